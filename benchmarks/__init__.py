@@ -0,0 +1 @@
+"""Package for performance benchmarks of physical quantity classes."""
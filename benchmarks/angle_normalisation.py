@@ -0,0 +1,156 @@
+"""Benchmark of creating angles & of arithmetic on angles.
+
+Compares the current implementation, which skips the modulo of values that are
+already in range & reads the full turn of each unit from a precomputed table,
+against the previous one, which looked up the info of the unit & calculated the
+full turn on every call, and created the results of arithmetic with the public
+initialiser. Also compares wrapping & unwrapping a buffer of encoder readings with
+the batch functions against doing it with an `Angle` & `AngleDelta` per reading.
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.angle_normalisation
+    micropython -m benchmarks.angle_normalisation
+"""
+
+# pyright: reportPrivateUsage=false
+
+import math
+from array import array
+
+from src.units import Angle, AngleDelta, AngleUnit
+from src.units.angle import unwrap_into, wrap_into
+from src.units.units_inner.angle import get_unit_delta_per_radian
+
+from .timing import print_comparison, print_header, time_per_iteration_ns
+
+_ITERATIONS = 10_000
+_BUFFER_LENGTH = 64
+
+
+def _previous_map_to_unit_circle(value: float, unit: AngleUnit) -> float:
+    """Map an angle to the range [0, 2*pi) radians, as before."""
+    unit_delta_per_radian = get_unit_delta_per_radian(unit)
+    tmp_value = value % (2 * math.pi * unit_delta_per_radian)
+    return (
+        tmp_value if tmp_value >= 0 else tmp_value + 2 * math.pi * unit_delta_per_radian
+    )
+
+
+class _PreviousAngle(Angle):
+    """Angle with the previous `__init__` & `__add__`, for comparison."""
+
+    __slots__ = ()
+
+    def __init__(self, value: float, unit: AngleUnit) -> None:
+        self._value = _previous_map_to_unit_circle(value, unit)
+        self._unit = unit
+        internal_unit_delta_per_radian = get_unit_delta_per_radian(self._unit)
+        self._value_as_radian = self._value / internal_unit_delta_per_radian
+
+    def __add__(self, delta: AngleDelta) -> "_PreviousAngle":
+        if self._unit == delta._unit:
+            return _PreviousAngle(self._value + delta._value, self._unit)
+
+        value_sum_as_radian = self._value_as_radian + delta._value_as_radian
+        return _PreviousAngle(value_sum_as_radian, AngleUnit.RADIAN)
+
+
+def _benchmark_create(name: str, value: float) -> None:
+    def before_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            _PreviousAngle(value, AngleUnit.DEGREE)
+
+    def after_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            Angle(value, AngleUnit.DEGREE)
+
+    print_comparison(
+        name,
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def _benchmark_add(name: str, delta: AngleDelta) -> None:
+    def before_loop(iterations: int) -> None:
+        angle = _PreviousAngle(0, AngleUnit.DEGREE)
+        for _ in range(iterations):
+            angle = angle + delta
+
+    def after_loop(iterations: int) -> None:
+        angle = Angle(0, AngleUnit.DEGREE)
+        for _ in range(iterations):
+            angle = angle + delta
+
+    print_comparison(
+        name,
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def _benchmark_wrap() -> None:
+    src = array("d", [37.5 * index - 720 for index in range(_BUFFER_LENGTH)])
+    dst = array("d", [0] * _BUFFER_LENGTH)
+
+    def before_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            for index in range(_BUFFER_LENGTH):
+                dst[index] = Angle(src[index], AngleUnit.DEGREE).as_unit(
+                    AngleUnit.DEGREE
+                )
+
+    def after_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            wrap_into(src, dst, AngleUnit.DEGREE)
+
+    print_comparison(
+        f"wrap {_BUFFER_LENGTH} readings",
+        time_per_iteration_ns(before_loop, _ITERATIONS // _BUFFER_LENGTH),
+        time_per_iteration_ns(after_loop, _ITERATIONS // _BUFFER_LENGTH),
+    )
+
+
+def _benchmark_unwrap() -> None:
+    # Encoder readings, which wrap around every few readings
+    src = array("d", [(37.5 * index) % 360 for index in range(_BUFFER_LENGTH)])
+    dst = array("d", [0] * _BUFFER_LENGTH)
+
+    def before_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            previous = Angle(src[0], AngleUnit.DEGREE)
+            total = src[0]
+            dst[0] = total
+            for index in range(1, _BUFFER_LENGTH):
+                angle = Angle(src[index], AngleUnit.DEGREE)
+                total += (angle - previous).as_unit(AngleUnit.DEGREE)
+                previous = angle
+                dst[index] = total
+
+    def after_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            unwrap_into(src, dst, AngleUnit.DEGREE)
+
+    print_comparison(
+        f"unwrap {_BUFFER_LENGTH} readings",
+        time_per_iteration_ns(before_loop, _ITERATIONS // _BUFFER_LENGTH),
+        time_per_iteration_ns(after_loop, _ITERATIONS // _BUFFER_LENGTH),
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print_header("Angle normalisation: per-call modulo vs in-range skip & tables")
+    _benchmark_create("Angle(45, deg) (in range)", 45)
+    _benchmark_create("Angle(-315, deg) (out of range)", -315)
+    _benchmark_add("Angle + delta (same unit)", AngleDelta(1.5, AngleUnit.DEGREE))
+    _benchmark_add("Angle + delta (mixed)", AngleDelta(0.025, AngleUnit.RADIAN))
+
+    print_header("Encoder buffers", before="per angle", after="batch")
+    _benchmark_wrap()
+    _benchmark_unwrap()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark of rebuilding a continuous angular position from encoder readings.
+
+Compares the previous approach, which subtracted consecutive angles & summed the
+differences, against the unwrapper, fed either a reading at a time or a buffer of
+readings at once.
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.angle_unwrapping
+    micropython -m benchmarks.angle_unwrapping
+"""
+
+from array import array
+
+from src.units import Angle, AngleUnit, AngularDisplacement
+from src.units.angular_motion import Unwrapper
+
+from .timing import print_comparison, print_header, time_per_iteration_ns
+
+_ITERATIONS = 10_000
+_BUFFER_LENGTH = 64
+
+# Encoder readings, which wrap around every few readings
+_READINGS = array("d", [(37.5 * index) % 360 for index in range(_BUFFER_LENGTH)])
+
+
+def _unwrap_by_subtraction() -> None:
+    """Rebuild the position by subtracting consecutive angles, as before."""
+    previous = Angle(_READINGS[0], AngleUnit.DEGREE)
+    position = AngularDisplacement(_READINGS[0], AngleUnit.DEGREE)
+    for index in range(1, _BUFFER_LENGTH):
+        angle = Angle(_READINGS[index], AngleUnit.DEGREE)
+        position = position + AngularDisplacement(
+            (angle - previous).as_unit(AngleUnit.DEGREE), AngleUnit.DEGREE
+        )
+        previous = angle
+
+
+def _before_loop(iterations: int) -> None:
+    for _ in range(iterations):
+        _unwrap_by_subtraction()
+
+
+def _update_loop(iterations: int) -> None:
+    unwrapper = Unwrapper(AngleUnit.DEGREE)
+    for _ in range(iterations):
+        for index in range(_BUFFER_LENGTH):
+            unwrapper.update(Angle(_READINGS[index], AngleUnit.DEGREE))
+
+
+def _update_raw_loop(iterations: int) -> None:
+    unwrapper = Unwrapper(AngleUnit.DEGREE)
+    for _ in range(iterations):
+        for index in range(_BUFFER_LENGTH):
+            unwrapper.update_raw(_READINGS[index])
+
+
+def _unwrap_into_loop(iterations: int) -> None:
+    unwrapper = Unwrapper(AngleUnit.DEGREE)
+    dst = array("d", [0] * _BUFFER_LENGTH)
+    for _ in range(iterations):
+        unwrapper.unwrap_into(_READINGS, dst)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    iterations = _ITERATIONS // _BUFFER_LENGTH
+    before_ns = time_per_iteration_ns(_before_loop, iterations)
+    print_header(
+        f"Unwrapping {_BUFFER_LENGTH} readings: Angle - Angle vs unwrapper",
+    )
+    for name, loop in [
+        ("Unwrapper.update(Angle)", _update_loop),
+        ("Unwrapper.update_raw(float)", _update_raw_loop),
+        ("Unwrapper.unwrap_into(buffer)", _unwrap_into_loop),
+    ]:
+        print_comparison(name, before_ns, time_per_iteration_ns(loop, iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Benchmark of creating & converting quantities with composite units.
+
+Compares the current implementation, which reads the combined factor of the units
+from a bounded cache, against the previous one, which looked up the factor of each
+unit & combined them on every call. The last rows alternate between two
+combinations of units, as a program that reads a sensor in one unit & reports it in
+another does.
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.composite_factor_cache
+    micropython -m benchmarks.composite_factor_cache
+"""
+
+from src.units import DistanceUnit, Jerk, MassFlowRate, MassUnit, TimeUnit
+from src.units.units_inner.length import (
+    get_unit_delta_per_metre as get_distance_unit_delta_per_metre,
+)
+from src.units.units_inner.mass import (
+    get_unit_delta_per_kilogram as get_mass_unit_delta_per_kilogram,
+)
+from src.units.units_inner.time import (
+    get_unit_delta_per_second as get_time_unit_delta_per_second,
+)
+
+from .timing import print_comparison, print_header, time_per_iteration_ns
+
+_ITERATIONS = 10_000
+
+
+class _UncachedJerk(Jerk):
+    """Jerk with the previous `__init__` & `as_unit`, for comparison."""
+
+    __slots__ = ()
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        value: float,
+        distance_unit: DistanceUnit,
+        first_time_unit: TimeUnit,
+        second_time_unit: TimeUnit | None = None,
+        third_time_unit: TimeUnit | None = None,
+    ) -> None:
+        self._value = value
+        self._distance_unit = distance_unit
+        self._first_time_unit = first_time_unit
+        self._second_time_unit = (
+            second_time_unit if second_time_unit is not None else first_time_unit
+        )
+        self._third_time_unit = (
+            third_time_unit if third_time_unit is not None else self._second_time_unit
+        )
+        self._value_as_metre_per_second_cubed = (
+            get_time_unit_delta_per_second(self._third_time_unit)
+            * get_time_unit_delta_per_second(self._second_time_unit)
+            * get_time_unit_delta_per_second(self._first_time_unit)
+            / get_distance_unit_delta_per_metre(self._distance_unit)
+            * self._value
+        )
+
+    def as_unit(
+        self,
+        distance_unit: DistanceUnit,
+        first_time_unit: TimeUnit,
+        second_time_unit: TimeUnit | None = None,
+        third_time_unit: TimeUnit | None = None,
+    ) -> float:
+        external_first_time_unit_delta_per_second = get_time_unit_delta_per_second(
+            first_time_unit
+        )
+        external_second_time_unit_delta_per_second = (
+            get_time_unit_delta_per_second(second_time_unit)
+            if second_time_unit is not None
+            else external_first_time_unit_delta_per_second
+        )
+        external_third_time_unit_delta_per_second = (
+            get_time_unit_delta_per_second(third_time_unit)
+            if third_time_unit is not None
+            else external_second_time_unit_delta_per_second
+        )
+        return (
+            get_distance_unit_delta_per_metre(distance_unit)
+            / (
+                external_first_time_unit_delta_per_second
+                * external_second_time_unit_delta_per_second
+                * external_third_time_unit_delta_per_second
+            )
+            * self._value_as_metre_per_second_cubed
+        )
+
+
+class _UncachedMassFlowRate(MassFlowRate):
+    """Mass flow rate with the previous `__init__` & `as_unit`, for comparison."""
+
+    __slots__ = ()
+
+    def __init__(self, value: float, mass_unit: MassUnit, time_unit: TimeUnit) -> None:
+        self._value = value
+        self._mass_unit = mass_unit
+        self._time_unit = time_unit
+        self._value_as_kilogram_per_second = (
+            get_time_unit_delta_per_second(self._time_unit)
+            / get_mass_unit_delta_per_kilogram(self._mass_unit)
+            * self._value
+        )
+
+    def as_unit(self, mass_unit: MassUnit, time_unit: TimeUnit) -> float:
+        return (
+            get_mass_unit_delta_per_kilogram(mass_unit)
+            / get_time_unit_delta_per_second(time_unit)
+            * self._value_as_kilogram_per_second
+        )
+
+
+def _benchmark_jerk() -> None:
+    def before_create_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            _UncachedJerk(1.5, DistanceUnit.MILLIMETRE, TimeUnit.SECOND)
+
+    def after_create_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            Jerk(1.5, DistanceUnit.MILLIMETRE, TimeUnit.SECOND)
+
+    print_comparison(
+        "Jerk(1.5, mm, s)",
+        time_per_iteration_ns(before_create_loop, _ITERATIONS),
+        time_per_iteration_ns(after_create_loop, _ITERATIONS),
+    )
+
+    before = _UncachedJerk(1.5, DistanceUnit.MILLIMETRE, TimeUnit.SECOND)
+    after = Jerk(1.5, DistanceUnit.MILLIMETRE, TimeUnit.SECOND)
+
+    def before_as_unit_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            before.as_unit(DistanceUnit.INCH, TimeUnit.MILLISECOND)
+
+    def after_as_unit_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            after.as_unit(DistanceUnit.INCH, TimeUnit.MILLISECOND)
+
+    print_comparison(
+        "Jerk.as_unit(in, ms)",
+        time_per_iteration_ns(before_as_unit_loop, _ITERATIONS),
+        time_per_iteration_ns(after_as_unit_loop, _ITERATIONS),
+    )
+
+
+def _benchmark_mass_flow_rate() -> None:
+    def before_create_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            _UncachedMassFlowRate(1.5, MassUnit.GRAM, TimeUnit.MINUTE)
+
+    def after_create_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            MassFlowRate(1.5, MassUnit.GRAM, TimeUnit.MINUTE)
+
+    print_comparison(
+        "MassFlowRate(1.5, g, min)",
+        time_per_iteration_ns(before_create_loop, _ITERATIONS),
+        time_per_iteration_ns(after_create_loop, _ITERATIONS),
+    )
+
+    before = _UncachedMassFlowRate(1.5, MassUnit.GRAM, TimeUnit.MINUTE)
+    after = MassFlowRate(1.5, MassUnit.GRAM, TimeUnit.MINUTE)
+
+    def before_as_unit_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            before.as_unit(MassUnit.KILOGRAM, TimeUnit.HOUR)
+
+    def after_as_unit_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            after.as_unit(MassUnit.KILOGRAM, TimeUnit.HOUR)
+
+    print_comparison(
+        "MassFlowRate.as_unit(kg, h)",
+        time_per_iteration_ns(before_as_unit_loop, _ITERATIONS),
+        time_per_iteration_ns(after_as_unit_loop, _ITERATIONS),
+    )
+
+
+def _benchmark_alternating_units() -> None:
+    def before_jerk_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            _UncachedJerk(1.5, DistanceUnit.MILLIMETRE, TimeUnit.SECOND).as_unit(
+                DistanceUnit.INCH, TimeUnit.MILLISECOND
+            )
+
+    def after_jerk_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            Jerk(1.5, DistanceUnit.MILLIMETRE, TimeUnit.SECOND).as_unit(
+                DistanceUnit.INCH, TimeUnit.MILLISECOND
+            )
+
+    print_comparison(
+        "Jerk(1.5, mm, s).as_unit(in, ms)",
+        time_per_iteration_ns(before_jerk_loop, _ITERATIONS),
+        time_per_iteration_ns(after_jerk_loop, _ITERATIONS),
+    )
+
+    def before_mass_flow_rate_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            _UncachedMassFlowRate(1.5, MassUnit.GRAM, TimeUnit.MINUTE).as_unit(
+                MassUnit.KILOGRAM, TimeUnit.HOUR
+            )
+
+    def after_mass_flow_rate_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            MassFlowRate(1.5, MassUnit.GRAM, TimeUnit.MINUTE).as_unit(
+                MassUnit.KILOGRAM, TimeUnit.HOUR
+            )
+
+    print_comparison(
+        "MassFlowRate(1.5, g, min).as_unit(kg, h)",
+        time_per_iteration_ns(before_mass_flow_rate_loop, _ITERATIONS),
+        time_per_iteration_ns(after_mass_flow_rate_loop, _ITERATIONS),
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print_header("Composite units: per-unit lookups vs cached factor")
+    _benchmark_jerk()
+    _benchmark_mass_flow_rate()
+    _benchmark_alternating_units()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark of `as_unit` using the precomputed conversion factor tables.
+
+Compares the current `as_unit` implementation against the previous one, which
+looked up the unit info for both the internal & external units on every call.
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.conversion_factors
+    micropython -m benchmarks.conversion_factors
+"""
+
+from typing import TYPE_CHECKING
+
+from src.units import (
+    Angle,
+    AngleUnit,
+    DistanceUnit,
+    Length,
+    Pressure,
+    PressureUnit,
+    Time,
+    TimeUnit,
+)
+from src.units.units_inner.angle import get_unit_delta_per_radian
+from src.units.units_inner.length import get_unit_delta_per_metre
+from src.units.units_inner.pressure import get_unit_delta_per_pascal
+from src.units.units_inner.time import get_unit_delta_per_second
+
+from .timing import print_comparison, print_header, time_per_iteration_ns
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+_ITERATIONS = 20_000
+
+
+class _PerCallLookupQuantity:
+    """Reproduction of the previous `as_unit`, for comparison.
+
+    The unit info of both the internal and external unit was looked up on every
+    call to convert a value.
+    """
+
+    def __init__(
+        self,
+        value: float,
+        unit: int,
+        # Any, as each quantity's lookup takes its own unit enum
+        get_unit_delta_per_si_unit: "Callable[[Any], float]",
+    ) -> None:
+        self._value = value
+        self._unit = unit
+        self._get_unit_delta_per_si_unit = get_unit_delta_per_si_unit
+
+    def as_unit(self, unit: int) -> float:
+        internal_unit_delta_per_si_unit = self._get_unit_delta_per_si_unit(self._unit)
+        value_as_si_unit = self._value / internal_unit_delta_per_si_unit
+        external_unit_delta_per_si_unit = self._get_unit_delta_per_si_unit(unit)
+        return external_unit_delta_per_si_unit * value_as_si_unit
+
+
+def _benchmark(
+    name: str,
+    before: "_PerCallLookupQuantity",
+    after: "Length | Pressure | Time | Angle",
+    unit: int,
+) -> None:
+    def before_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            before.as_unit(unit)
+
+    def after_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            after.as_unit(unit)  # type: ignore[arg-type]
+
+    print_comparison(
+        name,
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print_header("as_unit: per-call unit lookups vs conversion factor table")
+    _benchmark(
+        "Length mm -> in",
+        _PerCallLookupQuantity(12.5, DistanceUnit.MILLIMETRE, get_unit_delta_per_metre),
+        Length(12.5, DistanceUnit.MILLIMETRE),
+        DistanceUnit.INCH,
+    )
+    _benchmark(
+        "Pressure Pa -> psi",
+        _PerCallLookupQuantity(101_325, PressureUnit.PASCAL, get_unit_delta_per_pascal),
+        Pressure(101_325, PressureUnit.PASCAL),
+        PressureUnit.POUND_PER_SQUARE_INCH,
+    )
+    _benchmark(
+        "Time ms -> s",
+        _PerCallLookupQuantity(250, TimeUnit.MILLISECOND, get_unit_delta_per_second),
+        Time(250, TimeUnit.MILLISECOND),
+        TimeUnit.SECOND,
+    )
+    _benchmark(
+        "Angle deg -> rad",
+        _PerCallLookupQuantity(90, AngleUnit.DEGREE, get_unit_delta_per_radian),
+        Angle(90, AngleUnit.DEGREE),
+        AngleUnit.RADIAN,
+    )
+
+
+if __name__ == "__main__":
+    main()
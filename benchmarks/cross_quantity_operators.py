@@ -0,0 +1,87 @@
+"""Benchmark of integrating motion over a time step.
+
+Compares the previous approach, which expressed each operand in a common set of
+units, multiplied the floats & created the result from them, against the current
+operators between the rates & time differences, which multiply the values (and
+the values in SI units) directly.
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.cross_quantity_operators
+    micropython -m benchmarks.cross_quantity_operators
+"""
+
+from src.units import (
+    Acceleration,
+    Displacement,
+    DistanceUnit,
+    TimeDelta,
+    TimeUnit,
+    Velocity,
+)
+
+from .timing import print_comparison, print_header, time_per_iteration_ns
+
+_ITERATIONS = 10_000
+
+
+def _benchmark_velocity_times_time_delta(name: str, time_delta: TimeDelta) -> None:
+    velocity = Velocity(1.5, DistanceUnit.MILLIMETRE, TimeUnit.SECOND)
+
+    def before_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            Displacement(
+                velocity.as_unit(DistanceUnit.MILLIMETRE, TimeUnit.SECOND)
+                * time_delta.as_unit(TimeUnit.SECOND),
+                DistanceUnit.MILLIMETRE,
+            )
+
+    def after_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            _ = velocity * time_delta
+
+    print_comparison(
+        name,
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def _benchmark_velocity_over_time_delta() -> None:
+    velocity = Velocity(1.5, DistanceUnit.MILLIMETRE, TimeUnit.SECOND)
+    time_delta = TimeDelta(10, TimeUnit.MILLISECOND)
+
+    def before_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            Acceleration(
+                velocity.as_unit(DistanceUnit.MILLIMETRE, TimeUnit.SECOND)
+                / time_delta.as_unit(TimeUnit.SECOND),
+                DistanceUnit.MILLIMETRE,
+                TimeUnit.SECOND,
+            )
+
+    def after_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            _ = velocity / time_delta
+
+    print_comparison(
+        "Velocity / TimeDelta",
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print_header("Cross-quantity operators: as_unit & rewrap vs fused operator")
+    _benchmark_velocity_times_time_delta(
+        "Velocity * TimeDelta (same unit)", TimeDelta(10, TimeUnit.SECOND)
+    )
+    _benchmark_velocity_times_time_delta(
+        "Velocity * TimeDelta (mixed)", TimeDelta(10, TimeUnit.MILLISECOND)
+    )
+    _benchmark_velocity_over_time_delta()
+
+
+if __name__ == "__main__":
+    main()
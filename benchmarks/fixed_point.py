@@ -0,0 +1,113 @@
+"""Benchmark of the fixed-point quantity classes against the floating-point ones.
+
+Each loop does the same work with both representations: creating a quantity
+from an integer sensor reading, accumulating a running total, comparing against
+a limit & reading the total back in a unit. On ports with hardware floating point
+& unboxed floats the difference is small; the fixed-point classes are intended
+for ports where every float operation allocates or runs in software.
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.fixed_point
+    micropython -m benchmarks.fixed_point
+"""
+
+from src.units import DistanceUnit, Length, LengthDelta, Voltage, VoltageUnit
+from src.units.length import FixedPointLength, FixedPointLengthDelta
+from src.units.voltage import FixedPointVoltage
+
+from .timing import print_comparison, print_header, time_per_iteration_ns
+
+_ITERATIONS = 10_000
+
+
+def _benchmark_length_create() -> None:
+    def float_loop(iterations: int) -> None:
+        for reading in range(iterations):
+            Length(reading, DistanceUnit.MILLIMETRE)
+
+    def fixed_loop(iterations: int) -> None:
+        for reading in range(iterations):
+            FixedPointLength(reading, DistanceUnit.MILLIMETRE)
+
+    print_comparison(
+        "Length(reading, mm)",
+        time_per_iteration_ns(float_loop, _ITERATIONS),
+        time_per_iteration_ns(fixed_loop, _ITERATIONS),
+    )
+
+
+def _benchmark_length_accumulate() -> None:
+    float_delta = LengthDelta(5, DistanceUnit.MILLIMETRE)
+    fixed_delta = FixedPointLengthDelta(5, DistanceUnit.MILLIMETRE)
+
+    def float_loop(iterations: int) -> None:
+        total = Length(0, DistanceUnit.METRE)
+        for _ in range(iterations):
+            total += float_delta
+        total.as_unit(DistanceUnit.MILLIMETRE)
+
+    def fixed_loop(iterations: int) -> None:
+        total = FixedPointLength(0, DistanceUnit.METRE)
+        for _ in range(iterations):
+            total += fixed_delta
+        total.as_unit(DistanceUnit.MILLIMETRE)
+
+    print_comparison(
+        "Length += LengthDelta (m += mm)",
+        time_per_iteration_ns(float_loop, _ITERATIONS),
+        time_per_iteration_ns(fixed_loop, _ITERATIONS),
+    )
+
+
+def _benchmark_voltage_compare() -> None:
+    float_limit = Voltage(3.3, VoltageUnit.VOLT)
+    float_voltage = Voltage(1_650, VoltageUnit.MILLIVOLT)
+    fixed_limit = FixedPointVoltage(3_300, VoltageUnit.MILLIVOLT)
+    fixed_voltage = FixedPointVoltage(1_650, VoltageUnit.MILLIVOLT)
+
+    def float_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            _ = float_voltage < float_limit
+
+    def fixed_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            _ = fixed_voltage < fixed_limit
+
+    print_comparison(
+        "Voltage < Voltage",
+        time_per_iteration_ns(float_loop, _ITERATIONS),
+        time_per_iteration_ns(fixed_loop, _ITERATIONS),
+    )
+
+
+def _benchmark_voltage_as_unit() -> None:
+    float_voltage = Voltage(1_650, VoltageUnit.MILLIVOLT)
+    fixed_voltage = FixedPointVoltage(1_650, VoltageUnit.MILLIVOLT)
+
+    def float_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            float_voltage.as_unit(VoltageUnit.MICROVOLT)
+
+    def fixed_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            fixed_voltage.as_unit(VoltageUnit.MICROVOLT)
+
+    print_comparison(
+        "Voltage.as_unit(uV)",
+        time_per_iteration_ns(float_loop, _ITERATIONS),
+        time_per_iteration_ns(fixed_loop, _ITERATIONS),
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print_header("Floating-point vs fixed-point", before="float", after="fixed")
+    _benchmark_length_create()
+    _benchmark_length_accumulate()
+    _benchmark_voltage_compare()
+    _benchmark_voltage_as_unit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark of importing a quantity from the source layout & the flattened build.
+
+Compares importing the package & using a single class from it, where each quantity
+is a subpackage of several modules (the source layout), against the flattened build
+made by `tools/flatten.py`, where each quantity is a single module. Each package is
+removed from `sys.modules` before each import, so every import starts from scratch.
+Memory is measured with `tracemalloc` on CPython & `gc.mem_free` on micropython.
+
+Build the flattened copy first, then run from the root of the repository with
+either of:
+
+    cd tools && python flatten.py && cd ..
+    python -m benchmarks.flat_import
+    micropython -m benchmarks.flat_import
+"""
+
+import gc
+import sys
+from typing import TYPE_CHECKING
+
+from .timing import print_comparison, print_header, time_per_iteration_ns
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+_ITERATIONS = 20
+_SRC_PACKAGE_NAME = "src.units"
+_FLAT_PACKAGE_NAME = "flat.units"
+
+# The classes to use, each of which imports a different set of quantities
+_CLASS_NAMES = ("Length", "Temperature", "Velocity", "VolumetricFlowRate")
+
+
+def _unload_package(package_name: str) -> None:
+    """Remove the package & all of its modules from the module cache."""
+    for name in list(sys.modules):
+        if name == package_name or name.startswith(package_name + "."):
+            del sys.modules[name]
+
+    # Also drop the reference held by the parent package, so it is reimported
+    parent_name, _, child_name = package_name.rpartition(".")
+    parent = sys.modules.get(parent_name)
+    if parent is not None and child_name in vars(parent):
+        delattr(parent, child_name)
+
+
+def _loader(package_name: str, class_name: str) -> "Callable[[], None]":
+    """Return a function that imports the package & uses only the class."""
+
+    def load() -> None:
+        units = __import__(package_name, None, None, ("__name__",))
+        getattr(units, class_name)
+
+    return load
+
+
+def _time_loop(package_name: str, class_name: str) -> "Callable[[int], None]":
+    """Return a loop that unloads the package, then loads the class again."""
+    load = _loader(package_name, class_name)
+
+    def loop(iterations: int) -> None:
+        for _ in range(iterations):
+            _unload_package(package_name)
+            load()
+
+    return loop
+
+
+def _allocated_bytes() -> int:
+    """Return the number of bytes currently allocated on the heap."""
+    if tracemalloc is not None:
+        return tracemalloc.get_traced_memory()[0]
+
+    # Micropython
+    gc.collect()
+    return -gc.mem_free()  # type: ignore[attr-defined]
+
+
+def _bytes_retained(package_name: str, class_name: str) -> int:
+    """Return the number of bytes retained by a fresh load of the class."""
+    _unload_package(package_name)
+    gc.collect()
+    before = _allocated_bytes()
+    _loader(package_name, class_name)()
+    gc.collect()
+    return _allocated_bytes() - before
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    try:
+        __import__(_FLAT_PACKAGE_NAME)
+    except ImportError:
+        print("Build the flattened copy first, with tools/flatten.py")  # noqa: T201
+        return
+
+    print_header("Import time", before="source", after="flattened")
+    for class_name in _CLASS_NAMES:
+        print_comparison(
+            f"import units; units.{class_name}",
+            time_per_iteration_ns(
+                _time_loop(_SRC_PACKAGE_NAME, class_name), _ITERATIONS
+            ),
+            time_per_iteration_ns(
+                _time_loop(_FLAT_PACKAGE_NAME, class_name), _ITERATIONS
+            ),
+        )
+
+    if tracemalloc is not None:
+        tracemalloc.start()
+
+    print("Bytes retained")  # noqa: T201
+    print(f"{'':<40} {'source':>13} {'flattened':>13}")  # noqa: T201
+    for class_name in _CLASS_NAMES:
+        src_bytes = _bytes_retained(_SRC_PACKAGE_NAME, class_name)
+        flat_bytes = _bytes_retained(_FLAT_PACKAGE_NAME, class_name)
+        print(  # noqa: T201
+            f"{'import units; units.' + class_name:<40}"
+            f" {src_bytes:>13} {flat_bytes:>13}"
+        )
+
+    if tracemalloc is not None:
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark of importing the package & using a single class from it.
+
+Compares loading every module & class up front, as the package did before, against
+the current on-demand loading, where `import units; units.Temperature` only imports
+the temperature modules. The package is removed from `sys.modules` before each
+import, so every import starts from scratch. Memory is measured with
+`tracemalloc` on CPython & `gc.mem_free` on micropython.
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.lazy_import
+    micropython -m benchmarks.lazy_import
+"""
+
+import gc
+import sys
+from typing import TYPE_CHECKING
+
+from .timing import print_comparison, print_header, time_per_iteration_ns
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+_ITERATIONS = 20
+_PACKAGE_NAME = "src.units"
+
+
+def _unload_package() -> None:
+    """Remove the package & all of its modules from the module cache."""
+    for name in list(sys.modules):
+        if name == _PACKAGE_NAME or name.startswith(_PACKAGE_NAME + "."):
+            del sys.modules[name]
+
+    # Also drop the reference held by the parent package, so it is reimported
+    src = sys.modules.get("src")
+    if src is not None and "units" in vars(src):
+        delattr(src, "units")
+
+
+def _import_everything() -> None:
+    """Import the package & load all of its contents, as before."""
+    units = __import__(_PACKAGE_NAME, None, None, ("__name__",))
+    for name in units.__all__:
+        getattr(units, name)
+
+
+def _import_temperature() -> None:
+    """Import the package & only use the temperature class."""
+    units = __import__(_PACKAGE_NAME, None, None, ("__name__",))
+    _ = units.Temperature
+
+
+def _time_loop(load: "Callable[[], None]") -> "Callable[[int], None]":
+    """Return a loop that unloads the package, then loads it again."""
+
+    def loop(iterations: int) -> None:
+        for _ in range(iterations):
+            _unload_package()
+            load()
+
+    return loop
+
+
+def _allocated_bytes() -> int:
+    """Return the number of bytes currently allocated on the heap."""
+    if tracemalloc is not None:
+        return tracemalloc.get_traced_memory()[0]
+
+    # Micropython
+    gc.collect()
+    return -gc.mem_free()  # type: ignore[attr-defined]
+
+
+def _bytes_retained(load: "Callable[[], None]") -> int:
+    """Return the number of bytes retained by a fresh load of the package."""
+    _unload_package()
+    gc.collect()
+    before = _allocated_bytes()
+    load()
+    gc.collect()
+    return _allocated_bytes() - before
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print_header("Import time", before="everything", after="temperature")
+    print_comparison(
+        "import units; units.Temperature",
+        time_per_iteration_ns(_time_loop(_import_everything), _ITERATIONS),
+        time_per_iteration_ns(_time_loop(_import_temperature), _ITERATIONS),
+    )
+
+    if tracemalloc is not None:
+        tracemalloc.start()
+
+    everything_bytes = _bytes_retained(_import_everything)
+    temperature_bytes = _bytes_retained(_import_temperature)
+    print("Bytes retained")  # noqa: T201
+    print(f"{'':<40} {'everything':>13} {'temperature':>13}")  # noqa: T201
+    print(  # noqa: T201
+        f"{'import units; units.Temperature':<40}"
+        f" {everything_bytes:>13} {temperature_bytes:>13}"
+    )
+
+    if tracemalloc is not None:
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Benchmark of the memory used by each instance of the physical quantity classes.
+
+Compares each class, which declares `__slots__`, against an otherwise identical
+subclass that does not, and so has a per-instance `__dict__` like the classes did
+before `__slots__` were introduced. Memory is measured with `tracemalloc` on
+CPython & `gc.mem_free` on micropython (which does not support `__slots__`, so
+no difference is expected there).
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.memory
+    micropython -m benchmarks.memory
+"""
+
+import gc
+
+from src.units import (
+    Acceleration,
+    Angle,
+    AngleDelta,
+    AngleUnit,
+    AngularAcceleration,
+    AngularDisplacement,
+    AngularJerk,
+    AngularVelocity,
+    Area,
+    AreaDelta,
+    AreaUnit,
+    Current,
+    CurrentUnit,
+    Displacement,
+    DistanceUnit,
+    Jerk,
+    Length,
+    LengthDelta,
+    Mass,
+    MassDelta,
+    MassFlowRate,
+    MassUnit,
+    Pressure,
+    PressureDelta,
+    PressureUnit,
+    Temperature,
+    TemperatureDelta,
+    TemperatureUnit,
+    Time,
+    TimeDelta,
+    TimeUnit,
+    Velocity,
+    Voltage,
+    VoltageUnit,
+    Volume,
+    VolumeDelta,
+    VolumetricFlowRate,
+    VolumeUnit,
+)
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+_INSTANCE_COUNT = 2_000
+
+# Each class, along with the units used to create instances of it
+_CLASSES_AND_UNITS = [
+    ("Angle", Angle, (AngleUnit.DEGREE,)),
+    ("AngleDelta", AngleDelta, (AngleUnit.DEGREE,)),
+    ("AngularDisplacement", AngularDisplacement, (AngleUnit.DEGREE,)),
+    ("AngularVelocity", AngularVelocity, (AngleUnit.DEGREE, TimeUnit.SECOND)),
+    ("AngularAcceleration", AngularAcceleration, (AngleUnit.DEGREE, TimeUnit.SECOND)),
+    ("AngularJerk", AngularJerk, (AngleUnit.DEGREE, TimeUnit.SECOND)),
+    ("Area", Area, (AreaUnit.SQUARE_CENTIMETRE,)),
+    ("AreaDelta", AreaDelta, (AreaUnit.SQUARE_CENTIMETRE,)),
+    ("Current", Current, (CurrentUnit.MILLIAMPERE,)),
+    ("Length", Length, (DistanceUnit.MILLIMETRE,)),
+    ("LengthDelta", LengthDelta, (DistanceUnit.MILLIMETRE,)),
+    ("Displacement", Displacement, (DistanceUnit.MILLIMETRE,)),
+    ("Velocity", Velocity, (DistanceUnit.MILLIMETRE, TimeUnit.SECOND)),
+    ("Acceleration", Acceleration, (DistanceUnit.MILLIMETRE, TimeUnit.SECOND)),
+    ("Jerk", Jerk, (DistanceUnit.MILLIMETRE, TimeUnit.SECOND)),
+    ("Mass", Mass, (MassUnit.GRAM,)),
+    ("MassDelta", MassDelta, (MassUnit.GRAM,)),
+    ("MassFlowRate", MassFlowRate, (MassUnit.GRAM, TimeUnit.SECOND)),
+    ("Pressure", Pressure, (PressureUnit.BAR,)),
+    ("PressureDelta", PressureDelta, (PressureUnit.BAR,)),
+    ("Temperature", Temperature, (TemperatureUnit.CELSIUS,)),
+    ("TemperatureDelta", TemperatureDelta, (TemperatureUnit.CELSIUS,)),
+    ("Time", Time, (TimeUnit.MILLISECOND,)),
+    ("TimeDelta", TimeDelta, (TimeUnit.MILLISECOND,)),
+    ("Voltage", Voltage, (VoltageUnit.MILLIVOLT,)),
+    ("Volume", Volume, (VolumeUnit.LITRE,)),
+    ("VolumeDelta", VolumeDelta, (VolumeUnit.LITRE,)),
+    ("VolumetricFlowRate", VolumetricFlowRate, (VolumeUnit.LITRE, TimeUnit.MINUTE)),
+]
+
+
+def _allocated_bytes() -> int:
+    """Return the number of bytes currently allocated on the heap."""
+    if tracemalloc is not None:
+        return tracemalloc.get_traced_memory()[0]
+
+    # Micropython
+    gc.collect()
+    return -gc.mem_free()  # type: ignore[attr-defined]
+
+
+def _bytes_per_instance(cls: type, units: tuple[int, ...]) -> float:
+    """Return the mean number of bytes used by an instance of the class."""
+    instances: list[object] = [None] * _INSTANCE_COUNT
+    values = [float(index) for index in range(_INSTANCE_COUNT)]
+    gc.collect()
+    before = _allocated_bytes()
+    for index in range(_INSTANCE_COUNT):
+        instances[index] = cls(values[index], *units)
+    after = _allocated_bytes()
+    return (after - before) / _INSTANCE_COUNT
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    if tracemalloc is not None:
+        tracemalloc.start()
+
+    print("Bytes per instance")  # noqa: T201
+    print(f"{'':<24} {'__dict__':>10} {'__slots__':>10}")  # noqa: T201
+    for name, cls, units in _CLASSES_AND_UNITS:
+        # A subclass that does not declare __slots__ gets a per-instance __dict__
+        cls_with_dict = type(name, (cls,), {})
+        with_dict = _bytes_per_instance(cls_with_dict, units)
+        with_slots = _bytes_per_instance(cls, units)
+        print(f"{name:<24} {with_dict:>10.1f} {with_slots:>10.1f}")  # noqa: T201
+
+    if tracemalloc is not None:
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
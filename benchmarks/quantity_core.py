@@ -0,0 +1,223 @@
+"""Benchmark of the generic quantity against the typed quantity classes.
+
+Compares the size of the compiled bytecode of the typed classes that a generic
+quantity can stand in for against that of the generic quantity package, as a proxy
+for the flash taken up by freezing them into the firmware; the memory retained by
+importing them; and the time taken by common operations on each. The typed
+subpackages also hold the array, fixed-point & ISR classes, so the bytecode of just
+the modules of the typed classes is reported too. The bytecode size
+is only measured on CPython, as micropython cannot compile a module to bytes at
+runtime (`mpy-cross` reports the size of a frozen module there).
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.quantity_core
+    micropython -m benchmarks.quantity_core
+"""
+
+# pyright: reportPrivateUsage=false
+
+import gc
+import sys
+from typing import TYPE_CHECKING
+
+from src.units import DistanceUnit, LengthDelta, TimeDelta, TimeUnit, Velocity
+from src.units.linear_motion import Displacement
+from src.units.quantity import LENGTH, TIME, Quantity
+from src.units.units_inner.quantity.kinds import _KINDS
+
+from .timing import print_comparison, print_header, time_per_iteration_ns
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+try:
+    import marshal
+except ImportError:
+    marshal = None
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+_ITERATIONS = 10_000
+_INNER_PACKAGE_NAME = "src.units.units_inner"
+
+# The subpackages of the typed classes that the generic quantity can stand in for
+_TYPED_SUBPACKAGES = (
+    "angle",
+    "angular_motion",
+    "area",
+    "current",
+    "flow_rate",
+    "length",
+    "linear_motion",
+    "mass",
+    "pressure",
+    "temperature",
+    "time",
+    "voltage",
+    "volume",
+)
+_GENERIC_SUBPACKAGES = ("quantity",)
+
+
+def _unload_subpackages() -> None:
+    """Remove the internal subpackages & their modules from the module cache."""
+    for name in list(sys.modules):
+        if name.startswith(_INNER_PACKAGE_NAME + "."):
+            del sys.modules[name]
+
+    inner_package = sys.modules[_INNER_PACKAGE_NAME]
+    for name in _TYPED_SUBPACKAGES + _GENERIC_SUBPACKAGES:
+        if name in vars(inner_package):
+            delattr(inner_package, name)
+
+
+def _import_subpackages(names: tuple[str, ...]) -> None:
+    """Import the internal subpackages."""
+    for name in names:
+        __import__(f"{_INNER_PACKAGE_NAME}.{name}")
+
+
+def _module_bytecode_bytes(module_name: str) -> int:
+    """Return the size of the marshalled bytecode of the module."""
+    file_name: str = sys.modules[module_name].__file__  # type: ignore[assignment]
+    with open(file_name, encoding="utf-8") as file:  # noqa: PTH123
+        code = compile(file.read(), file_name, "exec")
+    return len(marshal.dumps(code))  # type: ignore[union-attr]
+
+
+def _bytecode_bytes(names: tuple[str, ...]) -> int:
+    """Return the size of the marshalled bytecode of every module of the subpackages."""
+    _import_subpackages(names)
+    total = 0
+    for module_name in list(sys.modules):
+        if any(module_name.startswith(f"{_INNER_PACKAGE_NAME}.{x}") for x in names):
+            total += _module_bytecode_bytes(module_name)
+
+    return total
+
+
+def _class_bytecode_bytes() -> int:
+    """Return the size of the marshalled bytecode of the module of each typed class."""
+    _import_subpackages(_TYPED_SUBPACKAGES)
+    module_names = {
+        getattr(sys.modules[f"{_INNER_PACKAGE_NAME}.{kind[0]}"], kind[1]).__module__
+        for kind in _KINDS
+    }
+    total = 0
+    for module_name in module_names:
+        total += _module_bytecode_bytes(module_name)
+
+    return total
+
+
+def _allocated_bytes() -> int:
+    """Return the number of bytes currently allocated on the heap."""
+    if tracemalloc is not None:
+        return tracemalloc.get_traced_memory()[0]
+
+    # Micropython
+    gc.collect()
+    return -gc.mem_free()  # type: ignore[attr-defined]
+
+
+def _bytes_retained(names: tuple[str, ...]) -> int:
+    """Return the number of bytes retained by a fresh import of the subpackages."""
+    _unload_subpackages()
+    gc.collect()
+    before = _allocated_bytes()
+    _import_subpackages(names)
+    gc.collect()
+    return _allocated_bytes() - before
+
+
+def _benchmark(
+    name: str, typed: "Callable[[], object]", generic: "Callable[[], object]"
+) -> None:
+    def typed_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            typed()
+
+    def generic_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            generic()
+
+    print_comparison(
+        name,
+        time_per_iteration_ns(typed_loop, _ITERATIONS),
+        time_per_iteration_ns(generic_loop, _ITERATIONS),
+    )
+
+
+def _benchmark_operations() -> None:
+    print_header("Operations", before="typed", after="generic")
+    _benchmark(
+        "create",
+        lambda: LengthDelta(1.5, DistanceUnit.METRE),
+        lambda: Quantity(1.5, LENGTH),
+    )
+
+    typed_length = LengthDelta(1.5, DistanceUnit.METRE)
+    generic_length = Quantity(1.5, LENGTH)
+    _benchmark(
+        "length + length",
+        lambda: typed_length + typed_length,
+        lambda: generic_length + generic_length,
+    )
+
+    typed_velocity = Velocity(2, DistanceUnit.METRE, TimeUnit.SECOND)
+    typed_time = TimeDelta(3, TimeUnit.SECOND)
+    generic_velocity = Quantity(2, LENGTH - TIME)
+    generic_time = Quantity(3, TIME)
+    _benchmark(
+        "velocity * time",
+        lambda: typed_velocity * typed_time,
+        lambda: generic_velocity * generic_time,
+    )
+
+    typed_displacement = Displacement(6, DistanceUnit.METRE)
+    generic_displacement = Quantity(6, LENGTH)
+    _benchmark(
+        "displacement / time / time",
+        lambda: typed_displacement / typed_time / typed_time,
+        lambda: generic_displacement / generic_time / generic_time,
+    )
+    _benchmark(
+        "velocity * typed time",
+        lambda: typed_velocity * typed_time,
+        lambda: generic_velocity * typed_time,
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    _benchmark_operations()
+
+    if tracemalloc is not None:
+        tracemalloc.start()
+
+    typed_bytes = _bytes_retained(_TYPED_SUBPACKAGES)
+    generic_bytes = _bytes_retained(_GENERIC_SUBPACKAGES)
+    print("Bytes")  # noqa: T201
+    print(f"{'':<40} {'typed':>13} {'generic':>13}")  # noqa: T201
+    print(f"{'retained by import':<40} {typed_bytes:>13} {generic_bytes:>13}")  # noqa: T201
+
+    if tracemalloc is not None:
+        tracemalloc.stop()
+
+    if marshal is not None:
+        typed_bytes = _bytecode_bytes(_TYPED_SUBPACKAGES)
+        generic_bytes = _bytecode_bytes(_GENERIC_SUBPACKAGES)
+        print(f"{'bytecode':<40} {typed_bytes:>13} {generic_bytes:>13}")  # noqa: T201
+        typed_bytes = _class_bytecode_bytes()
+        print(  # noqa: T201
+            f"{'bytecode (typed class modules only)':<40}"
+            f" {typed_bytes:>13} {generic_bytes:>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark of estimating a velocity from a stream of timestamped lengths.
+
+Compares the usual hand-written estimate, which subtracts the previous length &
+time, converts both differences into floats & creates a new velocity from their
+ratio, against a `VelocityEstimator` of a first difference, which works on the SI
+values held by each sample.
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.rate_estimation
+    micropython -m benchmarks.rate_estimation
+"""
+
+from src.units import DistanceUnit, Length, Time, TimeUnit, Velocity
+from src.units.linear_motion import VelocityEstimator
+from src.units.rate_estimators import FirstDifference
+
+from .timing import print_comparison, print_header, time_per_iteration_ns
+
+_ITERATIONS = 10_000
+
+_SAMPLE_COUNT = 64
+_TIMES = [Time(index * 10, TimeUnit.MILLISECOND) for index in range(_SAMPLE_COUNT)]
+_LENGTHS = [
+    Length(index * index % 17, DistanceUnit.MILLIMETRE)
+    for index in range(_SAMPLE_COUNT)
+]
+
+
+def _benchmark_first_difference() -> None:
+    def before_loop(iterations: int) -> None:
+        previous_time = _TIMES[0]
+        previous_length = _LENGTHS[0]
+        for iteration in range(1, iterations + 1):
+            index = iteration % _SAMPLE_COUNT
+            if not index:
+                previous_time = _TIMES[0]
+                previous_length = _LENGTHS[0]
+                continue
+            time = _TIMES[index]
+            length = _LENGTHS[index]
+            Velocity(
+                (length - previous_length).as_unit(DistanceUnit.MILLIMETRE)
+                / (time - previous_time).as_unit(TimeUnit.SECOND),
+                DistanceUnit.MILLIMETRE,
+                TimeUnit.SECOND,
+            )
+            previous_time = time
+            previous_length = length
+
+    def after_loop(iterations: int) -> None:
+        estimator = VelocityEstimator(
+            FirstDifference(), DistanceUnit.MILLIMETRE, TimeUnit.SECOND
+        )
+        estimator.update(_TIMES[0], _LENGTHS[0])
+        for iteration in range(1, iterations + 1):
+            index = iteration % _SAMPLE_COUNT
+            if not index:
+                estimator.reset()
+            estimator.update(_TIMES[index], _LENGTHS[index])
+
+    print_comparison(
+        "first difference",
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print_header("Velocity estimation", before="by hand", after="estimator")
+    _benchmark_first_difference()
+
+
+if __name__ == "__main__":
+    main()
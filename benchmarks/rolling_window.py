@@ -0,0 +1,162 @@
+"""Benchmark of keeping a rolling window of the most recent readings.
+
+Compares holding the window as a list of pressure objects, appending each reading
+& dropping the oldest one once the window is full, against pushing each reading
+into a preallocated `PressureSeries`. Also compares taking the latest readings as a
+slice of the list against a window of the series, which is a view rather than a
+copy, and the memory retained by a full window of distinct readings. Memory is
+measured with `tracemalloc` on CPython & `gc.mem_free` on micropython.
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.rolling_window
+    micropython -m benchmarks.rolling_window
+"""
+
+import gc
+from typing import TYPE_CHECKING
+
+from src.units import Pressure, PressureUnit, Time, TimeUnit
+from src.units.pressure import PressureSeries
+
+from .timing import print_comparison, print_header, time_per_iteration_ns
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+_ITERATIONS = 10_000
+_CAPACITY = 32
+
+
+def _benchmark_push() -> None:
+    pressure = Pressure(101.3, PressureUnit.KILOPASCAL)
+
+    def before_loop(iterations: int) -> None:
+        window: list[Pressure] = []
+        for _ in range(iterations):
+            window.append(pressure)
+            if len(window) > _CAPACITY:
+                window.pop(0)
+
+    def after_loop(iterations: int) -> None:
+        series = PressureSeries(_CAPACITY, PressureUnit.KILOPASCAL)
+        for _ in range(iterations):
+            series.push(pressure)
+
+    print_comparison(
+        "push reading",
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def _benchmark_push_timestamped() -> None:
+    pressure = Pressure(101.3, PressureUnit.KILOPASCAL)
+    time = Time(1, TimeUnit.SECOND)
+
+    def before_loop(iterations: int) -> None:
+        window: list[tuple[Pressure, Time]] = []
+        for _ in range(iterations):
+            window.append((pressure, time))
+            if len(window) > _CAPACITY:
+                window.pop(0)
+
+    def after_loop(iterations: int) -> None:
+        series = PressureSeries(_CAPACITY, PressureUnit.KILOPASCAL, timestamped=True)
+        for _ in range(iterations):
+            series.push(pressure, time)
+
+    print_comparison(
+        "push timestamped reading",
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def _benchmark_window() -> None:
+    pressure = Pressure(101.3, PressureUnit.KILOPASCAL)
+    window = [pressure] * _CAPACITY
+    series = PressureSeries(_CAPACITY, PressureUnit.KILOPASCAL)
+    for _ in range(_CAPACITY):
+        series.push(pressure)
+
+    def before_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            _ = window[-10:]
+
+    def after_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            series.window(10)
+
+    print_comparison(
+        "latest 10 readings",
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def _allocated_bytes() -> int:
+    """Return the number of bytes currently allocated on the heap."""
+    if tracemalloc is not None:
+        return tracemalloc.get_traced_memory()[0]
+
+    # Micropython
+    gc.collect()
+    return -gc.mem_free()  # type: ignore[attr-defined]
+
+
+def _bytes_retained(fill: "Callable[[], object]") -> int:
+    """Return the number of bytes retained by a window filled by the function."""
+    gc.collect()
+    before = _allocated_bytes()
+    window = fill()
+    gc.collect()
+    retained = _allocated_bytes() - before
+    del window
+    return retained
+
+
+def _fill_list() -> "list[Pressure]":
+    window: list[Pressure] = []
+    for index in range(2 * _CAPACITY):
+        window.append(Pressure(100 + index, PressureUnit.KILOPASCAL))
+        if len(window) > _CAPACITY:
+            window.pop(0)
+    return window
+
+
+def _fill_series() -> PressureSeries:
+    series = PressureSeries(_CAPACITY, PressureUnit.KILOPASCAL)
+    for index in range(2 * _CAPACITY):
+        series.push(Pressure(100 + index, PressureUnit.KILOPASCAL))
+    return series
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print_header("Rolling window", before="list", after="series")
+    _benchmark_push()
+    _benchmark_push_timestamped()
+    _benchmark_window()
+
+    if tracemalloc is not None:
+        tracemalloc.start()
+
+    print("Bytes retained")  # noqa: T201
+    print(f"{'':<40} {'list':>13} {'series':>13}")  # noqa: T201
+    print(  # noqa: T201
+        f"{f'window of {_CAPACITY} readings':<40}"
+        f" {_bytes_retained(_fill_list):>13} {_bytes_retained(_fill_series):>13}"
+    )
+
+    if tracemalloc is not None:
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
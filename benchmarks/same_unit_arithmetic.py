@@ -0,0 +1,155 @@
+"""Benchmark of accumulating quantities that share a unit.
+
+Compares the current `__add__`, which adds the values directly when both operands
+are in the same unit, against the previous one, which always added the values in
+the SI unit & returned the sum in the SI unit. Each loop accumulates a running
+total in a non-SI unit, then reads the total back in that unit.
+
+The same-unit path is not expected to be faster. Every quantity stores its value
+in the SI unit, so the previous path was a single addition, while the same-unit
+path also derives the stored SI value from the sum, so that the sum compares equal
+to a quantity created with the same value & unit. The ratio between the two varies
+by around 10-20% between runs on a busy machine, so compare several runs.
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.same_unit_arithmetic
+    micropython -m benchmarks.same_unit_arithmetic
+"""
+
+# pyright: reportPrivateUsage=false
+
+from src.units import (
+    DistanceUnit,
+    Length,
+    LengthDelta,
+    TimeDelta,
+    TimeUnit,
+    Velocity,
+)
+
+from .timing import print_comparison, print_header, time_per_iteration_ns
+
+_ITERATIONS = 50_000
+
+
+class _ViaMetreLength(Length):
+    """Length with the previous `__add__`, for comparison."""
+
+    __slots__ = ()
+
+    def __add__(self, delta: LengthDelta) -> "_ViaMetreLength":
+        value_sum_as_metre = self._value_as_metre + delta._value_as_metre
+        return _ViaMetreLength._create(
+            value_sum_as_metre, DistanceUnit.METRE, value_sum_as_metre
+        )
+
+
+class _ViaSecondTimeDelta(TimeDelta):
+    """Time delta with the previous `__add__`, for comparison."""
+
+    __slots__ = ()
+
+    def __add__(self, other: TimeDelta) -> "_ViaSecondTimeDelta":
+        if not isinstance(other, TimeDelta):  # type: ignore[reportUnnecessaryIsInstance]
+            return NotImplemented
+
+        added_value_as_second = self._value_as_second + other._value_as_second
+        return _ViaSecondTimeDelta._create(
+            added_value_as_second, TimeUnit.SECOND, added_value_as_second
+        )
+
+
+class _ViaMetrePerSecondVelocity(Velocity):
+    """Velocity with the previous `__add__`, for comparison."""
+
+    __slots__ = ()
+
+    def __add__(self, other: Velocity) -> "_ViaMetrePerSecondVelocity":
+        value_sum_as_metre_per_second = (
+            self._value_as_metre_per_second + other._value_as_metre_per_second
+        )
+        return _ViaMetrePerSecondVelocity._create(
+            value_sum_as_metre_per_second,
+            DistanceUnit.METRE,
+            TimeUnit.SECOND,
+            value_sum_as_metre_per_second,
+        )
+
+
+def _benchmark_length() -> None:
+    delta = LengthDelta(0.5, DistanceUnit.MILLIMETRE)
+
+    def before_loop(iterations: int) -> None:
+        total = _ViaMetreLength(0, DistanceUnit.MILLIMETRE)
+        for _ in range(iterations):
+            total += delta
+        total.as_unit(DistanceUnit.MILLIMETRE)
+
+    def after_loop(iterations: int) -> None:
+        total = Length(0, DistanceUnit.MILLIMETRE)
+        for _ in range(iterations):
+            total += delta
+        total.as_unit(DistanceUnit.MILLIMETRE)
+
+    print_comparison(
+        "Length += LengthDelta (mm)",
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def _benchmark_time_delta() -> None:
+    delta = TimeDelta(10, TimeUnit.MILLISECOND)
+
+    def before_loop(iterations: int) -> None:
+        total = _ViaSecondTimeDelta(0, TimeUnit.MILLISECOND)
+        for _ in range(iterations):
+            total += delta
+        total.as_unit(TimeUnit.MILLISECOND)
+
+    def after_loop(iterations: int) -> None:
+        total = TimeDelta(0, TimeUnit.MILLISECOND)
+        for _ in range(iterations):
+            total += delta
+        total.as_unit(TimeUnit.MILLISECOND)
+
+    print_comparison(
+        "TimeDelta += TimeDelta (ms)",
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def _benchmark_velocity() -> None:
+    velocity = Velocity(1.5, DistanceUnit.MILLIMETRE, TimeUnit.MINUTE)
+
+    def before_loop(iterations: int) -> None:
+        total = _ViaMetrePerSecondVelocity(0, DistanceUnit.MILLIMETRE, TimeUnit.MINUTE)
+        for _ in range(iterations):
+            total += velocity
+        total.as_unit(DistanceUnit.MILLIMETRE, TimeUnit.MINUTE)
+
+    def after_loop(iterations: int) -> None:
+        total = Velocity(0, DistanceUnit.MILLIMETRE, TimeUnit.MINUTE)
+        for _ in range(iterations):
+            total += velocity
+        total.as_unit(DistanceUnit.MILLIMETRE, TimeUnit.MINUTE)
+
+    print_comparison(
+        "Velocity += Velocity (mm/min)",
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print_header("Accumulation: via SI unit vs same-unit fast path")
+    _benchmark_length()
+    _benchmark_time_delta()
+    _benchmark_velocity()
+
+
+if __name__ == "__main__":
+    main()
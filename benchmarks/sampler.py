@@ -0,0 +1,131 @@
+"""Benchmark of sampling a dozen sensors at different rates.
+
+Compares the usual ad-hoc sampling, which runs one task per sensor that reads it,
+wraps the reading up as a quantity & sleeps for its period, against a `Sampler`
+that reads every sensor from a single task. Each approach runs for a fixed time,
+and the total throughput is given in samples per second, while the jitter is the
+mean distance between each read & the time it was scheduled for, in microseconds.
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.sampler
+    micropython -m benchmarks.sampler
+"""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from src.units import Pressure, PressureUnit
+from src.units.sampler import SampleQueue, Sampler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+_DURATION_MS = 1_000
+_PERIODS_MS = (5, 5, 5, 5, 10, 10, 10, 10, 20, 20, 20, 20)
+_UNIT = PressureUnit.KILOPASCAL
+
+
+def _ticks_us() -> int:
+    if hasattr(time, "ticks_us"):
+        return time.ticks_us()  # type: ignore[attr-defined]
+    return time.monotonic_ns() // 1_000
+
+
+def _ticks_diff(end: int, start: int) -> int:
+    if hasattr(time, "ticks_diff"):
+        return time.ticks_diff(end, start)  # type: ignore[attr-defined]
+    return end - start
+
+
+class _FakeSensor:
+    """A sensor that records when it is read, relative to its first read."""
+
+    def __init__(self, period_ms: int) -> None:
+        self.period_us = period_ms * 1_000
+        self.start_us: int | None = None
+        self.reads = 0
+        self.lateness_us = 0
+
+    async def read(self) -> float:
+        now = _ticks_us()
+        if self.start_us is None:
+            self.start_us = now
+        else:
+            scheduled_us = self.reads * self.period_us
+            self.lateness_us += abs(_ticks_diff(now, self.start_us) - scheduled_us)
+        self.reads += 1
+        await asyncio.sleep(0)
+        return 101.3
+
+
+async def _drain(queue: SampleQueue) -> None:
+    while True:
+        await queue.get()
+
+
+async def _run_for_duration(tasks: "list[asyncio.Task[None]]") -> None:
+    await asyncio.sleep(_DURATION_MS / 1_000)
+    for task in tasks:
+        task.cancel()
+    # Let the cancellations land before the loop is closed
+    await asyncio.sleep(0)
+
+
+async def _sample_by_hand(sensors: "list[_FakeSensor]") -> None:
+    async def poll(sensor: _FakeSensor, queue: SampleQueue) -> None:
+        period_s = sensor.period_us / 1_000_000
+        while True:
+            await queue.put(Pressure(await sensor.read(), _UNIT))
+            await asyncio.sleep(period_s)
+
+    tasks: list[asyncio.Task[None]] = []
+    for sensor in sensors:
+        queue = SampleQueue(4)
+        tasks.append(asyncio.create_task(poll(sensor, queue)))
+        tasks.append(asyncio.create_task(_drain(queue)))
+    await _run_for_duration(tasks)
+
+
+async def _sample_with_sampler(sensors: "list[_FakeSensor]") -> None:
+    sampler = Sampler()
+    tasks: list[asyncio.Task[None]] = []
+    for sensor in sensors:
+        queue = sampler.register(
+            sensor.read, Pressure, _UNIT, sensor.period_us // 1_000
+        ).subscribe()
+        tasks.append(asyncio.create_task(_drain(queue)))
+    tasks.append(asyncio.create_task(sampler.run()))
+    await _run_for_duration(tasks)
+
+
+def _print_header() -> None:
+    print(f"Sampling {len(_PERIODS_MS)} sensors for {_DURATION_MS} ms")  # noqa: T201
+    print(f"{'':<40} {'samples/s':>13} {'jitter (us)':>13}")  # noqa: T201
+
+
+def _benchmark(
+    name: str,
+    sample: "Callable[[list[_FakeSensor]], Coroutine[None, None, None]]",
+) -> None:
+    sensors = [_FakeSensor(period_ms) for period_ms in _PERIODS_MS]
+    asyncio.run(sample(sensors))
+    reads = sum(sensor.reads for sensor in sensors)
+    late_reads = sum(max(0, sensor.reads - 1) for sensor in sensors)
+    lateness_us = sum(sensor.lateness_us for sensor in sensors)
+    print(  # noqa: T201
+        f"{name:<40} {reads * 1_000 / _DURATION_MS:>13.0f}"
+        f" {lateness_us / max(1, late_reads):>13.0f}",
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    _print_header()
+    _benchmark("one task per sensor", _sample_by_hand)
+    _benchmark("sampler", _sample_with_sampler)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Benchmark of smoothing a stream of pressure readings.
+
+Compares the usual hand-written smoothing, which pulls each reading out as a float
+with `as_unit`, keeps a list of recent floats & wraps each result up as a new
+pressure, against a `PressureFilter` of each of the streaming filters. The
+throughput is given in samples per second.
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.streaming_filters
+    micropython -m benchmarks.streaming_filters
+"""
+
+from typing import TYPE_CHECKING
+
+from src.units import Pressure, PressureUnit, TimeDelta, TimeUnit
+from src.units.filters import (
+    ExponentialMovingAverage,
+    LowPass,
+    MovingAverage,
+    MovingMedian,
+)
+from src.units.pressure import PressureFilter
+
+from .timing import time_per_iteration_ns
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_ITERATIONS = 10_000
+_WINDOW = 16
+_SMOOTHING_FACTOR = 0.1
+_UNIT = PressureUnit.KILOPASCAL
+
+# Readings that wander about, so that the median has to move samples around
+_READINGS = [
+    Pressure(100 + (index * 7) % 13 - (index % 5) * 0.5, _UNIT) for index in range(64)
+]
+
+
+def _print_header() -> None:
+    print("Streaming filters (samples/s)")  # noqa: T201
+    print(f"{'':<40} {'by hand':>13} {'filter':>13} {'speedup':>8}")  # noqa: T201
+
+
+def _print_throughput(name: str, before_ns: float, after_ns: float) -> None:
+    print(  # noqa: T201
+        f"{name:<40} {1e9 / before_ns:>13.0f} {1e9 / after_ns:>13.0f}"
+        f" {before_ns / after_ns:>7.2f}x",
+    )
+
+
+def _filter_loop(pressure_filter: PressureFilter) -> "Callable[[int], None]":
+    """Return a loop that smooths the readings with the filter."""
+    readings = _READINGS
+    count = len(readings)
+
+    def loop(iterations: int) -> None:
+        pressure_filter.reset()
+        for index in range(iterations):
+            pressure_filter.update(readings[index % count])
+
+    return loop
+
+
+def _benchmark_moving_average() -> None:
+    readings = _READINGS
+    count = len(readings)
+
+    def before_loop(iterations: int) -> None:
+        window: list[float] = []
+        for index in range(iterations):
+            window.append(readings[index % count].as_unit(_UNIT))
+            if len(window) > _WINDOW:
+                window.pop(0)
+            Pressure(sum(window) / len(window), _UNIT)
+
+    _print_throughput(
+        "moving average",
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(
+            _filter_loop(PressureFilter(MovingAverage(_WINDOW), _UNIT)), _ITERATIONS
+        ),
+    )
+
+
+def _benchmark_exponential_moving_average() -> None:
+    readings = _READINGS
+    count = len(readings)
+
+    def before_loop(iterations: int) -> None:
+        average = readings[0].as_unit(_UNIT)
+        for index in range(iterations):
+            value = readings[index % count].as_unit(_UNIT)
+            average += _SMOOTHING_FACTOR * (value - average)
+            Pressure(average, _UNIT)
+
+    _print_throughput(
+        "exponential moving average",
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(
+            _filter_loop(
+                PressureFilter(ExponentialMovingAverage(_SMOOTHING_FACTOR), _UNIT)
+            ),
+            _ITERATIONS,
+        ),
+    )
+
+
+def _benchmark_low_pass() -> None:
+    readings = _READINGS
+    count = len(readings)
+    time_constant = TimeDelta(90, TimeUnit.MILLISECOND)
+    sample_period = TimeDelta(10, TimeUnit.MILLISECOND)
+
+    def before_loop(iterations: int) -> None:
+        period = sample_period.as_unit(TimeUnit.SECOND)
+        smoothing_factor = period / (time_constant.as_unit(TimeUnit.SECOND) + period)
+        output = readings[0].as_unit(_UNIT)
+        for index in range(iterations):
+            value = readings[index % count].as_unit(_UNIT)
+            output += smoothing_factor * (value - output)
+            Pressure(output, _UNIT)
+
+    _print_throughput(
+        "low-pass",
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(
+            _filter_loop(PressureFilter(LowPass(time_constant, sample_period), _UNIT)),
+            _ITERATIONS,
+        ),
+    )
+
+
+def _benchmark_moving_median() -> None:
+    readings = _READINGS
+    count = len(readings)
+
+    def before_loop(iterations: int) -> None:
+        window: list[float] = []
+        for index in range(iterations):
+            window.append(readings[index % count].as_unit(_UNIT))
+            if len(window) > _WINDOW:
+                window.pop(0)
+            ordered = sorted(window)
+            middle = len(ordered) // 2
+            if len(ordered) % 2:
+                Pressure(ordered[middle], _UNIT)
+            else:
+                Pressure((ordered[middle - 1] + ordered[middle]) / 2, _UNIT)
+
+    _print_throughput(
+        "moving median",
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(
+            _filter_loop(PressureFilter(MovingMedian(_WINDOW), _UNIT)), _ITERATIONS
+        ),
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    _print_header()
+    _benchmark_moving_average()
+    _benchmark_exponential_moving_average()
+    _benchmark_low_pass()
+    _benchmark_moving_median()
+
+
+if __name__ == "__main__":
+    main()
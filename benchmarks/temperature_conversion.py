@@ -0,0 +1,175 @@
+"""Benchmark of creating temperatures & expressing them in other units.
+
+Compares the current implementation, which converts with the parameters read from
+precomputed from-unit x to-unit tables, against the previous one, which looked up
+the kelvin conversion parameters of each unit through a function call & a pair of
+properties, and converted via kelvin.
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.temperature_conversion
+    micropython -m benchmarks.temperature_conversion
+"""
+
+# pyright: reportPrivateUsage=false
+
+from src.units import Temperature, TemperatureDelta, TemperatureUnit
+
+from .timing import print_comparison, print_header, time_per_iteration_ns
+
+_ITERATIONS = 10_000
+
+
+class _UnitConversionParameters:
+    """The previous parameters to convert a value from kelvin to a unit."""
+
+    __slots__ = ("_absolute_zero_offset", "_unit_delta_per_degree_kelvin")
+
+    def __init__(
+        self, unit_delta_per_degree_kelvin: float, absolute_zero_offset: float
+    ) -> None:
+        self._unit_delta_per_degree_kelvin = unit_delta_per_degree_kelvin
+        self._absolute_zero_offset = absolute_zero_offset
+
+    @property
+    def unit_delta_per_degree_kelvin(self) -> float:
+        return self._unit_delta_per_degree_kelvin
+
+    @property
+    def absolute_zero_offset(self) -> float:
+        return self._absolute_zero_offset
+
+
+_UNIT_CONVERSION_PARAMETERS = (
+    _UnitConversionParameters(float("nan"), float("nan")),
+    _UnitConversionParameters(1, -273.15),
+    _UnitConversionParameters(1, 0),
+    _UnitConversionParameters(1.8, -459.67),
+)
+
+
+def get_kelvin_to_unit_conversion_parameters(
+    unit: TemperatureUnit,
+) -> _UnitConversionParameters:
+    """Get the parameters to convert a value from kelvin to the unit, as previously."""
+    if not 0 < unit < len(_UNIT_CONVERSION_PARAMETERS):
+        raise ValueError
+
+    return _UNIT_CONVERSION_PARAMETERS[unit]
+
+
+class _ViaParametersTemperature(Temperature):
+    """Temperature with the previous `__init__` & `as_unit`, for comparison."""
+
+    __slots__ = ()
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self, value: float, unit: TemperatureUnit
+    ) -> None:
+        unit_conversion_parameters = get_kelvin_to_unit_conversion_parameters(unit)
+        value_as_kelvin = (
+            value - unit_conversion_parameters.absolute_zero_offset
+        ) / unit_conversion_parameters.unit_delta_per_degree_kelvin
+        if value_as_kelvin < 0:
+            raise ValueError
+
+        self._value = value
+        self._unit = unit
+        self._value_as_kelvin = value_as_kelvin
+
+    def as_unit(self, unit: TemperatureUnit) -> float:
+        external_unit_conversion_parameters = get_kelvin_to_unit_conversion_parameters(
+            unit,
+        )
+        return (
+            external_unit_conversion_parameters.unit_delta_per_degree_kelvin
+            * self._value_as_kelvin
+            + external_unit_conversion_parameters.absolute_zero_offset
+        )
+
+
+class _ViaParametersTemperatureDelta(TemperatureDelta):
+    """Temperature delta with the previous `__init__` & `as_unit`, for comparison."""
+
+    __slots__ = ()
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self, value: float, unit: TemperatureUnit
+    ) -> None:
+        self._value = value
+        self._unit = unit
+        internal_unit_conversion_parameters = get_kelvin_to_unit_conversion_parameters(
+            self._unit,
+        )
+        self._value_as_kelvin = (
+            self._value
+            / internal_unit_conversion_parameters.unit_delta_per_degree_kelvin
+        )
+
+    def as_unit(self, unit: TemperatureUnit) -> float:
+        external_unit_conversion_parameters = get_kelvin_to_unit_conversion_parameters(
+            unit,
+        )
+        return (
+            external_unit_conversion_parameters.unit_delta_per_degree_kelvin
+            * self._value_as_kelvin
+        )
+
+
+def _benchmark_create(name: str, before_cls: type, after_cls: type) -> None:
+    def before_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            before_cls(21.5, TemperatureUnit.CELSIUS)
+
+    def after_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            after_cls(21.5, TemperatureUnit.CELSIUS)
+
+    print_comparison(
+        name,
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def _benchmark_as_unit(
+    name: str,
+    before: Temperature | TemperatureDelta,
+    after: Temperature | TemperatureDelta,
+) -> None:
+    def before_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            before.as_unit(TemperatureUnit.FAHRENHEIT)
+
+    def after_loop(iterations: int) -> None:
+        for _ in range(iterations):
+            after.as_unit(TemperatureUnit.FAHRENHEIT)
+
+    print_comparison(
+        name,
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print_header("Temperature conversion: parameter lookup vs precomputed table")
+    _benchmark_create("Temperature(21.5, C)", _ViaParametersTemperature, Temperature)
+    _benchmark_create(
+        "TemperatureDelta(21.5, C)", _ViaParametersTemperatureDelta, TemperatureDelta
+    )
+    _benchmark_as_unit(
+        "Temperature.as_unit(F)",
+        _ViaParametersTemperature(21.5, TemperatureUnit.CELSIUS),
+        Temperature(21.5, TemperatureUnit.CELSIUS),
+    )
+    _benchmark_as_unit(
+        "TemperatureDelta.as_unit(F)",
+        _ViaParametersTemperatureDelta(21.5, TemperatureUnit.CELSIUS),
+        TemperatureDelta(21.5, TemperatureUnit.CELSIUS),
+    )
+
+
+if __name__ == "__main__":
+    main()
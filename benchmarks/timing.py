@@ -0,0 +1,48 @@
+"""Module for timing helpers that run on both CPython and micropython."""
+
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_REPEATS = 5
+
+
+def _time_loop_ns(loop: "Callable[[int], object]", iterations: int) -> int:
+    """Return how long a single run of the loop took, in nanoseconds."""
+    if hasattr(time, "ticks_us"):
+        # Micropython does not provide perf_counter_ns
+        start_us = time.ticks_us()  # type: ignore[attr-defined]
+        loop(iterations)
+        end_us = time.ticks_us()  # type: ignore[attr-defined]
+        return time.ticks_diff(end_us, start_us) * 1_000  # type: ignore[attr-defined]
+
+    start_ns = time.perf_counter_ns()
+    loop(iterations)
+    return time.perf_counter_ns() - start_ns
+
+
+def time_per_iteration_ns(loop: "Callable[[int], object]", iterations: int) -> float:
+    """Return the fastest mean time per iteration of the loop, in nanoseconds.
+
+    The loop is passed the number of iterations to run, so that the overhead of
+    calling it is amortised over all of them. The fastest of several runs is used,
+    as it is the least affected by other activity on the machine.
+    """
+    fastest_ns = min(_time_loop_ns(loop, iterations) for _ in range(_REPEATS))
+    return fastest_ns / iterations
+
+
+def print_comparison(name: str, before_ns: float, after_ns: float) -> None:
+    """Print the time per iteration before & after a change, and the speedup."""
+    print(  # noqa: T201
+        f"{name:<40} {before_ns:>10.1f} ns {after_ns:>10.1f} ns"
+        f" {before_ns / after_ns:>7.2f}x",
+    )
+
+
+def print_header(title: str, before: str = "before", after: str = "after") -> None:
+    """Print a title and the column headings for a table of comparisons."""
+    print(title)  # noqa: T201
+    print(f"{'':<40} {before:>13} {after:>13} {'speedup':>8}")  # noqa: T201
@@ -0,0 +1,63 @@
+"""Benchmark of totalling the volume delivered by a flow rate over many ticks.
+
+Compares the usual hand-written total, which adds the flow rate & tick converted
+with `as_unit` to a plain float on every tick, against a `VolumeTotalizer`, which
+adds the SI values held by each with compensated summation. Also prints how far
+each total has drifted from the exact total after the ticks.
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.totalizer
+    micropython -m benchmarks.totalizer
+"""
+
+from src.units import TimeDelta, TimeUnit, VolumetricFlowRate, VolumeUnit
+from src.units.flow_rate import VolumeTotalizer
+
+from .timing import print_comparison, print_header, time_per_iteration_ns
+
+_ITERATIONS = 10_000
+_DRIFT_TICKS = 100_000
+
+_FLOW_RATE = VolumetricFlowRate(0.6, VolumeUnit.LITRE, TimeUnit.MINUTE)
+_TICK = TimeDelta(10, TimeUnit.MILLISECOND)
+
+
+def _total_by_hand(ticks: int) -> float:
+    total = 0.0
+    for _ in range(ticks):
+        total += _FLOW_RATE.as_unit(VolumeUnit.LITRE, TimeUnit.SECOND) * _TICK.as_unit(
+            TimeUnit.SECOND
+        )
+    return total
+
+
+def _total_by_totalizer(ticks: int) -> float:
+    totalizer = VolumeTotalizer(VolumeUnit.LITRE)
+    for _ in range(ticks):
+        totalizer.add(_FLOW_RATE, _TICK)
+    return totalizer.total().as_unit(VolumeUnit.LITRE)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print_header("Volume totals", before="by hand", after="totalizer")
+    print_comparison(
+        "add a tick",
+        time_per_iteration_ns(_total_by_hand, _ITERATIONS),
+        time_per_iteration_ns(_total_by_totalizer, _ITERATIONS),
+    )
+
+    # 0.01L/s for 0.01s per tick
+    exact_total = _DRIFT_TICKS * 0.0001
+    print(f"Drift after {_DRIFT_TICKS} ticks (L)")  # noqa: T201
+    print(f"{'':<40} {'by hand':>13} {'totalizer':>13}")  # noqa: T201
+    print(  # noqa: T201
+        f"{'total - exact total':<40}"
+        f" {_total_by_hand(_DRIFT_TICKS) - exact_total:>13.3g}"
+        f" {_total_by_totalizer(_DRIFT_TICKS) - exact_total:>13.3g}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Benchmark of chains of arithmetic on temperatures & lengths.
+
+Compares the current operators, which create their results with a trusted internal
+constructor that takes the value in both the unit & the SI unit, against the
+previous ones, which created their results with the public initialiser (and so
+converted the value to the SI unit again, and revalidated it).
+
+Run from the root of the repository with either of:
+
+    python -m benchmarks.trusted_constructors
+    micropython -m benchmarks.trusted_constructors
+"""
+
+# pyright: reportPrivateUsage=false
+
+from src.units import (
+    DistanceUnit,
+    Length,
+    LengthDelta,
+    Temperature,
+    TemperatureDelta,
+    TemperatureUnit,
+)
+
+from .timing import print_comparison, print_header, time_per_iteration_ns
+
+_ITERATIONS = 10_000
+
+
+class _ViaInitialiserTemperature(Temperature):
+    """Temperature with the previous `__add__` & `__sub__`, for comparison."""
+
+    __slots__ = ()
+
+    def __add__(self, delta: TemperatureDelta) -> "_ViaInitialiserTemperature":
+        if self._unit == delta._unit:
+            return _ViaInitialiserTemperature(self._value + delta._value, self._unit)
+
+        value_sum_as_kelvin = self._value_as_kelvin + delta._value_as_kelvin
+        return _ViaInitialiserTemperature(value_sum_as_kelvin, TemperatureUnit.KELVIN)
+
+    def __sub__(self, other: TemperatureDelta) -> "_ViaInitialiserTemperature":  # type: ignore[override]
+        if self._unit == other._unit:
+            return _ViaInitialiserTemperature(self._value - other._value, self._unit)
+
+        value_difference_as_kelvin = self._value_as_kelvin - other._value_as_kelvin
+        return _ViaInitialiserTemperature(
+            value_difference_as_kelvin, TemperatureUnit.KELVIN
+        )
+
+
+class _ViaInitialiserLength(Length):
+    """Length with the previous `__add__` & `__sub__`, for comparison."""
+
+    __slots__ = ()
+
+    def __add__(self, delta: LengthDelta) -> "_ViaInitialiserLength":
+        if self._unit == delta._unit:
+            return _ViaInitialiserLength(self._value + delta._value, self._unit)
+
+        value_sum_as_metre = self._value_as_metre + delta._value_as_metre
+        return _ViaInitialiserLength(value_sum_as_metre, DistanceUnit.METRE)
+
+    def __sub__(self, other: LengthDelta) -> "_ViaInitialiserLength":  # type: ignore[override]
+        if self._unit == other._unit:
+            return _ViaInitialiserLength(self._value - other._value, self._unit)
+
+        value_difference_as_metre = self._value_as_metre - other._value_as_metre
+        return _ViaInitialiserLength(value_difference_as_metre, DistanceUnit.METRE)
+
+
+def _benchmark_temperature(name: str, delta: TemperatureDelta) -> None:
+    def before_loop(iterations: int) -> None:
+        temperature = _ViaInitialiserTemperature(20, TemperatureUnit.CELSIUS)
+        for _ in range(iterations):
+            temperature = temperature + delta - delta
+
+    def after_loop(iterations: int) -> None:
+        temperature = Temperature(20, TemperatureUnit.CELSIUS)
+        for _ in range(iterations):
+            temperature = temperature + delta - delta
+
+    print_comparison(
+        name,
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def _benchmark_length(name: str, delta: LengthDelta) -> None:
+    def before_loop(iterations: int) -> None:
+        length = _ViaInitialiserLength(1, DistanceUnit.MILLIMETRE)
+        for _ in range(iterations):
+            length = length + delta - delta
+
+    def after_loop(iterations: int) -> None:
+        length = Length(1, DistanceUnit.MILLIMETRE)
+        for _ in range(iterations):
+            length = length + delta - delta
+
+    print_comparison(
+        name,
+        time_per_iteration_ns(before_loop, _ITERATIONS),
+        time_per_iteration_ns(after_loop, _ITERATIONS),
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print_header("Chains of + & -: public initialiser vs trusted constructor")
+    _benchmark_temperature(
+        "Temperature + delta - delta (same unit)",
+        TemperatureDelta(0.5, TemperatureUnit.CELSIUS),
+    )
+    _benchmark_temperature(
+        "Temperature + delta - delta (mixed)",
+        TemperatureDelta(0.5, TemperatureUnit.KELVIN),
+    )
+    _benchmark_length(
+        "Length + delta - delta (same unit)",
+        LengthDelta(0.5, DistanceUnit.MILLIMETRE),
+    )
+    _benchmark_length(
+        "Length + delta - delta (mixed)",
+        LengthDelta(0.5, DistanceUnit.INCH),
+    )
+
+
+if __name__ == "__main__":
+    main()
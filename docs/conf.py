@@ -33,7 +33,7 @@ autodoc_default_options = {
     "undoc-members": True,
     "special-members": True,
     "autodoc-member-order": "groupwise",
-    "exclude-members": "__dict__, __weakref__, __annotations__, __new__, __module__, __str__, __repr__",  # noqa: E501
+    "exclude-members": "__dict__, __slots__, __weakref__, __annotations__, __new__, __module__, __str__, __repr__",  # noqa: E501
 }
 
 templates_path = ["_templates"]
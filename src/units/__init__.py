@@ -1,49 +1,101 @@
-"""Package for physical quantity modules and classes."""
+"""Package for physical quantity modules and classes.
 
-from . import (
-    angle,
-    angular_motion,
-    area,
-    current,
-    flow_rate,
-    length,
-    linear_motion,
-    pressure,
-    temperature,
-    time,
-    voltage,
-    volume,
-)
-from .units_inner.angle import Angle, AngleDelta
-from .units_inner.angle import Unit as AngleUnit
-from .units_inner.angular_motion import Acceleration as AngularAcceleration
-from .units_inner.angular_motion import Displacement as AngularDisplacement
-from .units_inner.angular_motion import Jerk as AngularJerk
-from .units_inner.angular_motion import Velocity as AngularVelocity
-from .units_inner.area import Area, AreaDelta, NegativeAreaValueError
-from .units_inner.area import Unit as AreaUnit
-from .units_inner.current import Current
-from .units_inner.current import Unit as CurrentUnit
-from .units_inner.flow_rate import MassFlowRate, VolumetricFlowRate
-from .units_inner.length import Length, LengthDelta, NegativeLengthValueError
-from .units_inner.length import Unit as DistanceUnit
-from .units_inner.linear_motion import Acceleration, Displacement, Jerk, Velocity
-from .units_inner.mass import Mass, MassDelta, NegativeMassValueError
-from .units_inner.mass import Unit as MassUnit
-from .units_inner.pressure import NegativePressureValueError, Pressure, PressureDelta
-from .units_inner.pressure import Unit as PressureUnit
-from .units_inner.temperature import (
-    BelowAbsoluteZeroError,
-    Temperature,
-    TemperatureDelta,
-)
-from .units_inner.temperature import Unit as TemperatureUnit
-from .units_inner.time import NegativeTimeValueError, Time, TimeDelta
-from .units_inner.time import Unit as TimeUnit
-from .units_inner.voltage import Unit as VoltageUnit
-from .units_inner.voltage import Voltage
-from .units_inner.volume import NegativeVolumeValueError, Volume, VolumeDelta
-from .units_inner.volume import Unit as VolumeUnit
+The modules & classes are only imported the first time they are accessed, so that
+the physical quantities which are not used take up no memory or import time.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import (
+        angle,
+        angular_motion,
+        area,
+        current,
+        filters,
+        flow_rate,
+        length,
+        linear_motion,
+        mass,
+        pressure,
+        quantity,
+        rate_estimators,
+        sampler,
+        temperature,
+        time,
+        voltage,
+        volume,
+    )
+    from .units_inner.angle import Angle, AngleDelta
+    from .units_inner.angle import Unit as AngleUnit
+    from .units_inner.angular_motion import Acceleration as AngularAcceleration
+    from .units_inner.angular_motion import Displacement as AngularDisplacement
+    from .units_inner.angular_motion import Jerk as AngularJerk
+    from .units_inner.angular_motion import Velocity as AngularVelocity
+    from .units_inner.area import (
+        Area,
+        AreaArray,
+        AreaDelta,
+        AreaDeltaArray,
+        NegativeAreaValueError,
+    )
+    from .units_inner.area import Unit as AreaUnit
+    from .units_inner.current import Current, CurrentArray
+    from .units_inner.current import Unit as CurrentUnit
+    from .units_inner.flow_rate import MassFlowRate, VolumetricFlowRate
+    from .units_inner.length import (
+        Length,
+        LengthArray,
+        LengthDelta,
+        LengthDeltaArray,
+        NegativeLengthValueError,
+    )
+    from .units_inner.length import Unit as DistanceUnit
+    from .units_inner.linear_motion import Acceleration, Displacement, Jerk, Velocity
+    from .units_inner.mass import (
+        Mass,
+        MassArray,
+        MassDelta,
+        MassDeltaArray,
+        NegativeMassValueError,
+    )
+    from .units_inner.mass import Unit as MassUnit
+    from .units_inner.pressure import (
+        NegativePressureValueError,
+        Pressure,
+        PressureArray,
+        PressureDelta,
+        PressureDeltaArray,
+    )
+    from .units_inner.pressure import Unit as PressureUnit
+    from .units_inner.quantity import DimensionMismatchError, Quantity
+    from .units_inner.quantity_array import get_indices
+    from .units_inner.temperature import (
+        BelowAbsoluteZeroError,
+        Temperature,
+        TemperatureArray,
+        TemperatureDelta,
+        TemperatureDeltaArray,
+    )
+    from .units_inner.temperature import Unit as TemperatureUnit
+    from .units_inner.time import (
+        NegativeTimeValueError,
+        Time,
+        TimeArray,
+        TimeDelta,
+        TimeDeltaArray,
+    )
+    from .units_inner.time import Unit as TimeUnit
+    from .units_inner.voltage import Unit as VoltageUnit
+    from .units_inner.voltage import Voltage, VoltageArray
+    from .units_inner.volume import (
+        NegativeVolumeValueError,
+        Volume,
+        VolumeArray,
+        VolumeDelta,
+        VolumeDeltaArray,
+    )
+    from .units_inner.volume import Unit as VolumeUnit
 
 __all__ = [
     "Acceleration",
@@ -55,19 +107,27 @@ __all__ = [
     "AngularJerk",
     "AngularVelocity",
     "Area",
+    "AreaArray",
     "AreaDelta",
+    "AreaDeltaArray",
     "AreaUnit",
     "BelowAbsoluteZeroError",
     "Current",
+    "CurrentArray",
     "CurrentUnit",
+    "DimensionMismatchError",
     "Displacement",
     "Displacement",
     "DistanceUnit",
     "Jerk",
     "Length",
+    "LengthArray",
     "LengthDelta",
+    "LengthDeltaArray",
     "Mass",
+    "MassArray",
     "MassDelta",
+    "MassDeltaArray",
     "MassFlowRate",
     "MassUnit",
     "NegativeAreaValueError",
@@ -77,32 +137,160 @@ __all__ = [
     "NegativeTimeValueError",
     "NegativeVolumeValueError",
     "Pressure",
+    "PressureArray",
     "PressureDelta",
+    "PressureDeltaArray",
     "PressureUnit",
+    "Quantity",
     "Temperature",
+    "TemperatureArray",
     "TemperatureDelta",
+    "TemperatureDeltaArray",
     "TemperatureUnit",
     "Time",
+    "TimeArray",
     "TimeDelta",
+    "TimeDeltaArray",
     "TimeUnit",
     "Velocity",
     "Velocity",
     "Voltage",
+    "VoltageArray",
     "VoltageUnit",
     "Volume",
+    "VolumeArray",
     "VolumeDelta",
+    "VolumeDeltaArray",
     "VolumeUnit",
     "VolumetricFlowRate",
     "angle",
     "angular_motion",
     "area",
     "current",
+    "filters",
     "flow_rate",
+    "get_indices",
     "length",
     "linear_motion",
+    "mass",
     "pressure",
+    "quantity",
+    "rate_estimators",
+    "sampler",
     "temperature",
     "time",
     "voltage",
     "volume",
 ]
+
+# The module (relative to this package) that each public name is imported from, and
+# the name of the attribute within that module, or None if the name is the module
+_LAZY_IMPORTS: "dict[str, tuple[str, str | None]]" = {
+    "Acceleration": ("units_inner.linear_motion", "Acceleration"),
+    "Angle": ("units_inner.angle", "Angle"),
+    "AngleDelta": ("units_inner.angle", "AngleDelta"),
+    "AngleUnit": ("units_inner.angle", "Unit"),
+    "AngularAcceleration": ("units_inner.angular_motion", "Acceleration"),
+    "AngularDisplacement": ("units_inner.angular_motion", "Displacement"),
+    "AngularJerk": ("units_inner.angular_motion", "Jerk"),
+    "AngularVelocity": ("units_inner.angular_motion", "Velocity"),
+    "Area": ("units_inner.area", "Area"),
+    "AreaArray": ("units_inner.area", "AreaArray"),
+    "AreaDelta": ("units_inner.area", "AreaDelta"),
+    "AreaDeltaArray": ("units_inner.area", "AreaDeltaArray"),
+    "AreaUnit": ("units_inner.area", "Unit"),
+    "BelowAbsoluteZeroError": ("units_inner.temperature", "BelowAbsoluteZeroError"),
+    "Current": ("units_inner.current", "Current"),
+    "CurrentArray": ("units_inner.current", "CurrentArray"),
+    "CurrentUnit": ("units_inner.current", "Unit"),
+    "DimensionMismatchError": ("units_inner.quantity", "DimensionMismatchError"),
+    "Displacement": ("units_inner.linear_motion", "Displacement"),
+    "DistanceUnit": ("units_inner.length", "Unit"),
+    "Jerk": ("units_inner.linear_motion", "Jerk"),
+    "Length": ("units_inner.length", "Length"),
+    "LengthArray": ("units_inner.length", "LengthArray"),
+    "LengthDelta": ("units_inner.length", "LengthDelta"),
+    "LengthDeltaArray": ("units_inner.length", "LengthDeltaArray"),
+    "Mass": ("units_inner.mass", "Mass"),
+    "MassArray": ("units_inner.mass", "MassArray"),
+    "MassDelta": ("units_inner.mass", "MassDelta"),
+    "MassDeltaArray": ("units_inner.mass", "MassDeltaArray"),
+    "MassFlowRate": ("units_inner.flow_rate", "MassFlowRate"),
+    "MassUnit": ("units_inner.mass", "Unit"),
+    "NegativeAreaValueError": ("units_inner.area", "NegativeAreaValueError"),
+    "NegativeLengthValueError": ("units_inner.length", "NegativeLengthValueError"),
+    "NegativeMassValueError": ("units_inner.mass", "NegativeMassValueError"),
+    "NegativePressureValueError": (
+        "units_inner.pressure",
+        "NegativePressureValueError",
+    ),
+    "NegativeTimeValueError": ("units_inner.time", "NegativeTimeValueError"),
+    "NegativeVolumeValueError": ("units_inner.volume", "NegativeVolumeValueError"),
+    "Pressure": ("units_inner.pressure", "Pressure"),
+    "PressureArray": ("units_inner.pressure", "PressureArray"),
+    "PressureDelta": ("units_inner.pressure", "PressureDelta"),
+    "PressureDeltaArray": ("units_inner.pressure", "PressureDeltaArray"),
+    "PressureUnit": ("units_inner.pressure", "Unit"),
+    "Quantity": ("units_inner.quantity", "Quantity"),
+    "Temperature": ("units_inner.temperature", "Temperature"),
+    "TemperatureArray": ("units_inner.temperature", "TemperatureArray"),
+    "TemperatureDelta": ("units_inner.temperature", "TemperatureDelta"),
+    "TemperatureDeltaArray": ("units_inner.temperature", "TemperatureDeltaArray"),
+    "TemperatureUnit": ("units_inner.temperature", "Unit"),
+    "Time": ("units_inner.time", "Time"),
+    "TimeArray": ("units_inner.time", "TimeArray"),
+    "TimeDelta": ("units_inner.time", "TimeDelta"),
+    "TimeDeltaArray": ("units_inner.time", "TimeDeltaArray"),
+    "TimeUnit": ("units_inner.time", "Unit"),
+    "Velocity": ("units_inner.linear_motion", "Velocity"),
+    "Voltage": ("units_inner.voltage", "Voltage"),
+    "VoltageArray": ("units_inner.voltage", "VoltageArray"),
+    "VoltageUnit": ("units_inner.voltage", "Unit"),
+    "Volume": ("units_inner.volume", "Volume"),
+    "VolumeArray": ("units_inner.volume", "VolumeArray"),
+    "VolumeDelta": ("units_inner.volume", "VolumeDelta"),
+    "VolumeDeltaArray": ("units_inner.volume", "VolumeDeltaArray"),
+    "VolumeUnit": ("units_inner.volume", "Unit"),
+    "VolumetricFlowRate": ("units_inner.flow_rate", "VolumetricFlowRate"),
+    "get_indices": ("units_inner.quantity_array", "get_indices"),
+    "angle": ("angle", None),
+    "angular_motion": ("angular_motion", None),
+    "area": ("area", None),
+    "current": ("current", None),
+    "filters": ("filters", None),
+    "flow_rate": ("flow_rate", None),
+    "length": ("length", None),
+    "linear_motion": ("linear_motion", None),
+    "mass": ("mass", None),
+    "pressure": ("pressure", None),
+    "quantity": ("quantity", None),
+    "rate_estimators": ("rate_estimators", None),
+    "sampler": ("sampler", None),
+    "temperature": ("temperature", None),
+    "time": ("time", None),
+    "voltage": ("voltage", None),
+    "volume": ("volume", None),
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import a public module or class on first access.
+
+    The imported object is stored in the package, so that this is only called once
+    per name.
+
+    Raises:
+        AttributeError: The name is not part of the package.
+    """
+    try:
+        module_name, attribute_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    # A non-empty fromlist makes __import__ return the submodule itself, rather than
+    # the top-level package
+    module = __import__(module_name, globals(), None, ("__name__",), 1)
+    value = module if attribute_name is None else getattr(module, attribute_name)
+    globals()[name] = value
+    return value
@@ -1,5 +1,25 @@
 """Module for grouping angle-related classes."""
 
-from .units_inner.angle import Angle, AngleDelta, Unit
+from .units_inner.angle import (
+    Angle,
+    AngleCell,
+    AngleDelta,
+    AngleThreshold,
+    Unit,
+    convert_into,
+    make_converter,
+    unwrap_into,
+    wrap_into,
+)
 
-__all__ = ["Angle", "AngleDelta", "Unit"]
+__all__ = [
+    "Angle",
+    "AngleCell",
+    "AngleDelta",
+    "AngleThreshold",
+    "Unit",
+    "convert_into",
+    "make_converter",
+    "unwrap_into",
+    "wrap_into",
+]
@@ -1,7 +1,27 @@
 """Module for grouping angular-motion-related classes and constants."""
 
 from .units_inner.angle import Unit as AngleUnit
-from .units_inner.angular_motion import Acceleration, Displacement, Jerk, Velocity
+from .units_inner.angular_motion import (
+    Acceleration,
+    Displacement,
+    Jerk,
+    Unwrapper,
+    Velocity,
+    VelocityEstimator,
+    convert_into,
+    make_converter,
+)
 from .units_inner.time import Unit as TimeUnit
 
-__all__ = ["Acceleration", "AngleUnit", "Displacement", "Jerk", "TimeUnit", "Velocity"]
+__all__ = [
+    "Acceleration",
+    "AngleUnit",
+    "Displacement",
+    "Jerk",
+    "TimeUnit",
+    "Unwrapper",
+    "Velocity",
+    "VelocityEstimator",
+    "convert_into",
+    "make_converter",
+]
@@ -3,9 +3,35 @@
 from .units_inner.area import (
     ZERO,
     Area,
+    AreaArray,
+    AreaCell,
     AreaDelta,
+    AreaDeltaArray,
+    AreaFilter,
+    AreaSeries,
+    AreaThreshold,
+    FixedPointArea,
+    FixedPointAreaDelta,
     NegativeAreaValueError,
     Unit,
+    convert_into,
+    make_converter,
 )
 
-__all__ = ["ZERO", "Area", "AreaDelta", "NegativeAreaValueError", "Unit"]
+__all__ = [
+    "ZERO",
+    "Area",
+    "AreaArray",
+    "AreaCell",
+    "AreaDelta",
+    "AreaDeltaArray",
+    "AreaFilter",
+    "AreaSeries",
+    "AreaThreshold",
+    "FixedPointArea",
+    "FixedPointAreaDelta",
+    "NegativeAreaValueError",
+    "Unit",
+    "convert_into",
+    "make_converter",
+]
@@ -1,5 +1,27 @@
 """Module for grouping current-related classes."""
 
-from .units_inner.current import Current, Unit
+from .units_inner.current import (
+    Current,
+    CurrentArray,
+    CurrentCell,
+    CurrentFilter,
+    CurrentSeries,
+    CurrentThreshold,
+    FixedPointCurrent,
+    Unit,
+    convert_into,
+    make_converter,
+)
 
-__all__ = ["Current", "Unit"]
+__all__ = [
+    "Current",
+    "CurrentArray",
+    "CurrentCell",
+    "CurrentFilter",
+    "CurrentSeries",
+    "CurrentThreshold",
+    "FixedPointCurrent",
+    "Unit",
+    "convert_into",
+    "make_converter",
+]
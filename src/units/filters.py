@@ -0,0 +1,15 @@
+"""Module for grouping the streaming filters that smooth a stream of samples."""
+
+from .units_inner.filters import (
+    ExponentialMovingAverage,
+    LowPass,
+    MovingAverage,
+    MovingMedian,
+)
+
+__all__ = [
+    "ExponentialMovingAverage",
+    "LowPass",
+    "MovingAverage",
+    "MovingMedian",
+]
@@ -1,8 +1,31 @@
 """Module for grouping flow-rate-related classes and constants."""
 
-from .units_inner.flow_rate import MassFlowRate, VolumetricFlowRate
+from .units_inner.flow_rate import (
+    MassFlowRate,
+    MassTotalizer,
+    VolumeTotalizer,
+    VolumetricFlowRate,
+    VolumetricFlowRateEstimator,
+    convert_mass_flow_rate_into,
+    convert_volumetric_flow_rate_into,
+    make_mass_flow_rate_converter,
+    make_volumetric_flow_rate_converter,
+)
 from .units_inner.mass import Unit as MassUnit
 from .units_inner.time import Unit as TimeUnit
 from .units_inner.volume import Unit as VolumeUnit
 
-__all__ = ["MassFlowRate", "MassUnit", "TimeUnit", "VolumeUnit", "VolumetricFlowRate"]
+__all__ = [
+    "MassFlowRate",
+    "MassTotalizer",
+    "MassUnit",
+    "TimeUnit",
+    "VolumeTotalizer",
+    "VolumeUnit",
+    "VolumetricFlowRate",
+    "VolumetricFlowRateEstimator",
+    "convert_mass_flow_rate_into",
+    "convert_volumetric_flow_rate_into",
+    "make_mass_flow_rate_converter",
+    "make_volumetric_flow_rate_converter",
+]
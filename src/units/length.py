@@ -2,16 +2,36 @@
 
 from .units_inner.length import (
     ZERO,
+    FixedPointLength,
+    FixedPointLengthDelta,
     Length,
+    LengthArray,
+    LengthCell,
     LengthDelta,
+    LengthDeltaArray,
+    LengthFilter,
+    LengthSeries,
+    LengthThreshold,
     NegativeLengthValueError,
     Unit,
+    convert_into,
+    make_converter,
 )
 
 __all__ = [
     "ZERO",
+    "FixedPointLength",
+    "FixedPointLengthDelta",
     "Length",
+    "LengthArray",
+    "LengthCell",
     "LengthDelta",
+    "LengthDeltaArray",
+    "LengthFilter",
+    "LengthSeries",
+    "LengthThreshold",
     "NegativeLengthValueError",
     "Unit",
+    "convert_into",
+    "make_converter",
 ]
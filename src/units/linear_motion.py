@@ -4,16 +4,24 @@ from .units_inner.length import Unit as DistanceUnit
 from .units_inner.linear_motion import (
     Acceleration,
     Displacement,
+    DisplacementTotalizer,
     Jerk,
     Velocity,
+    VelocityEstimator,
+    convert_into,
+    make_converter,
 )
 from .units_inner.time import Unit as TimeUnit
 
 __all__ = [
     "Acceleration",
     "Displacement",
+    "DisplacementTotalizer",
     "DistanceUnit",
     "Jerk",
     "TimeUnit",
     "Velocity",
+    "VelocityEstimator",
+    "convert_into",
+    "make_converter",
 ]
@@ -2,16 +2,36 @@
 
 from .units_inner.mass import (
     ZERO,
+    FixedPointMass,
+    FixedPointMassDelta,
     Mass,
+    MassArray,
+    MassCell,
     MassDelta,
+    MassDeltaArray,
+    MassFilter,
+    MassSeries,
+    MassThreshold,
     NegativeMassValueError,
     Unit,
+    convert_into,
+    make_converter,
 )
 
 __all__ = [
     "ZERO",
+    "FixedPointMass",
+    "FixedPointMassDelta",
     "Mass",
+    "MassArray",
+    "MassCell",
     "MassDelta",
+    "MassDeltaArray",
+    "MassFilter",
+    "MassSeries",
+    "MassThreshold",
     "NegativeMassValueError",
     "Unit",
+    "convert_into",
+    "make_converter",
 ]
@@ -3,17 +3,37 @@
 from .units_inner.pressure import (
     PERFECT_VACUUM,
     STANDARD_ATMOSPHERE,
+    FixedPointPressure,
+    FixedPointPressureDelta,
     NegativePressureValueError,
     Pressure,
+    PressureArray,
+    PressureCell,
     PressureDelta,
+    PressureDeltaArray,
+    PressureFilter,
+    PressureSeries,
+    PressureThreshold,
     Unit,
+    convert_into,
+    make_converter,
 )
 
 __all__ = [
     "PERFECT_VACUUM",
     "STANDARD_ATMOSPHERE",
+    "FixedPointPressure",
+    "FixedPointPressureDelta",
     "NegativePressureValueError",
     "Pressure",
+    "PressureArray",
+    "PressureCell",
     "PressureDelta",
+    "PressureDeltaArray",
+    "PressureFilter",
+    "PressureSeries",
+    "PressureThreshold",
     "Unit",
+    "convert_into",
+    "make_converter",
 ]
@@ -0,0 +1,37 @@
+"""Module for grouping the generic quantity class and dimensions."""
+
+from .units_inner.quantity import (
+    ANGLE,
+    CURRENT,
+    DIMENSIONLESS,
+    LENGTH,
+    MASS,
+    MAX_EXPONENT,
+    TEMPERATURE,
+    TIME,
+    DimensionMismatchError,
+    Quantity,
+    get_exponents,
+    get_power_dimension,
+    get_product_dimension,
+    get_symbol,
+    make_dimension,
+)
+
+__all__ = [
+    "ANGLE",
+    "CURRENT",
+    "DIMENSIONLESS",
+    "LENGTH",
+    "MASS",
+    "MAX_EXPONENT",
+    "TEMPERATURE",
+    "TIME",
+    "DimensionMismatchError",
+    "Quantity",
+    "get_exponents",
+    "get_power_dimension",
+    "get_product_dimension",
+    "get_symbol",
+    "make_dimension",
+]
@@ -0,0 +1,13 @@
+"""Module for grouping the estimators of the rate of change of a stream of samples."""
+
+from .units_inner.rate_estimators import (
+    CentralDifference,
+    FirstDifference,
+    LeastSquaresSlope,
+)
+
+__all__ = [
+    "CentralDifference",
+    "FirstDifference",
+    "LeastSquaresSlope",
+]
@@ -0,0 +1,17 @@
+"""Module for grouping the classes that sample sensors on a schedule."""
+
+from .units_inner.sampler import (
+    QueueEmptyError,
+    QueueFullError,
+    SampleQueue,
+    Sampler,
+    Sensor,
+)
+
+__all__ = [
+    "QueueEmptyError",
+    "QueueFullError",
+    "SampleQueue",
+    "Sampler",
+    "Sensor",
+]
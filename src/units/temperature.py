@@ -4,14 +4,34 @@ from .units_inner.temperature import (
     ABSOLUTE_ZERO,
     BelowAbsoluteZeroError,
     Temperature,
+    TemperatureArray,
+    TemperatureCell,
     TemperatureDelta,
+    TemperatureDeltaArray,
+    TemperatureFilter,
+    TemperatureSeries,
+    TemperatureThreshold,
     Unit,
+    convert_delta_into,
+    convert_into,
+    make_converter,
+    make_delta_converter,
 )
 
 __all__ = [
     "ABSOLUTE_ZERO",
     "BelowAbsoluteZeroError",
     "Temperature",
+    "TemperatureArray",
+    "TemperatureCell",
     "TemperatureDelta",
+    "TemperatureDeltaArray",
+    "TemperatureFilter",
+    "TemperatureSeries",
+    "TemperatureThreshold",
     "Unit",
+    "convert_delta_into",
+    "convert_into",
+    "make_converter",
+    "make_delta_converter",
 ]
@@ -1,5 +1,33 @@
 """Module for grouping time-related classes and constants."""
 
-from .units_inner.time import ZERO, NegativeTimeValueError, Time, TimeDelta, Unit
+from .units_inner.time import (
+    ZERO,
+    FixedPointTime,
+    FixedPointTimeDelta,
+    NegativeTimeValueError,
+    Time,
+    TimeArray,
+    TimeCell,
+    TimeDelta,
+    TimeDeltaArray,
+    TimeThreshold,
+    Unit,
+    convert_into,
+    make_converter,
+)
 
-__all__ = ["ZERO", "NegativeTimeValueError", "Time", "TimeDelta", "Unit"]
+__all__ = [
+    "ZERO",
+    "FixedPointTime",
+    "FixedPointTimeDelta",
+    "NegativeTimeValueError",
+    "Time",
+    "TimeArray",
+    "TimeCell",
+    "TimeDelta",
+    "TimeDeltaArray",
+    "TimeThreshold",
+    "Unit",
+    "convert_into",
+    "make_converter",
+]
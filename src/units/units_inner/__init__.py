@@ -1,22 +1,27 @@
 """Internal package for physical quantity modules and classes.
 
-Structured like this to allow for internal sharing of non-public functions.
+Structured like this to allow for internal sharing of non-public functions. The
+subpackages are only imported the first time they are accessed.
 """
 
-from . import (
-    angle,
-    angular_motion,
-    area,
-    current,
-    flow_rate,
-    length,
-    linear_motion,
-    pressure,
-    temperature,
-    time,
-    voltage,
-    volume,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import (
+        angle,
+        angular_motion,
+        area,
+        current,
+        flow_rate,
+        length,
+        linear_motion,
+        pressure,
+        quantity,
+        temperature,
+        time,
+        voltage,
+        volume,
+    )
 
 __all__ = [
     "angle",
@@ -27,8 +32,28 @@ __all__ = [
     "length",
     "linear_motion",
     "pressure",
+    "quantity",
     "temperature",
     "time",
     "voltage",
     "volume",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import a subpackage on first access.
+
+    Not intended for public use.
+
+    Raises:
+        AttributeError: The name is not a subpackage.
+    """
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    # A non-empty fromlist makes __import__ return the subpackage itself, rather than
+    # the top-level package
+    subpackage = __import__(name, globals(), None, ("__name__",), 1)
+    globals()[name] = subpackage
+    return subpackage
@@ -2,15 +2,35 @@
 
 from .angle import Angle
 from .angle_delta import AngleDelta
-from .unit import Unit, get_unit_delta_per_radian
+from .converter import convert_into, make_converter
+from .isr import AngleCell, AngleThreshold
+from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    FULL_TURNS,
+    HALF_TURNS,
+    Unit,
+    get_unit_delta_per_radian,
+)
 from .unit import get_abbreviation as get_unit_abbreviation
 from .unit import get_name as get_unit_name
+from .wrap import unwrap_into, wrap_into
 
 __all__ = [
+    "CONVERSION_FACTORS",
+    "CONVERSION_FACTORS_STRIDE",
+    "FULL_TURNS",
+    "HALF_TURNS",
     "Angle",
+    "AngleCell",
     "AngleDelta",
+    "AngleThreshold",
     "Unit",
+    "convert_into",
     "get_unit_abbreviation",
     "get_unit_delta_per_radian",
     "get_unit_name",
+    "make_converter",
+    "unwrap_into",
+    "wrap_into",
 ]
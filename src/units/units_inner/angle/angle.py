@@ -1,24 +1,33 @@
 """Module for the angle class."""
 
-import math
+# pyright: reportPrivateUsage=false
+
 from typing import overload
 
 from .angle_delta import AngleDelta
 from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    FULL_TURNS,
+    UNIT_DELTAS_PER_RADIAN,
     Unit,
     get_abbreviation,
     get_name,
-    get_unit_delta_per_radian,
 )
 
 
-def _map_to_unit_circle(value: float, unit: Unit) -> float:
-    """Map an angle to the range [0, 2*pi) radians."""
-    unit_delta_per_radian = get_unit_delta_per_radian(unit)
-    tmp_value = value % (2 * math.pi * unit_delta_per_radian)
-    return (
-        tmp_value if tmp_value >= 0 else tmp_value + 2 * math.pi * unit_delta_per_radian
-    )
+def _map_to_unit_circle(value: float, full_turn: float) -> float:
+    """Map an angle to the range [0, 2*pi) radians.
+
+    The full turn is expressed in the unit of the value. Values that are already in
+    range (such as most results of arithmetic) are returned as-is.
+    """
+    if 0 <= value < full_turn:
+        return value
+
+    value %= full_turn
+    # The modulo of a tiny negative value can round up to a full turn
+    return value if value < full_turn else 0.0
 
 
 class Angle:
@@ -27,6 +36,8 @@ class Angle:
     Angle always in range [0, 2*pi) radians.
     """
 
+    __slots__ = ("_unit", "_value", "_value_as_radian")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new angle.
 
@@ -41,23 +52,53 @@ class Angle:
         +--------+--------------------------------+-----------------------------+
         | Above  | Angle(4, Unit.REVOLUTION)      | Angle(0, Unit.REVOLUTION)   |
         +--------+--------------------------------+-----------------------------+
+
+        Raises:
+            ValueError: The unit is not an angle unit.
         """
-        self._value = _map_to_unit_circle(value, unit)
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        self._value = _map_to_unit_circle(value, FULL_TURNS[unit])
         self._unit = unit
+        self._value_as_radian = self._value / UNIT_DELTAS_PER_RADIAN[unit]
+
+    @classmethod
+    def _create(cls, value: float, unit: Unit) -> "Angle":
+        """Create an angle from a value in a unit known to be valid.
+
+        Not intended for public use.
+
+        The value is still mapped into range, but the unit is not checked again.
+        """
+        value = _map_to_unit_circle(value, FULL_TURNS[unit])
+        angle: Angle = cls.__new__(cls)
+        angle._value = value
+        angle._unit = unit
+        angle._value_as_radian = value / UNIT_DELTAS_PER_RADIAN[unit]
+        return angle
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the angle, expressed as the unit."""
-        internal_unit_delta_per_radian = get_unit_delta_per_radian(self._unit)
-        value_as_radian = self._value / internal_unit_delta_per_radian
-        external_unit_delta_per_radian = get_unit_delta_per_radian(unit)
-        return external_unit_delta_per_radian * value_as_radian
+        """Return the angle, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not an angle unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __add__(self, delta: AngleDelta) -> "Angle":
         """Return the sum of the angle and the difference."""
-        value_as_radian = self.as_unit(Unit.RADIAN)
-        delta_value_as_radian = delta.as_unit(Unit.RADIAN)
-        value_sum_as_radian = value_as_radian + delta_value_as_radian
-        return Angle(value_sum_as_radian, Unit.RADIAN)
+        if self._unit == delta._unit:
+            return Angle._create(self._value + delta._value, self._unit)
+
+        value_sum_as_radian = self._value_as_radian + delta._value_as_radian
+        return Angle._create(value_sum_as_radian, Unit.RADIAN)
 
     def __radd__(self, delta: AngleDelta) -> "Angle":
         """Return the sum of the angle and the difference."""
@@ -77,13 +118,19 @@ class Angle:
         - If the argument is an angle, return the difference between the two angles.
         - If the argument is an angle delta, return the angle less the difference.
         """
-        value_as_radian = self.as_unit(Unit.RADIAN)
-        other_value_as_radian = other.as_unit(Unit.RADIAN)
-        value_difference_as_radian = value_as_radian - other_value_as_radian
+        if self._unit == other._unit:
+            value_difference = self._value - other._value
+            return (
+                AngleDelta._create(value_difference, self._unit)
+                if isinstance(other, Angle)
+                else Angle._create(value_difference, self._unit)
+            )
+
+        value_difference_as_radian = self._value_as_radian - other._value_as_radian
         return (
-            AngleDelta(value_difference_as_radian, Unit.RADIAN)
+            AngleDelta._create(value_difference_as_radian, Unit.RADIAN)
             if isinstance(other, Angle)
-            else Angle(value_difference_as_radian, Unit.RADIAN)
+            else Angle._create(value_difference_as_radian, Unit.RADIAN)
         )
 
     def __eq__(self, other: object) -> bool:
@@ -91,11 +138,11 @@ class Angle:
         if not isinstance(other, Angle):
             return NotImplemented
 
-        return self.as_unit(Unit.RADIAN) == other.as_unit(Unit.RADIAN)
+        return self._value_as_radian == other._value_as_radian
 
     def __hash__(self) -> int:
         """Return the hash of the length."""
-        return hash(self.as_unit(Unit.RADIAN))
+        return hash(self._value_as_radian)
 
     def __str__(self) -> str:
         """Return a string representation of the length."""
@@ -1,24 +1,28 @@
 """Module for the angle difference class."""
 
-import math
-
 from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    FULL_TURNS,
+    HALF_TURNS,
+    UNIT_DELTAS_PER_RADIAN,
     Unit,
     get_abbreviation,
     get_name,
-    get_unit_delta_per_radian,
 )
 
 
-def _map_to_unit_circle(value: float, unit: Unit) -> float:
-    """Map an angle to the range [-pi, pi) radians."""
-    unit_delta_per_radian = get_unit_delta_per_radian(unit)
-    tmp_value = value % (2 * math.pi * unit_delta_per_radian)
-    if tmp_value < -math.pi * unit_delta_per_radian:
-        return tmp_value + 2 * math.pi * unit_delta_per_radian
-    if tmp_value >= math.pi * unit_delta_per_radian:
-        return tmp_value - 2 * math.pi * unit_delta_per_radian
-    return tmp_value
+def _map_to_unit_circle(value: float, full_turn: float, half_turn: float) -> float:
+    """Map an angle to the range [-pi, pi) radians.
+
+    The full & half turns are expressed in the unit of the value. Values that are
+    already in range (such as most results of arithmetic) are returned as-is.
+    """
+    if -half_turn <= value < half_turn:
+        return value
+
+    value %= full_turn
+    return value - full_turn if value >= half_turn else value
 
 
 class AngleDelta:
@@ -27,6 +31,8 @@ class AngleDelta:
     Angle difference always in range [-pi, pi) radians.
     """
 
+    __slots__ = ("_unit", "_value", "_value_as_radian")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new angle difference.
 
@@ -41,16 +47,45 @@ class AngleDelta:
         +--------+-----------------------------------+-----------------------------------+
         | Above  | AngleDelta(3.75, Unit.REVOLUTION) | AngleDelta(-0.25, Unit.REVOLUTION)|
         +--------+-----------------------------------+-----------------------------------+
+
+        Raises:
+            ValueError: The unit is not an angle unit.
         """  # noqa: E501
-        self._value = _map_to_unit_circle(value, unit)
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        self._value = _map_to_unit_circle(value, FULL_TURNS[unit], HALF_TURNS[unit])
         self._unit = unit
+        self._value_as_radian = self._value / UNIT_DELTAS_PER_RADIAN[unit]
+
+    @classmethod
+    def _create(cls, value: float, unit: Unit) -> "AngleDelta":
+        """Create an angle difference from a value in a unit known to be valid.
+
+        Not intended for public use.
+
+        The value is still mapped into range, but the unit is not checked again.
+        """
+        value = _map_to_unit_circle(value, FULL_TURNS[unit], HALF_TURNS[unit])
+        angle_delta: AngleDelta = cls.__new__(cls)
+        angle_delta._value = value
+        angle_delta._unit = unit
+        angle_delta._value_as_radian = value / UNIT_DELTAS_PER_RADIAN[unit]
+        return angle_delta
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the angle difference, expressed as the unit."""
-        internal_unit_delta_per_radian = get_unit_delta_per_radian(self._unit)
-        value_as_radian = self._value / internal_unit_delta_per_radian
-        external_unit_delta_per_radian = get_unit_delta_per_radian(unit)
-        return external_unit_delta_per_radian * value_as_radian
+        """Return the angle difference, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not an angle unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __add__(self, other: "AngleDelta") -> "AngleDelta":
         """Return the sum of the angle differences."""
@@ -60,10 +95,11 @@ class AngleDelta:
         if not isinstance(other, AngleDelta):  # type: ignore[reportUnnecessaryIsInstance]
             return NotImplemented
 
-        value_as_radian = self.as_unit(Unit.RADIAN)
-        delta_value_as_radian = other.as_unit(Unit.RADIAN)
-        added_value_as_radian = value_as_radian + delta_value_as_radian
-        return AngleDelta(added_value_as_radian, Unit.RADIAN)
+        if self._unit == other._unit:
+            return AngleDelta._create(self._value + other._value, self._unit)
+
+        added_value_as_radian = self._value_as_radian + other._value_as_radian
+        return AngleDelta._create(added_value_as_radian, Unit.RADIAN)
 
     def __sub__(self, delta: "AngleDelta") -> "AngleDelta":
         """Return the difference between the angle differences."""
@@ -72,18 +108,18 @@ class AngleDelta:
     def __neg__(self) -> "AngleDelta":
         """Return the inverse of the angle difference."""
         inverted_value = -self._value
-        return AngleDelta(inverted_value, self._unit)
+        return AngleDelta._create(inverted_value, self._unit)
 
     def __eq__(self, other: object) -> bool:
         """Return whether the objects are equal angle differences."""
         if not isinstance(other, AngleDelta):
             return NotImplemented
 
-        return self.as_unit(Unit.RADIAN) == other.as_unit(Unit.RADIAN)
+        return self._value_as_radian == other._value_as_radian
 
     def __hash__(self) -> int:
         """Return the hash of the angle difference."""
-        return hash(self.as_unit(Unit.RADIAN))
+        return hash(self._value_as_radian)
 
     def __str__(self) -> str:
         """Return a string representation of the angle difference."""
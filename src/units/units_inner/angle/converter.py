@@ -0,0 +1,67 @@
+"""Module for the angle unit converters."""
+
+# ruff: noqa: TID252
+
+from typing import TYPE_CHECKING
+
+from ..buffer import convert_values_into
+from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    Unit,
+    get_unit_delta_per_radian,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, MutableSequence, Sequence
+
+
+def _get_conversion_factor(from_unit: Unit, to_unit: Unit) -> float:
+    """Get the factor that converts a angle value from one unit to another.
+
+    Not intended for public use.
+
+    Raises:
+        ValueError: Either of the units is not a angle unit.
+    """
+    # Validate the units, as the table lookup would silently accept some bad units
+    get_unit_delta_per_radian(from_unit)
+    get_unit_delta_per_radian(to_unit)
+    return CONVERSION_FACTORS[from_unit * CONVERSION_FACTORS_STRIDE + to_unit]
+
+
+def make_converter(from_unit: Unit, to_unit: Unit) -> "Callable[[float], float]":
+    """Make a function that converts a angle value from one unit to another.
+
+    The conversion factor is looked up once, up front, so converting a value is a
+    single multiplication & no intermediate objects are created.
+
+    Raises:
+        ValueError: Either of the units is not a angle unit.
+    """
+    factor = _get_conversion_factor(from_unit, to_unit)
+
+    def convert(value: float) -> float:
+        return value * factor
+
+    return convert
+
+
+def convert_into(
+    src: "Sequence[float]",
+    dst: "MutableSequence[float] | memoryview[float]",
+    from_unit: Unit,
+    to_unit: Unit,
+) -> None:
+    """Convert a buffer of angle values from one unit to another, writing into dst.
+
+    The values are written to the start of the destination buffer, which can be any
+    buffer of floats (such as an `array('f')`, or a memoryview cast onto a
+    bytearray). The source & destination may be the same buffer, in which case the
+    values are converted in place. No intermediate objects are created.
+
+    Raises:
+        ValueError: Either of the units is not a angle unit, or the destination is
+            shorter than the source.
+    """
+    convert_values_into(src, dst, _get_conversion_factor(from_unit, to_unit))
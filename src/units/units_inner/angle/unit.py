@@ -1,6 +1,9 @@
-"""Module for the angle units."""
+"""Module for the angle units.
+
+Generated by `tools/generate_units.py` from `tools/units_spec.json`, so edit the
+spec & rerun the generator rather than editing this module.
+"""
 
-import math
 from typing import TYPE_CHECKING, Final
 
 if TYPE_CHECKING:
@@ -8,10 +11,12 @@ if TYPE_CHECKING:
 else:
     IntEnum = object
 
+_NAN: Final = float("nan")
+
 
-# NB: When adding a new unit, be sure to also update:
-# - The info list in helpers.py
-# - The `test_get_X_value_as_unit` test in `test_X.py` and `test_X_delta.py`
+# NB: When adding a new unit, add it to `tools/units_spec.json` & rerun
+# `tools/generate_units.py`, which also regenerates the tests of the unit
+# tables
 class Unit(IntEnum):
     """A angle unit.
 
@@ -26,73 +31,86 @@ class Unit(IntEnum):
     REVOLUTION = 3
 
 
-class _UnitInfo:
-    """Information associated with a particular angle unit.
+# The name & abbreviation of each unit, indexed by the unit. Element 0 does not
+# correspond to a unit.
+_NAMES: Final = (
+    "",
+    "radian",
+    "degree",
+    "revolution",
+)
+_ABBREVIATIONS: Final = (
+    "",
+    "rad",
+    "deg",
+    "rev",
+)
+
+# The change in angle expressed as each unit per 1rad, indexed by the unit. Element 0
+# does not correspond to a unit, and so holds NaN.
+UNIT_DELTAS_PER_RADIAN: Final = (
+    _NAN,
+    1,
+    57.29577951308232,
+    0.15915494309189535,
+)
+
+# Dense from-unit x to-unit table of conversion factors. Units are small contiguous
+# ints, so the factor that converts a value from one unit to another is at index
+# `from_unit * CONVERSION_FACTORS_STRIDE + to_unit`. Row & column 0 do not correspond to
+# a unit, and so hold NaN. A tuple is used rather than an array, as reading an element
+# of a tuple returns the stored float instead of allocating a new one.
+CONVERSION_FACTORS_STRIDE: Final = 4
+CONVERSION_FACTORS: Final = (
+    # Row 0 does not correspond to a unit
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    # From radian to each unit
+    _NAN,
+    1.0,
+    57.29577951308232,
+    0.15915494309189535,
+    # From degree to each unit
+    _NAN,
+    0.017453292519943295,
+    1.0,
+    0.002777777777777778,
+    # From revolution to each unit
+    _NAN,
+    6.283185307179586,
+    360.0,
+    1.0,
+)
+
+# Tables of a full turn & half a turn, expressed as each unit & indexed by the unit, so
+# that angles can be wrapped into range without looking up the info of the unit. Element
+# 0 does not correspond to a unit, and so holds NaN.
+FULL_TURNS: Final = (
+    _NAN,
+    6.283185307179586,
+    360.0,
+    1.0,
+)
+HALF_TURNS: Final = (
+    _NAN,
+    3.141592653589793,
+    180.0,
+    0.5,
+)
+
+
+def _check_unit(unit: Unit) -> None:
+    """Check that the unit is a angle unit.
 
     Not intended for public use.
-    """
 
-    def __init__(
-        self,
-        unit: Unit,
-        name: str,
-        abbreviation: str,
-        unit_delta_per_radian: float,
-    ) -> None:
-        """Initialise a collection of info associated with a unit."""
-        self._unit = unit
-        self._name = name
-        self._abbreviation = abbreviation
-        self._unit_delta_per_radian = unit_delta_per_radian
-
-    @property
-    def unit(self) -> Unit:
-        """The unit the information relates to."""
-        return self._unit
-
-    @property
-    def name(self) -> str:
-        """The name of the unit."""
-        return self._name
-
-    @property
-    def abbreviation(self) -> str:
-        """The abbreviation of the unit."""
-        return self._abbreviation
-
-    @property
-    def unit_delta_per_radian(self) -> float:
-        """The change in angle expressed as the unit per 1rad.
-
-        Equivalent to the gradient of the radian-vs-unit graph.
-        """
-        return self._unit_delta_per_radian
-
-
-# All info is entered here to create a SSoT
-_UNITS_INFO: Final = [
-    _UnitInfo(
-        unit=Unit.RADIAN,
-        name="radian",
-        abbreviation="rad",
-        unit_delta_per_radian=1,
-    ),
-    _UnitInfo(
-        unit=Unit.DEGREE,
-        name="degree",
-        abbreviation="deg",
-        unit_delta_per_radian=180 / math.pi,
-    ),
-    _UnitInfo(
-        unit=Unit.REVOLUTION,
-        name="revolution",
-        abbreviation="rev",
-        unit_delta_per_radian=1 / (2 * math.pi),
-    ),
-]
-
-# Convert into dictionary for quick lookup
-_UNIT_TO_INFO_MAP: Final = {info.unit: info for info in _UNITS_INFO}
+    Raises:
+        ValueError: The unit is not a angle unit.
+    """
+    if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+        raise ValueError
 
 
 def get_name(unit: Unit) -> str:
@@ -100,10 +118,8 @@ def get_name(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].name
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _NAMES[unit]
 
 
 def get_abbreviation(unit: Unit) -> str:
@@ -111,20 +127,14 @@ def get_abbreviation(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].abbreviation
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _ABBREVIATIONS[unit]
 
 
-def get_unit_delta_per_radian(
-    unit: Unit,
-) -> float:
+def get_unit_delta_per_radian(unit: Unit) -> float:
     """Get the change in angle expressed as the unit per 1rad.
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].unit_delta_per_radian
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return UNIT_DELTAS_PER_RADIAN[unit]
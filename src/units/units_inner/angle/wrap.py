@@ -0,0 +1,138 @@
+"""Module for wrapping & unwrapping buffers of angle values.
+
+The wrappers work on raw values in a single unit (such as a buffer of encoder
+readings), and write the results into a caller-supplied buffer, so that a full
+buffer of samples can be processed without creating any intermediate objects.
+"""
+
+from typing import TYPE_CHECKING
+
+from .unit import CONVERSION_FACTORS_STRIDE, FULL_TURNS, HALF_TURNS, Unit
+
+if TYPE_CHECKING:
+    from collections.abc import MutableSequence, Sequence
+
+
+def count_turns(jump: float, full_turn: float) -> int:
+    """Return the whole number of turns nearest to the jump between two values.
+
+    Not intended for public use.
+
+    Raises:
+        ValueError: The jump is not finite.
+    """
+    turns = jump / full_turn
+    # A value minus itself is only zero if the value is finite
+    if turns - turns:
+        msg = f"Angle jump not finite [{jump}]."
+        raise ValueError(msg)
+
+    return round(turns)
+
+
+def unwrap_values_into(  # noqa: PLR0913, PLR0917 # pylint: disable=too-many-arguments, too-many-positional-arguments
+    src: "Sequence[float]",
+    dst: "MutableSequence[float] | memoryview[float]",
+    full_turn: float,
+    half_turn: float,
+    previous: float,
+    offset: float,
+) -> float:
+    """Unwrap the source values, continuing on from the previous value & offset.
+
+    The offset is the whole number of turns added to the previous value, and the
+    offset after the last value is returned, so that a run of values can be
+    unwrapped across several buffers. The destination must be at least as long as
+    the source. Jumps of any size are unwrapped in a single step.
+
+    Not intended for public use.
+
+    Raises:
+        ValueError: A value is not finite. The values before it have already been
+            written to the destination.
+    """
+    for index, value in enumerate(src):
+        jump = value - previous
+        if not -half_turn <= jump <= half_turn:
+            offset -= count_turns(jump, full_turn) * full_turn
+        previous = value
+        dst[index] = value + offset
+
+    return offset
+
+
+def _validate(
+    src: "Sequence[float]",
+    dst: "MutableSequence[float] | memoryview[float]",
+    unit: Unit,
+) -> int:
+    """Validate the arguments of a wrapper, and return the length of the source.
+
+    Not intended for public use.
+
+    Raises:
+        ValueError: The unit is not an angle unit, or the destination is shorter
+            than the source.
+    """
+    if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+        raise ValueError
+
+    length = len(src)
+    if len(dst) < length:
+        msg = f"Destination shorter than source [{len(dst)}, {length}]."
+        raise ValueError(msg)
+
+    return length
+
+
+def wrap_into(
+    src: "Sequence[float]",
+    dst: "MutableSequence[float] | memoryview[float]",
+    unit: Unit,
+) -> None:
+    """Wrap a buffer of angle values into the range [0, 2*pi) radians, writing into dst.
+
+    The values are expressed in the given unit, and are wrapped the same way as the
+    value of an `Angle`. Values that are already in range are copied as-is. The
+    source & destination may be the same buffer, in which case the values are
+    wrapped in place.
+
+    Raises:
+        ValueError: The unit is not an angle unit, or the destination is shorter
+            than the source.
+    """
+    length = _validate(src, dst, unit)
+    full_turn = FULL_TURNS[unit]
+    for index in range(length):
+        value = src[index]
+        if not 0 <= value < full_turn:
+            value %= full_turn
+            # The modulo of a tiny negative value can round up to a full turn
+            if value >= full_turn:
+                value = 0.0
+        dst[index] = value
+
+
+def unwrap_into(
+    src: "Sequence[float]",
+    dst: "MutableSequence[float] | memoryview[float]",
+    unit: Unit,
+) -> None:
+    """Unwrap a buffer of wrapped angle values into a continuous run, writing into dst.
+
+    The values are expressed in the given unit. Whenever consecutive values jump by
+    more than half a turn, whole turns are added to that value & every value after
+    it, so that the jump is less than half a turn. This turns a run of readings from
+    an encoder that wraps around (for example from 359 to 0 degrees) into the total
+    angle turned through. The first value is copied as-is. The source & destination
+    may be the same buffer, in which case the values are unwrapped in place.
+
+    Raises:
+        ValueError: The unit is not an angle unit, the destination is shorter than
+            the source, or a value is not finite.
+    """
+    length = _validate(src, dst, unit)
+    if not length:
+        return
+
+    unwrap_values_into(src, dst, FULL_TURNS[unit], HALF_TURNS[unit], src[0], 0.0)
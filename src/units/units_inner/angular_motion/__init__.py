@@ -1,8 +1,20 @@
 """Package for angular-motion-related classes and constants."""
 
 from .acceleration import Acceleration
+from .converter import convert_into, make_converter
 from .displacement import Displacement
 from .jerk import Jerk
+from .unwrapper import Unwrapper
 from .velocity import Velocity
+from .velocity_estimator import VelocityEstimator
 
-__all__ = ["Acceleration", "Displacement", "Jerk", "Velocity"]
+__all__ = [
+    "Acceleration",
+    "Displacement",
+    "Jerk",
+    "Unwrapper",
+    "Velocity",
+    "VelocityEstimator",
+    "convert_into",
+    "make_converter",
+]
@@ -0,0 +1,180 @@
+"""Module for the angular-motion unit converters."""
+
+# ruff: noqa: TID252
+
+from typing import TYPE_CHECKING, Final, overload
+
+from ..angle import Unit as AngleUnit
+from ..angle import (
+    get_unit_delta_per_radian as get_angle_unit_delta_per_radian,
+)
+from ..buffer import convert_values_into
+from ..factor_cache import FactorCache
+from ..time import Unit as TimeUnit
+from ..time import get_unit_delta_per_second as get_time_unit_delta_per_second
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, MutableSequence, Sequence
+
+
+def _get_unit_delta_per_si_unit(
+    units: "tuple[AngleUnit, *tuple[TimeUnit, ...]]",
+) -> float:
+    """Get the change in value expressed as the units per 1 of the SI units.
+
+    Not intended for public use.
+    """
+    distance_unit, *time_units = units
+    unit_delta_per_si_unit = get_angle_unit_delta_per_radian(distance_unit)
+    for time_unit in time_units:
+        unit_delta_per_si_unit /= get_time_unit_delta_per_second(time_unit)
+    return unit_delta_per_si_unit
+
+
+# The change in value expressed as the units per 1 of the SI units, for each of the
+# combinations of units in use. Not intended for public use.
+UNIT_DELTAS_PER_SI_UNIT: Final = FactorCache(_get_unit_delta_per_si_unit)
+
+
+def _get_conversion_factor(
+    from_unit: "AngleUnit | tuple[AngleUnit, *tuple[TimeUnit, ...]]",
+    to_unit: "AngleUnit | tuple[AngleUnit, *tuple[TimeUnit, ...]]",
+) -> float:
+    """Get the factor that converts a angular-motion value from one unit to another.
+
+    Not intended for public use.
+
+    Raises:
+        ValueError: Either of the units are not valid angular-motion units, or they
+            are the units of different quantities.
+    """
+    from_units = from_unit if isinstance(from_unit, tuple) else (from_unit,)
+    to_units = to_unit if isinstance(to_unit, tuple) else (to_unit,)
+    if len(from_units) != len(to_units) or not 1 <= len(from_units) <= 4:  # noqa: PLR2004
+        raise ValueError
+
+    return _get_unit_delta_per_si_unit(to_units) / _get_unit_delta_per_si_unit(
+        from_units
+    )
+
+
+@overload
+def make_converter(
+    from_unit: AngleUnit, to_unit: AngleUnit
+) -> "Callable[[float], float]": ...
+
+
+@overload
+def make_converter(
+    from_unit: "tuple[AngleUnit, TimeUnit]",
+    to_unit: "tuple[AngleUnit, TimeUnit]",
+) -> "Callable[[float], float]": ...
+
+
+@overload
+def make_converter(
+    from_unit: "tuple[AngleUnit, TimeUnit, TimeUnit]",
+    to_unit: "tuple[AngleUnit, TimeUnit, TimeUnit]",
+) -> "Callable[[float], float]": ...
+
+
+@overload
+def make_converter(
+    from_unit: "tuple[AngleUnit, TimeUnit, TimeUnit, TimeUnit]",
+    to_unit: "tuple[AngleUnit, TimeUnit, TimeUnit, TimeUnit]",
+) -> "Callable[[float], float]": ...
+
+
+def make_converter(
+    from_unit: "AngleUnit | tuple[AngleUnit, *tuple[TimeUnit, ...]]",
+    to_unit: "AngleUnit | tuple[AngleUnit, *tuple[TimeUnit, ...]]",
+) -> "Callable[[float], float]":
+    """Make a function that converts an angular-motion value from one unit to another.
+
+    The units of a displacement are given as an angle unit. The units of a velocity,
+    acceleration or jerk are given as a tuple of an angle unit followed by one, two
+    or three time units, in the same order as their initialisers take them.
+
+    +--------------+-------------------------------------------------------------+
+    | Quantity     | EXAMPLE                                                     |
+    +==============+=============================================================+
+    | Displacement | make_converter(AngleUnit.DEGREE, AngleUnit.RADIAN)          |
+    +--------------+-------------------------------------------------------------+
+    | Velocity     | make_converter(                                             |
+    |              |     (AngleUnit.RADIAN, TimeUnit.SECOND),                    |
+    |              |     (AngleUnit.REVOLUTION, TimeUnit.MINUTE),                |
+    |              | )                                                           |
+    +--------------+-------------------------------------------------------------+
+
+    The conversion factor is calculated once, up front, so converting a value is a
+    single multiplication & no intermediate objects are created.
+
+    Raises:
+        ValueError: Either of the units are not valid angular-motion units, or they
+            are the units of different quantities.
+    """
+    factor = _get_conversion_factor(from_unit, to_unit)
+
+    def convert(value: float) -> float:
+        return value * factor
+
+    return convert
+
+
+@overload
+def convert_into(
+    src: "Sequence[float]",
+    dst: "MutableSequence[float] | memoryview[float]",
+    from_unit: AngleUnit,
+    to_unit: AngleUnit,
+) -> None: ...
+
+
+@overload
+def convert_into(
+    src: "Sequence[float]",
+    dst: "MutableSequence[float] | memoryview[float]",
+    from_unit: "tuple[AngleUnit, TimeUnit]",
+    to_unit: "tuple[AngleUnit, TimeUnit]",
+) -> None: ...
+
+
+@overload
+def convert_into(
+    src: "Sequence[float]",
+    dst: "MutableSequence[float] | memoryview[float]",
+    from_unit: "tuple[AngleUnit, TimeUnit, TimeUnit]",
+    to_unit: "tuple[AngleUnit, TimeUnit, TimeUnit]",
+) -> None: ...
+
+
+@overload
+def convert_into(
+    src: "Sequence[float]",
+    dst: "MutableSequence[float] | memoryview[float]",
+    from_unit: "tuple[AngleUnit, TimeUnit, TimeUnit, TimeUnit]",
+    to_unit: "tuple[AngleUnit, TimeUnit, TimeUnit, TimeUnit]",
+) -> None: ...
+
+
+def convert_into(
+    src: "Sequence[float]",
+    dst: "MutableSequence[float] | memoryview[float]",
+    from_unit: "AngleUnit | tuple[AngleUnit, *tuple[TimeUnit, ...]]",
+    to_unit: "AngleUnit | tuple[AngleUnit, *tuple[TimeUnit, ...]]",
+) -> None:
+    """Convert a buffer of angular-motion values from one unit to another, into dst.
+
+    The units are given in the same way as for :py:func:`make_converter`.
+
+    The values are written to the start of the destination buffer, which can be any
+    buffer of floats (such as an `array('f')`, or a memoryview cast onto a
+    bytearray). The source & destination may be the same buffer, in which case the
+    values are converted in place. No intermediate objects are created.
+
+    Raises:
+        ValueError: Either of the units are not valid angular-motion units, they are the
+            units of different quantities, or the destination is shorter than the
+            source.
+    """
+    convert_values_into(src, dst, _get_conversion_factor(from_unit, to_unit))
@@ -1,36 +1,75 @@
 """Module for the angular displacement class."""
 
+# pyright: reportPrivateUsage=false
 # ruff: noqa: TID252
 
-from typing import overload
+from typing import TYPE_CHECKING, overload
 
-from ..angle import Unit as AngleUnit
 from ..angle import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
     get_unit_abbreviation,
     get_unit_delta_per_radian,
     get_unit_name,
 )
+from ..angle import Unit as AngleUnit
+from ..time import TimeDelta
+
+# Imported as modules, as the classes of neighbouring orders import each other
+from . import velocity
+
+if TYPE_CHECKING:
+    from .velocity import Velocity
 
 
 class Displacement:
     """The difference between the final & initial position of an angular trajectory."""
 
+    __slots__ = ("_unit", "_value", "_value_as_radian")
+
     def __init__(self, value: float, unit: AngleUnit) -> None:
         """Initialise a new angular displacement."""
         self._value = value
         self._unit = unit
+        internal_unit_delta_per_radian = get_unit_delta_per_radian(self._unit)
+        self._value_as_radian = self._value / internal_unit_delta_per_radian
+
+    @classmethod
+    def _create(
+        cls, value: float, unit: AngleUnit, value_as_radian: float
+    ) -> "Displacement":
+        """Create an angular displacement from its value in both the unit & radians.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        displacement: Displacement = cls.__new__(cls)
+        displacement._value = value
+        displacement._unit = unit
+        displacement._value_as_radian = value_as_radian
+        return displacement
 
     def as_unit(self, unit: AngleUnit) -> float:
-        """Return the angular displacement, expressed as the unit."""
-        internal_unit_delta_per_radian = get_unit_delta_per_radian(self._unit)
-        value_as_radian = self._value / internal_unit_delta_per_radian
-        external_unit_delta_per_radian = get_unit_delta_per_radian(unit)
-        return external_unit_delta_per_radian * value_as_radian
+        """Return the angular displacement, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not an angle unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __mul__(self, value: float) -> "Displacement":
         """Return a angular displacement scaled by the value."""
         scaled_value = self._value * value
-        return Displacement(scaled_value, self._unit)
+        return Displacement._create(
+            scaled_value, self._unit, self._value_as_radian * value
+        )
 
     def __rmul__(self, value: float) -> "Displacement":
         """Return a angular displacement scaled by the value."""
@@ -42,8 +81,13 @@ class Displacement:
     @overload
     def __truediv__(self, other: "Displacement") -> float: ...
 
-    def __truediv__(self, other: "float | Displacement") -> "Displacement | float":
-        """Return a scaled angular displacement or the ratio between the displacements.
+    @overload
+    def __truediv__(self, other: TimeDelta) -> "Velocity": ...
+
+    def __truediv__(
+        self, other: "float | Displacement | TimeDelta"
+    ) -> "Displacement | float | Velocity":
+        """Return a scaled angular displacement, a ratio or an angular velocity.
 
         The behaviour depends upon the type of the argument.
 
@@ -51,21 +95,39 @@ class Displacement:
           inverse of the value
         - If the argument is a angular displacement, return the ratio between the two
           angular displacements
+        - If the argument is a :py:class:`TimeDelta`, return the average angular
+          velocity over the time difference
         """
         if isinstance(other, Displacement):
-            value_as_radian = self.as_unit(AngleUnit.RADIAN)
-            other_value_as_radian = other.as_unit(AngleUnit.RADIAN)
-            return value_as_radian / other_value_as_radian
+            return self._value_as_radian / other._value_as_radian
+
+        if isinstance(other, TimeDelta):
+            return velocity.Velocity._create(
+                self._value / other._value,
+                self._unit,
+                other._unit,
+                self._value_as_radian / other._value_as_second,
+            )
 
         scaled_value = self._value / other
-        return Displacement(scaled_value, self._unit)
+        return Displacement._create(
+            scaled_value, self._unit, self._value_as_radian / other
+        )
 
     def __add__(self, other: "Displacement") -> "Displacement":
         """Return the sum of the angular displacements."""
-        value_as_radian = self.as_unit(AngleUnit.RADIAN)
-        delta_value_as_radian = other.as_unit(AngleUnit.RADIAN)
-        added_value_as_radian = value_as_radian + delta_value_as_radian
-        return Displacement(added_value_as_radian, AngleUnit.RADIAN)
+        if self._unit == other._unit:
+            value_sum = self._value + other._value
+            return Displacement._create(
+                value_sum,
+                self._unit,
+                value_sum / get_unit_delta_per_radian(self._unit),
+            )
+
+        added_value_as_radian = self._value_as_radian + other._value_as_radian
+        return Displacement._create(
+            added_value_as_radian, AngleUnit.RADIAN, added_value_as_radian
+        )
 
     def __sub__(self, delta: "Displacement") -> "Displacement":
         """Return the difference between the angular displacements."""
@@ -74,57 +136,53 @@ class Displacement:
     def __neg__(self) -> "Displacement":
         """Return the inverse of the angular displacement."""
         inverted_value = -self._value
-        return Displacement(inverted_value, self._unit)
+        return Displacement._create(inverted_value, self._unit, -self._value_as_radian)
 
     def __abs__(self) -> "Displacement":
         """Return the absolute version of the angular displacement."""
         absolute_value = abs(self._value)
-        return Displacement(absolute_value, self._unit)
+        return Displacement._create(
+            absolute_value, self._unit, abs(self._value_as_radian)
+        )
 
     def __floordiv__(self, other: "Displacement") -> float:
         """Return the floored ratio between the angular displacements."""
-        value_as_radian = self.as_unit(AngleUnit.RADIAN)
-        other_value_as_radian = other.as_unit(AngleUnit.RADIAN)
-        return value_as_radian // other_value_as_radian
+        return self._value_as_radian // other._value_as_radian
 
     def __mod__(self, other: "Displacement") -> float:
         """Return the remainder of the ratio between the angular displacements."""
-        value_as_radian = self.as_unit(AngleUnit.RADIAN)
-        other_value_as_radian = other.as_unit(AngleUnit.RADIAN)
-        return value_as_radian % other_value_as_radian
+        return self._value_as_radian % other._value_as_radian
 
     def __divmod__(self, other: "Displacement") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio btwn the displacements."""
-        value_as_radian = self.as_unit(AngleUnit.RADIAN)
-        other_value_as_radian = other.as_unit(AngleUnit.RADIAN)
-        return divmod(value_as_radian, other_value_as_radian)
+        return divmod(self._value_as_radian, other._value_as_radian)
 
     def __eq__(self, other: object) -> bool:
         """Return whether the objects are equal angular displacements."""
         if not isinstance(other, Displacement):
             return NotImplemented
 
-        return self.as_unit(AngleUnit.RADIAN) == other.as_unit(AngleUnit.RADIAN)
+        return self._value_as_radian == other._value_as_radian
 
     def __lt__(self, other: "Displacement") -> bool:
         """Return whether the angular displacement is less than the other."""
-        return self.as_unit(AngleUnit.RADIAN) < other.as_unit(AngleUnit.RADIAN)
+        return self._value_as_radian < other._value_as_radian
 
     def __le__(self, other: "Displacement") -> bool:
         """Return whether the angular displacement is less than or equal to other."""
-        return self.as_unit(AngleUnit.RADIAN) <= other.as_unit(AngleUnit.RADIAN)
+        return self._value_as_radian <= other._value_as_radian
 
     def __gt__(self, other: "Displacement") -> bool:
         """Return whether the angular displacement is greater than the other."""
-        return self.as_unit(AngleUnit.RADIAN) > other.as_unit(AngleUnit.RADIAN)
+        return self._value_as_radian > other._value_as_radian
 
     def __ge__(self, other: "Displacement") -> bool:
         """Return whether the angular displacement is greater than or equal to other."""
-        return self.as_unit(AngleUnit.RADIAN) >= other.as_unit(AngleUnit.RADIAN)
+        return self._value_as_radian >= other._value_as_radian
 
     def __hash__(self) -> int:
         """Return the hash of the angular displacement."""
-        return hash(self.as_unit(AngleUnit.RADIAN))
+        return hash(self._value_as_radian)
 
     def __str__(self) -> str:
         """Return a string representation of the angular displacement."""
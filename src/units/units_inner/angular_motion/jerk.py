@@ -1,26 +1,38 @@
 """Module for the angular jerk class."""
 
+# pyright: reportPrivateUsage=false
 # ruff: noqa: TID252
 
-from typing import overload
+from typing import TYPE_CHECKING, overload
 
 from ..angle import Unit as AngleUnit
 from ..angle import get_unit_abbreviation as get_angle_unit_abbreviation
-from ..angle import (
-    get_unit_delta_per_radian as get_angle_unit_delta_per_radian,
-)
 from ..angle import get_unit_name as get_angle_unit_name
+from ..time import TimeDelta
 from ..time import Unit as TimeUnit
 from ..time import get_unit_abbreviation as get_time_unit_abbreviation
-from ..time import (
-    get_unit_delta_per_second as get_time_unit_delta_per_second,
-)
 from ..time import get_unit_name as get_time_unit_name
 
+# Imported as modules, as the classes of neighbouring orders import each other
+from . import acceleration
+from .converter import UNIT_DELTAS_PER_SI_UNIT
+
+if TYPE_CHECKING:
+    from .acceleration import Acceleration
+
 
 class Jerk:
     """The rate of change of the angular jerk of an object with respect to time."""
 
+    __slots__ = (
+        "_angle_unit",
+        "_first_time_unit",
+        "_second_time_unit",
+        "_third_time_unit",
+        "_value",
+        "_value_as_radian_per_second_cubed",
+    )
+
     def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
         self,
         value: float,
@@ -44,8 +56,44 @@ class Jerk:
         self._third_time_unit = (
             third_time_unit if third_time_unit is not None else self._second_time_unit
         )
+        units = (
+            self._angle_unit,
+            self._first_time_unit,
+            self._second_time_unit,
+            self._third_time_unit,
+        )
+        try:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+        self._value_as_radian_per_second_cubed = value / unit_delta_per_si_unit
 
-    def as_unit(  # pylint: disable=too-many-locals
+    @classmethod
+    def _create(  # noqa: PLR0913, PLR0917 # pylint: disable=too-many-arguments, too-many-positional-arguments
+        cls,
+        value: float,
+        angle_unit: AngleUnit,
+        first_time_unit: TimeUnit,
+        second_time_unit: TimeUnit,
+        third_time_unit: TimeUnit,
+        value_as_radian_per_second_cubed: float,
+    ) -> "Jerk":
+        """Create an angular jerk from its value in both the units & SI units.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        jerk: Jerk = cls.__new__(cls)
+        jerk._value = value
+        jerk._angle_unit = angle_unit
+        jerk._first_time_unit = first_time_unit
+        jerk._second_time_unit = second_time_unit
+        jerk._third_time_unit = third_time_unit
+        jerk._value_as_radian_per_second_cubed = value_as_radian_per_second_cubed
+        return jerk
+
+    def as_unit(
         self,
         angle_unit: AngleUnit,
         first_time_unit: TimeUnit,
@@ -58,70 +106,76 @@ class Jerk:
         If the third time unit is not provided, the second time unit will be reused
         (or the first, if the second is also not provided).
         """
-        internal_angle_unit_delta_per_radian = get_angle_unit_delta_per_radian(
-            self._angle_unit
-        )
-        internal_first_time_unit_delta_per_second = get_time_unit_delta_per_second(
-            self._first_time_unit
-        )
-        internal_second_time_unit_delta_per_second = get_time_unit_delta_per_second(
-            self._second_time_unit
-        )
-        internal_third_time_unit_delta_per_second = get_time_unit_delta_per_second(
-            self._third_time_unit
-        )
-        internal_unit_to_radian_per_second_cubed_factor = (
-            internal_third_time_unit_delta_per_second
-            * internal_second_time_unit_delta_per_second
-            * internal_first_time_unit_delta_per_second
-            / internal_angle_unit_delta_per_radian
-        )
-        value_as_radian_per_second_cubed = (
-            internal_unit_to_radian_per_second_cubed_factor * self._value
-        )
-        external_angle_unit_delta_per_radian = get_angle_unit_delta_per_radian(
-            angle_unit
-        )
-        external_first_time_unit_delta_per_second = get_time_unit_delta_per_second(
-            first_time_unit
-        )
-        external_second_time_unit_delta_per_second = (
-            get_time_unit_delta_per_second(second_time_unit)
-            if second_time_unit is not None
-            else external_first_time_unit_delta_per_second
-        )
-        external_third_time_unit_delta_per_second = (
-            get_time_unit_delta_per_second(third_time_unit)
-            if third_time_unit is not None
-            else external_second_time_unit_delta_per_second
-        )
-        radian_per_second_cubed_to_external_unit_factor = (
-            external_angle_unit_delta_per_radian
-            / (
-                external_first_time_unit_delta_per_second
-                * external_second_time_unit_delta_per_second
-                * external_third_time_unit_delta_per_second
+        if second_time_unit is None:
+            second_time_unit = first_time_unit
+        if third_time_unit is None:
+            third_time_unit = second_time_unit
+        units = (angle_unit, first_time_unit, second_time_unit, third_time_unit)
+        try:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+        return self._value_as_radian_per_second_cubed * unit_delta_per_si_unit
+
+    @overload
+    def __mul__(self, other: float) -> "Jerk": ...
+
+    @overload
+    def __mul__(self, other: TimeDelta) -> "Acceleration": ...
+
+    def __mul__(self, other: "float | TimeDelta") -> "Jerk | Acceleration":
+        """Return a scaled angular jerk or an angular acceleration.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a :py:class:`float`, return an angular jerk scaled by the
+          value
+        - If the argument is a :py:class:`TimeDelta`, return the angular acceleration
+          gained at the angular jerk over the time difference
+        """
+        if isinstance(other, TimeDelta):
+            value_as_radian_per_second_per_second = (
+                self._value_as_radian_per_second_cubed * other._value_as_second
+            )
+            if self._third_time_unit == other._unit:
+                return acceleration.Acceleration._create(
+                    self._value * other._value,
+                    self._angle_unit,
+                    self._first_time_unit,
+                    self._second_time_unit,
+                    value_as_radian_per_second_per_second,
+                )
+
+            return acceleration.Acceleration._create(
+                value_as_radian_per_second_per_second,
+                AngleUnit.RADIAN,
+                TimeUnit.SECOND,
+                TimeUnit.SECOND,
+                value_as_radian_per_second_per_second,
             )
-        )
-        return (
-            radian_per_second_cubed_to_external_unit_factor
-            * value_as_radian_per_second_cubed
-        )
 
-    def __mul__(self, value: float) -> "Jerk":
-        """Return an angular jerk scaled by the value."""
-        scaled_value = self._value * value
-        return Jerk(
+        scaled_value = self._value * other
+        return Jerk._create(
             scaled_value,
             self._angle_unit,
             self._first_time_unit,
             self._second_time_unit,
             self._third_time_unit,
+            self._value_as_radian_per_second_cubed * other,
         )
 
-    def __rmul__(self, value: float) -> "Jerk":
-        """Return an angular jerk scaled by the value."""
-        return self * value
+    @overload
+    def __rmul__(self, other: float) -> "Jerk": ...
+
+    @overload
+    def __rmul__(self, other: TimeDelta) -> "Acceleration": ...
+
+    def __rmul__(self, other: "float | TimeDelta") -> "Jerk | Acceleration":
+        """Return a scaled angular jerk or an angular acceleration.
+
+        The product is the same as with the operands the other way around.
+        """
+        return self * other
 
     @overload
     def __truediv__(self, other: float) -> "Jerk": ...
@@ -140,51 +194,93 @@ class Jerk:
           angular jerks
         """
         if isinstance(other, Jerk):
-            value_as_radian_per_second_cubed = self.as_unit(
-                AngleUnit.RADIAN, TimeUnit.SECOND
-            )
-            other_value_as_radian_per_second_cubed = other.as_unit(
-                AngleUnit.RADIAN, TimeUnit.SECOND
-            )
             return (
-                value_as_radian_per_second_cubed
-                / other_value_as_radian_per_second_cubed
+                self._value_as_radian_per_second_cubed
+                / other._value_as_radian_per_second_cubed
             )
 
         return (1 / other) * self
 
     def __add__(self, other: "Jerk") -> "Jerk":
         """Return the sum of two angular jerks."""
-        value_as_radian_per_second_cubed = self.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
-        other_value_as_radian_per_second_cubed = other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
+        if (
+            self._angle_unit == other._angle_unit
+            and self._first_time_unit == other._first_time_unit
+            and self._second_time_unit == other._second_time_unit
+            and self._third_time_unit == other._third_time_unit
+        ):
+            value_sum = self._value + other._value
+            units = (
+                self._angle_unit,
+                self._first_time_unit,
+                self._second_time_unit,
+                self._third_time_unit,
+            )
+            try:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+            except KeyError:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+            return Jerk._create(
+                value_sum,
+                self._angle_unit,
+                self._first_time_unit,
+                self._second_time_unit,
+                self._third_time_unit,
+                value_sum / unit_delta_per_si_unit,
+            )
+
         value_sum_as_radian_per_second_cubed = (
-            value_as_radian_per_second_cubed + other_value_as_radian_per_second_cubed
+            self._value_as_radian_per_second_cubed
+            + other._value_as_radian_per_second_cubed
         )
-        return Jerk(
+        return Jerk._create(
             value_sum_as_radian_per_second_cubed,
             AngleUnit.RADIAN,
             TimeUnit.SECOND,
+            TimeUnit.SECOND,
+            TimeUnit.SECOND,
+            value_sum_as_radian_per_second_cubed,
         )
 
     def __sub__(self, other: "Jerk") -> "Jerk":
         """Return the difference of two angular jerks."""
-        value_as_radian_per_second_cubed = self.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
-        other_value_as_radian_per_second_cubed = other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
+        if (
+            self._angle_unit == other._angle_unit
+            and self._first_time_unit == other._first_time_unit
+            and self._second_time_unit == other._second_time_unit
+            and self._third_time_unit == other._third_time_unit
+        ):
+            value_difference = self._value - other._value
+            units = (
+                self._angle_unit,
+                self._first_time_unit,
+                self._second_time_unit,
+                self._third_time_unit,
+            )
+            try:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+            except KeyError:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+            return Jerk._create(
+                value_difference,
+                self._angle_unit,
+                self._first_time_unit,
+                self._second_time_unit,
+                self._third_time_unit,
+                value_difference / unit_delta_per_si_unit,
+            )
+
         value_difference_as_radian_per_second_cubed = (
-            value_as_radian_per_second_cubed - other_value_as_radian_per_second_cubed
+            self._value_as_radian_per_second_cubed
+            - other._value_as_radian_per_second_cubed
         )
-        return Jerk(
+        return Jerk._create(
             value_difference_as_radian_per_second_cubed,
             AngleUnit.RADIAN,
             TimeUnit.SECOND,
+            TimeUnit.SECOND,
+            TimeUnit.SECOND,
+            value_difference_as_radian_per_second_cubed,
         )
 
     def __neg__(self) -> "Jerk":
@@ -194,46 +290,34 @@ class Jerk:
     def __abs__(self) -> "Jerk":
         """Return the absolute version of the angular jerk."""
         absolute_value = abs(self._value)
-        return Jerk(
+        return Jerk._create(
             absolute_value,
             self._angle_unit,
             self._first_time_unit,
             self._second_time_unit,
+            self._second_time_unit,
+            abs(self._value_as_radian_per_second_cubed),
         )
 
     def __floordiv__(self, other: "Jerk") -> float:
         """Return the floored ratio between the angular jerks."""
-        value_as_radian_per_second_cubed = self.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
-        other_value_as_radian_per_second_cubed = other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
         return (
-            value_as_radian_per_second_cubed // other_value_as_radian_per_second_cubed
+            self._value_as_radian_per_second_cubed
+            // other._value_as_radian_per_second_cubed
         )
 
     def __mod__(self, other: "Jerk") -> float:
         """Return the remainder of the ratio between the angular jerk."""
-        value_as_radian_per_second_cubed = self.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
-        other_value_as_radian_per_second_cubed = other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
+        return (
+            self._value_as_radian_per_second_cubed
+            % other._value_as_radian_per_second_cubed
         )
-        return value_as_radian_per_second_cubed % other_value_as_radian_per_second_cubed
 
     def __divmod__(self, other: "Jerk") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the angular jerks."""
-        value_as_radian_per_second_cubed = self.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
-        other_value_as_radian_per_second_cubed = other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
         return divmod(
-            value_as_radian_per_second_cubed,
-            other_value_as_radian_per_second_cubed,
+            self._value_as_radian_per_second_cubed,
+            other._value_as_radian_per_second_cubed,
         )
 
     def __eq__(self, other: object) -> bool:
@@ -241,37 +325,42 @@ class Jerk:
         if not isinstance(other, Jerk):
             return NotImplemented
 
-        return self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND) == other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
+        return (
+            self._value_as_radian_per_second_cubed
+            == other._value_as_radian_per_second_cubed
         )
 
     def __lt__(self, other: "Jerk") -> bool:
         """Return whether the angular jerk is less than the other."""
-        return self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND) < other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
+        return (
+            self._value_as_radian_per_second_cubed
+            < other._value_as_radian_per_second_cubed
         )
 
     def __le__(self, other: "Jerk") -> bool:
         """Return whether the angular jerk is less than or equal to the other."""
-        return self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND) <= other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
+        return (
+            self._value_as_radian_per_second_cubed
+            <= other._value_as_radian_per_second_cubed
         )
 
     def __gt__(self, other: "Jerk") -> bool:
         """Return whether the angular jerk is greater than the other."""
-        return self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND) > other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
+        return (
+            self._value_as_radian_per_second_cubed
+            > other._value_as_radian_per_second_cubed
         )
 
     def __ge__(self, other: "Jerk") -> bool:
         """Return whether the angular jerk is greater than or equal to the other."""
-        return self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND) >= other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
+        return (
+            self._value_as_radian_per_second_cubed
+            >= other._value_as_radian_per_second_cubed
         )
 
     def __hash__(self) -> int:
         """Return the hash of the angular jerk."""
-        return hash(self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND))
+        return hash(self._value_as_radian_per_second_cubed)
 
     def __str__(self) -> str:
         """Return a string representation of the angular jerk."""
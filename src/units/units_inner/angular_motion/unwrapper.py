@@ -0,0 +1,112 @@
+"""Module for the angular displacement unwrapper."""
+
+# ruff: noqa: TID252
+
+from typing import TYPE_CHECKING
+
+from ..angle import (
+    CONVERSION_FACTORS_STRIDE,
+    FULL_TURNS,
+    HALF_TURNS,
+    Angle,
+)
+from ..angle import Unit as AngleUnit
+from ..angle.wrap import count_turns, unwrap_values_into
+from .displacement import Displacement
+
+if TYPE_CHECKING:
+    from collections.abc import MutableSequence, Sequence
+
+
+class Unwrapper:
+    """Turns a stream of wrapped angles into a continuous angular displacement.
+
+    An angle always wraps into a single turn, and so loses count of the number of
+    turns made. The unwrapper keeps that count, by assuming that each angle is less
+    than half a turn away from the one before it. The displacement is measured from
+    the zero angle, so the displacement of the first angle equals the angle.
+
+    Only the previous angle & the number of turns are kept, so the state does not
+    grow with the length of the stream.
+    """
+
+    __slots__ = ("_full_turn", "_half_turn", "_offset", "_previous", "_unit")
+
+    def __init__(self, unit: AngleUnit) -> None:
+        """Initialise a new unwrapper, for raw values & displacements in the unit.
+
+        Raises:
+            ValueError: The unit is not an angle unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        self._unit = unit
+        self._full_turn = FULL_TURNS[unit]
+        self._half_turn = HALF_TURNS[unit]
+        self._previous: float | None = None
+        self._offset = 0.0
+
+    def reset(self) -> None:
+        """Forget the stream so far, so that the next angle starts a new stream."""
+        self._previous = None
+        self._offset = 0.0
+
+    def update(self, angle: Angle) -> Displacement:
+        """Add the next angle of the stream, and return the displacement so far."""
+        return self.update_raw(angle.as_unit(self._unit))
+
+    def update_raw(self, value: float) -> Displacement:
+        """Add the next raw angle of the stream, and return the displacement so far.
+
+        The value is expressed in the unit of the unwrapper, and does not need to be
+        within a single turn.
+
+        Raises:
+            ValueError: The value is not finite. The stream is left as it was.
+        """
+        previous = self._previous
+        jump = value - (value if previous is None else previous)
+        if not -self._half_turn <= jump <= self._half_turn:
+            self._offset -= count_turns(jump, self._full_turn) * self._full_turn
+        self._previous = value
+
+        return Displacement(value + self._offset, self._unit)
+
+    def unwrap_into(
+        self,
+        src: "Sequence[float]",
+        dst: "MutableSequence[float] | memoryview[float]",
+    ) -> None:
+        """Add a buffer of raw angles to the stream, writing the displacements to dst.
+
+        The values are expressed in the unit of the unwrapper, and the displacements
+        are written to the start of the destination buffer as raw values in the same
+        unit, without creating any intermediate objects. The source & destination may
+        be the same buffer, in which case the values are unwrapped in place. Buffers
+        & single angles can be mixed within a stream.
+
+        Raises:
+            ValueError: The destination is shorter than the source, or a value is not
+                finite. The stream is left as it was, though the displacements before
+                the value have been written to the destination.
+        """
+        length = len(src)
+        if len(dst) < length:
+            msg = f"Destination shorter than source [{len(dst)}, {length}]."
+            raise ValueError(msg)
+
+        if not length:
+            return
+
+        previous = self._previous
+        last_value = src[length - 1]
+        self._offset = unwrap_values_into(
+            src,
+            dst,
+            self._full_turn,
+            self._half_turn,
+            src[0] if previous is None else previous,
+            self._offset,
+        )
+        self._previous = last_value
@@ -1,24 +1,32 @@
 """Module for the angular velocity class."""
 
+# pyright: reportPrivateUsage=false
 # ruff: noqa: TID252
 
-from typing import overload
+from typing import TYPE_CHECKING, overload
 
 from ..angle import Unit as AngleUnit
 from ..angle import get_unit_abbreviation as get_angle_unit_abbreviation
-from ..angle import (
-    get_unit_delta_per_radian as get_angle_unit_delta_per_radian,
-)
 from ..angle import get_unit_name as get_angle_unit_name
+from ..time import TimeDelta
 from ..time import Unit as TimeUnit
 from ..time import get_unit_abbreviation as get_time_unit_abbreviation
-from ..time import get_unit_delta_per_second as get_time_unit_delta_per_second
 from ..time import get_unit_name as get_time_unit_name
 
+# Imported as modules, as the classes of neighbouring orders import each other
+from . import acceleration, displacement
+from .converter import UNIT_DELTAS_PER_SI_UNIT
+
+if TYPE_CHECKING:
+    from .acceleration import Acceleration
+    from .displacement import Displacement
+
 
 class Velocity:
     """The rate of change of the angular displacement of an object wrt time."""
 
+    __slots__ = ("_angle_unit", "_time_unit", "_value", "_value_as_radian_per_second")
+
     def __init__(
         self, value: float, angle_unit: AngleUnit, time_unit: TimeUnit
     ) -> None:
@@ -26,38 +34,90 @@ class Velocity:
         self._value = value
         self._angle_unit = angle_unit
         self._time_unit = time_unit
+        units = (self._angle_unit, self._time_unit)
+        try:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+        self._value_as_radian_per_second = value / unit_delta_per_si_unit
+
+    @classmethod
+    def _create(
+        cls,
+        value: float,
+        angle_unit: AngleUnit,
+        time_unit: TimeUnit,
+        value_as_radian_per_second: float,
+    ) -> "Velocity":
+        """Create an angular velocity from its value in both the units & SI units.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        velocity: Velocity = cls.__new__(cls)
+        velocity._value = value
+        velocity._angle_unit = angle_unit
+        velocity._time_unit = time_unit
+        velocity._value_as_radian_per_second = value_as_radian_per_second
+        return velocity
 
     def as_unit(self, angle_unit: AngleUnit, time_unit: TimeUnit) -> float:
         """Return the angular velocity in the specified units."""
-        internal_angle_unit_delta_per_radian = get_angle_unit_delta_per_radian(
-            self._angle_unit
-        )
-        internal_time_unit_delta_per_second = get_time_unit_delta_per_second(
-            self._time_unit
-        )
-        internal_unit_to_radian_per_second_factor = (
-            internal_time_unit_delta_per_second / internal_angle_unit_delta_per_radian
-        )
-        value_as_radian_per_second = (
-            internal_unit_to_radian_per_second_factor * self._value
-        )
-        external_angle_unit_delta_per_radian = get_angle_unit_delta_per_radian(
-            angle_unit
-        )
-        external_time_unit_delta_per_second = get_time_unit_delta_per_second(time_unit)
-        radian_per_second_to_external_unit_factor = (
-            external_angle_unit_delta_per_radian / external_time_unit_delta_per_second
+        units = (angle_unit, time_unit)
+        try:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+        return self._value_as_radian_per_second * unit_delta_per_si_unit
+
+    @overload
+    def __mul__(self, other: float) -> "Velocity": ...
+
+    @overload
+    def __mul__(self, other: TimeDelta) -> "Displacement": ...
+
+    def __mul__(self, other: "float | TimeDelta") -> "Velocity | Displacement":
+        """Return a scaled angular velocity or an angular displacement.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a :py:class:`float`, return an angular velocity scaled by
+          the value
+        - If the argument is a :py:class:`TimeDelta`, return the angular displacement
+          gained at the angular velocity over the time difference
+        """
+        if isinstance(other, TimeDelta):
+            value_as_radian = self._value_as_radian_per_second * other._value_as_second
+            if self._time_unit == other._unit:
+                return displacement.Displacement._create(
+                    self._value * other._value, self._angle_unit, value_as_radian
+                )
+
+            return displacement.Displacement._create(
+                value_as_radian, AngleUnit.RADIAN, value_as_radian
+            )
+
+        scaled_value = self._value * other
+        return Velocity._create(
+            scaled_value,
+            self._angle_unit,
+            self._time_unit,
+            self._value_as_radian_per_second * other,
         )
-        return radian_per_second_to_external_unit_factor * value_as_radian_per_second
 
-    def __mul__(self, value: float) -> "Velocity":
-        """Return a angular velocity scaled by the value."""
-        scaled_value = self._value * value
-        return Velocity(scaled_value, self._angle_unit, self._time_unit)
+    @overload
+    def __rmul__(self, other: float) -> "Velocity": ...
 
-    def __rmul__(self, value: float) -> "Velocity":
-        """Return a angular velocity scaled by the value."""
-        return self * value
+    @overload
+    def __rmul__(self, other: TimeDelta) -> "Displacement": ...
+
+    def __rmul__(self, other: "float | TimeDelta") -> "Velocity | Displacement":
+        """Return a scaled angular velocity or an angular displacement.
+
+        The product is the same as with the operands the other way around.
+        """
+        return self * other
 
     @overload
     def __truediv__(self, other: float) -> "Velocity": ...
@@ -65,8 +125,13 @@ class Velocity:
     @overload
     def __truediv__(self, other: "Velocity") -> float: ...
 
-    def __truediv__(self, other: "float | Velocity") -> "Velocity | float":
-        """Return a scaled angular velocity or the ratio between the angular velocities.
+    @overload
+    def __truediv__(self, other: TimeDelta) -> "Acceleration": ...
+
+    def __truediv__(
+        self, other: "float | Velocity | TimeDelta"
+    ) -> "Velocity | float | Acceleration":
+        """Return a scaled angular velocity, a ratio or an angular acceleration.
 
         The behaviour depends upon the type of the argument.
 
@@ -74,42 +139,79 @@ class Velocity:
           inverse of the value
         - If the argument is a :py:class:`Velocity`, return the ratio between the two
           angular velocities
+        - If the argument is a :py:class:`TimeDelta`, return the average angular
+          acceleration over the time difference
         """
         if isinstance(other, Velocity):
-            value_as_radian_per_second = self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND)
-            other_value_as_radian_per_second = other.as_unit(
-                AngleUnit.RADIAN, TimeUnit.SECOND
+            return self._value_as_radian_per_second / other._value_as_radian_per_second
+
+        if isinstance(other, TimeDelta):
+            return acceleration.Acceleration._create(
+                self._value / other._value,
+                self._angle_unit,
+                self._time_unit,
+                other._unit,
+                self._value_as_radian_per_second / other._value_as_second,
             )
-            return value_as_radian_per_second / other_value_as_radian_per_second
 
         return (1 / other) * self
 
     def __add__(self, other: "Velocity") -> "Velocity":
         """Return the sum of two angular velocities."""
-        value_as_radian_per_second = self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND)
-        other_value_as_radian_per_second = other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
+        if (
+            self._angle_unit == other._angle_unit
+            and self._time_unit == other._time_unit
+        ):
+            value_sum = self._value + other._value
+            units = (self._angle_unit, self._time_unit)
+            try:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+            except KeyError:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+            return Velocity._create(
+                value_sum,
+                self._angle_unit,
+                self._time_unit,
+                value_sum / unit_delta_per_si_unit,
+            )
+
         value_sum_as_radian_per_second = (
-            value_as_radian_per_second + other_value_as_radian_per_second
+            self._value_as_radian_per_second + other._value_as_radian_per_second
         )
-        return Velocity(
-            value_sum_as_radian_per_second, AngleUnit.RADIAN, TimeUnit.SECOND
+        return Velocity._create(
+            value_sum_as_radian_per_second,
+            AngleUnit.RADIAN,
+            TimeUnit.SECOND,
+            value_sum_as_radian_per_second,
         )
 
     def __sub__(self, other: "Velocity") -> "Velocity":
         """Return the difference of two angular velocities."""
-        value_as_radian_per_second = self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND)
-        other_value_as_radian_per_second = other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
+        if (
+            self._angle_unit == other._angle_unit
+            and self._time_unit == other._time_unit
+        ):
+            value_difference = self._value - other._value
+            units = (self._angle_unit, self._time_unit)
+            try:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+            except KeyError:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+            return Velocity._create(
+                value_difference,
+                self._angle_unit,
+                self._time_unit,
+                value_difference / unit_delta_per_si_unit,
+            )
+
         value_difference_as_radian_per_second = (
-            value_as_radian_per_second - other_value_as_radian_per_second
+            self._value_as_radian_per_second - other._value_as_radian_per_second
         )
-        return Velocity(
+        return Velocity._create(
             value_difference_as_radian_per_second,
             AngleUnit.RADIAN,
             TimeUnit.SECOND,
+            value_difference_as_radian_per_second,
         )
 
     def __neg__(self) -> "Velocity":
@@ -119,68 +221,53 @@ class Velocity:
     def __abs__(self) -> "Velocity":
         """Return the absolute version of the angular velocity."""
         absolute_value = abs(self._value)
-        return Velocity(absolute_value, self._angle_unit, self._time_unit)
+        return Velocity._create(
+            absolute_value,
+            self._angle_unit,
+            self._time_unit,
+            abs(self._value_as_radian_per_second),
+        )
 
     def __floordiv__(self, other: "Velocity") -> float:
         """Return the floored ratio between the angular velocities."""
-        value_as_radian_per_second = self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND)
-        other_value_as_radian_per_second = other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
-        return value_as_radian_per_second // other_value_as_radian_per_second
+        return self._value_as_radian_per_second // other._value_as_radian_per_second
 
     def __mod__(self, other: "Velocity") -> float:
         """Return the remainder of the ratio between the angular velocity."""
-        value_as_radian_per_second = self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND)
-        other_value_as_radian_per_second = other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
-        return value_as_radian_per_second % other_value_as_radian_per_second
+        return self._value_as_radian_per_second % other._value_as_radian_per_second
 
     def __divmod__(self, other: "Velocity") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the velocities."""
-        value_as_radian_per_second = self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND)
-        other_value_as_radian_per_second = other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
+        return divmod(
+            self._value_as_radian_per_second, other._value_as_radian_per_second
         )
-        return divmod(value_as_radian_per_second, other_value_as_radian_per_second)
 
     def __eq__(self, other: object) -> bool:
         """Return whether the objects are equal angular velocities."""
         if not isinstance(other, Velocity):
             return NotImplemented
 
-        return self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND) == other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
+        return self._value_as_radian_per_second == other._value_as_radian_per_second
 
     def __lt__(self, other: "Velocity") -> bool:
         """Return whether the angular velocity is less than the other."""
-        return self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND) < other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
+        return self._value_as_radian_per_second < other._value_as_radian_per_second
 
     def __le__(self, other: "Velocity") -> bool:
         """Return whether the angular velocity is less than or equal to the other."""
-        return self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND) <= other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
+        return self._value_as_radian_per_second <= other._value_as_radian_per_second
 
     def __gt__(self, other: "Velocity") -> bool:
         """Return whether the angular velocity is greater than the other."""
-        return self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND) > other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
+        return self._value_as_radian_per_second > other._value_as_radian_per_second
 
     def __ge__(self, other: "Velocity") -> bool:
         """Return whether the angular velocity is greater than or equal to the other."""
-        return self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND) >= other.as_unit(
-            AngleUnit.RADIAN, TimeUnit.SECOND
-        )
+        return self._value_as_radian_per_second >= other._value_as_radian_per_second
 
     def __hash__(self) -> int:
         """Return the hash of the angular velocity."""
-        return hash(self.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND))
+        return hash(self._value_as_radian_per_second)
 
     def __str__(self) -> str:
         """Return a string representation of the angular velocity."""
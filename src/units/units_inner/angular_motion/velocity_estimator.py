@@ -0,0 +1,104 @@
+"""Module for the angular velocity estimator class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from ..angle import Unit as AngleUnit
+from ..angle import get_unit_delta_per_radian
+from ..time import Unit as TimeUnit
+from .converter import UNIT_DELTAS_PER_SI_UNIT
+from .velocity import Velocity
+
+if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Sequence
+
+    from ..angle import Angle
+    from ..rate_estimators import RateEstimator
+    from ..time import Time, TimeArray
+    from .displacement import Displacement
+
+
+class VelocityEstimator:
+    """Estimates the angular velocity from a stream of timestamped displacements.
+
+    Each time & displacement is passed to the estimator in seconds & radians, and
+    each rate is returned as an angular velocity in the units of the estimator, so
+    that no differences are converted or created for each sample.
+
+    An angle wraps around every turn, which the estimator would take as a sudden
+    turn backwards, so only a stream of angles that never wraps should be given
+    as angles. Otherwise, unwrap them into displacements with an `Unwrapper` first.
+    """
+
+    __slots__ = (
+        "_angle_unit",
+        "_estimator",
+        "_time_unit",
+        "_unit_delta_per_si",
+        "_unit_per_radian",
+    )
+
+    def __init__(
+        self,
+        estimator: "RateEstimator",
+        angle_unit: AngleUnit,
+        time_unit: TimeUnit,
+    ) -> None:
+        """Initialise a new estimator, returning angular velocities in the units."""
+        self._estimator = estimator
+        self._angle_unit = angle_unit
+        self._time_unit = time_unit
+        units = (angle_unit, time_unit)
+        try:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+        self._unit_delta_per_si = unit_delta_per_si_unit
+        self._unit_per_radian = get_unit_delta_per_radian(angle_unit)
+
+    def update(
+        self, time: "Time", displacement: "Displacement | Angle"
+    ) -> "Velocity | None":
+        """Add the displacement at the time & return the angular velocity.
+
+        None is returned until the estimator has enough samples to estimate from.
+
+        Raises:
+            ValueError: The time is not after the time of the previous sample.
+        """
+        rate = self._estimator.update(
+            time._value_as_second, displacement._value_as_radian
+        )
+        if rate is None:
+            return None
+
+        return Velocity._create(
+            rate * self._unit_delta_per_si, self._angle_unit, self._time_unit, rate
+        )
+
+    def estimate(self, times: "TimeArray", values: "Sequence[float]") -> "array[float]":
+        """Return the angular velocities of whole buffers of samples, in the units.
+
+        There is no array of angles, so the displacements are raw values in the
+        angle unit of the estimator. The velocities are those a fresh estimator
+        would return for the samples, without those it returns as None, and the
+        stream so far is not disturbed.
+
+        Raises:
+            ValueError: The buffers are of different lengths, or the times do not
+                increase.
+        """
+        rates = self._estimator.estimate(times._values_as_second, values)
+        # The rates are already in the angle unit, so only convert the time unit
+        unit_delta_per_si = self._unit_delta_per_si / self._unit_per_radian
+        for index, rate in enumerate(rates):
+            rates[index] = rate * unit_delta_per_si
+        return rates
+
+    def reset(self) -> None:
+        """Forget every sample."""
+        self._estimator.reset()
@@ -1,20 +1,45 @@
 """Package for area-related classes and constants."""
 
 from .area import Area
+from .area_array import AreaArray
 from .area_delta import AreaDelta
+from .area_delta_array import AreaDeltaArray
 from .constants import ZERO
+from .converter import convert_into, make_converter
 from .exceptions import NegativeAreaValueError
-from .unit import Unit, get_unit_delta_per_square_metre
+from .filter import AreaFilter
+from .fixed_point_area import FixedPointArea
+from .fixed_point_area_delta import FixedPointAreaDelta
+from .isr import AreaCell, AreaThreshold
+from .series import AreaSeries
+from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    Unit,
+    get_unit_delta_per_square_metre,
+)
 from .unit import get_abbreviation as get_unit_abbreviation
 from .unit import get_name as get_unit_name
 
 __all__ = [
+    "CONVERSION_FACTORS",
+    "CONVERSION_FACTORS_STRIDE",
     "ZERO",
     "Area",
+    "AreaArray",
+    "AreaCell",
     "AreaDelta",
+    "AreaDeltaArray",
+    "AreaFilter",
+    "AreaSeries",
+    "AreaThreshold",
+    "FixedPointArea",
+    "FixedPointAreaDelta",
     "NegativeAreaValueError",
     "Unit",
+    "convert_into",
     "get_unit_abbreviation",
     "get_unit_delta_per_square_metre",
     "get_unit_name",
+    "make_converter",
 ]
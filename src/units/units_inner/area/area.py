@@ -1,15 +1,27 @@
 """Module for the area class."""
 
+# pyright: reportPrivateUsage=false
+
 from typing import overload
 
 from .area_delta import AreaDelta
 from .exceptions import NegativeAreaValueError
-from .unit import Unit, get_abbreviation, get_name, get_unit_delta_per_square_metre
+from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    UNIT_DELTAS_PER_SQUARE_METRE,
+    Unit,
+    get_abbreviation,
+    get_name,
+    get_unit_delta_per_square_metre,
+)
 
 
 class Area:
     """The measure of a two-dimensional space."""
 
+    __slots__ = ("_unit", "_value", "_value_as_square_metre")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new area.
 
@@ -21,15 +33,45 @@ class Area:
 
         self._value = value
         self._unit = unit
-
-    def as_unit(self, unit: Unit) -> float:
-        """Return the area, expressed as the unit."""
         internal_unit_delta_per_square_metre = get_unit_delta_per_square_metre(
             self._unit
         )
-        value_as_square_metre = self._value / internal_unit_delta_per_square_metre
-        external_unit_delta_per_square_meter = get_unit_delta_per_square_metre(unit)
-        return external_unit_delta_per_square_meter * value_as_square_metre
+        self._value_as_square_metre = self._value / internal_unit_delta_per_square_metre
+
+    @classmethod
+    def _create(cls, value: float, unit: Unit, value_as_square_metre: float) -> "Area":
+        """Create an area from its value in both the unit & square metres.
+
+        Not intended for public use.
+
+        The value is not converted again, and the only validation is a single
+        comparison of the value in square metres.
+
+        Raises:
+            NegativeAreaValueError: The value produced an area less than 0m^2.
+        """
+        if value_as_square_metre < 0:
+            raise NegativeAreaValueError(value=value)
+
+        area: Area = cls.__new__(cls)
+        area._value = value
+        area._unit = unit
+        area._value_as_square_metre = value_as_square_metre
+        return area
+
+    def as_unit(self, unit: Unit) -> float:
+        """Return the area, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not an area unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __add__(self, delta: AreaDelta) -> "Area":
         """Return the sum of the area and the difference.
@@ -38,10 +80,20 @@ class Area:
             NegativeAreaValueError: The sum of the area and the difference was less than
                 0m^2.
         """
-        value_as_square_metre = self.as_unit(Unit.SQUARE_METRE)
-        delta_value_as_square_metre = delta.as_unit(Unit.SQUARE_METRE)
-        value_sum_as_square_metre = value_as_square_metre + delta_value_as_square_metre
-        return Area(value_sum_as_square_metre, Unit.SQUARE_METRE)
+        if self._unit == delta._unit:
+            value_sum = self._value + delta._value
+            return Area._create(
+                value_sum,
+                self._unit,
+                value_sum / UNIT_DELTAS_PER_SQUARE_METRE[self._unit],
+            )
+
+        value_sum_as_square_metre = (
+            self._value_as_square_metre + delta._value_as_square_metre
+        )
+        return Area._create(
+            value_sum_as_square_metre, Unit.SQUARE_METRE, value_sum_as_square_metre
+        )
 
     def __radd__(self, delta: AreaDelta) -> "Area":
         """Return the sum of the area and the difference."""
@@ -67,15 +119,36 @@ class Area:
             NegativeAreaValueError: The area minus the difference was less than
                 0m^2. Error can only be raised when other is an :py:class:`AreaDelta`.
         """
-        value_as_square_metre = self.as_unit(Unit.SQUARE_METRE)
-        other_value_as_square_metre = other.as_unit(Unit.SQUARE_METRE)
+        if self._unit == other._unit:
+            value_difference = self._value - other._value
+            value_difference_as_square_metre = (
+                value_difference / UNIT_DELTAS_PER_SQUARE_METRE[self._unit]
+            )
+            return (
+                AreaDelta._create(
+                    value_difference, self._unit, value_difference_as_square_metre
+                )
+                if isinstance(other, Area)
+                else Area._create(
+                    value_difference, self._unit, value_difference_as_square_metre
+                )
+            )
+
         value_difference_as_square_metre = (
-            value_as_square_metre - other_value_as_square_metre
+            self._value_as_square_metre - other._value_as_square_metre
         )
         return (
-            AreaDelta(value_difference_as_square_metre, Unit.SQUARE_METRE)
+            AreaDelta._create(
+                value_difference_as_square_metre,
+                Unit.SQUARE_METRE,
+                value_difference_as_square_metre,
+            )
             if isinstance(other, Area)
-            else Area(value_difference_as_square_metre, Unit.SQUARE_METRE)
+            else Area._create(
+                value_difference_as_square_metre,
+                Unit.SQUARE_METRE,
+                value_difference_as_square_metre,
+            )
         )
 
     def __eq__(self, other: object) -> bool:
@@ -83,27 +156,27 @@ class Area:
         if not isinstance(other, Area):
             return NotImplemented
 
-        return self.as_unit(Unit.SQUARE_METRE) == other.as_unit(Unit.SQUARE_METRE)
+        return self._value_as_square_metre == other._value_as_square_metre
 
     def __lt__(self, other: "Area") -> bool:
         """Return whether the area is less than the other."""
-        return self.as_unit(Unit.SQUARE_METRE) < other.as_unit(Unit.SQUARE_METRE)
+        return self._value_as_square_metre < other._value_as_square_metre
 
     def __le__(self, other: "Area") -> bool:
         """Return whether the area is less than or equal to the other."""
-        return self.as_unit(Unit.SQUARE_METRE) <= other.as_unit(Unit.SQUARE_METRE)
+        return self._value_as_square_metre <= other._value_as_square_metre
 
     def __gt__(self, other: "Area") -> bool:
         """Return whether the area is greater than the other."""
-        return self.as_unit(Unit.SQUARE_METRE) > other.as_unit(Unit.SQUARE_METRE)
+        return self._value_as_square_metre > other._value_as_square_metre
 
     def __ge__(self, other: "Area") -> bool:
         """Return whether the area is greater than or equal to the other."""
-        return self.as_unit(Unit.SQUARE_METRE) >= other.as_unit(Unit.SQUARE_METRE)
+        return self._value_as_square_metre >= other._value_as_square_metre
 
     def __hash__(self) -> int:
         """Return the hash of the area."""
-        return hash(self.as_unit(Unit.SQUARE_METRE))
+        return hash(self._value_as_square_metre)
 
     def __str__(self) -> str:
         """Return a string representation of the area."""
@@ -0,0 +1,249 @@
+"""Module for the area array class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    create_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .area import Area
+from .area_delta import AreaDelta
+from .area_delta_array import AreaDeltaArray
+from .exceptions import NegativeAreaValueError
+from .unit import Unit, get_name, get_unit_delta_per_square_metre
+
+if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Iterable, Iterator
+
+
+def _check_non_negative(
+    values_as_square_metre: "array[float] | memoryview", unit: Unit
+) -> None:
+    """Check that none of the areas are less than 0m^2^2.
+
+    Raises:
+        NegativeAreaValueError: One of the areas was less than 0m^2^2.
+    """
+    if not values_as_square_metre:
+        return
+
+    minimum_value_as_square_metre = min(values_as_square_metre)
+    if minimum_value_as_square_metre < 0:
+        internal_unit_delta_per_square_metre = get_unit_delta_per_square_metre(unit)
+        raise NegativeAreaValueError(
+            value=minimum_value_as_square_metre * internal_unit_delta_per_square_metre
+        )
+
+
+class AreaArray:
+    """A homogeneous array of areas.
+
+    The areas are stored in bulk as square metres, and share a single unit that they
+    are expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_square_metre")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of areas, with all values in the unit.
+
+        Raises:
+            NegativeAreaValueError: One of the values produced an area less than
+                0m^2^2.
+        """
+        internal_unit_delta_per_square_metre = get_unit_delta_per_square_metre(unit)
+        values_as_square_metre = create_values(
+            values, 1 / internal_unit_delta_per_square_metre
+        )
+        _check_non_negative(values_as_square_metre, unit)
+
+        self._unit = unit
+        self._values_as_square_metre: array[float] | memoryview = values_as_square_metre
+
+    @classmethod
+    def _from_values_as_square_metre(
+        cls, values_as_square_metre: "array[float] | memoryview", unit: Unit
+    ) -> "AreaArray":
+        """Create an array of areas directly from a buffer of square metres.
+
+        The buffer is used as-is, rather than copied, and is assumed to be valid.
+        """
+        areas: AreaArray = cls.__new__(cls)
+        areas._unit = unit
+        areas._values_as_square_metre = values_as_square_metre
+        return areas
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the areas, expressed as the unit."""
+        external_unit_delta_per_square_metre = get_unit_delta_per_square_metre(unit)
+        return create_values(
+            self._values_as_square_metre, external_unit_delta_per_square_metre
+        )
+
+    def __len__(self) -> int:
+        """Return the number of areas."""
+        return len(self._values_as_square_metre)
+
+    @overload
+    def __getitem__(self, index: int) -> Area: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "AreaArray": ...
+
+    def __getitem__(self, index: "int | slice") -> "Area | AreaArray":
+        """Return the area at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return AreaArray._from_values_as_square_metre(
+                memoryview(self._values_as_square_metre)[index], self._unit
+            )
+
+        internal_unit_delta_per_square_metre = get_unit_delta_per_square_metre(
+            self._unit
+        )
+        return Area(
+            self._values_as_square_metre[index] * internal_unit_delta_per_square_metre,
+            self._unit,
+        )
+
+    def __iter__(self) -> "Iterator[Area]":
+        """Return an iterator over the areas."""
+        internal_unit_delta_per_square_metre = get_unit_delta_per_square_metre(
+            self._unit
+        )
+        for value_as_square_metre in self._values_as_square_metre:
+            yield Area(
+                value_as_square_metre * internal_unit_delta_per_square_metre, self._unit
+            )
+
+    def __add__(self, delta: "AreaDelta | AreaDeltaArray") -> "AreaArray":
+        """Return the sum of the areas and the difference(s).
+
+        A single area delta is added to every area, while an array of area
+        deltas is added elementwise.
+
+        Raises:
+            NegativeAreaValueError: One of the sums was less than 0m^2^2.
+            ValueError: The arrays are of different lengths.
+        """
+        delta_values_as_square_metre = (
+            delta.as_unit(Unit.SQUARE_METRE)
+            if isinstance(delta, AreaDelta)
+            else delta._values_as_square_metre
+        )
+        value_sums_as_square_metre = add_values(
+            self._values_as_square_metre, delta_values_as_square_metre
+        )
+        _check_non_negative(value_sums_as_square_metre, self._unit)
+        return AreaArray._from_values_as_square_metre(
+            value_sums_as_square_metre, self._unit
+        )
+
+    def __radd__(self, delta: AreaDelta) -> "AreaArray":
+        """Return the sum of the areas and the difference.
+
+        Raises:
+            NegativeAreaValueError: One of the sums was less than 0m^2^2.
+        """
+        return self + delta
+
+    @overload
+    def __sub__(self, other: "Area | AreaArray") -> AreaDeltaArray: ...
+
+    @overload
+    def __sub__(self, other: "AreaDelta | AreaDeltaArray") -> "AreaArray": ...
+
+    def __sub__(
+        self, other: "Area | AreaArray | AreaDelta | AreaDeltaArray"
+    ) -> "AreaDeltaArray | AreaArray":
+        """Return the difference between the areas and the other(s).
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is an area or an array of areas, return the differences
+          between the areas.
+        - If the argument is an area delta or an array of area deltas, return the
+          areas less the differences.
+
+        A single argument is subtracted from every area, while an array is
+        subtracted elementwise.
+
+        Raises:
+            NegativeAreaValueError: One of the differences was less than 0m^2^2. Error
+                can only be raised when other is a :py:class:`AreaDelta` or
+                :py:class:`AreaDeltaArray`.
+            ValueError: The arrays are of different lengths.
+        """
+        other_values_as_square_metre = (
+            other.as_unit(Unit.SQUARE_METRE)
+            if isinstance(other, (Area, AreaDelta))
+            else other._values_as_square_metre
+        )
+        value_differences_as_square_metre = subtract_values(
+            self._values_as_square_metre, other_values_as_square_metre
+        )
+        if isinstance(other, (Area, AreaArray)):
+            return AreaDeltaArray._from_values_as_square_metre(
+                value_differences_as_square_metre, self._unit
+            )
+
+        _check_non_negative(value_differences_as_square_metre, self._unit)
+        return AreaArray._from_values_as_square_metre(
+            value_differences_as_square_metre, self._unit
+        )
+
+    def __lt__(self, other: "Area | AreaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the areas less than the other area(s)."""
+        other_values_as_square_metre = (
+            other.as_unit(Unit.SQUARE_METRE)
+            if isinstance(other, Area)
+            else other._values_as_square_metre
+        )
+        return less_than(self._values_as_square_metre, other_values_as_square_metre)
+
+    def __le__(self, other: "Area | AreaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the areas less than or equal to the other area(s)."""
+        other_values_as_square_metre = (
+            other.as_unit(Unit.SQUARE_METRE)
+            if isinstance(other, Area)
+            else other._values_as_square_metre
+        )
+        return less_than_or_equal_to(
+            self._values_as_square_metre, other_values_as_square_metre
+        )
+
+    def __gt__(self, other: "Area | AreaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the areas greater than the other area(s)."""
+        other_values_as_square_metre = (
+            other.as_unit(Unit.SQUARE_METRE)
+            if isinstance(other, Area)
+            else other._values_as_square_metre
+        )
+        return greater_than(self._values_as_square_metre, other_values_as_square_metre)
+
+    def __ge__(self, other: "Area | AreaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the areas greater than or equal to the other area(s)."""
+        other_values_as_square_metre = (
+            other.as_unit(Unit.SQUARE_METRE)
+            if isinstance(other, Area)
+            else other._values_as_square_metre
+        )
+        return greater_than_or_equal_to(
+            self._values_as_square_metre, other_values_as_square_metre
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the areas."""
+        values = list(self.as_unit(self._unit))
+        return f"AreaArray({values}, {get_name(self._unit)})"
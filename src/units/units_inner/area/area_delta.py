@@ -3,6 +3,9 @@
 from typing import overload
 
 from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    UNIT_DELTAS_PER_SQUARE_METRE,
     Unit,
     get_abbreviation,
     get_name,
@@ -13,24 +16,53 @@ from .unit import (
 class AreaDelta:
     """The difference between two areas."""
 
+    __slots__ = ("_unit", "_value", "_value_as_square_metre")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new area difference."""
         self._value = value
         self._unit = unit
-
-    def as_unit(self, unit: Unit) -> float:
-        """Return the area difference, expressed as the unit."""
         internal_unit_delta_per_square_metre = get_unit_delta_per_square_metre(
             self._unit
         )
-        value_as_square_metre = self._value / internal_unit_delta_per_square_metre
-        external_unit_delta_per_square_metre = get_unit_delta_per_square_metre(unit)
-        return external_unit_delta_per_square_metre * value_as_square_metre
+        self._value_as_square_metre = self._value / internal_unit_delta_per_square_metre
+
+    @classmethod
+    def _create(
+        cls, value: float, unit: Unit, value_as_square_metre: float
+    ) -> "AreaDelta":
+        """Create an area difference from its value in both the unit & square metres.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        area_delta: AreaDelta = cls.__new__(cls)
+        area_delta._value = value
+        area_delta._unit = unit
+        area_delta._value_as_square_metre = value_as_square_metre
+        return area_delta
+
+    def as_unit(self, unit: Unit) -> float:
+        """Return the area difference, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not an area unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __mul__(self, value: float) -> "AreaDelta":
         """Return a area difference scaled by the value."""
         scaled_value = self._value * value
-        return AreaDelta(scaled_value, self._unit)
+        return AreaDelta._create(
+            scaled_value, self._unit, self._value_as_square_metre * value
+        )
 
     def __rmul__(self, value: float) -> "AreaDelta":
         """Return a area difference scaled by the value."""
@@ -53,12 +85,12 @@ class AreaDelta:
           differences
         """
         if isinstance(other, AreaDelta):
-            value_as_square_metre = self.as_unit(Unit.SQUARE_METRE)
-            other_value_as_square_metre = other.as_unit(Unit.SQUARE_METRE)
-            return value_as_square_metre / other_value_as_square_metre
+            return self._value_as_square_metre / other._value_as_square_metre
 
         scaled_value = self._value / other
-        return AreaDelta(scaled_value, self._unit)
+        return AreaDelta._create(
+            scaled_value, self._unit, self._value_as_square_metre / other
+        )
 
     def __add__(self, other: "AreaDelta") -> "AreaDelta":
         """Return the sum of the area differences."""
@@ -68,12 +100,20 @@ class AreaDelta:
         if not isinstance(other, AreaDelta):  # type: ignore[reportUnnecessaryIsInstance]
             return NotImplemented
 
-        value_as_square_metre = self.as_unit(Unit.SQUARE_METRE)
-        delta_value_as_square_metre = other.as_unit(Unit.SQUARE_METRE)
+        if self._unit == other._unit:
+            value_sum = self._value + other._value
+            return AreaDelta._create(
+                value_sum,
+                self._unit,
+                value_sum / UNIT_DELTAS_PER_SQUARE_METRE[self._unit],
+            )
+
         added_value_as_square_metre = (
-            value_as_square_metre + delta_value_as_square_metre
+            self._value_as_square_metre + other._value_as_square_metre
+        )
+        return AreaDelta._create(
+            added_value_as_square_metre, Unit.SQUARE_METRE, added_value_as_square_metre
         )
-        return AreaDelta(added_value_as_square_metre, Unit.SQUARE_METRE)
 
     def __sub__(self, delta: "AreaDelta") -> "AreaDelta":
         """Return the difference between the area differences."""
@@ -82,57 +122,55 @@ class AreaDelta:
     def __neg__(self) -> "AreaDelta":
         """Return the inverse of the area difference."""
         inverted_value = -self._value
-        return AreaDelta(inverted_value, self._unit)
+        return AreaDelta._create(
+            inverted_value, self._unit, -self._value_as_square_metre
+        )
 
     def __abs__(self) -> "AreaDelta":
         """Return the absolute version of the area difference."""
         absolute_value = abs(self._value)
-        return AreaDelta(absolute_value, self._unit)
+        return AreaDelta._create(
+            absolute_value, self._unit, abs(self._value_as_square_metre)
+        )
 
     def __floordiv__(self, other: "AreaDelta") -> float:
         """Return the floored ratio between the area differences."""
-        value_as_square_metre = self.as_unit(Unit.SQUARE_METRE)
-        other_value_as_square_metre = other.as_unit(Unit.SQUARE_METRE)
-        return value_as_square_metre // other_value_as_square_metre
+        return self._value_as_square_metre // other._value_as_square_metre
 
     def __mod__(self, other: "AreaDelta") -> float:
         """Return the remainder of the ratio between the area differences."""
-        value_as_square_metre = self.as_unit(Unit.SQUARE_METRE)
-        other_value_as_square_metre = other.as_unit(Unit.SQUARE_METRE)
-        return value_as_square_metre % other_value_as_square_metre
+        return self._value_as_square_metre % other._value_as_square_metre
 
     def __divmod__(self, other: "AreaDelta") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the area deltas."""
-        value_as_square_metre = self.as_unit(Unit.SQUARE_METRE)
-        other_value_as_square_metre = other.as_unit(Unit.SQUARE_METRE)
-        return divmod(value_as_square_metre, other_value_as_square_metre)
+        return divmod(self._value_as_square_metre, other._value_as_square_metre)
 
     def __eq__(self, other: object) -> bool:
         """Return whether the objects are equal area differences."""
         if not isinstance(other, AreaDelta):
             return NotImplemented
 
-        return self.as_unit(Unit.SQUARE_METRE) == other.as_unit(Unit.SQUARE_METRE)
+        return self._value_as_square_metre == other._value_as_square_metre
 
     def __lt__(self, other: "AreaDelta") -> bool:
         """Return whether the area difference is less than the other."""
-        return self.as_unit(Unit.SQUARE_METRE) < other.as_unit(Unit.SQUARE_METRE)
+        return self._value_as_square_metre < other._value_as_square_metre
 
     def __le__(self, other: "AreaDelta") -> bool:
         """Return whether the area delta is less than or equal to the other."""
-        return self.as_unit(Unit.SQUARE_METRE) <= other.as_unit(Unit.SQUARE_METRE)
+        return self._value_as_square_metre <= other._value_as_square_metre
 
     def __gt__(self, other: "AreaDelta") -> bool:
         """Return whether the area difference is greater than the other."""
-        return self.as_unit(Unit.SQUARE_METRE) > other.as_unit(Unit.SQUARE_METRE)
+        return self._value_as_square_metre > other._value_as_square_metre
 
     def __ge__(self, other: "AreaDelta") -> bool:
         """Return whether the area delta is greater than or equal to the other."""
-        return self.as_unit(Unit.SQUARE_METRE) >= other.as_unit(Unit.SQUARE_METRE)
+        return self._value_as_square_metre >= other._value_as_square_metre
 
     def __hash__(self) -> int:
         """Return the hash of the area difference."""
-        return hash(self.as_unit(Unit.SQUARE_METRE))
+        return hash(self._value_as_square_metre)
 
     def __str__(self) -> str:
         """Return a string representation of the area difference."""
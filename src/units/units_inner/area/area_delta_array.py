@@ -0,0 +1,223 @@
+"""Module for the area delta array class."""
+
+# ruff: noqa: TID252
+
+from array import array
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    create_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .area_delta import AreaDelta
+from .unit import Unit, get_name, get_unit_delta_per_square_metre
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class AreaDeltaArray:
+    """A homogeneous array of area deltas.
+
+    The deltas are stored in bulk as square metres, and share a single unit that
+    they are expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_square_metre")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of area deltas, with all values in the unit."""
+        internal_unit_delta_per_square_metre = get_unit_delta_per_square_metre(unit)
+        self._unit = unit
+        self._values_as_square_metre: array[float] | memoryview = create_values(
+            values, 1 / internal_unit_delta_per_square_metre
+        )
+
+    @classmethod
+    def _from_values_as_square_metre(
+        cls, values_as_square_metre: "array[float] | memoryview", unit: Unit
+    ) -> "AreaDeltaArray":
+        """Create an array of area deltas directly from a buffer of square metres.
+
+        The buffer is used as-is, rather than copied.
+        """
+        deltas: AreaDeltaArray = cls.__new__(cls)
+        deltas._unit = unit
+        deltas._values_as_square_metre = values_as_square_metre
+        return deltas
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the area deltas, expressed as the unit."""
+        external_unit_delta_per_square_metre = get_unit_delta_per_square_metre(unit)
+        return create_values(
+            self._values_as_square_metre, external_unit_delta_per_square_metre
+        )
+
+    def __len__(self) -> int:
+        """Return the number of area deltas."""
+        return len(self._values_as_square_metre)
+
+    @overload
+    def __getitem__(self, index: int) -> AreaDelta: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "AreaDeltaArray": ...
+
+    def __getitem__(self, index: "int | slice") -> "AreaDelta | AreaDeltaArray":
+        """Return the area delta at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return AreaDeltaArray._from_values_as_square_metre(
+                memoryview(self._values_as_square_metre)[index], self._unit
+            )
+
+        internal_unit_delta_per_square_metre = get_unit_delta_per_square_metre(
+            self._unit
+        )
+        return AreaDelta(
+            self._values_as_square_metre[index] * internal_unit_delta_per_square_metre,
+            self._unit,
+        )
+
+    def __iter__(self) -> "Iterator[AreaDelta]":
+        """Return an iterator over the area deltas."""
+        internal_unit_delta_per_square_metre = get_unit_delta_per_square_metre(
+            self._unit
+        )
+        for value_as_square_metre in self._values_as_square_metre:
+            yield AreaDelta(
+                value_as_square_metre * internal_unit_delta_per_square_metre, self._unit
+            )
+
+    def __mul__(self, value: float) -> "AreaDeltaArray":
+        """Return the area deltas scaled by the value."""
+        return AreaDeltaArray._from_values_as_square_metre(
+            create_values(self._values_as_square_metre, value), self._unit
+        )
+
+    def __rmul__(self, value: float) -> "AreaDeltaArray":
+        """Return the area deltas scaled by the value."""
+        return self * value
+
+    def __truediv__(self, value: float) -> "AreaDeltaArray":
+        """Return the area deltas scaled by the inverse of the value."""
+        return self * (1 / value)
+
+    def __add__(self, other: "AreaDelta | AreaDeltaArray") -> "AreaDeltaArray":
+        """Return the sum of the area deltas and the other delta(s).
+
+        A single area delta is added to every element, while an array of area
+        deltas is added elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, AreaDelta):
+            return AreaDeltaArray._from_values_as_square_metre(
+                add_values(
+                    self._values_as_square_metre, other.as_unit(Unit.SQUARE_METRE)
+                ),
+                self._unit,
+            )
+
+        if isinstance(other, AreaDeltaArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return AreaDeltaArray._from_values_as_square_metre(
+                add_values(self._values_as_square_metre, other._values_as_square_metre),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __radd__(self, other: AreaDelta) -> "AreaDeltaArray":
+        """Return the sum of the area deltas and the other delta."""
+        return self + other
+
+    def __sub__(self, other: "AreaDelta | AreaDeltaArray") -> "AreaDeltaArray":
+        """Return the difference of the area deltas and the other delta(s).
+
+        A single area delta is subtracted from every element, while an array of
+        area deltas is subtracted elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, AreaDelta):
+            return AreaDeltaArray._from_values_as_square_metre(
+                subtract_values(
+                    self._values_as_square_metre, other.as_unit(Unit.SQUARE_METRE)
+                ),
+                self._unit,
+            )
+
+        if isinstance(other, AreaDeltaArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return AreaDeltaArray._from_values_as_square_metre(
+                subtract_values(
+                    self._values_as_square_metre, other._values_as_square_metre
+                ),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __neg__(self) -> "AreaDeltaArray":
+        """Return the inverse of the area deltas."""
+        return self * -1
+
+    def __abs__(self) -> "AreaDeltaArray":
+        """Return the absolute of the area deltas."""
+        return AreaDeltaArray._from_values_as_square_metre(
+            array("d", (abs(value) for value in self._values_as_square_metre)),
+            self._unit,
+        )
+
+    def __lt__(self, other: "AreaDelta | AreaDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the area deltas less than the other delta(s)."""
+        other_values_as_square_metre = (
+            other.as_unit(Unit.SQUARE_METRE)
+            if isinstance(other, AreaDelta)
+            else other._values_as_square_metre
+        )
+        return less_than(self._values_as_square_metre, other_values_as_square_metre)
+
+    def __le__(self, other: "AreaDelta | AreaDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the area deltas less than or equal to the other(s)."""
+        other_values_as_square_metre = (
+            other.as_unit(Unit.SQUARE_METRE)
+            if isinstance(other, AreaDelta)
+            else other._values_as_square_metre
+        )
+        return less_than_or_equal_to(
+            self._values_as_square_metre, other_values_as_square_metre
+        )
+
+    def __gt__(self, other: "AreaDelta | AreaDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the area deltas greater than the other delta(s)."""
+        other_values_as_square_metre = (
+            other.as_unit(Unit.SQUARE_METRE)
+            if isinstance(other, AreaDelta)
+            else other._values_as_square_metre
+        )
+        return greater_than(self._values_as_square_metre, other_values_as_square_metre)
+
+    def __ge__(self, other: "AreaDelta | AreaDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the area deltas greater than or equal to the other(s)."""
+        other_values_as_square_metre = (
+            other.as_unit(Unit.SQUARE_METRE)
+            if isinstance(other, AreaDelta)
+            else other._values_as_square_metre
+        )
+        return greater_than_or_equal_to(
+            self._values_as_square_metre, other_values_as_square_metre
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the area deltas."""
+        values = list(self.as_unit(self._unit))
+        return f"AreaDeltaArray({values}, {get_name(self._unit)})"
@@ -0,0 +1,60 @@
+"""Module for the area filter class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from .area import Area
+from .exceptions import NegativeAreaValueError
+from .unit import Unit, get_unit_delta_per_square_metre
+
+if TYPE_CHECKING:
+    from ..filters import Filter
+
+
+class AreaFilter:
+    """A streaming filter over areas, such as a moving average or median.
+
+    Each area is passed to the filter in square metres, and each result is returned
+    as an area in the unit of the filter, so that a stream of readings is smoothed
+    without unwrapping & rewrapping them by hand.
+    """
+
+    __slots__ = ("_filter", "_unit", "_unit_delta_per_square_metre")
+
+    def __init__(self, filter_: "Filter", unit: Unit) -> None:
+        """Initialise a new area filter, returning results in the unit."""
+        self._filter = filter_
+        self._unit = unit
+        self._unit_delta_per_square_metre = get_unit_delta_per_square_metre(unit)
+
+    def update(self, area: Area) -> Area:
+        """Add the area to the filter & return the filtered area."""
+        return self._create(self._filter.update(area._value_as_square_metre))
+
+    def update_value(self, value: float) -> Area:
+        """Add a raw value in the unit of the filter & return the filtered area.
+
+        Raises:
+            NegativeAreaValueError: The negative value produced an area less than 0m^2.
+        """
+        if value < 0:
+            raise NegativeAreaValueError(value=value)
+
+        return self._create(
+            self._filter.update(value / self._unit_delta_per_square_metre)
+        )
+
+    def _create(self, value_as_square_metre: float) -> Area:
+        """Create an area in the unit of the filter from its value in square metres."""
+        return Area._create(
+            value_as_square_metre * self._unit_delta_per_square_metre,
+            self._unit,
+            value_as_square_metre,
+        )
+
+    def reset(self) -> None:
+        """Forget every area added to the filter."""
+        self._filter.reset()
@@ -0,0 +1,158 @@
+"""Module for the fixed-point area class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+from typing import overload
+
+from ..fixed_point import check_count, from_count, to_count
+from .area import Area
+from .exceptions import NegativeAreaValueError
+from .fixed_point_area_delta import FixedPointAreaDelta
+from .unit import FIXED_POINT_RESOLUTION_PER_SQUARE_METRE, Unit, get_fixed_point_ratio
+
+
+class FixedPointArea:
+    """An area, in fixed-point.
+
+    The area is held as an integer number of square millimetres. Intended for ports
+    without hardware floating point, or where floats are allocated on the heap. Only
+    creating the area & expressing it in a unit involve a conversion, which is done with
+    an integer ratio; arithmetic & comparisons stay in ints.
+
+    The count is kept within the range of a small int on 32-bit ports (see
+    `MAXIMUM_COUNT`), so up to about 1073 square metres can be held, and creating a
+    area or doing arithmetic beyond it raises `OverflowError`.
+    """
+
+    __slots__ = ("_value_as_square_millimetre",)
+
+    def __init__(self, value: int, unit: Unit) -> None:
+        """Initialise a new fixed-point area from an integer value.
+
+        The value is in the unit, and is rounded to the nearest square millimetre.
+
+        Raises:
+            NegativeAreaValueError: The negative value produced a area less than 0m^2.
+            OverflowError: The value is too large to be held as a count of square
+                millimetres.
+        """
+        if value < 0:
+            raise NegativeAreaValueError(value=value)
+
+        numerator, denominator = get_fixed_point_ratio(unit)
+        self._value_as_square_millimetre = to_count(value, numerator, denominator)
+
+    @classmethod
+    def _from_value_as_square_millimetre(
+        cls, value_as_square_millimetre: int
+    ) -> "FixedPointArea":
+        """Create a fixed-point area from a number of square millimetres.
+
+        Raises:
+            NegativeAreaValueError: The number of square millimetres was negative.
+            OverflowError: The number of square millimetres was out of range.
+        """
+        if value_as_square_millimetre < 0:
+            raise NegativeAreaValueError(value=value_as_square_millimetre)
+
+        area: FixedPointArea = cls.__new__(cls)
+        area._value_as_square_millimetre = check_count(value_as_square_millimetre)
+        return area
+
+    def as_unit(self, unit: Unit) -> int:
+        """Return the area in the unit, rounded to the nearest integer."""
+        numerator, denominator = get_fixed_point_ratio(unit)
+        return from_count(self._value_as_square_millimetre, numerator, denominator)
+
+    def to_area(self) -> Area:
+        """Return the area as a floating-point :py:class:`Area`."""
+        return Area(
+            self._value_as_square_millimetre / FIXED_POINT_RESOLUTION_PER_SQUARE_METRE,
+            Unit.SQUARE_METRE,
+        )
+
+    def __add__(self, delta: FixedPointAreaDelta) -> "FixedPointArea":
+        """Return the sum of the area and the difference.
+
+        Raises:
+            NegativeAreaValueError: The sum of the area and the difference was less
+                than 0m^2.
+        """
+        return FixedPointArea._from_value_as_square_millimetre(
+            self._value_as_square_millimetre + delta._value_as_square_millimetre
+        )
+
+    def __radd__(self, delta: FixedPointAreaDelta) -> "FixedPointArea":
+        """Return the sum of the area and the difference."""
+        return self + delta
+
+    @overload
+    def __sub__(self, other: "FixedPointArea") -> FixedPointAreaDelta: ...
+
+    @overload
+    def __sub__(self, other: FixedPointAreaDelta) -> "FixedPointArea": ...
+
+    def __sub__(
+        self, other: "FixedPointArea | FixedPointAreaDelta"
+    ) -> "FixedPointAreaDelta | FixedPointArea":
+        """Return the delta between areas or the area less the delta.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a :py:class:`FixedPointArea`, return the difference
+          between the two areas.
+        - If the argument is a :py:class:`FixedPointAreaDelta`, return the area
+          less the difference.
+
+        Raises:
+            NegativeAreaValueError: The area minus the difference was less
+                than 0m^2. Error can only be raised when other is a
+                :py:class:`FixedPointAreaDelta`.
+        """
+        value_difference_as_square_millimetre = (
+            self._value_as_square_millimetre - other._value_as_square_millimetre
+        )
+        return (
+            FixedPointAreaDelta._from_value_as_square_millimetre(
+                value_difference_as_square_millimetre
+            )
+            if isinstance(other, FixedPointArea)
+            else FixedPointArea._from_value_as_square_millimetre(
+                value_difference_as_square_millimetre
+            )
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the objects are equal fixed-point areas."""
+        if not isinstance(other, FixedPointArea):
+            return NotImplemented
+
+        return self._value_as_square_millimetre == other._value_as_square_millimetre
+
+    def __lt__(self, other: "FixedPointArea") -> bool:
+        """Return whether the area is less than the other."""
+        return self._value_as_square_millimetre < other._value_as_square_millimetre
+
+    def __le__(self, other: "FixedPointArea") -> bool:
+        """Return whether the area is less than or equal to the other."""
+        return self._value_as_square_millimetre <= other._value_as_square_millimetre
+
+    def __gt__(self, other: "FixedPointArea") -> bool:
+        """Return whether the area is greater than the other."""
+        return self._value_as_square_millimetre > other._value_as_square_millimetre
+
+    def __ge__(self, other: "FixedPointArea") -> bool:
+        """Return whether the area is greater than or equal to the other."""
+        return self._value_as_square_millimetre >= other._value_as_square_millimetre
+
+    def __hash__(self) -> int:
+        """Return the hash of the area."""
+        return hash(self._value_as_square_millimetre)
+
+    def __str__(self) -> str:
+        """Return a string representation of the area."""
+        return f"{self._value_as_square_millimetre} mm^2"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the area for developers."""
+        return f"{__class__.__name__}({self._value_as_square_millimetre} mm^2)"
@@ -0,0 +1,161 @@
+"""Module for the fixed-point area delta class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+from typing import overload
+
+from ..fixed_point import check_count, from_count, to_count
+from .area_delta import AreaDelta
+from .unit import FIXED_POINT_RESOLUTION_PER_SQUARE_METRE, Unit, get_fixed_point_ratio
+
+
+class FixedPointAreaDelta:
+    """The difference between two areas, in fixed-point.
+
+    The area delta is held as an integer number of square millimetres. Intended for
+    ports without hardware floating point, or where floats are allocated on the heap.
+    Only creating the area delta & expressing it in a unit involve a conversion, which
+    is done with an integer ratio; arithmetic & comparisons stay in ints.
+
+    The count is kept within the range of a small int on 32-bit ports (see
+    `MAXIMUM_COUNT`), so up to about 1073 square metres can be held, and creating a
+    area delta or doing arithmetic beyond it raises `OverflowError`.
+    """
+
+    __slots__ = ("_value_as_square_millimetre",)
+
+    def __init__(self, value: int, unit: Unit) -> None:
+        """Initialise a new fixed-point area delta from an integer value.
+
+        The value is in the unit, and is rounded to the nearest square millimetre.
+
+        Raises:
+            OverflowError: The value is too large to be held as a count of square
+                millimetres.
+        """
+        numerator, denominator = get_fixed_point_ratio(unit)
+        self._value_as_square_millimetre = to_count(value, numerator, denominator)
+
+    @classmethod
+    def _from_value_as_square_millimetre(
+        cls, value_as_square_millimetre: int
+    ) -> "FixedPointAreaDelta":
+        """Create a fixed-point area delta from a number of square millimetres.
+
+        Raises:
+            OverflowError: The number of square millimetres was out of range.
+        """
+        delta: FixedPointAreaDelta = cls.__new__(cls)
+        delta._value_as_square_millimetre = check_count(value_as_square_millimetre)
+        return delta
+
+    def as_unit(self, unit: Unit) -> int:
+        """Return the area delta in the unit, rounded to the nearest integer."""
+        numerator, denominator = get_fixed_point_ratio(unit)
+        return from_count(self._value_as_square_millimetre, numerator, denominator)
+
+    def to_area_delta(self) -> AreaDelta:
+        """Return the area delta as a floating-point :py:class:`AreaDelta`."""
+        return AreaDelta(
+            self._value_as_square_millimetre / FIXED_POINT_RESOLUTION_PER_SQUARE_METRE,
+            Unit.SQUARE_METRE,
+        )
+
+    def __mul__(self, value: int) -> "FixedPointAreaDelta":
+        """Return the area delta scaled by the integer."""
+        return FixedPointAreaDelta._from_value_as_square_millimetre(
+            self._value_as_square_millimetre * value
+        )
+
+    def __rmul__(self, value: int) -> "FixedPointAreaDelta":
+        """Return the area delta scaled by the integer."""
+        return self * value
+
+    @overload
+    def __floordiv__(self, other: int) -> "FixedPointAreaDelta": ...
+
+    @overload
+    def __floordiv__(self, other: "FixedPointAreaDelta") -> int: ...
+
+    def __floordiv__(
+        self, other: "int | FixedPointAreaDelta"
+    ) -> "FixedPointAreaDelta | int":
+        """Return a floored scaled area delta or the floored ratio between them.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is an :py:class:`int`, return the area delta scaled by the
+          inverse of the value, floored to the nearest square millimetre.
+        - If the argument is a :py:class:`FixedPointAreaDelta`, return the floored ratio
+          between the two.
+        """
+        if isinstance(other, FixedPointAreaDelta):
+            return self._value_as_square_millimetre // other._value_as_square_millimetre
+
+        return FixedPointAreaDelta._from_value_as_square_millimetre(
+            self._value_as_square_millimetre // other
+        )
+
+    def __add__(self, other: "FixedPointAreaDelta") -> "FixedPointAreaDelta":
+        """Return the sum of the area deltas."""
+        # Adding to a fixed-point area is handled by the __radd__ method of the
+        # fixed-point area class
+        if not isinstance(other, FixedPointAreaDelta):  # type: ignore[reportUnnecessaryIsInstance]
+            return NotImplemented
+
+        return FixedPointAreaDelta._from_value_as_square_millimetre(
+            self._value_as_square_millimetre + other._value_as_square_millimetre
+        )
+
+    def __sub__(self, other: "FixedPointAreaDelta") -> "FixedPointAreaDelta":
+        """Return the difference between the area deltas."""
+        return FixedPointAreaDelta._from_value_as_square_millimetre(
+            self._value_as_square_millimetre - other._value_as_square_millimetre
+        )
+
+    def __neg__(self) -> "FixedPointAreaDelta":
+        """Return the inverse of the area delta."""
+        return FixedPointAreaDelta._from_value_as_square_millimetre(
+            -self._value_as_square_millimetre
+        )
+
+    def __abs__(self) -> "FixedPointAreaDelta":
+        """Return the absolute version of the area delta."""
+        return FixedPointAreaDelta._from_value_as_square_millimetre(
+            abs(self._value_as_square_millimetre)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the objects are equal fixed-point area deltas."""
+        if not isinstance(other, FixedPointAreaDelta):
+            return NotImplemented
+
+        return self._value_as_square_millimetre == other._value_as_square_millimetre
+
+    def __lt__(self, other: "FixedPointAreaDelta") -> bool:
+        """Return whether the area delta is less than the other."""
+        return self._value_as_square_millimetre < other._value_as_square_millimetre
+
+    def __le__(self, other: "FixedPointAreaDelta") -> bool:
+        """Return whether the area delta is less than or equal to the other."""
+        return self._value_as_square_millimetre <= other._value_as_square_millimetre
+
+    def __gt__(self, other: "FixedPointAreaDelta") -> bool:
+        """Return whether the area delta is greater than the other."""
+        return self._value_as_square_millimetre > other._value_as_square_millimetre
+
+    def __ge__(self, other: "FixedPointAreaDelta") -> bool:
+        """Return whether the area delta is greater than or equal to the other."""
+        return self._value_as_square_millimetre >= other._value_as_square_millimetre
+
+    def __hash__(self) -> int:
+        """Return the hash of the area delta."""
+        return hash(self._value_as_square_millimetre)
+
+    def __str__(self) -> str:
+        """Return a string representation of the area delta."""
+        return f"{self._value_as_square_millimetre} mm^2"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the area delta for developers."""
+        return f"{__class__.__name__}({self._value_as_square_millimetre} mm^2)"
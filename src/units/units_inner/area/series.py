@@ -0,0 +1,136 @@
+"""Module for the area series class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from ..ring_buffer import RingBuffer
+from .area import Area
+from .area_array import AreaArray
+from .exceptions import NegativeAreaValueError
+from .unit import Unit, get_name, get_unit_delta_per_square_metre
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ..time import Time
+
+
+class AreaSeries(RingBuffer):
+    """A rolling window of the most recent areas, with optional timestamps.
+
+    The areas are stored as square metres in a buffer preallocated on initialisation,
+    so that pushing an area drops the oldest one once the series is full,
+    rather than allocating. The areas are indexed from the oldest (0) to the
+    latest (-1), and are expressed in the unit of the series when retrieved.
+    """
+
+    __slots__ = ("_unit", "_unit_delta_per_square_metre")
+
+    def __init__(self, capacity: int, unit: Unit, *, timestamped: bool = False) -> None:
+        """Initialise a new, empty series, holding up to the number of areas.
+
+        If the series is timestamped, every area is pushed along with the time it
+        was measured at.
+
+        Raises:
+            ValueError: The capacity is less than 1.
+        """
+        super().__init__(capacity, timestamped=timestamped)
+        self._unit = unit
+        self._unit_delta_per_square_metre = get_unit_delta_per_square_metre(unit)
+
+    def push(self, area: Area, time: "Time | None" = None) -> None:
+        """Push an area, overwriting the oldest one if the series is full.
+
+        Does not allocate.
+
+        Raises:
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        end = self._end
+        if end == self._limit:
+            end = self._compact()
+        times = self._times
+        if times is not None and time is not None:
+            times[end] = time._value_as_second
+        elif times is not None or time is not None:
+            self._raise_time_error()
+        self._values[end] = area._value_as_square_metre
+        self._end = end + 1
+
+    def push_value(self, value: float, time: "Time | None" = None) -> None:
+        """Push a raw value in the unit of the series, as an area.
+
+        Raises:
+            NegativeAreaValueError: The negative value produced an area less than 0m^2.
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        if value < 0:
+            raise NegativeAreaValueError(value=value)
+
+        self._push(value / self._unit_delta_per_square_metre, time)
+
+    def _create(self, value_as_square_metre: float) -> Area:
+        """Create an area in the unit of the series from its value in square metres."""
+        return Area._create(
+            value_as_square_metre * self._unit_delta_per_square_metre,
+            self._unit,
+            value_as_square_metre,
+        )
+
+    def latest(self) -> Area:
+        """Return the most recently pushed area.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(-1))
+
+    def oldest(self) -> Area:
+        """Return the least recently pushed area still in the series.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(0))
+
+    def window(self, count: "int | None" = None) -> AreaArray:
+        """Return the latest areas, from oldest to latest.
+
+        All of the areas are returned if the count is None, and at most as many areas as
+        the series holds otherwise. The window is a view of the series rather than a
+        copy, so it is only valid until the next push or clear.
+        """
+        return AreaArray._from_values_as_square_metre(
+            self._view_values(count), self._unit
+        )
+
+    def __getitem__(self, index: int) -> Area:
+        """Return the area at the index.
+
+        Raises:
+            IndexError: There is no area at the index.
+        """
+        return self._create(self._get_value(index))
+
+    def __iter__(self) -> "Iterator[Area]":
+        """Return an iterator over the areas, from oldest to latest.
+
+        Each area is only created when it is reached.
+        """
+        for value_as_square_metre in self._iter_values():
+            yield self._create(value_as_square_metre)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the area series."""
+        values = [
+            value * self._unit_delta_per_square_metre for value in self._iter_values()
+        ]
+        return (
+            f"AreaSeries({values}, {get_name(self._unit)}, capacity={self._capacity})"
+        )
@@ -1,25 +1,24 @@
-"""Module for the area unit enum."""
+"""Module for the area units.
 
-# ruff: noqa: TID252
+Generated by `tools/generate_units.py` from `tools/units_spec.json`, so edit the
+spec & rerun the generator rather than editing this module.
+"""
 
 from typing import TYPE_CHECKING, Final
 
-from ..length import Unit as DistanceUnit
-from ..length import get_unit_abbreviation as get_distance_unit_abbreviation
-from ..length import get_unit_delta_per_metre as get_distance_unit_delta_per_metre
-from ..length import get_unit_name as get_distance_unit_name
-
 if TYPE_CHECKING:
     from enum import IntEnum
 else:
     IntEnum = object
 
+_NAN: Final = float("nan")
+
 
-# NB: When adding a new unit, be sure to also update:
-# - The info list in helpers.py
-# - The `test_get_X_value_as_unit` test in `test_X.py` and `test_X_delta.py`
+# NB: When adding a new unit, add it to `tools/units_spec.json` & rerun
+# `tools/generate_units.py`, which also regenerates the tests of the unit
+# tables
 class Unit(IntEnum):
-    """An area unit.
+    """A area unit.
 
     NB: Micropython does not yet support enums. The desired behaviour
     (enumerated options embedded in the type system) can be mostly
@@ -35,103 +34,130 @@ class Unit(IntEnum):
     SQUARE_INCH = 6
 
 
-class _UnitInfo:
-    """Information associated with a area particular unit.
+# The name & abbreviation of each unit, indexed by the unit. Element 0 does not
+# correspond to a unit.
+_NAMES: Final = (
+    "",
+    "square metre",
+    "square centimetre",
+    "square millimetre",
+    "square yard",
+    "square foot",
+    "square inch",
+)
+_ABBREVIATIONS: Final = (
+    "",
+    "m^2",
+    "cm^2",
+    "mm^2",
+    "yd^2",
+    "ft^2",
+    "in^2",
+)
+
+# The change in area expressed as each unit per 1m^2, indexed by the unit. Element 0
+# does not correspond to a unit, and so holds NaN.
+UNIT_DELTAS_PER_SQUARE_METRE: Final = (
+    _NAN,
+    1,
+    10_000,
+    1_000_000,
+    1.1959900463060937,
+    10.763910416689228,
+    1550.003100009548,
+)
+
+# Dense from-unit x to-unit table of conversion factors. Units are small contiguous
+# ints, so the factor that converts a value from one unit to another is at index
+# `from_unit * CONVERSION_FACTORS_STRIDE + to_unit`. Row & column 0 do not correspond to
+# a unit, and so hold NaN. A tuple is used rather than an array, as reading an element
+# of a tuple returns the stored float instead of allocating a new one.
+CONVERSION_FACTORS_STRIDE: Final = 7
+CONVERSION_FACTORS: Final = (
+    # Row 0 does not correspond to a unit
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    # From square metre to each unit
+    _NAN,
+    1.0,
+    10000.0,
+    1000000.0,
+    1.1959900463060937,
+    10.763910416689228,
+    1550.003100009548,
+    # From square centimetre to each unit
+    _NAN,
+    0.0001,
+    1.0,
+    100.0,
+    0.00011959900463060938,
+    0.0010763910416689228,
+    0.1550003100009548,
+    # From square millimetre to each unit
+    _NAN,
+    1e-06,
+    0.01,
+    1.0,
+    1.1959900463060937e-06,
+    1.0763910416689228e-05,
+    0.001550003100009548,
+    # From square yard to each unit
+    _NAN,
+    0.836127359996495,
+    8361.27359996495,
+    836127.3599964951,
+    1.0,
+    8.999999999945137,
+    1295.9999999973666,
+    # From square foot to each unit
+    _NAN,
+    0.09290304000017688,
+    929.0304000017688,
+    92903.04000017689,
+    0.11111111111178842,
+    1.0,
+    144.0000000005852,
+    # From square inch to each unit
+    _NAN,
+    0.0006451599999986065,
+    6.4515999999860645,
+    645.1599999986065,
+    0.0007716049382731728,
+    0.006944444444416223,
+    1.0,
+)
+
+# Fixed-point quantities hold an integer count of square millimetres. The number of
+# square millimetres per 1 of each unit is stored as an integer ratio, indexed by the
+# unit, so that converting to & from the units stays in ints. Element 0 does not
+# correspond to a unit.
+FIXED_POINT_RESOLUTION_PER_SQUARE_METRE: Final = 1_000_000
+_FIXED_POINT_RATIOS: Final = (
+    (0, 1),
+    (1000000, 1),
+    (100, 1),
+    (1, 1),
+    (8361274, 10),
+    (9290304, 100),
+    (64516, 100),
+)
+
+
+def _check_unit(unit: Unit) -> None:
+    """Check that the unit is a area unit.
 
     Not intended for public use.
-    """
 
-    def __init__(
-        self,
-        unit: Unit,
-        name: str,
-        abbreviation: str,
-        unit_delta_per_square_metre: float,
-    ) -> None:
-        """Initialise a collection of info associated with a unit."""
-        self._unit = unit
-        self._name = name
-        self._abbreviation = abbreviation
-        self._unit_delta_per_square_metre = unit_delta_per_square_metre
-
-    @property
-    def unit(self) -> Unit:
-        """The unit the information relates to."""
-        return self._unit
-
-    @property
-    def name(self) -> str:
-        """The name of the unit."""
-        return self._name
-
-    @property
-    def abbreviation(self) -> str:
-        """The abbreviation of the unit."""
-        return self._abbreviation
-
-    @property
-    def unit_delta_per_square_metre(self) -> float:
-        """The change in area expressed as the unit per 1m^2.
-
-        Equivalent to the gradient of the square-metre-vs-unit graph.
-        """
-        return self._unit_delta_per_square_metre
-
-
-# All info is entered here to create a SSoT
-_UNITS_INFO: Final = [
-    _UnitInfo(
-        unit=Unit.SQUARE_METRE,
-        name=f"square {get_distance_unit_name(DistanceUnit.METRE)}",
-        abbreviation=f"{get_distance_unit_abbreviation(DistanceUnit.METRE)}^2",
-        unit_delta_per_square_metre=get_distance_unit_delta_per_metre(
-            DistanceUnit.METRE
-        )
-        ** 2,
-    ),
-    _UnitInfo(
-        unit=Unit.SQUARE_CENTIMETRE,
-        name=f"square {get_distance_unit_name(DistanceUnit.CENTIMETRE)}",
-        abbreviation=f"{get_distance_unit_abbreviation(DistanceUnit.CENTIMETRE)}^2",
-        unit_delta_per_square_metre=get_distance_unit_delta_per_metre(
-            DistanceUnit.CENTIMETRE
-        )
-        ** 2,
-    ),
-    _UnitInfo(
-        unit=Unit.SQUARE_MILLIMETRE,
-        name=f"square {get_distance_unit_name(DistanceUnit.MILLIMETRE)}",
-        abbreviation=f"{get_distance_unit_abbreviation(DistanceUnit.MILLIMETRE)}^2",
-        unit_delta_per_square_metre=get_distance_unit_delta_per_metre(
-            DistanceUnit.MILLIMETRE
-        )
-        ** 2,
-    ),
-    _UnitInfo(
-        unit=Unit.SQUARE_YARD,
-        name=f"square {get_distance_unit_name(DistanceUnit.YARD)}",
-        abbreviation=f"{get_distance_unit_abbreviation(DistanceUnit.YARD)}^2",
-        unit_delta_per_square_metre=get_distance_unit_delta_per_metre(DistanceUnit.YARD)
-        ** 2,
-    ),
-    _UnitInfo(
-        unit=Unit.SQUARE_FOOT,
-        name=f"square {get_distance_unit_name(DistanceUnit.FOOT)}",
-        abbreviation=f"{get_distance_unit_abbreviation(DistanceUnit.FOOT)}^2",
-        unit_delta_per_square_metre=get_distance_unit_delta_per_metre(DistanceUnit.FOOT)
-        ** 2,
-    ),
-    _UnitInfo(
-        unit=Unit.SQUARE_INCH,
-        name=f"square {get_distance_unit_name(DistanceUnit.INCH)}",
-        abbreviation=f"{get_distance_unit_abbreviation(DistanceUnit.INCH)}^2",
-        unit_delta_per_square_metre=get_distance_unit_delta_per_metre(DistanceUnit.INCH)
-        ** 2,
-    ),
-]
-
-# Convert into dictionary for quick lookup
-_UNIT_TO_INFO_MAP: Final = {info.unit: info for info in _UNITS_INFO}
+    Raises:
+        ValueError: The unit is not a area unit.
+    """
+    if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+        raise ValueError
 
 
 def get_name(unit: Unit) -> str:
@@ -139,10 +165,8 @@ def get_name(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].name
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _NAMES[unit]
 
 
 def get_abbreviation(unit: Unit) -> str:
@@ -150,20 +174,23 @@ def get_abbreviation(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].abbreviation
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _ABBREVIATIONS[unit]
 
 
-def get_unit_delta_per_square_metre(
-    unit: Unit,
-) -> float:
+def get_unit_delta_per_square_metre(unit: Unit) -> float:
     """Get the change in area expressed as the unit per 1m^2.
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].unit_delta_per_square_metre
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return UNIT_DELTAS_PER_SQUARE_METRE[unit]
+
+
+def get_fixed_point_ratio(unit: Unit) -> tuple[int, int]:
+    """Get the number of square millimetres per 1 of the area unit, as an integer ratio.
+
+    Not intended for public use.
+    """
+    _check_unit(unit)
+    return _FIXED_POINT_RATIOS[unit]
@@ -0,0 +1,56 @@
+"""Module for the conversions shared by the buffer converters.
+
+The buffer converters convert every value of a caller-supplied buffer (such as an
+`array`, or a memoryview onto one) and write the results into another, so that a
+full buffer of samples can be converted without creating any intermediate
+objects.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import MutableSequence, Sequence
+
+
+def check_destination_length(
+    src: "Sequence[float]", dst: "MutableSequence[float] | memoryview[float]"
+) -> int:
+    """Check that the destination can hold the source, returning its length.
+
+    Not intended for public use.
+
+    Raises:
+        ValueError: The destination is shorter than the source.
+    """
+    length = len(src)
+    if len(dst) < length:
+        msg = f"Destination shorter than source [{len(dst)}, {length}]."
+        raise ValueError(msg)
+
+    return length
+
+
+def convert_values_into(
+    src: "Sequence[float]",
+    dst: "MutableSequence[float] | memoryview[float]",
+    gradient: float,
+    offset: float = 0,
+) -> None:
+    """Write each of the source values, transformed by `gradient * x + offset`, to dst.
+
+    The source & destination may be the same buffer, in which case the values are
+    converted in place.
+
+    Not intended for public use.
+
+    Raises:
+        ValueError: The destination is shorter than the source.
+    """
+    length = check_destination_length(src, dst)
+    if not offset:
+        for index in range(length):
+            dst[index] = src[index] * gradient
+        return
+
+    for index in range(length):
+        dst[index] = src[index] * gradient + offset
@@ -1,14 +1,35 @@
 """Package for current-related classes."""
 
+from .converter import convert_into, make_converter
 from .current import Current
-from .unit import Unit, get_unit_delta_per_ampere
+from .current_array import CurrentArray
+from .filter import CurrentFilter
+from .fixed_point_current import FixedPointCurrent
+from .isr import CurrentCell, CurrentThreshold
+from .series import CurrentSeries
+from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    Unit,
+    get_unit_delta_per_ampere,
+)
 from .unit import get_abbreviation as get_unit_abbreviation
 from .unit import get_name as get_unit_name
 
 __all__ = [
+    "CONVERSION_FACTORS",
+    "CONVERSION_FACTORS_STRIDE",
     "Current",
+    "CurrentArray",
+    "CurrentCell",
+    "CurrentFilter",
+    "CurrentSeries",
+    "CurrentThreshold",
+    "FixedPointCurrent",
     "Unit",
+    "convert_into",
     "get_unit_abbreviation",
     "get_unit_delta_per_ampere",
     "get_unit_name",
+    "make_converter",
 ]
@@ -3,6 +3,9 @@
 from typing import overload
 
 from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    UNIT_DELTAS_PER_AMPERE,
     Unit,
     get_abbreviation,
     get_name,
@@ -13,22 +16,47 @@ from .unit import (
 class Current:
     """The flow of charged particles through an electrical conductor."""
 
+    __slots__ = ("_unit", "_value", "_value_as_ampere")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new current."""
         self._value = value
         self._unit = unit
+        internal_unit_delta_per_ampere = get_unit_delta_per_ampere(self._unit)
+        self._value_as_ampere = self._value / internal_unit_delta_per_ampere
+
+    @classmethod
+    def _create(cls, value: float, unit: Unit, value_as_ampere: float) -> "Current":
+        """Create a current from its value in both the unit & amperes.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        current: Current = cls.__new__(cls)
+        current._value = value
+        current._unit = unit
+        current._value_as_ampere = value_as_ampere
+        return current
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the current, expressed as the unit."""
-        internal_unit_delta_per_ampere = get_unit_delta_per_ampere(self._unit)
-        value_as_ampere = self._value / internal_unit_delta_per_ampere
-        external_unit_delta_per_ampere = get_unit_delta_per_ampere(unit)
-        return external_unit_delta_per_ampere * value_as_ampere
+        """Return the current, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not a current unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __mul__(self, value: float) -> "Current":
         """Return a current scaled by the value."""
         scaled_value = self._value * value
-        return Current(scaled_value, self._unit)
+        return Current._create(scaled_value, self._unit, self._value_as_ampere * value)
 
     def __rmul__(self, value: float) -> "Current":
         """Return a current scaled by the value."""
@@ -51,19 +79,30 @@ class Current:
           currents
         """
         if isinstance(other, Current):
-            value_as_ampere = self.as_unit(Unit.AMPERE)
-            other_value_as_ampere = other.as_unit(Unit.AMPERE)
-            return value_as_ampere / other_value_as_ampere
+            return self._value_as_ampere / other._value_as_ampere
 
         scaled_value = self._value / other
-        return Current(scaled_value, self._unit)
+        return Current._create(scaled_value, self._unit, self._value_as_ampere / other)
 
     def __add__(self, other: "Current") -> "Current":
         """Return the sum of the currents."""
-        value_as_ampere = self.as_unit(Unit.AMPERE)
-        other_value_as_ampere = other.as_unit(Unit.AMPERE)
-        added_value_as_ampere = value_as_ampere + other_value_as_ampere
-        return Current(added_value_as_ampere, Unit.AMPERE)
+        # This NotImplemented block is here because the case of a Current + a
+        # CurrentArray is handled in the __radd__ method in the CurrentArray class
+        if not isinstance(other, Current):  # type: ignore[reportUnnecessaryIsInstance]
+            return NotImplemented
+
+        if self._unit == other._unit:
+            value_sum = self._value + other._value
+            return Current._create(
+                value_sum,
+                self._unit,
+                value_sum / UNIT_DELTAS_PER_AMPERE[self._unit],
+            )
+
+        added_value_as_ampere = self._value_as_ampere + other._value_as_ampere
+        return Current._create(
+            added_value_as_ampere, Unit.AMPERE, added_value_as_ampere
+        )
 
     def __sub__(self, delta: "Current") -> "Current":
         """Return the difference between the currents."""
@@ -72,57 +111,51 @@ class Current:
     def __neg__(self) -> "Current":
         """Return the inverse of the current."""
         inverted_value = -self._value
-        return Current(inverted_value, self._unit)
+        return Current._create(inverted_value, self._unit, -self._value_as_ampere)
 
     def __abs__(self) -> "Current":
         """Return the absolute version of the current."""
         absolute_value = abs(self._value)
-        return Current(absolute_value, self._unit)
+        return Current._create(absolute_value, self._unit, abs(self._value_as_ampere))
 
     def __floordiv__(self, other: "Current") -> float:
         """Return the floored ratio between the currents."""
-        value_as_ampere = self.as_unit(Unit.AMPERE)
-        other_value_as_ampere = other.as_unit(Unit.AMPERE)
-        return value_as_ampere // other_value_as_ampere
+        return self._value_as_ampere // other._value_as_ampere
 
     def __mod__(self, other: "Current") -> float:
         """Return the remainder of the ratio between the currents."""
-        value_as_ampere = self.as_unit(Unit.AMPERE)
-        other_value_as_ampere = other.as_unit(Unit.AMPERE)
-        return value_as_ampere % other_value_as_ampere
+        return self._value_as_ampere % other._value_as_ampere
 
     def __divmod__(self, other: "Current") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the currents."""
-        value_as_ampere = self.as_unit(Unit.AMPERE)
-        other_value_as_ampere = other.as_unit(Unit.AMPERE)
-        return divmod(value_as_ampere, other_value_as_ampere)
+        return divmod(self._value_as_ampere, other._value_as_ampere)
 
     def __eq__(self, other: object) -> bool:
         """Return whether the objects are equal currents."""
         if not isinstance(other, Current):
             return NotImplemented
 
-        return self.as_unit(Unit.AMPERE) == other.as_unit(Unit.AMPERE)
+        return self._value_as_ampere == other._value_as_ampere
 
     def __lt__(self, other: "Current") -> bool:
         """Return whether the current is less than the other."""
-        return self.as_unit(Unit.AMPERE) < other.as_unit(Unit.AMPERE)
+        return self._value_as_ampere < other._value_as_ampere
 
     def __le__(self, other: "Current") -> bool:
         """Return whether the current is less than or equal to the other."""
-        return self.as_unit(Unit.AMPERE) <= other.as_unit(Unit.AMPERE)
+        return self._value_as_ampere <= other._value_as_ampere
 
     def __gt__(self, other: "Current") -> bool:
         """Return whether the current is greater than the other."""
-        return self.as_unit(Unit.AMPERE) > other.as_unit(Unit.AMPERE)
+        return self._value_as_ampere > other._value_as_ampere
 
     def __ge__(self, other: "Current") -> bool:
         """Return whether the current is greater than or equal to the other."""
-        return self.as_unit(Unit.AMPERE) >= other.as_unit(Unit.AMPERE)
+        return self._value_as_ampere >= other._value_as_ampere
 
     def __hash__(self) -> int:
         """Return the hash of the current."""
-        return hash(self.as_unit(Unit.AMPERE))
+        return hash(self._value_as_ampere)
 
     def __str__(self) -> str:
         """Return a string representation of the current."""
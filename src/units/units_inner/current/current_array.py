@@ -0,0 +1,203 @@
+"""Module for the current array class."""
+
+# ruff: noqa: TID252
+
+from array import array
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    create_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .current import Current
+from .unit import Unit, get_name, get_unit_delta_per_ampere
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class CurrentArray:
+    """A homogeneous array of currents.
+
+    The currents are stored in bulk as amperes, and share a single unit that they are
+    expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_ampere")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of currents, with all values in the unit."""
+        internal_unit_delta_per_ampere = get_unit_delta_per_ampere(unit)
+        self._unit = unit
+        self._values_as_ampere: array[float] | memoryview = create_values(
+            values, 1 / internal_unit_delta_per_ampere
+        )
+
+    @classmethod
+    def _from_values_as_ampere(
+        cls, values_as_ampere: "array[float] | memoryview", unit: Unit
+    ) -> "CurrentArray":
+        """Create an array of currents directly from a buffer of amperes.
+
+        The buffer is used as-is, rather than copied.
+        """
+        currents: CurrentArray = cls.__new__(cls)
+        currents._unit = unit
+        currents._values_as_ampere = values_as_ampere
+        return currents
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the currents, expressed as the unit."""
+        external_unit_delta_per_ampere = get_unit_delta_per_ampere(unit)
+        return create_values(self._values_as_ampere, external_unit_delta_per_ampere)
+
+    def __len__(self) -> int:
+        """Return the number of currents."""
+        return len(self._values_as_ampere)
+
+    @overload
+    def __getitem__(self, index: int) -> Current: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "CurrentArray": ...
+
+    def __getitem__(self, index: "int | slice") -> "Current | CurrentArray":
+        """Return the current at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return CurrentArray._from_values_as_ampere(
+                memoryview(self._values_as_ampere)[index], self._unit
+            )
+
+        internal_unit_delta_per_ampere = get_unit_delta_per_ampere(self._unit)
+        return Current(
+            self._values_as_ampere[index] * internal_unit_delta_per_ampere, self._unit
+        )
+
+    def __iter__(self) -> "Iterator[Current]":
+        """Return an iterator over the currents."""
+        internal_unit_delta_per_ampere = get_unit_delta_per_ampere(self._unit)
+        for value_as_ampere in self._values_as_ampere:
+            yield Current(value_as_ampere * internal_unit_delta_per_ampere, self._unit)
+
+    def __mul__(self, value: float) -> "CurrentArray":
+        """Return the currents scaled by the value."""
+        return CurrentArray._from_values_as_ampere(
+            create_values(self._values_as_ampere, value), self._unit
+        )
+
+    def __rmul__(self, value: float) -> "CurrentArray":
+        """Return the currents scaled by the value."""
+        return self * value
+
+    def __truediv__(self, value: float) -> "CurrentArray":
+        """Return the currents scaled by the inverse of the value."""
+        return self * (1 / value)
+
+    def __add__(self, other: "Current | CurrentArray") -> "CurrentArray":
+        """Return the sum of the currents and the other current(s).
+
+        A single current is added to every element, while an array of
+        currents is added elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, Current):
+            return CurrentArray._from_values_as_ampere(
+                add_values(self._values_as_ampere, other.as_unit(Unit.AMPERE)),
+                self._unit,
+            )
+
+        if isinstance(other, CurrentArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return CurrentArray._from_values_as_ampere(
+                add_values(self._values_as_ampere, other._values_as_ampere),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __radd__(self, other: Current) -> "CurrentArray":
+        """Return the sum of the currents and the other current."""
+        return self + other
+
+    def __sub__(self, other: "Current | CurrentArray") -> "CurrentArray":
+        """Return the difference of the currents and the other current(s).
+
+        A single current is subtracted from every element, while an array of
+        currents is subtracted elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, Current):
+            return CurrentArray._from_values_as_ampere(
+                subtract_values(self._values_as_ampere, other.as_unit(Unit.AMPERE)),
+                self._unit,
+            )
+
+        if isinstance(other, CurrentArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return CurrentArray._from_values_as_ampere(
+                subtract_values(self._values_as_ampere, other._values_as_ampere),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __neg__(self) -> "CurrentArray":
+        """Return the inverse of the currents."""
+        return self * -1
+
+    def __abs__(self) -> "CurrentArray":
+        """Return the absolute of the currents."""
+        return CurrentArray._from_values_as_ampere(
+            array("d", (abs(value) for value in self._values_as_ampere)), self._unit
+        )
+
+    def __lt__(self, other: "Current | CurrentArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the currents less than the other current(s)."""
+        other_values_as_ampere = (
+            other.as_unit(Unit.AMPERE)
+            if isinstance(other, Current)
+            else other._values_as_ampere
+        )
+        return less_than(self._values_as_ampere, other_values_as_ampere)
+
+    def __le__(self, other: "Current | CurrentArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the currents less than or equal to the other(s)."""
+        other_values_as_ampere = (
+            other.as_unit(Unit.AMPERE)
+            if isinstance(other, Current)
+            else other._values_as_ampere
+        )
+        return less_than_or_equal_to(self._values_as_ampere, other_values_as_ampere)
+
+    def __gt__(self, other: "Current | CurrentArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the currents greater than the other current(s)."""
+        other_values_as_ampere = (
+            other.as_unit(Unit.AMPERE)
+            if isinstance(other, Current)
+            else other._values_as_ampere
+        )
+        return greater_than(self._values_as_ampere, other_values_as_ampere)
+
+    def __ge__(self, other: "Current | CurrentArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the currents greater than or equal to the other(s)."""
+        other_values_as_ampere = (
+            other.as_unit(Unit.AMPERE)
+            if isinstance(other, Current)
+            else other._values_as_ampere
+        )
+        return greater_than_or_equal_to(self._values_as_ampere, other_values_as_ampere)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the currents."""
+        values = list(self.as_unit(self._unit))
+        return f"CurrentArray({values}, {get_name(self._unit)})"
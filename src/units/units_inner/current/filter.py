@@ -0,0 +1,48 @@
+"""Module for the current filter class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from .current import Current
+from .unit import Unit, get_unit_delta_per_ampere
+
+if TYPE_CHECKING:
+    from ..filters import Filter
+
+
+class CurrentFilter:
+    """A streaming filter over currents, such as a moving average or median.
+
+    Each current is passed to the filter in amperes, and each result is returned
+    as a current in the unit of the filter, so that a stream of readings is smoothed
+    without unwrapping & rewrapping them by hand.
+    """
+
+    __slots__ = ("_filter", "_unit", "_unit_delta_per_ampere")
+
+    def __init__(self, filter_: "Filter", unit: Unit) -> None:
+        """Initialise a new current filter, returning results in the unit."""
+        self._filter = filter_
+        self._unit = unit
+        self._unit_delta_per_ampere = get_unit_delta_per_ampere(unit)
+
+    def update(self, current: Current) -> Current:
+        """Add the current to the filter & return the filtered current."""
+        return self._create(self._filter.update(current._value_as_ampere))
+
+    def update_value(self, value: float) -> Current:
+        """Add a raw value in the unit of the filter & return the filtered current."""
+        return self._create(self._filter.update(value / self._unit_delta_per_ampere))
+
+    def _create(self, value_as_ampere: float) -> Current:
+        """Create a current in the unit of the filter from its value in amperes."""
+        return Current._create(
+            value_as_ampere * self._unit_delta_per_ampere, self._unit, value_as_ampere
+        )
+
+    def reset(self) -> None:
+        """Forget every current added to the filter."""
+        self._filter.reset()
@@ -0,0 +1,152 @@
+"""Module for the fixed-point current class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+from typing import overload
+
+from ..fixed_point import check_count, from_count, to_count
+from .current import Current
+from .unit import FIXED_POINT_RESOLUTION_PER_AMPERE, Unit, get_fixed_point_ratio
+
+
+class FixedPointCurrent:
+    """A current, in fixed-point.
+
+    The current is held as an integer number of microamperes. Intended for ports without
+    hardware floating point, or where floats are allocated on the heap. Only creating
+    the current & expressing it in a unit involve a conversion, which is done with an
+    integer ratio; arithmetic & comparisons stay in ints.
+
+    The count is kept within the range of a small int on 32-bit ports (see
+    `MAXIMUM_COUNT`), so up to about 1073 amperes can be held, and creating a
+    current or doing arithmetic beyond it raises `OverflowError`.
+    """
+
+    __slots__ = ("_value_as_microampere",)
+
+    def __init__(self, value: int, unit: Unit) -> None:
+        """Initialise a new fixed-point current from an integer value.
+
+        The value is in the unit, and is rounded to the nearest microampere.
+
+        Raises:
+            OverflowError: The value is too large to be held as a count of microamperes.
+        """
+        numerator, denominator = get_fixed_point_ratio(unit)
+        self._value_as_microampere = to_count(value, numerator, denominator)
+
+    @classmethod
+    def _from_value_as_microampere(
+        cls, value_as_microampere: int
+    ) -> "FixedPointCurrent":
+        """Create a fixed-point current from a number of microamperes.
+
+        Raises:
+            OverflowError: The number of microamperes was out of range.
+        """
+        current: FixedPointCurrent = cls.__new__(cls)
+        current._value_as_microampere = check_count(value_as_microampere)
+        return current
+
+    def as_unit(self, unit: Unit) -> int:
+        """Return the current in the unit, rounded to the nearest integer."""
+        numerator, denominator = get_fixed_point_ratio(unit)
+        return from_count(self._value_as_microampere, numerator, denominator)
+
+    def to_current(self) -> Current:
+        """Return the current as a floating-point :py:class:`Current`."""
+        return Current(
+            self._value_as_microampere / FIXED_POINT_RESOLUTION_PER_AMPERE, Unit.AMPERE
+        )
+
+    def __mul__(self, value: int) -> "FixedPointCurrent":
+        """Return the current scaled by the integer."""
+        return FixedPointCurrent._from_value_as_microampere(
+            self._value_as_microampere * value
+        )
+
+    def __rmul__(self, value: int) -> "FixedPointCurrent":
+        """Return the current scaled by the integer."""
+        return self * value
+
+    @overload
+    def __floordiv__(self, other: int) -> "FixedPointCurrent": ...
+
+    @overload
+    def __floordiv__(self, other: "FixedPointCurrent") -> int: ...
+
+    def __floordiv__(
+        self, other: "int | FixedPointCurrent"
+    ) -> "FixedPointCurrent | int":
+        """Return a floored scaled current or the floored ratio between them.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is an :py:class:`int`, return the current scaled by the
+          inverse of the value, floored to the nearest microampere.
+        - If the argument is a :py:class:`FixedPointCurrent`, return the floored ratio
+          between the two.
+        """
+        if isinstance(other, FixedPointCurrent):
+            return self._value_as_microampere // other._value_as_microampere
+
+        return FixedPointCurrent._from_value_as_microampere(
+            self._value_as_microampere // other
+        )
+
+    def __add__(self, other: "FixedPointCurrent") -> "FixedPointCurrent":
+        """Return the sum of the currents."""
+        return FixedPointCurrent._from_value_as_microampere(
+            self._value_as_microampere + other._value_as_microampere
+        )
+
+    def __sub__(self, other: "FixedPointCurrent") -> "FixedPointCurrent":
+        """Return the difference between the currents."""
+        return FixedPointCurrent._from_value_as_microampere(
+            self._value_as_microampere - other._value_as_microampere
+        )
+
+    def __neg__(self) -> "FixedPointCurrent":
+        """Return the inverse of the current."""
+        return FixedPointCurrent._from_value_as_microampere(-self._value_as_microampere)
+
+    def __abs__(self) -> "FixedPointCurrent":
+        """Return the absolute version of the current."""
+        return FixedPointCurrent._from_value_as_microampere(
+            abs(self._value_as_microampere)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the objects are equal fixed-point currents."""
+        if not isinstance(other, FixedPointCurrent):
+            return NotImplemented
+
+        return self._value_as_microampere == other._value_as_microampere
+
+    def __lt__(self, other: "FixedPointCurrent") -> bool:
+        """Return whether the current is less than the other."""
+        return self._value_as_microampere < other._value_as_microampere
+
+    def __le__(self, other: "FixedPointCurrent") -> bool:
+        """Return whether the current is less than or equal to the other."""
+        return self._value_as_microampere <= other._value_as_microampere
+
+    def __gt__(self, other: "FixedPointCurrent") -> bool:
+        """Return whether the current is greater than the other."""
+        return self._value_as_microampere > other._value_as_microampere
+
+    def __ge__(self, other: "FixedPointCurrent") -> bool:
+        """Return whether the current is greater than or equal to the other."""
+        return self._value_as_microampere >= other._value_as_microampere
+
+    def __hash__(self) -> int:
+        """Return the hash of the current."""
+        return hash(self._value_as_microampere)
+
+    def __str__(self) -> str:
+        """Return a string representation of the current."""
+        return f"{self._value_as_microampere} uA"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the current for developers."""
+        return f"{__class__.__name__}({self._value_as_microampere} uA)"
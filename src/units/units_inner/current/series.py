@@ -0,0 +1,126 @@
+"""Module for the current series class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from ..ring_buffer import RingBuffer
+from .current import Current
+from .current_array import CurrentArray
+from .unit import Unit, get_name, get_unit_delta_per_ampere
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ..time import Time
+
+
+class CurrentSeries(RingBuffer):
+    """A rolling window of the most recent currents, with optional timestamps.
+
+    The currents are stored as amperes in a buffer preallocated on initialisation,
+    so that pushing a current drops the oldest one once the series is full,
+    rather than allocating. The currents are indexed from the oldest (0) to the
+    latest (-1), and are expressed in the unit of the series when retrieved.
+    """
+
+    __slots__ = ("_unit", "_unit_delta_per_ampere")
+
+    def __init__(self, capacity: int, unit: Unit, *, timestamped: bool = False) -> None:
+        """Initialise a new, empty series, holding up to the number of currents.
+
+        If the series is timestamped, every current is pushed along with the time it
+        was measured at.
+
+        Raises:
+            ValueError: The capacity is less than 1.
+        """
+        super().__init__(capacity, timestamped=timestamped)
+        self._unit = unit
+        self._unit_delta_per_ampere = get_unit_delta_per_ampere(unit)
+
+    def push(self, current: Current, time: "Time | None" = None) -> None:
+        """Push a current, dropping the oldest one if the series is full.
+
+        Does not allocate.
+
+        Raises:
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        end = self._end
+        if end == self._limit:
+            end = self._compact()
+        times = self._times
+        if times is not None and time is not None:
+            times[end] = time._value_as_second
+        elif times is not None or time is not None:
+            self._raise_time_error()
+        self._values[end] = current._value_as_ampere
+        self._end = end + 1
+
+    def push_value(self, value: float, time: "Time | None" = None) -> None:
+        """Push a raw value in the unit of the series, as a current.
+
+        Raises:
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        self._push(value / self._unit_delta_per_ampere, time)
+
+    def _create(self, value_as_ampere: float) -> Current:
+        """Create a current in the unit of the series from its value in amperes."""
+        return Current._create(
+            value_as_ampere * self._unit_delta_per_ampere, self._unit, value_as_ampere
+        )
+
+    def latest(self) -> Current:
+        """Return the most recently pushed current.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(-1))
+
+    def oldest(self) -> Current:
+        """Return the least recently pushed current still in the series.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(0))
+
+    def window(self, count: "int | None" = None) -> CurrentArray:
+        """Return the latest currents, from oldest to latest.
+
+        All of the currents are returned if the count is None, and at most as many
+        currents as the series holds otherwise. The window is a view of the series
+        rather than a copy, so it is only valid until the next push or clear.
+        """
+        return CurrentArray._from_values_as_ampere(self._view_values(count), self._unit)
+
+    def __getitem__(self, index: int) -> Current:
+        """Return the current at the index.
+
+        Raises:
+            IndexError: There is no current at the index.
+        """
+        return self._create(self._get_value(index))
+
+    def __iter__(self) -> "Iterator[Current]":
+        """Return an iterator over the currents, from oldest to latest.
+
+        Each current is only created when it is reached.
+        """
+        for value_as_ampere in self._iter_values():
+            yield self._create(value_as_ampere)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the current series."""
+        values = [value * self._unit_delta_per_ampere for value in self._iter_values()]
+        return (
+            f"CurrentSeries({values}, {get_name(self._unit)},"
+            f" capacity={self._capacity})"
+        )
@@ -0,0 +1,72 @@
+"""Module for the cache of the conversion factors of composite units.
+
+The conversion factor of a composite unit (such as mm/min/s) is a chain of lookups,
+multiplications & divisions. Only a few combinations of units tend to be used by a
+program, so the factors are cached, up to a small bound that suits the limited
+memory of a micropython board.
+"""
+
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    _Factors = dict[tuple[Any, ...], float]
+else:
+    # Micropython does not support subscripting the builtin types
+    _Factors = dict
+
+DEFAULT_MAX_SIZE: Final = 16
+
+
+class FactorCache(_Factors):
+    """A bounded cache of conversion factors, keyed by a tuple of units.
+
+    The cache is a dict, so that a cached factor costs a single subscript of the
+    builtin type, rather than a call of a method written in python. A factor is read
+    with::
+
+        try:
+            factor = cache[units]
+        except KeyError:
+            factor = cache.calculate(units)
+
+    Once the cache is full, an arbitrary factor is evicted to make room for a new
+    one, rather than the least recently used, as tracking the use of each factor
+    would cost more on every lookup than the occasional recalculation it saves. Only
+    a factor that was calculated without raising is cached, so invalid units are
+    rejected on every lookup.
+
+    Not intended for public use.
+    """
+
+    __slots__ = ("_calculate", "_max_size")
+
+    def __init__(
+        self,
+        calculate: "Callable[[tuple[Any, ...]], float]",
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        """Initialise a new cache, for factors calculated from units by the function.
+
+        Raises:
+            ValueError: The maximum size is less than 1.
+        """
+        if max_size < 1:
+            raise ValueError
+
+        super().__init__()
+        self._calculate = calculate
+        self._max_size = max_size
+
+    def calculate(self, units: "tuple[Any, ...]") -> float:
+        """Calculate & cache the factor of the units, which are not yet cached.
+
+        Raises:
+            ValueError: The factor of the units could not be calculated.
+        """
+        factor = self._calculate(units)
+        if len(self) >= self._max_size:
+            del self[next(iter(self))]
+        self[units] = factor
+        return factor
@@ -0,0 +1,262 @@
+"""Module for the streaming filters that smooth a stream of samples.
+
+Each filter is preallocated on initialisation & updated one sample at a time, so
+that smoothing a stream of sensor readings costs a fixed amount of memory. The
+filters work on plain floats, so can be used directly on raw values, or wrapped by
+a quantity filter (such as `PressureFilter`), which passes them the value of each
+quantity in its SI unit & wraps each result back up as a quantity.
+
+Every filter is linear or order-preserving, so its result is the same whichever
+unit (or offset, for temperatures) the samples are given in.
+"""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001
+
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .time import TimeDelta
+
+
+def _validate_window(window: int) -> None:
+    """Raise an error if the window size is less than 1."""
+    if window < 1:
+        msg = f"Window size less than 1 [{window}]."
+        raise ValueError(msg)
+
+
+class MovingAverage:
+    """A simple moving average of the most recent samples.
+
+    Each update costs O(1): the running sum is adjusted by the newest & oldest
+    samples, and recalculated from scratch once per lap of the window, so that
+    rounding errors cannot build up. Until the window fills, the average is of the
+    samples so far.
+    """
+
+    __slots__ = ("_index", "_length", "_sum", "_values", "_window")
+
+    def __init__(self, window: int) -> None:
+        """Initialise a new moving average, over the number of samples.
+
+        Raises:
+            ValueError: The window size is less than 1.
+        """
+        _validate_window(window)
+        self._window = window
+        self._values = array("d", [0] * window)
+        self._index = 0
+        self._length = 0
+        self._sum = 0.0
+
+    @property
+    def window(self) -> int:
+        """The number of samples averaged over."""
+        return self._window
+
+    def update(self, value: float) -> float:
+        """Add the sample & return the average of the window."""
+        index = self._index
+        values = self._values
+        self._sum += value - values[index]
+        values[index] = value
+        index += 1
+        if index == self._window:
+            index = 0
+            self._sum = sum(values)
+        self._index = index
+        if self._length < self._window:
+            self._length += 1
+        return self._sum / self._length
+
+    def reset(self) -> None:
+        """Forget every sample."""
+        values = self._values
+        for index in range(self._window):
+            values[index] = 0
+        self._index = 0
+        self._length = 0
+        self._sum = 0.0
+
+
+class ExponentialMovingAverage:
+    """An exponential moving average of the samples.
+
+    Each update moves the average the smoothing factor of the way towards the
+    sample, so the larger the factor, the less the samples are smoothed. The first
+    sample is taken as the initial average.
+    """
+
+    __slots__ = ("_average", "_is_empty", "_smoothing_factor")
+
+    def __init__(self, smoothing_factor: float) -> None:
+        """Initialise a new exponential moving average, with the smoothing factor.
+
+        Raises:
+            ValueError: The smoothing factor is not greater than 0 and at most 1.
+        """
+        if not 0 < smoothing_factor <= 1:
+            msg = f"Smoothing factor not in range (0, 1] [{smoothing_factor}]."
+            raise ValueError(msg)
+
+        self._smoothing_factor = smoothing_factor
+        self._average = 0.0
+        self._is_empty = True
+
+    @classmethod
+    def from_span(cls, span: int) -> "ExponentialMovingAverage":
+        """Create an exponential moving average that lags like a moving average.
+
+        The smoothing factor is 2/(span+1), which gives the samples the same centre
+        of mass as a simple moving average over the span.
+
+        Raises:
+            ValueError: The span is less than 1.
+        """
+        _validate_window(span)
+        return cls(2 / (span + 1))
+
+    @property
+    def smoothing_factor(self) -> float:
+        """The fraction of the way the average moves towards each sample."""
+        return self._smoothing_factor
+
+    def update(self, value: float) -> float:
+        """Add the sample & return the average."""
+        if self._is_empty:
+            self._is_empty = False
+            self._average = value
+        else:
+            self._average += self._smoothing_factor * (value - self._average)
+        return self._average
+
+    def reset(self) -> None:
+        """Forget every sample."""
+        self._average = 0.0
+        self._is_empty = True
+
+
+class LowPass(ExponentialMovingAverage):
+    """A first-order low-pass filter, for samples taken at a fixed period.
+
+    A discretised RC filter, which is an exponential moving average with the
+    smoothing factor set by the cutoff frequency (given by its time constant) & the
+    sample period.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, time_constant: "TimeDelta", sample_period: "TimeDelta") -> None:
+        """Initialise a new low-pass filter.
+
+        The time constant is 1/(2*pi*f) for a cutoff frequency of f.
+
+        Raises:
+            ValueError: The time constant is negative, or the sample period is not
+                positive.
+        """
+        time_constant_as_second = time_constant._value_as_second
+        sample_period_as_second = sample_period._value_as_second
+        if time_constant_as_second < 0:
+            msg = f"Negative time constant [{time_constant}]."
+            raise ValueError(msg)
+        if sample_period_as_second <= 0:
+            msg = f"Sample period not positive [{sample_period}]."
+            raise ValueError(msg)
+
+        super().__init__(
+            sample_period_as_second
+            / (time_constant_as_second + sample_period_as_second)
+        )
+
+
+class MovingMedian:
+    """A running median of the most recent samples.
+
+    The window is kept sorted alongside the samples in the order they arrived.
+    Each update finds the oldest sample & the place for the newest one by binary
+    search, O(log N), then shifts only the samples between the two places, in
+    place. The shift is O(N) at worst, when the newest sample lands at the other
+    end of the window from the oldest, but is short when readings change slowly.
+    Until the window fills, the median is of the samples so far. The median of an
+    even number of samples is the mean of the middle two.
+    """
+
+    __slots__ = ("_index", "_length", "_sorted", "_values", "_window")
+
+    def __init__(self, window: int) -> None:
+        """Initialise a new running median, over the number of samples.
+
+        Raises:
+            ValueError: The window size is less than 1.
+        """
+        _validate_window(window)
+        self._window = window
+        self._values = array("d", [0] * window)
+        self._sorted = array("d", [0] * window)
+        self._index = 0
+        self._length = 0
+
+    @property
+    def window(self) -> int:
+        """The number of samples the median is taken over."""
+        return self._window
+
+    def _find(self, value: float, length: int) -> int:
+        """Return the leftmost place in the sorted samples to insert the value."""
+        sorted_values = self._sorted
+        low = 0
+        high = length
+        while low < high:
+            middle = (low + high) >> 1
+            if sorted_values[middle] < value:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def update(self, value: float) -> float:
+        """Add the sample & return the median of the window."""
+        sorted_values = self._sorted
+        length = self._length
+        if length < self._window:
+            # Take the empty place at the end, as if it held the removed sample
+            insert_position = self._find(value, length)
+            position = length
+            length += 1
+            self._length = length
+        else:
+            position = self._find(self._values[self._index], length)
+            insert_position = self._find(value, length)
+
+        if insert_position > position:
+            # The removed sample leaves a gap to the left, so insert to its left
+            insert_position -= 1
+            for index in range(position, insert_position):
+                sorted_values[index] = sorted_values[index + 1]
+        else:
+            for index in range(position, insert_position, -1):
+                sorted_values[index] = sorted_values[index - 1]
+        sorted_values[insert_position] = value
+
+        index = self._index
+        self._values[index] = value
+        index += 1
+        self._index = 0 if index == self._window else index
+
+        middle = length >> 1
+        if length & 1:
+            return sorted_values[middle]
+        return (sorted_values[middle - 1] + sorted_values[middle]) / 2
+
+    def reset(self) -> None:
+        """Forget every sample."""
+        self._index = 0
+        self._length = 0
+
+
+if TYPE_CHECKING:
+    Filter = MovingAverage | ExponentialMovingAverage | MovingMedian
@@ -0,0 +1,100 @@
+"""Module for the integer ratios used by the fixed-point quantity classes.
+
+Fixed-point quantities hold an integer count of a small sub-unit (such as
+micrometres for a length), so that their arithmetic & comparisons stay in ints.
+Conversions to & from the units are done with an integer ratio per unit, rather
+than a float factor.
+
+Micropython only holds ints of up to 30 bits (plus the sign) in a machine word on
+32-bit ports. Larger ints are allocated on the heap, or raise `OverflowError` on
+ports without long ints, so the count of a fixed-point quantity is kept within
+±`MAXIMUM_COUNT`, and the conversions are split up so that no intermediate value
+is much larger than the count.
+"""
+
+from typing import Final
+
+# The largest denominator tried when approximating a factor as an integer ratio
+_MAXIMUM_DENOMINATOR = 1_000_000
+
+# The relative error allowed when approximating a factor as an integer ratio
+_RELATIVE_TOLERANCE = 1e-7
+
+# The largest magnitude of the count of a fixed-point quantity, being the largest
+# small int on 32-bit ports of micropython
+MAXIMUM_COUNT: Final = 0x3FFF_FFFF
+
+
+def get_ratio(value: float) -> tuple[int, int]:
+    """Get an integer numerator & power-of-ten denominator approximating the value.
+
+    The smallest denominator that approximates the value to within the tolerance
+    is used, so that the numerator stays as small as possible.
+
+    Not intended for public use.
+    """
+    denominator = 1
+    while denominator < _MAXIMUM_DENOMINATOR:
+        scaled_value = value * denominator
+        if abs(round(scaled_value) - scaled_value) <= _RELATIVE_TOLERANCE * abs(
+            scaled_value
+        ):
+            break
+        denominator *= 10
+    return round(value * denominator), denominator
+
+
+def check_count(count: int) -> int:
+    """Return the count of a fixed-point quantity, if it is within range.
+
+    Not intended for public use.
+
+    Raises:
+        OverflowError: The magnitude of the count is greater than `MAXIMUM_COUNT`.
+    """
+    if not -MAXIMUM_COUNT <= count <= MAXIMUM_COUNT:
+        msg = f"Fixed-point count out of range [{count}]."
+        raise OverflowError(msg)
+
+    return count
+
+
+def to_count(value: int, numerator: int, denominator: int) -> int:
+    """Return the value times the ratio, rounded to the nearest integer (halves up).
+
+    The value is split into whole multiples of the denominator & the part left
+    over, so that the only intermediate larger than the count is the part times
+    the remainder of the ratio, which is less than the square of the denominator.
+
+    Not intended for public use.
+
+    Raises:
+        OverflowError: The magnitude of the count is greater than `MAXIMUM_COUNT`.
+    """
+    if denominator == 1:
+        return check_count(value * numerator)
+
+    quotient, remainder = divmod(numerator, denominator)
+    whole, part = divmod(value, denominator)
+    return check_count(
+        value * quotient
+        + whole * remainder
+        + (2 * part * remainder + denominator) // (2 * denominator)
+    )
+
+
+def from_count(count: int, numerator: int, denominator: int) -> int:
+    """Return the count over the ratio, rounded to the nearest integer (halves up).
+
+    The denominator is a power of ten, so the count is divided by long division,
+    one decimal digit at a time, so that no intermediate is larger than ten times
+    the numerator, or the result.
+
+    Not intended for public use.
+    """
+    value, remainder = divmod(count, numerator)
+    while denominator > 1:
+        digit, remainder = divmod(remainder * 10, numerator)
+        value = value * 10 + digit
+        denominator //= 10
+    return value + 1 if remainder >= numerator - remainder else value
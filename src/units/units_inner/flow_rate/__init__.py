@@ -1,6 +1,25 @@
 """Package for flow-rate-related classes."""
 
+from .converter import (
+    convert_mass_flow_rate_into,
+    convert_volumetric_flow_rate_into,
+    make_mass_flow_rate_converter,
+    make_volumetric_flow_rate_converter,
+)
 from .mass_flow_rate import MassFlowRate
+from .mass_totalizer import MassTotalizer
+from .volume_totalizer import VolumeTotalizer
 from .volumetric_flow_rate import VolumetricFlowRate
+from .volumetric_flow_rate_estimator import VolumetricFlowRateEstimator
 
-__all__ = ["MassFlowRate", "VolumetricFlowRate"]
+__all__ = [
+    "MassFlowRate",
+    "MassTotalizer",
+    "VolumeTotalizer",
+    "VolumetricFlowRate",
+    "VolumetricFlowRateEstimator",
+    "convert_mass_flow_rate_into",
+    "convert_volumetric_flow_rate_into",
+    "make_mass_flow_rate_converter",
+    "make_volumetric_flow_rate_converter",
+]
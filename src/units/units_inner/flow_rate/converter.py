@@ -0,0 +1,199 @@
+"""Module for the flow-rate unit converters."""
+
+# ruff: noqa: TID252
+
+from typing import TYPE_CHECKING, Final
+
+from ..buffer import convert_values_into
+from ..factor_cache import FactorCache
+from ..mass import Unit as MassUnit
+from ..mass import get_unit_delta_per_kilogram as get_mass_unit_delta_per_kilogram
+from ..time import Unit as TimeUnit
+from ..time import get_unit_delta_per_second as get_time_unit_delta_per_second
+from ..volume import Unit as VolumeUnit
+from ..volume import (
+    get_unit_delta_per_cubic_metre as get_volume_unit_delta_per_cubic_metre,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, MutableSequence, Sequence
+
+
+def _get_volumetric_flow_rate_unit_delta_per_si_unit(
+    units: "tuple[VolumeUnit, TimeUnit]",
+) -> float:
+    """Get the change in value expressed as the units per 1 of the SI units.
+
+    Not intended for public use.
+    """
+    volume_unit, time_unit = units
+    return get_volume_unit_delta_per_cubic_metre(
+        volume_unit
+    ) / get_time_unit_delta_per_second(time_unit)
+
+
+def _get_mass_flow_rate_unit_delta_per_si_unit(
+    units: "tuple[MassUnit, TimeUnit]",
+) -> float:
+    """Get the change in value expressed as the units per 1 of the SI units.
+
+    Not intended for public use.
+    """
+    mass_unit, time_unit = units
+    return get_mass_unit_delta_per_kilogram(mass_unit) / get_time_unit_delta_per_second(
+        time_unit
+    )
+
+
+# The change in value expressed as the units per 1 of the SI units, for each of the
+# combinations of units in use. Not intended for public use.
+VOLUMETRIC_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT: Final = FactorCache(
+    _get_volumetric_flow_rate_unit_delta_per_si_unit
+)
+MASS_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT: Final = FactorCache(
+    _get_mass_flow_rate_unit_delta_per_si_unit
+)
+
+
+def _make_multiplier(factor: float) -> "Callable[[float], float]":
+    """Make a function that multiplies a value by the factor.
+
+    Not intended for public use.
+    """
+
+    def convert(value: float) -> float:
+        return value * factor
+
+    return convert
+
+
+def _get_volumetric_flow_rate_conversion_factor(
+    from_unit: "tuple[VolumeUnit, TimeUnit]",
+    to_unit: "tuple[VolumeUnit, TimeUnit]",
+) -> float:
+    """Get the factor that converts a volumetric flow rate from one unit to another.
+
+    Not intended for public use.
+
+    Raises:
+        ValueError: Either of the units are not valid volumetric flow rate units.
+    """
+    from_volume_unit, from_time_unit = from_unit
+    to_volume_unit, to_time_unit = to_unit
+    volume_factor = get_volume_unit_delta_per_cubic_metre(
+        to_volume_unit
+    ) / get_volume_unit_delta_per_cubic_metre(from_volume_unit)
+    time_factor = get_time_unit_delta_per_second(
+        to_time_unit
+    ) / get_time_unit_delta_per_second(from_time_unit)
+    return volume_factor / time_factor
+
+
+def make_volumetric_flow_rate_converter(
+    from_unit: "tuple[VolumeUnit, TimeUnit]",
+    to_unit: "tuple[VolumeUnit, TimeUnit]",
+) -> "Callable[[float], float]":
+    """Make a function that converts a volumetric flow rate from one unit to another.
+
+    The units are given as a tuple of a volume unit followed by a time unit, in the
+    same order as the :py:class:`VolumetricFlowRate` initialiser takes them.
+
+    The conversion factor is calculated once, up front, so converting a value is a
+    single multiplication & no intermediate objects are created.
+
+    Raises:
+        ValueError: Either of the units are not valid volumetric flow rate units.
+    """
+    return _make_multiplier(
+        _get_volumetric_flow_rate_conversion_factor(from_unit, to_unit)
+    )
+
+
+def _get_mass_flow_rate_conversion_factor(
+    from_unit: "tuple[MassUnit, TimeUnit]",
+    to_unit: "tuple[MassUnit, TimeUnit]",
+) -> float:
+    """Get the factor that converts a mass flow rate from one unit to another.
+
+    Not intended for public use.
+
+    Raises:
+        ValueError: Either of the units are not valid mass flow rate units.
+    """
+    from_mass_unit, from_time_unit = from_unit
+    to_mass_unit, to_time_unit = to_unit
+    mass_factor = get_mass_unit_delta_per_kilogram(
+        to_mass_unit
+    ) / get_mass_unit_delta_per_kilogram(from_mass_unit)
+    time_factor = get_time_unit_delta_per_second(
+        to_time_unit
+    ) / get_time_unit_delta_per_second(from_time_unit)
+    return mass_factor / time_factor
+
+
+def make_mass_flow_rate_converter(
+    from_unit: "tuple[MassUnit, TimeUnit]",
+    to_unit: "tuple[MassUnit, TimeUnit]",
+) -> "Callable[[float], float]":
+    """Make a function that converts a mass flow rate from one unit to another.
+
+    The units are given as a tuple of a mass unit followed by a time unit, in the
+    same order as the :py:class:`MassFlowRate` initialiser takes them.
+
+    The conversion factor is calculated once, up front, so converting a value is a
+    single multiplication & no intermediate objects are created.
+
+    Raises:
+        ValueError: Either of the units are not valid mass flow rate units.
+    """
+    return _make_multiplier(_get_mass_flow_rate_conversion_factor(from_unit, to_unit))
+
+
+def convert_volumetric_flow_rate_into(
+    src: "Sequence[float]",
+    dst: "MutableSequence[float] | memoryview[float]",
+    from_unit: "tuple[VolumeUnit, TimeUnit]",
+    to_unit: "tuple[VolumeUnit, TimeUnit]",
+) -> None:
+    """Convert a buffer of volumetric flow rates from one unit to another, into dst.
+
+    The units are given in the same way as for
+    :py:func:`make_volumetric_flow_rate_converter`.
+
+    The values are written to the start of the destination buffer, which can be any
+    buffer of floats (such as an `array('f')`, or a memoryview cast onto a
+    bytearray). The source & destination may be the same buffer, in which case the
+    values are converted in place. No intermediate objects are created.
+
+    Raises:
+        ValueError: Either of the units are not valid volumetric flow rate units, or the
+            destination is shorter than the source.
+    """
+    convert_values_into(
+        src, dst, _get_volumetric_flow_rate_conversion_factor(from_unit, to_unit)
+    )
+
+
+def convert_mass_flow_rate_into(
+    src: "Sequence[float]",
+    dst: "MutableSequence[float] | memoryview[float]",
+    from_unit: "tuple[MassUnit, TimeUnit]",
+    to_unit: "tuple[MassUnit, TimeUnit]",
+) -> None:
+    """Convert a buffer of mass flow rates from one unit to another, into dst.
+
+    The units are given in the same way as for
+    :py:func:`make_mass_flow_rate_converter`.
+
+    The values are written to the start of the destination buffer, which can be any
+    buffer of floats (such as an `array('f')`, or a memoryview cast onto a
+    bytearray). The source & destination may be the same buffer, in which case the
+    values are converted in place. No intermediate objects are created.
+
+    Raises:
+        ValueError: Either of the units are not valid mass flow rate units, or the
+            destination is shorter than the source.
+    """
+    convert_values_into(
+        src, dst, _get_mass_flow_rate_conversion_factor(from_unit, to_unit)
+    )
@@ -1,63 +1,120 @@
 """Module for the mass flow rate class."""
 
+# pyright: reportPrivateUsage=false
 # ruff: noqa: TID252
 
 from typing import overload
 
+from ..mass import MassDelta
 from ..mass import Unit as MassUnit
 from ..mass import get_unit_abbreviation as get_mass_unit_abbreviation
-from ..mass import (
-    get_unit_delta_per_kilogram as get_mass_unit_delta_per_kilogram,
-)
 from ..mass import get_unit_name as get_mass_unit_name
+from ..time import TimeDelta
 from ..time import Unit as TimeUnit
 from ..time import get_unit_abbreviation as get_time_unit_abbreviation
-from ..time import get_unit_delta_per_second as get_time_unit_delta_per_second
 from ..time import get_unit_name as get_time_unit_name
+from .converter import MASS_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT
 
 
 class MassFlowRate:
     """The mass of a gas or liquid that flows in a certain amount of time."""
 
+    __slots__ = ("_mass_unit", "_time_unit", "_value", "_value_as_kilogram_per_second")
+
     def __init__(self, value: float, mass_unit: MassUnit, time_unit: TimeUnit) -> None:
         """Initialise a new flow rate."""
         self._value = value
         self._mass_unit = mass_unit
         self._time_unit = time_unit
+        units = (self._mass_unit, self._time_unit)
+        try:
+            unit_delta_per_si_unit = MASS_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = MASS_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT.calculate(
+                units
+            )
+        self._value_as_kilogram_per_second = value / unit_delta_per_si_unit
+
+    @classmethod
+    def _create(
+        cls,
+        value: float,
+        mass_unit: MassUnit,
+        time_unit: TimeUnit,
+        value_as_kilogram_per_second: float,
+    ) -> "MassFlowRate":
+        """Create a mass flow rate from its value in both the units & SI units.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        mass_flow_rate: MassFlowRate = cls.__new__(cls)
+        mass_flow_rate._value = value
+        mass_flow_rate._mass_unit = mass_unit
+        mass_flow_rate._time_unit = time_unit
+        mass_flow_rate._value_as_kilogram_per_second = value_as_kilogram_per_second
+        return mass_flow_rate
 
     def as_unit(self, mass_unit: MassUnit, time_unit: TimeUnit) -> float:
         """Return the flow rate in the specified units."""
-        internal_mass_unit_delta_per_kilogram = get_mass_unit_delta_per_kilogram(
-            self._mass_unit
-        )
-        internal_time_unit_delta_per_second = get_time_unit_delta_per_second(
-            self._time_unit
-        )
-        internal_unit_to_kilogram_per_second_factor = (
-            internal_time_unit_delta_per_second / internal_mass_unit_delta_per_kilogram
-        )
-        value_as_kilogram_per_second = (
-            internal_unit_to_kilogram_per_second_factor * self._value
-        )
-        external_mass_unit_delta_per_kilogram = get_mass_unit_delta_per_kilogram(
-            mass_unit
-        )
-        external_time_unit_delta_per_second = get_time_unit_delta_per_second(time_unit)
-        kilogram_per_second_to_external_unit_factor = (
-            external_mass_unit_delta_per_kilogram / external_time_unit_delta_per_second
-        )
-        return (
-            kilogram_per_second_to_external_unit_factor * value_as_kilogram_per_second
+        units = (mass_unit, time_unit)
+        try:
+            unit_delta_per_si_unit = MASS_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = MASS_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT.calculate(
+                units
+            )
+        return self._value_as_kilogram_per_second * unit_delta_per_si_unit
+
+    @overload
+    def __mul__(self, other: float) -> "MassFlowRate": ...
+
+    @overload
+    def __mul__(self, other: TimeDelta) -> MassDelta: ...
+
+    def __mul__(self, other: "float | TimeDelta") -> "MassFlowRate | MassDelta":
+        """Return a scaled flow rate or a mass.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a :py:class:`float`, return a flow rate scaled by the value
+        - If the argument is a :py:class:`TimeDelta`, return the mass gained at the flow
+          rate over the time difference
+        """
+        if isinstance(other, TimeDelta):
+            value_as_kilogram = (
+                self._value_as_kilogram_per_second * other._value_as_second
+            )
+            if self._time_unit == other._unit:
+                return MassDelta._create(
+                    self._value * other._value, self._mass_unit, value_as_kilogram
+                )
+
+            return MassDelta._create(
+                value_as_kilogram, MassUnit.KILOGRAM, value_as_kilogram
+            )
+
+        scaled_value = self._value * other
+        return MassFlowRate._create(
+            scaled_value,
+            self._mass_unit,
+            self._time_unit,
+            self._value_as_kilogram_per_second * other,
         )
 
-    def __mul__(self, value: float) -> "MassFlowRate":
-        """Return a flow rate scaled by the value."""
-        scaled_value = self._value * value
-        return MassFlowRate(scaled_value, self._mass_unit, self._time_unit)
+    @overload
+    def __rmul__(self, other: float) -> "MassFlowRate": ...
 
-    def __rmul__(self, value: float) -> "MassFlowRate":
-        """Return a flow rate scaled by the value."""
-        return self * value
+    @overload
+    def __rmul__(self, other: TimeDelta) -> MassDelta: ...
+
+    def __rmul__(self, other: "float | TimeDelta") -> "MassFlowRate | MassDelta":
+        """Return a scaled flow rate or a mass.
+
+        The product is the same as with the operands the other way around.
+        """
+        return self * other
 
     @overload
     def __truediv__(self, other: float) -> "MassFlowRate": ...
@@ -76,42 +133,66 @@ class MassFlowRate:
           two flow rates
         """
         if isinstance(other, MassFlowRate):
-            value_as_kilogram_per_second = self.as_unit(
-                MassUnit.KILOGRAM, TimeUnit.SECOND
+            return (
+                self._value_as_kilogram_per_second / other._value_as_kilogram_per_second
             )
-            other_value_as_kilogram_per_second = other.as_unit(
-                MassUnit.KILOGRAM, TimeUnit.SECOND
-            )
-            return value_as_kilogram_per_second / other_value_as_kilogram_per_second
 
         return (1 / other) * self
 
     def __add__(self, other: "MassFlowRate") -> "MassFlowRate":
         """Return the sum of two flow rates."""
-        value_as_kilogram_per_second = self.as_unit(MassUnit.KILOGRAM, TimeUnit.SECOND)
-        other_value_as_kilogram_per_second = other.as_unit(
-            MassUnit.KILOGRAM, TimeUnit.SECOND
-        )
+        if self._mass_unit == other._mass_unit and self._time_unit == other._time_unit:
+            value_sum = self._value + other._value
+            units = (self._mass_unit, self._time_unit)
+            try:
+                unit_delta_per_si_unit = MASS_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT[units]
+            except KeyError:
+                unit_delta_per_si_unit = (
+                    MASS_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+                )
+            return MassFlowRate._create(
+                value_sum,
+                self._mass_unit,
+                self._time_unit,
+                value_sum / unit_delta_per_si_unit,
+            )
+
         value_sum_as_kilogram_per_second = (
-            value_as_kilogram_per_second + other_value_as_kilogram_per_second
+            self._value_as_kilogram_per_second + other._value_as_kilogram_per_second
         )
-        return MassFlowRate(
-            value_sum_as_kilogram_per_second, MassUnit.KILOGRAM, TimeUnit.SECOND
+        return MassFlowRate._create(
+            value_sum_as_kilogram_per_second,
+            MassUnit.KILOGRAM,
+            TimeUnit.SECOND,
+            value_sum_as_kilogram_per_second,
         )
 
     def __sub__(self, other: "MassFlowRate") -> "MassFlowRate":
         """Return the difference of two flow rates."""
-        value_as_kilogram_per_second = self.as_unit(MassUnit.KILOGRAM, TimeUnit.SECOND)
-        other_value_as_kilogram_per_second = other.as_unit(
-            MassUnit.KILOGRAM, TimeUnit.SECOND
-        )
+        if self._mass_unit == other._mass_unit and self._time_unit == other._time_unit:
+            value_difference = self._value - other._value
+            units = (self._mass_unit, self._time_unit)
+            try:
+                unit_delta_per_si_unit = MASS_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT[units]
+            except KeyError:
+                unit_delta_per_si_unit = (
+                    MASS_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+                )
+            return MassFlowRate._create(
+                value_difference,
+                self._mass_unit,
+                self._time_unit,
+                value_difference / unit_delta_per_si_unit,
+            )
+
         value_difference_as_kilogram_per_second = (
-            value_as_kilogram_per_second - other_value_as_kilogram_per_second
+            self._value_as_kilogram_per_second - other._value_as_kilogram_per_second
         )
-        return MassFlowRate(
+        return MassFlowRate._create(
             value_difference_as_kilogram_per_second,
             MassUnit.KILOGRAM,
             TimeUnit.SECOND,
+            value_difference_as_kilogram_per_second,
         )
 
     def __neg__(self) -> "MassFlowRate":
@@ -121,68 +202,53 @@ class MassFlowRate:
     def __abs__(self) -> "MassFlowRate":
         """Return the absolute version of the flow rate."""
         absolute_value = abs(self._value)
-        return MassFlowRate(absolute_value, self._mass_unit, self._time_unit)
+        return MassFlowRate._create(
+            absolute_value,
+            self._mass_unit,
+            self._time_unit,
+            abs(self._value_as_kilogram_per_second),
+        )
 
     def __floordiv__(self, other: "MassFlowRate") -> float:
         """Return the floored ratio between the flow rates."""
-        value_as_kilogram_per_second = self.as_unit(MassUnit.KILOGRAM, TimeUnit.SECOND)
-        other_value_as_kilogram_per_second = other.as_unit(
-            MassUnit.KILOGRAM, TimeUnit.SECOND
-        )
-        return value_as_kilogram_per_second // other_value_as_kilogram_per_second
+        return self._value_as_kilogram_per_second // other._value_as_kilogram_per_second
 
     def __mod__(self, other: "MassFlowRate") -> float:
         """Return the remainder of the ratio between the flow rate."""
-        value_as_kilogram_per_second = self.as_unit(MassUnit.KILOGRAM, TimeUnit.SECOND)
-        other_value_as_kilogram_per_second = other.as_unit(
-            MassUnit.KILOGRAM, TimeUnit.SECOND
-        )
-        return value_as_kilogram_per_second % other_value_as_kilogram_per_second
+        return self._value_as_kilogram_per_second % other._value_as_kilogram_per_second
 
     def __divmod__(self, other: "MassFlowRate") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the flow rates."""
-        value_as_kilogram_per_second = self.as_unit(MassUnit.KILOGRAM, TimeUnit.SECOND)
-        other_value_as_kilogram_per_second = other.as_unit(
-            MassUnit.KILOGRAM, TimeUnit.SECOND
+        return divmod(
+            self._value_as_kilogram_per_second, other._value_as_kilogram_per_second
         )
-        return divmod(value_as_kilogram_per_second, other_value_as_kilogram_per_second)
 
     def __eq__(self, other: object) -> bool:
         """Return whether the objects are equal flow rates."""
         if not isinstance(other, MassFlowRate):
             return NotImplemented
 
-        return self.as_unit(MassUnit.KILOGRAM, TimeUnit.SECOND) == other.as_unit(
-            MassUnit.KILOGRAM, TimeUnit.SECOND
-        )
+        return self._value_as_kilogram_per_second == other._value_as_kilogram_per_second
 
     def __lt__(self, other: "MassFlowRate") -> bool:
         """Return whether the flow rate is less than the other."""
-        return self.as_unit(MassUnit.KILOGRAM, TimeUnit.SECOND) < other.as_unit(
-            MassUnit.KILOGRAM, TimeUnit.SECOND
-        )
+        return self._value_as_kilogram_per_second < other._value_as_kilogram_per_second
 
     def __le__(self, other: "MassFlowRate") -> bool:
         """Return whether the flow rate is less than or equal to the other."""
-        return self.as_unit(MassUnit.KILOGRAM, TimeUnit.SECOND) <= other.as_unit(
-            MassUnit.KILOGRAM, TimeUnit.SECOND
-        )
+        return self._value_as_kilogram_per_second <= other._value_as_kilogram_per_second
 
     def __gt__(self, other: "MassFlowRate") -> bool:
         """Return whether the flow rate is greater than the other."""
-        return self.as_unit(MassUnit.KILOGRAM, TimeUnit.SECOND) > other.as_unit(
-            MassUnit.KILOGRAM, TimeUnit.SECOND
-        )
+        return self._value_as_kilogram_per_second > other._value_as_kilogram_per_second
 
     def __ge__(self, other: "MassFlowRate") -> bool:
         """Return whether the flow rate is greater than or equal to the other."""
-        return self.as_unit(MassUnit.KILOGRAM, TimeUnit.SECOND) >= other.as_unit(
-            MassUnit.KILOGRAM, TimeUnit.SECOND
-        )
+        return self._value_as_kilogram_per_second >= other._value_as_kilogram_per_second
 
     def __hash__(self) -> int:
         """Return the hash of the flow rate."""
-        return hash(self.as_unit(MassUnit.KILOGRAM, TimeUnit.SECOND))
+        return hash(self._value_as_kilogram_per_second)
 
     def __str__(self) -> str:
         """Return a string representation of the flow rate."""
@@ -0,0 +1,68 @@
+"""Module for the mass totalizer class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from ..mass import MassDelta, get_unit_delta_per_kilogram
+from ..mass import Unit as MassUnit
+from ..totalizer import Totalizer
+
+if TYPE_CHECKING:
+    from ..time import Time, TimeDelta
+    from .mass_flow_rate import MassFlowRate
+
+
+class MassTotalizer:
+    """Totals the mass delivered by a mass flow rate over time.
+
+    The total is kept in kilograms, with compensated summation, so that it does
+    not drift over millions of updates, and no objects are created by an update.
+    The total is returned as a mass difference in the unit of the totalizer.
+    """
+
+    __slots__ = ("_totalizer", "_unit", "_unit_delta_per_kilogram")
+
+    def __init__(self, unit: MassUnit) -> None:
+        """Initialise a new totalizer, with a total of 0, returned in the unit."""
+        self._totalizer = Totalizer()
+        self._unit = unit
+        self._unit_delta_per_kilogram = get_unit_delta_per_kilogram(unit)
+
+    def add(self, flow_rate: "MassFlowRate", duration: "TimeDelta") -> None:
+        """Add the mass delivered at the flow rate over the duration.
+
+        Raises:
+            ValueError: The duration is negative.
+        """
+        self._totalizer.add(
+            flow_rate._value_as_kilogram_per_second, duration._value_as_second
+        )
+
+    def update(self, flow_rate: "MassFlowRate", time: "Time") -> None:
+        """Add the mass delivered since the previous flow rate was measured.
+
+        The flow rate is taken to change linearly between the measurements, and the
+        first flow rate only sets the start of the total.
+
+        Raises:
+            ValueError: The time is before the time of the previous flow rate.
+        """
+        self._totalizer.update(
+            flow_rate._value_as_kilogram_per_second, time._value_as_second
+        )
+
+    def total(self) -> MassDelta:
+        """Return the total mass delivered so far."""
+        value_as_kilogram = self._totalizer.total
+        return MassDelta._create(
+            value_as_kilogram * self._unit_delta_per_kilogram,
+            self._unit,
+            value_as_kilogram,
+        )
+
+    def reset(self) -> None:
+        """Set the total back to 0, and forget the previous flow rate."""
+        self._totalizer.reset()
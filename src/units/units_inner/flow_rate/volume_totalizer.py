@@ -0,0 +1,68 @@
+"""Module for the volume totalizer class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from ..totalizer import Totalizer
+from ..volume import Unit as VolumeUnit
+from ..volume import VolumeDelta, get_unit_delta_per_cubic_metre
+
+if TYPE_CHECKING:
+    from ..time import Time, TimeDelta
+    from .volumetric_flow_rate import VolumetricFlowRate
+
+
+class VolumeTotalizer:
+    """Totals the volume delivered by a volumetric flow rate over time.
+
+    The total is kept in cubic metres, with compensated summation, so that it does
+    not drift over millions of updates, and no objects are created by an update.
+    The total is returned as a volume difference in the unit of the totalizer.
+    """
+
+    __slots__ = ("_totalizer", "_unit", "_unit_delta_per_cubic_metre")
+
+    def __init__(self, unit: VolumeUnit) -> None:
+        """Initialise a new totalizer, with a total of 0, returned in the unit."""
+        self._totalizer = Totalizer()
+        self._unit = unit
+        self._unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(unit)
+
+    def add(self, flow_rate: "VolumetricFlowRate", duration: "TimeDelta") -> None:
+        """Add the volume delivered at the flow rate over the duration.
+
+        Raises:
+            ValueError: The duration is negative.
+        """
+        self._totalizer.add(
+            flow_rate._value_as_cubic_metre_per_second, duration._value_as_second
+        )
+
+    def update(self, flow_rate: "VolumetricFlowRate", time: "Time") -> None:
+        """Add the volume delivered since the previous flow rate was measured.
+
+        The flow rate is taken to change linearly between the measurements, and the
+        first flow rate only sets the start of the total.
+
+        Raises:
+            ValueError: The time is before the time of the previous flow rate.
+        """
+        self._totalizer.update(
+            flow_rate._value_as_cubic_metre_per_second, time._value_as_second
+        )
+
+    def total(self) -> VolumeDelta:
+        """Return the total volume delivered so far."""
+        value_as_cubic_metre = self._totalizer.total
+        return VolumeDelta._create(
+            value_as_cubic_metre * self._unit_delta_per_cubic_metre,
+            self._unit,
+            value_as_cubic_metre,
+        )
+
+    def reset(self) -> None:
+        """Set the total back to 0, and forget the previous flow rate."""
+        self._totalizer.reset()
@@ -1,24 +1,31 @@
 """Module for the volumetric flow rate class."""
 
+# pyright: reportPrivateUsage=false
 # ruff: noqa: TID252
 
 from typing import overload
 
+from ..time import TimeDelta
 from ..time import Unit as TimeUnit
 from ..time import get_unit_abbreviation as get_time_unit_abbreviation
-from ..time import get_unit_delta_per_second as get_time_unit_delta_per_second
 from ..time import get_unit_name as get_time_unit_name
 from ..volume import Unit as VolumeUnit
+from ..volume import VolumeDelta
 from ..volume import get_unit_abbreviation as get_volume_unit_abbreviation
-from ..volume import (
-    get_unit_delta_per_cubic_metre as get_volume_unit_delta_per_cubic_metre,
-)
 from ..volume import get_unit_name as get_volume_unit_name
+from .converter import VOLUMETRIC_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT
 
 
 class VolumetricFlowRate:
     """The volume of a gas or liquid that flows in a certain amount of time."""
 
+    __slots__ = (
+        "_time_unit",
+        "_value",
+        "_value_as_cubic_metre_per_second",
+        "_volume_unit",
+    )
+
     def __init__(
         self, value: float, volume_unit: VolumeUnit, time_unit: TimeUnit
     ) -> None:
@@ -26,43 +33,99 @@ class VolumetricFlowRate:
         self._value = value
         self._volume_unit = volume_unit
         self._time_unit = time_unit
+        units = (self._volume_unit, self._time_unit)
+        try:
+            unit_delta_per_si_unit = VOLUMETRIC_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = (
+                VOLUMETRIC_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+            )
+        self._value_as_cubic_metre_per_second = value / unit_delta_per_si_unit
+
+    @classmethod
+    def _create(
+        cls,
+        value: float,
+        volume_unit: VolumeUnit,
+        time_unit: TimeUnit,
+        value_as_cubic_metre_per_second: float,
+    ) -> "VolumetricFlowRate":
+        """Create a volumetric flow rate from its value in both the units & SI units.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        volumetric_flow_rate: VolumetricFlowRate = cls.__new__(cls)
+        volumetric_flow_rate._value = value
+        volumetric_flow_rate._volume_unit = volume_unit
+        volumetric_flow_rate._time_unit = time_unit
+        volumetric_flow_rate._value_as_cubic_metre_per_second = (
+            value_as_cubic_metre_per_second
+        )
+        return volumetric_flow_rate
 
     def as_unit(self, volume_unit: VolumeUnit, time_unit: TimeUnit) -> float:
         """Return the flow rate in the specified units."""
-        internal_volume_unit_delta_per_cubic_metre = (
-            get_volume_unit_delta_per_cubic_metre(self._volume_unit)
-        )
-        internal_time_unit_delta_per_second = get_time_unit_delta_per_second(
-            self._time_unit
-        )
-        internal_unit_to_cubic_metre_per_second_factor = (
-            internal_time_unit_delta_per_second
-            / internal_volume_unit_delta_per_cubic_metre
-        )
-        value_as_cubic_metre_per_second = (
-            internal_unit_to_cubic_metre_per_second_factor * self._value
-        )
-        external_volume_unit_delta_per_cubic_metre = (
-            get_volume_unit_delta_per_cubic_metre(volume_unit)
-        )
-        external_time_unit_delta_per_second = get_time_unit_delta_per_second(time_unit)
-        cubic_metre_per_second_to_external_unit_factor = (
-            external_volume_unit_delta_per_cubic_metre
-            / external_time_unit_delta_per_second
-        )
-        return (
-            cubic_metre_per_second_to_external_unit_factor
-            * value_as_cubic_metre_per_second
+        units = (volume_unit, time_unit)
+        try:
+            unit_delta_per_si_unit = VOLUMETRIC_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = (
+                VOLUMETRIC_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+            )
+        return self._value_as_cubic_metre_per_second * unit_delta_per_si_unit
+
+    @overload
+    def __mul__(self, other: float) -> "VolumetricFlowRate": ...
+
+    @overload
+    def __mul__(self, other: TimeDelta) -> VolumeDelta: ...
+
+    def __mul__(self, other: "float | TimeDelta") -> "VolumetricFlowRate | VolumeDelta":
+        """Return a scaled flow rate or a volume.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a :py:class:`float`, return a flow rate scaled by the value
+        - If the argument is a :py:class:`TimeDelta`, return the volume gained at the
+          flow rate over the time difference
+        """
+        if isinstance(other, TimeDelta):
+            value_as_cubic_metre = (
+                self._value_as_cubic_metre_per_second * other._value_as_second
+            )
+            if self._time_unit == other._unit:
+                return VolumeDelta._create(
+                    self._value * other._value, self._volume_unit, value_as_cubic_metre
+                )
+
+            return VolumeDelta._create(
+                value_as_cubic_metre, VolumeUnit.CUBIC_METRE, value_as_cubic_metre
+            )
+
+        scaled_value = self._value * other
+        return VolumetricFlowRate._create(
+            scaled_value,
+            self._volume_unit,
+            self._time_unit,
+            self._value_as_cubic_metre_per_second * other,
         )
 
-    def __mul__(self, value: float) -> "VolumetricFlowRate":
-        """Return a flow rate scaled by the value."""
-        scaled_value = self._value * value
-        return VolumetricFlowRate(scaled_value, self._volume_unit, self._time_unit)
+    @overload
+    def __rmul__(self, other: float) -> "VolumetricFlowRate": ...
+
+    @overload
+    def __rmul__(self, other: TimeDelta) -> VolumeDelta: ...
+
+    def __rmul__(
+        self, other: "float | TimeDelta"
+    ) -> "VolumetricFlowRate | VolumeDelta":
+        """Return a scaled flow rate or a volume.
 
-    def __rmul__(self, value: float) -> "VolumetricFlowRate":
-        """Return a flow rate scaled by the value."""
-        return self * value
+        The product is the same as with the operands the other way around.
+        """
+        return self * other
 
     @overload
     def __truediv__(self, other: float) -> "VolumetricFlowRate": ...
@@ -83,48 +146,79 @@ class VolumetricFlowRate:
           the two flow rates
         """
         if isinstance(other, VolumetricFlowRate):
-            value_as_cubic_metre_per_second = self.as_unit(
-                VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
-            )
-            other_value_as_cubic_metre_per_second = other.as_unit(
-                VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
-            )
             return (
-                value_as_cubic_metre_per_second / other_value_as_cubic_metre_per_second
+                self._value_as_cubic_metre_per_second
+                / other._value_as_cubic_metre_per_second
             )
 
         return (1 / other) * self
 
     def __add__(self, other: "VolumetricFlowRate") -> "VolumetricFlowRate":
         """Return the sum of two flow rates."""
-        value_as_cubic_metre_per_second = self.as_unit(
-            VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
-        )
-        other_value_as_cubic_metre_per_second = other.as_unit(
-            VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
-        )
+        if (
+            self._volume_unit == other._volume_unit
+            and self._time_unit == other._time_unit
+        ):
+            value_sum = self._value + other._value
+            units = (self._volume_unit, self._time_unit)
+            try:
+                unit_delta_per_si_unit = VOLUMETRIC_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT[
+                    units
+                ]
+            except KeyError:
+                unit_delta_per_si_unit = (
+                    VOLUMETRIC_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+                )
+            return VolumetricFlowRate._create(
+                value_sum,
+                self._volume_unit,
+                self._time_unit,
+                value_sum / unit_delta_per_si_unit,
+            )
+
         value_sum_as_cubic_metre_per_second = (
-            value_as_cubic_metre_per_second + other_value_as_cubic_metre_per_second
+            self._value_as_cubic_metre_per_second
+            + other._value_as_cubic_metre_per_second
         )
-        return VolumetricFlowRate(
-            value_sum_as_cubic_metre_per_second, VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
+        return VolumetricFlowRate._create(
+            value_sum_as_cubic_metre_per_second,
+            VolumeUnit.CUBIC_METRE,
+            TimeUnit.SECOND,
+            value_sum_as_cubic_metre_per_second,
         )
 
     def __sub__(self, other: "VolumetricFlowRate") -> "VolumetricFlowRate":
         """Return the difference of two flow rates."""
-        value_as_cubic_metre_per_second = self.as_unit(
-            VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
-        )
-        other_value_as_cubic_metre_per_second = other.as_unit(
-            VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
-        )
+        if (
+            self._volume_unit == other._volume_unit
+            and self._time_unit == other._time_unit
+        ):
+            value_difference = self._value - other._value
+            units = (self._volume_unit, self._time_unit)
+            try:
+                unit_delta_per_si_unit = VOLUMETRIC_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT[
+                    units
+                ]
+            except KeyError:
+                unit_delta_per_si_unit = (
+                    VOLUMETRIC_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+                )
+            return VolumetricFlowRate._create(
+                value_difference,
+                self._volume_unit,
+                self._time_unit,
+                value_difference / unit_delta_per_si_unit,
+            )
+
         value_difference_as_cubic_metre_per_second = (
-            value_as_cubic_metre_per_second - other_value_as_cubic_metre_per_second
+            self._value_as_cubic_metre_per_second
+            - other._value_as_cubic_metre_per_second
         )
-        return VolumetricFlowRate(
+        return VolumetricFlowRate._create(
             value_difference_as_cubic_metre_per_second,
             VolumeUnit.CUBIC_METRE,
             TimeUnit.SECOND,
+            value_difference_as_cubic_metre_per_second,
         )
 
     def __neg__(self) -> "VolumetricFlowRate":
@@ -134,38 +228,32 @@ class VolumetricFlowRate:
     def __abs__(self) -> "VolumetricFlowRate":
         """Return the absolute version of the flow rate."""
         absolute_value = abs(self._value)
-        return VolumetricFlowRate(absolute_value, self._volume_unit, self._time_unit)
+        return VolumetricFlowRate._create(
+            absolute_value,
+            self._volume_unit,
+            self._time_unit,
+            abs(self._value_as_cubic_metre_per_second),
+        )
 
     def __floordiv__(self, other: "VolumetricFlowRate") -> float:
         """Return the floored ratio between the flow rates."""
-        value_as_cubic_metre_per_second = self.as_unit(
-            VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
-        )
-        other_value_as_cubic_metre_per_second = other.as_unit(
-            VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
+        return (
+            self._value_as_cubic_metre_per_second
+            // other._value_as_cubic_metre_per_second
         )
-        return value_as_cubic_metre_per_second // other_value_as_cubic_metre_per_second
 
     def __mod__(self, other: "VolumetricFlowRate") -> float:
         """Return the remainder of the ratio between the flow rate."""
-        value_as_cubic_metre_per_second = self.as_unit(
-            VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
-        )
-        other_value_as_cubic_metre_per_second = other.as_unit(
-            VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
+        return (
+            self._value_as_cubic_metre_per_second
+            % other._value_as_cubic_metre_per_second
         )
-        return value_as_cubic_metre_per_second % other_value_as_cubic_metre_per_second
 
     def __divmod__(self, other: "VolumetricFlowRate") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the flow rates."""
-        value_as_cubic_metre_per_second = self.as_unit(
-            VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
-        )
-        other_value_as_cubic_metre_per_second = other.as_unit(
-            VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
-        )
         return divmod(
-            value_as_cubic_metre_per_second, other_value_as_cubic_metre_per_second
+            self._value_as_cubic_metre_per_second,
+            other._value_as_cubic_metre_per_second,
         )
 
     def __eq__(self, other: object) -> bool:
@@ -173,37 +261,42 @@ class VolumetricFlowRate:
         if not isinstance(other, VolumetricFlowRate):
             return NotImplemented
 
-        return self.as_unit(VolumeUnit.CUBIC_METRE, TimeUnit.SECOND) == other.as_unit(
-            VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
+        return (
+            self._value_as_cubic_metre_per_second
+            == other._value_as_cubic_metre_per_second
         )
 
     def __lt__(self, other: "VolumetricFlowRate") -> bool:
         """Return whether the flow rate is less than the other."""
-        return self.as_unit(VolumeUnit.CUBIC_METRE, TimeUnit.SECOND) < other.as_unit(
-            VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
+        return (
+            self._value_as_cubic_metre_per_second
+            < other._value_as_cubic_metre_per_second
         )
 
     def __le__(self, other: "VolumetricFlowRate") -> bool:
         """Return whether the flow rate is less than or equal to the other."""
-        return self.as_unit(VolumeUnit.CUBIC_METRE, TimeUnit.SECOND) <= other.as_unit(
-            VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
+        return (
+            self._value_as_cubic_metre_per_second
+            <= other._value_as_cubic_metre_per_second
         )
 
     def __gt__(self, other: "VolumetricFlowRate") -> bool:
         """Return whether the flow rate is greater than the other."""
-        return self.as_unit(VolumeUnit.CUBIC_METRE, TimeUnit.SECOND) > other.as_unit(
-            VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
+        return (
+            self._value_as_cubic_metre_per_second
+            > other._value_as_cubic_metre_per_second
         )
 
     def __ge__(self, other: "VolumetricFlowRate") -> bool:
         """Return whether the flow rate is greater than or equal to the other."""
-        return self.as_unit(VolumeUnit.CUBIC_METRE, TimeUnit.SECOND) >= other.as_unit(
-            VolumeUnit.CUBIC_METRE, TimeUnit.SECOND
+        return (
+            self._value_as_cubic_metre_per_second
+            >= other._value_as_cubic_metre_per_second
         )
 
     def __hash__(self) -> int:
         """Return the hash of the flow rate."""
-        return hash(self.as_unit(VolumeUnit.CUBIC_METRE, TimeUnit.SECOND))
+        return hash(self._value_as_cubic_metre_per_second)
 
     def __str__(self) -> str:
         """Return a string representation of the flow rate."""
@@ -0,0 +1,89 @@
+"""Module for the volumetric flow rate estimator class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from ..time import Unit as TimeUnit
+from ..volume import Unit as VolumeUnit
+from .converter import VOLUMETRIC_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT
+from .volumetric_flow_rate import VolumetricFlowRate
+
+if TYPE_CHECKING:
+    from array import array
+
+    from ..rate_estimators import RateEstimator
+    from ..time import Time, TimeArray
+    from ..volume import Volume, VolumeArray
+
+
+class VolumetricFlowRateEstimator:
+    """Estimates the flow rate from a stream of timestamped volumes.
+
+    Each time & volume is passed to the estimator in seconds & cubic metres, and
+    each rate is returned as a flow rate in the units of the estimator, so that no
+    differences are converted or created for each sample.
+    """
+
+    __slots__ = ("_estimator", "_time_unit", "_unit_delta_per_si", "_volume_unit")
+
+    def __init__(
+        self,
+        estimator: "RateEstimator",
+        volume_unit: VolumeUnit,
+        time_unit: TimeUnit,
+    ) -> None:
+        """Initialise a new flow rate estimator, returning flow rates in the units."""
+        self._estimator = estimator
+        self._volume_unit = volume_unit
+        self._time_unit = time_unit
+        units = (volume_unit, time_unit)
+        try:
+            unit_delta_per_si_unit = VOLUMETRIC_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = (
+                VOLUMETRIC_FLOW_RATE_UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+            )
+        self._unit_delta_per_si = unit_delta_per_si_unit
+
+    def update(self, time: "Time", volume: "Volume") -> "VolumetricFlowRate | None":
+        """Add the volume at the time & return the flow rate.
+
+        None is returned until the estimator has enough samples to estimate from.
+
+        Raises:
+            ValueError: The time is not after the time of the previous sample.
+        """
+        rate = self._estimator.update(
+            time._value_as_second, volume._value_as_cubic_metre
+        )
+        if rate is None:
+            return None
+
+        return VolumetricFlowRate._create(
+            rate * self._unit_delta_per_si, self._volume_unit, self._time_unit, rate
+        )
+
+    def estimate(self, times: "TimeArray", volumes: "VolumeArray") -> "array[float]":
+        """Return the flow rates of whole arrays of samples, in the units.
+
+        The flow rates are those a fresh estimator would return for the samples,
+        without those it returns as None, and the stream so far is not disturbed.
+
+        Raises:
+            ValueError: The arrays are of different lengths, or the times do not
+                increase.
+        """
+        rates = self._estimator.estimate(
+            times._values_as_second, volumes._values_as_cubic_metre
+        )
+        unit_delta_per_si = self._unit_delta_per_si
+        for index, rate in enumerate(rates):
+            rates[index] = rate * unit_delta_per_si
+        return rates
+
+    def reset(self) -> None:
+        """Forget every sample."""
+        self._estimator.reset()
@@ -1,20 +1,45 @@
 """Package for length-related classes and constants."""
 
 from .constants import ZERO
+from .converter import convert_into, make_converter
 from .exceptions import NegativeLengthValueError
+from .filter import LengthFilter
+from .fixed_point_length import FixedPointLength
+from .fixed_point_length_delta import FixedPointLengthDelta
+from .isr import LengthCell, LengthThreshold
 from .length import Length
+from .length_array import LengthArray
 from .length_delta import LengthDelta
-from .unit import Unit, get_unit_delta_per_metre
+from .length_delta_array import LengthDeltaArray
+from .series import LengthSeries
+from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    Unit,
+    get_unit_delta_per_metre,
+)
 from .unit import get_abbreviation as get_unit_abbreviation
 from .unit import get_name as get_unit_name
 
 __all__ = [
+    "CONVERSION_FACTORS",
+    "CONVERSION_FACTORS_STRIDE",
     "ZERO",
+    "FixedPointLength",
+    "FixedPointLengthDelta",
     "Length",
+    "LengthArray",
+    "LengthCell",
     "LengthDelta",
+    "LengthDeltaArray",
+    "LengthFilter",
+    "LengthSeries",
+    "LengthThreshold",
     "NegativeLengthValueError",
     "Unit",
+    "convert_into",
     "get_unit_abbreviation",
     "get_unit_delta_per_metre",
     "get_unit_name",
+    "make_converter",
 ]
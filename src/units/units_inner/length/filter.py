@@ -0,0 +1,56 @@
+"""Module for the length filter class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from .exceptions import NegativeLengthValueError
+from .length import Length
+from .unit import Unit, get_unit_delta_per_metre
+
+if TYPE_CHECKING:
+    from ..filters import Filter
+
+
+class LengthFilter:
+    """A streaming filter over lengths, such as a moving average or median.
+
+    Each length is passed to the filter in metres, and each result is returned
+    as a length in the unit of the filter, so that a stream of readings is smoothed
+    without unwrapping & rewrapping them by hand.
+    """
+
+    __slots__ = ("_filter", "_unit", "_unit_delta_per_metre")
+
+    def __init__(self, filter_: "Filter", unit: Unit) -> None:
+        """Initialise a new length filter, returning results in the unit."""
+        self._filter = filter_
+        self._unit = unit
+        self._unit_delta_per_metre = get_unit_delta_per_metre(unit)
+
+    def update(self, length: Length) -> Length:
+        """Add the length to the filter & return the filtered length."""
+        return self._create(self._filter.update(length._value_as_metre))
+
+    def update_value(self, value: float) -> Length:
+        """Add a raw value in the unit of the filter & return the filtered length.
+
+        Raises:
+            NegativeLengthValueError: The negative value produced a length less than 0m.
+        """
+        if value < 0:
+            raise NegativeLengthValueError(value=value)
+
+        return self._create(self._filter.update(value / self._unit_delta_per_metre))
+
+    def _create(self, value_as_metre: float) -> Length:
+        """Create a length in the unit of the filter from its value in metres."""
+        return Length._create(
+            value_as_metre * self._unit_delta_per_metre, self._unit, value_as_metre
+        )
+
+    def reset(self) -> None:
+        """Forget every length added to the filter."""
+        self._filter.reset()
@@ -0,0 +1,154 @@
+"""Module for the fixed-point length class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+from typing import overload
+
+from ..fixed_point import check_count, from_count, to_count
+from .exceptions import NegativeLengthValueError
+from .fixed_point_length_delta import FixedPointLengthDelta
+from .length import Length
+from .unit import FIXED_POINT_RESOLUTION_PER_METRE, Unit, get_fixed_point_ratio
+
+
+class FixedPointLength:
+    """A length, in fixed-point.
+
+    The length is held as an integer number of micrometres. Intended for ports without
+    hardware floating point, or where floats are allocated on the heap. Only creating
+    the length & expressing it in a unit involve a conversion, which is done with an
+    integer ratio; arithmetic & comparisons stay in ints.
+
+    The count is kept within the range of a small int on 32-bit ports (see
+    `MAXIMUM_COUNT`), so up to about 1073 metres can be held, and creating a length
+    or doing arithmetic beyond it raises `OverflowError`.
+    """
+
+    __slots__ = ("_value_as_micrometre",)
+
+    def __init__(self, value: int, unit: Unit) -> None:
+        """Initialise a new fixed-point length from an integer value.
+
+        The value is in the unit, and is rounded to the nearest micrometre.
+
+        Raises:
+            NegativeLengthValueError: The negative value produced a length less than 0m.
+            OverflowError: The value is too large to be held as a count of micrometres.
+        """
+        if value < 0:
+            raise NegativeLengthValueError(value=value)
+
+        numerator, denominator = get_fixed_point_ratio(unit)
+        self._value_as_micrometre = to_count(value, numerator, denominator)
+
+    @classmethod
+    def _from_value_as_micrometre(cls, value_as_micrometre: int) -> "FixedPointLength":
+        """Create a fixed-point length from a number of micrometres.
+
+        Raises:
+            NegativeLengthValueError: The number of micrometres was negative.
+            OverflowError: The number of micrometres was out of range.
+        """
+        if value_as_micrometre < 0:
+            raise NegativeLengthValueError(value=value_as_micrometre)
+
+        length: FixedPointLength = cls.__new__(cls)
+        length._value_as_micrometre = check_count(value_as_micrometre)
+        return length
+
+    def as_unit(self, unit: Unit) -> int:
+        """Return the length in the unit, rounded to the nearest integer."""
+        numerator, denominator = get_fixed_point_ratio(unit)
+        return from_count(self._value_as_micrometre, numerator, denominator)
+
+    def to_length(self) -> Length:
+        """Return the length as a floating-point :py:class:`Length`."""
+        return Length(
+            self._value_as_micrometre / FIXED_POINT_RESOLUTION_PER_METRE, Unit.METRE
+        )
+
+    def __add__(self, delta: FixedPointLengthDelta) -> "FixedPointLength":
+        """Return the sum of the length and the difference.
+
+        Raises:
+            NegativeLengthValueError: The sum of the length and the difference was less
+                than 0m.
+        """
+        return FixedPointLength._from_value_as_micrometre(
+            self._value_as_micrometre + delta._value_as_micrometre
+        )
+
+    def __radd__(self, delta: FixedPointLengthDelta) -> "FixedPointLength":
+        """Return the sum of the length and the difference."""
+        return self + delta
+
+    @overload
+    def __sub__(self, other: "FixedPointLength") -> FixedPointLengthDelta: ...
+
+    @overload
+    def __sub__(self, other: FixedPointLengthDelta) -> "FixedPointLength": ...
+
+    def __sub__(
+        self, other: "FixedPointLength | FixedPointLengthDelta"
+    ) -> "FixedPointLengthDelta | FixedPointLength":
+        """Return the delta between lengths or the length less the delta.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a :py:class:`FixedPointLength`, return the difference
+          between the two lengths.
+        - If the argument is a :py:class:`FixedPointLengthDelta`, return the length
+          less the difference.
+
+        Raises:
+            NegativeLengthValueError: The length minus the difference was less
+                than 0m. Error can only be raised when other is a
+                :py:class:`FixedPointLengthDelta`.
+        """
+        value_difference_as_micrometre = (
+            self._value_as_micrometre - other._value_as_micrometre
+        )
+        return (
+            FixedPointLengthDelta._from_value_as_micrometre(
+                value_difference_as_micrometre
+            )
+            if isinstance(other, FixedPointLength)
+            else FixedPointLength._from_value_as_micrometre(
+                value_difference_as_micrometre
+            )
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the objects are equal fixed-point lengths."""
+        if not isinstance(other, FixedPointLength):
+            return NotImplemented
+
+        return self._value_as_micrometre == other._value_as_micrometre
+
+    def __lt__(self, other: "FixedPointLength") -> bool:
+        """Return whether the length is less than the other."""
+        return self._value_as_micrometre < other._value_as_micrometre
+
+    def __le__(self, other: "FixedPointLength") -> bool:
+        """Return whether the length is less than or equal to the other."""
+        return self._value_as_micrometre <= other._value_as_micrometre
+
+    def __gt__(self, other: "FixedPointLength") -> bool:
+        """Return whether the length is greater than the other."""
+        return self._value_as_micrometre > other._value_as_micrometre
+
+    def __ge__(self, other: "FixedPointLength") -> bool:
+        """Return whether the length is greater than or equal to the other."""
+        return self._value_as_micrometre >= other._value_as_micrometre
+
+    def __hash__(self) -> int:
+        """Return the hash of the length."""
+        return hash(self._value_as_micrometre)
+
+    def __str__(self) -> str:
+        """Return a string representation of the length."""
+        return f"{self._value_as_micrometre} um"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the length for developers."""
+        return f"{__class__.__name__}({self._value_as_micrometre} um)"
@@ -0,0 +1,159 @@
+"""Module for the fixed-point length delta class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+from typing import overload
+
+from ..fixed_point import check_count, from_count, to_count
+from .length_delta import LengthDelta
+from .unit import FIXED_POINT_RESOLUTION_PER_METRE, Unit, get_fixed_point_ratio
+
+
+class FixedPointLengthDelta:
+    """The difference between two lengths, in fixed-point.
+
+    The length delta is held as an integer number of micrometres. Intended for ports
+    without hardware floating point, or where floats are allocated on the heap. Only
+    creating the length delta & expressing it in a unit involve a conversion, which is
+    done with an integer ratio; arithmetic & comparisons stay in ints.
+
+    The count is kept within the range of a small int on 32-bit ports (see
+    `MAXIMUM_COUNT`), so up to about 1073 metres can be held, and creating a length
+    delta or doing arithmetic beyond it raises `OverflowError`.
+    """
+
+    __slots__ = ("_value_as_micrometre",)
+
+    def __init__(self, value: int, unit: Unit) -> None:
+        """Initialise a new fixed-point length delta from an integer value.
+
+        The value is in the unit, and is rounded to the nearest micrometre.
+
+        Raises:
+            OverflowError: The value is too large to be held as a count of micrometres.
+        """
+        numerator, denominator = get_fixed_point_ratio(unit)
+        self._value_as_micrometre = to_count(value, numerator, denominator)
+
+    @classmethod
+    def _from_value_as_micrometre(
+        cls, value_as_micrometre: int
+    ) -> "FixedPointLengthDelta":
+        """Create a fixed-point length delta from a number of micrometres.
+
+        Raises:
+            OverflowError: The number of micrometres was out of range.
+        """
+        delta: FixedPointLengthDelta = cls.__new__(cls)
+        delta._value_as_micrometre = check_count(value_as_micrometre)
+        return delta
+
+    def as_unit(self, unit: Unit) -> int:
+        """Return the length delta in the unit, rounded to the nearest integer."""
+        numerator, denominator = get_fixed_point_ratio(unit)
+        return from_count(self._value_as_micrometre, numerator, denominator)
+
+    def to_length_delta(self) -> LengthDelta:
+        """Return the length delta as a floating-point :py:class:`LengthDelta`."""
+        return LengthDelta(
+            self._value_as_micrometre / FIXED_POINT_RESOLUTION_PER_METRE, Unit.METRE
+        )
+
+    def __mul__(self, value: int) -> "FixedPointLengthDelta":
+        """Return the length delta scaled by the integer."""
+        return FixedPointLengthDelta._from_value_as_micrometre(
+            self._value_as_micrometre * value
+        )
+
+    def __rmul__(self, value: int) -> "FixedPointLengthDelta":
+        """Return the length delta scaled by the integer."""
+        return self * value
+
+    @overload
+    def __floordiv__(self, other: int) -> "FixedPointLengthDelta": ...
+
+    @overload
+    def __floordiv__(self, other: "FixedPointLengthDelta") -> int: ...
+
+    def __floordiv__(
+        self, other: "int | FixedPointLengthDelta"
+    ) -> "FixedPointLengthDelta | int":
+        """Return a floored scaled length delta or the floored ratio between them.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is an :py:class:`int`, return the length delta scaled by the
+          inverse of the value, floored to the nearest micrometre.
+        - If the argument is a :py:class:`FixedPointLengthDelta`, return the floored
+          ratio between the two.
+        """
+        if isinstance(other, FixedPointLengthDelta):
+            return self._value_as_micrometre // other._value_as_micrometre
+
+        return FixedPointLengthDelta._from_value_as_micrometre(
+            self._value_as_micrometre // other
+        )
+
+    def __add__(self, other: "FixedPointLengthDelta") -> "FixedPointLengthDelta":
+        """Return the sum of the length deltas."""
+        # Adding to a fixed-point length is handled by the __radd__ method of the
+        # fixed-point length class
+        if not isinstance(other, FixedPointLengthDelta):  # type: ignore[reportUnnecessaryIsInstance]
+            return NotImplemented
+
+        return FixedPointLengthDelta._from_value_as_micrometre(
+            self._value_as_micrometre + other._value_as_micrometre
+        )
+
+    def __sub__(self, other: "FixedPointLengthDelta") -> "FixedPointLengthDelta":
+        """Return the difference between the length deltas."""
+        return FixedPointLengthDelta._from_value_as_micrometre(
+            self._value_as_micrometre - other._value_as_micrometre
+        )
+
+    def __neg__(self) -> "FixedPointLengthDelta":
+        """Return the inverse of the length delta."""
+        return FixedPointLengthDelta._from_value_as_micrometre(
+            -self._value_as_micrometre
+        )
+
+    def __abs__(self) -> "FixedPointLengthDelta":
+        """Return the absolute version of the length delta."""
+        return FixedPointLengthDelta._from_value_as_micrometre(
+            abs(self._value_as_micrometre)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the objects are equal fixed-point length deltas."""
+        if not isinstance(other, FixedPointLengthDelta):
+            return NotImplemented
+
+        return self._value_as_micrometre == other._value_as_micrometre
+
+    def __lt__(self, other: "FixedPointLengthDelta") -> bool:
+        """Return whether the length delta is less than the other."""
+        return self._value_as_micrometre < other._value_as_micrometre
+
+    def __le__(self, other: "FixedPointLengthDelta") -> bool:
+        """Return whether the length delta is less than or equal to the other."""
+        return self._value_as_micrometre <= other._value_as_micrometre
+
+    def __gt__(self, other: "FixedPointLengthDelta") -> bool:
+        """Return whether the length delta is greater than the other."""
+        return self._value_as_micrometre > other._value_as_micrometre
+
+    def __ge__(self, other: "FixedPointLengthDelta") -> bool:
+        """Return whether the length delta is greater than or equal to the other."""
+        return self._value_as_micrometre >= other._value_as_micrometre
+
+    def __hash__(self) -> int:
+        """Return the hash of the length delta."""
+        return hash(self._value_as_micrometre)
+
+    def __str__(self) -> str:
+        """Return a string representation of the length delta."""
+        return f"{self._value_as_micrometre} um"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the length delta for developers."""
+        return f"{__class__.__name__}({self._value_as_micrometre} um)"
@@ -1,10 +1,15 @@
 """Module for the time class."""
 
+# pyright: reportPrivateUsage=false
+
 from typing import overload
 
 from .exceptions import NegativeLengthValueError
 from .length_delta import LengthDelta
 from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    UNIT_DELTAS_PER_METRE,
     Unit,
     get_abbreviation,
     get_name,
@@ -15,6 +20,8 @@ from .unit import (
 class Length:
     """The measure of distance."""
 
+    __slots__ = ("_unit", "_value", "_value_as_metre")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new length.
 
@@ -26,13 +33,43 @@ class Length:
 
         self._value = value
         self._unit = unit
+        internal_unit_delta_per_metre = get_unit_delta_per_metre(self._unit)
+        self._value_as_metre = self._value / internal_unit_delta_per_metre
+
+    @classmethod
+    def _create(cls, value: float, unit: Unit, value_as_metre: float) -> "Length":
+        """Create a length from its value in both the unit & metres.
+
+        Not intended for public use.
+
+        The value is not converted again, and the only validation is a single
+        comparison of the value in metres.
+
+        Raises:
+            NegativeLengthValueError: The value produced a length less than 0m.
+        """
+        if value_as_metre < 0:
+            raise NegativeLengthValueError(value=value)
+
+        length: Length = cls.__new__(cls)
+        length._value = value
+        length._unit = unit
+        length._value_as_metre = value_as_metre
+        return length
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the length, expressed as the unit."""
-        internal_unit_delta_per_metre = get_unit_delta_per_metre(self._unit)
-        value_as_metre = self._value / internal_unit_delta_per_metre
-        external_unit_delta_per_metre = get_unit_delta_per_metre(unit)
-        return external_unit_delta_per_metre * value_as_metre
+        """Return the length, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not a distance unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __add__(self, delta: LengthDelta) -> "Length":
         """Return the sum of the length and the difference.
@@ -41,10 +78,16 @@ class Length:
             NegativeLengthValueError: The sum of the length and the difference was less
                 than 0m.
         """
-        value_as_metre = self.as_unit(Unit.METRE)
-        delta_value_as_metre = delta.as_unit(Unit.METRE)
-        value_sum_as_metre = value_as_metre + delta_value_as_metre
-        return Length(value_sum_as_metre, Unit.METRE)
+        if self._unit == delta._unit:
+            value_sum = self._value + delta._value
+            return Length._create(
+                value_sum,
+                self._unit,
+                value_sum / UNIT_DELTAS_PER_METRE[self._unit],
+            )
+
+        value_sum_as_metre = self._value_as_metre + delta._value_as_metre
+        return Length._create(value_sum_as_metre, Unit.METRE, value_sum_as_metre)
 
     def __radd__(self, delta: LengthDelta) -> "Length":
         """Return the sum of the length and the difference."""
@@ -71,13 +114,30 @@ class Length:
                 than 0m. Error can only be raised when other is a
                 :py:class:`LengthDelta`.
         """
-        value_as_metre = self.as_unit(Unit.METRE)
-        other_value_as_metre = other.as_unit(Unit.METRE)
-        value_difference_as_metre = value_as_metre - other_value_as_metre
+        if self._unit == other._unit:
+            value_difference = self._value - other._value
+            value_difference_as_metre = (
+                value_difference / UNIT_DELTAS_PER_METRE[self._unit]
+            )
+            return (
+                LengthDelta._create(
+                    value_difference, self._unit, value_difference_as_metre
+                )
+                if isinstance(other, Length)
+                else Length._create(
+                    value_difference, self._unit, value_difference_as_metre
+                )
+            )
+
+        value_difference_as_metre = self._value_as_metre - other._value_as_metre
         return (
-            LengthDelta(value_difference_as_metre, Unit.METRE)
+            LengthDelta._create(
+                value_difference_as_metre, Unit.METRE, value_difference_as_metre
+            )
             if isinstance(other, Length)
-            else Length(value_difference_as_metre, Unit.METRE)
+            else Length._create(
+                value_difference_as_metre, Unit.METRE, value_difference_as_metre
+            )
         )
 
     def __eq__(self, other: object) -> bool:
@@ -85,27 +145,27 @@ class Length:
         if not isinstance(other, Length):
             return NotImplemented
 
-        return self.as_unit(Unit.METRE) == other.as_unit(Unit.METRE)
+        return self._value_as_metre == other._value_as_metre
 
     def __lt__(self, other: "Length") -> bool:
         """Return whether the length is less than the other."""
-        return self.as_unit(Unit.METRE) < other.as_unit(Unit.METRE)
+        return self._value_as_metre < other._value_as_metre
 
     def __le__(self, other: "Length") -> bool:
         """Return whether the length is less than or equal to the other."""
-        return self.as_unit(Unit.METRE) <= other.as_unit(Unit.METRE)
+        return self._value_as_metre <= other._value_as_metre
 
     def __gt__(self, other: "Length") -> bool:
         """Return whether the length is greater than the other."""
-        return self.as_unit(Unit.METRE) > other.as_unit(Unit.METRE)
+        return self._value_as_metre > other._value_as_metre
 
     def __ge__(self, other: "Length") -> bool:
         """Return whether the length is greater than or equal to the other."""
-        return self.as_unit(Unit.METRE) >= other.as_unit(Unit.METRE)
+        return self._value_as_metre >= other._value_as_metre
 
     def __hash__(self) -> int:
         """Return the hash of the length."""
-        return hash(self.as_unit(Unit.METRE))
+        return hash(self._value_as_metre)
 
     def __str__(self) -> str:
         """Return a string representation of the length."""
@@ -0,0 +1,228 @@
+"""Module for the length array class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    create_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .exceptions import NegativeLengthValueError
+from .length import Length
+from .length_delta import LengthDelta
+from .length_delta_array import LengthDeltaArray
+from .unit import Unit, get_name, get_unit_delta_per_metre
+
+if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Iterable, Iterator
+
+
+def _check_non_negative(
+    values_as_metre: "array[float] | memoryview", unit: Unit
+) -> None:
+    """Check that none of the lengths are less than 0m.
+
+    Raises:
+        NegativeLengthValueError: One of the lengths was less than 0m.
+    """
+    if not values_as_metre:
+        return
+
+    minimum_value_as_metre = min(values_as_metre)
+    if minimum_value_as_metre < 0:
+        internal_unit_delta_per_metre = get_unit_delta_per_metre(unit)
+        raise NegativeLengthValueError(
+            value=minimum_value_as_metre * internal_unit_delta_per_metre
+        )
+
+
+class LengthArray:
+    """A homogeneous array of lengths.
+
+    The lengths are stored in bulk as metres, and share a single unit that they are
+    expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_metre")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of lengths, with all values in the unit.
+
+        Raises:
+            NegativeLengthValueError: One of the values produced a length less than
+                0m.
+        """
+        internal_unit_delta_per_metre = get_unit_delta_per_metre(unit)
+        values_as_metre = create_values(values, 1 / internal_unit_delta_per_metre)
+        _check_non_negative(values_as_metre, unit)
+
+        self._unit = unit
+        self._values_as_metre: array[float] | memoryview = values_as_metre
+
+    @classmethod
+    def _from_values_as_metre(
+        cls, values_as_metre: "array[float] | memoryview", unit: Unit
+    ) -> "LengthArray":
+        """Create an array of lengths directly from a buffer of metres.
+
+        The buffer is used as-is, rather than copied, and is assumed to be valid.
+        """
+        lengths: LengthArray = cls.__new__(cls)
+        lengths._unit = unit
+        lengths._values_as_metre = values_as_metre
+        return lengths
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the lengths, expressed as the unit."""
+        external_unit_delta_per_metre = get_unit_delta_per_metre(unit)
+        return create_values(self._values_as_metre, external_unit_delta_per_metre)
+
+    def __len__(self) -> int:
+        """Return the number of lengths."""
+        return len(self._values_as_metre)
+
+    @overload
+    def __getitem__(self, index: int) -> Length: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LengthArray": ...
+
+    def __getitem__(self, index: "int | slice") -> "Length | LengthArray":
+        """Return the length at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return LengthArray._from_values_as_metre(
+                memoryview(self._values_as_metre)[index], self._unit
+            )
+
+        internal_unit_delta_per_metre = get_unit_delta_per_metre(self._unit)
+        return Length(
+            self._values_as_metre[index] * internal_unit_delta_per_metre, self._unit
+        )
+
+    def __iter__(self) -> "Iterator[Length]":
+        """Return an iterator over the lengths."""
+        internal_unit_delta_per_metre = get_unit_delta_per_metre(self._unit)
+        for value_as_metre in self._values_as_metre:
+            yield Length(value_as_metre * internal_unit_delta_per_metre, self._unit)
+
+    def __add__(self, delta: "LengthDelta | LengthDeltaArray") -> "LengthArray":
+        """Return the sum of the lengths and the difference(s).
+
+        A single length delta is added to every length, while an array of length
+        deltas is added elementwise.
+
+        Raises:
+            NegativeLengthValueError: One of the sums was less than 0m.
+            ValueError: The arrays are of different lengths.
+        """
+        delta_values_as_metre = (
+            delta.as_unit(Unit.METRE)
+            if isinstance(delta, LengthDelta)
+            else delta._values_as_metre
+        )
+        value_sums_as_metre = add_values(self._values_as_metre, delta_values_as_metre)
+        _check_non_negative(value_sums_as_metre, self._unit)
+        return LengthArray._from_values_as_metre(value_sums_as_metre, self._unit)
+
+    def __radd__(self, delta: LengthDelta) -> "LengthArray":
+        """Return the sum of the lengths and the difference.
+
+        Raises:
+            NegativeLengthValueError: One of the sums was less than 0m.
+        """
+        return self + delta
+
+    @overload
+    def __sub__(self, other: "Length | LengthArray") -> LengthDeltaArray: ...
+
+    @overload
+    def __sub__(self, other: "LengthDelta | LengthDeltaArray") -> "LengthArray": ...
+
+    def __sub__(
+        self, other: "Length | LengthArray | LengthDelta | LengthDeltaArray"
+    ) -> "LengthDeltaArray | LengthArray":
+        """Return the difference between the lengths and the other(s).
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a length or an array of lengths, return the differences
+          between the lengths.
+        - If the argument is a length delta or an array of length deltas, return the
+          lengths less the differences.
+
+        A single argument is subtracted from every length, while an array is
+        subtracted elementwise.
+
+        Raises:
+            NegativeLengthValueError: One of the differences was less than 0m. Error
+                can only be raised when other is a :py:class:`LengthDelta` or
+                :py:class:`LengthDeltaArray`.
+            ValueError: The arrays are of different lengths.
+        """
+        other_values_as_metre = (
+            other.as_unit(Unit.METRE)
+            if isinstance(other, (Length, LengthDelta))
+            else other._values_as_metre
+        )
+        value_differences_as_metre = subtract_values(
+            self._values_as_metre, other_values_as_metre
+        )
+        if isinstance(other, (Length, LengthArray)):
+            return LengthDeltaArray._from_values_as_metre(
+                value_differences_as_metre, self._unit
+            )
+
+        _check_non_negative(value_differences_as_metre, self._unit)
+        return LengthArray._from_values_as_metre(value_differences_as_metre, self._unit)
+
+    def __lt__(self, other: "Length | LengthArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the lengths less than the other length(s)."""
+        other_values_as_metre = (
+            other.as_unit(Unit.METRE)
+            if isinstance(other, Length)
+            else other._values_as_metre
+        )
+        return less_than(self._values_as_metre, other_values_as_metre)
+
+    def __le__(self, other: "Length | LengthArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the lengths less than or equal to the other length(s)."""
+        other_values_as_metre = (
+            other.as_unit(Unit.METRE)
+            if isinstance(other, Length)
+            else other._values_as_metre
+        )
+        return less_than_or_equal_to(self._values_as_metre, other_values_as_metre)
+
+    def __gt__(self, other: "Length | LengthArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the lengths greater than the other length(s)."""
+        other_values_as_metre = (
+            other.as_unit(Unit.METRE)
+            if isinstance(other, Length)
+            else other._values_as_metre
+        )
+        return greater_than(self._values_as_metre, other_values_as_metre)
+
+    def __ge__(self, other: "Length | LengthArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the lengths greater than or equal to the other length(s)."""
+        other_values_as_metre = (
+            other.as_unit(Unit.METRE)
+            if isinstance(other, Length)
+            else other._values_as_metre
+        )
+        return greater_than_or_equal_to(self._values_as_metre, other_values_as_metre)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the lengths."""
+        values = list(self.as_unit(self._unit))
+        return f"LengthArray({values}, {get_name(self._unit)})"
@@ -3,6 +3,9 @@
 from typing import overload
 
 from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    UNIT_DELTAS_PER_METRE,
     Unit,
     get_abbreviation,
     get_name,
@@ -13,22 +16,49 @@ from .unit import (
 class LengthDelta:
     """The difference between two lengths."""
 
+    __slots__ = ("_unit", "_value", "_value_as_metre")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new length difference."""
         self._value = value
         self._unit = unit
+        internal_unit_delta_per_metre = get_unit_delta_per_metre(self._unit)
+        self._value_as_metre = self._value / internal_unit_delta_per_metre
+
+    @classmethod
+    def _create(cls, value: float, unit: Unit, value_as_metre: float) -> "LengthDelta":
+        """Create a length difference from its value in both the unit & metres.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        length_delta: LengthDelta = cls.__new__(cls)
+        length_delta._value = value
+        length_delta._unit = unit
+        length_delta._value_as_metre = value_as_metre
+        return length_delta
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the length difference, expressed as the unit."""
-        internal_unit_delta_per_metre = get_unit_delta_per_metre(self._unit)
-        value_as_metre = self._value / internal_unit_delta_per_metre
-        external_unit_delta_per_metre = get_unit_delta_per_metre(unit)
-        return external_unit_delta_per_metre * value_as_metre
+        """Return the length difference, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not a distance unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __mul__(self, value: float) -> "LengthDelta":
         """Return a length difference scaled by the value."""
         scaled_value = self._value * value
-        return LengthDelta(scaled_value, self._unit)
+        return LengthDelta._create(
+            scaled_value, self._unit, self._value_as_metre * value
+        )
 
     def __rmul__(self, value: float) -> "LengthDelta":
         """Return a length difference scaled by the value."""
@@ -51,12 +81,12 @@ class LengthDelta:
           differences
         """
         if isinstance(other, LengthDelta):
-            value_as_metre = self.as_unit(Unit.METRE)
-            other_value_as_metre = other.as_unit(Unit.METRE)
-            return value_as_metre / other_value_as_metre
+            return self._value_as_metre / other._value_as_metre
 
         scaled_value = self._value / other
-        return LengthDelta(scaled_value, self._unit)
+        return LengthDelta._create(
+            scaled_value, self._unit, self._value_as_metre / other
+        )
 
     def __add__(self, other: "LengthDelta") -> "LengthDelta":
         """Return the sum of the length differences."""
@@ -66,10 +96,18 @@ class LengthDelta:
         if not isinstance(other, LengthDelta):  # type: ignore[reportUnnecessaryIsInstance]
             return NotImplemented
 
-        value_as_metre = self.as_unit(Unit.METRE)
-        delta_value_as_metre = other.as_unit(Unit.METRE)
-        added_value_as_metre = value_as_metre + delta_value_as_metre
-        return LengthDelta(added_value_as_metre, Unit.METRE)
+        if self._unit == other._unit:
+            value_sum = self._value + other._value
+            return LengthDelta._create(
+                value_sum,
+                self._unit,
+                value_sum / UNIT_DELTAS_PER_METRE[self._unit],
+            )
+
+        added_value_as_metre = self._value_as_metre + other._value_as_metre
+        return LengthDelta._create(
+            added_value_as_metre, Unit.METRE, added_value_as_metre
+        )
 
     def __sub__(self, delta: "LengthDelta") -> "LengthDelta":
         """Return the difference between the length differences."""
@@ -78,57 +116,53 @@ class LengthDelta:
     def __neg__(self) -> "LengthDelta":
         """Return the inverse of the length difference."""
         inverted_value = -self._value
-        return LengthDelta(inverted_value, self._unit)
+        return LengthDelta._create(inverted_value, self._unit, -self._value_as_metre)
 
     def __abs__(self) -> "LengthDelta":
         """Return the absolute version of the length difference."""
         absolute_value = abs(self._value)
-        return LengthDelta(absolute_value, self._unit)
+        return LengthDelta._create(
+            absolute_value, self._unit, abs(self._value_as_metre)
+        )
 
     def __floordiv__(self, other: "LengthDelta") -> float:
         """Return the floored ratio between the length differences."""
-        value_as_metre = self.as_unit(Unit.METRE)
-        other_value_as_metre = other.as_unit(Unit.METRE)
-        return value_as_metre // other_value_as_metre
+        return self._value_as_metre // other._value_as_metre
 
     def __mod__(self, other: "LengthDelta") -> float:
         """Return the remainder of the ratio between the length differences."""
-        value_as_metre = self.as_unit(Unit.METRE)
-        other_value_as_metre = other.as_unit(Unit.METRE)
-        return value_as_metre % other_value_as_metre
+        return self._value_as_metre % other._value_as_metre
 
     def __divmod__(self, other: "LengthDelta") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the length deltas."""
-        value_as_metre = self.as_unit(Unit.METRE)
-        other_value_as_metre = other.as_unit(Unit.METRE)
-        return divmod(value_as_metre, other_value_as_metre)
+        return divmod(self._value_as_metre, other._value_as_metre)
 
     def __eq__(self, other: object) -> bool:
         """Return whether the objects are equal length differences."""
         if not isinstance(other, LengthDelta):
             return NotImplemented
 
-        return self.as_unit(Unit.METRE) == other.as_unit(Unit.METRE)
+        return self._value_as_metre == other._value_as_metre
 
     def __lt__(self, other: "LengthDelta") -> bool:
         """Return whether the length difference is less than the other."""
-        return self.as_unit(Unit.METRE) < other.as_unit(Unit.METRE)
+        return self._value_as_metre < other._value_as_metre
 
     def __le__(self, other: "LengthDelta") -> bool:
         """Return whether the length difference is less than or equal to the other."""
-        return self.as_unit(Unit.METRE) <= other.as_unit(Unit.METRE)
+        return self._value_as_metre <= other._value_as_metre
 
     def __gt__(self, other: "LengthDelta") -> bool:
         """Return whether the length difference is greater than the other."""
-        return self.as_unit(Unit.METRE) > other.as_unit(Unit.METRE)
+        return self._value_as_metre > other._value_as_metre
 
     def __ge__(self, other: "LengthDelta") -> bool:
         """Return whether the length delta is greater than or equal to the other."""
-        return self.as_unit(Unit.METRE) >= other.as_unit(Unit.METRE)
+        return self._value_as_metre >= other._value_as_metre
 
     def __hash__(self) -> int:
         """Return the hash of the length difference."""
-        return hash(self.as_unit(Unit.METRE))
+        return hash(self._value_as_metre)
 
     def __str__(self) -> str:
         """Return a string representation of the length difference."""
@@ -0,0 +1,205 @@
+"""Module for the length delta array class."""
+
+# ruff: noqa: TID252
+
+from array import array
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    create_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .length_delta import LengthDelta
+from .unit import Unit, get_name, get_unit_delta_per_metre
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class LengthDeltaArray:
+    """A homogeneous array of length deltas.
+
+    The deltas are stored in bulk as metres, and share a single unit that they are
+    expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_metre")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of length deltas, with all values in the unit."""
+        internal_unit_delta_per_metre = get_unit_delta_per_metre(unit)
+        self._unit = unit
+        self._values_as_metre: array[float] | memoryview = create_values(
+            values, 1 / internal_unit_delta_per_metre
+        )
+
+    @classmethod
+    def _from_values_as_metre(
+        cls, values_as_metre: "array[float] | memoryview", unit: Unit
+    ) -> "LengthDeltaArray":
+        """Create an array of length deltas directly from a buffer of metres.
+
+        The buffer is used as-is, rather than copied.
+        """
+        deltas: LengthDeltaArray = cls.__new__(cls)
+        deltas._unit = unit
+        deltas._values_as_metre = values_as_metre
+        return deltas
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the length deltas, expressed as the unit."""
+        external_unit_delta_per_metre = get_unit_delta_per_metre(unit)
+        return create_values(self._values_as_metre, external_unit_delta_per_metre)
+
+    def __len__(self) -> int:
+        """Return the number of length deltas."""
+        return len(self._values_as_metre)
+
+    @overload
+    def __getitem__(self, index: int) -> LengthDelta: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LengthDeltaArray": ...
+
+    def __getitem__(self, index: "int | slice") -> "LengthDelta | LengthDeltaArray":
+        """Return the length delta at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return LengthDeltaArray._from_values_as_metre(
+                memoryview(self._values_as_metre)[index], self._unit
+            )
+
+        internal_unit_delta_per_metre = get_unit_delta_per_metre(self._unit)
+        return LengthDelta(
+            self._values_as_metre[index] * internal_unit_delta_per_metre, self._unit
+        )
+
+    def __iter__(self) -> "Iterator[LengthDelta]":
+        """Return an iterator over the length deltas."""
+        internal_unit_delta_per_metre = get_unit_delta_per_metre(self._unit)
+        for value_as_metre in self._values_as_metre:
+            yield LengthDelta(
+                value_as_metre * internal_unit_delta_per_metre, self._unit
+            )
+
+    def __mul__(self, value: float) -> "LengthDeltaArray":
+        """Return the length deltas scaled by the value."""
+        return LengthDeltaArray._from_values_as_metre(
+            create_values(self._values_as_metre, value), self._unit
+        )
+
+    def __rmul__(self, value: float) -> "LengthDeltaArray":
+        """Return the length deltas scaled by the value."""
+        return self * value
+
+    def __truediv__(self, value: float) -> "LengthDeltaArray":
+        """Return the length deltas scaled by the inverse of the value."""
+        return self * (1 / value)
+
+    def __add__(self, other: "LengthDelta | LengthDeltaArray") -> "LengthDeltaArray":
+        """Return the sum of the length deltas and the other delta(s).
+
+        A single length delta is added to every element, while an array of length
+        deltas is added elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, LengthDelta):
+            return LengthDeltaArray._from_values_as_metre(
+                add_values(self._values_as_metre, other.as_unit(Unit.METRE)),
+                self._unit,
+            )
+
+        if isinstance(other, LengthDeltaArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return LengthDeltaArray._from_values_as_metre(
+                add_values(self._values_as_metre, other._values_as_metre),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __radd__(self, other: LengthDelta) -> "LengthDeltaArray":
+        """Return the sum of the length deltas and the other delta."""
+        return self + other
+
+    def __sub__(self, other: "LengthDelta | LengthDeltaArray") -> "LengthDeltaArray":
+        """Return the difference of the length deltas and the other delta(s).
+
+        A single length delta is subtracted from every element, while an array of
+        length deltas is subtracted elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, LengthDelta):
+            return LengthDeltaArray._from_values_as_metre(
+                subtract_values(self._values_as_metre, other.as_unit(Unit.METRE)),
+                self._unit,
+            )
+
+        if isinstance(other, LengthDeltaArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return LengthDeltaArray._from_values_as_metre(
+                subtract_values(self._values_as_metre, other._values_as_metre),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __neg__(self) -> "LengthDeltaArray":
+        """Return the inverse of the length deltas."""
+        return self * -1
+
+    def __abs__(self) -> "LengthDeltaArray":
+        """Return the absolute of the length deltas."""
+        return LengthDeltaArray._from_values_as_metre(
+            array("d", (abs(value) for value in self._values_as_metre)), self._unit
+        )
+
+    def __lt__(self, other: "LengthDelta | LengthDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the length deltas less than the other delta(s)."""
+        other_values_as_metre = (
+            other.as_unit(Unit.METRE)
+            if isinstance(other, LengthDelta)
+            else other._values_as_metre
+        )
+        return less_than(self._values_as_metre, other_values_as_metre)
+
+    def __le__(self, other: "LengthDelta | LengthDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the length deltas less than or equal to the other(s)."""
+        other_values_as_metre = (
+            other.as_unit(Unit.METRE)
+            if isinstance(other, LengthDelta)
+            else other._values_as_metre
+        )
+        return less_than_or_equal_to(self._values_as_metre, other_values_as_metre)
+
+    def __gt__(self, other: "LengthDelta | LengthDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the length deltas greater than the other delta(s)."""
+        other_values_as_metre = (
+            other.as_unit(Unit.METRE)
+            if isinstance(other, LengthDelta)
+            else other._values_as_metre
+        )
+        return greater_than(self._values_as_metre, other_values_as_metre)
+
+    def __ge__(self, other: "LengthDelta | LengthDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the length deltas greater than or equal to the other(s)."""
+        other_values_as_metre = (
+            other.as_unit(Unit.METRE)
+            if isinstance(other, LengthDelta)
+            else other._values_as_metre
+        )
+        return greater_than_or_equal_to(self._values_as_metre, other_values_as_metre)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the length deltas."""
+        values = list(self.as_unit(self._unit))
+        return f"LengthDeltaArray({values}, {get_name(self._unit)})"
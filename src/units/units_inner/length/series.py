@@ -0,0 +1,130 @@
+"""Module for the length series class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from ..ring_buffer import RingBuffer
+from .exceptions import NegativeLengthValueError
+from .length import Length
+from .length_array import LengthArray
+from .unit import Unit, get_name, get_unit_delta_per_metre
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ..time import Time
+
+
+class LengthSeries(RingBuffer):
+    """A rolling window of the most recent lengths, with optional timestamps.
+
+    The lengths are stored as metres in a buffer preallocated on initialisation,
+    so that pushing a length drops the oldest one once the series is full,
+    rather than allocating. The lengths are indexed from the oldest (0) to the
+    latest (-1), and are expressed in the unit of the series when retrieved.
+    """
+
+    __slots__ = ("_unit", "_unit_delta_per_metre")
+
+    def __init__(self, capacity: int, unit: Unit, *, timestamped: bool = False) -> None:
+        """Initialise a new, empty series, holding up to the number of lengths.
+
+        If the series is timestamped, every length is pushed along with the time it
+        was measured at.
+
+        Raises:
+            ValueError: The capacity is less than 1.
+        """
+        super().__init__(capacity, timestamped=timestamped)
+        self._unit = unit
+        self._unit_delta_per_metre = get_unit_delta_per_metre(unit)
+
+    def push(self, length: Length, time: "Time | None" = None) -> None:
+        """Push a length, dropping the oldest one if the series is full.
+
+        Does not allocate.
+
+        Raises:
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        end = self._end
+        if end == self._limit:
+            end = self._compact()
+        times = self._times
+        if times is not None and time is not None:
+            times[end] = time._value_as_second
+        elif times is not None or time is not None:
+            self._raise_time_error()
+        self._values[end] = length._value_as_metre
+        self._end = end + 1
+
+    def push_value(self, value: float, time: "Time | None" = None) -> None:
+        """Push a raw value in the unit of the series, as a length.
+
+        Raises:
+            NegativeLengthValueError: The negative value produced a length less than 0m.
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        if value < 0:
+            raise NegativeLengthValueError(value=value)
+
+        self._push(value / self._unit_delta_per_metre, time)
+
+    def _create(self, value_as_metre: float) -> Length:
+        """Create a length in the unit of the series from its value in metres."""
+        return Length._create(
+            value_as_metre * self._unit_delta_per_metre, self._unit, value_as_metre
+        )
+
+    def latest(self) -> Length:
+        """Return the most recently pushed length.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(-1))
+
+    def oldest(self) -> Length:
+        """Return the least recently pushed length still in the series.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(0))
+
+    def window(self, count: "int | None" = None) -> LengthArray:
+        """Return the latest lengths, from oldest to latest.
+
+        All of the lengths are returned if the count is None, and at most as many
+        lengths as the series holds otherwise. The window is a view of the series rather
+        than a copy, so it is only valid until the next push or clear.
+        """
+        return LengthArray._from_values_as_metre(self._view_values(count), self._unit)
+
+    def __getitem__(self, index: int) -> Length:
+        """Return the length at the index.
+
+        Raises:
+            IndexError: There is no length at the index.
+        """
+        return self._create(self._get_value(index))
+
+    def __iter__(self) -> "Iterator[Length]":
+        """Return an iterator over the lengths, from oldest to latest.
+
+        Each length is only created when it is reached.
+        """
+        for value_as_metre in self._iter_values():
+            yield self._create(value_as_metre)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the length series."""
+        values = [value * self._unit_delta_per_metre for value in self._iter_values()]
+        return (
+            f"LengthSeries({values}, {get_name(self._unit)}, capacity={self._capacity})"
+        )
@@ -1,4 +1,8 @@
-"""Module for the pressure units."""
+"""Module for the distance units.
+
+Generated by `tools/generate_units.py` from `tools/units_spec.json`, so edit the
+spec & rerun the generator rather than editing this module.
+"""
 
 from typing import TYPE_CHECKING, Final
 
@@ -7,10 +11,12 @@ if TYPE_CHECKING:
 else:
     IntEnum = object
 
+_NAN: Final = float("nan")
+
 
-# NB: When adding a new unit, be sure to also update:
-# - The info list in helpers.py
-# - The `test_get_X_value_as_unit` test in `test_X.py` and `test_X_delta.py`
+# NB: When adding a new unit, add it to `tools/units_spec.json` & rerun
+# `tools/generate_units.py`, which also regenerates the tests of the unit
+# tables
 class Unit(IntEnum):
     """A distance unit.
 
@@ -28,91 +34,129 @@ class Unit(IntEnum):
     INCH = 6
 
 
-class _UnitInfo:
-    """Information associated with a particular distance unit.
+# The name & abbreviation of each unit, indexed by the unit. Element 0 does not
+# correspond to a unit.
+_NAMES: Final = (
+    "",
+    "metre",
+    "centimetre",
+    "millimetre",
+    "yard",
+    "foot",
+    "inch",
+)
+_ABBREVIATIONS: Final = (
+    "",
+    "m",
+    "cm",
+    "mm",
+    "yd",
+    "ft",
+    "in",
+)
+
+# The change in distance expressed as each unit per 1m, indexed by the unit. Element 0
+# does not correspond to a unit, and so holds NaN.
+UNIT_DELTAS_PER_METRE: Final = (
+    _NAN,
+    1,
+    100,
+    1000,
+    1.09361329834,
+    3.28083989501,
+    39.3700787402,
+)
+
+# Dense from-unit x to-unit table of conversion factors. Units are small contiguous
+# ints, so the factor that converts a value from one unit to another is at index
+# `from_unit * CONVERSION_FACTORS_STRIDE + to_unit`. Row & column 0 do not correspond to
+# a unit, and so hold NaN. A tuple is used rather than an array, as reading an element
+# of a tuple returns the stored float instead of allocating a new one.
+CONVERSION_FACTORS_STRIDE: Final = 7
+CONVERSION_FACTORS: Final = (
+    # Row 0 does not correspond to a unit
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    # From metre to each unit
+    _NAN,
+    1.0,
+    100.0,
+    1000.0,
+    1.09361329834,
+    3.28083989501,
+    39.3700787402,
+    # From centimetre to each unit
+    _NAN,
+    0.01,
+    1.0,
+    10.0,
+    0.0109361329834,
+    0.0328083989501,
+    0.393700787402,
+    # From millimetre to each unit
+    _NAN,
+    0.001,
+    0.1,
+    1.0,
+    0.00109361329834,
+    0.0032808398950100004,
+    0.0393700787402,
+    # From yard to each unit
+    _NAN,
+    0.9143999999980834,
+    91.43999999980835,
+    914.3999999980834,
+    1.0,
+    2.999999999990856,
+    35.99999999996342,
+    # From foot to each unit
+    _NAN,
+    0.30480000000029017,
+    30.480000000029015,
+    304.80000000029014,
+    0.33333333333434934,
+    1.0,
+    12.000000000024384,
+    # From inch to each unit
+    _NAN,
+    0.02539999999997257,
+    2.539999999997257,
+    25.399999999972568,
+    0.027777777777806,
+    0.083333333333164,
+    1.0,
+)
+
+# Fixed-point quantities hold an integer count of micrometres. The number of micrometres
+# per 1 of each unit is stored as an integer ratio, indexed by the unit, so that
+# converting to & from the units stays in ints. Element 0 does not correspond to a unit.
+FIXED_POINT_RESOLUTION_PER_METRE: Final = 1_000_000
+_FIXED_POINT_RATIOS: Final = (
+    (0, 1),
+    (1000000, 1),
+    (10000, 1),
+    (1000, 1),
+    (914400, 1),
+    (304800, 1),
+    (25400, 1),
+)
+
+
+def _check_unit(unit: Unit) -> None:
+    """Check that the unit is a distance unit.
 
     Not intended for public use.
-    """
 
-    def __init__(
-        self,
-        unit: Unit,
-        name: str,
-        abbreviation: str,
-        unit_delta_per_metre: float,
-    ) -> None:
-        """Initialise a collection of info associated with a unit."""
-        self._unit = unit
-        self._name = name
-        self._abbreviation = abbreviation
-        self._unit_delta_per_metre = unit_delta_per_metre
-
-    @property
-    def unit(self) -> Unit:
-        """The unit the information relates to."""
-        return self._unit
-
-    @property
-    def name(self) -> str:
-        """The name of the unit."""
-        return self._name
-
-    @property
-    def abbreviation(self) -> str:
-        """The abbreviation of the unit."""
-        return self._abbreviation
-
-    @property
-    def unit_delta_per_metre(self) -> float:
-        """The change in distance expressed as the unit per 1m.
-
-        Equivalent to the gradient of the metre-vs-unit graph.
-        """
-        return self._unit_delta_per_metre
-
-
-# All info is entered here to create a SSoT
-_UNITS_INFO: Final = [
-    _UnitInfo(
-        unit=Unit.METRE,
-        name="metre",
-        abbreviation="m",
-        unit_delta_per_metre=1,
-    ),
-    _UnitInfo(
-        unit=Unit.CENTIMETRE,
-        name="centimetre",
-        abbreviation="cm",
-        unit_delta_per_metre=100,
-    ),
-    _UnitInfo(
-        unit=Unit.MILLIMETRE,
-        name="millimetre",
-        abbreviation="mm",
-        unit_delta_per_metre=1_000,
-    ),
-    _UnitInfo(
-        unit=Unit.YARD,
-        name="yard",
-        abbreviation="yd",
-        unit_delta_per_metre=1.09361329834,
-    ),
-    _UnitInfo(
-        unit=Unit.FOOT,
-        name="foot",
-        abbreviation="ft",
-        unit_delta_per_metre=3.28083989501,
-    ),
-    _UnitInfo(
-        unit=Unit.INCH,
-        name="inch",
-        abbreviation="in",
-        unit_delta_per_metre=39.3700787402,
-    ),
-]
-
-# Convert into dictionary for quick lookup
-_UNIT_TO_INFO_MAP: Final = {info.unit: info for info in _UNITS_INFO}
+    Raises:
+        ValueError: The unit is not a distance unit.
+    """
+    if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+        raise ValueError
 
 
 def get_name(unit: Unit) -> str:
@@ -120,10 +164,8 @@ def get_name(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].name
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _NAMES[unit]
 
 
 def get_abbreviation(unit: Unit) -> str:
@@ -131,20 +173,23 @@ def get_abbreviation(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].abbreviation
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _ABBREVIATIONS[unit]
+
+
+def get_unit_delta_per_metre(unit: Unit) -> float:
+    """Get the change in distance expressed as the unit per 1m.
+
+    Not intended for public use.
+    """
+    _check_unit(unit)
+    return UNIT_DELTAS_PER_METRE[unit]
 
 
-def get_unit_delta_per_metre(
-    unit: Unit,
-) -> float:
-    """Get the change in distance expressed as the unit per 1Pa.
+def get_fixed_point_ratio(unit: Unit) -> tuple[int, int]:
+    """Get the number of micrometres per 1 of the distance unit, as an integer ratio.
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].unit_delta_per_metre
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _FIXED_POINT_RATIOS[unit]
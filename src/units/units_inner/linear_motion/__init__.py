@@ -1,8 +1,20 @@
 """Package for linear-motion-related classes and constants."""
 
 from .acceleration import Acceleration
+from .converter import convert_into, make_converter
 from .displacement import Displacement
+from .displacement_totalizer import DisplacementTotalizer
 from .jerk import Jerk
 from .velocity import Velocity
+from .velocity_estimator import VelocityEstimator
 
-__all__ = ["Acceleration", "Displacement", "Jerk", "Velocity"]
+__all__ = [
+    "Acceleration",
+    "Displacement",
+    "DisplacementTotalizer",
+    "Jerk",
+    "Velocity",
+    "VelocityEstimator",
+    "convert_into",
+    "make_converter",
+]
@@ -1,26 +1,38 @@
 """Module for the acceleration class."""
 
+# pyright: reportPrivateUsage=false
 # ruff: noqa: TID252
 
-from typing import overload
+from typing import TYPE_CHECKING, overload
 
 from ..length import Unit as DistanceUnit
 from ..length import get_unit_abbreviation as get_distance_unit_abbreviation
-from ..length import (
-    get_unit_delta_per_metre as get_distance_unit_delta_per_metre,
-)
 from ..length import get_unit_name as get_distance_unit_name
+from ..time import TimeDelta
 from ..time import Unit as TimeUnit
 from ..time import get_unit_abbreviation as get_time_unit_abbreviation
-from ..time import (
-    get_unit_delta_per_second as get_time_unit_delta_per_second,
-)
 from ..time import get_unit_name as get_time_unit_name
 
+# Imported as modules, as the classes of neighbouring orders import each other
+from . import jerk, velocity
+from .converter import UNIT_DELTAS_PER_SI_UNIT
+
+if TYPE_CHECKING:
+    from .jerk import Jerk
+    from .velocity import Velocity
+
 
 class Acceleration:
     """The rate of change of the velocity of an object with respect to time."""
 
+    __slots__ = (
+        "_distance_unit",
+        "_first_time_unit",
+        "_second_time_unit",
+        "_value",
+        "_value_as_metre_per_second_per_second",
+    )
+
     def __init__(
         self,
         value: float,
@@ -38,6 +50,37 @@ class Acceleration:
         self._second_time_unit = (
             second_time_unit if second_time_unit is not None else first_time_unit
         )
+        units = (self._distance_unit, self._first_time_unit, self._second_time_unit)
+        try:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+        self._value_as_metre_per_second_per_second = value / unit_delta_per_si_unit
+
+    @classmethod
+    def _create(
+        cls,
+        value: float,
+        distance_unit: DistanceUnit,
+        first_time_unit: TimeUnit,
+        second_time_unit: TimeUnit,
+        value_as_metre_per_second_per_second: float,
+    ) -> "Acceleration":
+        """Create an acceleration from its value in both the units & SI units.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        acceleration: Acceleration = cls.__new__(cls)
+        acceleration._value = value
+        acceleration._distance_unit = distance_unit
+        acceleration._first_time_unit = first_time_unit
+        acceleration._second_time_unit = second_time_unit
+        acceleration._value_as_metre_per_second_per_second = (
+            value_as_metre_per_second_per_second
+        )
+        return acceleration
 
     def as_unit(
         self,
@@ -49,59 +92,71 @@ class Acceleration:
 
         If a second time unit is not provided, the first time unit will be reused.
         """
-        internal_distance_unit_delta_per_metre = get_distance_unit_delta_per_metre(
-            self._distance_unit
-        )
-        internal_first_time_unit_delta_per_second = get_time_unit_delta_per_second(
-            self._first_time_unit
-        )
-        internal_second_time_unit_delta_per_second = get_time_unit_delta_per_second(
-            self._second_time_unit
-        )
-        internal_unit_to_metre_per_second_per_second_factor = (
-            internal_second_time_unit_delta_per_second
-            * internal_first_time_unit_delta_per_second
-            / internal_distance_unit_delta_per_metre
-        )
-        value_as_metre_per_second_per_second = (
-            internal_unit_to_metre_per_second_per_second_factor * self._value
-        )
-        external_distance_unit_delta_per_metre = get_distance_unit_delta_per_metre(
-            distance_unit
-        )
-        external_first_time_unit_delta_per_second = get_time_unit_delta_per_second(
-            first_time_unit
-        )
-        external_second_time_unit_delta_per_second = (
-            get_time_unit_delta_per_second(second_time_unit)
-            if second_time_unit is not None
-            else external_first_time_unit_delta_per_second
-        )
-        metre_per_second_per_second_to_external_unit_factor = (
-            external_distance_unit_delta_per_metre
-            / (
-                external_first_time_unit_delta_per_second
-                * external_second_time_unit_delta_per_second
+        if second_time_unit is None:
+            second_time_unit = first_time_unit
+        units = (distance_unit, first_time_unit, second_time_unit)
+        try:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+        return self._value_as_metre_per_second_per_second * unit_delta_per_si_unit
+
+    @overload
+    def __mul__(self, other: float) -> "Acceleration": ...
+
+    @overload
+    def __mul__(self, other: TimeDelta) -> "Velocity": ...
+
+    def __mul__(self, other: "float | TimeDelta") -> "Acceleration | Velocity":
+        """Return a scaled acceleration or a velocity.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a :py:class:`float`, return an acceleration scaled by the
+          value
+        - If the argument is a :py:class:`TimeDelta`, return the velocity gained at the
+          acceleration over the time difference
+        """
+        if isinstance(other, TimeDelta):
+            value_as_metre_per_second = (
+                self._value_as_metre_per_second_per_second * other._value_as_second
+            )
+            if self._second_time_unit == other._unit:
+                return velocity.Velocity._create(
+                    self._value * other._value,
+                    self._distance_unit,
+                    self._first_time_unit,
+                    value_as_metre_per_second,
+                )
+
+            return velocity.Velocity._create(
+                value_as_metre_per_second,
+                DistanceUnit.METRE,
+                TimeUnit.SECOND,
+                value_as_metre_per_second,
             )
-        )
-        return (
-            metre_per_second_per_second_to_external_unit_factor
-            * value_as_metre_per_second_per_second
-        )
 
-    def __mul__(self, value: float) -> "Acceleration":
-        """Return an acceleration scaled by the value."""
-        scaled_value = self._value * value
-        return Acceleration(
+        scaled_value = self._value * other
+        return Acceleration._create(
             scaled_value,
             self._distance_unit,
             self._first_time_unit,
             self._second_time_unit,
+            self._value_as_metre_per_second_per_second * other,
         )
 
-    def __rmul__(self, value: float) -> "Acceleration":
-        """Return an acceleration scaled by the value."""
-        return self * value
+    @overload
+    def __rmul__(self, other: float) -> "Acceleration": ...
+
+    @overload
+    def __rmul__(self, other: TimeDelta) -> "Velocity": ...
+
+    def __rmul__(self, other: "float | TimeDelta") -> "Acceleration | Velocity":
+        """Return a scaled acceleration or a velocity.
+
+        The product is the same as with the operands the other way around.
+        """
+        return self * other
 
     @overload
     def __truediv__(self, other: float) -> "Acceleration": ...
@@ -109,8 +164,13 @@ class Acceleration:
     @overload
     def __truediv__(self, other: "Acceleration") -> float: ...
 
-    def __truediv__(self, other: "float | Acceleration") -> "Acceleration | float":
-        """Return a scaled acceleration or the ratio between the accelerations.
+    @overload
+    def __truediv__(self, other: TimeDelta) -> "Jerk": ...
+
+    def __truediv__(
+        self, other: "float | Acceleration | TimeDelta"
+    ) -> "Acceleration | float | Jerk":
+        """Return a scaled acceleration, a ratio or a jerk.
 
         The behaviour depends upon the type of the argument.
 
@@ -118,55 +178,91 @@ class Acceleration:
           inverse of the value
         - If the argument is a :py:class:`Acceleration`, return the ratio between the
           two accelerations
+        - If the argument is a :py:class:`TimeDelta`, return the average jerk over the
+          time difference
         """
         if isinstance(other, Acceleration):
-            value_as_metre_per_second_per_second = self.as_unit(
-                DistanceUnit.METRE, TimeUnit.SECOND
-            )
-            other_value_as_metre_per_second_per_second = other.as_unit(
-                DistanceUnit.METRE, TimeUnit.SECOND
-            )
             return (
-                value_as_metre_per_second_per_second
-                / other_value_as_metre_per_second_per_second
+                self._value_as_metre_per_second_per_second
+                / other._value_as_metre_per_second_per_second
+            )
+
+        if isinstance(other, TimeDelta):
+            return jerk.Jerk._create(
+                self._value / other._value,
+                self._distance_unit,
+                self._first_time_unit,
+                self._second_time_unit,
+                other._unit,
+                self._value_as_metre_per_second_per_second / other._value_as_second,
             )
 
         return (1 / other) * self
 
     def __add__(self, other: "Acceleration") -> "Acceleration":
         """Return the sum of two accelerations."""
-        value_as_metre_per_second_per_second = self.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
-        other_value_as_metre_per_second_per_second = other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
+        if (
+            self._distance_unit == other._distance_unit
+            and self._first_time_unit == other._first_time_unit
+            and self._second_time_unit == other._second_time_unit
+        ):
+            value_sum = self._value + other._value
+            units = (self._distance_unit, self._first_time_unit, self._second_time_unit)
+            try:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+            except KeyError:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+            return Acceleration._create(
+                value_sum,
+                self._distance_unit,
+                self._first_time_unit,
+                self._second_time_unit,
+                value_sum / unit_delta_per_si_unit,
+            )
+
         value_sum_as_metre_per_second_per_second = (
-            value_as_metre_per_second_per_second
-            + other_value_as_metre_per_second_per_second
+            self._value_as_metre_per_second_per_second
+            + other._value_as_metre_per_second_per_second
         )
-        return Acceleration(
+        return Acceleration._create(
             value_sum_as_metre_per_second_per_second,
             DistanceUnit.METRE,
             TimeUnit.SECOND,
+            TimeUnit.SECOND,
+            value_sum_as_metre_per_second_per_second,
         )
 
     def __sub__(self, other: "Acceleration") -> "Acceleration":
         """Return the difference of two accelerations."""
-        value_as_metre_per_second_per_second = self.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
-        other_value_as_metre_per_second_per_second = other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
+        if (
+            self._distance_unit == other._distance_unit
+            and self._first_time_unit == other._first_time_unit
+            and self._second_time_unit == other._second_time_unit
+        ):
+            value_difference = self._value - other._value
+            units = (self._distance_unit, self._first_time_unit, self._second_time_unit)
+            try:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+            except KeyError:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+            return Acceleration._create(
+                value_difference,
+                self._distance_unit,
+                self._first_time_unit,
+                self._second_time_unit,
+                value_difference / unit_delta_per_si_unit,
+            )
+
         value_difference_as_metre_per_second_per_second = (
-            value_as_metre_per_second_per_second
-            - other_value_as_metre_per_second_per_second
+            self._value_as_metre_per_second_per_second
+            - other._value_as_metre_per_second_per_second
         )
-        return Acceleration(
+        return Acceleration._create(
             value_difference_as_metre_per_second_per_second,
             DistanceUnit.METRE,
             TimeUnit.SECOND,
+            TimeUnit.SECOND,
+            value_difference_as_metre_per_second_per_second,
         )
 
     def __neg__(self) -> "Acceleration":
@@ -176,50 +272,33 @@ class Acceleration:
     def __abs__(self) -> "Acceleration":
         """Return the absolute version of the acceleration."""
         absolute_value = abs(self._value)
-        return Acceleration(
+        return Acceleration._create(
             absolute_value,
             self._distance_unit,
             self._first_time_unit,
             self._second_time_unit,
+            abs(self._value_as_metre_per_second_per_second),
         )
 
     def __floordiv__(self, other: "Acceleration") -> float:
         """Return the floored ratio between the accelerations."""
-        value_as_metre_per_second_per_second = self.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
-        other_value_as_metre_per_second_per_second = other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
         return (
-            value_as_metre_per_second_per_second
-            // other_value_as_metre_per_second_per_second
+            self._value_as_metre_per_second_per_second
+            // other._value_as_metre_per_second_per_second
         )
 
     def __mod__(self, other: "Acceleration") -> float:
         """Return the remainder of the ratio between the acceleration."""
-        value_as_metre_per_second_per_second = self.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
-        other_value_as_metre_per_second_per_second = other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
         return (
-            value_as_metre_per_second_per_second
-            % other_value_as_metre_per_second_per_second
+            self._value_as_metre_per_second_per_second
+            % other._value_as_metre_per_second_per_second
         )
 
     def __divmod__(self, other: "Acceleration") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the accelerations."""
-        value_as_metre_per_second_per_second = self.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
-        other_value_as_metre_per_second_per_second = other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
         return divmod(
-            value_as_metre_per_second_per_second,
-            other_value_as_metre_per_second_per_second,
+            self._value_as_metre_per_second_per_second,
+            other._value_as_metre_per_second_per_second,
         )
 
     def __eq__(self, other: object) -> bool:
@@ -227,37 +306,42 @@ class Acceleration:
         if not isinstance(other, Acceleration):
             return NotImplemented
 
-        return self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND) == other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
+        return (
+            self._value_as_metre_per_second_per_second
+            == other._value_as_metre_per_second_per_second
         )
 
     def __lt__(self, other: "Acceleration") -> bool:
         """Return whether the acceleration is less than the other."""
-        return self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND) < other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
+        return (
+            self._value_as_metre_per_second_per_second
+            < other._value_as_metre_per_second_per_second
         )
 
     def __le__(self, other: "Acceleration") -> bool:
         """Return whether the acceleration is less than or equal to the other."""
-        return self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND) <= other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
+        return (
+            self._value_as_metre_per_second_per_second
+            <= other._value_as_metre_per_second_per_second
         )
 
     def __gt__(self, other: "Acceleration") -> bool:
         """Return whether the acceleration is greater than the other."""
-        return self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND) > other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
+        return (
+            self._value_as_metre_per_second_per_second
+            > other._value_as_metre_per_second_per_second
         )
 
     def __ge__(self, other: "Acceleration") -> bool:
         """Return whether the acceleration is greater than or equal to the other."""
-        return self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND) >= other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
+        return (
+            self._value_as_metre_per_second_per_second
+            >= other._value_as_metre_per_second_per_second
         )
 
     def __hash__(self) -> int:
         """Return the hash of the acceleration."""
-        return hash(self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND))
+        return hash(self._value_as_metre_per_second_per_second)
 
     def __str__(self) -> str:
         """Return a string representation of the acceleration."""
@@ -1,36 +1,75 @@
 """Module for the displacement class."""
 
+# pyright: reportPrivateUsage=false
 # ruff: noqa: TID252
 
-from typing import overload
+from typing import TYPE_CHECKING, overload
 
-from ..length import Unit as DistanceUnit
 from ..length import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
     get_unit_abbreviation,
     get_unit_delta_per_metre,
     get_unit_name,
 )
+from ..length import Unit as DistanceUnit
+from ..time import TimeDelta
+
+# Imported as modules, as the classes of neighbouring orders import each other
+from . import velocity
+
+if TYPE_CHECKING:
+    from .velocity import Velocity
 
 
 class Displacement:
     """The difference between the final and initial position of a trajectory."""
 
+    __slots__ = ("_unit", "_value", "_value_as_metre")
+
     def __init__(self, value: float, unit: DistanceUnit) -> None:
         """Initialise a new displacement."""
         self._value = value
         self._unit = unit
+        internal_unit_delta_per_metre = get_unit_delta_per_metre(self._unit)
+        self._value_as_metre = self._value / internal_unit_delta_per_metre
+
+    @classmethod
+    def _create(
+        cls, value: float, unit: DistanceUnit, value_as_metre: float
+    ) -> "Displacement":
+        """Create a displacement from its value in both the unit & metres.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        displacement: Displacement = cls.__new__(cls)
+        displacement._value = value
+        displacement._unit = unit
+        displacement._value_as_metre = value_as_metre
+        return displacement
 
     def as_unit(self, unit: DistanceUnit) -> float:
-        """Return the displacement, expressed as the unit."""
-        internal_unit_delta_per_metre = get_unit_delta_per_metre(self._unit)
-        value_as_metre = self._value / internal_unit_delta_per_metre
-        external_unit_delta_per_metre = get_unit_delta_per_metre(unit)
-        return external_unit_delta_per_metre * value_as_metre
+        """Return the displacement, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not a distance unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __mul__(self, value: float) -> "Displacement":
         """Return a displacement scaled by the value."""
         scaled_value = self._value * value
-        return Displacement(scaled_value, self._unit)
+        return Displacement._create(
+            scaled_value, self._unit, self._value_as_metre * value
+        )
 
     def __rmul__(self, value: float) -> "Displacement":
         """Return a displacement scaled by the value."""
@@ -42,8 +81,13 @@ class Displacement:
     @overload
     def __truediv__(self, other: "Displacement") -> float: ...
 
-    def __truediv__(self, other: "float | Displacement") -> "Displacement | float":
-        """Return a scaled displacement or the ratio between the displacements.
+    @overload
+    def __truediv__(self, other: TimeDelta) -> "Velocity": ...
+
+    def __truediv__(
+        self, other: "float | Displacement | TimeDelta"
+    ) -> "Displacement | float | Velocity":
+        """Return a scaled displacement, a ratio or a velocity.
 
         The behaviour depends upon the type of the argument.
 
@@ -51,21 +95,39 @@ class Displacement:
           inverse of the value
         - If the argument is a :py:class:`Displacement`, return the ratio between the
           two displacements
+        - If the argument is a :py:class:`TimeDelta`, return the average velocity over
+          the time difference
         """
         if isinstance(other, Displacement):
-            value_as_metre = self.as_unit(DistanceUnit.METRE)
-            other_value_as_metre = other.as_unit(DistanceUnit.METRE)
-            return value_as_metre / other_value_as_metre
+            return self._value_as_metre / other._value_as_metre
+
+        if isinstance(other, TimeDelta):
+            return velocity.Velocity._create(
+                self._value / other._value,
+                self._unit,
+                other._unit,
+                self._value_as_metre / other._value_as_second,
+            )
 
         scaled_value = self._value / other
-        return Displacement(scaled_value, self._unit)
+        return Displacement._create(
+            scaled_value, self._unit, self._value_as_metre / other
+        )
 
     def __add__(self, other: "Displacement") -> "Displacement":
         """Return the sum of the displacements."""
-        value_as_metre = self.as_unit(DistanceUnit.METRE)
-        delta_value_as_metre = other.as_unit(DistanceUnit.METRE)
-        added_value_as_metre = value_as_metre + delta_value_as_metre
-        return Displacement(added_value_as_metre, DistanceUnit.METRE)
+        if self._unit == other._unit:
+            value_sum = self._value + other._value
+            return Displacement._create(
+                value_sum,
+                self._unit,
+                value_sum / get_unit_delta_per_metre(self._unit),
+            )
+
+        added_value_as_metre = self._value_as_metre + other._value_as_metre
+        return Displacement._create(
+            added_value_as_metre, DistanceUnit.METRE, added_value_as_metre
+        )
 
     def __sub__(self, delta: "Displacement") -> "Displacement":
         """Return the difference between the displacements."""
@@ -74,57 +136,53 @@ class Displacement:
     def __neg__(self) -> "Displacement":
         """Return the inverse of the displacement."""
         inverted_value = -self._value
-        return Displacement(inverted_value, self._unit)
+        return Displacement._create(inverted_value, self._unit, -self._value_as_metre)
 
     def __abs__(self) -> "Displacement":
         """Return the absolute version of the displacement."""
         absolute_value = abs(self._value)
-        return Displacement(absolute_value, self._unit)
+        return Displacement._create(
+            absolute_value, self._unit, abs(self._value_as_metre)
+        )
 
     def __floordiv__(self, other: "Displacement") -> float:
         """Return the floored ratio between the displacements."""
-        value_as_metre = self.as_unit(DistanceUnit.METRE)
-        other_value_as_metre = other.as_unit(DistanceUnit.METRE)
-        return value_as_metre // other_value_as_metre
+        return self._value_as_metre // other._value_as_metre
 
     def __mod__(self, other: "Displacement") -> float:
         """Return the remainder of the ratio between the displacements."""
-        value_as_metre = self.as_unit(DistanceUnit.METRE)
-        other_value_as_metre = other.as_unit(DistanceUnit.METRE)
-        return value_as_metre % other_value_as_metre
+        return self._value_as_metre % other._value_as_metre
 
     def __divmod__(self, other: "Displacement") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the displacements."""
-        value_as_metre = self.as_unit(DistanceUnit.METRE)
-        other_value_as_metre = other.as_unit(DistanceUnit.METRE)
-        return divmod(value_as_metre, other_value_as_metre)
+        return divmod(self._value_as_metre, other._value_as_metre)
 
     def __eq__(self, other: object) -> bool:
         """Return whether the objects are equal displacements."""
         if not isinstance(other, Displacement):
             return NotImplemented
 
-        return self.as_unit(DistanceUnit.METRE) == other.as_unit(DistanceUnit.METRE)
+        return self._value_as_metre == other._value_as_metre
 
     def __lt__(self, other: "Displacement") -> bool:
         """Return whether the displacement is less than the other."""
-        return self.as_unit(DistanceUnit.METRE) < other.as_unit(DistanceUnit.METRE)
+        return self._value_as_metre < other._value_as_metre
 
     def __le__(self, other: "Displacement") -> bool:
         """Return whether the displacement is less than or equal to the other."""
-        return self.as_unit(DistanceUnit.METRE) <= other.as_unit(DistanceUnit.METRE)
+        return self._value_as_metre <= other._value_as_metre
 
     def __gt__(self, other: "Displacement") -> bool:
         """Return whether the displacement is greater than the other."""
-        return self.as_unit(DistanceUnit.METRE) > other.as_unit(DistanceUnit.METRE)
+        return self._value_as_metre > other._value_as_metre
 
     def __ge__(self, other: "Displacement") -> bool:
         """Return whether the displacement is greater than or equal to the other."""
-        return self.as_unit(DistanceUnit.METRE) >= other.as_unit(DistanceUnit.METRE)
+        return self._value_as_metre >= other._value_as_metre
 
     def __hash__(self) -> int:
         """Return the hash of the displacement."""
-        return hash(self.as_unit(DistanceUnit.METRE))
+        return hash(self._value_as_metre)
 
     def __str__(self) -> str:
         """Return a string representation of the displacement."""
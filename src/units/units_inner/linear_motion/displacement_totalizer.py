@@ -0,0 +1,67 @@
+"""Module for the displacement totalizer class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from ..length import Unit as DistanceUnit
+from ..length import get_unit_delta_per_metre
+from ..totalizer import Totalizer
+from .displacement import Displacement
+
+if TYPE_CHECKING:
+    from ..time import Time, TimeDelta
+    from .velocity import Velocity
+
+
+class DisplacementTotalizer:
+    """Totals the displacement travelled at a velocity over time, for odometry.
+
+    The total is kept in metres, with compensated summation, so that it does not
+    drift over millions of updates, and no objects are created by an update. The
+    total is returned as a displacement in the unit of the totalizer.
+    """
+
+    __slots__ = ("_totalizer", "_unit", "_unit_delta_per_metre")
+
+    def __init__(self, unit: DistanceUnit) -> None:
+        """Initialise a new totalizer, with a total of 0, returned in the unit."""
+        self._totalizer = Totalizer()
+        self._unit = unit
+        self._unit_delta_per_metre = get_unit_delta_per_metre(unit)
+
+    def add(self, velocity: "Velocity", duration: "TimeDelta") -> None:
+        """Add the displacement travelled at the velocity over the duration.
+
+        Raises:
+            ValueError: The duration is negative.
+        """
+        self._totalizer.add(
+            velocity._value_as_metre_per_second, duration._value_as_second
+        )
+
+    def update(self, velocity: "Velocity", time: "Time") -> None:
+        """Add the displacement travelled since the previous velocity was measured.
+
+        The velocity is taken to change linearly between the measurements, and the
+        first velocity only sets the start of the total.
+
+        Raises:
+            ValueError: The time is before the time of the previous velocity.
+        """
+        self._totalizer.update(
+            velocity._value_as_metre_per_second, time._value_as_second
+        )
+
+    def total(self) -> Displacement:
+        """Return the total displacement travelled so far."""
+        value_as_metre = self._totalizer.total
+        return Displacement._create(
+            value_as_metre * self._unit_delta_per_metre, self._unit, value_as_metre
+        )
+
+    def reset(self) -> None:
+        """Set the total back to 0, and forget the previous velocity."""
+        self._totalizer.reset()
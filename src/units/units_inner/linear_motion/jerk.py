@@ -1,26 +1,38 @@
 """Module for the jerk class."""
 
+# pyright: reportPrivateUsage=false
 # ruff: noqa: TID252
 
-from typing import overload
+from typing import TYPE_CHECKING, overload
 
 from ..length import Unit as DistanceUnit
 from ..length import get_unit_abbreviation as get_distance_unit_abbreviation
-from ..length import (
-    get_unit_delta_per_metre as get_distance_unit_delta_per_metre,
-)
 from ..length import get_unit_name as get_distance_unit_name
+from ..time import TimeDelta
 from ..time import Unit as TimeUnit
 from ..time import get_unit_abbreviation as get_time_unit_abbreviation
-from ..time import (
-    get_unit_delta_per_second as get_time_unit_delta_per_second,
-)
 from ..time import get_unit_name as get_time_unit_name
 
+# Imported as modules, as the classes of neighbouring orders import each other
+from . import acceleration
+from .converter import UNIT_DELTAS_PER_SI_UNIT
+
+if TYPE_CHECKING:
+    from .acceleration import Acceleration
+
 
 class Jerk:
     """The rate of change of the jerk of an object with respect to time."""
 
+    __slots__ = (
+        "_distance_unit",
+        "_first_time_unit",
+        "_second_time_unit",
+        "_third_time_unit",
+        "_value",
+        "_value_as_metre_per_second_cubed",
+    )
+
     def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
         self,
         value: float,
@@ -44,8 +56,44 @@ class Jerk:
         self._third_time_unit = (
             third_time_unit if third_time_unit is not None else self._second_time_unit
         )
+        units = (
+            self._distance_unit,
+            self._first_time_unit,
+            self._second_time_unit,
+            self._third_time_unit,
+        )
+        try:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+        self._value_as_metre_per_second_cubed = value / unit_delta_per_si_unit
 
-    def as_unit(  # pylint: disable=too-many-locals
+    @classmethod
+    def _create(  # noqa: PLR0913, PLR0917 # pylint: disable=too-many-arguments, too-many-positional-arguments
+        cls,
+        value: float,
+        distance_unit: DistanceUnit,
+        first_time_unit: TimeUnit,
+        second_time_unit: TimeUnit,
+        third_time_unit: TimeUnit,
+        value_as_metre_per_second_cubed: float,
+    ) -> "Jerk":
+        """Create a jerk from its value in both the units & SI units.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        jerk: Jerk = cls.__new__(cls)
+        jerk._value = value
+        jerk._distance_unit = distance_unit
+        jerk._first_time_unit = first_time_unit
+        jerk._second_time_unit = second_time_unit
+        jerk._third_time_unit = third_time_unit
+        jerk._value_as_metre_per_second_cubed = value_as_metre_per_second_cubed
+        return jerk
+
+    def as_unit(
         self,
         distance_unit: DistanceUnit,
         first_time_unit: TimeUnit,
@@ -58,70 +106,75 @@ class Jerk:
         If the third time unit is not provided, the second time unit will be reused
         (or the first, if the second is also not provided).
         """
-        internal_distance_unit_delta_per_metre = get_distance_unit_delta_per_metre(
-            self._distance_unit
-        )
-        internal_first_time_unit_delta_per_second = get_time_unit_delta_per_second(
-            self._first_time_unit
-        )
-        internal_second_time_unit_delta_per_second = get_time_unit_delta_per_second(
-            self._second_time_unit
-        )
-        internal_third_time_unit_delta_per_second = get_time_unit_delta_per_second(
-            self._third_time_unit
-        )
-        internal_unit_to_metre_per_second_cubed_factor = (
-            internal_third_time_unit_delta_per_second
-            * internal_second_time_unit_delta_per_second
-            * internal_first_time_unit_delta_per_second
-            / internal_distance_unit_delta_per_metre
-        )
-        value_as_metre_per_second_cubed = (
-            internal_unit_to_metre_per_second_cubed_factor * self._value
-        )
-        external_distance_unit_delta_per_metre = get_distance_unit_delta_per_metre(
-            distance_unit
-        )
-        external_first_time_unit_delta_per_second = get_time_unit_delta_per_second(
-            first_time_unit
-        )
-        external_second_time_unit_delta_per_second = (
-            get_time_unit_delta_per_second(second_time_unit)
-            if second_time_unit is not None
-            else external_first_time_unit_delta_per_second
-        )
-        external_third_time_unit_delta_per_second = (
-            get_time_unit_delta_per_second(third_time_unit)
-            if third_time_unit is not None
-            else external_second_time_unit_delta_per_second
-        )
-        metre_per_second_cubed_to_external_unit_factor = (
-            external_distance_unit_delta_per_metre
-            / (
-                external_first_time_unit_delta_per_second
-                * external_second_time_unit_delta_per_second
-                * external_third_time_unit_delta_per_second
+        if second_time_unit is None:
+            second_time_unit = first_time_unit
+        if third_time_unit is None:
+            third_time_unit = second_time_unit
+        units = (distance_unit, first_time_unit, second_time_unit, third_time_unit)
+        try:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+        return self._value_as_metre_per_second_cubed * unit_delta_per_si_unit
+
+    @overload
+    def __mul__(self, other: float) -> "Jerk": ...
+
+    @overload
+    def __mul__(self, other: TimeDelta) -> "Acceleration": ...
+
+    def __mul__(self, other: "float | TimeDelta") -> "Jerk | Acceleration":
+        """Return a scaled jerk or an acceleration.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a :py:class:`float`, return a jerk scaled by the value
+        - If the argument is a :py:class:`TimeDelta`, return the acceleration gained at
+          the jerk over the time difference
+        """
+        if isinstance(other, TimeDelta):
+            value_as_metre_per_second_per_second = (
+                self._value_as_metre_per_second_cubed * other._value_as_second
+            )
+            if self._third_time_unit == other._unit:
+                return acceleration.Acceleration._create(
+                    self._value * other._value,
+                    self._distance_unit,
+                    self._first_time_unit,
+                    self._second_time_unit,
+                    value_as_metre_per_second_per_second,
+                )
+
+            return acceleration.Acceleration._create(
+                value_as_metre_per_second_per_second,
+                DistanceUnit.METRE,
+                TimeUnit.SECOND,
+                TimeUnit.SECOND,
+                value_as_metre_per_second_per_second,
             )
-        )
-        return (
-            metre_per_second_cubed_to_external_unit_factor
-            * value_as_metre_per_second_cubed
-        )
 
-    def __mul__(self, value: float) -> "Jerk":
-        """Return an jerk scaled by the value."""
-        scaled_value = self._value * value
-        return Jerk(
+        scaled_value = self._value * other
+        return Jerk._create(
             scaled_value,
             self._distance_unit,
             self._first_time_unit,
             self._second_time_unit,
             self._third_time_unit,
+            self._value_as_metre_per_second_cubed * other,
         )
 
-    def __rmul__(self, value: float) -> "Jerk":
-        """Return an jerk scaled by the value."""
-        return self * value
+    @overload
+    def __rmul__(self, other: float) -> "Jerk": ...
+
+    @overload
+    def __rmul__(self, other: TimeDelta) -> "Acceleration": ...
+
+    def __rmul__(self, other: "float | TimeDelta") -> "Jerk | Acceleration":
+        """Return a scaled jerk or an acceleration.
+
+        The product is the same as with the operands the other way around.
+        """
+        return self * other
 
     @overload
     def __truediv__(self, other: float) -> "Jerk": ...
@@ -140,50 +193,93 @@ class Jerk:
           jerks
         """
         if isinstance(other, Jerk):
-            value_as_metre_per_second_cubed = self.as_unit(
-                DistanceUnit.METRE, TimeUnit.SECOND
-            )
-            other_value_as_metre_per_second_cubed = other.as_unit(
-                DistanceUnit.METRE, TimeUnit.SECOND
-            )
             return (
-                value_as_metre_per_second_cubed / other_value_as_metre_per_second_cubed
+                self._value_as_metre_per_second_cubed
+                / other._value_as_metre_per_second_cubed
             )
 
         return (1 / other) * self
 
     def __add__(self, other: "Jerk") -> "Jerk":
         """Return the sum of two jerks."""
-        value_as_metre_per_second_cubed = self.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
-        other_value_as_metre_per_second_cubed = other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
+        if (
+            self._distance_unit == other._distance_unit
+            and self._first_time_unit == other._first_time_unit
+            and self._second_time_unit == other._second_time_unit
+            and self._third_time_unit == other._third_time_unit
+        ):
+            value_sum = self._value + other._value
+            units = (
+                self._distance_unit,
+                self._first_time_unit,
+                self._second_time_unit,
+                self._third_time_unit,
+            )
+            try:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+            except KeyError:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+            return Jerk._create(
+                value_sum,
+                self._distance_unit,
+                self._first_time_unit,
+                self._second_time_unit,
+                self._third_time_unit,
+                value_sum / unit_delta_per_si_unit,
+            )
+
         value_sum_as_metre_per_second_cubed = (
-            value_as_metre_per_second_cubed + other_value_as_metre_per_second_cubed
+            self._value_as_metre_per_second_cubed
+            + other._value_as_metre_per_second_cubed
         )
-        return Jerk(
+        return Jerk._create(
             value_sum_as_metre_per_second_cubed,
             DistanceUnit.METRE,
             TimeUnit.SECOND,
+            TimeUnit.SECOND,
+            TimeUnit.SECOND,
+            value_sum_as_metre_per_second_cubed,
         )
 
     def __sub__(self, other: "Jerk") -> "Jerk":
         """Return the difference of two jerks."""
-        value_as_metre_per_second_cubed = self.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
-        other_value_as_metre_per_second_cubed = other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
+        if (
+            self._distance_unit == other._distance_unit
+            and self._first_time_unit == other._first_time_unit
+            and self._second_time_unit == other._second_time_unit
+            and self._third_time_unit == other._third_time_unit
+        ):
+            value_difference = self._value - other._value
+            units = (
+                self._distance_unit,
+                self._first_time_unit,
+                self._second_time_unit,
+                self._third_time_unit,
+            )
+            try:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+            except KeyError:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+            return Jerk._create(
+                value_difference,
+                self._distance_unit,
+                self._first_time_unit,
+                self._second_time_unit,
+                self._third_time_unit,
+                value_difference / unit_delta_per_si_unit,
+            )
+
         value_difference_as_metre_per_second_cubed = (
-            value_as_metre_per_second_cubed - other_value_as_metre_per_second_cubed
+            self._value_as_metre_per_second_cubed
+            - other._value_as_metre_per_second_cubed
         )
-        return Jerk(
+        return Jerk._create(
             value_difference_as_metre_per_second_cubed,
             DistanceUnit.METRE,
             TimeUnit.SECOND,
+            TimeUnit.SECOND,
+            TimeUnit.SECOND,
+            value_difference_as_metre_per_second_cubed,
         )
 
     def __neg__(self) -> "Jerk":
@@ -193,44 +289,34 @@ class Jerk:
     def __abs__(self) -> "Jerk":
         """Return the absolute version of the jerk."""
         absolute_value = abs(self._value)
-        return Jerk(
+        return Jerk._create(
             absolute_value,
             self._distance_unit,
             self._first_time_unit,
             self._second_time_unit,
+            self._second_time_unit,
+            abs(self._value_as_metre_per_second_cubed),
         )
 
     def __floordiv__(self, other: "Jerk") -> float:
         """Return the floored ratio between the jerks."""
-        value_as_metre_per_second_cubed = self.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
-        other_value_as_metre_per_second_cubed = other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
+        return (
+            self._value_as_metre_per_second_cubed
+            // other._value_as_metre_per_second_cubed
         )
-        return value_as_metre_per_second_cubed // other_value_as_metre_per_second_cubed
 
     def __mod__(self, other: "Jerk") -> float:
         """Return the remainder of the ratio between the jerk."""
-        value_as_metre_per_second_cubed = self.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
-        other_value_as_metre_per_second_cubed = other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
+        return (
+            self._value_as_metre_per_second_cubed
+            % other._value_as_metre_per_second_cubed
         )
-        return value_as_metre_per_second_cubed % other_value_as_metre_per_second_cubed
 
     def __divmod__(self, other: "Jerk") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the jerks."""
-        value_as_metre_per_second_cubed = self.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
-        other_value_as_metre_per_second_cubed = other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
         return divmod(
-            value_as_metre_per_second_cubed,
-            other_value_as_metre_per_second_cubed,
+            self._value_as_metre_per_second_cubed,
+            other._value_as_metre_per_second_cubed,
         )
 
     def __eq__(self, other: object) -> bool:
@@ -238,37 +324,42 @@ class Jerk:
         if not isinstance(other, Jerk):
             return NotImplemented
 
-        return self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND) == other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
+        return (
+            self._value_as_metre_per_second_cubed
+            == other._value_as_metre_per_second_cubed
         )
 
     def __lt__(self, other: "Jerk") -> bool:
         """Return whether the jerk is less than the other."""
-        return self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND) < other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
+        return (
+            self._value_as_metre_per_second_cubed
+            < other._value_as_metre_per_second_cubed
         )
 
     def __le__(self, other: "Jerk") -> bool:
         """Return whether the jerk is less than or equal to the other."""
-        return self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND) <= other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
+        return (
+            self._value_as_metre_per_second_cubed
+            <= other._value_as_metre_per_second_cubed
         )
 
     def __gt__(self, other: "Jerk") -> bool:
         """Return whether the jerk is greater than the other."""
-        return self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND) > other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
+        return (
+            self._value_as_metre_per_second_cubed
+            > other._value_as_metre_per_second_cubed
         )
 
     def __ge__(self, other: "Jerk") -> bool:
         """Return whether the jerk is greater than or equal to the other."""
-        return self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND) >= other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
+        return (
+            self._value_as_metre_per_second_cubed
+            >= other._value_as_metre_per_second_cubed
         )
 
     def __hash__(self) -> int:
         """Return the hash of the jerk."""
-        return hash(self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND))
+        return hash(self._value_as_metre_per_second_cubed)
 
     def __str__(self) -> str:
         """Return a string representation of the jerk."""
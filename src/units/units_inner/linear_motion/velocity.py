@@ -1,24 +1,32 @@
 """Module for the velocity class."""
 
+# pyright: reportPrivateUsage=false
 # ruff: noqa: TID252
 
-from typing import overload
+from typing import TYPE_CHECKING, overload
 
 from ..length import Unit as DistanceUnit
 from ..length import get_unit_abbreviation as get_distance_unit_abbreviation
-from ..length import (
-    get_unit_delta_per_metre as get_distance_unit_delta_per_metre,
-)
 from ..length import get_unit_name as get_distance_unit_name
+from ..time import TimeDelta
 from ..time import Unit as TimeUnit
 from ..time import get_unit_abbreviation as get_time_unit_abbreviation
-from ..time import get_unit_delta_per_second as get_time_unit_delta_per_second
 from ..time import get_unit_name as get_time_unit_name
 
+# Imported as modules, as the classes of neighbouring orders import each other
+from . import acceleration, displacement
+from .converter import UNIT_DELTAS_PER_SI_UNIT
+
+if TYPE_CHECKING:
+    from .acceleration import Acceleration
+    from .displacement import Displacement
+
 
 class Velocity:
     """The rate of change of the displacement of an object wrt time."""
 
+    __slots__ = ("_distance_unit", "_time_unit", "_value", "_value_as_metre_per_second")
+
     def __init__(
         self, value: float, distance_unit: DistanceUnit, time_unit: TimeUnit
     ) -> None:
@@ -26,38 +34,89 @@ class Velocity:
         self._value = value
         self._distance_unit = distance_unit
         self._time_unit = time_unit
+        units = (self._distance_unit, self._time_unit)
+        try:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+        self._value_as_metre_per_second = value / unit_delta_per_si_unit
+
+    @classmethod
+    def _create(
+        cls,
+        value: float,
+        distance_unit: DistanceUnit,
+        time_unit: TimeUnit,
+        value_as_metre_per_second: float,
+    ) -> "Velocity":
+        """Create a velocity from its value in both the units & SI units.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        velocity: Velocity = cls.__new__(cls)
+        velocity._value = value
+        velocity._distance_unit = distance_unit
+        velocity._time_unit = time_unit
+        velocity._value_as_metre_per_second = value_as_metre_per_second
+        return velocity
 
     def as_unit(self, distance_unit: DistanceUnit, time_unit: TimeUnit) -> float:
         """Return the velocity in the specified units."""
-        internal_distance_unit_delta_per_metre = get_distance_unit_delta_per_metre(
-            self._distance_unit
-        )
-        internal_time_unit_delta_per_second = get_time_unit_delta_per_second(
-            self._time_unit
-        )
-        internal_unit_to_metre_per_second_factor = (
-            internal_time_unit_delta_per_second / internal_distance_unit_delta_per_metre
-        )
-        value_as_metre_per_second = (
-            internal_unit_to_metre_per_second_factor * self._value
-        )
-        external_distance_unit_delta_per_metre = get_distance_unit_delta_per_metre(
-            distance_unit
-        )
-        external_time_unit_delta_per_second = get_time_unit_delta_per_second(time_unit)
-        metre_per_second_to_external_unit_factor = (
-            external_distance_unit_delta_per_metre / external_time_unit_delta_per_second
+        units = (distance_unit, time_unit)
+        try:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+        return self._value_as_metre_per_second * unit_delta_per_si_unit
+
+    @overload
+    def __mul__(self, other: float) -> "Velocity": ...
+
+    @overload
+    def __mul__(self, other: TimeDelta) -> "Displacement": ...
+
+    def __mul__(self, other: "float | TimeDelta") -> "Velocity | Displacement":
+        """Return a scaled velocity or a displacement.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a :py:class:`float`, return a velocity scaled by the value
+        - If the argument is a :py:class:`TimeDelta`, return the displacement gained at
+          the velocity over the time difference
+        """
+        if isinstance(other, TimeDelta):
+            value_as_metre = self._value_as_metre_per_second * other._value_as_second
+            if self._time_unit == other._unit:
+                return displacement.Displacement._create(
+                    self._value * other._value, self._distance_unit, value_as_metre
+                )
+
+            return displacement.Displacement._create(
+                value_as_metre, DistanceUnit.METRE, value_as_metre
+            )
+
+        scaled_value = self._value * other
+        return Velocity._create(
+            scaled_value,
+            self._distance_unit,
+            self._time_unit,
+            self._value_as_metre_per_second * other,
         )
-        return metre_per_second_to_external_unit_factor * value_as_metre_per_second
 
-    def __mul__(self, value: float) -> "Velocity":
-        """Return a velocity scaled by the value."""
-        scaled_value = self._value * value
-        return Velocity(scaled_value, self._distance_unit, self._time_unit)
+    @overload
+    def __rmul__(self, other: float) -> "Velocity": ...
 
-    def __rmul__(self, value: float) -> "Velocity":
-        """Return a velocity scaled by the value."""
-        return self * value
+    @overload
+    def __rmul__(self, other: TimeDelta) -> "Displacement": ...
+
+    def __rmul__(self, other: "float | TimeDelta") -> "Velocity | Displacement":
+        """Return a scaled velocity or a displacement.
+
+        The product is the same as with the operands the other way around.
+        """
+        return self * other
 
     @overload
     def __truediv__(self, other: float) -> "Velocity": ...
@@ -65,8 +124,13 @@ class Velocity:
     @overload
     def __truediv__(self, other: "Velocity") -> float: ...
 
-    def __truediv__(self, other: "float | Velocity") -> "Velocity | float":
-        """Return a scaled velocity or the ratio between the velocities.
+    @overload
+    def __truediv__(self, other: TimeDelta) -> "Acceleration": ...
+
+    def __truediv__(
+        self, other: "float | Velocity | TimeDelta"
+    ) -> "Velocity | float | Acceleration":
+        """Return a scaled velocity, a ratio or an acceleration.
 
         The behaviour depends upon the type of the argument.
 
@@ -74,44 +138,79 @@ class Velocity:
           inverse of the value
         - If the argument is a :py:class:`Velocity`, return the ratio between the two
           velocities
+        - If the argument is a :py:class:`TimeDelta`, return the average acceleration
+          over the time difference
         """
         if isinstance(other, Velocity):
-            value_as_metre_per_second = self.as_unit(
-                DistanceUnit.METRE, TimeUnit.SECOND
-            )
-            other_value_as_metre_per_second = other.as_unit(
-                DistanceUnit.METRE, TimeUnit.SECOND
+            return self._value_as_metre_per_second / other._value_as_metre_per_second
+
+        if isinstance(other, TimeDelta):
+            return acceleration.Acceleration._create(
+                self._value / other._value,
+                self._distance_unit,
+                self._time_unit,
+                other._unit,
+                self._value_as_metre_per_second / other._value_as_second,
             )
-            return value_as_metre_per_second / other_value_as_metre_per_second
 
         return (1 / other) * self
 
     def __add__(self, other: "Velocity") -> "Velocity":
         """Return the sum of two velocities."""
-        value_as_metre_per_second = self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND)
-        other_value_as_metre_per_second = other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
+        if (
+            self._distance_unit == other._distance_unit
+            and self._time_unit == other._time_unit
+        ):
+            value_sum = self._value + other._value
+            units = (self._distance_unit, self._time_unit)
+            try:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+            except KeyError:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+            return Velocity._create(
+                value_sum,
+                self._distance_unit,
+                self._time_unit,
+                value_sum / unit_delta_per_si_unit,
+            )
+
         value_sum_as_metre_per_second = (
-            value_as_metre_per_second + other_value_as_metre_per_second
+            self._value_as_metre_per_second + other._value_as_metre_per_second
         )
-        return Velocity(
-            value_sum_as_metre_per_second, DistanceUnit.METRE, TimeUnit.SECOND
+        return Velocity._create(
+            value_sum_as_metre_per_second,
+            DistanceUnit.METRE,
+            TimeUnit.SECOND,
+            value_sum_as_metre_per_second,
         )
 
     def __sub__(self, other: "Velocity") -> "Velocity":
         """Return the difference of two velocities."""
-        value_as_metre_per_second = self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND)
-        other_value_as_metre_per_second = other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
+        if (
+            self._distance_unit == other._distance_unit
+            and self._time_unit == other._time_unit
+        ):
+            value_difference = self._value - other._value
+            units = (self._distance_unit, self._time_unit)
+            try:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+            except KeyError:
+                unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+            return Velocity._create(
+                value_difference,
+                self._distance_unit,
+                self._time_unit,
+                value_difference / unit_delta_per_si_unit,
+            )
+
         value_difference_as_metre_per_second = (
-            value_as_metre_per_second - other_value_as_metre_per_second
+            self._value_as_metre_per_second - other._value_as_metre_per_second
         )
-        return Velocity(
+        return Velocity._create(
             value_difference_as_metre_per_second,
             DistanceUnit.METRE,
             TimeUnit.SECOND,
+            value_difference_as_metre_per_second,
         )
 
     def __neg__(self) -> "Velocity":
@@ -121,68 +220,51 @@ class Velocity:
     def __abs__(self) -> "Velocity":
         """Return the absolute version of the velocity."""
         absolute_value = abs(self._value)
-        return Velocity(absolute_value, self._distance_unit, self._time_unit)
+        return Velocity._create(
+            absolute_value,
+            self._distance_unit,
+            self._time_unit,
+            abs(self._value_as_metre_per_second),
+        )
 
     def __floordiv__(self, other: "Velocity") -> float:
         """Return the floored ratio between the velocities."""
-        value_as_metre_per_second = self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND)
-        other_value_as_metre_per_second = other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
-        return value_as_metre_per_second // other_value_as_metre_per_second
+        return self._value_as_metre_per_second // other._value_as_metre_per_second
 
     def __mod__(self, other: "Velocity") -> float:
         """Return the remainder of the ratio between the velocity."""
-        value_as_metre_per_second = self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND)
-        other_value_as_metre_per_second = other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
-        return value_as_metre_per_second % other_value_as_metre_per_second
+        return self._value_as_metre_per_second % other._value_as_metre_per_second
 
     def __divmod__(self, other: "Velocity") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the velocities."""
-        value_as_metre_per_second = self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND)
-        other_value_as_metre_per_second = other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
-        return divmod(value_as_metre_per_second, other_value_as_metre_per_second)
+        return divmod(self._value_as_metre_per_second, other._value_as_metre_per_second)
 
     def __eq__(self, other: object) -> bool:
         """Return whether the objects are equal velocities."""
         if not isinstance(other, Velocity):
             return NotImplemented
 
-        return self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND) == other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
+        return self._value_as_metre_per_second == other._value_as_metre_per_second
 
     def __lt__(self, other: "Velocity") -> bool:
         """Return whether the velocity is less than the other."""
-        return self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND) < other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
+        return self._value_as_metre_per_second < other._value_as_metre_per_second
 
     def __le__(self, other: "Velocity") -> bool:
         """Return whether the velocity is less than or equal to the other."""
-        return self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND) <= other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
+        return self._value_as_metre_per_second <= other._value_as_metre_per_second
 
     def __gt__(self, other: "Velocity") -> bool:
         """Return whether the velocity is greater than the other."""
-        return self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND) > other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
+        return self._value_as_metre_per_second > other._value_as_metre_per_second
 
     def __ge__(self, other: "Velocity") -> bool:
         """Return whether the velocity is greater than or equal to the other."""
-        return self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND) >= other.as_unit(
-            DistanceUnit.METRE, TimeUnit.SECOND
-        )
+        return self._value_as_metre_per_second >= other._value_as_metre_per_second
 
     def __hash__(self) -> int:
         """Return the hash of the velocity."""
-        return hash(self.as_unit(DistanceUnit.METRE, TimeUnit.SECOND))
+        return hash(self._value_as_metre_per_second)
 
     def __str__(self) -> str:
         """Return a string representation of the velocity."""
@@ -0,0 +1,91 @@
+"""Module for the velocity estimator class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from ..length import Unit as DistanceUnit
+from ..time import Unit as TimeUnit
+from .converter import UNIT_DELTAS_PER_SI_UNIT
+from .velocity import Velocity
+
+if TYPE_CHECKING:
+    from array import array
+
+    from ..length import Length, LengthArray
+    from ..rate_estimators import RateEstimator
+    from ..time import Time, TimeArray
+    from .displacement import Displacement
+
+
+class VelocityEstimator:
+    """Estimates the velocity from a stream of timestamped lengths or displacements.
+
+    Each time & length is passed to the estimator in seconds & metres, and each
+    rate is returned as a velocity in the units of the estimator, so that no
+    differences are converted or created for each sample.
+    """
+
+    __slots__ = ("_distance_unit", "_estimator", "_time_unit", "_unit_delta_per_si")
+
+    def __init__(
+        self,
+        estimator: "RateEstimator",
+        distance_unit: DistanceUnit,
+        time_unit: TimeUnit,
+    ) -> None:
+        """Initialise a new velocity estimator, returning velocities in the units."""
+        self._estimator = estimator
+        self._distance_unit = distance_unit
+        self._time_unit = time_unit
+        units = (distance_unit, time_unit)
+        try:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT[units]
+        except KeyError:
+            unit_delta_per_si_unit = UNIT_DELTAS_PER_SI_UNIT.calculate(units)
+        self._unit_delta_per_si = unit_delta_per_si_unit
+
+    def update(
+        self, time: "Time", position: "Length | Displacement"
+    ) -> "Velocity | None":
+        """Add the position at the time & return the velocity.
+
+        None is returned until the estimator has enough samples to estimate from.
+
+        Raises:
+            ValueError: The time is not after the time of the previous sample.
+        """
+        rate = self._estimator.update(time._value_as_second, position._value_as_metre)
+        if rate is None:
+            return None
+
+        return Velocity._create(
+            rate * self._unit_delta_per_si,
+            self._distance_unit,
+            self._time_unit,
+            rate,
+        )
+
+    def estimate(self, times: "TimeArray", lengths: "LengthArray") -> "array[float]":
+        """Return the velocities of whole arrays of samples, in the units.
+
+        The velocities are those a fresh estimator would return for the samples,
+        without those it returns as None, and the stream so far is not disturbed.
+
+        Raises:
+            ValueError: The arrays are of different lengths, or the times do not
+                increase.
+        """
+        rates = self._estimator.estimate(
+            times._values_as_second, lengths._values_as_metre
+        )
+        unit_delta_per_si = self._unit_delta_per_si
+        for index, rate in enumerate(rates):
+            rates[index] = rate * unit_delta_per_si
+        return rates
+
+    def reset(self) -> None:
+        """Forget every sample."""
+        self._estimator.reset()
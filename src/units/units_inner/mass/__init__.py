@@ -1,20 +1,45 @@
 """Package for mass-related classes and constants."""
 
 from .constants import ZERO
+from .converter import convert_into, make_converter
 from .exceptions import NegativeMassValueError
+from .filter import MassFilter
+from .fixed_point_mass import FixedPointMass
+from .fixed_point_mass_delta import FixedPointMassDelta
+from .isr import MassCell, MassThreshold
 from .mass import Mass
+from .mass_array import MassArray
 from .mass_delta import MassDelta
-from .unit import Unit, get_unit_delta_per_kilogram
+from .mass_delta_array import MassDeltaArray
+from .series import MassSeries
+from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    Unit,
+    get_unit_delta_per_kilogram,
+)
 from .unit import get_abbreviation as get_unit_abbreviation
 from .unit import get_name as get_unit_name
 
 __all__ = [
+    "CONVERSION_FACTORS",
+    "CONVERSION_FACTORS_STRIDE",
     "ZERO",
+    "FixedPointMass",
+    "FixedPointMassDelta",
     "Mass",
+    "MassArray",
+    "MassCell",
     "MassDelta",
+    "MassDeltaArray",
+    "MassFilter",
+    "MassSeries",
+    "MassThreshold",
     "NegativeMassValueError",
     "Unit",
+    "convert_into",
     "get_unit_abbreviation",
     "get_unit_delta_per_kilogram",
     "get_unit_name",
+    "make_converter",
 ]
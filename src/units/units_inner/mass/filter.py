@@ -0,0 +1,58 @@
+"""Module for the mass filter class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from .exceptions import NegativeMassValueError
+from .mass import Mass
+from .unit import Unit, get_unit_delta_per_kilogram
+
+if TYPE_CHECKING:
+    from ..filters import Filter
+
+
+class MassFilter:
+    """A streaming filter over masss, such as a moving average or median.
+
+    Each mass is passed to the filter in kilograms, and each result is returned
+    as a mass in the unit of the filter, so that a stream of readings is smoothed
+    without unwrapping & rewrapping them by hand.
+    """
+
+    __slots__ = ("_filter", "_unit", "_unit_delta_per_kilogram")
+
+    def __init__(self, filter_: "Filter", unit: Unit) -> None:
+        """Initialise a new mass filter, returning results in the unit."""
+        self._filter = filter_
+        self._unit = unit
+        self._unit_delta_per_kilogram = get_unit_delta_per_kilogram(unit)
+
+    def update(self, mass: Mass) -> Mass:
+        """Add the mass to the filter & return the filtered mass."""
+        return self._create(self._filter.update(mass._value_as_kilogram))
+
+    def update_value(self, value: float) -> Mass:
+        """Add a raw value in the unit of the filter & return the filtered mass.
+
+        Raises:
+            NegativeMassValueError: The negative value produced a mass less than 0kg.
+        """
+        if value < 0:
+            raise NegativeMassValueError(value=value)
+
+        return self._create(self._filter.update(value / self._unit_delta_per_kilogram))
+
+    def _create(self, value_as_kilogram: float) -> Mass:
+        """Create a mass in the unit of the filter from its value in kilograms."""
+        return Mass._create(
+            value_as_kilogram * self._unit_delta_per_kilogram,
+            self._unit,
+            value_as_kilogram,
+        )
+
+    def reset(self) -> None:
+        """Forget every mass added to the filter."""
+        self._filter.reset()
@@ -0,0 +1,151 @@
+"""Module for the fixed-point mass class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+from typing import overload
+
+from ..fixed_point import check_count, from_count, to_count
+from .exceptions import NegativeMassValueError
+from .fixed_point_mass_delta import FixedPointMassDelta
+from .mass import Mass
+from .unit import FIXED_POINT_RESOLUTION_PER_KILOGRAM, Unit, get_fixed_point_ratio
+
+
+class FixedPointMass:
+    """A mass, in fixed-point.
+
+    The mass is held as an integer number of milligrams. Intended for ports without
+    hardware floating point, or where floats are allocated on the heap. Only creating
+    the mass & expressing it in a unit involve a conversion, which is done with an
+    integer ratio; arithmetic & comparisons stay in ints.
+
+    The count is kept within the range of a small int on 32-bit ports (see
+    `MAXIMUM_COUNT`), so up to about 1073 kilograms can be held, and creating a mass
+    or doing arithmetic beyond it raises `OverflowError`.
+    """
+
+    __slots__ = ("_value_as_milligram",)
+
+    def __init__(self, value: int, unit: Unit) -> None:
+        """Initialise a new fixed-point mass from an integer value.
+
+        The value is in the unit, and is rounded to the nearest milligram.
+
+        Raises:
+            NegativeMassValueError: The negative value produced a mass less than 0kg.
+            OverflowError: The value is too large to be held as a count of milligrams.
+        """
+        if value < 0:
+            raise NegativeMassValueError(value=value)
+
+        numerator, denominator = get_fixed_point_ratio(unit)
+        self._value_as_milligram = to_count(value, numerator, denominator)
+
+    @classmethod
+    def _from_value_as_milligram(cls, value_as_milligram: int) -> "FixedPointMass":
+        """Create a fixed-point mass from a number of milligrams.
+
+        Raises:
+            NegativeMassValueError: The number of milligrams was negative.
+            OverflowError: The number of milligrams was out of range.
+        """
+        if value_as_milligram < 0:
+            raise NegativeMassValueError(value=value_as_milligram)
+
+        mass: FixedPointMass = cls.__new__(cls)
+        mass._value_as_milligram = check_count(value_as_milligram)
+        return mass
+
+    def as_unit(self, unit: Unit) -> int:
+        """Return the mass in the unit, rounded to the nearest integer."""
+        numerator, denominator = get_fixed_point_ratio(unit)
+        return from_count(self._value_as_milligram, numerator, denominator)
+
+    def to_mass(self) -> Mass:
+        """Return the mass as a floating-point :py:class:`Mass`."""
+        return Mass(
+            self._value_as_milligram / FIXED_POINT_RESOLUTION_PER_KILOGRAM,
+            Unit.KILOGRAM,
+        )
+
+    def __add__(self, delta: FixedPointMassDelta) -> "FixedPointMass":
+        """Return the sum of the mass and the difference.
+
+        Raises:
+            NegativeMassValueError: The sum of the mass and the difference was less
+                than 0kg.
+        """
+        return FixedPointMass._from_value_as_milligram(
+            self._value_as_milligram + delta._value_as_milligram
+        )
+
+    def __radd__(self, delta: FixedPointMassDelta) -> "FixedPointMass":
+        """Return the sum of the mass and the difference."""
+        return self + delta
+
+    @overload
+    def __sub__(self, other: "FixedPointMass") -> FixedPointMassDelta: ...
+
+    @overload
+    def __sub__(self, other: FixedPointMassDelta) -> "FixedPointMass": ...
+
+    def __sub__(
+        self, other: "FixedPointMass | FixedPointMassDelta"
+    ) -> "FixedPointMassDelta | FixedPointMass":
+        """Return the delta between masses or the mass less the delta.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a :py:class:`FixedPointMass`, return the difference
+          between the two masses.
+        - If the argument is a :py:class:`FixedPointMassDelta`, return the mass
+          less the difference.
+
+        Raises:
+            NegativeMassValueError: The mass minus the difference was less
+                than 0kg. Error can only be raised when other is a
+                :py:class:`FixedPointMassDelta`.
+        """
+        value_difference_as_milligram = (
+            self._value_as_milligram - other._value_as_milligram
+        )
+        return (
+            FixedPointMassDelta._from_value_as_milligram(value_difference_as_milligram)
+            if isinstance(other, FixedPointMass)
+            else FixedPointMass._from_value_as_milligram(value_difference_as_milligram)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the objects are equal fixed-point masses."""
+        if not isinstance(other, FixedPointMass):
+            return NotImplemented
+
+        return self._value_as_milligram == other._value_as_milligram
+
+    def __lt__(self, other: "FixedPointMass") -> bool:
+        """Return whether the mass is less than the other."""
+        return self._value_as_milligram < other._value_as_milligram
+
+    def __le__(self, other: "FixedPointMass") -> bool:
+        """Return whether the mass is less than or equal to the other."""
+        return self._value_as_milligram <= other._value_as_milligram
+
+    def __gt__(self, other: "FixedPointMass") -> bool:
+        """Return whether the mass is greater than the other."""
+        return self._value_as_milligram > other._value_as_milligram
+
+    def __ge__(self, other: "FixedPointMass") -> bool:
+        """Return whether the mass is greater than or equal to the other."""
+        return self._value_as_milligram >= other._value_as_milligram
+
+    def __hash__(self) -> int:
+        """Return the hash of the mass."""
+        return hash(self._value_as_milligram)
+
+    def __str__(self) -> str:
+        """Return a string representation of the mass."""
+        return f"{self._value_as_milligram} mg"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the mass for developers."""
+        return f"{__class__.__name__}({self._value_as_milligram} mg)"
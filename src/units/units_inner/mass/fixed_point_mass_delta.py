@@ -0,0 +1,156 @@
+"""Module for the fixed-point mass delta class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+from typing import overload
+
+from ..fixed_point import check_count, from_count, to_count
+from .mass_delta import MassDelta
+from .unit import FIXED_POINT_RESOLUTION_PER_KILOGRAM, Unit, get_fixed_point_ratio
+
+
+class FixedPointMassDelta:
+    """The difference between two masses, in fixed-point.
+
+    The mass delta is held as an integer number of milligrams. Intended for ports
+    without hardware floating point, or where floats are allocated on the heap. Only
+    creating the mass delta & expressing it in a unit involve a conversion, which is
+    done with an integer ratio; arithmetic & comparisons stay in ints.
+
+    The count is kept within the range of a small int on 32-bit ports (see
+    `MAXIMUM_COUNT`), so up to about 1073 kilograms can be held, and creating a mass
+    delta or doing arithmetic beyond it raises `OverflowError`.
+    """
+
+    __slots__ = ("_value_as_milligram",)
+
+    def __init__(self, value: int, unit: Unit) -> None:
+        """Initialise a new fixed-point mass delta from an integer value.
+
+        The value is in the unit, and is rounded to the nearest milligram.
+
+        Raises:
+            OverflowError: The value is too large to be held as a count of milligrams.
+        """
+        numerator, denominator = get_fixed_point_ratio(unit)
+        self._value_as_milligram = to_count(value, numerator, denominator)
+
+    @classmethod
+    def _from_value_as_milligram(cls, value_as_milligram: int) -> "FixedPointMassDelta":
+        """Create a fixed-point mass delta from a number of milligrams.
+
+        Raises:
+            OverflowError: The number of milligrams was out of range.
+        """
+        delta: FixedPointMassDelta = cls.__new__(cls)
+        delta._value_as_milligram = check_count(value_as_milligram)
+        return delta
+
+    def as_unit(self, unit: Unit) -> int:
+        """Return the mass delta in the unit, rounded to the nearest integer."""
+        numerator, denominator = get_fixed_point_ratio(unit)
+        return from_count(self._value_as_milligram, numerator, denominator)
+
+    def to_mass_delta(self) -> MassDelta:
+        """Return the mass delta as a floating-point :py:class:`MassDelta`."""
+        return MassDelta(
+            self._value_as_milligram / FIXED_POINT_RESOLUTION_PER_KILOGRAM,
+            Unit.KILOGRAM,
+        )
+
+    def __mul__(self, value: int) -> "FixedPointMassDelta":
+        """Return the mass delta scaled by the integer."""
+        return FixedPointMassDelta._from_value_as_milligram(
+            self._value_as_milligram * value
+        )
+
+    def __rmul__(self, value: int) -> "FixedPointMassDelta":
+        """Return the mass delta scaled by the integer."""
+        return self * value
+
+    @overload
+    def __floordiv__(self, other: int) -> "FixedPointMassDelta": ...
+
+    @overload
+    def __floordiv__(self, other: "FixedPointMassDelta") -> int: ...
+
+    def __floordiv__(
+        self, other: "int | FixedPointMassDelta"
+    ) -> "FixedPointMassDelta | int":
+        """Return a floored scaled mass delta or the floored ratio between them.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is an :py:class:`int`, return the mass delta scaled by the
+          inverse of the value, floored to the nearest milligram.
+        - If the argument is a :py:class:`FixedPointMassDelta`, return the floored ratio
+          between the two.
+        """
+        if isinstance(other, FixedPointMassDelta):
+            return self._value_as_milligram // other._value_as_milligram
+
+        return FixedPointMassDelta._from_value_as_milligram(
+            self._value_as_milligram // other
+        )
+
+    def __add__(self, other: "FixedPointMassDelta") -> "FixedPointMassDelta":
+        """Return the sum of the mass deltas."""
+        # Adding to a fixed-point mass is handled by the __radd__ method of the
+        # fixed-point mass class
+        if not isinstance(other, FixedPointMassDelta):  # type: ignore[reportUnnecessaryIsInstance]
+            return NotImplemented
+
+        return FixedPointMassDelta._from_value_as_milligram(
+            self._value_as_milligram + other._value_as_milligram
+        )
+
+    def __sub__(self, other: "FixedPointMassDelta") -> "FixedPointMassDelta":
+        """Return the difference between the mass deltas."""
+        return FixedPointMassDelta._from_value_as_milligram(
+            self._value_as_milligram - other._value_as_milligram
+        )
+
+    def __neg__(self) -> "FixedPointMassDelta":
+        """Return the inverse of the mass delta."""
+        return FixedPointMassDelta._from_value_as_milligram(-self._value_as_milligram)
+
+    def __abs__(self) -> "FixedPointMassDelta":
+        """Return the absolute version of the mass delta."""
+        return FixedPointMassDelta._from_value_as_milligram(
+            abs(self._value_as_milligram)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the objects are equal fixed-point mass deltas."""
+        if not isinstance(other, FixedPointMassDelta):
+            return NotImplemented
+
+        return self._value_as_milligram == other._value_as_milligram
+
+    def __lt__(self, other: "FixedPointMassDelta") -> bool:
+        """Return whether the mass delta is less than the other."""
+        return self._value_as_milligram < other._value_as_milligram
+
+    def __le__(self, other: "FixedPointMassDelta") -> bool:
+        """Return whether the mass delta is less than or equal to the other."""
+        return self._value_as_milligram <= other._value_as_milligram
+
+    def __gt__(self, other: "FixedPointMassDelta") -> bool:
+        """Return whether the mass delta is greater than the other."""
+        return self._value_as_milligram > other._value_as_milligram
+
+    def __ge__(self, other: "FixedPointMassDelta") -> bool:
+        """Return whether the mass delta is greater than or equal to the other."""
+        return self._value_as_milligram >= other._value_as_milligram
+
+    def __hash__(self) -> int:
+        """Return the hash of the mass delta."""
+        return hash(self._value_as_milligram)
+
+    def __str__(self) -> str:
+        """Return a string representation of the mass delta."""
+        return f"{self._value_as_milligram} mg"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the mass delta for developers."""
+        return f"{__class__.__name__}({self._value_as_milligram} mg)"
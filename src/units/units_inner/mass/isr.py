@@ -0,0 +1,66 @@
+"""Module for the mass classes that are safe to use in interrupt handlers.
+
+MicroPython interrupt handlers cannot allocate heap memory, so the methods marked
+as interrupt-safe only store & compare values that already exist. Any conversion
+between units happens up front (or later, outside of the handler).
+"""
+
+from .mass import Mass
+from .unit import Unit
+
+
+class MassCell:
+    """A preallocated, mutable holder for a mass reading.
+
+    The reading is stored as a raw value in the unit given on initialisation, so
+    that it can be updated from an interrupt handler without allocating.
+    """
+
+    __slots__ = ("_unit", "_value")
+
+    def __init__(self, unit: Unit, value: float = 0) -> None:
+        """Initialise a new mass cell, holding the value in the unit."""
+        self._unit = unit
+        self._value = value
+
+    def set(self, value: float) -> None:
+        """Set the reading to the value, in the unit of the cell.
+
+        Interrupt-safe. The value is not validated until :py:meth:`get` is called.
+        """
+        self._value = value
+
+    def get(self) -> Mass:
+        """Return the reading as a mass.
+
+        Not interrupt-safe.
+        """
+        return Mass(self._value, self._unit)
+
+
+class MassThreshold:
+    """A mass limit, precomputed in the unit of the raw values.
+
+    The limit is converted once on initialisation, so that comparing a raw value
+    against it is a single comparison & no objects are created.
+    """
+
+    __slots__ = ("_limit",)
+
+    def __init__(self, limit: Mass, unit: Unit) -> None:
+        """Initialise a new mass threshold, for raw values in the unit."""
+        self._limit = limit.as_unit(unit)
+
+    def is_above(self, value: float) -> bool:
+        """Return whether the raw value is greater than the limit.
+
+        Interrupt-safe.
+        """
+        return value > self._limit
+
+    def is_below(self, value: float) -> bool:
+        """Return whether the raw value is less than the limit.
+
+        Interrupt-safe.
+        """
+        return value < self._limit
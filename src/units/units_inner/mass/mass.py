@@ -1,10 +1,15 @@
 """Module for the mass class."""
 
+# pyright: reportPrivateUsage=false
+
 from typing import overload
 
 from .exceptions import NegativeMassValueError
 from .mass_delta import MassDelta
 from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    UNIT_DELTAS_PER_KILOGRAM,
     Unit,
     get_abbreviation,
     get_name,
@@ -15,6 +20,8 @@ from .unit import (
 class Mass:
     """The force applied per unit area over which that force is distributed."""
 
+    __slots__ = ("_unit", "_value", "_value_as_kilogram")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new mass.
 
@@ -26,13 +33,43 @@ class Mass:
 
         self._value = value
         self._unit = unit
+        internal_unit_delta_per_kilogram = get_unit_delta_per_kilogram(self._unit)
+        self._value_as_kilogram = self._value / internal_unit_delta_per_kilogram
+
+    @classmethod
+    def _create(cls, value: float, unit: Unit, value_as_kilogram: float) -> "Mass":
+        """Create a mass from its value in both the unit & kilograms.
+
+        Not intended for public use.
+
+        The value is not converted again, and the only validation is a single
+        comparison of the value in kilograms.
+
+        Raises:
+            NegativeMassValueError: The value produced a mass less than 0kg.
+        """
+        if value_as_kilogram < 0:
+            raise NegativeMassValueError(value=value)
+
+        mass: Mass = cls.__new__(cls)
+        mass._value = value
+        mass._unit = unit
+        mass._value_as_kilogram = value_as_kilogram
+        return mass
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the mass, expressed as the unit."""
-        internal_unit_delta_per_kilogram = get_unit_delta_per_kilogram(self._unit)
-        value_as_kilogram = self._value / internal_unit_delta_per_kilogram
-        external_unit_delta_per_kilogram = get_unit_delta_per_kilogram(unit)
-        return external_unit_delta_per_kilogram * value_as_kilogram
+        """Return the mass, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not a mass unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __add__(self, delta: MassDelta) -> "Mass":
         """Return the sum of the mass and the difference.
@@ -41,10 +78,16 @@ class Mass:
             NegativeMassValueError: The sum of the mass and the difference was less
                 than 0kg.
         """
-        value_as_kilogram = self.as_unit(Unit.KILOGRAM)
-        delta_value_as_kilogram = delta.as_unit(Unit.KILOGRAM)
-        value_sum_as_kilogram = value_as_kilogram + delta_value_as_kilogram
-        return Mass(value_sum_as_kilogram, Unit.KILOGRAM)
+        if self._unit == delta._unit:
+            value_sum = self._value + delta._value
+            return Mass._create(
+                value_sum,
+                self._unit,
+                value_sum / UNIT_DELTAS_PER_KILOGRAM[self._unit],
+            )
+
+        value_sum_as_kilogram = self._value_as_kilogram + delta._value_as_kilogram
+        return Mass._create(value_sum_as_kilogram, Unit.KILOGRAM, value_sum_as_kilogram)
 
     def __radd__(self, delta: MassDelta) -> "Mass":
         """Return the sum of the mass and the difference."""
@@ -70,13 +113,36 @@ class Mass:
             NegativeMassValueError: The mass minus the difference was less
                 than 0kg. Only possible when other is a MassDelta.
         """
-        value_as_kilogram = self.as_unit(Unit.KILOGRAM)
-        other_value_as_kilogram = other.as_unit(Unit.KILOGRAM)
-        value_difference_as_kilogram = value_as_kilogram - other_value_as_kilogram
+        if self._unit == other._unit:
+            value_difference = self._value - other._value
+            value_difference_as_kilogram = (
+                value_difference / UNIT_DELTAS_PER_KILOGRAM[self._unit]
+            )
+            return (
+                MassDelta._create(
+                    value_difference, self._unit, value_difference_as_kilogram
+                )
+                if isinstance(other, Mass)
+                else Mass._create(
+                    value_difference, self._unit, value_difference_as_kilogram
+                )
+            )
+
+        value_difference_as_kilogram = (
+            self._value_as_kilogram - other._value_as_kilogram
+        )
         return (
-            MassDelta(value_difference_as_kilogram, Unit.KILOGRAM)
+            MassDelta._create(
+                value_difference_as_kilogram,
+                Unit.KILOGRAM,
+                value_difference_as_kilogram,
+            )
             if isinstance(other, Mass)
-            else Mass(value_difference_as_kilogram, Unit.KILOGRAM)
+            else Mass._create(
+                value_difference_as_kilogram,
+                Unit.KILOGRAM,
+                value_difference_as_kilogram,
+            )
         )
 
     def __eq__(self, other: object) -> bool:
@@ -84,27 +150,27 @@ class Mass:
         if not isinstance(other, Mass):
             return NotImplemented
 
-        return self.as_unit(Unit.KILOGRAM) == other.as_unit(Unit.KILOGRAM)
+        return self._value_as_kilogram == other._value_as_kilogram
 
     def __lt__(self, other: "Mass") -> bool:
         """Return whether the mass is less than the other."""
-        return self.as_unit(Unit.KILOGRAM) < other.as_unit(Unit.KILOGRAM)
+        return self._value_as_kilogram < other._value_as_kilogram
 
     def __le__(self, other: "Mass") -> bool:
         """Return whether the mass is less than or equal to the other."""
-        return self.as_unit(Unit.KILOGRAM) <= other.as_unit(Unit.KILOGRAM)
+        return self._value_as_kilogram <= other._value_as_kilogram
 
     def __gt__(self, other: "Mass") -> bool:
         """Return whether the mass is greater than the other."""
-        return self.as_unit(Unit.KILOGRAM) > other.as_unit(Unit.KILOGRAM)
+        return self._value_as_kilogram > other._value_as_kilogram
 
     def __ge__(self, other: "Mass") -> bool:
         """Return whether the mass is greater than or equal to the other."""
-        return self.as_unit(Unit.KILOGRAM) >= other.as_unit(Unit.KILOGRAM)
+        return self._value_as_kilogram >= other._value_as_kilogram
 
     def __hash__(self) -> int:
         """Return the hash of the mass."""
-        return hash(self.as_unit(Unit.KILOGRAM))
+        return hash(self._value_as_kilogram)
 
     def __str__(self) -> str:
         """Return a string representation of the mass."""
@@ -0,0 +1,235 @@
+"""Module for the mass array class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    create_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .exceptions import NegativeMassValueError
+from .mass import Mass
+from .mass_delta import MassDelta
+from .mass_delta_array import MassDeltaArray
+from .unit import Unit, get_name, get_unit_delta_per_kilogram
+
+if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Iterable, Iterator
+
+
+def _check_non_negative(
+    values_as_kilogram: "array[float] | memoryview", unit: Unit
+) -> None:
+    """Check that none of the masses are less than 0kg.
+
+    Raises:
+        NegativeMassValueError: One of the masses was less than 0kg.
+    """
+    if not values_as_kilogram:
+        return
+
+    minimum_value_as_kilogram = min(values_as_kilogram)
+    if minimum_value_as_kilogram < 0:
+        internal_unit_delta_per_kilogram = get_unit_delta_per_kilogram(unit)
+        raise NegativeMassValueError(
+            value=minimum_value_as_kilogram * internal_unit_delta_per_kilogram
+        )
+
+
+class MassArray:
+    """A homogeneous array of masses.
+
+    The masses are stored in bulk as kilograms, and share a single unit that they
+    are expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_kilogram")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of masses, with all values in the unit.
+
+        Raises:
+            NegativeMassValueError: One of the values produced a mass less than
+                0kg.
+        """
+        internal_unit_delta_per_kilogram = get_unit_delta_per_kilogram(unit)
+        values_as_kilogram = create_values(values, 1 / internal_unit_delta_per_kilogram)
+        _check_non_negative(values_as_kilogram, unit)
+
+        self._unit = unit
+        self._values_as_kilogram: array[float] | memoryview = values_as_kilogram
+
+    @classmethod
+    def _from_values_as_kilogram(
+        cls, values_as_kilogram: "array[float] | memoryview", unit: Unit
+    ) -> "MassArray":
+        """Create an array of masses directly from a buffer of kilograms.
+
+        The buffer is used as-is, rather than copied, and is assumed to be valid.
+        """
+        masses: MassArray = cls.__new__(cls)
+        masses._unit = unit
+        masses._values_as_kilogram = values_as_kilogram
+        return masses
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the masses, expressed as the unit."""
+        external_unit_delta_per_kilogram = get_unit_delta_per_kilogram(unit)
+        return create_values(self._values_as_kilogram, external_unit_delta_per_kilogram)
+
+    def __len__(self) -> int:
+        """Return the number of masses."""
+        return len(self._values_as_kilogram)
+
+    @overload
+    def __getitem__(self, index: int) -> Mass: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "MassArray": ...
+
+    def __getitem__(self, index: "int | slice") -> "Mass | MassArray":
+        """Return the mass at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return MassArray._from_values_as_kilogram(
+                memoryview(self._values_as_kilogram)[index], self._unit
+            )
+
+        internal_unit_delta_per_kilogram = get_unit_delta_per_kilogram(self._unit)
+        return Mass(
+            self._values_as_kilogram[index] * internal_unit_delta_per_kilogram,
+            self._unit,
+        )
+
+    def __iter__(self) -> "Iterator[Mass]":
+        """Return an iterator over the masses."""
+        internal_unit_delta_per_kilogram = get_unit_delta_per_kilogram(self._unit)
+        for value_as_kilogram in self._values_as_kilogram:
+            yield Mass(value_as_kilogram * internal_unit_delta_per_kilogram, self._unit)
+
+    def __add__(self, delta: "MassDelta | MassDeltaArray") -> "MassArray":
+        """Return the sum of the masses and the difference(s).
+
+        A single mass delta is added to every mass, while an array of mass
+        deltas is added elementwise.
+
+        Raises:
+            NegativeMassValueError: One of the sums was less than 0kg.
+            ValueError: The arrays are of different lengths.
+        """
+        delta_values_as_kilogram = (
+            delta.as_unit(Unit.KILOGRAM)
+            if isinstance(delta, MassDelta)
+            else delta._values_as_kilogram
+        )
+        value_sums_as_kilogram = add_values(
+            self._values_as_kilogram, delta_values_as_kilogram
+        )
+        _check_non_negative(value_sums_as_kilogram, self._unit)
+        return MassArray._from_values_as_kilogram(value_sums_as_kilogram, self._unit)
+
+    def __radd__(self, delta: MassDelta) -> "MassArray":
+        """Return the sum of the masses and the difference.
+
+        Raises:
+            NegativeMassValueError: One of the sums was less than 0kg.
+        """
+        return self + delta
+
+    @overload
+    def __sub__(self, other: "Mass | MassArray") -> MassDeltaArray: ...
+
+    @overload
+    def __sub__(self, other: "MassDelta | MassDeltaArray") -> "MassArray": ...
+
+    def __sub__(
+        self, other: "Mass | MassArray | MassDelta | MassDeltaArray"
+    ) -> "MassDeltaArray | MassArray":
+        """Return the difference between the masses and the other(s).
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a mass or an array of masses, return the differences
+          between the masses.
+        - If the argument is a mass delta or an array of mass deltas, return the
+          masses less the differences.
+
+        A single argument is subtracted from every mass, while an array is
+        subtracted elementwise.
+
+        Raises:
+            NegativeMassValueError: One of the differences was less than 0kg. Error
+                can only be raised when other is a :py:class:`MassDelta` or
+                :py:class:`MassDeltaArray`.
+            ValueError: The arrays are of different lengths.
+        """
+        other_values_as_kilogram = (
+            other.as_unit(Unit.KILOGRAM)
+            if isinstance(other, (Mass, MassDelta))
+            else other._values_as_kilogram
+        )
+        value_differences_as_kilogram = subtract_values(
+            self._values_as_kilogram, other_values_as_kilogram
+        )
+        if isinstance(other, (Mass, MassArray)):
+            return MassDeltaArray._from_values_as_kilogram(
+                value_differences_as_kilogram, self._unit
+            )
+
+        _check_non_negative(value_differences_as_kilogram, self._unit)
+        return MassArray._from_values_as_kilogram(
+            value_differences_as_kilogram, self._unit
+        )
+
+    def __lt__(self, other: "Mass | MassArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the masses less than the other mass(s)."""
+        other_values_as_kilogram = (
+            other.as_unit(Unit.KILOGRAM)
+            if isinstance(other, Mass)
+            else other._values_as_kilogram
+        )
+        return less_than(self._values_as_kilogram, other_values_as_kilogram)
+
+    def __le__(self, other: "Mass | MassArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the masses less than or equal to the other mass(s)."""
+        other_values_as_kilogram = (
+            other.as_unit(Unit.KILOGRAM)
+            if isinstance(other, Mass)
+            else other._values_as_kilogram
+        )
+        return less_than_or_equal_to(self._values_as_kilogram, other_values_as_kilogram)
+
+    def __gt__(self, other: "Mass | MassArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the masses greater than the other mass(s)."""
+        other_values_as_kilogram = (
+            other.as_unit(Unit.KILOGRAM)
+            if isinstance(other, Mass)
+            else other._values_as_kilogram
+        )
+        return greater_than(self._values_as_kilogram, other_values_as_kilogram)
+
+    def __ge__(self, other: "Mass | MassArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the masses greater than or equal to the other mass(s)."""
+        other_values_as_kilogram = (
+            other.as_unit(Unit.KILOGRAM)
+            if isinstance(other, Mass)
+            else other._values_as_kilogram
+        )
+        return greater_than_or_equal_to(
+            self._values_as_kilogram, other_values_as_kilogram
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the masses."""
+        values = list(self.as_unit(self._unit))
+        return f"MassArray({values}, {get_name(self._unit)})"
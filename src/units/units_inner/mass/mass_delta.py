@@ -3,6 +3,9 @@
 from typing import overload
 
 from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    UNIT_DELTAS_PER_KILOGRAM,
     Unit,
     get_abbreviation,
     get_name,
@@ -13,22 +16,49 @@ from .unit import (
 class MassDelta:
     """The difference between two masses."""
 
+    __slots__ = ("_unit", "_value", "_value_as_kilogram")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new mass difference."""
         self._value = value
         self._unit = unit
+        internal_unit_delta_per_kilogram = get_unit_delta_per_kilogram(self._unit)
+        self._value_as_kilogram = self._value / internal_unit_delta_per_kilogram
+
+    @classmethod
+    def _create(cls, value: float, unit: Unit, value_as_kilogram: float) -> "MassDelta":
+        """Create a mass difference from its value in both the unit & kilograms.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        mass_delta: MassDelta = cls.__new__(cls)
+        mass_delta._value = value
+        mass_delta._unit = unit
+        mass_delta._value_as_kilogram = value_as_kilogram
+        return mass_delta
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the mass difference, expressed as the unit."""
-        internal_unit_delta_per_kilogram = get_unit_delta_per_kilogram(self._unit)
-        value_as_kilogram = self._value / internal_unit_delta_per_kilogram
-        external_unit_delta_per_kilogram = get_unit_delta_per_kilogram(unit)
-        return external_unit_delta_per_kilogram * value_as_kilogram
+        """Return the mass difference, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not a mass unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __mul__(self, value: float) -> "MassDelta":
         """Return a mass difference scaled by the value."""
         scaled_value = self._value * value
-        return MassDelta(scaled_value, self._unit)
+        return MassDelta._create(
+            scaled_value, self._unit, self._value_as_kilogram * value
+        )
 
     def __rmul__(self, value: float) -> "MassDelta":
         """Return a mass difference scaled by the value."""
@@ -51,12 +81,12 @@ class MassDelta:
           differences
         """
         if isinstance(other, MassDelta):
-            value_as_kilogram = self.as_unit(Unit.KILOGRAM)
-            other_value_as_kilogram = other.as_unit(Unit.KILOGRAM)
-            return value_as_kilogram / other_value_as_kilogram
+            return self._value_as_kilogram / other._value_as_kilogram
 
         scaled_value = self._value / other
-        return MassDelta(scaled_value, self._unit)
+        return MassDelta._create(
+            scaled_value, self._unit, self._value_as_kilogram / other
+        )
 
     def __add__(self, other: "MassDelta") -> "MassDelta":
         """Return the sum of the mass differences."""
@@ -66,10 +96,18 @@ class MassDelta:
         if not isinstance(other, MassDelta):  # type: ignore[reportUnnecessaryIsInstance]
             return NotImplemented
 
-        value_as_kilogram = self.as_unit(Unit.KILOGRAM)
-        delta_value_as_kilogram = other.as_unit(Unit.KILOGRAM)
-        added_value_as_kilogram = value_as_kilogram + delta_value_as_kilogram
-        return MassDelta(added_value_as_kilogram, Unit.KILOGRAM)
+        if self._unit == other._unit:
+            value_sum = self._value + other._value
+            return MassDelta._create(
+                value_sum,
+                self._unit,
+                value_sum / UNIT_DELTAS_PER_KILOGRAM[self._unit],
+            )
+
+        added_value_as_kilogram = self._value_as_kilogram + other._value_as_kilogram
+        return MassDelta._create(
+            added_value_as_kilogram, Unit.KILOGRAM, added_value_as_kilogram
+        )
 
     def __sub__(self, delta: "MassDelta") -> "MassDelta":
         """Return the difference between the mass differences."""
@@ -78,57 +116,53 @@ class MassDelta:
     def __neg__(self) -> "MassDelta":
         """Return the inverse of the mass difference."""
         inverted_value = -self._value
-        return MassDelta(inverted_value, self._unit)
+        return MassDelta._create(inverted_value, self._unit, -self._value_as_kilogram)
 
     def __abs__(self) -> "MassDelta":
         """Return the absolute version of the mass difference."""
         absolute_value = abs(self._value)
-        return MassDelta(absolute_value, self._unit)
+        return MassDelta._create(
+            absolute_value, self._unit, abs(self._value_as_kilogram)
+        )
 
     def __floordiv__(self, other: "MassDelta") -> float:
         """Return the floored ratio between the mass differences."""
-        value_as_kilogram = self.as_unit(Unit.KILOGRAM)
-        other_value_as_kilogram = other.as_unit(Unit.KILOGRAM)
-        return value_as_kilogram // other_value_as_kilogram
+        return self._value_as_kilogram // other._value_as_kilogram
 
     def __mod__(self, other: "MassDelta") -> float:
         """Return the remainder of the ratio between the mass differences."""
-        value_as_kilogram = self.as_unit(Unit.KILOGRAM)
-        other_value_as_kilogram = other.as_unit(Unit.KILOGRAM)
-        return value_as_kilogram % other_value_as_kilogram
+        return self._value_as_kilogram % other._value_as_kilogram
 
     def __divmod__(self, other: "MassDelta") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the mass deltas."""
-        value_as_kilogram = self.as_unit(Unit.KILOGRAM)
-        other_value_as_kilogram = other.as_unit(Unit.KILOGRAM)
-        return divmod(value_as_kilogram, other_value_as_kilogram)
+        return divmod(self._value_as_kilogram, other._value_as_kilogram)
 
     def __eq__(self, other: object) -> bool:
         """Return whether the objects are equal mass differences."""
         if not isinstance(other, MassDelta):
             return NotImplemented
 
-        return self.as_unit(Unit.KILOGRAM) == other.as_unit(Unit.KILOGRAM)
+        return self._value_as_kilogram == other._value_as_kilogram
 
     def __lt__(self, other: "MassDelta") -> bool:
         """Return whether the mass difference is less than the other."""
-        return self.as_unit(Unit.KILOGRAM) < other.as_unit(Unit.KILOGRAM)
+        return self._value_as_kilogram < other._value_as_kilogram
 
     def __le__(self, other: "MassDelta") -> bool:
         """Return whether the mass delta is less than or equal to the other."""
-        return self.as_unit(Unit.KILOGRAM) <= other.as_unit(Unit.KILOGRAM)
+        return self._value_as_kilogram <= other._value_as_kilogram
 
     def __gt__(self, other: "MassDelta") -> bool:
         """Return whether the mass difference is greater than the other."""
-        return self.as_unit(Unit.KILOGRAM) > other.as_unit(Unit.KILOGRAM)
+        return self._value_as_kilogram > other._value_as_kilogram
 
     def __ge__(self, other: "MassDelta") -> bool:
         """Return whether the mass delta is greater than or equal to the other."""
-        return self.as_unit(Unit.KILOGRAM) >= other.as_unit(Unit.KILOGRAM)
+        return self._value_as_kilogram >= other._value_as_kilogram
 
     def __hash__(self) -> int:
         """Return the hash of the mass difference."""
-        return hash(self.as_unit(Unit.KILOGRAM))
+        return hash(self._value_as_kilogram)
 
     def __str__(self) -> str:
         """Return a string representation of the mass difference."""
@@ -0,0 +1,208 @@
+"""Module for the mass delta array class."""
+
+# ruff: noqa: TID252
+
+from array import array
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    create_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .mass_delta import MassDelta
+from .unit import Unit, get_name, get_unit_delta_per_kilogram
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class MassDeltaArray:
+    """A homogeneous array of mass deltas.
+
+    The deltas are stored in bulk as kilograms, and share a single unit that they
+    are expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_kilogram")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of mass deltas, with all values in the unit."""
+        internal_unit_delta_per_kilogram = get_unit_delta_per_kilogram(unit)
+        self._unit = unit
+        self._values_as_kilogram: array[float] | memoryview = create_values(
+            values, 1 / internal_unit_delta_per_kilogram
+        )
+
+    @classmethod
+    def _from_values_as_kilogram(
+        cls, values_as_kilogram: "array[float] | memoryview", unit: Unit
+    ) -> "MassDeltaArray":
+        """Create an array of mass deltas directly from a buffer of kilograms.
+
+        The buffer is used as-is, rather than copied.
+        """
+        deltas: MassDeltaArray = cls.__new__(cls)
+        deltas._unit = unit
+        deltas._values_as_kilogram = values_as_kilogram
+        return deltas
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the mass deltas, expressed as the unit."""
+        external_unit_delta_per_kilogram = get_unit_delta_per_kilogram(unit)
+        return create_values(self._values_as_kilogram, external_unit_delta_per_kilogram)
+
+    def __len__(self) -> int:
+        """Return the number of mass deltas."""
+        return len(self._values_as_kilogram)
+
+    @overload
+    def __getitem__(self, index: int) -> MassDelta: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "MassDeltaArray": ...
+
+    def __getitem__(self, index: "int | slice") -> "MassDelta | MassDeltaArray":
+        """Return the mass delta at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return MassDeltaArray._from_values_as_kilogram(
+                memoryview(self._values_as_kilogram)[index], self._unit
+            )
+
+        internal_unit_delta_per_kilogram = get_unit_delta_per_kilogram(self._unit)
+        return MassDelta(
+            self._values_as_kilogram[index] * internal_unit_delta_per_kilogram,
+            self._unit,
+        )
+
+    def __iter__(self) -> "Iterator[MassDelta]":
+        """Return an iterator over the mass deltas."""
+        internal_unit_delta_per_kilogram = get_unit_delta_per_kilogram(self._unit)
+        for value_as_kilogram in self._values_as_kilogram:
+            yield MassDelta(
+                value_as_kilogram * internal_unit_delta_per_kilogram, self._unit
+            )
+
+    def __mul__(self, value: float) -> "MassDeltaArray":
+        """Return the mass deltas scaled by the value."""
+        return MassDeltaArray._from_values_as_kilogram(
+            create_values(self._values_as_kilogram, value), self._unit
+        )
+
+    def __rmul__(self, value: float) -> "MassDeltaArray":
+        """Return the mass deltas scaled by the value."""
+        return self * value
+
+    def __truediv__(self, value: float) -> "MassDeltaArray":
+        """Return the mass deltas scaled by the inverse of the value."""
+        return self * (1 / value)
+
+    def __add__(self, other: "MassDelta | MassDeltaArray") -> "MassDeltaArray":
+        """Return the sum of the mass deltas and the other delta(s).
+
+        A single mass delta is added to every element, while an array of mass
+        deltas is added elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, MassDelta):
+            return MassDeltaArray._from_values_as_kilogram(
+                add_values(self._values_as_kilogram, other.as_unit(Unit.KILOGRAM)),
+                self._unit,
+            )
+
+        if isinstance(other, MassDeltaArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return MassDeltaArray._from_values_as_kilogram(
+                add_values(self._values_as_kilogram, other._values_as_kilogram),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __radd__(self, other: MassDelta) -> "MassDeltaArray":
+        """Return the sum of the mass deltas and the other delta."""
+        return self + other
+
+    def __sub__(self, other: "MassDelta | MassDeltaArray") -> "MassDeltaArray":
+        """Return the difference of the mass deltas and the other delta(s).
+
+        A single mass delta is subtracted from every element, while an array of
+        mass deltas is subtracted elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, MassDelta):
+            return MassDeltaArray._from_values_as_kilogram(
+                subtract_values(self._values_as_kilogram, other.as_unit(Unit.KILOGRAM)),
+                self._unit,
+            )
+
+        if isinstance(other, MassDeltaArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return MassDeltaArray._from_values_as_kilogram(
+                subtract_values(self._values_as_kilogram, other._values_as_kilogram),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __neg__(self) -> "MassDeltaArray":
+        """Return the inverse of the mass deltas."""
+        return self * -1
+
+    def __abs__(self) -> "MassDeltaArray":
+        """Return the absolute of the mass deltas."""
+        return MassDeltaArray._from_values_as_kilogram(
+            array("d", (abs(value) for value in self._values_as_kilogram)), self._unit
+        )
+
+    def __lt__(self, other: "MassDelta | MassDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the mass deltas less than the other delta(s)."""
+        other_values_as_kilogram = (
+            other.as_unit(Unit.KILOGRAM)
+            if isinstance(other, MassDelta)
+            else other._values_as_kilogram
+        )
+        return less_than(self._values_as_kilogram, other_values_as_kilogram)
+
+    def __le__(self, other: "MassDelta | MassDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the mass deltas less than or equal to the other(s)."""
+        other_values_as_kilogram = (
+            other.as_unit(Unit.KILOGRAM)
+            if isinstance(other, MassDelta)
+            else other._values_as_kilogram
+        )
+        return less_than_or_equal_to(self._values_as_kilogram, other_values_as_kilogram)
+
+    def __gt__(self, other: "MassDelta | MassDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the mass deltas greater than the other delta(s)."""
+        other_values_as_kilogram = (
+            other.as_unit(Unit.KILOGRAM)
+            if isinstance(other, MassDelta)
+            else other._values_as_kilogram
+        )
+        return greater_than(self._values_as_kilogram, other_values_as_kilogram)
+
+    def __ge__(self, other: "MassDelta | MassDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the mass deltas greater than or equal to the other(s)."""
+        other_values_as_kilogram = (
+            other.as_unit(Unit.KILOGRAM)
+            if isinstance(other, MassDelta)
+            else other._values_as_kilogram
+        )
+        return greater_than_or_equal_to(
+            self._values_as_kilogram, other_values_as_kilogram
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the mass deltas."""
+        values = list(self.as_unit(self._unit))
+        return f"MassDeltaArray({values}, {get_name(self._unit)})"
@@ -0,0 +1,134 @@
+"""Module for the mass series class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from ..ring_buffer import RingBuffer
+from .exceptions import NegativeMassValueError
+from .mass import Mass
+from .mass_array import MassArray
+from .unit import Unit, get_name, get_unit_delta_per_kilogram
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ..time import Time
+
+
+class MassSeries(RingBuffer):
+    """A rolling window of the most recent masses, with optional timestamps.
+
+    The masses are stored as kilograms in a buffer preallocated on initialisation,
+    so that pushing a mass drops the oldest one once the series is full,
+    rather than allocating. The masses are indexed from the oldest (0) to the
+    latest (-1), and are expressed in the unit of the series when retrieved.
+    """
+
+    __slots__ = ("_unit", "_unit_delta_per_kilogram")
+
+    def __init__(self, capacity: int, unit: Unit, *, timestamped: bool = False) -> None:
+        """Initialise a new, empty series, holding up to the number of masses.
+
+        If the series is timestamped, every mass is pushed along with the time it
+        was measured at.
+
+        Raises:
+            ValueError: The capacity is less than 1.
+        """
+        super().__init__(capacity, timestamped=timestamped)
+        self._unit = unit
+        self._unit_delta_per_kilogram = get_unit_delta_per_kilogram(unit)
+
+    def push(self, mass: Mass, time: "Time | None" = None) -> None:
+        """Push a mass, dropping the oldest one if the series is full.
+
+        Does not allocate.
+
+        Raises:
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        end = self._end
+        if end == self._limit:
+            end = self._compact()
+        times = self._times
+        if times is not None and time is not None:
+            times[end] = time._value_as_second
+        elif times is not None or time is not None:
+            self._raise_time_error()
+        self._values[end] = mass._value_as_kilogram
+        self._end = end + 1
+
+    def push_value(self, value: float, time: "Time | None" = None) -> None:
+        """Push a raw value in the unit of the series, as a mass.
+
+        Raises:
+            NegativeMassValueError: The negative value produced a mass less than 0kg.
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        if value < 0:
+            raise NegativeMassValueError(value=value)
+
+        self._push(value / self._unit_delta_per_kilogram, time)
+
+    def _create(self, value_as_kilogram: float) -> Mass:
+        """Create a mass in the unit of the series from its value in kilograms."""
+        return Mass._create(
+            value_as_kilogram * self._unit_delta_per_kilogram,
+            self._unit,
+            value_as_kilogram,
+        )
+
+    def latest(self) -> Mass:
+        """Return the most recently pushed mass.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(-1))
+
+    def oldest(self) -> Mass:
+        """Return the least recently pushed mass still in the series.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(0))
+
+    def window(self, count: "int | None" = None) -> MassArray:
+        """Return the latest masses, from oldest to latest.
+
+        All of the masses are returned if the count is None, and at most as many masses
+        as the series holds otherwise. The window is a view of the series rather than a
+        copy, so it is only valid until the next push or clear.
+        """
+        return MassArray._from_values_as_kilogram(self._view_values(count), self._unit)
+
+    def __getitem__(self, index: int) -> Mass:
+        """Return the mass at the index.
+
+        Raises:
+            IndexError: There is no mass at the index.
+        """
+        return self._create(self._get_value(index))
+
+    def __iter__(self) -> "Iterator[Mass]":
+        """Return an iterator over the masses, from oldest to latest.
+
+        Each mass is only created when it is reached.
+        """
+        for value_as_kilogram in self._iter_values():
+            yield self._create(value_as_kilogram)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the mass series."""
+        values = [
+            value * self._unit_delta_per_kilogram for value in self._iter_values()
+        ]
+        return (
+            f"MassSeries({values}, {get_name(self._unit)}, capacity={self._capacity})"
+        )
@@ -1,4 +1,8 @@
-"""Module for the mass units."""
+"""Module for the mass units.
+
+Generated by `tools/generate_units.py` from `tools/units_spec.json`, so edit the
+spec & rerun the generator rather than editing this module.
+"""
 
 from typing import TYPE_CHECKING, Final
 
@@ -7,10 +11,12 @@ if TYPE_CHECKING:
 else:
     IntEnum = object
 
+_NAN: Final = float("nan")
+
 
-# NB: When adding a new unit, be sure to also update:
-# - The info list in helpers.py
-# - The `test_get_X_value_as_unit` test in `test_X.py` and `test_X_delta.py`
+# NB: When adding a new unit, add it to `tools/units_spec.json` & rerun
+# `tools/generate_units.py`, which also regenerates the tests of the unit
+# tables
 class Unit(IntEnum):
     """A mass unit.
 
@@ -27,85 +33,111 @@ class Unit(IntEnum):
     OUNCE = 5
 
 
-class _UnitInfo:
-    """Information associated with a mass particular unit.
+# The name & abbreviation of each unit, indexed by the unit. Element 0 does not
+# correspond to a unit.
+_NAMES: Final = (
+    "",
+    "kilogram",
+    "gram",
+    "milligram",
+    "pound",
+    "ounce",
+)
+_ABBREVIATIONS: Final = (
+    "",
+    "kg",
+    "g",
+    "mg",
+    "lb",
+    "oz",
+)
+
+# The change in mass expressed as each unit per 1kg, indexed by the unit. Element 0 does
+# not correspond to a unit, and so holds NaN.
+UNIT_DELTAS_PER_KILOGRAM: Final = (
+    _NAN,
+    1,
+    1000,
+    1_000_000,
+    2.20462262185,
+    35.2739619496,
+)
+
+# Dense from-unit x to-unit table of conversion factors. Units are small contiguous
+# ints, so the factor that converts a value from one unit to another is at index
+# `from_unit * CONVERSION_FACTORS_STRIDE + to_unit`. Row & column 0 do not correspond to
+# a unit, and so hold NaN. A tuple is used rather than an array, as reading an element
+# of a tuple returns the stored float instead of allocating a new one.
+CONVERSION_FACTORS_STRIDE: Final = 6
+CONVERSION_FACTORS: Final = (
+    # Row 0 does not correspond to a unit
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    # From kilogram to each unit
+    _NAN,
+    1.0,
+    1000.0,
+    1000000.0,
+    2.20462262185,
+    35.2739619496,
+    # From gram to each unit
+    _NAN,
+    0.001,
+    1.0,
+    1000.0,
+    0.00220462262185,
+    0.0352739619496,
+    # From milligram to each unit
+    _NAN,
+    1e-06,
+    0.001,
+    1.0,
+    2.20462262185e-06,
+    3.52739619496e-05,
+    # From pound to each unit
+    _NAN,
+    0.4535923699997481,
+    453.59236999974814,
+    453592.36999974813,
+    1.0,
+    16.0,
+    # From ounce to each unit
+    _NAN,
+    0.028349523124984257,
+    28.34952312498426,
+    28349.523124984258,
+    0.0625,
+    1.0,
+)
+
+# Fixed-point quantities hold an integer count of milligrams. The number of milligrams
+# per 1 of each unit is stored as an integer ratio, indexed by the unit, so that
+# converting to & from the units stays in ints. Element 0 does not correspond to a unit.
+FIXED_POINT_RESOLUTION_PER_KILOGRAM: Final = 1_000_000
+_FIXED_POINT_RATIOS: Final = (
+    (0, 1),
+    (1000000, 1),
+    (1000, 1),
+    (1, 1),
+    (4535924, 10),
+    (28349523, 1000),
+)
+
+
+def _check_unit(unit: Unit) -> None:
+    """Check that the unit is a mass unit.
 
     Not intended for public use.
-    """
 
-    def __init__(
-        self,
-        unit: Unit,
-        name: str,
-        abbreviation: str,
-        unit_delta_per_kilogram: float,
-    ) -> None:
-        """Initialise a collection of info associated with a unit."""
-        self._unit = unit
-        self._name = name
-        self._abbreviation = abbreviation
-        self._unit_delta_per_kilogram = unit_delta_per_kilogram
-
-    @property
-    def unit(self) -> Unit:
-        """The unit the information relates to."""
-        return self._unit
-
-    @property
-    def name(self) -> str:
-        """The name of the unit."""
-        return self._name
-
-    @property
-    def abbreviation(self) -> str:
-        """The abbreviation of the unit."""
-        return self._abbreviation
-
-    @property
-    def unit_delta_per_kilogram(self) -> float:
-        """The change in mass expressed as the unit per 1kg.
-
-        Equivalent to the gradient of the kilogram-vs-unit graph.
-        """
-        return self._unit_delta_per_kilogram
-
-
-# All info is entered here to create a SSoT
-_UNITS_INFO: Final = [
-    _UnitInfo(
-        unit=Unit.KILOGRAM,
-        name="kilogram",
-        abbreviation="kg",
-        unit_delta_per_kilogram=1,
-    ),
-    _UnitInfo(
-        unit=Unit.GRAM,
-        name="gram",
-        abbreviation="g",
-        unit_delta_per_kilogram=1_000,
-    ),
-    _UnitInfo(
-        unit=Unit.MILLIGRAM,
-        name="milligram",
-        abbreviation="mg",
-        unit_delta_per_kilogram=1_000_000,
-    ),
-    _UnitInfo(
-        unit=Unit.POUND,
-        name="pound",
-        abbreviation="lb",
-        unit_delta_per_kilogram=2.20462262185,
-    ),
-    _UnitInfo(
-        unit=Unit.OUNCE,
-        name="ounce",
-        abbreviation="oz",
-        unit_delta_per_kilogram=35.2739619496,
-    ),
-]
-
-# Convert into dictionary for quick lookup
-_UNIT_TO_INFO_MAP: Final = {info.unit: info for info in _UNITS_INFO}
+    Raises:
+        ValueError: The unit is not a mass unit.
+    """
+    if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+        raise ValueError
 
 
 def get_name(unit: Unit) -> str:
@@ -113,10 +145,8 @@ def get_name(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].name
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _NAMES[unit]
 
 
 def get_abbreviation(unit: Unit) -> str:
@@ -124,20 +154,23 @@ def get_abbreviation(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].abbreviation
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _ABBREVIATIONS[unit]
 
 
-def get_unit_delta_per_kilogram(
-    unit: Unit,
-) -> float:
+def get_unit_delta_per_kilogram(unit: Unit) -> float:
     """Get the change in mass expressed as the unit per 1kg.
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].unit_delta_per_kilogram
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return UNIT_DELTAS_PER_KILOGRAM[unit]
+
+
+def get_fixed_point_ratio(unit: Unit) -> tuple[int, int]:
+    """Get the number of milligrams per 1 of the mass unit, as an integer ratio.
+
+    Not intended for public use.
+    """
+    _check_unit(unit)
+    return _FIXED_POINT_RATIOS[unit]
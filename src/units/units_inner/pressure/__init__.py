@@ -1,21 +1,46 @@
 """Package for pressure-related classes and constants."""
 
 from .constants import PERFECT_VACUUM, STANDARD_ATMOSPHERE
+from .converter import convert_into, make_converter
 from .exceptions import NegativePressureValueError
+from .filter import PressureFilter
+from .fixed_point_pressure import FixedPointPressure
+from .fixed_point_pressure_delta import FixedPointPressureDelta
+from .isr import PressureCell, PressureThreshold
 from .pressure import Pressure
+from .pressure_array import PressureArray
 from .pressure_delta import PressureDelta
-from .unit import Unit, get_unit_delta_per_pascal
+from .pressure_delta_array import PressureDeltaArray
+from .series import PressureSeries
+from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    Unit,
+    get_unit_delta_per_pascal,
+)
 from .unit import get_abbreviation as get_unit_abbreviation
 from .unit import get_name as get_unit_name
 
 __all__ = [
+    "CONVERSION_FACTORS",
+    "CONVERSION_FACTORS_STRIDE",
     "PERFECT_VACUUM",
     "STANDARD_ATMOSPHERE",
+    "FixedPointPressure",
+    "FixedPointPressureDelta",
     "NegativePressureValueError",
     "Pressure",
+    "PressureArray",
+    "PressureCell",
     "PressureDelta",
+    "PressureDeltaArray",
+    "PressureFilter",
+    "PressureSeries",
+    "PressureThreshold",
     "Unit",
+    "convert_into",
     "get_unit_abbreviation",
     "get_unit_delta_per_pascal",
     "get_unit_name",
+    "make_converter",
 ]
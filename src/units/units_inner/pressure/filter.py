@@ -0,0 +1,57 @@
+"""Module for the pressure filter class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from .exceptions import NegativePressureValueError
+from .pressure import Pressure
+from .unit import Unit, get_unit_delta_per_pascal
+
+if TYPE_CHECKING:
+    from ..filters import Filter
+
+
+class PressureFilter:
+    """A streaming filter over pressures, such as a moving average or median.
+
+    Each pressure is passed to the filter in pascals, and each result is returned
+    as a pressure in the unit of the filter, so that a stream of readings is smoothed
+    without unwrapping & rewrapping them by hand.
+    """
+
+    __slots__ = ("_filter", "_unit", "_unit_delta_per_pascal")
+
+    def __init__(self, filter_: "Filter", unit: Unit) -> None:
+        """Initialise a new pressure filter, returning results in the unit."""
+        self._filter = filter_
+        self._unit = unit
+        self._unit_delta_per_pascal = get_unit_delta_per_pascal(unit)
+
+    def update(self, pressure: Pressure) -> Pressure:
+        """Add the pressure to the filter & return the filtered pressure."""
+        return self._create(self._filter.update(pressure._value_as_pascal))
+
+    def update_value(self, value: float) -> Pressure:
+        """Add a raw value in the unit of the filter & return the filtered pressure.
+
+        Raises:
+            NegativePressureValueError: The negative value produced a pressure less than
+                0Pa.
+        """
+        if value < 0:
+            raise NegativePressureValueError(value=value)
+
+        return self._create(self._filter.update(value / self._unit_delta_per_pascal))
+
+    def _create(self, value_as_pascal: float) -> Pressure:
+        """Create a pressure in the unit of the filter from its value in pascals."""
+        return Pressure._create(
+            value_as_pascal * self._unit_delta_per_pascal, self._unit, value_as_pascal
+        )
+
+    def reset(self) -> None:
+        """Forget every pressure added to the filter."""
+        self._filter.reset()
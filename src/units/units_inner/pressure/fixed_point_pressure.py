@@ -0,0 +1,150 @@
+"""Module for the fixed-point pressure class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+from typing import overload
+
+from ..fixed_point import check_count, from_count, to_count
+from .exceptions import NegativePressureValueError
+from .fixed_point_pressure_delta import FixedPointPressureDelta
+from .pressure import Pressure
+from .unit import FIXED_POINT_RESOLUTION_PER_PASCAL, Unit, get_fixed_point_ratio
+
+
+class FixedPointPressure:
+    """A pressure, in fixed-point.
+
+    The pressure is held as an integer number of pascals. Intended for ports without
+    hardware floating point, or where floats are allocated on the heap. Only creating
+    the pressure & expressing it in a unit involve a conversion, which is done with an
+    integer ratio; arithmetic & comparisons stay in ints.
+
+    The count is kept within the range of a small int on 32-bit ports (see
+    `MAXIMUM_COUNT`), so up to about 1073 megapascals can be held, and creating a
+    pressure or doing arithmetic beyond it raises `OverflowError`.
+    """
+
+    __slots__ = ("_value_as_pascal",)
+
+    def __init__(self, value: int, unit: Unit) -> None:
+        """Initialise a new fixed-point pressure from an integer value.
+
+        The value is in the unit, and is rounded to the nearest pascal.
+
+        Raises:
+            NegativePressureValueError: The negative value produced a pressure less than
+            0Pa.
+            OverflowError: The value is too large to be held as a count of pascals.
+        """
+        if value < 0:
+            raise NegativePressureValueError(value=value)
+
+        numerator, denominator = get_fixed_point_ratio(unit)
+        self._value_as_pascal = to_count(value, numerator, denominator)
+
+    @classmethod
+    def _from_value_as_pascal(cls, value_as_pascal: int) -> "FixedPointPressure":
+        """Create a fixed-point pressure from a number of pascals.
+
+        Raises:
+            NegativePressureValueError: The number of pascals was negative.
+            OverflowError: The number of pascals was out of range.
+        """
+        if value_as_pascal < 0:
+            raise NegativePressureValueError(value=value_as_pascal)
+
+        pressure: FixedPointPressure = cls.__new__(cls)
+        pressure._value_as_pascal = check_count(value_as_pascal)
+        return pressure
+
+    def as_unit(self, unit: Unit) -> int:
+        """Return the pressure in the unit, rounded to the nearest integer."""
+        numerator, denominator = get_fixed_point_ratio(unit)
+        return from_count(self._value_as_pascal, numerator, denominator)
+
+    def to_pressure(self) -> Pressure:
+        """Return the pressure as a floating-point :py:class:`Pressure`."""
+        return Pressure(
+            self._value_as_pascal / FIXED_POINT_RESOLUTION_PER_PASCAL, Unit.PASCAL
+        )
+
+    def __add__(self, delta: FixedPointPressureDelta) -> "FixedPointPressure":
+        """Return the sum of the pressure and the difference.
+
+        Raises:
+            NegativePressureValueError: The sum of the pressure and the difference was
+            less
+                than 0Pa.
+        """
+        return FixedPointPressure._from_value_as_pascal(
+            self._value_as_pascal + delta._value_as_pascal
+        )
+
+    def __radd__(self, delta: FixedPointPressureDelta) -> "FixedPointPressure":
+        """Return the sum of the pressure and the difference."""
+        return self + delta
+
+    @overload
+    def __sub__(self, other: "FixedPointPressure") -> FixedPointPressureDelta: ...
+
+    @overload
+    def __sub__(self, other: FixedPointPressureDelta) -> "FixedPointPressure": ...
+
+    def __sub__(
+        self, other: "FixedPointPressure | FixedPointPressureDelta"
+    ) -> "FixedPointPressureDelta | FixedPointPressure":
+        """Return the delta between pressures or the pressure less the delta.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a :py:class:`FixedPointPressure`, return the difference
+          between the two pressures.
+        - If the argument is a :py:class:`FixedPointPressureDelta`, return the pressure
+          less the difference.
+
+        Raises:
+            NegativePressureValueError: The pressure minus the difference was less
+                than 0Pa. Error can only be raised when other is a
+                :py:class:`FixedPointPressureDelta`.
+        """
+        value_difference_as_pascal = self._value_as_pascal - other._value_as_pascal
+        return (
+            FixedPointPressureDelta._from_value_as_pascal(value_difference_as_pascal)
+            if isinstance(other, FixedPointPressure)
+            else FixedPointPressure._from_value_as_pascal(value_difference_as_pascal)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the objects are equal fixed-point pressures."""
+        if not isinstance(other, FixedPointPressure):
+            return NotImplemented
+
+        return self._value_as_pascal == other._value_as_pascal
+
+    def __lt__(self, other: "FixedPointPressure") -> bool:
+        """Return whether the pressure is less than the other."""
+        return self._value_as_pascal < other._value_as_pascal
+
+    def __le__(self, other: "FixedPointPressure") -> bool:
+        """Return whether the pressure is less than or equal to the other."""
+        return self._value_as_pascal <= other._value_as_pascal
+
+    def __gt__(self, other: "FixedPointPressure") -> bool:
+        """Return whether the pressure is greater than the other."""
+        return self._value_as_pascal > other._value_as_pascal
+
+    def __ge__(self, other: "FixedPointPressure") -> bool:
+        """Return whether the pressure is greater than or equal to the other."""
+        return self._value_as_pascal >= other._value_as_pascal
+
+    def __hash__(self) -> int:
+        """Return the hash of the pressure."""
+        return hash(self._value_as_pascal)
+
+    def __str__(self) -> str:
+        """Return a string representation of the pressure."""
+        return f"{self._value_as_pascal} Pa"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the pressure for developers."""
+        return f"{__class__.__name__}({self._value_as_pascal} Pa)"
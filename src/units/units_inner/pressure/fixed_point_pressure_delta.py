@@ -0,0 +1,153 @@
+"""Module for the fixed-point pressure delta class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+from typing import overload
+
+from ..fixed_point import check_count, from_count, to_count
+from .pressure_delta import PressureDelta
+from .unit import FIXED_POINT_RESOLUTION_PER_PASCAL, Unit, get_fixed_point_ratio
+
+
+class FixedPointPressureDelta:
+    """The difference between two pressures, in fixed-point.
+
+    The pressure delta is held as an integer number of pascals. Intended for ports
+    without hardware floating point, or where floats are allocated on the heap. Only
+    creating the pressure delta & expressing it in a unit involve a conversion, which is
+    done with an integer ratio; arithmetic & comparisons stay in ints.
+
+    The count is kept within the range of a small int on 32-bit ports (see
+    `MAXIMUM_COUNT`), so up to about 1073 megapascals can be held, and creating a
+    pressure delta or doing arithmetic beyond it raises `OverflowError`.
+    """
+
+    __slots__ = ("_value_as_pascal",)
+
+    def __init__(self, value: int, unit: Unit) -> None:
+        """Initialise a new fixed-point pressure delta from an integer value.
+
+        The value is in the unit, and is rounded to the nearest pascal.
+
+        Raises:
+            OverflowError: The value is too large to be held as a count of pascals.
+        """
+        numerator, denominator = get_fixed_point_ratio(unit)
+        self._value_as_pascal = to_count(value, numerator, denominator)
+
+    @classmethod
+    def _from_value_as_pascal(cls, value_as_pascal: int) -> "FixedPointPressureDelta":
+        """Create a fixed-point pressure delta from a number of pascals.
+
+        Raises:
+            OverflowError: The number of pascals was out of range.
+        """
+        delta: FixedPointPressureDelta = cls.__new__(cls)
+        delta._value_as_pascal = check_count(value_as_pascal)
+        return delta
+
+    def as_unit(self, unit: Unit) -> int:
+        """Return the pressure delta in the unit, rounded to the nearest integer."""
+        numerator, denominator = get_fixed_point_ratio(unit)
+        return from_count(self._value_as_pascal, numerator, denominator)
+
+    def to_pressure_delta(self) -> PressureDelta:
+        """Return the pressure delta as a floating-point :py:class:`PressureDelta`."""
+        return PressureDelta(
+            self._value_as_pascal / FIXED_POINT_RESOLUTION_PER_PASCAL, Unit.PASCAL
+        )
+
+    def __mul__(self, value: int) -> "FixedPointPressureDelta":
+        """Return the pressure delta scaled by the integer."""
+        return FixedPointPressureDelta._from_value_as_pascal(
+            self._value_as_pascal * value
+        )
+
+    def __rmul__(self, value: int) -> "FixedPointPressureDelta":
+        """Return the pressure delta scaled by the integer."""
+        return self * value
+
+    @overload
+    def __floordiv__(self, other: int) -> "FixedPointPressureDelta": ...
+
+    @overload
+    def __floordiv__(self, other: "FixedPointPressureDelta") -> int: ...
+
+    def __floordiv__(
+        self, other: "int | FixedPointPressureDelta"
+    ) -> "FixedPointPressureDelta | int":
+        """Return a floored scaled pressure delta or the floored ratio between them.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is an :py:class:`int`, return the pressure delta scaled by the
+          inverse of the value, floored to the nearest pascal.
+        - If the argument is a :py:class:`FixedPointPressureDelta`, return the floored
+          ratio between the two.
+        """
+        if isinstance(other, FixedPointPressureDelta):
+            return self._value_as_pascal // other._value_as_pascal
+
+        return FixedPointPressureDelta._from_value_as_pascal(
+            self._value_as_pascal // other
+        )
+
+    def __add__(self, other: "FixedPointPressureDelta") -> "FixedPointPressureDelta":
+        """Return the sum of the pressure deltas."""
+        # Adding to a fixed-point pressure is handled by the __radd__ method of the
+        # fixed-point pressure class
+        if not isinstance(other, FixedPointPressureDelta):  # type: ignore[reportUnnecessaryIsInstance]
+            return NotImplemented
+
+        return FixedPointPressureDelta._from_value_as_pascal(
+            self._value_as_pascal + other._value_as_pascal
+        )
+
+    def __sub__(self, other: "FixedPointPressureDelta") -> "FixedPointPressureDelta":
+        """Return the difference between the pressure deltas."""
+        return FixedPointPressureDelta._from_value_as_pascal(
+            self._value_as_pascal - other._value_as_pascal
+        )
+
+    def __neg__(self) -> "FixedPointPressureDelta":
+        """Return the inverse of the pressure delta."""
+        return FixedPointPressureDelta._from_value_as_pascal(-self._value_as_pascal)
+
+    def __abs__(self) -> "FixedPointPressureDelta":
+        """Return the absolute version of the pressure delta."""
+        return FixedPointPressureDelta._from_value_as_pascal(abs(self._value_as_pascal))
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the objects are equal fixed-point pressure deltas."""
+        if not isinstance(other, FixedPointPressureDelta):
+            return NotImplemented
+
+        return self._value_as_pascal == other._value_as_pascal
+
+    def __lt__(self, other: "FixedPointPressureDelta") -> bool:
+        """Return whether the pressure delta is less than the other."""
+        return self._value_as_pascal < other._value_as_pascal
+
+    def __le__(self, other: "FixedPointPressureDelta") -> bool:
+        """Return whether the pressure delta is less than or equal to the other."""
+        return self._value_as_pascal <= other._value_as_pascal
+
+    def __gt__(self, other: "FixedPointPressureDelta") -> bool:
+        """Return whether the pressure delta is greater than the other."""
+        return self._value_as_pascal > other._value_as_pascal
+
+    def __ge__(self, other: "FixedPointPressureDelta") -> bool:
+        """Return whether the pressure delta is greater than or equal to the other."""
+        return self._value_as_pascal >= other._value_as_pascal
+
+    def __hash__(self) -> int:
+        """Return the hash of the pressure delta."""
+        return hash(self._value_as_pascal)
+
+    def __str__(self) -> str:
+        """Return a string representation of the pressure delta."""
+        return f"{self._value_as_pascal} Pa"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the pressure delta for developers."""
+        return f"{__class__.__name__}({self._value_as_pascal} Pa)"
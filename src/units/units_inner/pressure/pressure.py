@@ -1,10 +1,15 @@
 """Module for the pressure class."""
 
+# pyright: reportPrivateUsage=false
+
 from typing import overload
 
 from .exceptions import NegativePressureValueError
 from .pressure_delta import PressureDelta
 from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    UNIT_DELTAS_PER_PASCAL,
     Unit,
     get_abbreviation,
     get_name,
@@ -15,6 +20,8 @@ from .unit import (
 class Pressure:
     """The force applied per unit area over which that force is distributed."""
 
+    __slots__ = ("_unit", "_value", "_value_as_pascal")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new pressure.
 
@@ -27,13 +34,43 @@ class Pressure:
 
         self._value = value
         self._unit = unit
+        internal_unit_delta_per_pascal = get_unit_delta_per_pascal(self._unit)
+        self._value_as_pascal = self._value / internal_unit_delta_per_pascal
+
+    @classmethod
+    def _create(cls, value: float, unit: Unit, value_as_pascal: float) -> "Pressure":
+        """Create a pressure from its value in both the unit & pascals.
+
+        Not intended for public use.
+
+        The value is not converted again, and the only validation is a single
+        comparison of the value in pascals.
+
+        Raises:
+            NegativePressureValueError: The value produced a pressure less than 0Pa.
+        """
+        if value_as_pascal < 0:
+            raise NegativePressureValueError(value=value)
+
+        pressure: Pressure = cls.__new__(cls)
+        pressure._value = value
+        pressure._unit = unit
+        pressure._value_as_pascal = value_as_pascal
+        return pressure
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the pressure, expressed as the unit."""
-        internal_unit_delta_per_pascal = get_unit_delta_per_pascal(self._unit)
-        value_as_pascal = self._value / internal_unit_delta_per_pascal
-        external_unit_delta_per_pascal = get_unit_delta_per_pascal(unit)
-        return external_unit_delta_per_pascal * value_as_pascal
+        """Return the pressure, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not a pressure unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __add__(self, delta: PressureDelta) -> "Pressure":
         """Return the sum of the pressure and the difference.
@@ -42,10 +79,16 @@ class Pressure:
             NegativePressureValueError: The sum of the pressure and the difference was
                 less than 0Pa.
         """
-        value_as_pascal = self.as_unit(Unit.PASCAL)
-        delta_value_as_pascal = delta.as_unit(Unit.PASCAL)
-        value_sum_as_pascal = value_as_pascal + delta_value_as_pascal
-        return Pressure(value_sum_as_pascal, Unit.PASCAL)
+        if self._unit == delta._unit:
+            value_sum = self._value + delta._value
+            return Pressure._create(
+                value_sum,
+                self._unit,
+                value_sum / UNIT_DELTAS_PER_PASCAL[self._unit],
+            )
+
+        value_sum_as_pascal = self._value_as_pascal + delta._value_as_pascal
+        return Pressure._create(value_sum_as_pascal, Unit.PASCAL, value_sum_as_pascal)
 
     def __radd__(self, delta: PressureDelta) -> "Pressure":
         """Return the sum of the pressure and the difference."""
@@ -72,13 +115,30 @@ class Pressure:
                 than 0Pa. Error can only be raised when other is a
                 :py:class:`PressureDelta`.
         """
-        value_as_pascal = self.as_unit(Unit.PASCAL)
-        other_value_as_pascal = other.as_unit(Unit.PASCAL)
-        value_difference_as_pascal = value_as_pascal - other_value_as_pascal
+        if self._unit == other._unit:
+            value_difference = self._value - other._value
+            value_difference_as_pascal = (
+                value_difference / UNIT_DELTAS_PER_PASCAL[self._unit]
+            )
+            return (
+                PressureDelta._create(
+                    value_difference, self._unit, value_difference_as_pascal
+                )
+                if isinstance(other, Pressure)
+                else Pressure._create(
+                    value_difference, self._unit, value_difference_as_pascal
+                )
+            )
+
+        value_difference_as_pascal = self._value_as_pascal - other._value_as_pascal
         return (
-            PressureDelta(value_difference_as_pascal, Unit.PASCAL)
+            PressureDelta._create(
+                value_difference_as_pascal, Unit.PASCAL, value_difference_as_pascal
+            )
             if isinstance(other, Pressure)
-            else Pressure(value_difference_as_pascal, Unit.PASCAL)
+            else Pressure._create(
+                value_difference_as_pascal, Unit.PASCAL, value_difference_as_pascal
+            )
         )
 
     def __eq__(self, other: object) -> bool:
@@ -86,27 +146,27 @@ class Pressure:
         if not isinstance(other, Pressure):
             return NotImplemented
 
-        return self.as_unit(Unit.PASCAL) == other.as_unit(Unit.PASCAL)
+        return self._value_as_pascal == other._value_as_pascal
 
     def __lt__(self, other: "Pressure") -> bool:
         """Return whether the pressure is less than the other."""
-        return self.as_unit(Unit.PASCAL) < other.as_unit(Unit.PASCAL)
+        return self._value_as_pascal < other._value_as_pascal
 
     def __le__(self, other: "Pressure") -> bool:
         """Return whether the pressure is less than or equal to the other."""
-        return self.as_unit(Unit.PASCAL) <= other.as_unit(Unit.PASCAL)
+        return self._value_as_pascal <= other._value_as_pascal
 
     def __gt__(self, other: "Pressure") -> bool:
         """Return whether the pressure is greater than the other."""
-        return self.as_unit(Unit.PASCAL) > other.as_unit(Unit.PASCAL)
+        return self._value_as_pascal > other._value_as_pascal
 
     def __ge__(self, other: "Pressure") -> bool:
         """Return whether the pressure is greater than or equal to the other."""
-        return self.as_unit(Unit.PASCAL) >= other.as_unit(Unit.PASCAL)
+        return self._value_as_pascal >= other._value_as_pascal
 
     def __hash__(self) -> int:
         """Return the hash of the pressure."""
-        return hash(self.as_unit(Unit.PASCAL))
+        return hash(self._value_as_pascal)
 
     def __str__(self) -> str:
         """Return a string representation of the pressure."""
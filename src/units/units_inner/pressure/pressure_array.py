@@ -0,0 +1,234 @@
+"""Module for the pressure array class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    create_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .exceptions import NegativePressureValueError
+from .pressure import Pressure
+from .pressure_delta import PressureDelta
+from .pressure_delta_array import PressureDeltaArray
+from .unit import Unit, get_name, get_unit_delta_per_pascal
+
+if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Iterable, Iterator
+
+
+def _check_non_negative(
+    values_as_pascal: "array[float] | memoryview", unit: Unit
+) -> None:
+    """Check that none of the pressures are less than 0Pa.
+
+    Raises:
+        NegativePressureValueError: One of the pressures was less than 0Pa.
+    """
+    if not values_as_pascal:
+        return
+
+    minimum_value_as_pascal = min(values_as_pascal)
+    if minimum_value_as_pascal < 0:
+        internal_unit_delta_per_pascal = get_unit_delta_per_pascal(unit)
+        raise NegativePressureValueError(
+            value=minimum_value_as_pascal * internal_unit_delta_per_pascal
+        )
+
+
+class PressureArray:
+    """A homogeneous array of pressures.
+
+    The pressures are stored in bulk as pascals, and share a single unit that they
+    are expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_pascal")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of pressures, with all values in the unit.
+
+        Raises:
+            NegativePressureValueError: One of the values produced a pressure less than
+                0Pa.
+        """
+        internal_unit_delta_per_pascal = get_unit_delta_per_pascal(unit)
+        values_as_pascal = create_values(values, 1 / internal_unit_delta_per_pascal)
+        _check_non_negative(values_as_pascal, unit)
+
+        self._unit = unit
+        self._values_as_pascal: array[float] | memoryview = values_as_pascal
+
+    @classmethod
+    def _from_values_as_pascal(
+        cls, values_as_pascal: "array[float] | memoryview", unit: Unit
+    ) -> "PressureArray":
+        """Create an array of pressures directly from a buffer of pascals.
+
+        The buffer is used as-is, rather than copied, and is assumed to be valid.
+        """
+        pressures: PressureArray = cls.__new__(cls)
+        pressures._unit = unit
+        pressures._values_as_pascal = values_as_pascal
+        return pressures
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the pressures, expressed as the unit."""
+        external_unit_delta_per_pascal = get_unit_delta_per_pascal(unit)
+        return create_values(self._values_as_pascal, external_unit_delta_per_pascal)
+
+    def __len__(self) -> int:
+        """Return the number of pressures."""
+        return len(self._values_as_pascal)
+
+    @overload
+    def __getitem__(self, index: int) -> Pressure: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PressureArray": ...
+
+    def __getitem__(self, index: "int | slice") -> "Pressure | PressureArray":
+        """Return the pressure at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return PressureArray._from_values_as_pascal(
+                memoryview(self._values_as_pascal)[index], self._unit
+            )
+
+        internal_unit_delta_per_pascal = get_unit_delta_per_pascal(self._unit)
+        return Pressure(
+            self._values_as_pascal[index] * internal_unit_delta_per_pascal, self._unit
+        )
+
+    def __iter__(self) -> "Iterator[Pressure]":
+        """Return an iterator over the pressures."""
+        internal_unit_delta_per_pascal = get_unit_delta_per_pascal(self._unit)
+        for value_as_pascal in self._values_as_pascal:
+            yield Pressure(value_as_pascal * internal_unit_delta_per_pascal, self._unit)
+
+    def __add__(self, delta: "PressureDelta | PressureDeltaArray") -> "PressureArray":
+        """Return the sum of the pressures and the difference(s).
+
+        A single pressure delta is added to every pressure, while an array of pressure
+        deltas is added elementwise.
+
+        Raises:
+            NegativePressureValueError: One of the sums was less than 0Pa.
+            ValueError: The arrays are of different lengths.
+        """
+        delta_values_as_pascal = (
+            delta.as_unit(Unit.PASCAL)
+            if isinstance(delta, PressureDelta)
+            else delta._values_as_pascal
+        )
+        value_sums_as_pascal = add_values(
+            self._values_as_pascal, delta_values_as_pascal
+        )
+        _check_non_negative(value_sums_as_pascal, self._unit)
+        return PressureArray._from_values_as_pascal(value_sums_as_pascal, self._unit)
+
+    def __radd__(self, delta: PressureDelta) -> "PressureArray":
+        """Return the sum of the pressures and the difference.
+
+        Raises:
+            NegativePressureValueError: One of the sums was less than 0Pa.
+        """
+        return self + delta
+
+    @overload
+    def __sub__(self, other: "Pressure | PressureArray") -> PressureDeltaArray: ...
+
+    @overload
+    def __sub__(
+        self, other: "PressureDelta | PressureDeltaArray"
+    ) -> "PressureArray": ...
+
+    def __sub__(
+        self, other: "Pressure | PressureArray | PressureDelta | PressureDeltaArray"
+    ) -> "PressureDeltaArray | PressureArray":
+        """Return the difference between the pressures and the other(s).
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a pressure or an array of pressures, return the differences
+          between the pressures.
+        - If the argument is a pressure delta or an array of pressure deltas, return the
+          pressures less the differences.
+
+        A single argument is subtracted from every pressure, while an array is
+        subtracted elementwise.
+
+        Raises:
+            NegativePressureValueError: One of the differences was less than 0Pa. Error
+                can only be raised when other is a :py:class:`PressureDelta` or
+                :py:class:`PressureDeltaArray`.
+            ValueError: The arrays are of different lengths.
+        """
+        other_values_as_pascal = (
+            other.as_unit(Unit.PASCAL)
+            if isinstance(other, (Pressure, PressureDelta))
+            else other._values_as_pascal
+        )
+        value_differences_as_pascal = subtract_values(
+            self._values_as_pascal, other_values_as_pascal
+        )
+        if isinstance(other, (Pressure, PressureArray)):
+            return PressureDeltaArray._from_values_as_pascal(
+                value_differences_as_pascal, self._unit
+            )
+
+        _check_non_negative(value_differences_as_pascal, self._unit)
+        return PressureArray._from_values_as_pascal(
+            value_differences_as_pascal, self._unit
+        )
+
+    def __lt__(self, other: "Pressure | PressureArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the pressures less than the other pressure(s)."""
+        other_values_as_pascal = (
+            other.as_unit(Unit.PASCAL)
+            if isinstance(other, Pressure)
+            else other._values_as_pascal
+        )
+        return less_than(self._values_as_pascal, other_values_as_pascal)
+
+    def __le__(self, other: "Pressure | PressureArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the pressures less than or equal to the other(s)."""
+        other_values_as_pascal = (
+            other.as_unit(Unit.PASCAL)
+            if isinstance(other, Pressure)
+            else other._values_as_pascal
+        )
+        return less_than_or_equal_to(self._values_as_pascal, other_values_as_pascal)
+
+    def __gt__(self, other: "Pressure | PressureArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the pressures greater than the other pressure(s)."""
+        other_values_as_pascal = (
+            other.as_unit(Unit.PASCAL)
+            if isinstance(other, Pressure)
+            else other._values_as_pascal
+        )
+        return greater_than(self._values_as_pascal, other_values_as_pascal)
+
+    def __ge__(self, other: "Pressure | PressureArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the pressures greater than or equal to the other(s)."""
+        other_values_as_pascal = (
+            other.as_unit(Unit.PASCAL)
+            if isinstance(other, Pressure)
+            else other._values_as_pascal
+        )
+        return greater_than_or_equal_to(self._values_as_pascal, other_values_as_pascal)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the pressures."""
+        values = list(self.as_unit(self._unit))
+        return f"PressureArray({values}, {get_name(self._unit)})"
@@ -3,6 +3,9 @@
 from typing import overload
 
 from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    UNIT_DELTAS_PER_PASCAL,
     Unit,
     get_abbreviation,
     get_name,
@@ -13,22 +16,51 @@ from .unit import (
 class PressureDelta:
     """The difference between two pressures."""
 
+    __slots__ = ("_unit", "_value", "_value_as_pascal")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new pressure difference."""
         self._value = value
         self._unit = unit
+        internal_unit_delta_per_pascal = get_unit_delta_per_pascal(self._unit)
+        self._value_as_pascal = self._value / internal_unit_delta_per_pascal
+
+    @classmethod
+    def _create(
+        cls, value: float, unit: Unit, value_as_pascal: float
+    ) -> "PressureDelta":
+        """Create a pressure difference from its value in both the unit & pascals.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        pressure_delta: PressureDelta = cls.__new__(cls)
+        pressure_delta._value = value
+        pressure_delta._unit = unit
+        pressure_delta._value_as_pascal = value_as_pascal
+        return pressure_delta
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the pressure difference, expressed as the unit."""
-        internal_unit_delta_per_pascal = get_unit_delta_per_pascal(self._unit)
-        value_as_pascal = self._value / internal_unit_delta_per_pascal
-        external_unit_delta_per_pascal = get_unit_delta_per_pascal(unit)
-        return external_unit_delta_per_pascal * value_as_pascal
+        """Return the pressure difference, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not a pressure unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __mul__(self, value: float) -> "PressureDelta":
         """Return a pressure difference scaled by the value."""
         scaled_value = self._value * value
-        return PressureDelta(scaled_value, self._unit)
+        return PressureDelta._create(
+            scaled_value, self._unit, self._value_as_pascal * value
+        )
 
     def __rmul__(self, value: float) -> "PressureDelta":
         """Return a pressure difference scaled by the value."""
@@ -51,12 +83,12 @@ class PressureDelta:
           two differences
         """
         if isinstance(other, PressureDelta):
-            value_as_pascal = self.as_unit(Unit.PASCAL)
-            other_value_as_pascal = other.as_unit(Unit.PASCAL)
-            return value_as_pascal / other_value_as_pascal
+            return self._value_as_pascal / other._value_as_pascal
 
         scaled_value = self._value / other
-        return PressureDelta(scaled_value, self._unit)
+        return PressureDelta._create(
+            scaled_value, self._unit, self._value_as_pascal / other
+        )
 
     def __add__(self, other: "PressureDelta") -> "PressureDelta":
         """Return the sum of the pressure differences."""
@@ -66,10 +98,18 @@ class PressureDelta:
         if not isinstance(other, PressureDelta):  # type: ignore[reportUnnecessaryIsInstance]
             return NotImplemented
 
-        value_as_pascal = self.as_unit(Unit.PASCAL)
-        delta_value_as_pascal = other.as_unit(Unit.PASCAL)
-        added_value_as_pascal = value_as_pascal + delta_value_as_pascal
-        return PressureDelta(added_value_as_pascal, Unit.PASCAL)
+        if self._unit == other._unit:
+            value_sum = self._value + other._value
+            return PressureDelta._create(
+                value_sum,
+                self._unit,
+                value_sum / UNIT_DELTAS_PER_PASCAL[self._unit],
+            )
+
+        added_value_as_pascal = self._value_as_pascal + other._value_as_pascal
+        return PressureDelta._create(
+            added_value_as_pascal, Unit.PASCAL, added_value_as_pascal
+        )
 
     def __sub__(self, delta: "PressureDelta") -> "PressureDelta":
         """Return the difference between the pressure differences."""
@@ -78,57 +118,53 @@ class PressureDelta:
     def __neg__(self) -> "PressureDelta":
         """Return the inverse of the pressure difference."""
         inverted_value = -self._value
-        return PressureDelta(inverted_value, self._unit)
+        return PressureDelta._create(inverted_value, self._unit, -self._value_as_pascal)
 
     def __abs__(self) -> "PressureDelta":
         """Return the absolute version of the pressure difference."""
         absolute_value = abs(self._value)
-        return PressureDelta(absolute_value, self._unit)
+        return PressureDelta._create(
+            absolute_value, self._unit, abs(self._value_as_pascal)
+        )
 
     def __floordiv__(self, other: "PressureDelta") -> float:
         """Return the floored ratio between the pressure differences."""
-        value_as_pascal = self.as_unit(Unit.PASCAL)
-        other_value_as_pascal = other.as_unit(Unit.PASCAL)
-        return value_as_pascal // other_value_as_pascal
+        return self._value_as_pascal // other._value_as_pascal
 
     def __mod__(self, other: "PressureDelta") -> float:
         """Return the remainder of the ratio between the pressure differences."""
-        value_as_pascal = self.as_unit(Unit.PASCAL)
-        other_value_as_pascal = other.as_unit(Unit.PASCAL)
-        return value_as_pascal % other_value_as_pascal
+        return self._value_as_pascal % other._value_as_pascal
 
     def __divmod__(self, other: "PressureDelta") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the pressure deltas."""
-        value_as_pascal = self.as_unit(Unit.PASCAL)
-        other_value_as_pascal = other.as_unit(Unit.PASCAL)
-        return divmod(value_as_pascal, other_value_as_pascal)
+        return divmod(self._value_as_pascal, other._value_as_pascal)
 
     def __eq__(self, other: object) -> bool:
         """Return whether the objects are equal pressure differences."""
         if not isinstance(other, PressureDelta):
             return NotImplemented
 
-        return self.as_unit(Unit.PASCAL) == other.as_unit(Unit.PASCAL)
+        return self._value_as_pascal == other._value_as_pascal
 
     def __lt__(self, other: "PressureDelta") -> bool:
         """Return whether the pressure difference is less than the other."""
-        return self.as_unit(Unit.PASCAL) < other.as_unit(Unit.PASCAL)
+        return self._value_as_pascal < other._value_as_pascal
 
     def __le__(self, other: "PressureDelta") -> bool:
         """Return whether the pressure delta is less than or equal to the other."""
-        return self.as_unit(Unit.PASCAL) <= other.as_unit(Unit.PASCAL)
+        return self._value_as_pascal <= other._value_as_pascal
 
     def __gt__(self, other: "PressureDelta") -> bool:
         """Return whether the pressure difference is greater than the other."""
-        return self.as_unit(Unit.PASCAL) > other.as_unit(Unit.PASCAL)
+        return self._value_as_pascal > other._value_as_pascal
 
     def __ge__(self, other: "PressureDelta") -> bool:
         """Return whether the pressure delta is greater than or equal to the other."""
-        return self.as_unit(Unit.PASCAL) >= other.as_unit(Unit.PASCAL)
+        return self._value_as_pascal >= other._value_as_pascal
 
     def __hash__(self) -> int:
         """Return the hash of the pressure difference."""
-        return hash(self.as_unit(Unit.PASCAL))
+        return hash(self._value_as_pascal)
 
     def __str__(self) -> str:
         """Return a string representation of the pressure difference."""
@@ -0,0 +1,209 @@
+"""Module for the pressure delta array class."""
+
+# ruff: noqa: TID252
+
+from array import array
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    create_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .pressure_delta import PressureDelta
+from .unit import Unit, get_name, get_unit_delta_per_pascal
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class PressureDeltaArray:
+    """A homogeneous array of pressure deltas.
+
+    The deltas are stored in bulk as pascals, and share a single unit that they are
+    expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_pascal")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of pressure deltas, with all values in the unit."""
+        internal_unit_delta_per_pascal = get_unit_delta_per_pascal(unit)
+        self._unit = unit
+        self._values_as_pascal: array[float] | memoryview = create_values(
+            values, 1 / internal_unit_delta_per_pascal
+        )
+
+    @classmethod
+    def _from_values_as_pascal(
+        cls, values_as_pascal: "array[float] | memoryview", unit: Unit
+    ) -> "PressureDeltaArray":
+        """Create an array of pressure deltas directly from a buffer of pascals.
+
+        The buffer is used as-is, rather than copied.
+        """
+        deltas: PressureDeltaArray = cls.__new__(cls)
+        deltas._unit = unit
+        deltas._values_as_pascal = values_as_pascal
+        return deltas
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the pressure deltas, expressed as the unit."""
+        external_unit_delta_per_pascal = get_unit_delta_per_pascal(unit)
+        return create_values(self._values_as_pascal, external_unit_delta_per_pascal)
+
+    def __len__(self) -> int:
+        """Return the number of pressure deltas."""
+        return len(self._values_as_pascal)
+
+    @overload
+    def __getitem__(self, index: int) -> PressureDelta: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PressureDeltaArray": ...
+
+    def __getitem__(self, index: "int | slice") -> "PressureDelta | PressureDeltaArray":
+        """Return the pressure delta at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return PressureDeltaArray._from_values_as_pascal(
+                memoryview(self._values_as_pascal)[index], self._unit
+            )
+
+        internal_unit_delta_per_pascal = get_unit_delta_per_pascal(self._unit)
+        return PressureDelta(
+            self._values_as_pascal[index] * internal_unit_delta_per_pascal, self._unit
+        )
+
+    def __iter__(self) -> "Iterator[PressureDelta]":
+        """Return an iterator over the pressure deltas."""
+        internal_unit_delta_per_pascal = get_unit_delta_per_pascal(self._unit)
+        for value_as_pascal in self._values_as_pascal:
+            yield PressureDelta(
+                value_as_pascal * internal_unit_delta_per_pascal, self._unit
+            )
+
+    def __mul__(self, value: float) -> "PressureDeltaArray":
+        """Return the pressure deltas scaled by the value."""
+        return PressureDeltaArray._from_values_as_pascal(
+            create_values(self._values_as_pascal, value), self._unit
+        )
+
+    def __rmul__(self, value: float) -> "PressureDeltaArray":
+        """Return the pressure deltas scaled by the value."""
+        return self * value
+
+    def __truediv__(self, value: float) -> "PressureDeltaArray":
+        """Return the pressure deltas scaled by the inverse of the value."""
+        return self * (1 / value)
+
+    def __add__(
+        self, other: "PressureDelta | PressureDeltaArray"
+    ) -> "PressureDeltaArray":
+        """Return the sum of the pressure deltas and the other delta(s).
+
+        A single pressure delta is added to every element, while an array of pressure
+        deltas is added elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, PressureDelta):
+            return PressureDeltaArray._from_values_as_pascal(
+                add_values(self._values_as_pascal, other.as_unit(Unit.PASCAL)),
+                self._unit,
+            )
+
+        if isinstance(other, PressureDeltaArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return PressureDeltaArray._from_values_as_pascal(
+                add_values(self._values_as_pascal, other._values_as_pascal),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __radd__(self, other: PressureDelta) -> "PressureDeltaArray":
+        """Return the sum of the pressure deltas and the other delta."""
+        return self + other
+
+    def __sub__(
+        self, other: "PressureDelta | PressureDeltaArray"
+    ) -> "PressureDeltaArray":
+        """Return the difference of the pressure deltas and the other delta(s).
+
+        A single pressure delta is subtracted from every element, while an array of
+        pressure deltas is subtracted elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, PressureDelta):
+            return PressureDeltaArray._from_values_as_pascal(
+                subtract_values(self._values_as_pascal, other.as_unit(Unit.PASCAL)),
+                self._unit,
+            )
+
+        if isinstance(other, PressureDeltaArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return PressureDeltaArray._from_values_as_pascal(
+                subtract_values(self._values_as_pascal, other._values_as_pascal),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __neg__(self) -> "PressureDeltaArray":
+        """Return the inverse of the pressure deltas."""
+        return self * -1
+
+    def __abs__(self) -> "PressureDeltaArray":
+        """Return the absolute of the pressure deltas."""
+        return PressureDeltaArray._from_values_as_pascal(
+            array("d", (abs(value) for value in self._values_as_pascal)), self._unit
+        )
+
+    def __lt__(self, other: "PressureDelta | PressureDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the pressure deltas less than the other delta(s)."""
+        other_values_as_pascal = (
+            other.as_unit(Unit.PASCAL)
+            if isinstance(other, PressureDelta)
+            else other._values_as_pascal
+        )
+        return less_than(self._values_as_pascal, other_values_as_pascal)
+
+    def __le__(self, other: "PressureDelta | PressureDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the pressure deltas less than or equal to the other(s)."""
+        other_values_as_pascal = (
+            other.as_unit(Unit.PASCAL)
+            if isinstance(other, PressureDelta)
+            else other._values_as_pascal
+        )
+        return less_than_or_equal_to(self._values_as_pascal, other_values_as_pascal)
+
+    def __gt__(self, other: "PressureDelta | PressureDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the pressure deltas greater than the other delta(s)."""
+        other_values_as_pascal = (
+            other.as_unit(Unit.PASCAL)
+            if isinstance(other, PressureDelta)
+            else other._values_as_pascal
+        )
+        return greater_than(self._values_as_pascal, other_values_as_pascal)
+
+    def __ge__(self, other: "PressureDelta | PressureDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the pressure deltas greater than or equal to others."""
+        other_values_as_pascal = (
+            other.as_unit(Unit.PASCAL)
+            if isinstance(other, PressureDelta)
+            else other._values_as_pascal
+        )
+        return greater_than_or_equal_to(self._values_as_pascal, other_values_as_pascal)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the pressure deltas."""
+        values = list(self.as_unit(self._unit))
+        return f"PressureDeltaArray({values}, {get_name(self._unit)})"
@@ -0,0 +1,134 @@
+"""Module for the pressure series class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from ..ring_buffer import RingBuffer
+from .exceptions import NegativePressureValueError
+from .pressure import Pressure
+from .pressure_array import PressureArray
+from .unit import Unit, get_name, get_unit_delta_per_pascal
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ..time import Time
+
+
+class PressureSeries(RingBuffer):
+    """A rolling window of the most recent pressures, with optional timestamps.
+
+    The pressures are stored as pascals in a buffer preallocated on initialisation,
+    so that pushing a pressure drops the oldest one once the series is full,
+    rather than allocating. The pressures are indexed from the oldest (0) to the
+    latest (-1), and are expressed in the unit of the series when retrieved.
+    """
+
+    __slots__ = ("_unit", "_unit_delta_per_pascal")
+
+    def __init__(self, capacity: int, unit: Unit, *, timestamped: bool = False) -> None:
+        """Initialise a new, empty series, holding up to the number of pressures.
+
+        If the series is timestamped, every pressure is pushed along with the time it
+        was measured at.
+
+        Raises:
+            ValueError: The capacity is less than 1.
+        """
+        super().__init__(capacity, timestamped=timestamped)
+        self._unit = unit
+        self._unit_delta_per_pascal = get_unit_delta_per_pascal(unit)
+
+    def push(self, pressure: Pressure, time: "Time | None" = None) -> None:
+        """Push a pressure, dropping the oldest one if the series is full.
+
+        Does not allocate.
+
+        Raises:
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        end = self._end
+        if end == self._limit:
+            end = self._compact()
+        times = self._times
+        if times is not None and time is not None:
+            times[end] = time._value_as_second
+        elif times is not None or time is not None:
+            self._raise_time_error()
+        self._values[end] = pressure._value_as_pascal
+        self._end = end + 1
+
+    def push_value(self, value: float, time: "Time | None" = None) -> None:
+        """Push a raw value in the unit of the series, as a pressure.
+
+        Raises:
+            NegativePressureValueError: The negative value produced a pressure less than
+                0Pa.
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        if value < 0:
+            raise NegativePressureValueError(value=value)
+
+        self._push(value / self._unit_delta_per_pascal, time)
+
+    def _create(self, value_as_pascal: float) -> Pressure:
+        """Create a pressure in the unit of the series from its value in pascals."""
+        return Pressure._create(
+            value_as_pascal * self._unit_delta_per_pascal, self._unit, value_as_pascal
+        )
+
+    def latest(self) -> Pressure:
+        """Return the most recently pushed pressure.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(-1))
+
+    def oldest(self) -> Pressure:
+        """Return the least recently pushed pressure still in the series.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(0))
+
+    def window(self, count: "int | None" = None) -> PressureArray:
+        """Return the latest pressures, from oldest to latest.
+
+        All of the pressures are returned if the count is None, and at most as many
+        pressures as the series holds otherwise. The window is a view of the series
+        rather than a copy, so it is only valid until the next push or clear.
+        """
+        return PressureArray._from_values_as_pascal(
+            self._view_values(count), self._unit
+        )
+
+    def __getitem__(self, index: int) -> Pressure:
+        """Return the pressure at the index.
+
+        Raises:
+            IndexError: There is no pressure at the index.
+        """
+        return self._create(self._get_value(index))
+
+    def __iter__(self) -> "Iterator[Pressure]":
+        """Return an iterator over the pressures, from oldest to latest.
+
+        Each pressure is only created when it is reached.
+        """
+        for value_as_pascal in self._iter_values():
+            yield self._create(value_as_pascal)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the pressure series."""
+        values = [value * self._unit_delta_per_pascal for value in self._iter_values()]
+        return (
+            f"PressureSeries({values}, {get_name(self._unit)},"
+            f" capacity={self._capacity})"
+        )
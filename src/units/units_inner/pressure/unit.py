@@ -1,4 +1,8 @@
-"""Module for the pressure units."""
+"""Module for the pressure units.
+
+Generated by `tools/generate_units.py` from `tools/units_spec.json`, so edit the
+spec & rerun the generator rather than editing this module.
+"""
 
 from typing import TYPE_CHECKING, Final
 
@@ -8,11 +12,12 @@ else:
     IntEnum = object
 
 STANDARD_ATMOSPHERIC_PRESSURE_AS_PASCAL: Final = 101_325
+_NAN: Final = float("nan")
 
 
-# NB: When adding a new unit, be sure to also update:
-# - The info list in helpers.py
-# - The `test_get_X_value_as_unit` test in `test_X.py` and `test_X_delta.py`
+# NB: When adding a new unit, add it to `tools/units_spec.json` & rerun
+# `tools/generate_units.py`, which also regenerates the tests of the unit
+# tables
 class Unit(IntEnum):
     """A pressure unit.
 
@@ -31,97 +36,149 @@ class Unit(IntEnum):
     MILLIBAR = 7
 
 
-class _UnitInfo:
-    """Information associated with a pressure particular unit.
+# The name & abbreviation of each unit, indexed by the unit. Element 0 does not
+# correspond to a unit.
+_NAMES: Final = (
+    "",
+    "pascal",
+    "pound-per-square-inch",
+    "bar",
+    "atmosphere",
+    "millimetre-of-mercury",
+    "kilopascal",
+    "millibar",
+)
+_ABBREVIATIONS: Final = (
+    "",
+    "Pa",
+    "PSI",
+    "bar",
+    "atm",
+    "mmHg",
+    "kPa",
+    "mbar",
+)
+
+# The change in pressure expressed as each unit per 1Pa, indexed by the unit. Element 0
+# does not correspond to a unit, and so holds NaN.
+UNIT_DELTAS_PER_PASCAL: Final = (
+    _NAN,
+    1,
+    0.00014503773773,
+    1e-05,
+    9.869232667160129e-06,
+    0.007500615758456563,
+    0.001,
+    0.01,
+)
+
+# Dense from-unit x to-unit table of conversion factors. Units are small contiguous
+# ints, so the factor that converts a value from one unit to another is at index
+# `from_unit * CONVERSION_FACTORS_STRIDE + to_unit`. Row & column 0 do not correspond to
+# a unit, and so hold NaN. A tuple is used rather than an array, as reading an element
+# of a tuple returns the stored float instead of allocating a new one.
+CONVERSION_FACTORS_STRIDE: Final = 8
+CONVERSION_FACTORS: Final = (
+    # Row 0 does not correspond to a unit
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    # From pascal to each unit
+    _NAN,
+    1.0,
+    0.00014503773773,
+    1e-05,
+    9.869232667160129e-06,
+    0.007500615758456563,
+    0.001,
+    0.01,
+    # From pound-per-square-inch to each unit
+    _NAN,
+    6894.757293178308,
+    1.0,
+    0.06894757293178308,
+    0.0680459639099759,
+    51.71492520394653,
+    6.894757293178308,
+    68.94757293178307,
+    # From bar to each unit
+    _NAN,
+    99999.99999999999,
+    14.503773772999997,
+    1.0,
+    0.9869232667160128,
+    750.0615758456562,
+    100.0,
+    999.9999999999999,
+    # From atmosphere to each unit
+    _NAN,
+    101325.0,
+    14.695948775492248,
+    1.01325,
+    1.0,
+    759.9998917256112,
+    101.325,
+    1013.25,
+    # From millimetre-of-mercury to each unit
+    _NAN,
+    133.322387415,
+    0.019336777459434223,
+    0.0013332238741500001,
+    0.0013157896611398965,
+    1.0,
+    0.13332238741500002,
+    1.3332238741500002,
+    # From kilopascal to each unit
+    _NAN,
+    1000.0,
+    0.14503773772999998,
+    0.01,
+    0.009869232667160128,
+    7.500615758456562,
+    1.0,
+    10.0,
+    # From millibar to each unit
+    _NAN,
+    100.0,
+    0.014503773772999998,
+    0.001,
+    0.0009869232667160128,
+    0.7500615758456562,
+    0.1,
+    1.0,
+)
+
+# Fixed-point quantities hold an integer count of pascals. The number of pascals per 1
+# of each unit is stored as an integer ratio, indexed by the unit, so that converting to
+# & from the units stays in ints. Element 0 does not correspond to a unit.
+FIXED_POINT_RESOLUTION_PER_PASCAL: Final = 1
+_FIXED_POINT_RATIOS: Final = (
+    (0, 1),
+    (1, 1),
+    (6894757, 1000),
+    (100000, 1),
+    (101325, 1),
+    (1333224, 10000),
+    (1000, 1),
+    (100, 1),
+)
+
+
+def _check_unit(unit: Unit) -> None:
+    """Check that the unit is a pressure unit.
 
     Not intended for public use.
-    """
 
-    def __init__(
-        self,
-        unit: Unit,
-        name: str,
-        abbreviation: str,
-        unit_delta_per_pascal: float,
-    ) -> None:
-        """Initialise a collection of info associated with a unit."""
-        self._unit = unit
-        self._name = name
-        self._abbreviation = abbreviation
-        self._unit_delta_per_pascal = unit_delta_per_pascal
-
-    @property
-    def unit(self) -> Unit:
-        """The unit the information relates to."""
-        return self._unit
-
-    @property
-    def name(self) -> str:
-        """The name of the unit."""
-        return self._name
-
-    @property
-    def abbreviation(self) -> str:
-        """The abbreviation of the unit."""
-        return self._abbreviation
-
-    @property
-    def unit_delta_per_pascal(self) -> float:
-        """The change in pressure expressed as the unit per 1Pa.
-
-        Equivalent to the gradient of the pascal-vs-unit graph.
-        """
-        return self._unit_delta_per_pascal
-
-
-# All info is entered here to create a SSoT
-_UNITS_INFO: Final = [
-    _UnitInfo(
-        unit=Unit.PASCAL,
-        name="pascal",
-        abbreviation="Pa",
-        unit_delta_per_pascal=1,
-    ),
-    _UnitInfo(
-        unit=Unit.POUND_PER_SQUARE_INCH,
-        name="pound-per-square-inch",
-        abbreviation="PSI",
-        unit_delta_per_pascal=0.00014503773773,
-    ),
-    _UnitInfo(
-        unit=Unit.BAR,
-        name="bar",
-        abbreviation="bar",
-        unit_delta_per_pascal=1 / 100_000,
-    ),
-    _UnitInfo(
-        unit=Unit.ATMOSPHERE,
-        name="atmosphere",
-        abbreviation="atm",
-        unit_delta_per_pascal=1 / STANDARD_ATMOSPHERIC_PRESSURE_AS_PASCAL,
-    ),
-    _UnitInfo(
-        unit=Unit.MILLIMETRE_OF_MERCURY,
-        name="millimetre-of-mercury",
-        abbreviation="mmHg",
-        unit_delta_per_pascal=1 / 133.322387415,
-    ),
-    _UnitInfo(
-        unit=Unit.KILOPASCAL,
-        name="kilopascal",
-        abbreviation="kPa",
-        unit_delta_per_pascal=1 / 1_000,
-    ),
-    _UnitInfo(
-        unit=Unit.MILLIBAR,
-        name="millibar",
-        abbreviation="mbar",
-        unit_delta_per_pascal=1 / 100,
-    ),
-]
-
-# Convert into dictionary for quick lookup
-_UNIT_TO_INFO_MAP: Final = {info.unit: info for info in _UNITS_INFO}
+    Raises:
+        ValueError: The unit is not a pressure unit.
+    """
+    if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+        raise ValueError
 
 
 def get_name(unit: Unit) -> str:
@@ -129,10 +186,8 @@ def get_name(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].name
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _NAMES[unit]
 
 
 def get_abbreviation(unit: Unit) -> str:
@@ -140,20 +195,23 @@ def get_abbreviation(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].abbreviation
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _ABBREVIATIONS[unit]
 
 
-def get_unit_delta_per_pascal(
-    unit: Unit,
-) -> float:
+def get_unit_delta_per_pascal(unit: Unit) -> float:
     """Get the change in pressure expressed as the unit per 1Pa.
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].unit_delta_per_pascal
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return UNIT_DELTAS_PER_PASCAL[unit]
+
+
+def get_fixed_point_ratio(unit: Unit) -> tuple[int, int]:
+    """Get the number of pascals per 1 of the pressure unit, as an integer ratio.
+
+    Not intended for public use.
+    """
+    _check_unit(unit)
+    return _FIXED_POINT_RATIOS[unit]
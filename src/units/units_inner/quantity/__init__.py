@@ -0,0 +1,37 @@
+"""Package for the generic quantity class and dimensions."""
+
+from .dimension import (
+    ANGLE,
+    CURRENT,
+    DIMENSIONLESS,
+    LENGTH,
+    MASS,
+    MAX_EXPONENT,
+    TEMPERATURE,
+    TIME,
+    get_exponents,
+    get_power_dimension,
+    get_product_dimension,
+    get_symbol,
+    make_dimension,
+)
+from .exceptions import DimensionMismatchError
+from .quantity import Quantity
+
+__all__ = [
+    "ANGLE",
+    "CURRENT",
+    "DIMENSIONLESS",
+    "LENGTH",
+    "MASS",
+    "MAX_EXPONENT",
+    "TEMPERATURE",
+    "TIME",
+    "DimensionMismatchError",
+    "Quantity",
+    "get_exponents",
+    "get_power_dimension",
+    "get_product_dimension",
+    "get_symbol",
+    "make_dimension",
+]
@@ -0,0 +1,127 @@
+"""Module for the dimensions of physical quantities.
+
+A dimension is the exponents of the base dimensions (length, mass, time, angle,
+current & temperature) that a quantity is made of. For example, a velocity is
+length^1 * time^-1. The exponents are packed into the digits of a single small int,
+so that the dimension of a product is the sum of the dimensions of its factors, and
+the dimension of a quotient is their difference, as long as every exponent stays
+within range. `get_product_dimension` & `get_power_dimension` check that it does.
+"""
+
+from typing import Final
+
+_EXPONENT_BASE: Final = 32
+MAX_EXPONENT: Final = 15
+
+DIMENSIONLESS: Final = 0
+LENGTH: Final = 1
+MASS: Final = _EXPONENT_BASE
+TIME: Final = _EXPONENT_BASE**2
+ANGLE: Final = _EXPONENT_BASE**3
+CURRENT: Final = _EXPONENT_BASE**4
+TEMPERATURE: Final = _EXPONENT_BASE**5
+
+_BASE_DIMENSION_COUNT: Final = 6
+_SYMBOLS: Final = ("m", "kg", "s", "rad", "A", "K")
+
+
+def make_dimension(  # noqa: PLR0913, PLR0917 # pylint: disable=too-many-arguments, too-many-positional-arguments
+    length: int = 0,
+    mass: int = 0,
+    time: int = 0,
+    angle: int = 0,
+    current: int = 0,
+    temperature: int = 0,
+) -> int:
+    """Return the dimension with the exponents of each of the base dimensions.
+
+    Raises:
+        ValueError: An exponent is greater than the maximum exponent, or less than
+            its negative.
+    """
+    dimension = 0
+    for exponent in (temperature, current, angle, time, mass, length):
+        if not -MAX_EXPONENT <= exponent <= MAX_EXPONENT:
+            msg = f"Exponent [{exponent}] outside of [-{MAX_EXPONENT}, {MAX_EXPONENT}]."
+            raise ValueError(msg)
+        dimension = dimension * _EXPONENT_BASE + exponent
+
+    return dimension
+
+
+def get_exponents(dimension: int) -> tuple[int, ...]:
+    """Return the exponents of the base dimensions, in the order of `make_dimension`."""
+    exponents: list[int] = []
+    for _ in range(_BASE_DIMENSION_COUNT):
+        exponent = dimension % _EXPONENT_BASE
+        # The exponents are signed, so the upper half of the digits are negative
+        if exponent > MAX_EXPONENT:
+            exponent -= _EXPONENT_BASE
+        exponents.append(exponent)
+        dimension = (dimension - exponent) // _EXPONENT_BASE
+
+    return tuple(exponents)
+
+
+def get_product_dimension(dimension: int, other_dimension: int) -> int:
+    """Return the dimension of the product of quantities of the two dimensions.
+
+    The product dimension is the sum of the dimensions, which is only valid if the
+    sum of each pair of exponents is within range, so the pairs are checked one
+    digit at a time until either dimension has no exponents left. The dimension of a
+    quotient is the product dimension of the negative of the divisor's dimension.
+
+    Raises:
+        ValueError: An exponent of the product is greater than the maximum
+            exponent, or less than its negative.
+    """
+    remaining_dimension = dimension
+    remaining_other_dimension = other_dimension
+    while remaining_dimension and remaining_other_dimension:
+        exponent = remaining_dimension % _EXPONENT_BASE
+        if exponent > MAX_EXPONENT:
+            exponent -= _EXPONENT_BASE
+        other_exponent = remaining_other_dimension % _EXPONENT_BASE
+        if other_exponent > MAX_EXPONENT:
+            other_exponent -= _EXPONENT_BASE
+        if not -MAX_EXPONENT <= exponent + other_exponent <= MAX_EXPONENT:
+            msg = (
+                f"Exponent [{exponent + other_exponent}] outside of"
+                f" [-{MAX_EXPONENT}, {MAX_EXPONENT}]."
+            )
+            raise ValueError(msg)
+        remaining_dimension = (remaining_dimension - exponent) // _EXPONENT_BASE
+        remaining_other_dimension = (
+            remaining_other_dimension - other_exponent
+        ) // _EXPONENT_BASE
+
+    return dimension + other_dimension
+
+
+def get_power_dimension(dimension: int, exponent: int) -> int:
+    """Return the dimension of a quantity of the dimension raised to the exponent.
+
+    Raises:
+        ValueError: An exponent of the power is greater than the maximum exponent, or
+            less than its negative.
+    """
+    if not dimension:
+        return dimension
+
+    return make_dimension(
+        *(base_exponent * exponent for base_exponent in get_exponents(dimension))
+    )
+
+
+def get_symbol(dimension: int) -> str:
+    """Return the symbol of the SI unit of the dimension, such as "m s^-1"."""
+    terms: list[str] = []
+    exponents = get_exponents(dimension)
+    for index, symbol in enumerate(_SYMBOLS):
+        exponent = exponents[index]
+        if exponent == 1:
+            terms.append(symbol)
+        elif exponent:
+            terms.append(f"{symbol}^{exponent}")
+
+    return " ".join(terms)
@@ -0,0 +1,37 @@
+"""Module for generic quantity exceptions."""
+
+from typing import Any
+
+
+class DimensionMismatchError(ValueError):
+    """Raised when quantities of different dimensions are combined.
+
+    Quantities can only be added, subtracted or compared when they have the same
+    dimension, as a length plus a time (for example) has no meaning.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        other_dimension: int,
+        *args: tuple[Any, ...],
+        **kwargs: dict[str, Any],
+    ) -> None:
+        """Initialise a new dimension-mismatch exception."""
+        self._dimension = dimension
+        self._other_dimension = other_dimension
+        super().__init__(
+            f"Dimensions [{dimension}, {other_dimension}] do not match.",
+            *args,
+            **kwargs,
+        )
+
+    @property
+    def dimension(self) -> int:
+        """The dimension of the first quantity."""
+        return self._dimension
+
+    @property
+    def other_dimension(self) -> int:
+        """The dimension of the second quantity."""
+        return self._other_dimension
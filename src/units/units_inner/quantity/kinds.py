@@ -0,0 +1,100 @@
+"""Module for the kinds of typed quantity classes that a generic quantity maps onto.
+
+Each kind is a typed class (such as `Velocity`), its dimension, and the SI units to
+pass to its initialiser. The attribute that holds the value of a typed class in the SI
+unit is found from its slots, rather than listed, to keep the table small.
+The SI units are given as their values, so that the typed packages are only imported
+by the program that uses them.
+"""
+
+import sys
+from typing import Final
+
+from .dimension import ANGLE, CURRENT, LENGTH, MASS, TEMPERATURE, TIME
+
+_VELOCITY: Final = LENGTH - TIME
+_ACCELERATION: Final = LENGTH - 2 * TIME
+_JERK: Final = LENGTH - 3 * TIME
+_ANGULAR_VELOCITY: Final = ANGLE - TIME
+_ANGULAR_ACCELERATION: Final = ANGLE - 2 * TIME
+_ANGULAR_JERK: Final = ANGLE - 3 * TIME
+_AREA: Final = 2 * LENGTH
+_VOLUME: Final = 3 * LENGTH
+_PRESSURE: Final = MASS - LENGTH - 2 * TIME
+_VOLTAGE: Final = 2 * LENGTH + MASS - 3 * TIME - CURRENT
+
+# The SI unit is the first of every unit enum, apart from kelvin
+_SI_UNIT: Final = 1
+_KELVIN: Final = 2
+
+# Subpackage, class name, dimension & SI units of each kind.
+# Angles & temperatures are excluded, as their values are not proportional to the
+# values of their SI units (an angle wraps & a temperature has an offset).
+_KINDS: Final = (
+    ("angle", "AngleDelta", ANGLE, (_SI_UNIT,)),
+    ("angular_motion", "Displacement", ANGLE, (_SI_UNIT,)),
+    ("angular_motion", "Velocity", _ANGULAR_VELOCITY, (_SI_UNIT, _SI_UNIT)),
+    ("angular_motion", "Acceleration", _ANGULAR_ACCELERATION, (_SI_UNIT, _SI_UNIT)),
+    ("angular_motion", "Jerk", _ANGULAR_JERK, (_SI_UNIT, _SI_UNIT)),
+    ("area", "Area", _AREA, (_SI_UNIT,)),
+    ("area", "AreaDelta", _AREA, (_SI_UNIT,)),
+    ("current", "Current", CURRENT, (_SI_UNIT,)),
+    ("flow_rate", "MassFlowRate", MASS - TIME, (_SI_UNIT, _SI_UNIT)),
+    ("flow_rate", "VolumetricFlowRate", _VOLUME - TIME, (_SI_UNIT, _SI_UNIT)),
+    ("length", "Length", LENGTH, (_SI_UNIT,)),
+    ("length", "LengthDelta", LENGTH, (_SI_UNIT,)),
+    ("linear_motion", "Displacement", LENGTH, (_SI_UNIT,)),
+    ("linear_motion", "Velocity", _VELOCITY, (_SI_UNIT, _SI_UNIT)),
+    ("linear_motion", "Acceleration", _ACCELERATION, (_SI_UNIT, _SI_UNIT)),
+    ("linear_motion", "Jerk", _JERK, (_SI_UNIT, _SI_UNIT)),
+    ("mass", "Mass", MASS, (_SI_UNIT,)),
+    ("mass", "MassDelta", MASS, (_SI_UNIT,)),
+    ("pressure", "Pressure", _PRESSURE, (_SI_UNIT,)),
+    ("pressure", "PressureDelta", _PRESSURE, (_SI_UNIT,)),
+    ("temperature", "TemperatureDelta", TEMPERATURE, (_KELVIN,)),
+    ("time", "Time", TIME, (_SI_UNIT,)),
+    ("time", "TimeDelta", TIME, (_SI_UNIT,)),
+    ("voltage", "Voltage", _VOLTAGE, (_SI_UNIT,)),
+    ("volume", "Volume", _VOLUME, (_SI_UNIT,)),
+    ("volume", "VolumeDelta", _VOLUME, (_SI_UNIT,)),
+)
+
+# The name of the internal package, that the subpackages of the kinds are within.
+# Found by name rather than by depth, as the flattened build of the library turns
+# each subpackage into a single module.
+_PACKAGE_NAME: Final = __name__.partition(".units_inner.")[0] + ".units_inner"
+
+_KINDS_BY_CLASS: "dict[type, tuple[str, int, tuple[int, ...]]]" = {}
+
+
+def get_kind(cls: type) -> "tuple[str, int, tuple[int, ...]]":
+    """Return the SI value attribute, dimension & SI units of a typed class.
+
+    Only the subpackages that have already been imported are searched, as an
+    instance of a typed class can only exist once its subpackage has been imported.
+
+    Not intended for public use.
+
+    Raises:
+        TypeError: The class is not a typed quantity class with a dimension.
+    """
+    kind = _KINDS_BY_CLASS.get(cls)
+    if kind is not None:
+        return kind
+
+    for subpackage_name, class_name, dimension, si_units in _KINDS:
+        subpackage = sys.modules.get(f"{_PACKAGE_NAME}.{subpackage_name}")
+        if subpackage is None:
+            continue
+
+        kind_cls = getattr(subpackage, class_name)
+        if cls is kind_cls or issubclass(cls, kind_cls):
+            attribute = next(
+                slot for slot in kind_cls.__slots__ if slot.startswith("_value_as_")
+            )
+            kind = (attribute, dimension, si_units)
+            _KINDS_BY_CLASS[cls] = kind
+            return kind
+
+    msg = f"{cls.__name__} has no dimension."
+    raise TypeError(msg)
@@ -0,0 +1,272 @@
+"""Module for the generic quantity class."""
+
+from typing import TYPE_CHECKING, TypeVar
+
+from .dimension import (
+    DIMENSIONLESS,
+    get_power_dimension,
+    get_product_dimension,
+    get_symbol,
+)
+from .exceptions import DimensionMismatchError
+from .kinds import get_kind
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_T = TypeVar("_T")
+
+
+class Quantity:
+    """A physical quantity of any dimension, held as its value in SI units.
+
+    Unlike the typed quantity classes (such as `Velocity`), the product or quotient of
+    any pair of quantities is a quantity, with the dimension worked out as it goes.
+    A typed quantity can be converted to a quantity, and a quantity back to a typed
+    quantity of the same dimension.
+    """
+
+    __slots__ = ("_dimension", "_value")
+
+    def __init__(self, value: float, dimension: int = DIMENSIONLESS) -> None:
+        """Initialise a new quantity, from its value in the SI unit of the dimension."""
+        self._value = value
+        self._dimension = dimension
+
+    @classmethod
+    def from_typed(cls, typed: object) -> "Quantity":
+        """Create a quantity from a typed quantity, such as a `Velocity`.
+
+        Raises:
+            TypeError: The typed quantity has no dimension, such as an `Angle`.
+        """
+        attribute, dimension, _ = get_kind(type(typed))
+        return cls(getattr(typed, attribute), dimension)
+
+    def as_type(self, cls: "Callable[..., _T]") -> _T:
+        """Return the quantity as an instance of a typed quantity class, in SI units.
+
+        Raises:
+            TypeError: The class is not a typed quantity class with a dimension.
+            DimensionMismatchError: The class has a different dimension.
+        """
+        _, dimension, si_units = get_kind(cls)  # type: ignore[arg-type]
+        if self._dimension != dimension:
+            raise DimensionMismatchError(self._dimension, dimension)
+
+        return cls(self._value, *si_units)
+
+    @property
+    def dimension(self) -> int:
+        """The dimension of the quantity."""
+        return self._dimension
+
+    def as_si_unit(self) -> float:
+        """Return the quantity, expressed as the SI unit of its dimension."""
+        return self._value
+
+    def _as_operand(self, other: object) -> "Quantity | None":
+        """Return the other operand as a quantity, converting it if it is typed.
+
+        Every binary operator takes its other operand through this, so that typed
+        operands are accepted alike by all of them.
+
+        Not intended for public use.
+
+        Returns:
+            The quantity, or None if the operand is neither a quantity nor a typed
+            quantity with a dimension.
+        """
+        if isinstance(other, Quantity):
+            return other
+
+        try:
+            return Quantity.from_typed(other)
+        except TypeError:
+            return None
+
+    def _check_same_dimension(self, other: "Quantity") -> None:
+        """Check that the quantities have the same dimension.
+
+        Not intended for public use.
+
+        Raises:
+            DimensionMismatchError: The quantities have different dimensions.
+        """
+        if self._dimension != other.dimension:
+            raise DimensionMismatchError(self._dimension, other.dimension)
+
+    def __mul__(self, other: "float | Quantity | object") -> "Quantity":
+        """Return the product of the quantity & a value or another quantity.
+
+        Raises:
+            ValueError: An exponent of the dimension of the product is out of range.
+        """
+        if isinstance(other, (int, float)):
+            return Quantity(self._value * other, self._dimension)
+
+        operand = self._as_operand(other)
+        if operand is None:
+            return NotImplemented
+
+        return Quantity(
+            self._value * operand._value,
+            get_product_dimension(self._dimension, operand._dimension),
+        )
+
+    def __rmul__(self, value: object) -> "Quantity":
+        """Return the quantity scaled by the value."""
+        if not isinstance(value, (int, float)):
+            return NotImplemented
+
+        return Quantity(self._value * value, self._dimension)
+
+    def __truediv__(self, other: "float | Quantity | object") -> "Quantity":
+        """Return the quotient of the quantity & a value or another quantity.
+
+        Raises:
+            ValueError: An exponent of the dimension of the quotient is out of range.
+        """
+        if isinstance(other, (int, float)):
+            return Quantity(self._value / other, self._dimension)
+
+        operand = self._as_operand(other)
+        if operand is None:
+            return NotImplemented
+
+        return Quantity(
+            self._value / operand._value,
+            get_product_dimension(self._dimension, -operand._dimension),
+        )
+
+    def __rtruediv__(self, value: object) -> "Quantity":
+        """Return the value divided by the quantity, such as a frequency from a time."""
+        if not isinstance(value, (int, float)):
+            return NotImplemented
+
+        return Quantity(value / self._value, -self._dimension)
+
+    def __pow__(self, exponent: int) -> "Quantity":
+        """Return the quantity raised to a whole-number power.
+
+        Raises:
+            ValueError: An exponent of the dimension of the power is out of range.
+        """
+        return Quantity(
+            self._value**exponent, get_power_dimension(self._dimension, exponent)
+        )
+
+    def __add__(self, other: "Quantity | object") -> "Quantity":
+        """Return the sum of the quantities.
+
+        Raises:
+            DimensionMismatchError: The quantities have different dimensions.
+        """
+        operand = self._as_operand(other)
+        if operand is None:
+            return NotImplemented
+
+        self._check_same_dimension(operand)
+        return Quantity(self._value + operand._value, self._dimension)
+
+    def __sub__(self, other: "Quantity | object") -> "Quantity":
+        """Return the difference between the quantities.
+
+        Raises:
+            DimensionMismatchError: The quantities have different dimensions.
+        """
+        operand = self._as_operand(other)
+        if operand is None:
+            return NotImplemented
+
+        self._check_same_dimension(operand)
+        return Quantity(self._value - operand._value, self._dimension)
+
+    def __neg__(self) -> "Quantity":
+        """Return the inverse of the quantity."""
+        return Quantity(-self._value, self._dimension)
+
+    def __abs__(self) -> "Quantity":
+        """Return the absolute version of the quantity."""
+        return Quantity(abs(self._value), self._dimension)
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the objects are equal quantities of the same dimension.
+
+        The other object may be a typed quantity, which is equal if it has the same
+        dimension & value in the SI unit.
+        """
+        operand = self._as_operand(other)
+        if operand is None:
+            return NotImplemented
+
+        return self._dimension == operand._dimension and self._value == operand._value
+
+    def __lt__(self, other: "Quantity | object") -> bool:
+        """Return whether the quantity is less than the other.
+
+        Raises:
+            DimensionMismatchError: The quantities have different dimensions.
+        """
+        operand = self._as_operand(other)
+        if operand is None:
+            return NotImplemented
+
+        self._check_same_dimension(operand)
+        return self._value < operand._value
+
+    def __le__(self, other: "Quantity | object") -> bool:
+        """Return whether the quantity is less than or equal to the other.
+
+        Raises:
+            DimensionMismatchError: The quantities have different dimensions.
+        """
+        operand = self._as_operand(other)
+        if operand is None:
+            return NotImplemented
+
+        self._check_same_dimension(operand)
+        return self._value <= operand._value
+
+    def __gt__(self, other: "Quantity | object") -> bool:
+        """Return whether the quantity is greater than the other.
+
+        Raises:
+            DimensionMismatchError: The quantities have different dimensions.
+        """
+        operand = self._as_operand(other)
+        if operand is None:
+            return NotImplemented
+
+        self._check_same_dimension(operand)
+        return self._value > operand._value
+
+    def __ge__(self, other: "Quantity | object") -> bool:
+        """Return whether the quantity is greater than or equal to the other.
+
+        Raises:
+            DimensionMismatchError: The quantities have different dimensions.
+        """
+        operand = self._as_operand(other)
+        if operand is None:
+            return NotImplemented
+
+        self._check_same_dimension(operand)
+        return self._value >= operand._value
+
+    def __hash__(self) -> int:
+        """Return the hash of the quantity.
+
+        Only the value is hashed, as a typed quantity hashes its value in the SI unit
+        & can be equal to a quantity.
+        """
+        return hash(self._value)
+
+    def __str__(self) -> str:
+        """Return a string representation of the quantity."""
+        symbol = get_symbol(self._dimension)
+        return f"{self._value} {symbol}" if symbol else f"{self._value}"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the quantity for devs."""
+        return f"{__class__.__name__}({self._value}, {self._dimension})"
@@ -0,0 +1,155 @@
+"""Module for the bulk operations shared by the quantity array classes.
+
+The quantity arrays store their values in the SI unit, in an `array('d')` (or a
+memoryview onto one, when the array is a slice of another). The functions here
+operate on those buffers directly, so that no quantity objects are created.
+"""
+
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def create_values(
+    values: "Iterable[float]", gradient: float, offset: float = 0
+) -> "array[float]":
+    """Create an array of the values, each transformed by `gradient * x + offset`.
+
+    Not intended for public use.
+    """
+    return array("d", (value * gradient + offset for value in values))
+
+
+def _check_same_length(
+    values: "array[float] | memoryview", other: "array[float] | memoryview"
+) -> None:
+    """Check that a pair of value buffers are the same length.
+
+    Not intended for public use.
+    """
+    if len(values) != len(other):
+        msg = f"Arrays of different lengths [{len(values)}, {len(other)}]."
+        raise ValueError(msg)
+
+
+def add_values(
+    values: "array[float] | memoryview", other: "float | array[float] | memoryview"
+) -> "array[float]":
+    """Add a value, or a buffer of values elementwise, to the values.
+
+    Not intended for public use.
+    """
+    if isinstance(other, (int, float)):
+        return array("d", (value + other for value in values))
+
+    _check_same_length(values, other)
+    return array("d", (value + other[index] for index, value in enumerate(values)))
+
+
+def subtract_values(
+    values: "array[float] | memoryview", other: "float | array[float] | memoryview"
+) -> "array[float]":
+    """Subtract a value, or a buffer of values elementwise, from the values.
+
+    Not intended for public use.
+    """
+    if isinstance(other, (int, float)):
+        return array("d", (value - other for value in values))
+
+    _check_same_length(values, other)
+    return array("d", (value - other[index] for index, value in enumerate(values)))
+
+
+def less_than(
+    values: "array[float] | memoryview", other: "float | array[float] | memoryview"
+) -> bytearray:
+    """Return a mask of the values less than a value, or a buffer of values.
+
+    Not intended for public use.
+    """
+    mask = bytearray(len(values))
+    if isinstance(other, (int, float)):
+        for index, value in enumerate(values):
+            if value < other:
+                mask[index] = 1
+        return mask
+
+    _check_same_length(values, other)
+    for index, value in enumerate(values):
+        if value < other[index]:
+            mask[index] = 1
+    return mask
+
+
+def less_than_or_equal_to(
+    values: "array[float] | memoryview", other: "float | array[float] | memoryview"
+) -> bytearray:
+    """Return a mask of the values less than or equal to a value or buffer of values.
+
+    Not intended for public use.
+    """
+    mask = bytearray(len(values))
+    if isinstance(other, (int, float)):
+        for index, value in enumerate(values):
+            if value <= other:
+                mask[index] = 1
+        return mask
+
+    _check_same_length(values, other)
+    for index, value in enumerate(values):
+        if value <= other[index]:
+            mask[index] = 1
+    return mask
+
+
+def greater_than(
+    values: "array[float] | memoryview", other: "float | array[float] | memoryview"
+) -> bytearray:
+    """Return a mask of the values greater than a value, or a buffer of values.
+
+    Not intended for public use.
+    """
+    mask = bytearray(len(values))
+    if isinstance(other, (int, float)):
+        for index, value in enumerate(values):
+            if value > other:
+                mask[index] = 1
+        return mask
+
+    _check_same_length(values, other)
+    for index, value in enumerate(values):
+        if value > other[index]:
+            mask[index] = 1
+    return mask
+
+
+def greater_than_or_equal_to(
+    values: "array[float] | memoryview", other: "float | array[float] | memoryview"
+) -> bytearray:
+    """Return a mask of the values greater than or equal to a value or buffer of values.
+
+    Not intended for public use.
+    """
+    mask = bytearray(len(values))
+    if isinstance(other, (int, float)):
+        for index, value in enumerate(values):
+            if value >= other:
+                mask[index] = 1
+        return mask
+
+    _check_same_length(values, other)
+    for index, value in enumerate(values):
+        if value >= other[index]:
+            mask[index] = 1
+    return mask
+
+
+def get_indices(mask: "bytearray | bytes") -> list[int]:
+    """Return the indices of the set elements of a mask.
+
+    Masks are returned by comparisons between quantity arrays, such as
+    `lengths > threshold`.
+    """
+    return [index for index, is_set in enumerate(mask) if is_set]
@@ -0,0 +1,242 @@
+"""Module for the estimators of the rate of change of a stream of samples.
+
+Each estimator is updated with one timestamped sample at a time & returns the rate
+of change of the samples, by finite differences or the slope of a least-squares
+fit. The estimators work on plain floats, in seconds & any unit of the samples, so
+can be used directly on raw values, or wrapped by a rate estimator of a quantity
+(such as `linear_motion.VelocityEstimator`), which passes them the values of each
+time & quantity in SI units & wraps each rate back up as the derived quantity.
+
+Each estimator also estimates the rates of whole buffers of samples in one pass,
+without disturbing the stream it is estimating.
+"""
+
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+def _check_time_advanced(time: float, previous_time: float) -> None:
+    """Raise an error if the time is not after the previous time."""
+    if time <= previous_time:
+        msg = f"Time did not advance [{previous_time}, {time}]."
+        raise ValueError(msg)
+
+
+def _estimate(
+    update: "Callable[[float, float], float | None]",
+    warm_up: int,
+    times: "Sequence[float]",
+    values: "Sequence[float]",
+) -> "array[float]":
+    """Return the rates returned by the update for each sample, skipping the first.
+
+    Not intended for public use.
+    """
+    if len(times) != len(values):
+        msg = f"Arrays of different lengths [{len(times)}, {len(values)}]."
+        raise ValueError(msg)
+
+    rates = array("d", [0] * max(0, len(times) - warm_up))
+    for index in range(min(warm_up, len(times))):
+        update(times[index], values[index])
+    for index in range(warm_up, len(times)):
+        rates[index - warm_up] = update(times[index], values[index])  # type: ignore[assignment]
+    return rates
+
+
+class FirstDifference:
+    """Estimates the rate as the change since the previous sample.
+
+    The rate is that of the interval ending at the latest sample, so responds
+    straight away, but is the most sensitive to noise.
+    """
+
+    __slots__ = ("_previous_time", "_previous_value")
+
+    def __init__(self) -> None:
+        """Initialise a new first-difference estimator."""
+        self._previous_time: float | None = None
+        self._previous_value = 0.0
+
+    def update(self, time: float, value: float) -> "float | None":
+        """Add the sample & return the rate, or None if it is the first sample.
+
+        Raises:
+            ValueError: The time is not after the time of the previous sample.
+        """
+        previous_time = self._previous_time
+        rate = None
+        if previous_time is not None:
+            _check_time_advanced(time, previous_time)
+            rate = (value - self._previous_value) / (time - previous_time)
+        self._previous_time = time
+        self._previous_value = value
+        return rate
+
+    def estimate(
+        self, times: "Sequence[float]", values: "Sequence[float]"
+    ) -> "array[float]":
+        """Return the rates of every sample after the first, by a fresh estimator.
+
+        Raises:
+            ValueError: The buffers are of different lengths, or the times do not
+                increase.
+        """
+        return _estimate(FirstDifference().update, 1, times, values)
+
+    def reset(self) -> None:
+        """Forget every sample."""
+        self._previous_time = None
+
+
+class CentralDifference:
+    """Estimates the rate as the change across the previous sample.
+
+    The rate is that of the interval between the samples either side of the
+    previous sample, so is the rate at the previous sample, one sample behind the
+    latest. It is more accurate than the first difference for smooth signals.
+    """
+
+    __slots__ = ("_length", "_times", "_values")
+
+    def __init__(self) -> None:
+        """Initialise a new central-difference estimator."""
+        self._times = array("d", [0, 0])
+        self._values = array("d", [0, 0])
+        self._length = 0
+
+    def update(self, time: float, value: float) -> "float | None":
+        """Add the sample & return the rate, or None if it is the first two samples.
+
+        Raises:
+            ValueError: The time is not after the time of the previous sample.
+        """
+        times = self._times
+        values = self._values
+        length = self._length
+        if length:
+            _check_time_advanced(time, times[1])
+
+        rate = None
+        if length == 2:  # noqa: PLR2004
+            rate = (value - values[0]) / (time - times[0])
+        else:
+            self._length = length + 1
+        times[0] = times[1]
+        values[0] = values[1]
+        times[1] = time
+        values[1] = value
+        return rate
+
+    def estimate(
+        self, times: "Sequence[float]", values: "Sequence[float]"
+    ) -> "array[float]":
+        """Return the rates of all but the first & last samples, by a fresh estimator.
+
+        Raises:
+            ValueError: The buffers are of different lengths, or the times do not
+                increase.
+        """
+        return _estimate(CentralDifference().update, 2, times, values)
+
+    def reset(self) -> None:
+        """Forget every sample."""
+        self._length = 0
+
+
+class LeastSquaresSlope:
+    """Estimates the rate as the slope of the line of best fit to recent samples.
+
+    The slope of a least-squares fit over a window of samples averages out the
+    noise of each one, at the cost of lagging behind a changing rate. Each update
+    costs O(N) in the window size, as the fit is taken about the mean time of the
+    window, which keeps it accurate however large the times grow. Until the
+    window fills, the fit is of the samples so far.
+    """
+
+    __slots__ = ("_index", "_length", "_times", "_values", "_window")
+
+    def __init__(self, window: int) -> None:
+        """Initialise a new least-squares estimator, over the number of samples.
+
+        Raises:
+            ValueError: The window size is less than 2.
+        """
+        if window < 2:  # noqa: PLR2004
+            msg = f"Window size less than 2 [{window}]."
+            raise ValueError(msg)
+
+        self._window = window
+        self._times = array("d", [0] * window)
+        self._values = array("d", [0] * window)
+        self._index = 0
+        self._length = 0
+
+    @property
+    def window(self) -> int:
+        """The number of samples fitted."""
+        return self._window
+
+    def update(self, time: float, value: float) -> "float | None":
+        """Add the sample & return the rate, or None if it is the first sample.
+
+        Raises:
+            ValueError: The time is not after the time of the previous sample.
+        """
+        times = self._times
+        values = self._values
+        index = self._index
+        length = self._length
+        if length:
+            _check_time_advanced(time, times[index - 1])
+
+        times[index] = time
+        values[index] = value
+        index += 1
+        self._index = 0 if index == self._window else index
+        if length < self._window:
+            length += 1
+            self._length = length
+        if length == 1:
+            return None
+
+        # Fit to the times since the latest, which are small even if the times are
+        # large, so that they lose no precision
+        mean_offset = 0.0
+        mean_value = 0.0
+        for index in range(length):
+            mean_offset += times[index] - time
+            mean_value += values[index]
+        mean_offset /= length
+        mean_value /= length
+
+        covariance = 0.0
+        variance = 0.0
+        for index in range(length):
+            time_offset = times[index] - time - mean_offset
+            covariance += time_offset * (values[index] - mean_value)
+            variance += time_offset * time_offset
+        return covariance / variance
+
+    def estimate(
+        self, times: "Sequence[float]", values: "Sequence[float]"
+    ) -> "array[float]":
+        """Return the rates of every sample after the first, by a fresh estimator.
+
+        Raises:
+            ValueError: The buffers are of different lengths, or the times do not
+                increase.
+        """
+        return _estimate(LeastSquaresSlope(self._window).update, 1, times, values)
+
+    def reset(self) -> None:
+        """Forget every sample."""
+        self._index = 0
+        self._length = 0
+
+
+if TYPE_CHECKING:
+    RateEstimator = FirstDifference | CentralDifference | LeastSquaresSlope
@@ -0,0 +1,237 @@
+"""Module for the ring buffer shared by the quantity series classes.
+
+A series keeps the most recent samples of a quantity in a fixed-capacity buffer,
+preallocated on initialisation, so that pushing a sample never allocates. The values
+are held in the SI unit, in an `array('d')`, alongside an optional `array('d')` of
+timestamps in seconds.
+
+The arrays have room for twice the capacity. Samples are written one after another,
+and once the end of the arrays is reached, the latest capacity's worth of samples is
+copied back to the start in one go. The latest samples are then always contiguous, so
+a window of them is a view of the arrays rather than a copy, and pushing a sample is
+a single store rather than a store into a wrapping index.
+"""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001
+
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .time import Time, TimeArray
+
+_NOT_TIMESTAMPED_MESSAGE = "Samples have no timestamps."
+
+
+class RingBuffer:
+    """A fixed-capacity buffer of values, with optional timestamps.
+
+    The base of the quantity series classes, which push the values of their quantity
+    into it. Samples are indexed from the oldest (0) to the latest (-1). Once the
+    buffer is full, pushing a sample drops the oldest one.
+
+    A series writes its `push` inline, rather than calling `_push`, as pushing is
+    the hot path of a series. It must compact the buffer once the end of the arrays
+    is reached, store the timestamp, store the value, and advance the end, in the
+    same way as `_push`.
+
+    Not intended for public use.
+    """
+
+    __slots__ = (
+        "_capacity",
+        "_end",
+        "_limit",
+        "_times",
+        "_times_halves",
+        "_values",
+        "_values_halves",
+    )
+
+    def __init__(self, capacity: int, *, timestamped: bool) -> None:
+        """Initialise a new, empty buffer, with room for the number of samples.
+
+        Raises:
+            ValueError: The capacity is less than 1.
+        """
+        if capacity < 1:
+            msg = f"Capacity less than 1 [{capacity}]."
+            raise ValueError(msg)
+
+        self._capacity = capacity
+        self._limit = 2 * capacity
+        # The index after the latest sample. Never less than the capacity once the
+        # buffer has been filled, so the number of samples is the lesser of the two,
+        # which is worked out with a comparison rather than the slower `min`.
+        self._end = 0
+        # The halves of each array are viewed up front, so that copying one half onto
+        # the other does not allocate a view
+        self._values = array("d", [0] * self._limit)
+        values = memoryview(self._values)
+        self._values_halves = (values[:capacity], values[capacity:])
+        self._times: array[float] | None = None
+        self._times_halves: tuple[memoryview, memoryview] | None = None
+        if timestamped:
+            self._times = array("d", [0] * self._limit)
+            times = memoryview(self._times)
+            self._times_halves = (times[:capacity], times[capacity:])
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of samples held."""
+        return self._capacity
+
+    def _compact(self) -> int:
+        """Copy the latest samples to the start of the arrays, and return the new end.
+
+        Called once the end of the arrays has been reached. Does not allocate.
+        """
+        head, tail = self._values_halves
+        head[:] = tail
+        times_halves = self._times_halves
+        if times_halves is not None:
+            head, tail = times_halves
+            head[:] = tail
+        self._end = self._capacity
+        return self._capacity
+
+    def _raise_time_error(self) -> None:
+        """Raise the error for a sample with a timestamp the buffer does not expect.
+
+        Called when one of the buffer & the sample has a timestamp & the other does
+        not.
+
+        Raises:
+            ValueError: The buffer is timestamped but no time was given, or the
+                buffer is not timestamped but a time was given.
+        """
+        if self._times is None:
+            raise ValueError(_NOT_TIMESTAMPED_MESSAGE)
+        msg = "Samples need timestamps."
+        raise ValueError(msg)
+
+    def _push(self, value: float, time: "Time | None") -> None:
+        """Push a sample, dropping the oldest one if the buffer is full.
+
+        Does not allocate.
+
+        Raises:
+            ValueError: The buffer is timestamped but no time was given, or the
+                buffer is not timestamped but a time was given.
+        """
+        end = self._end
+        if end == self._limit:
+            end = self._compact()
+        times = self._times
+        if times is not None and time is not None:
+            times[end] = time._value_as_second
+        elif times is not None or time is not None:
+            self._raise_time_error()
+        self._values[end] = value
+        self._end = end + 1
+
+    def _get_index(self, index: int) -> int:
+        """Return the position in the arrays of the sample at the index.
+
+        Raises:
+            IndexError: There is no sample at the index.
+        """
+        end = self._end
+        capacity = self._capacity
+        length = end if end < capacity else capacity  # noqa: FURB136
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            msg = f"Sample index out of range [{index}, {length}]."
+            raise IndexError(msg)
+
+        return end - length + index
+
+    def _get_value(self, index: int) -> float:
+        """Return the value of the sample at the index.
+
+        Raises:
+            IndexError: There is no sample at the index.
+        """
+        return self._values[self._get_index(index)]
+
+    def _get_times(self) -> "array[float]":
+        """Return the array of timestamps.
+
+        Raises:
+            ValueError: The buffer is not timestamped.
+        """
+        times = self._times
+        if times is None:
+            raise ValueError(_NOT_TIMESTAMPED_MESSAGE)
+        return times
+
+    def _view_latest(self, values: "array[float]", count: "int | None") -> memoryview:
+        """Return a view of the latest values of the array, from oldest to latest."""
+        end = self._end
+        capacity = self._capacity
+        length = end if end < capacity else capacity  # noqa: FURB136
+        if count is None or count > length:
+            count = length
+        elif count < 0:
+            count = 0
+        return memoryview(values)[end - count : end]
+
+    def _view_values(self, count: "int | None") -> memoryview:
+        """Return a view of the latest values, from oldest to latest.
+
+        All of the values are viewed if the count is None, and at most as many values
+        as the buffer holds otherwise.
+        """
+        return self._view_latest(self._values, count)
+
+    def _iter_values(self) -> "Iterator[float]":
+        """Return an iterator over the values, from oldest to latest."""
+        values = self._values
+        end = self._end
+        capacity = self._capacity
+        for index in range(end - capacity if end > capacity else 0, end):
+            yield values[index]
+
+    def time_at(self, index: int) -> "Time":
+        """Return the time the sample at the index was measured at.
+
+        Raises:
+            IndexError: There is no sample at the index.
+            ValueError: The series is not timestamped.
+        """
+        # Imported on first use, so that a buffer without timestamps does not import
+        # the time quantities
+        from .time import Time, Unit  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
+        value_as_second = self._get_times()[self._get_index(index)]
+        return Time._create(value_as_second, Unit.SECOND, value_as_second)
+
+    def times(self, count: "int | None" = None) -> "TimeArray":
+        """Return the times of the latest samples, from oldest to latest.
+
+        The times are a view of the series rather than a copy, so they are only valid
+        until the next push or clear.
+
+        Raises:
+            ValueError: The series is not timestamped.
+        """
+        from .time import TimeArray, Unit  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
+        return TimeArray._from_values_as_second(
+            self._view_latest(self._get_times(), count), Unit.SECOND
+        )
+
+    def clear(self) -> None:
+        """Remove every sample."""
+        self._end = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        end = self._end
+        capacity = self._capacity
+        return end if end < capacity else capacity  # noqa: FURB136
@@ -0,0 +1,359 @@
+"""Module for sampling sensors on a schedule, as quantities.
+
+A single task polls every sensor, rather than one task per sensor, so the sensors
+that fall due at the same time are read together & the task sleeps until the next
+sensor falls due. Each sensor is given a due time that advances by its period from
+the previous due time, rather than from when it was last read, so that the
+sampling does not drift.
+
+Works with both `asyncio` on CPython & micropython. Micropython's `asyncio` has no
+queue, so the samples are handed to subscribers through a bounded queue built on
+an event.
+"""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001
+
+import asyncio
+import time
+from array import array
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+if hasattr(time, "ticks_ms"):
+    # Micropython, where the ticks wrap around
+
+    def _ticks_ms() -> int:
+        return time.ticks_ms()  # type: ignore[attr-defined] # pylint: disable=no-member
+
+    def _ticks_add(ticks: int, delta: int) -> int:
+        return time.ticks_add(ticks, delta)  # type: ignore[attr-defined] # pylint: disable=no-member
+
+    def _ticks_diff(end: int, start: int) -> int:
+        return time.ticks_diff(end, start)  # type: ignore[attr-defined] # pylint: disable=no-member
+
+else:
+
+    def _ticks_ms() -> int:
+        return time.monotonic_ns() // 1_000_000
+
+    def _ticks_add(ticks: int, delta: int) -> int:
+        return ticks + delta
+
+    def _ticks_diff(end: int, start: int) -> int:
+        return end - start
+
+
+class QueueEmptyError(Exception):
+    """The sample queue was empty when a sample was taken without waiting."""
+
+
+class QueueFullError(Exception):
+    """The sample queue was full when a sample was added without waiting."""
+
+
+class SampleQueue:
+    """A bounded queue of samples, handed from a sampler to a subscriber.
+
+    The queue holds at most its maximum size of samples, in a list preallocated on
+    initialisation. Once it is full, adding a sample waits until the subscriber
+    takes one, which holds up the sampler, so that a slow subscriber applies
+    backpressure rather than the samples piling up in memory.
+    """
+
+    __slots__ = ("_head", "_items", "_length", "_not_empty", "_not_full")
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialise a new, empty queue, holding up to the number of samples.
+
+        Raises:
+            ValueError: The maximum size is less than 1.
+        """
+        if maxsize < 1:
+            msg = f"Maximum size less than 1 [{maxsize}]."
+            raise ValueError(msg)
+
+        self._items: list[Any] = [None] * maxsize
+        self._head = 0
+        self._length = 0
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of samples the queue holds."""
+        return len(self._items)
+
+    def empty(self) -> bool:
+        """Return whether the queue holds no samples."""
+        return not self._length
+
+    def full(self) -> bool:
+        """Return whether the queue holds its maximum number of samples."""
+        return self._length == len(self._items)
+
+    def put_nowait(self, sample: Any) -> None:  # noqa: ANN401
+        """Add the sample to the end of the queue, without waiting.
+
+        Raises:
+            QueueFullError: The queue is full.
+        """
+        items = self._items
+        if self._length == len(items):
+            raise QueueFullError
+
+        index = self._head + self._length
+        if index >= len(items):
+            index -= len(items)
+        items[index] = sample
+        self._length += 1
+        self._not_empty.set()
+
+    async def put(self, sample: Any) -> None:  # noqa: ANN401
+        """Add the sample to the end of the queue, waiting for room if it is full."""
+        while self._length == len(self._items):
+            self._not_full.clear()
+            await self._not_full.wait()
+        self.put_nowait(sample)
+
+    def get_nowait(self) -> Any:  # noqa: ANN401
+        """Remove & return the sample at the front of the queue, without waiting.
+
+        Raises:
+            QueueEmptyError: The queue is empty.
+        """
+        if not self._length:
+            raise QueueEmptyError
+
+        items = self._items
+        head = self._head
+        sample = items[head]
+        # Drop the reference, so the sample can be freed once the subscriber is done
+        items[head] = None
+        head += 1
+        self._head = 0 if head == len(items) else head
+        self._length -= 1
+        self._not_full.set()
+        return sample
+
+    async def get(self) -> Any:  # noqa: ANN401
+        """Remove & return the sample at the front of the queue, waiting for one."""
+        while not self._length:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def __len__(self) -> int:
+        """Return the number of samples in the queue."""
+        return self._length
+
+
+class Sensor:  # pylint: disable=too-many-instance-attributes
+    """A sensor registered with a sampler.
+
+    Each raw value read from the sensor is converted into a sample by calling the
+    factory with it & the unit of the sensor, so the factory is usually a quantity
+    class (such as `Pressure`). If the sensor has a batch size, the raw values are
+    instead collected into a preallocated `array('d')`, and the factory is called
+    with the whole batch once it is full, so is usually a quantity array class (such
+    as `PressureArray`).
+
+    A read or conversion that raises an exception (such as a reading that makes a
+    negative pressure) produces no sample, and is counted in `error_count`, with the
+    exception kept in `last_error`.
+    """
+
+    __slots__ = (
+        "_batch",
+        "_batch_length",
+        "_due",
+        "_error_count",
+        "_factory",
+        "_last_error",
+        "_period_ms",
+        "_queues",
+        "_read",
+        "_unit",
+    )
+
+    def __init__(
+        self,
+        read: "Callable[[], Awaitable[float]]",
+        factory: "Callable[[Any, Any], Any]",
+        unit: int,
+        period_ms: int,
+        batch_size: "int | None",
+    ) -> None:
+        """Initialise a new sensor, which first falls due straight away.
+
+        Not intended for public use.
+        """
+        self._read = read
+        self._factory = factory
+        self._unit = unit
+        self._period_ms = period_ms
+        self._batch = None if batch_size is None else array("d", [0] * batch_size)
+        self._batch_length = 0
+        self._due = _ticks_ms()
+        self._queues: list[SampleQueue] = []
+        self._error_count = 0
+        self._last_error: BaseException | None = None
+
+    @property
+    def period_ms(self) -> int:
+        """The time between reads of the sensor, in milliseconds."""
+        return self._period_ms
+
+    @property
+    def error_count(self) -> int:
+        """The number of reads of the sensor that failed to produce a sample."""
+        return self._error_count
+
+    @property
+    def last_error(self) -> "BaseException | None":
+        """The exception raised by the most recent failed read, if any."""
+        return self._last_error
+
+    def subscribe(self, maxsize: int = 4) -> SampleQueue:
+        """Return a new queue, which every sample of the sensor is added to.
+
+        Raises:
+            ValueError: The maximum size is less than 1.
+        """
+        queue = SampleQueue(maxsize)
+        self._queues.append(queue)
+        return queue
+
+    def _convert(self, value: float) -> Any:  # noqa: ANN401
+        """Return the sample of the raw value, or None if the batch is not full."""
+        batch = self._batch
+        if batch is None:
+            return self._factory(value, self._unit)
+
+        batch[self._batch_length] = value
+        self._batch_length += 1
+        if self._batch_length < len(batch):
+            return None
+
+        self._batch_length = 0
+        # Copied, so that the next batch does not overwrite the sample
+        return self._factory(array("d", batch), self._unit)
+
+    def _take(self, value: "float | BaseException") -> Any:  # noqa: ANN401
+        """Return the sample of the result of a read, or None if there is none.
+
+        There is no sample if the read raised an exception, the conversion raised
+        an exception, or the batch is not full. Exceptions are recorded, rather than
+        raised, so that they do not stop the other sensors being sampled.
+        """
+        if isinstance(value, BaseException):
+            error = value
+        else:
+            try:
+                return self._convert(value)
+            except Exception as conversion_error:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+                error = conversion_error
+
+        self._error_count += 1
+        self._last_error = error
+        return None
+
+
+class Sampler:
+    """Reads registered sensors on a schedule, and hands out their samples.
+
+    Every sensor that is due is read concurrently, then the raw values are all
+    converted into samples in one pass, and each sample is added to the queue of
+    every subscriber of its sensor. A sensor whose read or conversion fails is
+    skipped until its next due time, without holding up the other sensors (see
+    `Sensor.last_error`).
+    """
+
+    __slots__ = ("_sensors",)
+
+    def __init__(self) -> None:
+        """Initialise a new sampler, with no sensors."""
+        self._sensors: list[Sensor] = []
+
+    def register(
+        self,
+        read: "Callable[[], Awaitable[float]]",
+        factory: "Callable[[Any, Any], Any]",
+        unit: int,
+        period_ms: int,
+        batch_size: "int | None" = None,
+    ) -> Sensor:
+        """Register a sensor, which is read by awaiting the function every period.
+
+        The sensor first falls due straight away.
+
+        Raises:
+            ValueError: The period is not positive, or the batch size is less than 1.
+        """
+        if period_ms <= 0:
+            msg = f"Period not positive [{period_ms}]."
+            raise ValueError(msg)
+        if batch_size is not None and batch_size < 1:
+            msg = f"Batch size less than 1 [{batch_size}]."
+            raise ValueError(msg)
+
+        sensor = Sensor(read, factory, unit, period_ms, batch_size)
+        self._sensors.append(sensor)
+        return sensor
+
+    async def sample(self, now: "int | None" = None) -> int:
+        """Read every sensor that is due, and hand out their samples.
+
+        The current ticks (in milliseconds) are read if not given. Returns the
+        number of sensors read, including any whose read or conversion failed.
+        """
+        if now is None:
+            now = _ticks_ms()
+
+        due = [sensor for sensor in self._sensors if _ticks_diff(now, sensor._due) >= 0]
+        if not due:
+            return 0
+
+        values = await asyncio.gather(
+            *(sensor._read() for sensor in due), return_exceptions=True
+        )
+        samples = [sensor._take(values[index]) for index, sensor in enumerate(due)]
+
+        for index, sensor in enumerate(due):
+            sample = samples[index]
+            if sample is not None:
+                for queue in sensor._queues:
+                    await queue.put(sample)
+
+            # Advance from the due time, so that the sampling does not drift, unless
+            # the sensor has fallen more than a period behind
+            next_due = _ticks_add(sensor._due, sensor._period_ms)
+            if _ticks_diff(now, next_due) >= 0:
+                next_due = _ticks_add(now, sensor._period_ms)
+            sensor._due = next_due
+        return len(due)
+
+    def _get_time_until_due_ms(self, now: int) -> int:
+        """Return the time until the next sensor falls due, in milliseconds."""
+        return max(
+            0,
+            min(_ticks_diff(sensor._due, now) for sensor in self._sensors),
+        )
+
+    async def run(self) -> None:
+        """Read the sensors as they fall due, until cancelled.
+
+        Raises:
+            ValueError: No sensors are registered.
+        """
+        if not self._sensors:
+            msg = "No sensors registered."
+            raise ValueError(msg)
+
+        while True:
+            await self.sample()
+            await asyncio.sleep(self._get_time_until_due_ms(_ticks_ms()) / 1_000)
@@ -1,23 +1,50 @@
 """Package for temperature-related classes and constants."""
 
 from .constants import ABSOLUTE_ZERO
+from .converter import (
+    convert_delta_into,
+    convert_into,
+    make_converter,
+    make_delta_converter,
+)
 from .exceptions import BelowAbsoluteZeroError
+from .filter import TemperatureFilter
+from .isr import TemperatureCell, TemperatureThreshold
+from .series import TemperatureSeries
 from .temperature import Temperature
+from .temperature_array import TemperatureArray
 from .temperature_delta import TemperatureDelta
+from .temperature_delta_array import TemperatureDeltaArray
 from .unit import (
+    CONVERSION_DENOMINATORS,
+    CONVERSION_NUMERATORS,
+    CONVERSION_OFFSETS,
+    CONVERSION_PARAMETERS_STRIDE,
     Unit,
-    get_kelvin_to_unit_conversion_parameters,
 )
 from .unit import get_abbreviation as get_unit_abbreviation
 from .unit import get_name as get_unit_name
 
 __all__ = [
     "ABSOLUTE_ZERO",
+    "CONVERSION_DENOMINATORS",
+    "CONVERSION_NUMERATORS",
+    "CONVERSION_OFFSETS",
+    "CONVERSION_PARAMETERS_STRIDE",
     "BelowAbsoluteZeroError",
     "Temperature",
+    "TemperatureArray",
+    "TemperatureCell",
     "TemperatureDelta",
+    "TemperatureDeltaArray",
+    "TemperatureFilter",
+    "TemperatureSeries",
+    "TemperatureThreshold",
     "Unit",
-    "get_kelvin_to_unit_conversion_parameters",
+    "convert_delta_into",
+    "convert_into",
     "get_unit_abbreviation",
     "get_unit_name",
+    "make_converter",
+    "make_delta_converter",
 ]
@@ -0,0 +1,177 @@
+"""Module for the temperature unit converters."""
+
+# ruff: noqa: TID252
+
+from array import array
+from typing import TYPE_CHECKING
+
+from ..buffer import check_destination_length
+from .unit import (
+    CONVERSION_DENOMINATORS,
+    CONVERSION_NUMERATORS,
+    CONVERSION_OFFSETS,
+    CONVERSION_PARAMETERS_STRIDE,
+    Unit,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, MutableSequence, Sequence
+
+
+def get_conversion_parameters_index(from_unit: Unit, to_unit: Unit) -> int:
+    """Get the index of the parameters that convert from one unit to another.
+
+    Not intended for public use.
+
+    Raises:
+        ValueError: Either of the units is not a temperature unit.
+    """
+    if not (
+        0 < from_unit < CONVERSION_PARAMETERS_STRIDE
+        and 0 < to_unit < CONVERSION_PARAMETERS_STRIDE
+    ):
+        raise ValueError
+
+    return from_unit * CONVERSION_PARAMETERS_STRIDE + to_unit
+
+
+def convert_value(value: float, index: int) -> float:
+    """Convert a temperature with the parameters at the index.
+
+    Not intended for public use.
+    """
+    return (
+        value * CONVERSION_NUMERATORS[index] + CONVERSION_OFFSETS[index]
+    ) / CONVERSION_DENOMINATORS[index]
+
+
+def convert_delta_value(value: float, index: int) -> float:
+    """Convert a temperature difference with the parameters at the index.
+
+    Not intended for public use.
+    """
+    return value * CONVERSION_NUMERATORS[index] / CONVERSION_DENOMINATORS[index]
+
+
+def convert_values(values: "Iterable[float]", index: int) -> "array[float]":
+    """Create an array of the temperatures, converted with the parameters at the index.
+
+    Not intended for public use.
+    """
+    numerator = CONVERSION_NUMERATORS[index]
+    offset = CONVERSION_OFFSETS[index]
+    denominator = CONVERSION_DENOMINATORS[index]
+    return array(
+        "d",
+        ((value * numerator + offset) / denominator for value in values),
+    )
+
+
+def convert_delta_values(values: "Iterable[float]", index: int) -> "array[float]":
+    """Create an array of the temperature deltas, converted with the parameters.
+
+    The parameters are those at the index, of which only the numerator & denominator
+    apply to a difference.
+
+    Not intended for public use.
+    """
+    numerator = CONVERSION_NUMERATORS[index]
+    denominator = CONVERSION_DENOMINATORS[index]
+    return array("d", (value * numerator / denominator for value in values))
+
+
+def make_converter(from_unit: Unit, to_unit: Unit) -> "Callable[[float], float]":
+    """Make a function that converts a temperature from one unit to another.
+
+    The conversion parameters of both units are looked up once, up front, so no
+    intermediate objects are created. Values are converted in the same way as by
+    :py:meth:`Temperature.as_unit`, so temperatures that are exact in one unit (such
+    as 32F & 0C) stay exact in the other.
+
+    Use :py:func:`make_delta_converter` to convert temperature differences instead.
+
+    Raises:
+        ValueError: Either of the units is not a temperature unit.
+    """
+    index = get_conversion_parameters_index(from_unit, to_unit)
+    numerator = CONVERSION_NUMERATORS[index]
+    offset = CONVERSION_OFFSETS[index]
+    denominator = CONVERSION_DENOMINATORS[index]
+
+    def convert(value: float) -> float:
+        return (value * numerator + offset) / denominator
+
+    return convert
+
+
+def make_delta_converter(from_unit: Unit, to_unit: Unit) -> "Callable[[float], float]":
+    """Make a function that converts a temperature difference from one unit to another.
+
+    Temperature differences are not affected by the offset between the units, so
+    converting a value is a multiplication & a division by ints, & no intermediate
+    objects are created.
+
+    Raises:
+        ValueError: Either of the units is not a temperature unit.
+    """
+    index = get_conversion_parameters_index(from_unit, to_unit)
+    numerator = CONVERSION_NUMERATORS[index]
+    denominator = CONVERSION_DENOMINATORS[index]
+
+    def convert(value: float) -> float:
+        return value * numerator / denominator
+
+    return convert
+
+
+def convert_into(
+    src: "Sequence[float]",
+    dst: "MutableSequence[float] | memoryview[float]",
+    from_unit: Unit,
+    to_unit: Unit,
+) -> None:
+    """Convert a buffer of temperatures from one unit to another, writing into dst.
+
+    The values are written to the start of the destination buffer, which can be any
+    buffer of floats (such as an `array('f')`, or a memoryview cast onto a
+    bytearray). The source & destination may be the same buffer, in which case the
+    values are converted in place. No intermediate objects are created. Values are
+    converted in the same way as by :py:meth:`Temperature.as_unit`, so temperatures
+    that are exact in one unit (such as 32F & 0C) stay exact in the other.
+
+    Use :py:func:`convert_delta_into` to convert temperature differences instead.
+
+    Raises:
+        ValueError: Either of the units is not a temperature unit, or the
+            destination is shorter than the source.
+    """
+    index = get_conversion_parameters_index(from_unit, to_unit)
+    length = check_destination_length(src, dst)
+    numerator = CONVERSION_NUMERATORS[index]
+    offset = CONVERSION_OFFSETS[index]
+    denominator = CONVERSION_DENOMINATORS[index]
+    for value_index in range(length):
+        dst[value_index] = (src[value_index] * numerator + offset) / denominator
+
+
+def convert_delta_into(
+    src: "Sequence[float]",
+    dst: "MutableSequence[float] | memoryview[float]",
+    from_unit: Unit,
+    to_unit: Unit,
+) -> None:
+    """Convert a buffer of temperature differences from one unit to another.
+
+    The values are written to the start of the destination buffer, in the same way
+    as :py:func:`convert_into`, but without the offset between the units.
+
+    Raises:
+        ValueError: Either of the units is not a temperature unit, or the
+            destination is shorter than the source.
+    """
+    index = get_conversion_parameters_index(from_unit, to_unit)
+    length = check_destination_length(src, dst)
+    numerator = CONVERSION_NUMERATORS[index]
+    denominator = CONVERSION_DENOMINATORS[index]
+    for value_index in range(length):
+        dst[value_index] = src[value_index] * numerator / denominator
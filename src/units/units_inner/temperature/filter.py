@@ -0,0 +1,62 @@
+"""Module for the temperature filter class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from .converter import convert_value, get_conversion_parameters_index
+from .exceptions import BelowAbsoluteZeroError
+from .temperature import Temperature
+from .unit import Unit
+
+if TYPE_CHECKING:
+    from ..filters import Filter
+
+
+class TemperatureFilter:
+    """A streaming filter over temperatures, such as a moving average or median.
+
+    Each temperature is passed to the filter in kelvin, and each result is returned
+    as a temperature in the unit of the filter, so that a stream of readings is
+    smoothed without unwrapping & rewrapping them by hand.
+    """
+
+    __slots__ = ("_filter", "_from_kelvin_index", "_to_kelvin_index", "_unit")
+
+    def __init__(self, filter_: "Filter", unit: Unit) -> None:
+        """Initialise a new temperature filter, returning results in the unit."""
+        self._filter = filter_
+        self._unit = unit
+        self._to_kelvin_index = get_conversion_parameters_index(unit, Unit.KELVIN)
+        self._from_kelvin_index = get_conversion_parameters_index(Unit.KELVIN, unit)
+
+    def update(self, temperature: Temperature) -> Temperature:
+        """Add the temperature to the filter & return the filtered temperature."""
+        return self._create(self._filter.update(temperature._value_as_kelvin))
+
+    def update_value(self, value: float) -> Temperature:
+        """Add a raw value in the unit of the filter & return the filtered temperature.
+
+        Raises:
+            BelowAbsoluteZeroError: The value produced a temperature less than absolute
+                zero.
+        """
+        value_as_kelvin = convert_value(value, self._to_kelvin_index)
+        if value_as_kelvin < 0:
+            raise BelowAbsoluteZeroError(value=value, unit=self._unit)
+
+        return self._create(self._filter.update(value_as_kelvin))
+
+    def _create(self, value_as_kelvin: float) -> Temperature:
+        """Create a temperature in the unit of the filter from its value in kelvin."""
+        return Temperature._create(
+            convert_value(value_as_kelvin, self._from_kelvin_index),
+            self._unit,
+            value_as_kelvin,
+        )
+
+    def reset(self) -> None:
+        """Forget every temperature added to the filter."""
+        self._filter.reset()
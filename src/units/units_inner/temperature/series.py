@@ -0,0 +1,142 @@
+"""Module for the temperature series class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from ..ring_buffer import RingBuffer
+from .converter import convert_value, get_conversion_parameters_index
+from .exceptions import BelowAbsoluteZeroError
+from .temperature import Temperature
+from .temperature_array import TemperatureArray
+from .unit import Unit, get_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ..time import Time
+
+
+class TemperatureSeries(RingBuffer):
+    """A rolling window of the most recent temperatures, with optional timestamps.
+
+    The temperatures are stored as kelvin in a buffer preallocated on initialisation,
+    so that pushing a temperature drops the oldest one once the series is full,
+    rather than allocating. The temperatures are indexed from the oldest (0) to the
+    latest (-1), and are expressed in the unit of the series when retrieved.
+    """
+
+    __slots__ = ("_from_kelvin_index", "_to_kelvin_index", "_unit")
+
+    def __init__(self, capacity: int, unit: Unit, *, timestamped: bool = False) -> None:
+        """Initialise a new, empty series, holding up to the number of temperatures.
+
+        If the series is timestamped, every temperature is pushed along with the time it
+        was measured at.
+
+        Raises:
+            ValueError: The capacity is less than 1.
+        """
+        super().__init__(capacity, timestamped=timestamped)
+        self._unit = unit
+        self._to_kelvin_index = get_conversion_parameters_index(unit, Unit.KELVIN)
+        self._from_kelvin_index = get_conversion_parameters_index(Unit.KELVIN, unit)
+
+    def push(self, temperature: Temperature, time: "Time | None" = None) -> None:
+        """Push a temperature, dropping the oldest one if the series is full.
+
+        Does not allocate.
+
+        Raises:
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        end = self._end
+        if end == self._limit:
+            end = self._compact()
+        times = self._times
+        if times is not None and time is not None:
+            times[end] = time._value_as_second
+        elif times is not None or time is not None:
+            self._raise_time_error()
+        self._values[end] = temperature._value_as_kelvin
+        self._end = end + 1
+
+    def push_value(self, value: float, time: "Time | None" = None) -> None:
+        """Push a raw value in the unit of the series, as a temperature.
+
+        Raises:
+            BelowAbsoluteZeroError: The value produced a temperature less than absolute
+                zero.
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        value_as_kelvin = convert_value(value, self._to_kelvin_index)
+        if value_as_kelvin < 0:
+            raise BelowAbsoluteZeroError(value=value, unit=self._unit)
+
+        self._push(value_as_kelvin, time)
+
+    def _create(self, value_as_kelvin: float) -> Temperature:
+        """Create a temperature in the unit of the series from its value in kelvin."""
+        return Temperature._create(
+            convert_value(value_as_kelvin, self._from_kelvin_index),
+            self._unit,
+            value_as_kelvin,
+        )
+
+    def latest(self) -> Temperature:
+        """Return the most recently pushed temperature.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(-1))
+
+    def oldest(self) -> Temperature:
+        """Return the least recently pushed temperature still in the series.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(0))
+
+    def window(self, count: "int | None" = None) -> TemperatureArray:
+        """Return the latest temperatures, from oldest to latest.
+
+        All of the temperatures are returned if the count is None, and at most as many
+        temperatures as the series holds otherwise. The window is a view of the series
+        rather than a copy, so it is only valid until the next push or clear.
+        """
+        return TemperatureArray._from_values_as_kelvin(
+            self._view_values(count), self._unit
+        )
+
+    def __getitem__(self, index: int) -> Temperature:
+        """Return the temperature at the index.
+
+        Raises:
+            IndexError: There is no temperature at the index.
+        """
+        return self._create(self._get_value(index))
+
+    def __iter__(self) -> "Iterator[Temperature]":
+        """Return an iterator over the temperatures, from oldest to latest.
+
+        Each temperature is only created when it is reached.
+        """
+        for value_as_kelvin in self._iter_values():
+            yield self._create(value_as_kelvin)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the temperature series."""
+        values = [
+            convert_value(value, self._from_kelvin_index)
+            for value in self._iter_values()
+        ]
+        return (
+            f"TemperatureSeries({values}, {get_name(self._unit)},"
+            f" capacity={self._capacity})"
+        )
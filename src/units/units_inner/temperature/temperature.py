@@ -1,13 +1,18 @@
 """Module for the temperature class."""
 
+# pyright: reportPrivateUsage=false
+
 from typing import Final, overload
 
 from .exceptions import BelowAbsoluteZeroError
 from .temperature_delta import TemperatureDelta
 from .unit import (
+    CONVERSION_DENOMINATORS,
+    CONVERSION_NUMERATORS,
+    CONVERSION_OFFSETS,
+    CONVERSION_PARAMETERS_STRIDE,
     Unit,
     get_abbreviation,
-    get_kelvin_to_unit_conversion_parameters,
     get_name,
 )
 
@@ -17,40 +22,64 @@ ABSOLUTE_ZERO_AS_KELVIN: Final = 0
 class Temperature:
     """Quantitatively expresses the attribute of hotness or coldness."""
 
+    __slots__ = ("_unit", "_value", "_value_as_kelvin")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new temperature.
 
         Raises:
             BelowAbsoluteZeroError: The value and unit produced an invalid temperature
                 less than absolute zero.
+            ValueError: The unit is not a temperature unit.
         """
-        unit_conversion_parameters = get_kelvin_to_unit_conversion_parameters(unit)
+        if not 0 < unit < CONVERSION_PARAMETERS_STRIDE:
+            raise ValueError
+
+        index = unit * CONVERSION_PARAMETERS_STRIDE + Unit.KELVIN
         value_as_kelvin = (
-            value - unit_conversion_parameters.absolute_zero_offset
-        ) / unit_conversion_parameters.unit_delta_per_degree_kelvin
+            value * CONVERSION_NUMERATORS[index] + CONVERSION_OFFSETS[index]
+        ) / CONVERSION_DENOMINATORS[index]
         if value_as_kelvin < ABSOLUTE_ZERO_AS_KELVIN:
             raise BelowAbsoluteZeroError(value=value, unit=unit)
 
         self._value = value
         self._unit = unit
+        self._value_as_kelvin = value_as_kelvin
+
+    @classmethod
+    def _create(cls, value: float, unit: Unit, value_as_kelvin: float) -> "Temperature":
+        """Create a temperature from its value in both the unit & kelvin.
+
+        Not intended for public use.
+
+        The value is not converted again, and the only validation is a single
+        comparison of the value in kelvin.
+
+        Raises:
+            BelowAbsoluteZeroError: The value was less than absolute zero.
+        """
+        if value_as_kelvin < ABSOLUTE_ZERO_AS_KELVIN:
+            raise BelowAbsoluteZeroError(value=value, unit=unit)
+
+        temperature: Temperature = cls.__new__(cls)
+        temperature._value = value
+        temperature._unit = unit
+        temperature._value_as_kelvin = value_as_kelvin
+        return temperature
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the temperature, expressed as the unit."""
-        internal_unit_conversion_parameters = get_kelvin_to_unit_conversion_parameters(
-            self._unit,
-        )
-        value_as_kelvin = (
-            self._value - internal_unit_conversion_parameters.absolute_zero_offset
-        ) / internal_unit_conversion_parameters.unit_delta_per_degree_kelvin
+        """Return the temperature, expressed as the unit.
 
-        external_unit_conversion_parameters = get_kelvin_to_unit_conversion_parameters(
-            unit,
-        )
+        Raises:
+            ValueError: The unit is not a temperature unit.
+        """
+        if not 0 < unit < CONVERSION_PARAMETERS_STRIDE:
+            raise ValueError
+
+        index = self._unit * CONVERSION_PARAMETERS_STRIDE + unit
         return (
-            external_unit_conversion_parameters.unit_delta_per_degree_kelvin
-            * value_as_kelvin
-            + external_unit_conversion_parameters.absolute_zero_offset
-        )
+            self._value * CONVERSION_NUMERATORS[index] + CONVERSION_OFFSETS[index]
+        ) / CONVERSION_DENOMINATORS[index]
 
     def __add__(self, delta: TemperatureDelta) -> "Temperature":
         """Return the sum of the temperature and the difference.
@@ -59,10 +88,20 @@ class Temperature:
             BelowAbsoluteZeroError: The sum of the temperature and the difference was
                 less than absolute zero.
         """
-        value_as_kelvin = self.as_unit(Unit.KELVIN)
-        delta_value_as_kelvin = delta.as_unit(Unit.KELVIN)
-        value_sum_as_kelvin = value_as_kelvin + delta_value_as_kelvin
-        return Temperature(value_sum_as_kelvin, Unit.KELVIN)
+        if self._unit == delta._unit:
+            value_sum = self._value + delta._value
+            index = self._unit * CONVERSION_PARAMETERS_STRIDE + Unit.KELVIN
+            return Temperature._create(
+                value_sum,
+                self._unit,
+                (value_sum * CONVERSION_NUMERATORS[index] + CONVERSION_OFFSETS[index])
+                / CONVERSION_DENOMINATORS[index],
+            )
+
+        value_sum_as_kelvin = self._value_as_kelvin + delta._value_as_kelvin
+        return Temperature._create(
+            value_sum_as_kelvin, Unit.KELVIN, value_sum_as_kelvin
+        )
 
     def __radd__(self, delta: TemperatureDelta) -> "Temperature":
         """Return the sum of the temperature and the difference."""
@@ -92,13 +131,37 @@ class Temperature:
                 absolute zero.Error can only be raised when other is a
                 :py:class:`TemperatureDelta`.
         """
-        value_as_kelvin = self.as_unit(Unit.KELVIN)
-        other_value_as_kelvin = other.as_unit(Unit.KELVIN)
-        value_difference_as_kelvin = value_as_kelvin - other_value_as_kelvin
+        if self._unit == other._unit:
+            value_difference = self._value - other._value
+            index = self._unit * CONVERSION_PARAMETERS_STRIDE + Unit.KELVIN
+            if isinstance(other, Temperature):
+                return TemperatureDelta._create(
+                    value_difference,
+                    self._unit,
+                    value_difference
+                    * CONVERSION_NUMERATORS[index]
+                    / CONVERSION_DENOMINATORS[index],
+                )
+
+            return Temperature._create(
+                value_difference,
+                self._unit,
+                (
+                    value_difference * CONVERSION_NUMERATORS[index]
+                    + CONVERSION_OFFSETS[index]
+                )
+                / CONVERSION_DENOMINATORS[index],
+            )
+
+        value_difference_as_kelvin = self._value_as_kelvin - other._value_as_kelvin
         return (
-            TemperatureDelta(value_difference_as_kelvin, Unit.KELVIN)
+            TemperatureDelta._create(
+                value_difference_as_kelvin, Unit.KELVIN, value_difference_as_kelvin
+            )
             if isinstance(other, Temperature)
-            else Temperature(value_difference_as_kelvin, Unit.KELVIN)
+            else Temperature._create(
+                value_difference_as_kelvin, Unit.KELVIN, value_difference_as_kelvin
+            )
         )
 
     def __eq__(self, other: object) -> bool:
@@ -106,27 +169,27 @@ class Temperature:
         if not isinstance(other, Temperature):
             return NotImplemented
 
-        return self.as_unit(Unit.KELVIN) == other.as_unit(Unit.KELVIN)
+        return self._value_as_kelvin == other._value_as_kelvin
 
     def __lt__(self, other: "Temperature") -> bool:
         """Return whether the temperature is less than the other."""
-        return self.as_unit(Unit.KELVIN) < other.as_unit(Unit.KELVIN)
+        return self._value_as_kelvin < other._value_as_kelvin
 
     def __le__(self, other: "Temperature") -> bool:
         """Return whether the temperature is less than or equal to the other."""
-        return self.as_unit(Unit.KELVIN) <= other.as_unit(Unit.KELVIN)
+        return self._value_as_kelvin <= other._value_as_kelvin
 
     def __gt__(self, other: "Temperature") -> bool:
         """Return whether the temperature is greater than the other."""
-        return self.as_unit(Unit.KELVIN) > other.as_unit(Unit.KELVIN)
+        return self._value_as_kelvin > other._value_as_kelvin
 
     def __ge__(self, other: "Temperature") -> bool:
         """Return whether the temperature is greater than or equal to the other."""
-        return self.as_unit(Unit.KELVIN) >= other.as_unit(Unit.KELVIN)
+        return self._value_as_kelvin >= other._value_as_kelvin
 
     def __hash__(self) -> int:
         """Return the hash of the temperature."""
-        return hash(self.as_unit(Unit.KELVIN))
+        return hash(self._value_as_kelvin)
 
     def __str__(self) -> str:
         """Return a string representation of the temperature."""
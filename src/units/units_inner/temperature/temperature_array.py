@@ -0,0 +1,251 @@
+"""Module for the temperature array class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .converter import convert_value, convert_values, get_conversion_parameters_index
+from .exceptions import BelowAbsoluteZeroError
+from .temperature import ABSOLUTE_ZERO_AS_KELVIN, Temperature
+from .temperature_delta import TemperatureDelta
+from .temperature_delta_array import TemperatureDeltaArray
+from .unit import Unit, get_name
+
+if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Iterable, Iterator
+
+
+def _check_above_absolute_zero(
+    values_as_kelvin: "array[float] | memoryview", unit: Unit
+) -> None:
+    """Check that none of the temperatures are less than absolute zero.
+
+    Raises:
+        BelowAbsoluteZeroError: One of the temperatures was less than absolute zero.
+    """
+    if not values_as_kelvin:
+        return
+
+    minimum_value_as_kelvin = min(values_as_kelvin)
+    if minimum_value_as_kelvin < ABSOLUTE_ZERO_AS_KELVIN:
+        raise BelowAbsoluteZeroError(
+            value=convert_value(
+                minimum_value_as_kelvin,
+                get_conversion_parameters_index(Unit.KELVIN, unit),
+            ),
+            unit=unit,
+        )
+
+
+class TemperatureArray:
+    """A homogeneous array of temperatures.
+
+    The temperatures are stored in bulk as kelvin, and share a single unit that they are
+    expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_kelvin")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of temperatures, with all values in the unit.
+
+        Raises:
+            BelowAbsoluteZeroError: One of the values produced a temperature less than
+                absolute zero.
+        """
+        values_as_kelvin = convert_values(
+            values, get_conversion_parameters_index(unit, Unit.KELVIN)
+        )
+        _check_above_absolute_zero(values_as_kelvin, unit)
+
+        self._unit = unit
+        self._values_as_kelvin: array[float] | memoryview = values_as_kelvin
+
+    @classmethod
+    def _from_values_as_kelvin(
+        cls, values_as_kelvin: "array[float] | memoryview", unit: Unit
+    ) -> "TemperatureArray":
+        """Create an array of temperatures directly from a buffer of kelvin.
+
+        The buffer is used as-is, rather than copied, and is assumed to be valid.
+        """
+        temperatures: TemperatureArray = cls.__new__(cls)
+        temperatures._unit = unit
+        temperatures._values_as_kelvin = values_as_kelvin
+        return temperatures
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the temperatures, expressed as the unit."""
+        return convert_values(
+            self._values_as_kelvin, get_conversion_parameters_index(Unit.KELVIN, unit)
+        )
+
+    def __len__(self) -> int:
+        """Return the number of temperatures."""
+        return len(self._values_as_kelvin)
+
+    @overload
+    def __getitem__(self, index: int) -> Temperature: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "TemperatureArray": ...
+
+    def __getitem__(self, index: "int | slice") -> "Temperature | TemperatureArray":
+        """Return the temperature at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return TemperatureArray._from_values_as_kelvin(
+                memoryview(self._values_as_kelvin)[index], self._unit
+            )
+
+        value_as_kelvin = self._values_as_kelvin[index]
+        return Temperature._create(
+            convert_value(
+                value_as_kelvin,
+                get_conversion_parameters_index(Unit.KELVIN, self._unit),
+            ),
+            self._unit,
+            value_as_kelvin,
+        )
+
+    def __iter__(self) -> "Iterator[Temperature]":
+        """Return an iterator over the temperatures."""
+        index = get_conversion_parameters_index(Unit.KELVIN, self._unit)
+        for value_as_kelvin in self._values_as_kelvin:
+            yield Temperature._create(
+                convert_value(value_as_kelvin, index), self._unit, value_as_kelvin
+            )
+
+    def __add__(
+        self, delta: "TemperatureDelta | TemperatureDeltaArray"
+    ) -> "TemperatureArray":
+        """Return the sum of the temperatures and the difference(s).
+
+        A single temperature delta is added to every temperature, while an array of
+        temperature deltas is added elementwise.
+
+        Raises:
+            BelowAbsoluteZeroError: One of the sums was less than absolute zero.
+            ValueError: The arrays are of different lengths.
+        """
+        delta_values_as_kelvin = (
+            delta.as_unit(Unit.KELVIN)
+            if isinstance(delta, TemperatureDelta)
+            else delta._values_as_kelvin
+        )
+        value_sums_as_kelvin = add_values(
+            self._values_as_kelvin, delta_values_as_kelvin
+        )
+        _check_above_absolute_zero(value_sums_as_kelvin, self._unit)
+        return TemperatureArray._from_values_as_kelvin(value_sums_as_kelvin, self._unit)
+
+    def __radd__(self, delta: TemperatureDelta) -> "TemperatureArray":
+        """Return the sum of the temperatures and the difference.
+
+        Raises:
+            BelowAbsoluteZeroError: One of the sums was less than absolute zero.
+        """
+        return self + delta
+
+    @overload
+    def __sub__(
+        self, other: "Temperature | TemperatureArray"
+    ) -> TemperatureDeltaArray: ...
+
+    @overload
+    def __sub__(
+        self, other: "TemperatureDelta | TemperatureDeltaArray"
+    ) -> "TemperatureArray": ...
+
+    def __sub__(
+        self,
+        other: "Temperature | TemperatureArray | TemperatureDelta | TemperatureDeltaArray",  # noqa: E501
+    ) -> "TemperatureDeltaArray | TemperatureArray":
+        """Return the difference between the temperatures and the other(s).
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a temperature or an array of temperatures, return the
+          differences between the temperatures.
+        - If the argument is a temperature delta or an array of temperature deltas,
+          return the temperatures less the differences.
+
+        A single argument is subtracted from every temperature, while an array is
+        subtracted elementwise.
+
+        Raises:
+            BelowAbsoluteZeroError: One of the differences was less than absolute
+                zero. Error can only be raised when other is a
+                :py:class:`TemperatureDelta` or :py:class:`TemperatureDeltaArray`.
+            ValueError: The arrays are of different lengths.
+        """
+        other_values_as_kelvin = (
+            other.as_unit(Unit.KELVIN)
+            if isinstance(other, (Temperature, TemperatureDelta))
+            else other._values_as_kelvin
+        )
+        value_differences_as_kelvin = subtract_values(
+            self._values_as_kelvin, other_values_as_kelvin
+        )
+        if isinstance(other, (Temperature, TemperatureArray)):
+            return TemperatureDeltaArray._from_values_as_kelvin(
+                value_differences_as_kelvin, self._unit
+            )
+
+        _check_above_absolute_zero(value_differences_as_kelvin, self._unit)
+        return TemperatureArray._from_values_as_kelvin(
+            value_differences_as_kelvin, self._unit
+        )
+
+    def __lt__(self, other: "Temperature | TemperatureArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the temperatures less than the other temperature(s)."""
+        other_values_as_kelvin = (
+            other.as_unit(Unit.KELVIN)
+            if isinstance(other, Temperature)
+            else other._values_as_kelvin
+        )
+        return less_than(self._values_as_kelvin, other_values_as_kelvin)
+
+    def __le__(self, other: "Temperature | TemperatureArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the temperatures less than or equal to the other(s)."""
+        other_values_as_kelvin = (
+            other.as_unit(Unit.KELVIN)
+            if isinstance(other, Temperature)
+            else other._values_as_kelvin
+        )
+        return less_than_or_equal_to(self._values_as_kelvin, other_values_as_kelvin)
+
+    def __gt__(self, other: "Temperature | TemperatureArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the temperatures greater than the other temperature(s)."""
+        other_values_as_kelvin = (
+            other.as_unit(Unit.KELVIN)
+            if isinstance(other, Temperature)
+            else other._values_as_kelvin
+        )
+        return greater_than(self._values_as_kelvin, other_values_as_kelvin)
+
+    def __ge__(self, other: "Temperature | TemperatureArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the temperatures greater than or equal to the other(s)."""
+        other_values_as_kelvin = (
+            other.as_unit(Unit.KELVIN)
+            if isinstance(other, Temperature)
+            else other._values_as_kelvin
+        )
+        return greater_than_or_equal_to(self._values_as_kelvin, other_values_as_kelvin)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the temperatures."""
+        values = list(self.as_unit(self._unit))
+        return f"TemperatureArray({values}, {get_name(self._unit)})"
@@ -3,9 +3,11 @@
 from typing import overload
 
 from .unit import (
+    CONVERSION_DENOMINATORS,
+    CONVERSION_NUMERATORS,
+    CONVERSION_PARAMETERS_STRIDE,
     Unit,
     get_abbreviation,
-    get_kelvin_to_unit_conversion_parameters,
     get_name,
 )
 
@@ -13,34 +15,60 @@ from .unit import (
 class TemperatureDelta:
     """The difference between two temperatures."""
 
+    __slots__ = ("_unit", "_value", "_value_as_kelvin")
+
     def __init__(self, value: float, unit: Unit) -> None:
-        """Initialise a new temperature difference."""
+        """Initialise a new temperature difference.
+
+        Raises:
+            ValueError: The unit is not a temperature unit.
+        """
+        if not 0 < unit < CONVERSION_PARAMETERS_STRIDE:
+            raise ValueError
+
         self._value = value
         self._unit = unit
+        index = unit * CONVERSION_PARAMETERS_STRIDE + Unit.KELVIN
+        self._value_as_kelvin = (
+            value * CONVERSION_NUMERATORS[index] / CONVERSION_DENOMINATORS[index]
+        )
+
+    @classmethod
+    def _create(
+        cls, value: float, unit: Unit, value_as_kelvin: float
+    ) -> "TemperatureDelta":
+        """Create a temperature difference from its value in both the unit & kelvin.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        temperature_delta: TemperatureDelta = cls.__new__(cls)
+        temperature_delta._value = value
+        temperature_delta._unit = unit
+        temperature_delta._value_as_kelvin = value_as_kelvin
+        return temperature_delta
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the temperature difference, expressed as the unit."""
-        internal_unit_conversion_parameters = get_kelvin_to_unit_conversion_parameters(
-            self._unit,
-        )
+        """Return the temperature difference, expressed as the unit.
 
-        value_as_kelvin = (
-            self._value
-            / internal_unit_conversion_parameters.unit_delta_per_degree_kelvin
-        )
+        Raises:
+            ValueError: The unit is not a temperature unit.
+        """
+        if not 0 < unit < CONVERSION_PARAMETERS_STRIDE:
+            raise ValueError
 
-        external_unit_conversion_parameters = get_kelvin_to_unit_conversion_parameters(
-            unit,
-        )
+        index = self._unit * CONVERSION_PARAMETERS_STRIDE + unit
         return (
-            external_unit_conversion_parameters.unit_delta_per_degree_kelvin
-            * value_as_kelvin
+            self._value * CONVERSION_NUMERATORS[index] / CONVERSION_DENOMINATORS[index]
         )
 
     def __mul__(self, value: float) -> "TemperatureDelta":
         """Return a temperature difference scaled by the value."""
         scaled_value = self._value * value
-        return TemperatureDelta(scaled_value, self._unit)
+        return TemperatureDelta._create(
+            scaled_value, self._unit, self._value_as_kelvin * value
+        )
 
     def __rmul__(self, value: float) -> "TemperatureDelta":
         """Return a temperature difference scaled by the value."""
@@ -66,12 +94,12 @@ class TemperatureDelta:
           the two differences
         """
         if isinstance(other, TemperatureDelta):
-            value_as_kelvin = self.as_unit(Unit.KELVIN)
-            other_value_as_kelvin = other.as_unit(Unit.KELVIN)
-            return value_as_kelvin / other_value_as_kelvin
+            return self._value_as_kelvin / other._value_as_kelvin
 
         scaled_value = self._value / other
-        return TemperatureDelta(scaled_value, self._unit)
+        return TemperatureDelta._create(
+            scaled_value, self._unit, self._value_as_kelvin / other
+        )
 
     def __add__(self, other: "TemperatureDelta") -> "TemperatureDelta":
         """Return the sum of the temperature differences."""
@@ -81,10 +109,21 @@ class TemperatureDelta:
         if not isinstance(other, TemperatureDelta):  # type: ignore[reportUnnecessaryIsInstance]
             return NotImplemented
 
-        value_as_kelvin = self.as_unit(Unit.KELVIN)
-        delta_value_as_kelvin = other.as_unit(Unit.KELVIN)
-        added_value_as_kelvin = value_as_kelvin + delta_value_as_kelvin
-        return TemperatureDelta(added_value_as_kelvin, Unit.KELVIN)
+        if self._unit == other._unit:
+            value_sum = self._value + other._value
+            index = self._unit * CONVERSION_PARAMETERS_STRIDE + Unit.KELVIN
+            return TemperatureDelta._create(
+                value_sum,
+                self._unit,
+                value_sum
+                * CONVERSION_NUMERATORS[index]
+                / CONVERSION_DENOMINATORS[index],
+            )
+
+        added_value_as_kelvin = self._value_as_kelvin + other._value_as_kelvin
+        return TemperatureDelta._create(
+            added_value_as_kelvin, Unit.KELVIN, added_value_as_kelvin
+        )
 
     def __sub__(self, delta: "TemperatureDelta") -> "TemperatureDelta":
         """Return the difference between the temperature differences."""
@@ -93,57 +132,55 @@ class TemperatureDelta:
     def __neg__(self) -> "TemperatureDelta":
         """Return the inverse of the temperature difference."""
         inverted_value = -self._value
-        return TemperatureDelta(inverted_value, self._unit)
+        return TemperatureDelta._create(
+            inverted_value, self._unit, -self._value_as_kelvin
+        )
 
     def __abs__(self) -> "TemperatureDelta":
         """Return the absolute version of the temperature difference."""
         absolute_value = abs(self._value)
-        return TemperatureDelta(absolute_value, self._unit)
+        return TemperatureDelta._create(
+            absolute_value, self._unit, abs(self._value_as_kelvin)
+        )
 
     def __floordiv__(self, other: "TemperatureDelta") -> float:
         """Return the floored ratio between the temperature differences."""
-        value_as_kelvin = self.as_unit(Unit.KELVIN)
-        other_value_as_kelvin = other.as_unit(Unit.KELVIN)
-        return value_as_kelvin // other_value_as_kelvin
+        return self._value_as_kelvin // other._value_as_kelvin
 
     def __mod__(self, other: "TemperatureDelta") -> float:
         """Return the remainder of the ratio between the temperature differences."""
-        value_as_kelvin = self.as_unit(Unit.KELVIN)
-        other_value_as_kelvin = other.as_unit(Unit.KELVIN)
-        return value_as_kelvin % other_value_as_kelvin
+        return self._value_as_kelvin % other._value_as_kelvin
 
     def __divmod__(self, other: "TemperatureDelta") -> tuple[float, float]:
         """Return the quotient and remainder of the ratio between the temp deltas."""
-        value_as_kelvin = self.as_unit(Unit.KELVIN)
-        other_value_as_kelvin = other.as_unit(Unit.KELVIN)
-        return divmod(value_as_kelvin, other_value_as_kelvin)
+        return divmod(self._value_as_kelvin, other._value_as_kelvin)
 
     def __eq__(self, other: object) -> bool:
         """Return whether the objects are equal temperature differences."""
         if not isinstance(other, TemperatureDelta):
             return NotImplemented
 
-        return self.as_unit(Unit.KELVIN) == other.as_unit(Unit.KELVIN)
+        return self._value_as_kelvin == other._value_as_kelvin
 
     def __lt__(self, other: "TemperatureDelta") -> bool:
         """Return whether the temperature difference is less than the other."""
-        return self.as_unit(Unit.KELVIN) < other.as_unit(Unit.KELVIN)
+        return self._value_as_kelvin < other._value_as_kelvin
 
     def __le__(self, other: "TemperatureDelta") -> bool:
         """Return whether the temperature delta is less than or equal to the other."""
-        return self.as_unit(Unit.KELVIN) <= other.as_unit(Unit.KELVIN)
+        return self._value_as_kelvin <= other._value_as_kelvin
 
     def __gt__(self, other: "TemperatureDelta") -> bool:
         """Return whether the temperature difference is greater than the other."""
-        return self.as_unit(Unit.KELVIN) > other.as_unit(Unit.KELVIN)
+        return self._value_as_kelvin > other._value_as_kelvin
 
     def __ge__(self, other: "TemperatureDelta") -> bool:
         """Return whether the temperature delta is greater than or equal to other."""
-        return self.as_unit(Unit.KELVIN) >= other.as_unit(Unit.KELVIN)
+        return self._value_as_kelvin >= other._value_as_kelvin
 
     def __hash__(self) -> int:
         """Return the hash of the temperature difference."""
-        return hash(self.as_unit(Unit.KELVIN))
+        return hash(self._value_as_kelvin)
 
     def __str__(self) -> str:
         """Return a string representation of the temperature difference."""
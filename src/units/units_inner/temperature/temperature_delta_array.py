@@ -0,0 +1,224 @@
+"""Module for the temperature delta array class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: SLF001, TID252
+
+from array import array
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    create_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .converter import (
+    convert_delta_value,
+    convert_delta_values,
+    get_conversion_parameters_index,
+)
+from .temperature_delta import TemperatureDelta
+from .unit import Unit, get_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class TemperatureDeltaArray:
+    """A homogeneous array of temperature deltas.
+
+    The deltas are stored in bulk as kelvin, and share a single unit that they are
+    expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_kelvin")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of temperature deltas, with all values in the unit."""
+        self._unit = unit
+        self._values_as_kelvin: array[float] | memoryview = convert_delta_values(
+            values, get_conversion_parameters_index(unit, Unit.KELVIN)
+        )
+
+    @classmethod
+    def _from_values_as_kelvin(
+        cls, values_as_kelvin: "array[float] | memoryview", unit: Unit
+    ) -> "TemperatureDeltaArray":
+        """Create an array of temperature deltas directly from a buffer of kelvin.
+
+        The buffer is used as-is, rather than copied.
+        """
+        deltas: TemperatureDeltaArray = cls.__new__(cls)
+        deltas._unit = unit
+        deltas._values_as_kelvin = values_as_kelvin
+        return deltas
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the temperature deltas, expressed as the unit."""
+        return convert_delta_values(
+            self._values_as_kelvin, get_conversion_parameters_index(Unit.KELVIN, unit)
+        )
+
+    def __len__(self) -> int:
+        """Return the number of temperature deltas."""
+        return len(self._values_as_kelvin)
+
+    @overload
+    def __getitem__(self, index: int) -> TemperatureDelta: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "TemperatureDeltaArray": ...
+
+    def __getitem__(
+        self, index: "int | slice"
+    ) -> "TemperatureDelta | TemperatureDeltaArray":
+        """Return the temperature delta at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return TemperatureDeltaArray._from_values_as_kelvin(
+                memoryview(self._values_as_kelvin)[index], self._unit
+            )
+
+        value_as_kelvin = self._values_as_kelvin[index]
+        return TemperatureDelta._create(
+            convert_delta_value(
+                value_as_kelvin,
+                get_conversion_parameters_index(Unit.KELVIN, self._unit),
+            ),
+            self._unit,
+            value_as_kelvin,
+        )
+
+    def __iter__(self) -> "Iterator[TemperatureDelta]":
+        """Return an iterator over the temperature deltas."""
+        index = get_conversion_parameters_index(Unit.KELVIN, self._unit)
+        for value_as_kelvin in self._values_as_kelvin:
+            yield TemperatureDelta._create(
+                convert_delta_value(value_as_kelvin, index),
+                self._unit,
+                value_as_kelvin,
+            )
+
+    def __mul__(self, value: float) -> "TemperatureDeltaArray":
+        """Return the temperature deltas scaled by the value."""
+        return TemperatureDeltaArray._from_values_as_kelvin(
+            create_values(self._values_as_kelvin, value), self._unit
+        )
+
+    def __rmul__(self, value: float) -> "TemperatureDeltaArray":
+        """Return the temperature deltas scaled by the value."""
+        return self * value
+
+    def __truediv__(self, value: float) -> "TemperatureDeltaArray":
+        """Return the temperature deltas scaled by the inverse of the value."""
+        return self * (1 / value)
+
+    def __add__(
+        self, other: "TemperatureDelta | TemperatureDeltaArray"
+    ) -> "TemperatureDeltaArray":
+        """Return the sum of the temperature deltas and the other delta(s).
+
+        A single temperature delta is added to every element, while an array of
+        temperature deltas is added elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, TemperatureDelta):
+            return TemperatureDeltaArray._from_values_as_kelvin(
+                add_values(self._values_as_kelvin, other.as_unit(Unit.KELVIN)),
+                self._unit,
+            )
+
+        if isinstance(other, TemperatureDeltaArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return TemperatureDeltaArray._from_values_as_kelvin(
+                add_values(self._values_as_kelvin, other._values_as_kelvin),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __radd__(self, other: TemperatureDelta) -> "TemperatureDeltaArray":
+        """Return the sum of the temperature deltas and the other delta."""
+        return self + other
+
+    def __sub__(
+        self, other: "TemperatureDelta | TemperatureDeltaArray"
+    ) -> "TemperatureDeltaArray":
+        """Return the difference of the temperature deltas and the other delta(s).
+
+        A single temperature delta is subtracted from every element, while an array of
+        temperature deltas is subtracted elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, TemperatureDelta):
+            return TemperatureDeltaArray._from_values_as_kelvin(
+                subtract_values(self._values_as_kelvin, other.as_unit(Unit.KELVIN)),
+                self._unit,
+            )
+
+        if isinstance(other, TemperatureDeltaArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return TemperatureDeltaArray._from_values_as_kelvin(
+                subtract_values(self._values_as_kelvin, other._values_as_kelvin),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __neg__(self) -> "TemperatureDeltaArray":
+        """Return the inverse of the temperature deltas."""
+        return self * -1
+
+    def __abs__(self) -> "TemperatureDeltaArray":
+        """Return the absolute of the temperature deltas."""
+        return TemperatureDeltaArray._from_values_as_kelvin(
+            array("d", (abs(value) for value in self._values_as_kelvin)), self._unit
+        )
+
+    def __lt__(self, other: "TemperatureDelta | TemperatureDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the temperature deltas less than the other delta(s)."""
+        other_values_as_kelvin = (
+            other.as_unit(Unit.KELVIN)
+            if isinstance(other, TemperatureDelta)
+            else other._values_as_kelvin
+        )
+        return less_than(self._values_as_kelvin, other_values_as_kelvin)
+
+    def __le__(self, other: "TemperatureDelta | TemperatureDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the temperature deltas less than or equal to others."""
+        other_values_as_kelvin = (
+            other.as_unit(Unit.KELVIN)
+            if isinstance(other, TemperatureDelta)
+            else other._values_as_kelvin
+        )
+        return less_than_or_equal_to(self._values_as_kelvin, other_values_as_kelvin)
+
+    def __gt__(self, other: "TemperatureDelta | TemperatureDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the temperature deltas greater than the other delta(s)."""
+        other_values_as_kelvin = (
+            other.as_unit(Unit.KELVIN)
+            if isinstance(other, TemperatureDelta)
+            else other._values_as_kelvin
+        )
+        return greater_than(self._values_as_kelvin, other_values_as_kelvin)
+
+    def __ge__(self, other: "TemperatureDelta | TemperatureDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the temperature deltas greater than or equal to others."""
+        other_values_as_kelvin = (
+            other.as_unit(Unit.KELVIN)
+            if isinstance(other, TemperatureDelta)
+            else other._values_as_kelvin
+        )
+        return greater_than_or_equal_to(self._values_as_kelvin, other_values_as_kelvin)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the temperature deltas."""
+        values = list(self.as_unit(self._unit))
+        return f"TemperatureDeltaArray({values}, {get_name(self._unit)})"
@@ -1,4 +1,8 @@
-"""Module for the temperature unit enum."""
+"""Module for the temperature units.
+
+Generated by `tools/generate_units.py` from `tools/units_spec.json`, so edit the
+spec & rerun the generator rather than editing this module.
+"""
 
 from typing import TYPE_CHECKING, Final
 
@@ -7,10 +11,12 @@ if TYPE_CHECKING:
 else:
     IntEnum = object
 
+_NAN: Final = float("nan")
+
 
-# NB: When adding a new unit, be sure to also update:
-# - The info list in helpers.py
-# - The `test_get_X_value_as_unit` test in `test_X.py` and `test_X_delta.py`
+# NB: When adding a new unit, add it to `tools/units_spec.json` & rerun
+# `tools/generate_units.py`, which also regenerates the tests of the unit
+# tables
 class Unit(IntEnum):
     """A temperature unit.
 
@@ -25,102 +31,109 @@ class Unit(IntEnum):
     FAHRENHEIT = 3
 
 
-class _UnitConversionParameters:
-    """Parameters required to convert a value from kelvin to a unit.
+# The name & abbreviation of each unit, indexed by the unit. Element 0 does not
+# correspond to a unit.
+_NAMES: Final = (
+    "",
+    "celsius",
+    "kelvin",
+    "fahrenheit",
+)
+_ABBREVIATIONS: Final = (
+    "",
+    "C",
+    "K",
+    "F",
+)
+
+# Dense from-unit x to-unit tables of the conversion parameters. Units are small
+# contiguous ints, so the parameters that convert a value from one unit to another are
+# at index `from_unit * CONVERSION_PARAMETERS_STRIDE + to_unit`. A temperature is
+# converted with `(value * numerator + offset) / denominator`, where the numerator &
+# denominator are ints & the offset is a short decimal, so that temperatures that are
+# exact in one unit (such as 32F & 0C) stay exact in the other. Differences are
+# converted with the numerator & denominator alone. Row & column 0 do not correspond to
+# a unit. Tuples are used rather than arrays, as reading an element of a tuple returns
+# the stored float instead of allocating a new one.
+CONVERSION_PARAMETERS_STRIDE: Final = 4
+CONVERSION_NUMERATORS: Final = (
+    # Row 0 does not correspond to a unit
+    0,
+    0,
+    0,
+    0,
+    # Numerators from celsius to each unit
+    0,
+    1,
+    1,
+    9,
+    # Numerators from kelvin to each unit
+    0,
+    1,
+    1,
+    9,
+    # Numerators from fahrenheit to each unit
+    0,
+    5,
+    5,
+    1,
+)
+CONVERSION_DENOMINATORS: Final = (
+    # Row 0 does not correspond to a unit
+    1,
+    1,
+    1,
+    1,
+    # Denominators from celsius to each unit
+    1,
+    1,
+    1,
+    5,
+    # Denominators from kelvin to each unit
+    1,
+    1,
+    1,
+    5,
+    # Denominators from fahrenheit to each unit
+    1,
+    9,
+    9,
+    1,
+)
+CONVERSION_OFFSETS: Final = (
+    # Row 0 does not correspond to a unit
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    # Offsets from celsius to each unit
+    _NAN,
+    0.0,
+    273.15,
+    160.0,
+    # Offsets from kelvin to each unit
+    _NAN,
+    -273.15,
+    0.0,
+    -2298.35,
+    # Offsets from fahrenheit to each unit
+    _NAN,
+    -160.0,
+    2298.35,
+    0.0,
+)
+
+
+def _check_unit(unit: Unit) -> None:
+    """Check that the unit is a temperature unit.
 
     Not intended for public use.
-    """
-
-    def __init__(
-        self,
-        unit_delta_per_degree_kelvin: float,
-        absolute_zero_offset: float,
-    ) -> None:
-        """Initialise a new pair of conversion parameters."""
-        self._unit_delta_per_degree_kelvin = unit_delta_per_degree_kelvin
-        self._absolute_zero_offset = absolute_zero_offset
-
-    @property
-    def unit_delta_per_degree_kelvin(self) -> float:
-        """The change in temperature expressed as the unit per 1 degree K.
-
-        Equivalent to the gradient of the kelvin-vs-unit graph.
-        """
-        return self._unit_delta_per_degree_kelvin
-
-    @property
-    def absolute_zero_offset(self) -> float:
-        """The temperature expressed as the unit at absolute zero.
-
-        Equivalent to the y-intercept of the kelvin-vs-unit graph.
-        """
-        return self._absolute_zero_offset
-
 
-class _UnitInfo:
-    """Information associated with a particular unit.
-
-    Not intended for public use.
+    Raises:
+        ValueError: The unit is not a temperature unit.
     """
-
-    def __init__(
-        self,
-        unit: Unit,
-        name: str,
-        abbreviation: str,
-        conversion_parameters: _UnitConversionParameters,
-    ) -> None:
-        """Initialise a collection of info associated with a unit."""
-        self._unit = unit
-        self._name = name
-        self._abbreviation = abbreviation
-        self._conversion_parameters = conversion_parameters
-
-    @property
-    def unit(self) -> Unit:
-        """The unit the information relates to."""
-        return self._unit
-
-    @property
-    def name(self) -> str:
-        """The name of the unit."""
-        return self._name
-
-    @property
-    def abbreviation(self) -> str:
-        """The abbreviation of the unit."""
-        return self._abbreviation
-
-    @property
-    def conversion_parameters(self) -> _UnitConversionParameters:
-        """The conversion parameters associated with the unit."""
-        return self._conversion_parameters
-
-
-# All info is entered here to create a SSoT
-_UNITS_INFO: Final = [
-    _UnitInfo(
-        unit=Unit.KELVIN,
-        name="kelvin",
-        abbreviation="K",
-        conversion_parameters=_UnitConversionParameters(1, 0),
-    ),
-    _UnitInfo(
-        unit=Unit.CELSIUS,
-        name="celsius",
-        abbreviation="C",
-        conversion_parameters=_UnitConversionParameters(1, -273.15),
-    ),
-    _UnitInfo(
-        unit=Unit.FAHRENHEIT,
-        name="fahrenheit",
-        abbreviation="F",
-        conversion_parameters=_UnitConversionParameters(9 / 5, -459.67),
-    ),
-]
-
-# Convert into dictionary for quick lookup
-_UNIT_TO_INFO_MAP: Final = {info.unit: info for info in _UNITS_INFO}
+    if not 0 < unit < CONVERSION_PARAMETERS_STRIDE:
+        raise ValueError
 
 
 def get_name(unit: Unit) -> str:
@@ -128,10 +141,8 @@ def get_name(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].name
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _NAMES[unit]
 
 
 def get_abbreviation(unit: Unit) -> str:
@@ -139,20 +150,5 @@ def get_abbreviation(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].abbreviation
-    except KeyError as e:
-        raise ValueError from e
-
-
-def get_kelvin_to_unit_conversion_parameters(
-    unit: Unit,
-) -> _UnitConversionParameters:
-    """Get the parameters to convert a value from kelvin to the temperature unit.
-
-    Not intended for public use.
-    """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].conversion_parameters
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _ABBREVIATIONS[unit]
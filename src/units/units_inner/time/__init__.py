@@ -1,20 +1,41 @@
 """Package for time-related classes and constants."""
 
 from .constants import ZERO
+from .converter import convert_into, make_converter
 from .exceptions import NegativeTimeValueError
+from .fixed_point_time import FixedPointTime
+from .fixed_point_time_delta import FixedPointTimeDelta
+from .isr import TimeCell, TimeThreshold
 from .time import Time
+from .time_array import TimeArray
 from .time_delta import TimeDelta
-from .unit import Unit, get_unit_delta_per_second
+from .time_delta_array import TimeDeltaArray
+from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    Unit,
+    get_unit_delta_per_second,
+)
 from .unit import get_abbreviation as get_unit_abbreviation
 from .unit import get_name as get_unit_name
 
 __all__ = [
+    "CONVERSION_FACTORS",
+    "CONVERSION_FACTORS_STRIDE",
     "ZERO",
+    "FixedPointTime",
+    "FixedPointTimeDelta",
     "NegativeTimeValueError",
     "Time",
+    "TimeArray",
+    "TimeCell",
     "TimeDelta",
+    "TimeDeltaArray",
+    "TimeThreshold",
     "Unit",
+    "convert_into",
     "get_unit_abbreviation",
     "get_unit_delta_per_second",
     "get_unit_name",
+    "make_converter",
 ]
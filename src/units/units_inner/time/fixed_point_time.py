@@ -0,0 +1,154 @@
+"""Module for the fixed-point time class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+from typing import overload
+
+from ..fixed_point import check_count, from_count, to_count
+from .exceptions import NegativeTimeValueError
+from .fixed_point_time_delta import FixedPointTimeDelta
+from .time import Time
+from .unit import FIXED_POINT_RESOLUTION_PER_SECOND, Unit, get_fixed_point_ratio
+
+
+class FixedPointTime:
+    """A time, in fixed-point.
+
+    The time is held as an integer number of milliseconds. Intended for ports without
+    hardware floating point, or where floats are allocated on the heap. Only creating
+    the time & expressing it in a unit involve a conversion, which is done with an
+    integer ratio; arithmetic & comparisons stay in ints.
+
+    The count is kept within the range of a small int on 32-bit ports (see
+    `MAXIMUM_COUNT`), so up to about 12.4 days can be held, and creating a time or
+    doing arithmetic beyond it raises `OverflowError`.
+    """
+
+    __slots__ = ("_value_as_millisecond",)
+
+    def __init__(self, value: int, unit: Unit) -> None:
+        """Initialise a new fixed-point time from an integer value.
+
+        The value is in the unit, and is rounded to the nearest millisecond.
+
+        Raises:
+            NegativeTimeValueError: The negative value produced a time less than 0s.
+            OverflowError: The value is too large to be held as a count of milliseconds.
+        """
+        if value < 0:
+            raise NegativeTimeValueError(value=value)
+
+        numerator, denominator = get_fixed_point_ratio(unit)
+        self._value_as_millisecond = to_count(value, numerator, denominator)
+
+    @classmethod
+    def _from_value_as_millisecond(cls, value_as_millisecond: int) -> "FixedPointTime":
+        """Create a fixed-point time from a number of milliseconds.
+
+        Raises:
+            NegativeTimeValueError: The number of milliseconds was negative.
+            OverflowError: The number of milliseconds was out of range.
+        """
+        if value_as_millisecond < 0:
+            raise NegativeTimeValueError(value=value_as_millisecond)
+
+        time: FixedPointTime = cls.__new__(cls)
+        time._value_as_millisecond = check_count(value_as_millisecond)
+        return time
+
+    def as_unit(self, unit: Unit) -> int:
+        """Return the time in the unit, rounded to the nearest integer."""
+        numerator, denominator = get_fixed_point_ratio(unit)
+        return from_count(self._value_as_millisecond, numerator, denominator)
+
+    def to_time(self) -> Time:
+        """Return the time as a floating-point :py:class:`Time`."""
+        return Time(
+            self._value_as_millisecond / FIXED_POINT_RESOLUTION_PER_SECOND, Unit.SECOND
+        )
+
+    def __add__(self, delta: FixedPointTimeDelta) -> "FixedPointTime":
+        """Return the sum of the time and the difference.
+
+        Raises:
+            NegativeTimeValueError: The sum of the time and the difference was less
+                than 0s.
+        """
+        return FixedPointTime._from_value_as_millisecond(
+            self._value_as_millisecond + delta._value_as_millisecond
+        )
+
+    def __radd__(self, delta: FixedPointTimeDelta) -> "FixedPointTime":
+        """Return the sum of the time and the difference."""
+        return self + delta
+
+    @overload
+    def __sub__(self, other: "FixedPointTime") -> FixedPointTimeDelta: ...
+
+    @overload
+    def __sub__(self, other: FixedPointTimeDelta) -> "FixedPointTime": ...
+
+    def __sub__(
+        self, other: "FixedPointTime | FixedPointTimeDelta"
+    ) -> "FixedPointTimeDelta | FixedPointTime":
+        """Return the delta between times or the time less the delta.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a :py:class:`FixedPointTime`, return the difference
+          between the two times.
+        - If the argument is a :py:class:`FixedPointTimeDelta`, return the time
+          less the difference.
+
+        Raises:
+            NegativeTimeValueError: The time minus the difference was less
+                than 0s. Error can only be raised when other is a
+                :py:class:`FixedPointTimeDelta`.
+        """
+        value_difference_as_millisecond = (
+            self._value_as_millisecond - other._value_as_millisecond
+        )
+        return (
+            FixedPointTimeDelta._from_value_as_millisecond(
+                value_difference_as_millisecond
+            )
+            if isinstance(other, FixedPointTime)
+            else FixedPointTime._from_value_as_millisecond(
+                value_difference_as_millisecond
+            )
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the objects are equal fixed-point times."""
+        if not isinstance(other, FixedPointTime):
+            return NotImplemented
+
+        return self._value_as_millisecond == other._value_as_millisecond
+
+    def __lt__(self, other: "FixedPointTime") -> bool:
+        """Return whether the time is less than the other."""
+        return self._value_as_millisecond < other._value_as_millisecond
+
+    def __le__(self, other: "FixedPointTime") -> bool:
+        """Return whether the time is less than or equal to the other."""
+        return self._value_as_millisecond <= other._value_as_millisecond
+
+    def __gt__(self, other: "FixedPointTime") -> bool:
+        """Return whether the time is greater than the other."""
+        return self._value_as_millisecond > other._value_as_millisecond
+
+    def __ge__(self, other: "FixedPointTime") -> bool:
+        """Return whether the time is greater than or equal to the other."""
+        return self._value_as_millisecond >= other._value_as_millisecond
+
+    def __hash__(self) -> int:
+        """Return the hash of the time."""
+        return hash(self._value_as_millisecond)
+
+    def __str__(self) -> str:
+        """Return a string representation of the time."""
+        return f"{self._value_as_millisecond} ms"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the time for developers."""
+        return f"{__class__.__name__}({self._value_as_millisecond} ms)"
@@ -0,0 +1,159 @@
+"""Module for the fixed-point time delta class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+from typing import overload
+
+from ..fixed_point import check_count, from_count, to_count
+from .time_delta import TimeDelta
+from .unit import FIXED_POINT_RESOLUTION_PER_SECOND, Unit, get_fixed_point_ratio
+
+
+class FixedPointTimeDelta:
+    """The difference between two times, in fixed-point.
+
+    The time delta is held as an integer number of milliseconds. Intended for ports
+    without hardware floating point, or where floats are allocated on the heap. Only
+    creating the time delta & expressing it in a unit involve a conversion, which is
+    done with an integer ratio; arithmetic & comparisons stay in ints.
+
+    The count is kept within the range of a small int on 32-bit ports (see
+    `MAXIMUM_COUNT`), so up to about 12.4 days can be held, and creating a time
+    delta or doing arithmetic beyond it raises `OverflowError`.
+    """
+
+    __slots__ = ("_value_as_millisecond",)
+
+    def __init__(self, value: int, unit: Unit) -> None:
+        """Initialise a new fixed-point time delta from an integer value.
+
+        The value is in the unit, and is rounded to the nearest millisecond.
+
+        Raises:
+            OverflowError: The value is too large to be held as a count of milliseconds.
+        """
+        numerator, denominator = get_fixed_point_ratio(unit)
+        self._value_as_millisecond = to_count(value, numerator, denominator)
+
+    @classmethod
+    def _from_value_as_millisecond(
+        cls, value_as_millisecond: int
+    ) -> "FixedPointTimeDelta":
+        """Create a fixed-point time delta from a number of milliseconds.
+
+        Raises:
+            OverflowError: The number of milliseconds was out of range.
+        """
+        delta: FixedPointTimeDelta = cls.__new__(cls)
+        delta._value_as_millisecond = check_count(value_as_millisecond)
+        return delta
+
+    def as_unit(self, unit: Unit) -> int:
+        """Return the time delta in the unit, rounded to the nearest integer."""
+        numerator, denominator = get_fixed_point_ratio(unit)
+        return from_count(self._value_as_millisecond, numerator, denominator)
+
+    def to_time_delta(self) -> TimeDelta:
+        """Return the time delta as a floating-point :py:class:`TimeDelta`."""
+        return TimeDelta(
+            self._value_as_millisecond / FIXED_POINT_RESOLUTION_PER_SECOND, Unit.SECOND
+        )
+
+    def __mul__(self, value: int) -> "FixedPointTimeDelta":
+        """Return the time delta scaled by the integer."""
+        return FixedPointTimeDelta._from_value_as_millisecond(
+            self._value_as_millisecond * value
+        )
+
+    def __rmul__(self, value: int) -> "FixedPointTimeDelta":
+        """Return the time delta scaled by the integer."""
+        return self * value
+
+    @overload
+    def __floordiv__(self, other: int) -> "FixedPointTimeDelta": ...
+
+    @overload
+    def __floordiv__(self, other: "FixedPointTimeDelta") -> int: ...
+
+    def __floordiv__(
+        self, other: "int | FixedPointTimeDelta"
+    ) -> "FixedPointTimeDelta | int":
+        """Return a floored scaled time delta or the floored ratio between them.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is an :py:class:`int`, return the time delta scaled by the
+          inverse of the value, floored to the nearest millisecond.
+        - If the argument is a :py:class:`FixedPointTimeDelta`, return the floored ratio
+          between the two.
+        """
+        if isinstance(other, FixedPointTimeDelta):
+            return self._value_as_millisecond // other._value_as_millisecond
+
+        return FixedPointTimeDelta._from_value_as_millisecond(
+            self._value_as_millisecond // other
+        )
+
+    def __add__(self, other: "FixedPointTimeDelta") -> "FixedPointTimeDelta":
+        """Return the sum of the time deltas."""
+        # Adding to a fixed-point time is handled by the __radd__ method of the
+        # fixed-point time class
+        if not isinstance(other, FixedPointTimeDelta):  # type: ignore[reportUnnecessaryIsInstance]
+            return NotImplemented
+
+        return FixedPointTimeDelta._from_value_as_millisecond(
+            self._value_as_millisecond + other._value_as_millisecond
+        )
+
+    def __sub__(self, other: "FixedPointTimeDelta") -> "FixedPointTimeDelta":
+        """Return the difference between the time deltas."""
+        return FixedPointTimeDelta._from_value_as_millisecond(
+            self._value_as_millisecond - other._value_as_millisecond
+        )
+
+    def __neg__(self) -> "FixedPointTimeDelta":
+        """Return the inverse of the time delta."""
+        return FixedPointTimeDelta._from_value_as_millisecond(
+            -self._value_as_millisecond
+        )
+
+    def __abs__(self) -> "FixedPointTimeDelta":
+        """Return the absolute version of the time delta."""
+        return FixedPointTimeDelta._from_value_as_millisecond(
+            abs(self._value_as_millisecond)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the objects are equal fixed-point time deltas."""
+        if not isinstance(other, FixedPointTimeDelta):
+            return NotImplemented
+
+        return self._value_as_millisecond == other._value_as_millisecond
+
+    def __lt__(self, other: "FixedPointTimeDelta") -> bool:
+        """Return whether the time delta is less than the other."""
+        return self._value_as_millisecond < other._value_as_millisecond
+
+    def __le__(self, other: "FixedPointTimeDelta") -> bool:
+        """Return whether the time delta is less than or equal to the other."""
+        return self._value_as_millisecond <= other._value_as_millisecond
+
+    def __gt__(self, other: "FixedPointTimeDelta") -> bool:
+        """Return whether the time delta is greater than the other."""
+        return self._value_as_millisecond > other._value_as_millisecond
+
+    def __ge__(self, other: "FixedPointTimeDelta") -> bool:
+        """Return whether the time delta is greater than or equal to the other."""
+        return self._value_as_millisecond >= other._value_as_millisecond
+
+    def __hash__(self) -> int:
+        """Return the hash of the time delta."""
+        return hash(self._value_as_millisecond)
+
+    def __str__(self) -> str:
+        """Return a string representation of the time delta."""
+        return f"{self._value_as_millisecond} ms"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the time delta for developers."""
+        return f"{__class__.__name__}({self._value_as_millisecond} ms)"
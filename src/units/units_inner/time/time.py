@@ -1,10 +1,15 @@
 """Module for the time class."""
 
+# pyright: reportPrivateUsage=false
+
 from typing import overload
 
 from .exceptions import NegativeTimeValueError
 from .time_delta import TimeDelta
 from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    UNIT_DELTAS_PER_SECOND,
     Unit,
     get_abbreviation,
     get_name,
@@ -15,6 +20,8 @@ from .unit import (
 class Time:
     """The measure in which events can be ordered from the past into the future."""
 
+    __slots__ = ("_unit", "_value", "_value_as_second")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new time.
 
@@ -26,13 +33,43 @@ class Time:
 
         self._value = value
         self._unit = unit
+        internal_unit_delta_per_second = get_unit_delta_per_second(self._unit)
+        self._value_as_second = self._value / internal_unit_delta_per_second
+
+    @classmethod
+    def _create(cls, value: float, unit: Unit, value_as_second: float) -> "Time":
+        """Create a time from its value in both the unit & seconds.
+
+        Not intended for public use.
+
+        The value is not converted again, and the only validation is a single
+        comparison of the value in seconds.
+
+        Raises:
+            NegativeTimeValueError: The value produced a time less than 0s.
+        """
+        if value_as_second < 0:
+            raise NegativeTimeValueError(value=value)
+
+        time: Time = cls.__new__(cls)
+        time._value = value
+        time._unit = unit
+        time._value_as_second = value_as_second
+        return time
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the time, expressed as the unit."""
-        internal_unit_delta_per_second = get_unit_delta_per_second(self._unit)
-        value_as_second = self._value / internal_unit_delta_per_second
-        external_unit_delta_per_second = get_unit_delta_per_second(unit)
-        return external_unit_delta_per_second * value_as_second
+        """Return the time, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not a time unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __add__(self, delta: TimeDelta) -> "Time":
         """Return the sum of the time and the difference.
@@ -41,10 +78,16 @@ class Time:
             NegativeTimeValueError: The sum of the time and the difference was less than
                 0s.
         """
-        value_as_second = self.as_unit(Unit.SECOND)
-        delta_value_as_second = delta.as_unit(Unit.SECOND)
-        value_sum_as_second = value_as_second + delta_value_as_second
-        return Time(value_sum_as_second, Unit.SECOND)
+        if self._unit == delta._unit:
+            value_sum = self._value + delta._value
+            return Time._create(
+                value_sum,
+                self._unit,
+                value_sum / UNIT_DELTAS_PER_SECOND[self._unit],
+            )
+
+        value_sum_as_second = self._value_as_second + delta._value_as_second
+        return Time._create(value_sum_as_second, Unit.SECOND, value_sum_as_second)
 
     def __radd__(self, delta: TimeDelta) -> "Time":
         """Return the sum of the time and the difference."""
@@ -70,13 +113,30 @@ class Time:
             NegativeTimeValueError: The time minus the difference was less
                 than 0s. Error can only be raised when other is a :py:class:`TimeDelta`.
         """
-        value_as_second = self.as_unit(Unit.SECOND)
-        other_value_as_second = other.as_unit(Unit.SECOND)
-        value_difference_as_second = value_as_second - other_value_as_second
+        if self._unit == other._unit:
+            value_difference = self._value - other._value
+            value_difference_as_second = (
+                value_difference / UNIT_DELTAS_PER_SECOND[self._unit]
+            )
+            return (
+                TimeDelta._create(
+                    value_difference, self._unit, value_difference_as_second
+                )
+                if isinstance(other, Time)
+                else Time._create(
+                    value_difference, self._unit, value_difference_as_second
+                )
+            )
+
+        value_difference_as_second = self._value_as_second - other._value_as_second
         return (
-            TimeDelta(value_difference_as_second, Unit.SECOND)
+            TimeDelta._create(
+                value_difference_as_second, Unit.SECOND, value_difference_as_second
+            )
             if isinstance(other, Time)
-            else Time(value_difference_as_second, Unit.SECOND)
+            else Time._create(
+                value_difference_as_second, Unit.SECOND, value_difference_as_second
+            )
         )
 
     def __eq__(self, other: object) -> bool:
@@ -84,27 +144,27 @@ class Time:
         if not isinstance(other, Time):
             return NotImplemented
 
-        return self.as_unit(Unit.SECOND) == other.as_unit(Unit.SECOND)
+        return self._value_as_second == other._value_as_second
 
     def __lt__(self, other: "Time") -> bool:
         """Return whether the time is less than the other."""
-        return self.as_unit(Unit.SECOND) < other.as_unit(Unit.SECOND)
+        return self._value_as_second < other._value_as_second
 
     def __le__(self, other: "Time") -> bool:
         """Return whether the time is less than or equal to the other."""
-        return self.as_unit(Unit.SECOND) <= other.as_unit(Unit.SECOND)
+        return self._value_as_second <= other._value_as_second
 
     def __gt__(self, other: "Time") -> bool:
         """Return whether the time is greater than the other."""
-        return self.as_unit(Unit.SECOND) > other.as_unit(Unit.SECOND)
+        return self._value_as_second > other._value_as_second
 
     def __ge__(self, other: "Time") -> bool:
         """Return whether the time is greater than or equal to the other."""
-        return self.as_unit(Unit.SECOND) >= other.as_unit(Unit.SECOND)
+        return self._value_as_second >= other._value_as_second
 
     def __hash__(self) -> int:
         """Return the hash of the time."""
-        return hash(self.as_unit(Unit.SECOND))
+        return hash(self._value_as_second)
 
     def __str__(self) -> str:
         """Return a string representation of the time."""
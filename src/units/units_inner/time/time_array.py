@@ -0,0 +1,230 @@
+"""Module for the time array class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    create_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .exceptions import NegativeTimeValueError
+from .time import Time
+from .time_delta import TimeDelta
+from .time_delta_array import TimeDeltaArray
+from .unit import Unit, get_name, get_unit_delta_per_second
+
+if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Iterable, Iterator
+
+
+def _check_non_negative(
+    values_as_second: "array[float] | memoryview", unit: Unit
+) -> None:
+    """Check that none of the times are less than 0s.
+
+    Raises:
+        NegativeTimeValueError: One of the times was less than 0s.
+    """
+    if not values_as_second:
+        return
+
+    minimum_value_as_second = min(values_as_second)
+    if minimum_value_as_second < 0:
+        internal_unit_delta_per_second = get_unit_delta_per_second(unit)
+        raise NegativeTimeValueError(
+            value=minimum_value_as_second * internal_unit_delta_per_second
+        )
+
+
+class TimeArray:
+    """A homogeneous array of times.
+
+    The times are stored in bulk as seconds, and share a single unit that they are
+    expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_second")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of times, with all values in the unit.
+
+        Raises:
+            NegativeTimeValueError: One of the values produced a time less than
+                0s.
+        """
+        internal_unit_delta_per_second = get_unit_delta_per_second(unit)
+        values_as_second = create_values(values, 1 / internal_unit_delta_per_second)
+        _check_non_negative(values_as_second, unit)
+
+        self._unit = unit
+        self._values_as_second: array[float] | memoryview = values_as_second
+
+    @classmethod
+    def _from_values_as_second(
+        cls, values_as_second: "array[float] | memoryview", unit: Unit
+    ) -> "TimeArray":
+        """Create an array of times directly from a buffer of seconds.
+
+        The buffer is used as-is, rather than copied, and is assumed to be valid.
+        """
+        times: TimeArray = cls.__new__(cls)
+        times._unit = unit
+        times._values_as_second = values_as_second
+        return times
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the times, expressed as the unit."""
+        external_unit_delta_per_second = get_unit_delta_per_second(unit)
+        return create_values(self._values_as_second, external_unit_delta_per_second)
+
+    def __len__(self) -> int:
+        """Return the number of times."""
+        return len(self._values_as_second)
+
+    @overload
+    def __getitem__(self, index: int) -> Time: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "TimeArray": ...
+
+    def __getitem__(self, index: "int | slice") -> "Time | TimeArray":
+        """Return the time at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return TimeArray._from_values_as_second(
+                memoryview(self._values_as_second)[index], self._unit
+            )
+
+        internal_unit_delta_per_second = get_unit_delta_per_second(self._unit)
+        return Time(
+            self._values_as_second[index] * internal_unit_delta_per_second, self._unit
+        )
+
+    def __iter__(self) -> "Iterator[Time]":
+        """Return an iterator over the times."""
+        internal_unit_delta_per_second = get_unit_delta_per_second(self._unit)
+        for value_as_second in self._values_as_second:
+            yield Time(value_as_second * internal_unit_delta_per_second, self._unit)
+
+    def __add__(self, delta: "TimeDelta | TimeDeltaArray") -> "TimeArray":
+        """Return the sum of the times and the difference(s).
+
+        A single time delta is added to every time, while an array of time
+        deltas is added elementwise.
+
+        Raises:
+            NegativeTimeValueError: One of the sums was less than 0s.
+            ValueError: The arrays are of different lengths.
+        """
+        delta_values_as_second = (
+            delta.as_unit(Unit.SECOND)
+            if isinstance(delta, TimeDelta)
+            else delta._values_as_second
+        )
+        value_sums_as_second = add_values(
+            self._values_as_second, delta_values_as_second
+        )
+        _check_non_negative(value_sums_as_second, self._unit)
+        return TimeArray._from_values_as_second(value_sums_as_second, self._unit)
+
+    def __radd__(self, delta: TimeDelta) -> "TimeArray":
+        """Return the sum of the times and the difference.
+
+        Raises:
+            NegativeTimeValueError: One of the sums was less than 0s.
+        """
+        return self + delta
+
+    @overload
+    def __sub__(self, other: "Time | TimeArray") -> TimeDeltaArray: ...
+
+    @overload
+    def __sub__(self, other: "TimeDelta | TimeDeltaArray") -> "TimeArray": ...
+
+    def __sub__(
+        self, other: "Time | TimeArray | TimeDelta | TimeDeltaArray"
+    ) -> "TimeDeltaArray | TimeArray":
+        """Return the difference between the times and the other(s).
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a time or an array of times, return the differences
+          between the times.
+        - If the argument is a time delta or an array of time deltas, return the
+          times less the differences.
+
+        A single argument is subtracted from every time, while an array is
+        subtracted elementwise.
+
+        Raises:
+            NegativeTimeValueError: One of the differences was less than 0s. Error
+                can only be raised when other is a :py:class:`TimeDelta` or
+                :py:class:`TimeDeltaArray`.
+            ValueError: The arrays are of different lengths.
+        """
+        other_values_as_second = (
+            other.as_unit(Unit.SECOND)
+            if isinstance(other, (Time, TimeDelta))
+            else other._values_as_second
+        )
+        value_differences_as_second = subtract_values(
+            self._values_as_second, other_values_as_second
+        )
+        if isinstance(other, (Time, TimeArray)):
+            return TimeDeltaArray._from_values_as_second(
+                value_differences_as_second, self._unit
+            )
+
+        _check_non_negative(value_differences_as_second, self._unit)
+        return TimeArray._from_values_as_second(value_differences_as_second, self._unit)
+
+    def __lt__(self, other: "Time | TimeArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the times less than the other time(s)."""
+        other_values_as_second = (
+            other.as_unit(Unit.SECOND)
+            if isinstance(other, Time)
+            else other._values_as_second
+        )
+        return less_than(self._values_as_second, other_values_as_second)
+
+    def __le__(self, other: "Time | TimeArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the times less than or equal to the other time(s)."""
+        other_values_as_second = (
+            other.as_unit(Unit.SECOND)
+            if isinstance(other, Time)
+            else other._values_as_second
+        )
+        return less_than_or_equal_to(self._values_as_second, other_values_as_second)
+
+    def __gt__(self, other: "Time | TimeArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the times greater than the other time(s)."""
+        other_values_as_second = (
+            other.as_unit(Unit.SECOND)
+            if isinstance(other, Time)
+            else other._values_as_second
+        )
+        return greater_than(self._values_as_second, other_values_as_second)
+
+    def __ge__(self, other: "Time | TimeArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the times greater than or equal to the other time(s)."""
+        other_values_as_second = (
+            other.as_unit(Unit.SECOND)
+            if isinstance(other, Time)
+            else other._values_as_second
+        )
+        return greater_than_or_equal_to(self._values_as_second, other_values_as_second)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the times."""
+        values = list(self.as_unit(self._unit))
+        return f"TimeArray({values}, {get_name(self._unit)})"
@@ -3,6 +3,9 @@
 from typing import overload
 
 from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    UNIT_DELTAS_PER_SECOND,
     Unit,
     get_abbreviation,
     get_name,
@@ -13,22 +16,54 @@ from .unit import (
 class TimeDelta:
     """The difference between two times."""
 
+    __slots__ = ("_unit", "_value", "_value_as_second")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new time difference."""
         self._value = value
         self._unit = unit
+        internal_unit_delta_per_second = get_unit_delta_per_second(self._unit)
+        self._value_as_second = self._value / internal_unit_delta_per_second
+
+    @classmethod
+    def _create(cls, value: float, unit: Unit, value_as_second: float) -> "TimeDelta":
+        """Create a time difference from its value in both the unit & seconds.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        time_delta: TimeDelta = cls.__new__(cls)
+        time_delta._value = value
+        time_delta._unit = unit
+        time_delta._value_as_second = value_as_second
+        return time_delta
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the time difference, expressed as the unit."""
-        internal_unit_delta_per_second = get_unit_delta_per_second(self._unit)
-        value_as_second = self._value / internal_unit_delta_per_second
-        external_unit_delta_per_second = get_unit_delta_per_second(unit)
-        return external_unit_delta_per_second * value_as_second
+        """Return the time difference, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not a time unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __mul__(self, value: float) -> "TimeDelta":
         """Return a time difference scaled by the value."""
+        # The product of a rate & a time difference is handled in the __rmul__
+        # method of the rate, otherwise it runs into problems with circular imports
+        if not isinstance(value, (int, float)):  # type: ignore[reportUnnecessaryIsInstance]
+            return NotImplemented
+
         scaled_value = self._value * value
-        return TimeDelta(scaled_value, self._unit)
+        return TimeDelta._create(
+            scaled_value, self._unit, self._value_as_second * value
+        )
 
     def __rmul__(self, value: float) -> "TimeDelta":
         """Return a time difference scaled by the value."""
@@ -51,12 +86,15 @@ class TimeDelta:
           differences
         """
         if isinstance(other, TimeDelta):
-            value_as_second = self.as_unit(Unit.SECOND)
-            other_value_as_second = other.as_unit(Unit.SECOND)
-            return value_as_second / other_value_as_second
+            return self._value_as_second / other._value_as_second
+
+        if not isinstance(other, (int, float)):  # type: ignore[reportUnnecessaryIsInstance]
+            return NotImplemented
 
         scaled_value = self._value / other
-        return TimeDelta(scaled_value, self._unit)
+        return TimeDelta._create(
+            scaled_value, self._unit, self._value_as_second / other
+        )
 
     def __add__(self, other: "TimeDelta") -> "TimeDelta":
         """Return the sum of the time differences."""
@@ -66,10 +104,18 @@ class TimeDelta:
         if not isinstance(other, TimeDelta):  # type: ignore[reportUnnecessaryIsInstance]
             return NotImplemented
 
-        value_as_second = self.as_unit(Unit.SECOND)
-        delta_value_as_second = other.as_unit(Unit.SECOND)
-        added_value_as_second = value_as_second + delta_value_as_second
-        return TimeDelta(added_value_as_second, Unit.SECOND)
+        if self._unit == other._unit:
+            value_sum = self._value + other._value
+            return TimeDelta._create(
+                value_sum,
+                self._unit,
+                value_sum / UNIT_DELTAS_PER_SECOND[self._unit],
+            )
+
+        added_value_as_second = self._value_as_second + other._value_as_second
+        return TimeDelta._create(
+            added_value_as_second, Unit.SECOND, added_value_as_second
+        )
 
     def __sub__(self, delta: "TimeDelta") -> "TimeDelta":
         """Return the difference between the time differences."""
@@ -78,57 +124,51 @@ class TimeDelta:
     def __neg__(self) -> "TimeDelta":
         """Return the inverse of the time difference."""
         inverted_value = -self._value
-        return TimeDelta(inverted_value, self._unit)
+        return TimeDelta._create(inverted_value, self._unit, -self._value_as_second)
 
     def __abs__(self) -> "TimeDelta":
         """Return the absolute version of the time difference."""
         absolute_value = abs(self._value)
-        return TimeDelta(absolute_value, self._unit)
+        return TimeDelta._create(absolute_value, self._unit, abs(self._value_as_second))
 
     def __floordiv__(self, other: "TimeDelta") -> float:
         """Return the floored ratio between the time differences."""
-        value_as_second = self.as_unit(Unit.SECOND)
-        other_value_as_second = other.as_unit(Unit.SECOND)
-        return value_as_second // other_value_as_second
+        return self._value_as_second // other._value_as_second
 
     def __mod__(self, other: "TimeDelta") -> float:
         """Return the remainder of the ratio between the time differences."""
-        value_as_second = self.as_unit(Unit.SECOND)
-        other_value_as_second = other.as_unit(Unit.SECOND)
-        return value_as_second % other_value_as_second
+        return self._value_as_second % other._value_as_second
 
     def __divmod__(self, other: "TimeDelta") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the time deltas."""
-        value_as_second = self.as_unit(Unit.SECOND)
-        other_value_as_second = other.as_unit(Unit.SECOND)
-        return divmod(value_as_second, other_value_as_second)
+        return divmod(self._value_as_second, other._value_as_second)
 
     def __eq__(self, other: object) -> bool:
         """Return whether the objects are equal time differences."""
         if not isinstance(other, TimeDelta):
             return NotImplemented
 
-        return self.as_unit(Unit.SECOND) == other.as_unit(Unit.SECOND)
+        return self._value_as_second == other._value_as_second
 
     def __lt__(self, other: "TimeDelta") -> bool:
         """Return whether the time difference is less than the other."""
-        return self.as_unit(Unit.SECOND) < other.as_unit(Unit.SECOND)
+        return self._value_as_second < other._value_as_second
 
     def __le__(self, other: "TimeDelta") -> bool:
         """Return whether the time delta is less than or equal to the other."""
-        return self.as_unit(Unit.SECOND) <= other.as_unit(Unit.SECOND)
+        return self._value_as_second <= other._value_as_second
 
     def __gt__(self, other: "TimeDelta") -> bool:
         """Return whether the time difference is greater than the other."""
-        return self.as_unit(Unit.SECOND) > other.as_unit(Unit.SECOND)
+        return self._value_as_second > other._value_as_second
 
     def __ge__(self, other: "TimeDelta") -> bool:
         """Return whether the time delta is greater than or equal to the other."""
-        return self.as_unit(Unit.SECOND) >= other.as_unit(Unit.SECOND)
+        return self._value_as_second >= other._value_as_second
 
     def __hash__(self) -> int:
         """Return the hash of the time difference."""
-        return hash(self.as_unit(Unit.SECOND))
+        return hash(self._value_as_second)
 
     def __str__(self) -> str:
         """Return a string representation of the time difference."""
@@ -0,0 +1,205 @@
+"""Module for the time delta array class."""
+
+# ruff: noqa: TID252
+
+from array import array
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    create_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .time_delta import TimeDelta
+from .unit import Unit, get_name, get_unit_delta_per_second
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class TimeDeltaArray:
+    """A homogeneous array of time deltas.
+
+    The deltas are stored in bulk as seconds, and share a single unit that they are
+    expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_second")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of time deltas, with all values in the unit."""
+        internal_unit_delta_per_second = get_unit_delta_per_second(unit)
+        self._unit = unit
+        self._values_as_second: array[float] | memoryview = create_values(
+            values, 1 / internal_unit_delta_per_second
+        )
+
+    @classmethod
+    def _from_values_as_second(
+        cls, values_as_second: "array[float] | memoryview", unit: Unit
+    ) -> "TimeDeltaArray":
+        """Create an array of time deltas directly from a buffer of seconds.
+
+        The buffer is used as-is, rather than copied.
+        """
+        deltas: TimeDeltaArray = cls.__new__(cls)
+        deltas._unit = unit
+        deltas._values_as_second = values_as_second
+        return deltas
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the time deltas, expressed as the unit."""
+        external_unit_delta_per_second = get_unit_delta_per_second(unit)
+        return create_values(self._values_as_second, external_unit_delta_per_second)
+
+    def __len__(self) -> int:
+        """Return the number of time deltas."""
+        return len(self._values_as_second)
+
+    @overload
+    def __getitem__(self, index: int) -> TimeDelta: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "TimeDeltaArray": ...
+
+    def __getitem__(self, index: "int | slice") -> "TimeDelta | TimeDeltaArray":
+        """Return the time delta at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return TimeDeltaArray._from_values_as_second(
+                memoryview(self._values_as_second)[index], self._unit
+            )
+
+        internal_unit_delta_per_second = get_unit_delta_per_second(self._unit)
+        return TimeDelta(
+            self._values_as_second[index] * internal_unit_delta_per_second, self._unit
+        )
+
+    def __iter__(self) -> "Iterator[TimeDelta]":
+        """Return an iterator over the time deltas."""
+        internal_unit_delta_per_second = get_unit_delta_per_second(self._unit)
+        for value_as_second in self._values_as_second:
+            yield TimeDelta(
+                value_as_second * internal_unit_delta_per_second, self._unit
+            )
+
+    def __mul__(self, value: float) -> "TimeDeltaArray":
+        """Return the time deltas scaled by the value."""
+        return TimeDeltaArray._from_values_as_second(
+            create_values(self._values_as_second, value), self._unit
+        )
+
+    def __rmul__(self, value: float) -> "TimeDeltaArray":
+        """Return the time deltas scaled by the value."""
+        return self * value
+
+    def __truediv__(self, value: float) -> "TimeDeltaArray":
+        """Return the time deltas scaled by the inverse of the value."""
+        return self * (1 / value)
+
+    def __add__(self, other: "TimeDelta | TimeDeltaArray") -> "TimeDeltaArray":
+        """Return the sum of the time deltas and the other delta(s).
+
+        A single time delta is added to every element, while an array of time
+        deltas is added elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, TimeDelta):
+            return TimeDeltaArray._from_values_as_second(
+                add_values(self._values_as_second, other.as_unit(Unit.SECOND)),
+                self._unit,
+            )
+
+        if isinstance(other, TimeDeltaArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return TimeDeltaArray._from_values_as_second(
+                add_values(self._values_as_second, other._values_as_second),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __radd__(self, other: TimeDelta) -> "TimeDeltaArray":
+        """Return the sum of the time deltas and the other delta."""
+        return self + other
+
+    def __sub__(self, other: "TimeDelta | TimeDeltaArray") -> "TimeDeltaArray":
+        """Return the difference of the time deltas and the other delta(s).
+
+        A single time delta is subtracted from every element, while an array of
+        time deltas is subtracted elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, TimeDelta):
+            return TimeDeltaArray._from_values_as_second(
+                subtract_values(self._values_as_second, other.as_unit(Unit.SECOND)),
+                self._unit,
+            )
+
+        if isinstance(other, TimeDeltaArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return TimeDeltaArray._from_values_as_second(
+                subtract_values(self._values_as_second, other._values_as_second),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __neg__(self) -> "TimeDeltaArray":
+        """Return the inverse of the time deltas."""
+        return self * -1
+
+    def __abs__(self) -> "TimeDeltaArray":
+        """Return the absolute of the time deltas."""
+        return TimeDeltaArray._from_values_as_second(
+            array("d", (abs(value) for value in self._values_as_second)), self._unit
+        )
+
+    def __lt__(self, other: "TimeDelta | TimeDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the time deltas less than the other delta(s)."""
+        other_values_as_second = (
+            other.as_unit(Unit.SECOND)
+            if isinstance(other, TimeDelta)
+            else other._values_as_second
+        )
+        return less_than(self._values_as_second, other_values_as_second)
+
+    def __le__(self, other: "TimeDelta | TimeDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the time deltas less than or equal to the other(s)."""
+        other_values_as_second = (
+            other.as_unit(Unit.SECOND)
+            if isinstance(other, TimeDelta)
+            else other._values_as_second
+        )
+        return less_than_or_equal_to(self._values_as_second, other_values_as_second)
+
+    def __gt__(self, other: "TimeDelta | TimeDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the time deltas greater than the other delta(s)."""
+        other_values_as_second = (
+            other.as_unit(Unit.SECOND)
+            if isinstance(other, TimeDelta)
+            else other._values_as_second
+        )
+        return greater_than(self._values_as_second, other_values_as_second)
+
+    def __ge__(self, other: "TimeDelta | TimeDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the time deltas greater than or equal to the other(s)."""
+        other_values_as_second = (
+            other.as_unit(Unit.SECOND)
+            if isinstance(other, TimeDelta)
+            else other._values_as_second
+        )
+        return greater_than_or_equal_to(self._values_as_second, other_values_as_second)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the time deltas."""
+        values = list(self.as_unit(self._unit))
+        return f"TimeDeltaArray({values}, {get_name(self._unit)})"
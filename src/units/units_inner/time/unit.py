@@ -1,4 +1,8 @@
-"""Module for the time unit enum."""
+"""Module for the time units.
+
+Generated by `tools/generate_units.py` from `tools/units_spec.json`, so edit the
+spec & rerun the generator rather than editing this module.
+"""
 
 from typing import TYPE_CHECKING, Final
 
@@ -7,10 +11,12 @@ if TYPE_CHECKING:
 else:
     IntEnum = object
 
+_NAN: Final = float("nan")
+
 
-# NB: When adding a new unit, be sure to also update:
-# - The info list in helpers.py
-# - The `test_get_X_value_as_unit` test in `test_X.py` and `test_X_delta.py`
+# NB: When adding a new unit, add it to `tools/units_spec.json` & rerun
+# `tools/generate_units.py`, which also regenerates the tests of the unit
+# tables
 class Unit(IntEnum):
     """A time unit.
 
@@ -27,85 +33,112 @@ class Unit(IntEnum):
     MILLISECOND = 5
 
 
-class _UnitInfo:
-    """Information associated with a time particular unit.
+# The name & abbreviation of each unit, indexed by the unit. Element 0 does not
+# correspond to a unit.
+_NAMES: Final = (
+    "",
+    "second",
+    "minute",
+    "hour",
+    "microsecond",
+    "millisecond",
+)
+_ABBREVIATIONS: Final = (
+    "",
+    "s",
+    "min",
+    "h",
+    "us",
+    "ms",
+)
+
+# The change in time expressed as each unit per 1s, indexed by the unit. Element 0 does
+# not correspond to a unit, and so holds NaN.
+UNIT_DELTAS_PER_SECOND: Final = (
+    _NAN,
+    1,
+    0.016666666666666666,
+    0.0002777777777777778,
+    1000000.0,
+    1000.0,
+)
+
+# Dense from-unit x to-unit table of conversion factors. Units are small contiguous
+# ints, so the factor that converts a value from one unit to another is at index
+# `from_unit * CONVERSION_FACTORS_STRIDE + to_unit`. Row & column 0 do not correspond to
+# a unit, and so hold NaN. A tuple is used rather than an array, as reading an element
+# of a tuple returns the stored float instead of allocating a new one.
+CONVERSION_FACTORS_STRIDE: Final = 6
+CONVERSION_FACTORS: Final = (
+    # Row 0 does not correspond to a unit
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    # From second to each unit
+    _NAN,
+    1.0,
+    0.016666666666666666,
+    0.0002777777777777778,
+    1000000.0,
+    1000.0,
+    # From minute to each unit
+    _NAN,
+    60.0,
+    1.0,
+    0.016666666666666666,
+    60000000.0,
+    60000.0,
+    # From hour to each unit
+    _NAN,
+    3600.0,
+    60.0,
+    1.0,
+    3600000000.0,
+    3600000.0,
+    # From microsecond to each unit
+    _NAN,
+    1e-06,
+    1.6666666666666667e-08,
+    2.7777777777777777e-10,
+    1.0,
+    0.001,
+    # From millisecond to each unit
+    _NAN,
+    0.001,
+    1.6666666666666667e-05,
+    2.7777777777777776e-07,
+    1000.0,
+    1.0,
+)
+
+# Fixed-point quantities hold an integer count of milliseconds. The number of
+# milliseconds per 1 of each unit is stored as an integer ratio, indexed by the unit, so
+# that converting to & from the units stays in ints. Element 0 does not correspond to a
+# unit.
+FIXED_POINT_RESOLUTION_PER_SECOND: Final = 1000
+_FIXED_POINT_RATIOS: Final = (
+    (0, 1),
+    (1000, 1),
+    (60000, 1),
+    (3600000, 1),
+    (1, 1000),
+    (1, 1),
+)
+
+
+def _check_unit(unit: Unit) -> None:
+    """Check that the unit is a time unit.
 
     Not intended for public use.
-    """
 
-    def __init__(
-        self,
-        unit: Unit,
-        name: str,
-        abbreviation: str,
-        unit_delta_per_second: float,
-    ) -> None:
-        """Initialise a collection of info associated with a unit."""
-        self._unit = unit
-        self._name = name
-        self._abbreviation = abbreviation
-        self._unit_delta_per_second = unit_delta_per_second
-
-    @property
-    def unit(self) -> Unit:
-        """The unit the information relates to."""
-        return self._unit
-
-    @property
-    def name(self) -> str:
-        """The name of the unit."""
-        return self._name
-
-    @property
-    def abbreviation(self) -> str:
-        """The abbreviation of the unit."""
-        return self._abbreviation
-
-    @property
-    def unit_delta_per_pascal(self) -> float:
-        """The change in time expressed as the unit per 1s.
-
-        Equivalent to the gradient of the second-vs-unit graph.
-        """
-        return self._unit_delta_per_second
-
-
-# All info is entered here to create a SSoT
-_UNITS_INFO: Final = [
-    _UnitInfo(
-        unit=Unit.SECOND,
-        name="second",
-        abbreviation="s",
-        unit_delta_per_second=1,
-    ),
-    _UnitInfo(
-        unit=Unit.MINUTE,
-        name="minute",
-        abbreviation="min",
-        unit_delta_per_second=1 / 60,
-    ),
-    _UnitInfo(
-        unit=Unit.HOUR,
-        name="hour",
-        abbreviation="h",
-        unit_delta_per_second=1 / (60 * 60),
-    ),
-    _UnitInfo(
-        unit=Unit.MICROSECOND,
-        name="microsecond",
-        abbreviation="us",
-        unit_delta_per_second=1e6,
-    ),
-    _UnitInfo(
-        unit=Unit.MILLISECOND,
-        name="millisecond",
-        abbreviation="ms",
-        unit_delta_per_second=1e3,
-    ),
-]
-
-# Convert into dictionary for quick lookup
-_UNIT_TO_INFO_MAP: Final = {info.unit: info for info in _UNITS_INFO}
+    Raises:
+        ValueError: The unit is not a time unit.
+    """
+    if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+        raise ValueError
 
 
 def get_name(unit: Unit) -> str:
@@ -113,10 +146,8 @@ def get_name(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].name
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _NAMES[unit]
 
 
 def get_abbreviation(unit: Unit) -> str:
@@ -124,20 +155,23 @@ def get_abbreviation(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].abbreviation
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _ABBREVIATIONS[unit]
 
 
-def get_unit_delta_per_second(
-    unit: Unit,
-) -> float:
+def get_unit_delta_per_second(unit: Unit) -> float:
     """Get the change in time expressed as the unit per 1s.
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].unit_delta_per_pascal
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return UNIT_DELTAS_PER_SECOND[unit]
+
+
+def get_fixed_point_ratio(unit: Unit) -> tuple[int, int]:
+    """Get the number of milliseconds per 1 of the time unit, as an integer ratio.
+
+    Not intended for public use.
+    """
+    _check_unit(unit)
+    return _FIXED_POINT_RATIOS[unit]
@@ -0,0 +1,81 @@
+"""Module for the totalizer shared by the rate totalizer classes.
+
+A totalizer integrates a rate over time, by summing the rate times the duration of
+each update. Over millions of updates, the rounding error of a plain float sum
+builds up until the small increments are lost against the large total, so the
+total is kept with Neumaier's compensated summation, which carries the rounding
+error of each addition along in a second float.
+"""
+
+
+class Totalizer:
+    """A compensated running total of a rate integrated over time.
+
+    The rate & times are in any units, and the total is in those units. Rates
+    given with a duration are held over the duration, while rates given with a
+    timestamp are integrated by the trapezoidal rule, between each timestamp & the
+    one before it.
+
+    Not intended for public use.
+    """
+
+    __slots__ = ("_compensation", "_previous_rate", "_previous_time", "_total")
+
+    def __init__(self) -> None:
+        """Initialise a new totalizer, with a total of 0."""
+        self._total = 0.0
+        self._compensation = 0.0
+        self._previous_time: float | None = None
+        self._previous_rate = 0.0
+
+    def add(self, rate: float, duration: float) -> None:
+        """Add the rate held over the duration to the total.
+
+        Raises:
+            ValueError: The duration is negative.
+        """
+        if duration < 0:
+            msg = f"Negative duration [{duration}]."
+            raise ValueError(msg)
+
+        self._add(rate * duration)
+
+    def update(self, rate: float, time: float) -> None:
+        """Add the rate measured at the time to the total.
+
+        The first rate only sets the start of the integration.
+
+        Raises:
+            ValueError: The time is before the time of the previous rate.
+        """
+        previous_time = self._previous_time
+        if previous_time is not None:
+            if time < previous_time:
+                msg = f"Time went backwards [{previous_time}, {time}]."
+                raise ValueError(msg)
+
+            self._add((rate + self._previous_rate) * (time - previous_time) / 2)
+        self._previous_time = time
+        self._previous_rate = rate
+
+    def _add(self, increment: float) -> None:
+        """Add the increment to the total, keeping its rounding error."""
+        total = self._total
+        new_total = total + increment
+        if abs(total) >= abs(increment):
+            self._compensation += (total - new_total) + increment
+        else:
+            self._compensation += (increment - new_total) + total
+        self._total = new_total
+
+    @property
+    def total(self) -> float:
+        """The total so far."""
+        return self._total + self._compensation
+
+    def reset(self) -> None:
+        """Set the total back to 0, and forget the previous rate & time."""
+        self._total = 0.0
+        self._compensation = 0.0
+        self._previous_time = None
+        self._previous_rate = 0.0
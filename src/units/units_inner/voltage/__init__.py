@@ -1,14 +1,35 @@
 """Package for voltage-related classes."""
 
-from .unit import Unit, get_unit_delta_per_volt
+from .converter import convert_into, make_converter
+from .filter import VoltageFilter
+from .fixed_point_voltage import FixedPointVoltage
+from .isr import VoltageCell, VoltageThreshold
+from .series import VoltageSeries
+from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    Unit,
+    get_unit_delta_per_volt,
+)
 from .unit import get_abbreviation as get_unit_abbreviation
 from .unit import get_name as get_unit_name
 from .voltage import Voltage
+from .voltage_array import VoltageArray
 
 __all__ = [
+    "CONVERSION_FACTORS",
+    "CONVERSION_FACTORS_STRIDE",
+    "FixedPointVoltage",
     "Unit",
     "Voltage",
+    "VoltageArray",
+    "VoltageCell",
+    "VoltageFilter",
+    "VoltageSeries",
+    "VoltageThreshold",
+    "convert_into",
     "get_unit_abbreviation",
     "get_unit_delta_per_volt",
     "get_unit_name",
+    "make_converter",
 ]
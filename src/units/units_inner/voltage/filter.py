@@ -0,0 +1,48 @@
+"""Module for the voltage filter class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from .unit import Unit, get_unit_delta_per_volt
+from .voltage import Voltage
+
+if TYPE_CHECKING:
+    from ..filters import Filter
+
+
+class VoltageFilter:
+    """A streaming filter over voltages, such as a moving average or median.
+
+    Each voltage is passed to the filter in volts, and each result is returned
+    as a voltage in the unit of the filter, so that a stream of readings is smoothed
+    without unwrapping & rewrapping them by hand.
+    """
+
+    __slots__ = ("_filter", "_unit", "_unit_delta_per_volt")
+
+    def __init__(self, filter_: "Filter", unit: Unit) -> None:
+        """Initialise a new voltage filter, returning results in the unit."""
+        self._filter = filter_
+        self._unit = unit
+        self._unit_delta_per_volt = get_unit_delta_per_volt(unit)
+
+    def update(self, voltage: Voltage) -> Voltage:
+        """Add the voltage to the filter & return the filtered voltage."""
+        return self._create(self._filter.update(voltage._value_as_volt))
+
+    def update_value(self, value: float) -> Voltage:
+        """Add a raw value in the unit of the filter & return the filtered voltage."""
+        return self._create(self._filter.update(value / self._unit_delta_per_volt))
+
+    def _create(self, value_as_volt: float) -> Voltage:
+        """Create a voltage in the unit of the filter from its value in volts."""
+        return Voltage._create(
+            value_as_volt * self._unit_delta_per_volt, self._unit, value_as_volt
+        )
+
+    def reset(self) -> None:
+        """Forget every voltage added to the filter."""
+        self._filter.reset()
@@ -0,0 +1,148 @@
+"""Module for the fixed-point voltage class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+from typing import overload
+
+from ..fixed_point import check_count, from_count, to_count
+from .unit import FIXED_POINT_RESOLUTION_PER_VOLT, Unit, get_fixed_point_ratio
+from .voltage import Voltage
+
+
+class FixedPointVoltage:
+    """A voltage, in fixed-point.
+
+    The voltage is held as an integer number of microvolts. Intended for ports without
+    hardware floating point, or where floats are allocated on the heap. Only creating
+    the voltage & expressing it in a unit involve a conversion, which is done with an
+    integer ratio; arithmetic & comparisons stay in ints.
+
+    The count is kept within the range of a small int on 32-bit ports (see
+    `MAXIMUM_COUNT`), so up to about 1073 volts can be held, and creating a voltage
+    or doing arithmetic beyond it raises `OverflowError`.
+    """
+
+    __slots__ = ("_value_as_microvolt",)
+
+    def __init__(self, value: int, unit: Unit) -> None:
+        """Initialise a new fixed-point voltage from an integer value.
+
+        The value is in the unit, and is rounded to the nearest microvolt.
+
+        Raises:
+            OverflowError: The value is too large to be held as a count of microvolts.
+        """
+        numerator, denominator = get_fixed_point_ratio(unit)
+        self._value_as_microvolt = to_count(value, numerator, denominator)
+
+    @classmethod
+    def _from_value_as_microvolt(cls, value_as_microvolt: int) -> "FixedPointVoltage":
+        """Create a fixed-point voltage from a number of microvolts.
+
+        Raises:
+            OverflowError: The number of microvolts was out of range.
+        """
+        voltage: FixedPointVoltage = cls.__new__(cls)
+        voltage._value_as_microvolt = check_count(value_as_microvolt)
+        return voltage
+
+    def as_unit(self, unit: Unit) -> int:
+        """Return the voltage in the unit, rounded to the nearest integer."""
+        numerator, denominator = get_fixed_point_ratio(unit)
+        return from_count(self._value_as_microvolt, numerator, denominator)
+
+    def to_voltage(self) -> Voltage:
+        """Return the voltage as a floating-point :py:class:`Voltage`."""
+        return Voltage(
+            self._value_as_microvolt / FIXED_POINT_RESOLUTION_PER_VOLT, Unit.VOLT
+        )
+
+    def __mul__(self, value: int) -> "FixedPointVoltage":
+        """Return the voltage scaled by the integer."""
+        return FixedPointVoltage._from_value_as_microvolt(
+            self._value_as_microvolt * value
+        )
+
+    def __rmul__(self, value: int) -> "FixedPointVoltage":
+        """Return the voltage scaled by the integer."""
+        return self * value
+
+    @overload
+    def __floordiv__(self, other: int) -> "FixedPointVoltage": ...
+
+    @overload
+    def __floordiv__(self, other: "FixedPointVoltage") -> int: ...
+
+    def __floordiv__(
+        self, other: "int | FixedPointVoltage"
+    ) -> "FixedPointVoltage | int":
+        """Return a floored scaled voltage or the floored ratio between them.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is an :py:class:`int`, return the voltage scaled by the
+          inverse of the value, floored to the nearest microvolt.
+        - If the argument is a :py:class:`FixedPointVoltage`, return the floored ratio
+          between the two.
+        """
+        if isinstance(other, FixedPointVoltage):
+            return self._value_as_microvolt // other._value_as_microvolt
+
+        return FixedPointVoltage._from_value_as_microvolt(
+            self._value_as_microvolt // other
+        )
+
+    def __add__(self, other: "FixedPointVoltage") -> "FixedPointVoltage":
+        """Return the sum of the voltages."""
+        return FixedPointVoltage._from_value_as_microvolt(
+            self._value_as_microvolt + other._value_as_microvolt
+        )
+
+    def __sub__(self, other: "FixedPointVoltage") -> "FixedPointVoltage":
+        """Return the difference between the voltages."""
+        return FixedPointVoltage._from_value_as_microvolt(
+            self._value_as_microvolt - other._value_as_microvolt
+        )
+
+    def __neg__(self) -> "FixedPointVoltage":
+        """Return the inverse of the voltage."""
+        return FixedPointVoltage._from_value_as_microvolt(-self._value_as_microvolt)
+
+    def __abs__(self) -> "FixedPointVoltage":
+        """Return the absolute version of the voltage."""
+        return FixedPointVoltage._from_value_as_microvolt(abs(self._value_as_microvolt))
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the objects are equal fixed-point voltages."""
+        if not isinstance(other, FixedPointVoltage):
+            return NotImplemented
+
+        return self._value_as_microvolt == other._value_as_microvolt
+
+    def __lt__(self, other: "FixedPointVoltage") -> bool:
+        """Return whether the voltage is less than the other."""
+        return self._value_as_microvolt < other._value_as_microvolt
+
+    def __le__(self, other: "FixedPointVoltage") -> bool:
+        """Return whether the voltage is less than or equal to the other."""
+        return self._value_as_microvolt <= other._value_as_microvolt
+
+    def __gt__(self, other: "FixedPointVoltage") -> bool:
+        """Return whether the voltage is greater than the other."""
+        return self._value_as_microvolt > other._value_as_microvolt
+
+    def __ge__(self, other: "FixedPointVoltage") -> bool:
+        """Return whether the voltage is greater than or equal to the other."""
+        return self._value_as_microvolt >= other._value_as_microvolt
+
+    def __hash__(self) -> int:
+        """Return the hash of the voltage."""
+        return hash(self._value_as_microvolt)
+
+    def __str__(self) -> str:
+        """Return a string representation of the voltage."""
+        return f"{self._value_as_microvolt} uV"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the voltage for developers."""
+        return f"{__class__.__name__}({self._value_as_microvolt} uV)"
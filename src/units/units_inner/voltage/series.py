@@ -0,0 +1,126 @@
+"""Module for the voltage series class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from ..ring_buffer import RingBuffer
+from .unit import Unit, get_name, get_unit_delta_per_volt
+from .voltage import Voltage
+from .voltage_array import VoltageArray
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ..time import Time
+
+
+class VoltageSeries(RingBuffer):
+    """A rolling window of the most recent voltages, with optional timestamps.
+
+    The voltages are stored as volts in a buffer preallocated on initialisation,
+    so that pushing a voltage drops the oldest one once the series is full,
+    rather than allocating. The voltages are indexed from the oldest (0) to the
+    latest (-1), and are expressed in the unit of the series when retrieved.
+    """
+
+    __slots__ = ("_unit", "_unit_delta_per_volt")
+
+    def __init__(self, capacity: int, unit: Unit, *, timestamped: bool = False) -> None:
+        """Initialise a new, empty series, holding up to the number of voltages.
+
+        If the series is timestamped, every voltage is pushed along with the time it
+        was measured at.
+
+        Raises:
+            ValueError: The capacity is less than 1.
+        """
+        super().__init__(capacity, timestamped=timestamped)
+        self._unit = unit
+        self._unit_delta_per_volt = get_unit_delta_per_volt(unit)
+
+    def push(self, voltage: Voltage, time: "Time | None" = None) -> None:
+        """Push a voltage, dropping the oldest one if the series is full.
+
+        Does not allocate.
+
+        Raises:
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        end = self._end
+        if end == self._limit:
+            end = self._compact()
+        times = self._times
+        if times is not None and time is not None:
+            times[end] = time._value_as_second
+        elif times is not None or time is not None:
+            self._raise_time_error()
+        self._values[end] = voltage._value_as_volt
+        self._end = end + 1
+
+    def push_value(self, value: float, time: "Time | None" = None) -> None:
+        """Push a raw value in the unit of the series, as a voltage.
+
+        Raises:
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        self._push(value / self._unit_delta_per_volt, time)
+
+    def _create(self, value_as_volt: float) -> Voltage:
+        """Create a voltage in the unit of the series from its value in volts."""
+        return Voltage._create(
+            value_as_volt * self._unit_delta_per_volt, self._unit, value_as_volt
+        )
+
+    def latest(self) -> Voltage:
+        """Return the most recently pushed voltage.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(-1))
+
+    def oldest(self) -> Voltage:
+        """Return the least recently pushed voltage still in the series.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(0))
+
+    def window(self, count: "int | None" = None) -> VoltageArray:
+        """Return the latest voltages, from oldest to latest.
+
+        All of the voltages are returned if the count is None, and at most as many
+        voltages as the series holds otherwise. The window is a view of the series
+        rather than a copy, so it is only valid until the next push or clear.
+        """
+        return VoltageArray._from_values_as_volt(self._view_values(count), self._unit)
+
+    def __getitem__(self, index: int) -> Voltage:
+        """Return the voltage at the index.
+
+        Raises:
+            IndexError: There is no voltage at the index.
+        """
+        return self._create(self._get_value(index))
+
+    def __iter__(self) -> "Iterator[Voltage]":
+        """Return an iterator over the voltages, from oldest to latest.
+
+        Each voltage is only created when it is reached.
+        """
+        for value_as_volt in self._iter_values():
+            yield self._create(value_as_volt)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the voltage series."""
+        values = [value * self._unit_delta_per_volt for value in self._iter_values()]
+        return (
+            f"VoltageSeries({values}, {get_name(self._unit)},"
+            f" capacity={self._capacity})"
+        )
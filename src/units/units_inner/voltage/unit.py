@@ -1,4 +1,8 @@
-"""Module for the voltage units."""
+"""Module for the voltage units.
+
+Generated by `tools/generate_units.py` from `tools/units_spec.json`, so edit the
+spec & rerun the generator rather than editing this module.
+"""
 
 from typing import TYPE_CHECKING, Final
 
@@ -7,10 +11,12 @@ if TYPE_CHECKING:
 else:
     IntEnum = object
 
+_NAN: Final = float("nan")
+
 
-# NB: When adding a new unit, be sure to also update:
-# - The info list in helpers.py
-# - The `test_get_X_value_as_unit` test in `test_X.py` and `test_X_delta.py`
+# NB: When adding a new unit, add it to `tools/units_spec.json` & rerun
+# `tools/generate_units.py`, which also regenerates the tests of the unit
+# tables
 class Unit(IntEnum):
     """A voltage unit.
 
@@ -25,73 +31,81 @@ class Unit(IntEnum):
     MICROVOLT = 3
 
 
-class _UnitInfo:
-    """Information associated with a voltage particular unit.
+# The name & abbreviation of each unit, indexed by the unit. Element 0 does not
+# correspond to a unit.
+_NAMES: Final = (
+    "",
+    "volt",
+    "millivolt",
+    "microvolt",
+)
+_ABBREVIATIONS: Final = (
+    "",
+    "V",
+    "mV",
+    "uV",
+)
+
+# The change in voltage expressed as each unit per 1V, indexed by the unit. Element 0
+# does not correspond to a unit, and so holds NaN.
+UNIT_DELTAS_PER_VOLT: Final = (
+    _NAN,
+    1,
+    1000,
+    1_000_000,
+)
+
+# Dense from-unit x to-unit table of conversion factors. Units are small contiguous
+# ints, so the factor that converts a value from one unit to another is at index
+# `from_unit * CONVERSION_FACTORS_STRIDE + to_unit`. Row & column 0 do not correspond to
+# a unit, and so hold NaN. A tuple is used rather than an array, as reading an element
+# of a tuple returns the stored float instead of allocating a new one.
+CONVERSION_FACTORS_STRIDE: Final = 4
+CONVERSION_FACTORS: Final = (
+    # Row 0 does not correspond to a unit
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    # From volt to each unit
+    _NAN,
+    1.0,
+    1000.0,
+    1000000.0,
+    # From millivolt to each unit
+    _NAN,
+    0.001,
+    1.0,
+    1000.0,
+    # From microvolt to each unit
+    _NAN,
+    1e-06,
+    0.001,
+    1.0,
+)
+
+# Fixed-point quantities hold an integer count of microvolts. The number of microvolts
+# per 1 of each unit is stored as an integer ratio, indexed by the unit, so that
+# converting to & from the units stays in ints. Element 0 does not correspond to a unit.
+FIXED_POINT_RESOLUTION_PER_VOLT: Final = 1_000_000
+_FIXED_POINT_RATIOS: Final = (
+    (0, 1),
+    (1000000, 1),
+    (1000, 1),
+    (1, 1),
+)
+
+
+def _check_unit(unit: Unit) -> None:
+    """Check that the unit is a voltage unit.
 
     Not intended for public use.
-    """
 
-    def __init__(
-        self,
-        unit: Unit,
-        name: str,
-        abbreviation: str,
-        unit_delta_per_volt: float,
-    ) -> None:
-        """Initialise a collection of info associated with a unit."""
-        self._unit = unit
-        self._name = name
-        self._abbreviation = abbreviation
-        self._unit_delta_per_volt = unit_delta_per_volt
-
-    @property
-    def unit(self) -> Unit:
-        """The unit the information relates to."""
-        return self._unit
-
-    @property
-    def name(self) -> str:
-        """The name of the unit."""
-        return self._name
-
-    @property
-    def abbreviation(self) -> str:
-        """The abbreviation of the unit."""
-        return self._abbreviation
-
-    @property
-    def unit_delta_per_volt(self) -> float:
-        """The change in voltage expressed as the unit per 1V.
-
-        Equivalent to the gradient of the volt-vs-unit graph.
-        """
-        return self._unit_delta_per_volt
-
-
-# All info is entered here to create a SSoT
-_UNITS_INFO: Final = [
-    _UnitInfo(
-        unit=Unit.VOLT,
-        name="volt",
-        abbreviation="V",
-        unit_delta_per_volt=1,
-    ),
-    _UnitInfo(
-        unit=Unit.MILLIVOLT,
-        name="millivolt",
-        abbreviation="mV",
-        unit_delta_per_volt=1_000,
-    ),
-    _UnitInfo(
-        unit=Unit.MICROVOLT,
-        name="microvolt",
-        abbreviation="uV",
-        unit_delta_per_volt=1_000_000,
-    ),
-]
-
-# Convert into dictionary for quick lookup
-_UNIT_TO_INFO_MAP: Final = {info.unit: info for info in _UNITS_INFO}
+    Raises:
+        ValueError: The unit is not a voltage unit.
+    """
+    if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+        raise ValueError
 
 
 def get_name(unit: Unit) -> str:
@@ -99,10 +113,8 @@ def get_name(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].name
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _NAMES[unit]
 
 
 def get_abbreviation(unit: Unit) -> str:
@@ -110,20 +122,23 @@ def get_abbreviation(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].abbreviation
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _ABBREVIATIONS[unit]
 
 
-def get_unit_delta_per_volt(
-    unit: Unit,
-) -> float:
+def get_unit_delta_per_volt(unit: Unit) -> float:
     """Get the change in voltage expressed as the unit per 1V.
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].unit_delta_per_volt
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return UNIT_DELTAS_PER_VOLT[unit]
+
+
+def get_fixed_point_ratio(unit: Unit) -> tuple[int, int]:
+    """Get the number of microvolts per 1 of the voltage unit, as an integer ratio.
+
+    Not intended for public use.
+    """
+    _check_unit(unit)
+    return _FIXED_POINT_RATIOS[unit]
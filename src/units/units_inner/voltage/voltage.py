@@ -3,6 +3,9 @@
 from typing import overload
 
 from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    UNIT_DELTAS_PER_VOLT,
     Unit,
     get_abbreviation,
     get_name,
@@ -13,22 +16,47 @@ from .unit import (
 class Voltage:
     """The difference in electric potential between two points."""
 
+    __slots__ = ("_unit", "_value", "_value_as_volt")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new voltage."""
         self._value = value
         self._unit = unit
+        internal_unit_delta_per_volt = get_unit_delta_per_volt(self._unit)
+        self._value_as_volt = self._value / internal_unit_delta_per_volt
+
+    @classmethod
+    def _create(cls, value: float, unit: Unit, value_as_volt: float) -> "Voltage":
+        """Create a voltage from its value in both the unit & volts.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        voltage: Voltage = cls.__new__(cls)
+        voltage._value = value
+        voltage._unit = unit
+        voltage._value_as_volt = value_as_volt
+        return voltage
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the voltage, expressed as the unit."""
-        internal_unit_delta_per_volt = get_unit_delta_per_volt(self._unit)
-        value_as_volt = self._value / internal_unit_delta_per_volt
-        external_unit_delta_per_volt = get_unit_delta_per_volt(unit)
-        return external_unit_delta_per_volt * value_as_volt
+        """Return the voltage, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not a voltage unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __mul__(self, value: float) -> "Voltage":
         """Return a voltage scaled by the value."""
         scaled_value = self._value * value
-        return Voltage(scaled_value, self._unit)
+        return Voltage._create(scaled_value, self._unit, self._value_as_volt * value)
 
     def __rmul__(self, value: float) -> "Voltage":
         """Return a voltage scaled by the value."""
@@ -51,19 +79,28 @@ class Voltage:
           voltages
         """
         if isinstance(other, Voltage):
-            value_as_volt = self.as_unit(Unit.VOLT)
-            other_value_as_volt = other.as_unit(Unit.VOLT)
-            return value_as_volt / other_value_as_volt
+            return self._value_as_volt / other._value_as_volt
 
         scaled_value = self._value / other
-        return Voltage(scaled_value, self._unit)
+        return Voltage._create(scaled_value, self._unit, self._value_as_volt / other)
 
     def __add__(self, other: "Voltage") -> "Voltage":
         """Return the sum of the voltages."""
-        value_as_volt = self.as_unit(Unit.VOLT)
-        other_value_as_volt = other.as_unit(Unit.VOLT)
-        added_value_as_volt = value_as_volt + other_value_as_volt
-        return Voltage(added_value_as_volt, Unit.VOLT)
+        # This NotImplemented block is here because the case of a Voltage + a
+        # VoltageArray is handled in the __radd__ method in the VoltageArray class
+        if not isinstance(other, Voltage):  # type: ignore[reportUnnecessaryIsInstance]
+            return NotImplemented
+
+        if self._unit == other._unit:
+            value_sum = self._value + other._value
+            return Voltage._create(
+                value_sum,
+                self._unit,
+                value_sum / UNIT_DELTAS_PER_VOLT[self._unit],
+            )
+
+        added_value_as_volt = self._value_as_volt + other._value_as_volt
+        return Voltage._create(added_value_as_volt, Unit.VOLT, added_value_as_volt)
 
     def __sub__(self, delta: "Voltage") -> "Voltage":
         """Return the difference between the voltages."""
@@ -72,57 +109,51 @@ class Voltage:
     def __neg__(self) -> "Voltage":
         """Return the inverse of the voltage."""
         inverted_value = -self._value
-        return Voltage(inverted_value, self._unit)
+        return Voltage._create(inverted_value, self._unit, -self._value_as_volt)
 
     def __abs__(self) -> "Voltage":
         """Return the absolute version of the voltage."""
         absolute_value = abs(self._value)
-        return Voltage(absolute_value, self._unit)
+        return Voltage._create(absolute_value, self._unit, abs(self._value_as_volt))
 
     def __floordiv__(self, other: "Voltage") -> float:
         """Return the floored ratio between the voltages."""
-        value_as_volt = self.as_unit(Unit.VOLT)
-        other_value_as_volt = other.as_unit(Unit.VOLT)
-        return value_as_volt // other_value_as_volt
+        return self._value_as_volt // other._value_as_volt
 
     def __mod__(self, other: "Voltage") -> float:
         """Return the remainder of the ratio between the voltages."""
-        value_as_volt = self.as_unit(Unit.VOLT)
-        other_value_as_volt = other.as_unit(Unit.VOLT)
-        return value_as_volt % other_value_as_volt
+        return self._value_as_volt % other._value_as_volt
 
     def __divmod__(self, other: "Voltage") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the voltages."""
-        value_as_volt = self.as_unit(Unit.VOLT)
-        other_value_as_volt = other.as_unit(Unit.VOLT)
-        return divmod(value_as_volt, other_value_as_volt)
+        return divmod(self._value_as_volt, other._value_as_volt)
 
     def __eq__(self, other: object) -> bool:
         """Return whether the objects are equal voltages."""
         if not isinstance(other, Voltage):
             return NotImplemented
 
-        return self.as_unit(Unit.VOLT) == other.as_unit(Unit.VOLT)
+        return self._value_as_volt == other._value_as_volt
 
     def __lt__(self, other: "Voltage") -> bool:
         """Return whether the voltage is less than the other."""
-        return self.as_unit(Unit.VOLT) < other.as_unit(Unit.VOLT)
+        return self._value_as_volt < other._value_as_volt
 
     def __le__(self, other: "Voltage") -> bool:
         """Return whether the voltage is less than or equal to the other."""
-        return self.as_unit(Unit.VOLT) <= other.as_unit(Unit.VOLT)
+        return self._value_as_volt <= other._value_as_volt
 
     def __gt__(self, other: "Voltage") -> bool:
         """Return whether the voltage is greater than the other."""
-        return self.as_unit(Unit.VOLT) > other.as_unit(Unit.VOLT)
+        return self._value_as_volt > other._value_as_volt
 
     def __ge__(self, other: "Voltage") -> bool:
         """Return whether the voltage is greater than or equal to the other."""
-        return self.as_unit(Unit.VOLT) >= other.as_unit(Unit.VOLT)
+        return self._value_as_volt >= other._value_as_volt
 
     def __hash__(self) -> int:
         """Return the hash of the voltage."""
-        return hash(self.as_unit(Unit.VOLT))
+        return hash(self._value_as_volt)
 
     def __str__(self) -> str:
         """Return a string representation of the voltage."""
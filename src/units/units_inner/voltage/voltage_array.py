@@ -0,0 +1,203 @@
+"""Module for the voltage array class."""
+
+# ruff: noqa: TID252
+
+from array import array
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    create_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .unit import Unit, get_name, get_unit_delta_per_volt
+from .voltage import Voltage
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class VoltageArray:
+    """A homogeneous array of voltages.
+
+    The voltages are stored in bulk as volts, and share a single unit that they are
+    expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_volt")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of voltages, with all values in the unit."""
+        internal_unit_delta_per_volt = get_unit_delta_per_volt(unit)
+        self._unit = unit
+        self._values_as_volt: array[float] | memoryview = create_values(
+            values, 1 / internal_unit_delta_per_volt
+        )
+
+    @classmethod
+    def _from_values_as_volt(
+        cls, values_as_volt: "array[float] | memoryview", unit: Unit
+    ) -> "VoltageArray":
+        """Create an array of voltages directly from a buffer of volts.
+
+        The buffer is used as-is, rather than copied.
+        """
+        voltages: VoltageArray = cls.__new__(cls)
+        voltages._unit = unit
+        voltages._values_as_volt = values_as_volt
+        return voltages
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the voltages, expressed as the unit."""
+        external_unit_delta_per_volt = get_unit_delta_per_volt(unit)
+        return create_values(self._values_as_volt, external_unit_delta_per_volt)
+
+    def __len__(self) -> int:
+        """Return the number of voltages."""
+        return len(self._values_as_volt)
+
+    @overload
+    def __getitem__(self, index: int) -> Voltage: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "VoltageArray": ...
+
+    def __getitem__(self, index: "int | slice") -> "Voltage | VoltageArray":
+        """Return the voltage at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return VoltageArray._from_values_as_volt(
+                memoryview(self._values_as_volt)[index], self._unit
+            )
+
+        internal_unit_delta_per_volt = get_unit_delta_per_volt(self._unit)
+        return Voltage(
+            self._values_as_volt[index] * internal_unit_delta_per_volt, self._unit
+        )
+
+    def __iter__(self) -> "Iterator[Voltage]":
+        """Return an iterator over the voltages."""
+        internal_unit_delta_per_volt = get_unit_delta_per_volt(self._unit)
+        for value_as_volt in self._values_as_volt:
+            yield Voltage(value_as_volt * internal_unit_delta_per_volt, self._unit)
+
+    def __mul__(self, value: float) -> "VoltageArray":
+        """Return the voltages scaled by the value."""
+        return VoltageArray._from_values_as_volt(
+            create_values(self._values_as_volt, value), self._unit
+        )
+
+    def __rmul__(self, value: float) -> "VoltageArray":
+        """Return the voltages scaled by the value."""
+        return self * value
+
+    def __truediv__(self, value: float) -> "VoltageArray":
+        """Return the voltages scaled by the inverse of the value."""
+        return self * (1 / value)
+
+    def __add__(self, other: "Voltage | VoltageArray") -> "VoltageArray":
+        """Return the sum of the voltages and the other voltage(s).
+
+        A single voltage is added to every element, while an array of
+        voltages is added elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, Voltage):
+            return VoltageArray._from_values_as_volt(
+                add_values(self._values_as_volt, other.as_unit(Unit.VOLT)),
+                self._unit,
+            )
+
+        if isinstance(other, VoltageArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return VoltageArray._from_values_as_volt(
+                add_values(self._values_as_volt, other._values_as_volt),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __radd__(self, other: Voltage) -> "VoltageArray":
+        """Return the sum of the voltages and the other voltage."""
+        return self + other
+
+    def __sub__(self, other: "Voltage | VoltageArray") -> "VoltageArray":
+        """Return the difference of the voltages and the other voltage(s).
+
+        A single voltage is subtracted from every element, while an array of
+        voltages is subtracted elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, Voltage):
+            return VoltageArray._from_values_as_volt(
+                subtract_values(self._values_as_volt, other.as_unit(Unit.VOLT)),
+                self._unit,
+            )
+
+        if isinstance(other, VoltageArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return VoltageArray._from_values_as_volt(
+                subtract_values(self._values_as_volt, other._values_as_volt),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __neg__(self) -> "VoltageArray":
+        """Return the inverse of the voltages."""
+        return self * -1
+
+    def __abs__(self) -> "VoltageArray":
+        """Return the absolute of the voltages."""
+        return VoltageArray._from_values_as_volt(
+            array("d", (abs(value) for value in self._values_as_volt)), self._unit
+        )
+
+    def __lt__(self, other: "Voltage | VoltageArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the voltages less than the other voltage(s)."""
+        other_values_as_volt = (
+            other.as_unit(Unit.VOLT)
+            if isinstance(other, Voltage)
+            else other._values_as_volt
+        )
+        return less_than(self._values_as_volt, other_values_as_volt)
+
+    def __le__(self, other: "Voltage | VoltageArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the voltages less than or equal to the other(s)."""
+        other_values_as_volt = (
+            other.as_unit(Unit.VOLT)
+            if isinstance(other, Voltage)
+            else other._values_as_volt
+        )
+        return less_than_or_equal_to(self._values_as_volt, other_values_as_volt)
+
+    def __gt__(self, other: "Voltage | VoltageArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the voltages greater than the other voltage(s)."""
+        other_values_as_volt = (
+            other.as_unit(Unit.VOLT)
+            if isinstance(other, Voltage)
+            else other._values_as_volt
+        )
+        return greater_than(self._values_as_volt, other_values_as_volt)
+
+    def __ge__(self, other: "Voltage | VoltageArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the voltages greater than or equal to the other(s)."""
+        other_values_as_volt = (
+            other.as_unit(Unit.VOLT)
+            if isinstance(other, Voltage)
+            else other._values_as_volt
+        )
+        return greater_than_or_equal_to(self._values_as_volt, other_values_as_volt)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the voltages."""
+        values = list(self.as_unit(self._unit))
+        return f"VoltageArray({values}, {get_name(self._unit)})"
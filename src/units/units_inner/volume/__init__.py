@@ -1,20 +1,45 @@
 """Package for volume-related classes and constants."""
 
 from .constants import ZERO
+from .converter import convert_into, make_converter
 from .exceptions import NegativeVolumeValueError
-from .unit import Unit, get_unit_delta_per_cubic_metre
+from .filter import VolumeFilter
+from .fixed_point_volume import FixedPointVolume
+from .fixed_point_volume_delta import FixedPointVolumeDelta
+from .isr import VolumeCell, VolumeThreshold
+from .series import VolumeSeries
+from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    Unit,
+    get_unit_delta_per_cubic_metre,
+)
 from .unit import get_abbreviation as get_unit_abbreviation
 from .unit import get_name as get_unit_name
 from .volume import Volume
+from .volume_array import VolumeArray
 from .volume_delta import VolumeDelta
+from .volume_delta_array import VolumeDeltaArray
 
 __all__ = [
+    "CONVERSION_FACTORS",
+    "CONVERSION_FACTORS_STRIDE",
     "ZERO",
+    "FixedPointVolume",
+    "FixedPointVolumeDelta",
     "NegativeVolumeValueError",
     "Unit",
     "Volume",
+    "VolumeArray",
+    "VolumeCell",
     "VolumeDelta",
+    "VolumeDeltaArray",
+    "VolumeFilter",
+    "VolumeSeries",
+    "VolumeThreshold",
+    "convert_into",
     "get_unit_abbreviation",
     "get_unit_delta_per_cubic_metre",
     "get_unit_name",
+    "make_converter",
 ]
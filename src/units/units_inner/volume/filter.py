@@ -0,0 +1,61 @@
+"""Module for the volume filter class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from .exceptions import NegativeVolumeValueError
+from .unit import Unit, get_unit_delta_per_cubic_metre
+from .volume import Volume
+
+if TYPE_CHECKING:
+    from ..filters import Filter
+
+
+class VolumeFilter:
+    """A streaming filter over volumes, such as a moving average or median.
+
+    Each volume is passed to the filter in cubic metres, and each result is returned
+    as a volume in the unit of the filter, so that a stream of readings is smoothed
+    without unwrapping & rewrapping them by hand.
+    """
+
+    __slots__ = ("_filter", "_unit", "_unit_delta_per_cubic_metre")
+
+    def __init__(self, filter_: "Filter", unit: Unit) -> None:
+        """Initialise a new volume filter, returning results in the unit."""
+        self._filter = filter_
+        self._unit = unit
+        self._unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(unit)
+
+    def update(self, volume: Volume) -> Volume:
+        """Add the volume to the filter & return the filtered volume."""
+        return self._create(self._filter.update(volume._value_as_cubic_metre))
+
+    def update_value(self, value: float) -> Volume:
+        """Add a raw value in the unit of the filter & return the filtered volume.
+
+        Raises:
+            NegativeVolumeValueError: The negative value produced a volume less than
+                0m^3.
+        """
+        if value < 0:
+            raise NegativeVolumeValueError(value=value)
+
+        return self._create(
+            self._filter.update(value / self._unit_delta_per_cubic_metre)
+        )
+
+    def _create(self, value_as_cubic_metre: float) -> Volume:
+        """Create a volume in the unit of the filter from its value in cubic metres."""
+        return Volume._create(
+            value_as_cubic_metre * self._unit_delta_per_cubic_metre,
+            self._unit,
+            value_as_cubic_metre,
+        )
+
+    def reset(self) -> None:
+        """Forget every volume added to the filter."""
+        self._filter.reset()
@@ -0,0 +1,156 @@
+"""Module for the fixed-point volume class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+from typing import overload
+
+from ..fixed_point import check_count, from_count, to_count
+from .exceptions import NegativeVolumeValueError
+from .fixed_point_volume_delta import FixedPointVolumeDelta
+from .unit import FIXED_POINT_RESOLUTION_PER_CUBIC_METRE, Unit, get_fixed_point_ratio
+from .volume import Volume
+
+
+class FixedPointVolume:
+    """A volume, in fixed-point.
+
+    The volume is held as an integer number of microlitres. Intended for ports without
+    hardware floating point, or where floats are allocated on the heap. Only creating
+    the volume & expressing it in a unit involve a conversion, which is done with an
+    integer ratio; arithmetic & comparisons stay in ints.
+
+    The count is kept within the range of a small int on 32-bit ports (see
+    `MAXIMUM_COUNT`), so up to about 1.07 cubic metres can be held, and creating a
+    volume or doing arithmetic beyond it raises `OverflowError`.
+    """
+
+    __slots__ = ("_value_as_microlitre",)
+
+    def __init__(self, value: int, unit: Unit) -> None:
+        """Initialise a new fixed-point volume from an integer value.
+
+        The value is in the unit, and is rounded to the nearest microlitre.
+
+        Raises:
+            NegativeVolumeValueError: The negative value produced a volume less than
+            0m^3.
+            OverflowError: The value is too large to be held as a count of microlitres.
+        """
+        if value < 0:
+            raise NegativeVolumeValueError(value=value)
+
+        numerator, denominator = get_fixed_point_ratio(unit)
+        self._value_as_microlitre = to_count(value, numerator, denominator)
+
+    @classmethod
+    def _from_value_as_microlitre(cls, value_as_microlitre: int) -> "FixedPointVolume":
+        """Create a fixed-point volume from a number of microlitres.
+
+        Raises:
+            NegativeVolumeValueError: The number of microlitres was negative.
+            OverflowError: The number of microlitres was out of range.
+        """
+        if value_as_microlitre < 0:
+            raise NegativeVolumeValueError(value=value_as_microlitre)
+
+        volume: FixedPointVolume = cls.__new__(cls)
+        volume._value_as_microlitre = check_count(value_as_microlitre)
+        return volume
+
+    def as_unit(self, unit: Unit) -> int:
+        """Return the volume in the unit, rounded to the nearest integer."""
+        numerator, denominator = get_fixed_point_ratio(unit)
+        return from_count(self._value_as_microlitre, numerator, denominator)
+
+    def to_volume(self) -> Volume:
+        """Return the volume as a floating-point :py:class:`Volume`."""
+        return Volume(
+            self._value_as_microlitre / FIXED_POINT_RESOLUTION_PER_CUBIC_METRE,
+            Unit.CUBIC_METRE,
+        )
+
+    def __add__(self, delta: FixedPointVolumeDelta) -> "FixedPointVolume":
+        """Return the sum of the volume and the difference.
+
+        Raises:
+            NegativeVolumeValueError: The sum of the volume and the difference was less
+                than 0m^3.
+        """
+        return FixedPointVolume._from_value_as_microlitre(
+            self._value_as_microlitre + delta._value_as_microlitre
+        )
+
+    def __radd__(self, delta: FixedPointVolumeDelta) -> "FixedPointVolume":
+        """Return the sum of the volume and the difference."""
+        return self + delta
+
+    @overload
+    def __sub__(self, other: "FixedPointVolume") -> FixedPointVolumeDelta: ...
+
+    @overload
+    def __sub__(self, other: FixedPointVolumeDelta) -> "FixedPointVolume": ...
+
+    def __sub__(
+        self, other: "FixedPointVolume | FixedPointVolumeDelta"
+    ) -> "FixedPointVolumeDelta | FixedPointVolume":
+        """Return the delta between volumes or the volume less the delta.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a :py:class:`FixedPointVolume`, return the difference
+          between the two volumes.
+        - If the argument is a :py:class:`FixedPointVolumeDelta`, return the volume
+          less the difference.
+
+        Raises:
+            NegativeVolumeValueError: The volume minus the difference was less
+                than 0m^3. Error can only be raised when other is a
+                :py:class:`FixedPointVolumeDelta`.
+        """
+        value_difference_as_microlitre = (
+            self._value_as_microlitre - other._value_as_microlitre
+        )
+        return (
+            FixedPointVolumeDelta._from_value_as_microlitre(
+                value_difference_as_microlitre
+            )
+            if isinstance(other, FixedPointVolume)
+            else FixedPointVolume._from_value_as_microlitre(
+                value_difference_as_microlitre
+            )
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the objects are equal fixed-point volumes."""
+        if not isinstance(other, FixedPointVolume):
+            return NotImplemented
+
+        return self._value_as_microlitre == other._value_as_microlitre
+
+    def __lt__(self, other: "FixedPointVolume") -> bool:
+        """Return whether the volume is less than the other."""
+        return self._value_as_microlitre < other._value_as_microlitre
+
+    def __le__(self, other: "FixedPointVolume") -> bool:
+        """Return whether the volume is less than or equal to the other."""
+        return self._value_as_microlitre <= other._value_as_microlitre
+
+    def __gt__(self, other: "FixedPointVolume") -> bool:
+        """Return whether the volume is greater than the other."""
+        return self._value_as_microlitre > other._value_as_microlitre
+
+    def __ge__(self, other: "FixedPointVolume") -> bool:
+        """Return whether the volume is greater than or equal to the other."""
+        return self._value_as_microlitre >= other._value_as_microlitre
+
+    def __hash__(self) -> int:
+        """Return the hash of the volume."""
+        return hash(self._value_as_microlitre)
+
+    def __str__(self) -> str:
+        """Return a string representation of the volume."""
+        return f"{self._value_as_microlitre} uL"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the volume for developers."""
+        return f"{__class__.__name__}({self._value_as_microlitre} uL)"
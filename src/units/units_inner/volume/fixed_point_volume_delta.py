@@ -0,0 +1,160 @@
+"""Module for the fixed-point volume delta class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+from typing import overload
+
+from ..fixed_point import check_count, from_count, to_count
+from .unit import FIXED_POINT_RESOLUTION_PER_CUBIC_METRE, Unit, get_fixed_point_ratio
+from .volume_delta import VolumeDelta
+
+
+class FixedPointVolumeDelta:
+    """The difference between two volumes, in fixed-point.
+
+    The volume delta is held as an integer number of microlitres. Intended for ports
+    without hardware floating point, or where floats are allocated on the heap. Only
+    creating the volume delta & expressing it in a unit involve a conversion, which is
+    done with an integer ratio; arithmetic & comparisons stay in ints.
+
+    The count is kept within the range of a small int on 32-bit ports (see
+    `MAXIMUM_COUNT`), so up to about 1.07 cubic metres can be held, and creating a
+    volume delta or doing arithmetic beyond it raises `OverflowError`.
+    """
+
+    __slots__ = ("_value_as_microlitre",)
+
+    def __init__(self, value: int, unit: Unit) -> None:
+        """Initialise a new fixed-point volume delta from an integer value.
+
+        The value is in the unit, and is rounded to the nearest microlitre.
+
+        Raises:
+            OverflowError: The value is too large to be held as a count of microlitres.
+        """
+        numerator, denominator = get_fixed_point_ratio(unit)
+        self._value_as_microlitre = to_count(value, numerator, denominator)
+
+    @classmethod
+    def _from_value_as_microlitre(
+        cls, value_as_microlitre: int
+    ) -> "FixedPointVolumeDelta":
+        """Create a fixed-point volume delta from a number of microlitres.
+
+        Raises:
+            OverflowError: The number of microlitres was out of range.
+        """
+        delta: FixedPointVolumeDelta = cls.__new__(cls)
+        delta._value_as_microlitre = check_count(value_as_microlitre)
+        return delta
+
+    def as_unit(self, unit: Unit) -> int:
+        """Return the volume delta in the unit, rounded to the nearest integer."""
+        numerator, denominator = get_fixed_point_ratio(unit)
+        return from_count(self._value_as_microlitre, numerator, denominator)
+
+    def to_volume_delta(self) -> VolumeDelta:
+        """Return the volume delta as a floating-point :py:class:`VolumeDelta`."""
+        return VolumeDelta(
+            self._value_as_microlitre / FIXED_POINT_RESOLUTION_PER_CUBIC_METRE,
+            Unit.CUBIC_METRE,
+        )
+
+    def __mul__(self, value: int) -> "FixedPointVolumeDelta":
+        """Return the volume delta scaled by the integer."""
+        return FixedPointVolumeDelta._from_value_as_microlitre(
+            self._value_as_microlitre * value
+        )
+
+    def __rmul__(self, value: int) -> "FixedPointVolumeDelta":
+        """Return the volume delta scaled by the integer."""
+        return self * value
+
+    @overload
+    def __floordiv__(self, other: int) -> "FixedPointVolumeDelta": ...
+
+    @overload
+    def __floordiv__(self, other: "FixedPointVolumeDelta") -> int: ...
+
+    def __floordiv__(
+        self, other: "int | FixedPointVolumeDelta"
+    ) -> "FixedPointVolumeDelta | int":
+        """Return a floored scaled volume delta or the floored ratio between them.
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is an :py:class:`int`, return the volume delta scaled by the
+          inverse of the value, floored to the nearest microlitre.
+        - If the argument is a :py:class:`FixedPointVolumeDelta`, return the floored
+          ratio between the two.
+        """
+        if isinstance(other, FixedPointVolumeDelta):
+            return self._value_as_microlitre // other._value_as_microlitre
+
+        return FixedPointVolumeDelta._from_value_as_microlitre(
+            self._value_as_microlitre // other
+        )
+
+    def __add__(self, other: "FixedPointVolumeDelta") -> "FixedPointVolumeDelta":
+        """Return the sum of the volume deltas."""
+        # Adding to a fixed-point volume is handled by the __radd__ method of the
+        # fixed-point volume class
+        if not isinstance(other, FixedPointVolumeDelta):  # type: ignore[reportUnnecessaryIsInstance]
+            return NotImplemented
+
+        return FixedPointVolumeDelta._from_value_as_microlitre(
+            self._value_as_microlitre + other._value_as_microlitre
+        )
+
+    def __sub__(self, other: "FixedPointVolumeDelta") -> "FixedPointVolumeDelta":
+        """Return the difference between the volume deltas."""
+        return FixedPointVolumeDelta._from_value_as_microlitre(
+            self._value_as_microlitre - other._value_as_microlitre
+        )
+
+    def __neg__(self) -> "FixedPointVolumeDelta":
+        """Return the inverse of the volume delta."""
+        return FixedPointVolumeDelta._from_value_as_microlitre(
+            -self._value_as_microlitre
+        )
+
+    def __abs__(self) -> "FixedPointVolumeDelta":
+        """Return the absolute version of the volume delta."""
+        return FixedPointVolumeDelta._from_value_as_microlitre(
+            abs(self._value_as_microlitre)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the objects are equal fixed-point volume deltas."""
+        if not isinstance(other, FixedPointVolumeDelta):
+            return NotImplemented
+
+        return self._value_as_microlitre == other._value_as_microlitre
+
+    def __lt__(self, other: "FixedPointVolumeDelta") -> bool:
+        """Return whether the volume delta is less than the other."""
+        return self._value_as_microlitre < other._value_as_microlitre
+
+    def __le__(self, other: "FixedPointVolumeDelta") -> bool:
+        """Return whether the volume delta is less than or equal to the other."""
+        return self._value_as_microlitre <= other._value_as_microlitre
+
+    def __gt__(self, other: "FixedPointVolumeDelta") -> bool:
+        """Return whether the volume delta is greater than the other."""
+        return self._value_as_microlitre > other._value_as_microlitre
+
+    def __ge__(self, other: "FixedPointVolumeDelta") -> bool:
+        """Return whether the volume delta is greater than or equal to the other."""
+        return self._value_as_microlitre >= other._value_as_microlitre
+
+    def __hash__(self) -> int:
+        """Return the hash of the volume delta."""
+        return hash(self._value_as_microlitre)
+
+    def __str__(self) -> str:
+        """Return a string representation of the volume delta."""
+        return f"{self._value_as_microlitre} uL"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the volume delta for developers."""
+        return f"{__class__.__name__}({self._value_as_microlitre} uL)"
@@ -0,0 +1,137 @@
+"""Module for the volume series class."""
+
+# pyright: reportPrivateUsage=false
+# pylint: disable=protected-access
+# ruff: noqa: SLF001, TID252
+
+from typing import TYPE_CHECKING
+
+from ..ring_buffer import RingBuffer
+from .exceptions import NegativeVolumeValueError
+from .unit import Unit, get_name, get_unit_delta_per_cubic_metre
+from .volume import Volume
+from .volume_array import VolumeArray
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ..time import Time
+
+
+class VolumeSeries(RingBuffer):
+    """A rolling window of the most recent volumes, with optional timestamps.
+
+    The volumes are stored as cubic metres in a buffer preallocated on initialisation,
+    so that pushing a volume drops the oldest one once the series is full,
+    rather than allocating. The volumes are indexed from the oldest (0) to the
+    latest (-1), and are expressed in the unit of the series when retrieved.
+    """
+
+    __slots__ = ("_unit", "_unit_delta_per_cubic_metre")
+
+    def __init__(self, capacity: int, unit: Unit, *, timestamped: bool = False) -> None:
+        """Initialise a new, empty series, holding up to the number of volumes.
+
+        If the series is timestamped, every volume is pushed along with the time it
+        was measured at.
+
+        Raises:
+            ValueError: The capacity is less than 1.
+        """
+        super().__init__(capacity, timestamped=timestamped)
+        self._unit = unit
+        self._unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(unit)
+
+    def push(self, volume: Volume, time: "Time | None" = None) -> None:
+        """Push a volume, dropping the oldest one if the series is full.
+
+        Does not allocate.
+
+        Raises:
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        end = self._end
+        if end == self._limit:
+            end = self._compact()
+        times = self._times
+        if times is not None and time is not None:
+            times[end] = time._value_as_second
+        elif times is not None or time is not None:
+            self._raise_time_error()
+        self._values[end] = volume._value_as_cubic_metre
+        self._end = end + 1
+
+    def push_value(self, value: float, time: "Time | None" = None) -> None:
+        """Push a raw value in the unit of the series, as a volume.
+
+        Raises:
+            NegativeVolumeValueError: The negative value produced a volume less than
+                0m^3.
+            ValueError: The series is timestamped but no time was given, or the series
+                is not timestamped but a time was given.
+        """
+        if value < 0:
+            raise NegativeVolumeValueError(value=value)
+
+        self._push(value / self._unit_delta_per_cubic_metre, time)
+
+    def _create(self, value_as_cubic_metre: float) -> Volume:
+        """Create a volume in the unit of the series from its value in cubic metres."""
+        return Volume._create(
+            value_as_cubic_metre * self._unit_delta_per_cubic_metre,
+            self._unit,
+            value_as_cubic_metre,
+        )
+
+    def latest(self) -> Volume:
+        """Return the most recently pushed volume.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(-1))
+
+    def oldest(self) -> Volume:
+        """Return the least recently pushed volume still in the series.
+
+        Raises:
+            IndexError: The series is empty.
+        """
+        return self._create(self._get_value(0))
+
+    def window(self, count: "int | None" = None) -> VolumeArray:
+        """Return the latest volumes, from oldest to latest.
+
+        All of the volumes are returned if the count is None, and at most as many
+        volumes as the series holds otherwise. The window is a view of the series rather
+        than a copy, so it is only valid until the next push or clear.
+        """
+        return VolumeArray._from_values_as_cubic_metre(
+            self._view_values(count), self._unit
+        )
+
+    def __getitem__(self, index: int) -> Volume:
+        """Return the volume at the index.
+
+        Raises:
+            IndexError: There is no volume at the index.
+        """
+        return self._create(self._get_value(index))
+
+    def __iter__(self) -> "Iterator[Volume]":
+        """Return an iterator over the volumes, from oldest to latest.
+
+        Each volume is only created when it is reached.
+        """
+        for value_as_cubic_metre in self._iter_values():
+            yield self._create(value_as_cubic_metre)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the volume series."""
+        values = [
+            value * self._unit_delta_per_cubic_metre for value in self._iter_values()
+        ]
+        return (
+            f"VolumeSeries({values}, {get_name(self._unit)}, capacity={self._capacity})"
+        )
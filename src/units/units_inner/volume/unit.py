@@ -1,23 +1,22 @@
-"""Module for the volume unit enum."""
+"""Module for the volume units.
 
-# ruff: noqa: TID252
+Generated by `tools/generate_units.py` from `tools/units_spec.json`, so edit the
+spec & rerun the generator rather than editing this module.
+"""
 
 from typing import TYPE_CHECKING, Final
 
-from ..length import Unit as DistanceUnit
-from ..length import get_unit_abbreviation as get_distance_unit_abbreviation
-from ..length import get_unit_delta_per_metre as get_distance_unit_delta_per_metre
-from ..length import get_unit_name as get_distance_unit_name
-
 if TYPE_CHECKING:
     from enum import IntEnum
 else:
     IntEnum = object
 
+_NAN: Final = float("nan")
+
 
-# NB: When adding a new unit, be sure to also update:
-# - The info list in helpers.py
-# - The `test_get_X_value_as_unit` test in `test_X.py` and `test_X_delta.py`
+# NB: When adding a new unit, add it to `tools/units_spec.json` & rerun
+# `tools/generate_units.py`, which also regenerates the tests of the unit
+# tables
 class Unit(IntEnum):
     """A volume unit.
 
@@ -33,80 +32,95 @@ class Unit(IntEnum):
     MICROLITRE = 4
 
 
-class _UnitInfo:
-    """Information associated with a volume particular unit.
+# The name & abbreviation of each unit, indexed by the unit. Element 0 does not
+# correspond to a unit.
+_NAMES: Final = (
+    "",
+    "cubic metre",
+    "litre",
+    "millilitre",
+    "microlitre",
+)
+_ABBREVIATIONS: Final = (
+    "",
+    "m^3",
+    "L",
+    "mL",
+    "uL",
+)
+
+# The change in volume expressed as each unit per 1m^3, indexed by the unit. Element 0
+# does not correspond to a unit, and so holds NaN.
+UNIT_DELTAS_PER_CUBIC_METRE: Final = (
+    _NAN,
+    1,
+    1000.0,
+    1000000.0,
+    1000000000.0,
+)
+
+# Dense from-unit x to-unit table of conversion factors. Units are small contiguous
+# ints, so the factor that converts a value from one unit to another is at index
+# `from_unit * CONVERSION_FACTORS_STRIDE + to_unit`. Row & column 0 do not correspond to
+# a unit, and so hold NaN. A tuple is used rather than an array, as reading an element
+# of a tuple returns the stored float instead of allocating a new one.
+CONVERSION_FACTORS_STRIDE: Final = 5
+CONVERSION_FACTORS: Final = (
+    # Row 0 does not correspond to a unit
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    _NAN,
+    # From cubic metre to each unit
+    _NAN,
+    1.0,
+    1000.0,
+    1000000.0,
+    1000000000.0,
+    # From litre to each unit
+    _NAN,
+    0.001,
+    1.0,
+    1000.0,
+    1000000.0,
+    # From millilitre to each unit
+    _NAN,
+    1e-06,
+    0.001,
+    1.0,
+    1000.0,
+    # From microlitre to each unit
+    _NAN,
+    1e-09,
+    1e-06,
+    0.001,
+    1.0,
+)
+
+# Fixed-point quantities hold an integer count of microlitres. The number of microlitres
+# per 1 of each unit is stored as an integer ratio, indexed by the unit, so that
+# converting to & from the units stays in ints. Element 0 does not correspond to a unit.
+FIXED_POINT_RESOLUTION_PER_CUBIC_METRE: Final = 1_000_000_000
+_FIXED_POINT_RATIOS: Final = (
+    (0, 1),
+    (1000000000, 1),
+    (1000000, 1),
+    (1000, 1),
+    (1, 1),
+)
+
+
+def _check_unit(unit: Unit) -> None:
+    """Check that the unit is a volume unit.
 
     Not intended for public use.
-    """
 
-    def __init__(
-        self,
-        unit: Unit,
-        name: str,
-        abbreviation: str,
-        unit_delta_per_cubic_metre: float,
-    ) -> None:
-        """Initialise a collection of info associated with a unit."""
-        self._unit = unit
-        self._name = name
-        self._abbreviation = abbreviation
-        self._unit_delta_per_cubic_metre = unit_delta_per_cubic_metre
-
-    @property
-    def unit(self) -> Unit:
-        """The unit the information relates to."""
-        return self._unit
-
-    @property
-    def name(self) -> str:
-        """The name of the unit."""
-        return self._name
-
-    @property
-    def abbreviation(self) -> str:
-        """The abbreviation of the unit."""
-        return self._abbreviation
-
-    @property
-    def unit_delta_per_cubic_metre(self) -> float:
-        """The change in volume expressed as the unit per 1m^3.
-
-        Equivalent to the gradient of the cubic-metre-vs-unit graph.
-        """
-        return self._unit_delta_per_cubic_metre
-
-
-# All info is entered here to create a SSoT
-_UNITS_INFO: Final = [
-    _UnitInfo(
-        unit=Unit.CUBIC_METRE,
-        name=f"cubic {get_distance_unit_name(DistanceUnit.METRE)}",
-        abbreviation=f"{get_distance_unit_abbreviation(DistanceUnit.METRE)}^3",
-        unit_delta_per_cubic_metre=get_distance_unit_delta_per_metre(DistanceUnit.METRE)
-        ** 3,
-    ),
-    _UnitInfo(
-        unit=Unit.LITRE,
-        name="litre",
-        abbreviation="L",
-        unit_delta_per_cubic_metre=1e3,
-    ),
-    _UnitInfo(
-        unit=Unit.MILLILITRE,
-        name="millilitre",
-        abbreviation="mL",
-        unit_delta_per_cubic_metre=1e6,
-    ),
-    _UnitInfo(
-        unit=Unit.MICROLITRE,
-        name="microlitre",
-        abbreviation="uL",
-        unit_delta_per_cubic_metre=1e9,
-    ),
-]
-
-# Convert into dictionary for quick lookup
-_UNIT_TO_INFO_MAP: Final = {info.unit: info for info in _UNITS_INFO}
+    Raises:
+        ValueError: The unit is not a volume unit.
+    """
+    if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+        raise ValueError
 
 
 def get_name(unit: Unit) -> str:
@@ -114,10 +128,8 @@ def get_name(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].name
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _NAMES[unit]
 
 
 def get_abbreviation(unit: Unit) -> str:
@@ -125,20 +137,23 @@ def get_abbreviation(unit: Unit) -> str:
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].abbreviation
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return _ABBREVIATIONS[unit]
 
 
-def get_unit_delta_per_cubic_metre(
-    unit: Unit,
-) -> float:
+def get_unit_delta_per_cubic_metre(unit: Unit) -> float:
     """Get the change in volume expressed as the unit per 1m^3.
 
     Not intended for public use.
     """
-    try:
-        return _UNIT_TO_INFO_MAP[unit].unit_delta_per_cubic_metre
-    except KeyError as e:
-        raise ValueError from e
+    _check_unit(unit)
+    return UNIT_DELTAS_PER_CUBIC_METRE[unit]
+
+
+def get_fixed_point_ratio(unit: Unit) -> tuple[int, int]:
+    """Get the number of microlitres per 1 of the volume unit, as an integer ratio.
+
+    Not intended for public use.
+    """
+    _check_unit(unit)
+    return _FIXED_POINT_RATIOS[unit]
@@ -1,9 +1,14 @@
 """Module for the volume class."""
 
+# pyright: reportPrivateUsage=false
+
 from typing import overload
 
 from .exceptions import NegativeVolumeValueError
 from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    UNIT_DELTAS_PER_CUBIC_METRE,
     Unit,
     get_abbreviation,
     get_name,
@@ -15,6 +20,8 @@ from .volume_delta import VolumeDelta
 class Volume:
     """The measure of a three-dimensional space."""
 
+    __slots__ = ("_unit", "_value", "_value_as_cubic_metre")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new volume.
 
@@ -27,13 +34,43 @@ class Volume:
 
         self._value = value
         self._unit = unit
+        internal_unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(self._unit)
+        self._value_as_cubic_metre = self._value / internal_unit_delta_per_cubic_metre
+
+    @classmethod
+    def _create(cls, value: float, unit: Unit, value_as_cubic_metre: float) -> "Volume":
+        """Create a volume from its value in both the unit & cubic metres.
+
+        Not intended for public use.
+
+        The value is not converted again, and the only validation is a single
+        comparison of the value in cubic metres.
+
+        Raises:
+            NegativeVolumeValueError: The value produced a volume less than 0m^3.
+        """
+        if value_as_cubic_metre < 0:
+            raise NegativeVolumeValueError(value=value)
+
+        volume: Volume = cls.__new__(cls)
+        volume._value = value
+        volume._unit = unit
+        volume._value_as_cubic_metre = value_as_cubic_metre
+        return volume
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the volume, expressed as the unit."""
-        internal_unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(self._unit)
-        value_as_cubic_metre = self._value / internal_unit_delta_per_cubic_metre
-        external_unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(unit)
-        return external_unit_delta_per_cubic_metre * value_as_cubic_metre
+        """Return the volume, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not a volume unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __add__(self, delta: VolumeDelta) -> "Volume":
         """Return the sum of the volume and the difference.
@@ -42,10 +79,20 @@ class Volume:
             NegativeVolumeValueError: The sum of the volume and the difference was less
                 than 0m^3.
         """
-        value_as_cubic_metre = self.as_unit(Unit.CUBIC_METRE)
-        delta_value_as_cubic_metre = delta.as_unit(Unit.CUBIC_METRE)
-        value_sum_as_cubic_metre = value_as_cubic_metre + delta_value_as_cubic_metre
-        return Volume(value_sum_as_cubic_metre, Unit.CUBIC_METRE)
+        if self._unit == delta._unit:
+            value_sum = self._value + delta._value
+            return Volume._create(
+                value_sum,
+                self._unit,
+                value_sum / UNIT_DELTAS_PER_CUBIC_METRE[self._unit],
+            )
+
+        value_sum_as_cubic_metre = (
+            self._value_as_cubic_metre + delta._value_as_cubic_metre
+        )
+        return Volume._create(
+            value_sum_as_cubic_metre, Unit.CUBIC_METRE, value_sum_as_cubic_metre
+        )
 
     def __radd__(self, delta: VolumeDelta) -> "Volume":
         """Return the sum of the volume and the difference."""
@@ -72,15 +119,36 @@ class Volume:
                 than 0m^3. Error can only be raised when other is a
                 :py:class:`VolumeDelta`.
         """
-        value_as_cubic_metre = self.as_unit(Unit.CUBIC_METRE)
-        other_value_as_cubic_metre = other.as_unit(Unit.CUBIC_METRE)
+        if self._unit == other._unit:
+            value_difference = self._value - other._value
+            value_difference_as_cubic_metre = (
+                value_difference / UNIT_DELTAS_PER_CUBIC_METRE[self._unit]
+            )
+            return (
+                VolumeDelta._create(
+                    value_difference, self._unit, value_difference_as_cubic_metre
+                )
+                if isinstance(other, Volume)
+                else Volume._create(
+                    value_difference, self._unit, value_difference_as_cubic_metre
+                )
+            )
+
         value_difference_as_cubic_metre = (
-            value_as_cubic_metre - other_value_as_cubic_metre
+            self._value_as_cubic_metre - other._value_as_cubic_metre
         )
         return (
-            VolumeDelta(value_difference_as_cubic_metre, Unit.CUBIC_METRE)
+            VolumeDelta._create(
+                value_difference_as_cubic_metre,
+                Unit.CUBIC_METRE,
+                value_difference_as_cubic_metre,
+            )
             if isinstance(other, Volume)
-            else Volume(value_difference_as_cubic_metre, Unit.CUBIC_METRE)
+            else Volume._create(
+                value_difference_as_cubic_metre,
+                Unit.CUBIC_METRE,
+                value_difference_as_cubic_metre,
+            )
         )
 
     def __eq__(self, other: object) -> bool:
@@ -88,27 +156,27 @@ class Volume:
         if not isinstance(other, Volume):
             return NotImplemented
 
-        return self.as_unit(Unit.CUBIC_METRE) == other.as_unit(Unit.CUBIC_METRE)
+        return self._value_as_cubic_metre == other._value_as_cubic_metre
 
     def __lt__(self, other: "Volume") -> bool:
         """Return whether the volume is less than the other."""
-        return self.as_unit(Unit.CUBIC_METRE) < other.as_unit(Unit.CUBIC_METRE)
+        return self._value_as_cubic_metre < other._value_as_cubic_metre
 
     def __le__(self, other: "Volume") -> bool:
         """Return whether the volume is less than or equal to the other."""
-        return self.as_unit(Unit.CUBIC_METRE) <= other.as_unit(Unit.CUBIC_METRE)
+        return self._value_as_cubic_metre <= other._value_as_cubic_metre
 
     def __gt__(self, other: "Volume") -> bool:
         """Return whether the volume is greater than the other."""
-        return self.as_unit(Unit.CUBIC_METRE) > other.as_unit(Unit.CUBIC_METRE)
+        return self._value_as_cubic_metre > other._value_as_cubic_metre
 
     def __ge__(self, other: "Volume") -> bool:
         """Return whether the volume is greater than or equal to the other."""
-        return self.as_unit(Unit.CUBIC_METRE) >= other.as_unit(Unit.CUBIC_METRE)
+        return self._value_as_cubic_metre >= other._value_as_cubic_metre
 
     def __hash__(self) -> int:
         """Return the hash of the volume."""
-        return hash(self.as_unit(Unit.CUBIC_METRE))
+        return hash(self._value_as_cubic_metre)
 
     def __str__(self) -> str:
         """Return a string representation of the volume."""
@@ -0,0 +1,245 @@
+"""Module for the volume array class."""
+
+# pyright: reportPrivateUsage=false
+# ruff: noqa: TID252
+
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    create_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .exceptions import NegativeVolumeValueError
+from .unit import Unit, get_name, get_unit_delta_per_cubic_metre
+from .volume import Volume
+from .volume_delta import VolumeDelta
+from .volume_delta_array import VolumeDeltaArray
+
+if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Iterable, Iterator
+
+
+def _check_non_negative(
+    values_as_cubic_metre: "array[float] | memoryview", unit: Unit
+) -> None:
+    """Check that none of the volumes are less than 0m^3^3.
+
+    Raises:
+        NegativeVolumeValueError: One of the volumes was less than 0m^3^3.
+    """
+    if not values_as_cubic_metre:
+        return
+
+    minimum_value_as_cubic_metre = min(values_as_cubic_metre)
+    if minimum_value_as_cubic_metre < 0:
+        internal_unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(unit)
+        raise NegativeVolumeValueError(
+            value=minimum_value_as_cubic_metre * internal_unit_delta_per_cubic_metre
+        )
+
+
+class VolumeArray:
+    """A homogeneous array of volumes.
+
+    The volumes are stored in bulk as cubic metres, and share a single unit that
+    they are expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_cubic_metre")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of volumes, with all values in the unit.
+
+        Raises:
+            NegativeVolumeValueError: One of the values produced a volume less than
+                0m^3^3.
+        """
+        internal_unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(unit)
+        values_as_cubic_metre = create_values(
+            values, 1 / internal_unit_delta_per_cubic_metre
+        )
+        _check_non_negative(values_as_cubic_metre, unit)
+
+        self._unit = unit
+        self._values_as_cubic_metre: array[float] | memoryview = values_as_cubic_metre
+
+    @classmethod
+    def _from_values_as_cubic_metre(
+        cls, values_as_cubic_metre: "array[float] | memoryview", unit: Unit
+    ) -> "VolumeArray":
+        """Create an array of volumes directly from a buffer of cubic metres.
+
+        The buffer is used as-is, rather than copied, and is assumed to be valid.
+        """
+        volumes: VolumeArray = cls.__new__(cls)
+        volumes._unit = unit
+        volumes._values_as_cubic_metre = values_as_cubic_metre
+        return volumes
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the volumes, expressed as the unit."""
+        external_unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(unit)
+        return create_values(
+            self._values_as_cubic_metre, external_unit_delta_per_cubic_metre
+        )
+
+    def __len__(self) -> int:
+        """Return the number of volumes."""
+        return len(self._values_as_cubic_metre)
+
+    @overload
+    def __getitem__(self, index: int) -> Volume: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "VolumeArray": ...
+
+    def __getitem__(self, index: "int | slice") -> "Volume | VolumeArray":
+        """Return the volume at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return VolumeArray._from_values_as_cubic_metre(
+                memoryview(self._values_as_cubic_metre)[index], self._unit
+            )
+
+        internal_unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(self._unit)
+        return Volume(
+            self._values_as_cubic_metre[index] * internal_unit_delta_per_cubic_metre,
+            self._unit,
+        )
+
+    def __iter__(self) -> "Iterator[Volume]":
+        """Return an iterator over the volumes."""
+        internal_unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(self._unit)
+        for value_as_cubic_metre in self._values_as_cubic_metre:
+            yield Volume(
+                value_as_cubic_metre * internal_unit_delta_per_cubic_metre, self._unit
+            )
+
+    def __add__(self, delta: "VolumeDelta | VolumeDeltaArray") -> "VolumeArray":
+        """Return the sum of the volumes and the difference(s).
+
+        A single volume delta is added to every volume, while an array of volume
+        deltas is added elementwise.
+
+        Raises:
+            NegativeVolumeValueError: One of the sums was less than 0m^3^3.
+            ValueError: The arrays are of different lengths.
+        """
+        delta_values_as_cubic_metre = (
+            delta.as_unit(Unit.CUBIC_METRE)
+            if isinstance(delta, VolumeDelta)
+            else delta._values_as_cubic_metre
+        )
+        value_sums_as_cubic_metre = add_values(
+            self._values_as_cubic_metre, delta_values_as_cubic_metre
+        )
+        _check_non_negative(value_sums_as_cubic_metre, self._unit)
+        return VolumeArray._from_values_as_cubic_metre(
+            value_sums_as_cubic_metre, self._unit
+        )
+
+    def __radd__(self, delta: VolumeDelta) -> "VolumeArray":
+        """Return the sum of the volumes and the difference.
+
+        Raises:
+            NegativeVolumeValueError: One of the sums was less than 0m^3^3.
+        """
+        return self + delta
+
+    @overload
+    def __sub__(self, other: "Volume | VolumeArray") -> VolumeDeltaArray: ...
+
+    @overload
+    def __sub__(self, other: "VolumeDelta | VolumeDeltaArray") -> "VolumeArray": ...
+
+    def __sub__(
+        self, other: "Volume | VolumeArray | VolumeDelta | VolumeDeltaArray"
+    ) -> "VolumeDeltaArray | VolumeArray":
+        """Return the difference between the volumes and the other(s).
+
+        The behaviour depends upon the type of the argument.
+
+        - If the argument is a volume or an array of volumes, return the differences
+          between the volumes.
+        - If the argument is a volume delta or an array of volume deltas, return the
+          volumes less the differences.
+
+        A single argument is subtracted from every volume, while an array is
+        subtracted elementwise.
+
+        Raises:
+            NegativeVolumeValueError: One of the differences was less than 0m^3^3. Error
+                can only be raised when other is a :py:class:`VolumeDelta` or
+                :py:class:`VolumeDeltaArray`.
+            ValueError: The arrays are of different lengths.
+        """
+        other_values_as_cubic_metre = (
+            other.as_unit(Unit.CUBIC_METRE)
+            if isinstance(other, (Volume, VolumeDelta))
+            else other._values_as_cubic_metre
+        )
+        value_differences_as_cubic_metre = subtract_values(
+            self._values_as_cubic_metre, other_values_as_cubic_metre
+        )
+        if isinstance(other, (Volume, VolumeArray)):
+            return VolumeDeltaArray._from_values_as_cubic_metre(
+                value_differences_as_cubic_metre, self._unit
+            )
+
+        _check_non_negative(value_differences_as_cubic_metre, self._unit)
+        return VolumeArray._from_values_as_cubic_metre(
+            value_differences_as_cubic_metre, self._unit
+        )
+
+    def __lt__(self, other: "Volume | VolumeArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the volumes less than the other volume(s)."""
+        other_values_as_cubic_metre = (
+            other.as_unit(Unit.CUBIC_METRE)
+            if isinstance(other, Volume)
+            else other._values_as_cubic_metre
+        )
+        return less_than(self._values_as_cubic_metre, other_values_as_cubic_metre)
+
+    def __le__(self, other: "Volume | VolumeArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the volumes less than or equal to the other volume(s)."""
+        other_values_as_cubic_metre = (
+            other.as_unit(Unit.CUBIC_METRE)
+            if isinstance(other, Volume)
+            else other._values_as_cubic_metre
+        )
+        return less_than_or_equal_to(
+            self._values_as_cubic_metre, other_values_as_cubic_metre
+        )
+
+    def __gt__(self, other: "Volume | VolumeArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the volumes greater than the other volume(s)."""
+        other_values_as_cubic_metre = (
+            other.as_unit(Unit.CUBIC_METRE)
+            if isinstance(other, Volume)
+            else other._values_as_cubic_metre
+        )
+        return greater_than(self._values_as_cubic_metre, other_values_as_cubic_metre)
+
+    def __ge__(self, other: "Volume | VolumeArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the volumes greater than or equal to the other volume(s)."""
+        other_values_as_cubic_metre = (
+            other.as_unit(Unit.CUBIC_METRE)
+            if isinstance(other, Volume)
+            else other._values_as_cubic_metre
+        )
+        return greater_than_or_equal_to(
+            self._values_as_cubic_metre, other_values_as_cubic_metre
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the volumes."""
+        values = list(self.as_unit(self._unit))
+        return f"VolumeArray({values}, {get_name(self._unit)})"
@@ -3,6 +3,9 @@
 from typing import overload
 
 from .unit import (
+    CONVERSION_FACTORS,
+    CONVERSION_FACTORS_STRIDE,
+    UNIT_DELTAS_PER_CUBIC_METRE,
     Unit,
     get_abbreviation,
     get_name,
@@ -13,22 +16,51 @@ from .unit import (
 class VolumeDelta:
     """The difference between two volumes."""
 
+    __slots__ = ("_unit", "_value", "_value_as_cubic_metre")
+
     def __init__(self, value: float, unit: Unit) -> None:
         """Initialise a new volume difference."""
         self._value = value
         self._unit = unit
+        internal_unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(self._unit)
+        self._value_as_cubic_metre = self._value / internal_unit_delta_per_cubic_metre
+
+    @classmethod
+    def _create(
+        cls, value: float, unit: Unit, value_as_cubic_metre: float
+    ) -> "VolumeDelta":
+        """Create a volume difference from its value in both the unit & cubic metres.
+
+        Not intended for public use.
+
+        The value is not converted again.
+        """
+        volume_delta: VolumeDelta = cls.__new__(cls)
+        volume_delta._value = value
+        volume_delta._unit = unit
+        volume_delta._value_as_cubic_metre = value_as_cubic_metre
+        return volume_delta
 
     def as_unit(self, unit: Unit) -> float:
-        """Return the volume difference, expressed as the unit."""
-        internal_unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(self._unit)
-        value_as_cubic_metre = self._value / internal_unit_delta_per_cubic_metre
-        external_unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(unit)
-        return external_unit_delta_per_cubic_metre * value_as_cubic_metre
+        """Return the volume difference, expressed as the unit.
+
+        Raises:
+            ValueError: The unit is not a volume unit.
+        """
+        if not 0 < unit < CONVERSION_FACTORS_STRIDE:
+            raise ValueError
+
+        return (
+            self._value
+            * CONVERSION_FACTORS[self._unit * CONVERSION_FACTORS_STRIDE + unit]
+        )
 
     def __mul__(self, value: float) -> "VolumeDelta":
         """Return a volume difference scaled by the value."""
         scaled_value = self._value * value
-        return VolumeDelta(scaled_value, self._unit)
+        return VolumeDelta._create(
+            scaled_value, self._unit, self._value_as_cubic_metre * value
+        )
 
     def __rmul__(self, value: float) -> "VolumeDelta":
         """Return a volume difference scaled by the value."""
@@ -51,12 +83,12 @@ class VolumeDelta:
           differences
         """
         if isinstance(other, VolumeDelta):
-            value_as_cubic_metre = self.as_unit(Unit.CUBIC_METRE)
-            other_value_as_cubic_metre = other.as_unit(Unit.CUBIC_METRE)
-            return value_as_cubic_metre / other_value_as_cubic_metre
+            return self._value_as_cubic_metre / other._value_as_cubic_metre
 
         scaled_value = self._value / other
-        return VolumeDelta(scaled_value, self._unit)
+        return VolumeDelta._create(
+            scaled_value, self._unit, self._value_as_cubic_metre / other
+        )
 
     def __add__(self, other: "VolumeDelta") -> "VolumeDelta":
         """Return the sum of the volume differences."""
@@ -66,10 +98,20 @@ class VolumeDelta:
         if not isinstance(other, VolumeDelta):  # type: ignore[reportUnnecessaryIsInstance]
             return NotImplemented
 
-        value_as_cubic_metre = self.as_unit(Unit.CUBIC_METRE)
-        delta_value_as_cubic_metre = other.as_unit(Unit.CUBIC_METRE)
-        added_value_as_cubic_metre = value_as_cubic_metre + delta_value_as_cubic_metre
-        return VolumeDelta(added_value_as_cubic_metre, Unit.CUBIC_METRE)
+        if self._unit == other._unit:
+            value_sum = self._value + other._value
+            return VolumeDelta._create(
+                value_sum,
+                self._unit,
+                value_sum / UNIT_DELTAS_PER_CUBIC_METRE[self._unit],
+            )
+
+        added_value_as_cubic_metre = (
+            self._value_as_cubic_metre + other._value_as_cubic_metre
+        )
+        return VolumeDelta._create(
+            added_value_as_cubic_metre, Unit.CUBIC_METRE, added_value_as_cubic_metre
+        )
 
     def __sub__(self, delta: "VolumeDelta") -> "VolumeDelta":
         """Return the difference between the volume differences."""
@@ -78,57 +120,55 @@ class VolumeDelta:
     def __neg__(self) -> "VolumeDelta":
         """Return the inverse of the volume difference."""
         inverted_value = -self._value
-        return VolumeDelta(inverted_value, self._unit)
+        return VolumeDelta._create(
+            inverted_value, self._unit, -self._value_as_cubic_metre
+        )
 
     def __abs__(self) -> "VolumeDelta":
         """Return the absolute version of the volume difference."""
         absolute_value = abs(self._value)
-        return VolumeDelta(absolute_value, self._unit)
+        return VolumeDelta._create(
+            absolute_value, self._unit, abs(self._value_as_cubic_metre)
+        )
 
     def __floordiv__(self, other: "VolumeDelta") -> float:
         """Return the floored ratio between the volume differences."""
-        value_as_cubic_metre = self.as_unit(Unit.CUBIC_METRE)
-        other_value_as_cubic_metre = other.as_unit(Unit.CUBIC_METRE)
-        return value_as_cubic_metre // other_value_as_cubic_metre
+        return self._value_as_cubic_metre // other._value_as_cubic_metre
 
     def __mod__(self, other: "VolumeDelta") -> float:
         """Return the remainder of the ratio between the volume differences."""
-        value_as_cubic_metre = self.as_unit(Unit.CUBIC_METRE)
-        other_value_as_cubic_metre = other.as_unit(Unit.CUBIC_METRE)
-        return value_as_cubic_metre % other_value_as_cubic_metre
+        return self._value_as_cubic_metre % other._value_as_cubic_metre
 
     def __divmod__(self, other: "VolumeDelta") -> tuple[float, float]:
         """Return the quotient & remainder of the ratio between the volume deltas."""
-        value_as_cubic_metre = self.as_unit(Unit.CUBIC_METRE)
-        other_value_as_cubic_metre = other.as_unit(Unit.CUBIC_METRE)
-        return divmod(value_as_cubic_metre, other_value_as_cubic_metre)
+        return divmod(self._value_as_cubic_metre, other._value_as_cubic_metre)
 
     def __eq__(self, other: object) -> bool:
         """Return whether the objects are equal volume differences."""
         if not isinstance(other, VolumeDelta):
             return NotImplemented
 
-        return self.as_unit(Unit.CUBIC_METRE) == other.as_unit(Unit.CUBIC_METRE)
+        return self._value_as_cubic_metre == other._value_as_cubic_metre
 
     def __lt__(self, other: "VolumeDelta") -> bool:
         """Return whether the volume difference is less than the other."""
-        return self.as_unit(Unit.CUBIC_METRE) < other.as_unit(Unit.CUBIC_METRE)
+        return self._value_as_cubic_metre < other._value_as_cubic_metre
 
     def __le__(self, other: "VolumeDelta") -> bool:
         """Return whether the volume delta is less than or equal to the other."""
-        return self.as_unit(Unit.CUBIC_METRE) <= other.as_unit(Unit.CUBIC_METRE)
+        return self._value_as_cubic_metre <= other._value_as_cubic_metre
 
     def __gt__(self, other: "VolumeDelta") -> bool:
         """Return whether the volume difference is greater than the other."""
-        return self.as_unit(Unit.CUBIC_METRE) > other.as_unit(Unit.CUBIC_METRE)
+        return self._value_as_cubic_metre > other._value_as_cubic_metre
 
     def __ge__(self, other: "VolumeDelta") -> bool:
         """Return whether the volume delta is greater than or equal to the other."""
-        return self.as_unit(Unit.CUBIC_METRE) >= other.as_unit(Unit.CUBIC_METRE)
+        return self._value_as_cubic_metre >= other._value_as_cubic_metre
 
     def __hash__(self) -> int:
         """Return the hash of the volume difference."""
-        return hash(self.as_unit(Unit.CUBIC_METRE))
+        return hash(self._value_as_cubic_metre)
 
     def __str__(self) -> str:
         """Return a string representation of the volume difference."""
@@ -0,0 +1,219 @@
+"""Module for the volume delta array class."""
+
+# ruff: noqa: TID252
+
+from array import array
+from typing import TYPE_CHECKING, overload
+
+from ..quantity_array import (
+    add_values,
+    create_values,
+    greater_than,
+    greater_than_or_equal_to,
+    less_than,
+    less_than_or_equal_to,
+    subtract_values,
+)
+from .unit import Unit, get_name, get_unit_delta_per_cubic_metre
+from .volume_delta import VolumeDelta
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class VolumeDeltaArray:
+    """A homogeneous array of volume deltas.
+
+    The deltas are stored in bulk as cubic metres, and share a single unit that they
+    are expressed in when retrieved.
+    """
+
+    __slots__ = ("_unit", "_values_as_cubic_metre")
+
+    def __init__(self, values: "Iterable[float]", unit: Unit) -> None:
+        """Initialise a new array of volume deltas, with all values in the unit."""
+        internal_unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(unit)
+        self._unit = unit
+        self._values_as_cubic_metre: array[float] | memoryview = create_values(
+            values, 1 / internal_unit_delta_per_cubic_metre
+        )
+
+    @classmethod
+    def _from_values_as_cubic_metre(
+        cls, values_as_cubic_metre: "array[float] | memoryview", unit: Unit
+    ) -> "VolumeDeltaArray":
+        """Create an array of volume deltas directly from a buffer of cubic metres.
+
+        The buffer is used as-is, rather than copied.
+        """
+        deltas: VolumeDeltaArray = cls.__new__(cls)
+        deltas._unit = unit
+        deltas._values_as_cubic_metre = values_as_cubic_metre
+        return deltas
+
+    def as_unit(self, unit: Unit) -> "array[float]":
+        """Return the volume deltas, expressed as the unit."""
+        external_unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(unit)
+        return create_values(
+            self._values_as_cubic_metre, external_unit_delta_per_cubic_metre
+        )
+
+    def __len__(self) -> int:
+        """Return the number of volume deltas."""
+        return len(self._values_as_cubic_metre)
+
+    @overload
+    def __getitem__(self, index: int) -> VolumeDelta: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "VolumeDeltaArray": ...
+
+    def __getitem__(self, index: "int | slice") -> "VolumeDelta | VolumeDeltaArray":
+        """Return the volume delta at the index, or a view of the slice.
+
+        Slices share the underlying buffer, rather than copying it.
+        """
+        if isinstance(index, slice):
+            return VolumeDeltaArray._from_values_as_cubic_metre(
+                memoryview(self._values_as_cubic_metre)[index], self._unit
+            )
+
+        internal_unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(self._unit)
+        return VolumeDelta(
+            self._values_as_cubic_metre[index] * internal_unit_delta_per_cubic_metre,
+            self._unit,
+        )
+
+    def __iter__(self) -> "Iterator[VolumeDelta]":
+        """Return an iterator over the volume deltas."""
+        internal_unit_delta_per_cubic_metre = get_unit_delta_per_cubic_metre(self._unit)
+        for value_as_cubic_metre in self._values_as_cubic_metre:
+            yield VolumeDelta(
+                value_as_cubic_metre * internal_unit_delta_per_cubic_metre, self._unit
+            )
+
+    def __mul__(self, value: float) -> "VolumeDeltaArray":
+        """Return the volume deltas scaled by the value."""
+        return VolumeDeltaArray._from_values_as_cubic_metre(
+            create_values(self._values_as_cubic_metre, value), self._unit
+        )
+
+    def __rmul__(self, value: float) -> "VolumeDeltaArray":
+        """Return the volume deltas scaled by the value."""
+        return self * value
+
+    def __truediv__(self, value: float) -> "VolumeDeltaArray":
+        """Return the volume deltas scaled by the inverse of the value."""
+        return self * (1 / value)
+
+    def __add__(self, other: "VolumeDelta | VolumeDeltaArray") -> "VolumeDeltaArray":
+        """Return the sum of the volume deltas and the other delta(s).
+
+        A single volume delta is added to every element, while an array of volume
+        deltas is added elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, VolumeDelta):
+            return VolumeDeltaArray._from_values_as_cubic_metre(
+                add_values(
+                    self._values_as_cubic_metre, other.as_unit(Unit.CUBIC_METRE)
+                ),
+                self._unit,
+            )
+
+        if isinstance(other, VolumeDeltaArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return VolumeDeltaArray._from_values_as_cubic_metre(
+                add_values(self._values_as_cubic_metre, other._values_as_cubic_metre),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __radd__(self, other: VolumeDelta) -> "VolumeDeltaArray":
+        """Return the sum of the volume deltas and the other delta."""
+        return self + other
+
+    def __sub__(self, other: "VolumeDelta | VolumeDeltaArray") -> "VolumeDeltaArray":
+        """Return the difference of the volume deltas and the other delta(s).
+
+        A single volume delta is subtracted from every element, while an array of
+        volume deltas is subtracted elementwise.
+
+        Raises:
+            ValueError: The arrays are of different lengths.
+        """
+        if isinstance(other, VolumeDelta):
+            return VolumeDeltaArray._from_values_as_cubic_metre(
+                subtract_values(
+                    self._values_as_cubic_metre, other.as_unit(Unit.CUBIC_METRE)
+                ),
+                self._unit,
+            )
+
+        if isinstance(other, VolumeDeltaArray):  # type: ignore[reportUnnecessaryIsInstance]
+            return VolumeDeltaArray._from_values_as_cubic_metre(
+                subtract_values(
+                    self._values_as_cubic_metre, other._values_as_cubic_metre
+                ),
+                self._unit,
+            )
+
+        return NotImplemented
+
+    def __neg__(self) -> "VolumeDeltaArray":
+        """Return the inverse of the volume deltas."""
+        return self * -1
+
+    def __abs__(self) -> "VolumeDeltaArray":
+        """Return the absolute of the volume deltas."""
+        return VolumeDeltaArray._from_values_as_cubic_metre(
+            array("d", (abs(value) for value in self._values_as_cubic_metre)),
+            self._unit,
+        )
+
+    def __lt__(self, other: "VolumeDelta | VolumeDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the volume deltas less than the other delta(s)."""
+        other_values_as_cubic_metre = (
+            other.as_unit(Unit.CUBIC_METRE)
+            if isinstance(other, VolumeDelta)
+            else other._values_as_cubic_metre
+        )
+        return less_than(self._values_as_cubic_metre, other_values_as_cubic_metre)
+
+    def __le__(self, other: "VolumeDelta | VolumeDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the volume deltas less than or equal to the other(s)."""
+        other_values_as_cubic_metre = (
+            other.as_unit(Unit.CUBIC_METRE)
+            if isinstance(other, VolumeDelta)
+            else other._values_as_cubic_metre
+        )
+        return less_than_or_equal_to(
+            self._values_as_cubic_metre, other_values_as_cubic_metre
+        )
+
+    def __gt__(self, other: "VolumeDelta | VolumeDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the volume deltas greater than the other delta(s)."""
+        other_values_as_cubic_metre = (
+            other.as_unit(Unit.CUBIC_METRE)
+            if isinstance(other, VolumeDelta)
+            else other._values_as_cubic_metre
+        )
+        return greater_than(self._values_as_cubic_metre, other_values_as_cubic_metre)
+
+    def __ge__(self, other: "VolumeDelta | VolumeDeltaArray") -> bytearray:  # type: ignore[override]
+        """Return a mask of the volume deltas greater than or equal to the other(s)."""
+        other_values_as_cubic_metre = (
+            other.as_unit(Unit.CUBIC_METRE)
+            if isinstance(other, VolumeDelta)
+            else other._values_as_cubic_metre
+        )
+        return greater_than_or_equal_to(
+            self._values_as_cubic_metre, other_values_as_cubic_metre
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the volume deltas."""
+        values = list(self.as_unit(self._unit))
+        return f"VolumeDeltaArray({values}, {get_name(self._unit)})"
@@ -1,5 +1,27 @@
 """Module for grouping voltage-related classes."""
 
-from .units_inner.voltage import Unit, Voltage
+from .units_inner.voltage import (
+    FixedPointVoltage,
+    Unit,
+    Voltage,
+    VoltageArray,
+    VoltageCell,
+    VoltageFilter,
+    VoltageSeries,
+    VoltageThreshold,
+    convert_into,
+    make_converter,
+)
 
-__all__ = ["Unit", "Voltage"]
+__all__ = [
+    "FixedPointVoltage",
+    "Unit",
+    "Voltage",
+    "VoltageArray",
+    "VoltageCell",
+    "VoltageFilter",
+    "VoltageSeries",
+    "VoltageThreshold",
+    "convert_into",
+    "make_converter",
+]
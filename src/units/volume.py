@@ -2,10 +2,36 @@
 
 from .units_inner.volume import (
     ZERO,
+    FixedPointVolume,
+    FixedPointVolumeDelta,
     NegativeVolumeValueError,
     Unit,
     Volume,
+    VolumeArray,
+    VolumeCell,
     VolumeDelta,
+    VolumeDeltaArray,
+    VolumeFilter,
+    VolumeSeries,
+    VolumeThreshold,
+    convert_into,
+    make_converter,
 )
 
-__all__ = ["ZERO", "NegativeVolumeValueError", "Unit", "Volume", "VolumeDelta"]
+__all__ = [
+    "ZERO",
+    "FixedPointVolume",
+    "FixedPointVolumeDelta",
+    "NegativeVolumeValueError",
+    "Unit",
+    "Volume",
+    "VolumeArray",
+    "VolumeCell",
+    "VolumeDelta",
+    "VolumeDeltaArray",
+    "VolumeFilter",
+    "VolumeSeries",
+    "VolumeThreshold",
+    "convert_into",
+    "make_converter",
+]
@@ -1,84 +1,372 @@
 """Package for unit tests of physical quantity classes."""
 
-from .angle import AngleAndAngleDeltaTest, AngleDeltaTest, AngleTest
+from .angle import (
+    AngleAndAngleDeltaTest,
+    AngleCellTest,
+    AngleDeltaTest,
+    AngleTest,
+    AngleThresholdTest,
+    UnwrapIntoTest,
+    WrapIntoTest,
+)
+from .angle import ConvertIntoTest as AngleConvertIntoTest
+from .angle import MakeConverterTest as AngleMakeConverterTest
+from .angle import UnitTest as AngleUnitTest
 from .angular_motion import (
     AngularAccelerationTest,
     AngularDisplacementTest,
     AngularJerkTest,
+    AngularMotionAndTimeDeltaTest,
     AngularVelocityTest,
+    UnwrapperTest,
+)
+from .angular_motion import ConvertIntoTest as AngularMotionConvertIntoTest
+from .angular_motion import MakeConverterTest as AngularMotionMakeConverterTest
+from .angular_motion import VelocityEstimatorTest as AngularMotionVelocityEstimatorTest
+from .area import (
+    AreaAndAreaDeltaTest,
+    AreaArrayTest,
+    AreaCellTest,
+    AreaDeltaTest,
+    AreaFilterTest,
+    AreaSeriesTest,
+    AreaTest,
+    AreaThresholdTest,
+    FixedPointAreaDeltaTest,
+    FixedPointAreaTest,
 )
-from .area import AreaAndAreaDeltaTest, AreaDeltaTest, AreaTest
+from .area import ConvertIntoTest as AreaConvertIntoTest
+from .area import MakeConverterTest as AreaMakeConverterTest
+from .area import UnitTest as AreaUnitTest
 from .area import ZeroTest as AreaZeroTest
-from .current import CurrentTest
-from .flow_rate import MassFlowRateTest, VolumetricFlowRateTest
-from .length import LengthAndLengthDeltaTest, LengthDeltaTest, LengthTest
+from .current import ConvertIntoTest as CurrentConvertIntoTest
+from .current import (
+    CurrentArrayTest,
+    CurrentCellTest,
+    CurrentFilterTest,
+    CurrentSeriesTest,
+    CurrentTest,
+    CurrentThresholdTest,
+    FixedPointCurrentTest,
+)
+from .current import MakeConverterTest as CurrentMakeConverterTest
+from .current import UnitTest as CurrentUnitTest
+from .flow_rate import ConvertIntoTest as FlowRateConvertIntoTest
+from .flow_rate import (
+    FlowRateAndTimeDeltaTest,
+    MassFlowRateTest,
+    MassTotalizerTest,
+    VolumeTotalizerTest,
+    VolumetricFlowRateEstimatorTest,
+    VolumetricFlowRateTest,
+)
+from .flow_rate import MakeConverterTest as FlowRateMakeConverterTest
+from .length import ConvertIntoTest as LengthConvertIntoTest
+from .length import (
+    FixedPointLengthDeltaTest,
+    FixedPointLengthTest,
+    LengthAndLengthDeltaTest,
+    LengthArrayTest,
+    LengthCellTest,
+    LengthDeltaArrayTest,
+    LengthDeltaTest,
+    LengthFilterTest,
+    LengthSeriesTest,
+    LengthTest,
+    LengthThresholdTest,
+)
+from .length import MakeConverterTest as LengthMakeConverterTest
+from .length import UnitTest as LengthUnitTest
 from .length import ZeroTest as LengthZeroTest
-from .linear_motion import AccelerationTest, DisplacementTest, JerkTest, VelocityTest
-from .mass import MassAndMassDeltaTest, MassDeltaTest, MassTest
+from .linear_motion import (
+    AccelerationTest,
+    DisplacementTest,
+    DisplacementTotalizerTest,
+    JerkTest,
+    LinearMotionAndTimeDeltaTest,
+    VelocityTest,
+)
+from .linear_motion import ConvertIntoTest as LinearMotionConvertIntoTest
+from .linear_motion import MakeConverterTest as LinearMotionMakeConverterTest
+from .linear_motion import VelocityEstimatorTest as LinearMotionVelocityEstimatorTest
+from .mass import ConvertIntoTest as MassConvertIntoTest
+from .mass import (
+    FixedPointMassDeltaTest,
+    FixedPointMassTest,
+    MassAndMassDeltaTest,
+    MassArrayTest,
+    MassCellTest,
+    MassDeltaTest,
+    MassFilterTest,
+    MassSeriesTest,
+    MassTest,
+    MassThresholdTest,
+)
+from .mass import MakeConverterTest as MassMakeConverterTest
+from .mass import UnitTest as MassUnitTest
 from .mass import ZeroTest as MassZeroTest
+from .pressure import ConvertIntoTest as PressureConvertIntoTest
 from .pressure import (
+    FixedPointPressureDeltaTest,
+    FixedPointPressureTest,
     PerfectVacuumTest,
     PressureAndPressureDeltaTest,
+    PressureArrayTest,
+    PressureCellTest,
     PressureDeltaTest,
+    PressureFilterTest,
+    PressureSeriesTest,
     PressureTest,
+    PressureThresholdTest,
     StandardAtmosphereTest,
 )
+from .pressure import MakeConverterTest as PressureMakeConverterTest
+from .pressure import UnitTest as PressureUnitTest
+from .quantity import DimensionTest, QuantityAndTypedQuantityTest, QuantityTest
 from .temperature import (
     AbsoluteZeroTest,
     TemperatureAndTemperatureDeltaTest,
+    TemperatureArrayTest,
+    TemperatureCellTest,
+    TemperatureDeltaArrayTest,
     TemperatureDeltaTest,
+    TemperatureFilterTest,
+    TemperatureSeriesTest,
     TemperatureTest,
+    TemperatureThresholdTest,
 )
-from .time import TimeAndTimeDeltaTest, TimeDeltaTest, TimeTest
+from .temperature import ConvertIntoTest as TemperatureConvertIntoTest
+from .temperature import MakeConverterTest as TemperatureMakeConverterTest
+from .temperature import UnitTest as TemperatureUnitTest
+from .test_factor_cache import FactorCacheTest
+from .test_filters import (
+    ExponentialMovingAverageTest,
+    LowPassTest,
+    MovingAverageTest,
+    MovingMedianTest,
+)
+from .test_fixed_point import FixedPointTest
+from .test_package import PackageTest
+from .test_rate_estimators import (
+    CentralDifferenceTest,
+    FirstDifferenceTest,
+    LeastSquaresSlopeTest,
+)
+from .test_registration import RegistrationTest
+from .test_sampler import SampleQueueTest, SamplerTest
+from .test_totalizer import TotalizerTest
+from .time import ConvertIntoTest as TimeConvertIntoTest
+from .time import (
+    FixedPointTimeDeltaTest,
+    FixedPointTimeTest,
+    TimeAndTimeDeltaTest,
+    TimeArrayTest,
+    TimeCellTest,
+    TimeDeltaTest,
+    TimeTest,
+    TimeThresholdTest,
+)
+from .time import MakeConverterTest as TimeMakeConverterTest
+from .time import UnitTest as TimeUnitTest
 from .time import ZeroTest as TimeZeroTest
-from .voltage import VoltageTest
-from .volume import VolumeAndVolumeDeltaTest, VolumeDeltaTest, VolumeTest
+from .voltage import ConvertIntoTest as VoltageConvertIntoTest
+from .voltage import (
+    FixedPointVoltageTest,
+    VoltageArrayTest,
+    VoltageCellTest,
+    VoltageFilterTest,
+    VoltageSeriesTest,
+    VoltageTest,
+    VoltageThresholdTest,
+)
+from .voltage import MakeConverterTest as VoltageMakeConverterTest
+from .voltage import UnitTest as VoltageUnitTest
+from .volume import ConvertIntoTest as VolumeConvertIntoTest
+from .volume import (
+    FixedPointVolumeDeltaTest,
+    FixedPointVolumeTest,
+    VolumeAndVolumeDeltaTest,
+    VolumeArrayTest,
+    VolumeCellTest,
+    VolumeDeltaTest,
+    VolumeFilterTest,
+    VolumeSeriesTest,
+    VolumeTest,
+    VolumeThresholdTest,
+)
+from .volume import MakeConverterTest as VolumeMakeConverterTest
+from .volume import UnitTest as VolumeUnitTest
 from .volume import ZeroTest as VolumeZeroTest
 
 __all__ = [
     "AbsoluteZeroTest",
     "AccelerationTest",
     "AngleAndAngleDeltaTest",
+    "AngleCellTest",
+    "AngleConvertIntoTest",
     "AngleDeltaTest",
+    "AngleMakeConverterTest",
     "AngleTest",
+    "AngleThresholdTest",
+    "AngleUnitTest",
     "AngularAccelerationTest",
     "AngularDisplacementTest",
     "AngularJerkTest",
+    "AngularMotionAndTimeDeltaTest",
+    "AngularMotionConvertIntoTest",
+    "AngularMotionMakeConverterTest",
+    "AngularMotionVelocityEstimatorTest",
     "AngularVelocityTest",
     "AreaAndAreaDeltaTest",
+    "AreaArrayTest",
+    "AreaCellTest",
+    "AreaConvertIntoTest",
     "AreaDeltaTest",
+    "AreaFilterTest",
+    "AreaMakeConverterTest",
+    "AreaSeriesTest",
     "AreaTest",
+    "AreaThresholdTest",
+    "AreaUnitTest",
     "AreaZeroTest",
+    "CentralDifferenceTest",
+    "CurrentArrayTest",
+    "CurrentCellTest",
+    "CurrentConvertIntoTest",
+    "CurrentFilterTest",
+    "CurrentMakeConverterTest",
+    "CurrentSeriesTest",
     "CurrentTest",
+    "CurrentThresholdTest",
+    "CurrentUnitTest",
+    "DimensionTest",
     "DisplacementTest",
+    "DisplacementTotalizerTest",
+    "ExponentialMovingAverageTest",
+    "FactorCacheTest",
+    "FirstDifferenceTest",
+    "FixedPointAreaDeltaTest",
+    "FixedPointAreaTest",
+    "FixedPointCurrentTest",
+    "FixedPointLengthDeltaTest",
+    "FixedPointLengthTest",
+    "FixedPointMassDeltaTest",
+    "FixedPointMassTest",
+    "FixedPointPressureDeltaTest",
+    "FixedPointPressureTest",
+    "FixedPointTest",
+    "FixedPointTimeDeltaTest",
+    "FixedPointTimeTest",
+    "FixedPointVoltageTest",
+    "FixedPointVolumeDeltaTest",
+    "FixedPointVolumeTest",
+    "FlowRateAndTimeDeltaTest",
+    "FlowRateConvertIntoTest",
+    "FlowRateMakeConverterTest",
     "JerkTest",
+    "LeastSquaresSlopeTest",
     "LengthAndLengthDeltaTest",
+    "LengthArrayTest",
+    "LengthCellTest",
+    "LengthConvertIntoTest",
+    "LengthDeltaArrayTest",
     "LengthDeltaTest",
-    "LengthDeltaTest",
+    "LengthFilterTest",
+    "LengthMakeConverterTest",
+    "LengthSeriesTest",
     "LengthTest",
+    "LengthThresholdTest",
+    "LengthUnitTest",
     "LengthZeroTest",
+    "LinearMotionAndTimeDeltaTest",
+    "LinearMotionConvertIntoTest",
+    "LinearMotionMakeConverterTest",
+    "LinearMotionVelocityEstimatorTest",
+    "LowPassTest",
     "MassAndMassDeltaTest",
+    "MassArrayTest",
+    "MassCellTest",
+    "MassConvertIntoTest",
     "MassDeltaTest",
+    "MassFilterTest",
     "MassFlowRateTest",
+    "MassMakeConverterTest",
+    "MassSeriesTest",
     "MassTest",
+    "MassThresholdTest",
+    "MassTotalizerTest",
+    "MassUnitTest",
     "MassZeroTest",
+    "MovingAverageTest",
+    "MovingMedianTest",
+    "PackageTest",
     "PerfectVacuumTest",
     "PressureAndPressureDeltaTest",
+    "PressureArrayTest",
+    "PressureCellTest",
+    "PressureConvertIntoTest",
     "PressureDeltaTest",
+    "PressureFilterTest",
+    "PressureMakeConverterTest",
+    "PressureSeriesTest",
     "PressureTest",
+    "PressureThresholdTest",
+    "PressureUnitTest",
+    "QuantityAndTypedQuantityTest",
+    "QuantityTest",
+    "RegistrationTest",
+    "SampleQueueTest",
+    "SamplerTest",
     "StandardAtmosphereTest",
     "TemperatureAndTemperatureDeltaTest",
+    "TemperatureArrayTest",
+    "TemperatureCellTest",
+    "TemperatureConvertIntoTest",
+    "TemperatureDeltaArrayTest",
     "TemperatureDeltaTest",
+    "TemperatureFilterTest",
+    "TemperatureMakeConverterTest",
+    "TemperatureSeriesTest",
     "TemperatureTest",
+    "TemperatureThresholdTest",
+    "TemperatureUnitTest",
     "TimeAndTimeDeltaTest",
+    "TimeArrayTest",
+    "TimeCellTest",
+    "TimeConvertIntoTest",
     "TimeDeltaTest",
+    "TimeMakeConverterTest",
     "TimeTest",
+    "TimeThresholdTest",
+    "TimeUnitTest",
     "TimeZeroTest",
+    "TotalizerTest",
+    "UnwrapIntoTest",
+    "UnwrapperTest",
     "VelocityTest",
+    "VoltageArrayTest",
+    "VoltageCellTest",
+    "VoltageConvertIntoTest",
+    "VoltageFilterTest",
+    "VoltageMakeConverterTest",
+    "VoltageSeriesTest",
     "VoltageTest",
+    "VoltageThresholdTest",
+    "VoltageUnitTest",
     "VolumeAndVolumeDeltaTest",
+    "VolumeArrayTest",
+    "VolumeCellTest",
+    "VolumeConvertIntoTest",
     "VolumeDeltaTest",
+    "VolumeFilterTest",
+    "VolumeMakeConverterTest",
+    "VolumeSeriesTest",
     "VolumeTest",
+    "VolumeThresholdTest",
+    "VolumeTotalizerTest",
+    "VolumeUnitTest",
     "VolumeZeroTest",
+    "VolumetricFlowRateEstimatorTest",
     "VolumetricFlowRateTest",
+    "WrapIntoTest",
 ]
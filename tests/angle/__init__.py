@@ -3,9 +3,20 @@
 from .test_angle import AngleTest
 from .test_angle_and_angle_delta import AngleAndAngleDeltaTest
 from .test_angle_delta import AngleDeltaTest
+from .test_converter import ConvertIntoTest, MakeConverterTest
+from .test_isr import AngleCellTest, AngleThresholdTest
+from .test_unit import UnitTest
+from .test_wrap import UnwrapIntoTest, WrapIntoTest
 
 __all__ = [
-    "AngleTest",
-    "AngleDeltaTest",
     "AngleAndAngleDeltaTest",
+    "AngleCellTest",
+    "AngleDeltaTest",
+    "AngleTest",
+    "AngleThresholdTest",
+    "ConvertIntoTest",
+    "MakeConverterTest",
+    "UnitTest",
+    "UnwrapIntoTest",
+    "WrapIntoTest",
 ]
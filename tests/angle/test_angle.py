@@ -35,6 +35,24 @@ class AngleTest(unittest.TestCase):
                     Angle(value, AngleUnit.RADIAN).as_unit(AngleUnit.RADIAN),
                 )
 
+    def test_angle_in_range_keeps_value(self) -> None:
+        for unit, value in [
+            (AngleUnit.RADIAN, 0.1),
+            (AngleUnit.DEGREE, 359.5),
+            (AngleUnit.REVOLUTION, 0.75),
+        ]:
+            with self.subTest(unit=unit, value=value):
+                self.assertEqual(value, Angle(value, unit).as_unit(unit))
+
+    def test_tiny_negative_angle_maps_to_zero(self) -> None:
+        angle = Angle(-1e-20, AngleUnit.DEGREE)
+        self.assertEqual(0, angle.as_unit(AngleUnit.DEGREE))
+
+    def test_create_angle_with_invalid_unit_raises_value_error(self) -> None:
+        for unit in [0, 4]:
+            with self.subTest(unit=unit), self.assertRaises(ValueError):
+                Angle(1, unit)  # type: ignore[arg-type]
+
     def test_get_angle_value_as_unit(self) -> None:
         angle = Angle(math.pi, AngleUnit.RADIAN)
 
@@ -80,3 +98,9 @@ class AngleTest(unittest.TestCase):
             ):
                 self.assertEqual(is_equal, angle1 == angle2)
                 self.assertEqual(is_not_equal, angle1 != angle2)
+
+    def test_get_angle_value_as_invalid_unit_raises_value_error(self) -> None:
+        angle = Angle(1, AngleUnit.RADIAN)
+        for invalid_unit in [-1, 0, 4, 5, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                angle.as_unit(invalid_unit)  # type: ignore[arg-type]
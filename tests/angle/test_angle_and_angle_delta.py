@@ -1,3 +1,4 @@
+import math
 import unittest
 
 from src.units import Angle, AngleDelta, AngleUnit
@@ -33,3 +34,42 @@ class AngleAndAngleDeltaTest(unittest.TestCase):
         new_angle_delta = angle1 - angle2
         self.assertIsInstance(new_angle_delta, AngleDelta)
         self.assertAlmostEqual(1, new_angle_delta.as_unit(AngleUnit.RADIAN))
+
+    def test_add_angle_delta_to_angle_in_same_unit_preserves_unit_and_wraps(
+        self,
+    ) -> None:
+        angle = Angle(350, AngleUnit.DEGREE)
+        delta = AngleDelta(20, AngleUnit.DEGREE)
+        new_angle = angle + delta
+        self.assertEqual("10.0 deg", str(new_angle))
+        self.assertAlmostEqual(
+            (angle + AngleDelta(20 * math.pi / 180, AngleUnit.RADIAN)).as_unit(
+                AngleUnit.DEGREE
+            ),
+            new_angle.as_unit(AngleUnit.DEGREE),
+        )
+
+    def test_subtract_angle_from_angle_wraps_angle_delta(self) -> None:
+        for unit, value1, value2, expected_value in [
+            (AngleUnit.DEGREE, 350, 10, -20),
+            (AngleUnit.DEGREE, 10, 350, 20),
+            (AngleUnit.REVOLUTION, 0.9, 0.1, -0.2),
+        ]:
+            with self.subTest(unit=unit, value1=value1, value2=value2):
+                new_angle_delta = Angle(value1, unit) - Angle(value2, unit)
+                self.assertAlmostEqual(expected_value, new_angle_delta.as_unit(unit))
+
+    def test_subtract_angle_from_angle_in_different_units_wraps_angle_delta(
+        self,
+    ) -> None:
+        angle1 = Angle(350, AngleUnit.DEGREE)
+        angle2 = Angle(10 * math.pi / 180, AngleUnit.RADIAN)
+        new_angle_delta = angle1 - angle2
+        self.assertAlmostEqual(-20, new_angle_delta.as_unit(AngleUnit.DEGREE))
+
+    def test_subtract_angle_delta_from_angle_wraps(self) -> None:
+        angle = Angle(10, AngleUnit.DEGREE)
+        delta = AngleDelta(20, AngleUnit.DEGREE)
+        new_angle = angle - delta
+        self.assertEqual("350.0 deg", str(new_angle))
+        self.assertAlmostEqual(350, new_angle.as_unit(AngleUnit.DEGREE))
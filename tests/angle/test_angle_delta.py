@@ -63,6 +63,30 @@ class AngleDeltaTest(unittest.TestCase):
         new_delta = -delta
         self.assertAlmostEqual(-1, new_delta.as_unit(AngleUnit.RADIAN))
 
+    def test_add_angle_deltas_wraps(self) -> None:
+        delta = AngleDelta(100, AngleUnit.DEGREE)
+        new_delta = delta + delta
+        self.assertEqual("-160.0 deg", str(new_delta))
+        self.assertAlmostEqual(
+            -160 * math.pi / 180, new_delta.as_unit(AngleUnit.RADIAN)
+        )
+
+    def test_add_angle_deltas_in_different_units_wraps(self) -> None:
+        delta1 = AngleDelta(100, AngleUnit.DEGREE)
+        delta2 = AngleDelta(100 * math.pi / 180, AngleUnit.RADIAN)
+        new_delta = delta1 + delta2
+        self.assertAlmostEqual(-160, new_delta.as_unit(AngleUnit.DEGREE))
+
+    def test_negative_of_half_turn_angle_delta_wraps(self) -> None:
+        delta = AngleDelta(-180, AngleUnit.DEGREE)
+        new_delta = -delta
+        self.assertEqual(-180, new_delta.as_unit(AngleUnit.DEGREE))
+
+    def test_create_angle_delta_with_invalid_unit_raises_value_error(self) -> None:
+        for unit in [0, 4]:
+            with self.subTest(unit=unit), self.assertRaises(ValueError):
+                AngleDelta(1, unit)  # type: ignore[arg-type]
+
     def test_compare_angle_deltas(self) -> None:
         for (
             angle_delta1,
@@ -97,3 +121,9 @@ class AngleDeltaTest(unittest.TestCase):
             ):
                 self.assertEqual(is_equal, angle_delta1 == angle_delta2)
                 self.assertEqual(is_not_equal, angle_delta1 != angle_delta2)
+
+    def test_get_angle_delta_value_as_invalid_unit_raises_value_error(self) -> None:
+        angle_delta = AngleDelta(1, AngleUnit.RADIAN)
+        for invalid_unit in [-1, 0, 4, 5, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                angle_delta.as_unit(invalid_unit)  # type: ignore[arg-type]
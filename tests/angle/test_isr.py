@@ -0,0 +1,64 @@
+# pyright: reportUnknownMemberType=false
+
+import unittest
+
+from src.units import Angle, AngleUnit
+from src.units.angle import AngleCell, AngleThreshold
+
+try:
+    import micropython  # type: ignore[import-not-found]
+except ImportError:
+    micropython = None
+
+
+class AngleCellTest(unittest.TestCase):
+    """Unit tests for the angle cell class."""
+
+    def test_get_produces_angle(self) -> None:
+        cell = AngleCell(AngleUnit.DEGREE)
+        cell.set(12.5)
+        angle = cell.get()
+        self.assertIsInstance(angle, Angle)
+        self.assertAlmostEqual(12.5, angle.as_unit(AngleUnit.DEGREE))
+
+    def test_get_initial_value(self) -> None:
+        cell = AngleCell(AngleUnit.DEGREE, 12.5)
+        self.assertAlmostEqual(12.5, cell.get().as_unit(AngleUnit.DEGREE))
+
+    def test_set_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        cell = AngleCell(AngleUnit.DEGREE)
+        value = 12.5
+        micropython.heap_lock()
+        try:
+            cell.set(value)
+            cell.set(20)
+        finally:
+            micropython.heap_unlock()
+
+
+class AngleThresholdTest(unittest.TestCase):
+    """Unit tests for the angle threshold class."""
+
+    def test_compare_raw_values_with_threshold(self) -> None:
+        threshold = AngleThreshold(Angle(0.5, AngleUnit.RADIAN), AngleUnit.DEGREE)
+        self.assertTrue(threshold.is_below(20))
+        self.assertFalse(threshold.is_above(20))
+        self.assertTrue(threshold.is_above(40))
+        self.assertFalse(threshold.is_below(40))
+
+    def test_compare_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        threshold = AngleThreshold(Angle(0.5, AngleUnit.RADIAN), AngleUnit.DEGREE)
+        micropython.heap_lock()
+        try:
+            is_below = threshold.is_below(20)
+            is_above = threshold.is_above(20)
+        finally:
+            micropython.heap_unlock()
+        self.assertTrue(is_below)
+        self.assertFalse(is_above)
@@ -0,0 +1,65 @@
+# Generated by `tools/generate_units.py` from `tools/units_spec.json`, so edit the
+# spec & rerun the generator rather than editing this module.
+
+import math
+import unittest
+
+from src.units.units_inner.angle import unit
+
+# The member, name, abbreviation & change in the quantity expressed as the unit per 1rad
+# of each unit
+_UNITS = [
+    (unit.Unit.RADIAN, "radian", "rad", 1),
+    (unit.Unit.DEGREE, "degree", "deg", 180 / math.pi),
+    (unit.Unit.REVOLUTION, "revolution", "rev", 1 / (2 * math.pi)),
+]
+
+
+class UnitTest(unittest.TestCase):
+    """Unit tests for the angle unit tables."""
+
+    def assert_close(self, expected: float, actual: float) -> None:
+        self.assertAlmostEqual(expected, actual, delta=abs(expected) * 1e-9)
+
+    def test_get_name(self) -> None:
+        for member, name, *_ in _UNITS:
+            with self.subTest(unit=member):
+                self.assertEqual(name, unit.get_name(member))
+
+    def test_get_abbreviation(self) -> None:
+        for member, _, abbreviation, *_ in _UNITS:
+            with self.subTest(unit=member):
+                self.assertEqual(abbreviation, unit.get_abbreviation(member))
+
+    def test_invalid_unit_raises_value_error(self) -> None:
+        for invalid_unit in [0, len(_UNITS) + 1]:
+            with (
+                self.subTest(unit=invalid_unit),
+                self.assertRaises(ValueError),
+            ):
+                unit.get_name(invalid_unit)  # type: ignore[arg-type]
+
+    def test_get_unit_delta_per_radian(self) -> None:
+        for member, _, _, unit_delta in _UNITS:
+            with self.subTest(unit=member):
+                self.assert_close(unit_delta, unit.get_unit_delta_per_radian(member))
+
+    def test_conversion_factors(self) -> None:
+        for from_member, _, _, from_unit_delta in _UNITS:
+            for to_member, _, _, to_unit_delta in _UNITS:
+                with self.subTest(from_unit=from_member, to_unit=to_member):
+                    index = from_member * unit.CONVERSION_FACTORS_STRIDE + to_member
+                    self.assert_close(
+                        to_unit_delta / from_unit_delta,
+                        unit.CONVERSION_FACTORS[index],
+                    )
+
+    def test_turn_tables(self) -> None:
+        for member, _, _, unit_delta in _UNITS:
+            with self.subTest(unit=member):
+                self.assert_close(2 * math.pi * unit_delta, unit.FULL_TURNS[member])
+                self.assert_close(math.pi * unit_delta, unit.HALF_TURNS[member])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import math
+import unittest
+from array import array
+
+from src.units import Angle, AngleUnit
+from src.units.angle import unwrap_into, wrap_into
+
+
+class WrapIntoTest(unittest.TestCase):
+    """Unit tests for the angle buffer wrapper."""
+
+    def test_wrap_into_matches_angle(self) -> None:
+        for unit in [AngleUnit.RADIAN, AngleUnit.DEGREE, AngleUnit.REVOLUTION]:
+            src = array("d", [-725.5, -1, -1e-20, 0, 0.5, 1, 6.5, 359.5, 360, 1000])
+            dst = array("d", [0] * len(src))
+            wrap_into(src, dst, unit)
+            for index, value in enumerate(src):
+                with self.subTest(unit=unit, value=value):
+                    self.assertAlmostEqual(Angle(value, unit).as_unit(unit), dst[index])
+
+    def test_wrap_into_same_buffer_wraps_in_place(self) -> None:
+        values = array("d", [-90, 450])
+        wrap_into(values, values, AngleUnit.DEGREE)
+        self.assertAlmostEqual(270, values[0])
+        self.assertAlmostEqual(90, values[1])
+
+    def test_wrap_into_longer_destination_leaves_remainder(self) -> None:
+        dst = array("f", [-1, -1, -1])
+        wrap_into(array("h", [370, 10]), dst, AngleUnit.DEGREE)
+        self.assertAlmostEqual(10, dst[0])
+        self.assertAlmostEqual(10, dst[1])
+        self.assertEqual(-1, dst[2])
+
+    def test_wrap_into_shorter_destination_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            wrap_into(array("d", [1, 2]), array("d", [0]), AngleUnit.DEGREE)
+
+    def test_wrap_into_with_invalid_unit_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            wrap_into(array("d", [1]), array("d", [0]), 0)  # type: ignore[arg-type]
+
+
+class UnwrapIntoTest(unittest.TestCase):
+    """Unit tests for the angle buffer unwrapper."""
+
+    def test_unwrap_into_removes_jumps_across_full_turn(self) -> None:
+        src = array("d", [350, 355, 0, 5, 10, 5, 0, 355, 350])
+        dst = array("d", [0] * len(src))
+        unwrap_into(src, dst, AngleUnit.DEGREE)
+        for index, expected_value in enumerate(
+            [350, 355, 360, 365, 370, 365, 360, 355, 350]
+        ):
+            with self.subTest(index=index):
+                self.assertAlmostEqual(expected_value, dst[index])
+
+    def test_unwrap_into_counts_several_turns(self) -> None:
+        src = array("d", [(0.3 * index) % 1 for index in range(20)])
+        dst = array("d", [0] * len(src))
+        unwrap_into(src, dst, AngleUnit.REVOLUTION)
+        for index in range(len(src)):
+            with self.subTest(index=index):
+                self.assertAlmostEqual(0.3 * index, dst[index])
+
+    def test_unwrap_into_removes_jumps_of_several_turns(self) -> None:
+        src = array("d", [0.1, 0.2 + 4 * math.pi, 0.3 - 2 * math.pi])
+        dst = array("d", [0, 0, 0])
+        unwrap_into(src, dst, AngleUnit.RADIAN)
+        self.assertAlmostEqual(0.1, dst[0])
+        self.assertAlmostEqual(0.2, dst[1])
+        self.assertAlmostEqual(0.3, dst[2])
+
+    def test_unwrap_into_removes_huge_jumps_in_one_step(self) -> None:
+        src = array("d", [10, 10 + 360 * 1e12, 20 - 360 * 1e12])
+        dst = array("d", [0, 0, 0])
+        unwrap_into(src, dst, AngleUnit.DEGREE)
+        self.assertEqual(10, dst[0])
+        self.assertAlmostEqual(10, dst[1], delta=1e-3)
+        self.assertAlmostEqual(20, dst[2], delta=1e-3)
+
+    def test_unwrap_into_non_finite_value_raises_value_error(self) -> None:
+        for values in [
+            [10, math.inf],
+            [10, -math.inf],
+            [10, math.nan],
+            [math.inf, 10],
+            [math.nan],
+        ]:
+            with self.subTest(values=values), self.assertRaises(ValueError):
+                unwrap_into(
+                    array("d", values), array("d", [0] * len(values)), AngleUnit.DEGREE
+                )
+
+    def test_unwrap_into_same_buffer_unwraps_in_place(self) -> None:
+        values = array("d", [10, 350, 330])
+        unwrap_into(values, values, AngleUnit.DEGREE)
+        self.assertAlmostEqual(10, values[0])
+        self.assertAlmostEqual(-10, values[1])
+        self.assertAlmostEqual(-30, values[2])
+
+    def test_unwrap_into_empty_source_does_nothing(self) -> None:
+        dst = array("d", [-1])
+        unwrap_into(array("d"), dst, AngleUnit.DEGREE)
+        self.assertEqual(-1, dst[0])
+
+    def test_unwrap_into_shorter_destination_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            unwrap_into(array("d", [1, 2]), array("d", [0]), AngleUnit.DEGREE)
+
+    def test_unwrap_into_with_invalid_unit_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            unwrap_into(array("d", [1]), array("d", [0]), 4)  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,22 @@
 """Package for unit tests of angular motion classes."""
 
 from .test_acceleration import AngularAccelerationTest
+from .test_angular_motion_and_time_delta import AngularMotionAndTimeDeltaTest
+from .test_converter import ConvertIntoTest, MakeConverterTest
 from .test_displacement import AngularDisplacementTest
 from .test_jerk import AngularJerkTest
+from .test_unwrapper import UnwrapperTest
 from .test_velocity import AngularVelocityTest
+from .test_velocity_estimator import VelocityEstimatorTest
 
 __all__ = [
     "AngularAccelerationTest",
     "AngularDisplacementTest",
     "AngularJerkTest",
+    "AngularMotionAndTimeDeltaTest",
     "AngularVelocityTest",
+    "ConvertIntoTest",
+    "MakeConverterTest",
+    "UnwrapperTest",
+    "VelocityEstimatorTest",
 ]
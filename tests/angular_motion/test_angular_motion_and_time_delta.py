@@ -0,0 +1,106 @@
+import math
+import unittest
+
+from src.units import (
+    AngleUnit,
+    AngularAcceleration,
+    AngularDisplacement,
+    AngularJerk,
+    AngularVelocity,
+    TimeDelta,
+    TimeUnit,
+)
+
+
+class AngularMotionAndTimeDeltaTest(unittest.TestCase):
+    """Unit tests for the interactions between angular motion & time differences."""
+
+    def test_divide_displacement_by_time_delta_produces_velocity(self) -> None:
+        displacement = AngularDisplacement(3, AngleUnit.REVOLUTION)
+        velocity = displacement / TimeDelta(2, TimeUnit.MINUTE)
+        self.assertIsInstance(velocity, AngularVelocity)
+        self.assertAlmostEqual(
+            1.5, velocity.as_unit(AngleUnit.REVOLUTION, TimeUnit.MINUTE)
+        )
+        self.assertAlmostEqual(
+            math.pi / 20, velocity.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND)
+        )
+
+    def test_divide_velocity_by_time_delta_produces_acceleration(self) -> None:
+        velocity = AngularVelocity(3, AngleUnit.DEGREE, TimeUnit.SECOND)
+        acceleration = velocity / TimeDelta(2, TimeUnit.SECOND)
+        self.assertIsInstance(acceleration, AngularAcceleration)
+        self.assertAlmostEqual(
+            1.5, acceleration.as_unit(AngleUnit.DEGREE, TimeUnit.SECOND)
+        )
+
+    def test_divide_acceleration_by_time_delta_produces_jerk(self) -> None:
+        acceleration = AngularAcceleration(3, AngleUnit.RADIAN, TimeUnit.SECOND)
+        jerk = acceleration / TimeDelta(2, TimeUnit.MILLISECOND)
+        self.assertIsInstance(jerk, AngularJerk)
+        self.assertAlmostEqual(1500, jerk.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND))
+
+    def test_multiply_velocity_by_time_delta_produces_displacement(self) -> None:
+        velocity = AngularVelocity(3, AngleUnit.REVOLUTION, TimeUnit.MINUTE)
+        for time_delta, expected_value in [
+            (TimeDelta(2, TimeUnit.MINUTE), 6),
+            (TimeDelta(30, TimeUnit.SECOND), 1.5),
+        ]:
+            with self.subTest(time_delta=time_delta):
+                displacement = velocity * time_delta
+                self.assertIsInstance(displacement, AngularDisplacement)
+                self.assertAlmostEqual(
+                    expected_value, displacement.as_unit(AngleUnit.REVOLUTION)
+                )
+
+    def test_multiply_acceleration_by_time_delta_produces_velocity(self) -> None:
+        acceleration = AngularAcceleration(3, AngleUnit.RADIAN, TimeUnit.SECOND)
+        for time_delta, expected_value in [
+            (TimeDelta(2, TimeUnit.SECOND), 6),
+            (TimeDelta(2, TimeUnit.MILLISECOND), 0.006),
+        ]:
+            with self.subTest(time_delta=time_delta):
+                velocity = acceleration * time_delta
+                self.assertIsInstance(velocity, AngularVelocity)
+                self.assertAlmostEqual(
+                    expected_value, velocity.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND)
+                )
+
+    def test_multiply_jerk_by_time_delta_produces_acceleration(self) -> None:
+        jerk = AngularJerk(3, AngleUnit.RADIAN, TimeUnit.SECOND)
+        for time_delta, expected_value in [
+            (TimeDelta(2, TimeUnit.SECOND), 6),
+            (TimeDelta(1, TimeUnit.MINUTE), 180),
+        ]:
+            with self.subTest(time_delta=time_delta):
+                acceleration = jerk * time_delta
+                self.assertIsInstance(acceleration, AngularAcceleration)
+                self.assertAlmostEqual(
+                    expected_value,
+                    acceleration.as_unit(AngleUnit.RADIAN, TimeUnit.SECOND),
+                )
+
+    def test_multiply_time_delta_by_rate_matches_other_order(self) -> None:
+        for rate, time_delta in [
+            (
+                AngularVelocity(3, AngleUnit.DEGREE, TimeUnit.SECOND),
+                TimeDelta(2, TimeUnit.SECOND),
+            ),
+            (
+                AngularAcceleration(3, AngleUnit.RADIAN, TimeUnit.SECOND),
+                TimeDelta(2, TimeUnit.MILLISECOND),
+            ),
+            (
+                AngularJerk(3, AngleUnit.REVOLUTION, TimeUnit.SECOND),
+                TimeDelta(2, TimeUnit.SECOND),
+            ),
+        ]:
+            with self.subTest(rate=rate, time_delta=time_delta):
+                product = time_delta * rate
+                self.assertIsInstance(product, type(rate * time_delta))
+                self.assertEqual(rate * time_delta, product)
+                self.assertEqual(str(rate * time_delta), str(product))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from array import array
+
+from src.units import (
+    AngleUnit,
+    AngularAcceleration,
+    AngularDisplacement,
+    AngularJerk,
+    AngularVelocity,
+    TimeUnit,
+)
+from src.units.angular_motion import convert_into, make_converter
+
+
+class MakeConverterTest(unittest.TestCase):
+    """Unit tests for the angular-motion converter factory."""
+
+    def test_displacement_converter_matches_as_unit(self) -> None:
+        convert = make_converter(AngleUnit.REVOLUTION, AngleUnit.DEGREE)
+        self.assertAlmostEqual(
+            AngularDisplacement(12.5, AngleUnit.REVOLUTION).as_unit(AngleUnit.DEGREE),
+            convert(12.5),
+        )
+
+    def test_velocity_converter_matches_as_unit(self) -> None:
+        convert = make_converter(
+            (AngleUnit.REVOLUTION, TimeUnit.MINUTE),
+            (AngleUnit.RADIAN, TimeUnit.SECOND),
+        )
+        self.assertAlmostEqual(
+            AngularVelocity(12.5, AngleUnit.REVOLUTION, TimeUnit.MINUTE).as_unit(
+                AngleUnit.RADIAN, TimeUnit.SECOND
+            ),
+            convert(12.5),
+        )
+
+    def test_acceleration_converter_matches_as_unit(self) -> None:
+        convert = make_converter(
+            (AngleUnit.DEGREE, TimeUnit.SECOND, TimeUnit.SECOND),
+            (AngleUnit.RADIAN, TimeUnit.MILLISECOND, TimeUnit.SECOND),
+        )
+        self.assertAlmostEqual(
+            AngularAcceleration(12.5, AngleUnit.DEGREE, TimeUnit.SECOND).as_unit(
+                AngleUnit.RADIAN, TimeUnit.MILLISECOND, TimeUnit.SECOND
+            ),
+            convert(12.5),
+        )
+
+    def test_jerk_converter_matches_as_unit(self) -> None:
+        convert = make_converter(
+            (AngleUnit.RADIAN, TimeUnit.SECOND, TimeUnit.SECOND, TimeUnit.SECOND),
+            (AngleUnit.DEGREE, TimeUnit.SECOND, TimeUnit.MINUTE, TimeUnit.MINUTE),
+        )
+        self.assertAlmostEqual(
+            AngularJerk(12.5, AngleUnit.RADIAN, TimeUnit.SECOND).as_unit(
+                AngleUnit.DEGREE, TimeUnit.SECOND, TimeUnit.MINUTE, TimeUnit.MINUTE
+            ),
+            convert(12.5),
+        )
+
+    def test_make_converter_with_mismatched_units_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            make_converter(
+                AngleUnit.RADIAN,
+                (AngleUnit.RADIAN, TimeUnit.SECOND),  # type: ignore[arg-type]
+            )
+
+    def test_make_converter_with_invalid_unit_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            make_converter(AngleUnit.RADIAN, 0)  # type: ignore[arg-type]
+
+
+class ConvertIntoTest(unittest.TestCase):
+    """Unit tests for the angular-motion buffer converter."""
+
+    def test_convert_into_matches_converter(self) -> None:
+        from_unit = (AngleUnit.REVOLUTION, TimeUnit.SECOND)
+        to_unit = (AngleUnit.DEGREE, TimeUnit.MINUTE)
+        convert = make_converter(from_unit, to_unit)
+        src = array("d", [0, 1.5, 12.5])
+        dst = array("d", [0, 0, 0])
+        convert_into(src, dst, from_unit, to_unit)
+        for index, value in enumerate(src):
+            with self.subTest(index=index):
+                self.assertAlmostEqual(convert(value), dst[index])
+
+    def test_convert_into_same_buffer_converts_in_place(self) -> None:
+        convert = make_converter(AngleUnit.REVOLUTION, AngleUnit.DEGREE)
+        values = array("d", [1.5, 12.5])
+        convert_into(values, values, AngleUnit.REVOLUTION, AngleUnit.DEGREE)
+        self.assertAlmostEqual(convert(1.5), values[0])
+        self.assertAlmostEqual(convert(12.5), values[1])
+
+    def test_convert_into_shorter_destination_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            convert_into(
+                array("d", [1, 2]),
+                array("d", [0]),
+                AngleUnit.REVOLUTION,
+                AngleUnit.DEGREE,
+            )
+
+    def test_convert_into_with_mismatched_units_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            convert_into(
+                array("d", [1]),
+                array("d", [0]),
+                (AngleUnit.REVOLUTION, TimeUnit.SECOND),
+                (AngleUnit.DEGREE, TimeUnit.SECOND, TimeUnit.SECOND),  # type: ignore[arg-type]
+            )
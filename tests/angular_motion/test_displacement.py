@@ -150,3 +150,9 @@ class AngularDisplacementTest(unittest.TestCase):
                     is_greater_than_or_equal_to,
                     displacement1 >= displacement2,
                 )
+
+    def test_get_displacement_value_as_invalid_unit_raises_value_error(self) -> None:
+        displacement = AngularDisplacement(1, AngleUnit.RADIAN)
+        for invalid_unit in [-1, 0, 4, 5, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                displacement.as_unit(invalid_unit)  # type: ignore[arg-type]
@@ -0,0 +1,124 @@
+import math
+import unittest
+from array import array
+
+from src.units import Angle, AngleUnit, AngularDisplacement
+from src.units.angular_motion import Unwrapper
+
+
+class UnwrapperTest(unittest.TestCase):
+    """Unit tests for the angular displacement unwrapper."""
+
+    def test_first_angle_produces_equal_displacement(self) -> None:
+        unwrapper = Unwrapper(AngleUnit.DEGREE)
+        displacement = unwrapper.update(Angle(30, AngleUnit.DEGREE))
+        self.assertIsInstance(displacement, AngularDisplacement)
+        self.assertAlmostEqual(30, displacement.as_unit(AngleUnit.DEGREE))
+
+    def test_update_keeps_count_of_turns(self) -> None:
+        unwrapper = Unwrapper(AngleUnit.DEGREE)
+        for value, expected_value in [
+            (350, 350),
+            (10, 370),
+            (100, 460),
+            (200, 560),
+            (300, 660),
+            (20, 740),
+            (300, 660),
+            (200, 560),
+        ]:
+            with self.subTest(value=value, expected_value=expected_value):
+                displacement = unwrapper.update(Angle(value, AngleUnit.DEGREE))
+                self.assertAlmostEqual(
+                    expected_value, displacement.as_unit(AngleUnit.DEGREE)
+                )
+
+    def test_update_with_angle_in_other_unit(self) -> None:
+        unwrapper = Unwrapper(AngleUnit.REVOLUTION)
+        unwrapper.update(Angle(0.9, AngleUnit.REVOLUTION))
+        displacement = unwrapper.update(Angle(36, AngleUnit.DEGREE))
+        self.assertAlmostEqual(1.1, displacement.as_unit(AngleUnit.REVOLUTION))
+
+    def test_update_raw_accepts_values_outside_single_turn(self) -> None:
+        unwrapper = Unwrapper(AngleUnit.DEGREE)
+        unwrapper.update_raw(-10)
+        displacement = unwrapper.update_raw(710)
+        self.assertAlmostEqual(-10, displacement.as_unit(AngleUnit.DEGREE))
+
+    def test_update_raw_removes_huge_jump_in_one_step(self) -> None:
+        unwrapper = Unwrapper(AngleUnit.DEGREE)
+        unwrapper.update_raw(10)
+        displacement = unwrapper.update_raw(20 + 360 * 1e12)
+        self.assertAlmostEqual(20, displacement.as_unit(AngleUnit.DEGREE), delta=1e-3)
+
+    def test_update_raw_with_non_finite_value_raises_value_error(self) -> None:
+        for value in [math.inf, -math.inf, math.nan]:
+            with self.subTest(value=value):
+                unwrapper = Unwrapper(AngleUnit.DEGREE)
+                with self.assertRaises(ValueError):
+                    unwrapper.update_raw(value)
+                unwrapper.update_raw(350)
+                with self.assertRaises(ValueError):
+                    unwrapper.update_raw(value)
+                displacement = unwrapper.update_raw(10)
+                self.assertAlmostEqual(370, displacement.as_unit(AngleUnit.DEGREE))
+
+    def test_unwrap_into_with_non_finite_value_leaves_stream_as_it_was(self) -> None:
+        unwrapper = Unwrapper(AngleUnit.DEGREE)
+        unwrapper.update_raw(350)
+        values = array("d", [10, math.inf])
+        with self.assertRaises(ValueError):
+            unwrapper.unwrap_into(values, values)
+        displacement = unwrapper.update_raw(10)
+        self.assertAlmostEqual(370, displacement.as_unit(AngleUnit.DEGREE))
+
+    def test_reset_starts_new_stream(self) -> None:
+        unwrapper = Unwrapper(AngleUnit.DEGREE)
+        unwrapper.update_raw(350)
+        unwrapper.update_raw(10)
+        unwrapper.reset()
+        displacement = unwrapper.update_raw(10)
+        self.assertAlmostEqual(10, displacement.as_unit(AngleUnit.DEGREE))
+
+    def test_unwrap_into_matches_update_raw(self) -> None:
+        values = [(37.5 * index) % 360 for index in range(30)]
+        unwrapper = Unwrapper(AngleUnit.DEGREE)
+        src = array("d", values)
+        dst = array("d", [0] * len(src))
+        Unwrapper(AngleUnit.DEGREE).unwrap_into(src, dst)
+        for index, value in enumerate(values):
+            with self.subTest(index=index):
+                self.assertAlmostEqual(
+                    unwrapper.update_raw(value).as_unit(AngleUnit.DEGREE), dst[index]
+                )
+
+    def test_unwrap_into_continues_stream(self) -> None:
+        unwrapper = Unwrapper(AngleUnit.DEGREE)
+        unwrapper.update_raw(350)
+        values = array("d", [10, 100])
+        unwrapper.unwrap_into(values, values)
+        self.assertAlmostEqual(370, values[0])
+        self.assertAlmostEqual(460, values[1])
+        displacement = unwrapper.update_raw(200)
+        self.assertAlmostEqual(560, displacement.as_unit(AngleUnit.DEGREE))
+
+    def test_unwrap_into_empty_source_does_nothing(self) -> None:
+        unwrapper = Unwrapper(AngleUnit.DEGREE)
+        dst = array("d", [-1])
+        unwrapper.unwrap_into(array("d"), dst)
+        self.assertEqual(-1, dst[0])
+        displacement = unwrapper.update_raw(10)
+        self.assertAlmostEqual(10, displacement.as_unit(AngleUnit.DEGREE))
+
+    def test_unwrap_into_shorter_destination_raises_value_error(self) -> None:
+        unwrapper = Unwrapper(AngleUnit.DEGREE)
+        with self.assertRaises(ValueError):
+            unwrapper.unwrap_into(array("d", [1, 2]), array("d", [0]))
+
+    def test_create_unwrapper_with_invalid_unit_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            Unwrapper(0)  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    unittest.main()
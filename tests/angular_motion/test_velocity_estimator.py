@@ -0,0 +1,68 @@
+import unittest
+from array import array
+
+from src.units import (
+    Angle,
+    AngleUnit,
+    AngularDisplacement,
+    AngularVelocity,
+    Time,
+    TimeArray,
+    TimeUnit,
+)
+from src.units.angular_motion import Unwrapper, VelocityEstimator
+from src.units.rate_estimators import CentralDifference, FirstDifference
+
+
+class VelocityEstimatorTest(unittest.TestCase):
+    """Unit tests for the angular velocity estimator class."""
+
+    def test_update_returns_angular_velocity_in_units_of_estimator(self) -> None:
+        estimator = VelocityEstimator(
+            FirstDifference(), AngleUnit.DEGREE, TimeUnit.SECOND
+        )
+        estimator.update(Time(0, TimeUnit.SECOND), Angle(10, AngleUnit.DEGREE))
+        velocity = estimator.update(
+            Time(2, TimeUnit.SECOND), AngularDisplacement(1, AngleUnit.REVOLUTION)
+        )
+        self.assertIsInstance(velocity, AngularVelocity)
+        if velocity is None:
+            self.fail("No rate was estimated.")
+        self.assertAlmostEqual(175, velocity.as_unit(AngleUnit.DEGREE, TimeUnit.SECOND))
+
+    def test_update_with_unwrapped_angles(self) -> None:
+        estimator = VelocityEstimator(
+            FirstDifference(), AngleUnit.DEGREE, TimeUnit.SECOND
+        )
+        unwrapper = Unwrapper(AngleUnit.DEGREE)
+        estimator.update(
+            Time(0, TimeUnit.SECOND), unwrapper.update(Angle(350, AngleUnit.DEGREE))
+        )
+        velocity = estimator.update(
+            Time(1, TimeUnit.SECOND), unwrapper.update(Angle(10, AngleUnit.DEGREE))
+        )
+        if velocity is None:
+            self.fail("No rate was estimated.")
+        self.assertAlmostEqual(20, velocity.as_unit(AngleUnit.DEGREE, TimeUnit.SECOND))
+
+    def test_estimate(self) -> None:
+        estimator = VelocityEstimator(
+            CentralDifference(), AngleUnit.DEGREE, TimeUnit.MINUTE
+        )
+        times = TimeArray([0, 1, 2, 3], TimeUnit.SECOND)
+        rates = estimator.estimate(times, array("d", [0, 1, 4, 9]))
+        self.assertEqual([120, 240], [round(rate, 6) for rate in rates])
+
+    def test_reset(self) -> None:
+        estimator = VelocityEstimator(
+            FirstDifference(), AngleUnit.RADIAN, TimeUnit.SECOND
+        )
+        estimator.update(Time(1, TimeUnit.SECOND), Angle(0, AngleUnit.RADIAN))
+        estimator.reset()
+        self.assertIsNone(
+            estimator.update(Time(0, TimeUnit.SECOND), Angle(0, AngleUnit.RADIAN))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
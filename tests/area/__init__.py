@@ -2,12 +2,29 @@
 
 from .test_area import AreaTest
 from .test_area_and_area_delta import AreaAndAreaDeltaTest
+from .test_area_array import AreaArrayTest
 from .test_area_delta import AreaDeltaTest
 from .test_constants import ZeroTest
+from .test_converter import ConvertIntoTest, MakeConverterTest
+from .test_filter import AreaFilterTest
+from .test_fixed_point_area import FixedPointAreaDeltaTest, FixedPointAreaTest
+from .test_isr import AreaCellTest, AreaThresholdTest
+from .test_series import AreaSeriesTest
+from .test_unit import UnitTest
 
 __all__ = [
-    "AreaTest",
-    "AreaDeltaTest",
     "AreaAndAreaDeltaTest",
+    "AreaArrayTest",
+    "AreaCellTest",
+    "AreaDeltaTest",
+    "AreaFilterTest",
+    "AreaSeriesTest",
+    "AreaTest",
+    "AreaThresholdTest",
+    "ConvertIntoTest",
+    "FixedPointAreaDeltaTest",
+    "FixedPointAreaTest",
+    "MakeConverterTest",
+    "UnitTest",
     "ZeroTest",
 ]
@@ -89,3 +89,9 @@ class AreaTest(unittest.TestCase):
                 self.assertEqual(is_less_than_or_equal_to, area1 <= area2)
                 self.assertEqual(is_greater_than, area1 > area2)
                 self.assertEqual(is_greater_than_or_equal_to, area1 >= area2)
+
+    def test_get_area_value_as_invalid_unit_raises_value_error(self) -> None:
+        area = Area(1, AreaUnit.SQUARE_METRE)
+        for invalid_unit in [-1, 0, 7, 8, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                area.as_unit(invalid_unit)  # type: ignore[arg-type]
@@ -0,0 +1,65 @@
+import unittest
+
+from src.units import (
+    Area,
+    AreaArray,
+    AreaDelta,
+    AreaDeltaArray,
+    AreaUnit,
+    NegativeAreaValueError,
+)
+
+
+class AreaArrayTest(unittest.TestCase):
+    """Unit tests for area array and area delta array classes."""
+
+    def test_get_area_array_values_as_unit(self) -> None:
+        areas = AreaArray([1, 2], AreaUnit.SQUARE_METRE)
+        values = areas.as_unit(AreaUnit.SQUARE_CENTIMETRE)
+        self.assertAlmostEqual(10_000, values[0])
+        self.assertAlmostEqual(20_000, values[1])
+
+    def test_create_negative_area_array_raises_error(self) -> None:
+        with self.assertRaises(NegativeAreaValueError):
+            _ = AreaArray([1, -1], AreaUnit.SQUARE_METRE)
+
+    def test_index_area_array_produces_area(self) -> None:
+        areas = AreaArray([1, 2], AreaUnit.SQUARE_CENTIMETRE)
+        area = areas[1]
+        self.assertIsInstance(area, Area)
+        self.assertAlmostEqual(2, area.as_unit(AreaUnit.SQUARE_CENTIMETRE))
+
+    def test_add_area_delta_array_to_area_array(self) -> None:
+        areas = AreaArray([1, 2], AreaUnit.SQUARE_METRE)
+        deltas = AreaDeltaArray([1, -1], AreaUnit.SQUARE_METRE)
+        values = (areas + deltas).as_unit(AreaUnit.SQUARE_METRE)
+        self.assertAlmostEqual(2, values[0])
+        self.assertAlmostEqual(1, values[1])
+
+    def test_subtract_area_delta_from_area_array_below_zero_raises_error(
+        self,
+    ) -> None:
+        areas = AreaArray([1, 2], AreaUnit.SQUARE_METRE)
+        with self.assertRaises(NegativeAreaValueError):
+            _ = areas - AreaDelta(1.5, AreaUnit.SQUARE_METRE)
+
+    def test_subtract_area_arrays_produces_area_delta_array(self) -> None:
+        areas1 = AreaArray([1, 2], AreaUnit.SQUARE_METRE)
+        areas2 = AreaArray([2, 1], AreaUnit.SQUARE_METRE)
+        deltas = areas1 - areas2
+        self.assertIsInstance(deltas, AreaDeltaArray)
+        values = deltas.as_unit(AreaUnit.SQUARE_METRE)
+        self.assertAlmostEqual(-1, values[0])
+        self.assertAlmostEqual(1, values[1])
+
+    def test_scale_area_delta_array(self) -> None:
+        deltas = AreaDeltaArray([1, -2], AreaUnit.SQUARE_METRE)
+        values = (deltas * 2).as_unit(AreaUnit.SQUARE_METRE)
+        self.assertAlmostEqual(2, values[0])
+        self.assertAlmostEqual(-4, values[1])
+
+    def test_compare_area_array_to_area(self) -> None:
+        areas = AreaArray([1, 2, 3], AreaUnit.SQUARE_METRE)
+        threshold = Area(2, AreaUnit.SQUARE_METRE)
+        self.assertEqual(bytearray([1, 0, 0]), areas < threshold)
+        self.assertEqual(bytearray([0, 1, 1]), areas >= threshold)
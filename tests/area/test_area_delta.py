@@ -150,3 +150,9 @@ class AreaDeltaTest(unittest.TestCase):
                     is_greater_than_or_equal_to,
                     area_delta1 >= area_delta2,
                 )
+
+    def test_get_area_delta_value_as_invalid_unit_raises_value_error(self) -> None:
+        area_delta = AreaDelta(1, AreaUnit.SQUARE_METRE)
+        for invalid_unit in [-1, 0, 7, 8, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                area_delta.as_unit(invalid_unit)  # type: ignore[arg-type]
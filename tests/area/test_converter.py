@@ -0,0 +1,78 @@
+import unittest
+from array import array
+
+from src.units import AreaDelta, AreaUnit
+from src.units.area import convert_into, make_converter
+
+
+class MakeConverterTest(unittest.TestCase):
+    """Unit tests for the area converter factory."""
+
+    def test_converter_matches_as_unit(self) -> None:
+        units = [
+            AreaUnit.SQUARE_METRE,
+            AreaUnit.SQUARE_CENTIMETRE,
+            AreaUnit.SQUARE_MILLIMETRE,
+            AreaUnit.SQUARE_YARD,
+            AreaUnit.SQUARE_FOOT,
+            AreaUnit.SQUARE_INCH,
+        ]
+
+        for from_unit in units:
+            for to_unit in units:
+                with self.subTest(from_unit=from_unit, to_unit=to_unit):
+                    convert = make_converter(from_unit, to_unit)
+                    self.assertAlmostEqual(
+                        AreaDelta(12.5, from_unit).as_unit(to_unit), convert(12.5)
+                    )
+
+    def test_converter_between_same_unit_returns_value(self) -> None:
+        convert = make_converter(AreaUnit.SQUARE_CENTIMETRE, AreaUnit.SQUARE_CENTIMETRE)
+        self.assertEqual(12.5, convert(12.5))
+
+    def test_make_converter_with_invalid_unit_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            make_converter(AreaUnit.SQUARE_METRE, 0)  # type: ignore[arg-type]
+
+
+class ConvertIntoTest(unittest.TestCase):
+    """Unit tests for the area buffer converter."""
+
+    def test_convert_into_matches_converter(self) -> None:
+        convert = make_converter(AreaUnit.SQUARE_INCH, AreaUnit.SQUARE_CENTIMETRE)
+        src = array("d", [0, 1.5, 12.5])
+        dst = array("d", [0, 0, 0])
+        convert_into(src, dst, AreaUnit.SQUARE_INCH, AreaUnit.SQUARE_CENTIMETRE)
+        for index, value in enumerate(src):
+            with self.subTest(index=index):
+                self.assertAlmostEqual(convert(value), dst[index])
+
+    def test_convert_into_same_buffer_converts_in_place(self) -> None:
+        convert = make_converter(AreaUnit.SQUARE_INCH, AreaUnit.SQUARE_CENTIMETRE)
+        values = array("d", [1.5, 12.5])
+        convert_into(values, values, AreaUnit.SQUARE_INCH, AreaUnit.SQUARE_CENTIMETRE)
+        self.assertAlmostEqual(convert(1.5), values[0])
+        self.assertAlmostEqual(convert(12.5), values[1])
+
+    def test_convert_into_longer_destination_leaves_remainder(self) -> None:
+        convert = make_converter(AreaUnit.SQUARE_INCH, AreaUnit.SQUARE_CENTIMETRE)
+        dst = array("f", [-1, -1, -1])
+        convert_into(
+            array("h", [2, 4]), dst, AreaUnit.SQUARE_INCH, AreaUnit.SQUARE_CENTIMETRE
+        )
+        self.assertAlmostEqual(convert(2), dst[0], places=3)
+        self.assertAlmostEqual(convert(4), dst[1], places=3)
+        self.assertEqual(-1, dst[2])
+
+    def test_convert_into_shorter_destination_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            convert_into(
+                array("d", [1, 2]),
+                array("d", [0]),
+                AreaUnit.SQUARE_INCH,
+                AreaUnit.SQUARE_CENTIMETRE,
+            )
+
+    def test_convert_into_with_invalid_unit_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            convert_into(array("d", [1]), array("d", [0]), AreaUnit.SQUARE_INCH, 0)  # type: ignore[arg-type]
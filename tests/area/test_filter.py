@@ -0,0 +1,39 @@
+import unittest
+
+from src.units import Area, AreaUnit, NegativeAreaValueError
+from src.units.area import AreaFilter
+from src.units.filters import MovingAverage, MovingMedian
+
+
+class AreaFilterTest(unittest.TestCase):
+    """Unit tests for the area filter class."""
+
+    def test_update_returns_filtered_area_in_unit_of_filter(self) -> None:
+        area_filter = AreaFilter(MovingAverage(2), AreaUnit.SQUARE_MILLIMETRE)
+        area_filter.update(Area(1, AreaUnit.SQUARE_CENTIMETRE))
+        filtered = area_filter.update(Area(0, AreaUnit.SQUARE_MILLIMETRE))
+        self.assertIsInstance(filtered, Area)
+        self.assertAlmostEqual(50, filtered.as_unit(AreaUnit.SQUARE_MILLIMETRE))
+        self.assertAlmostEqual(0.5, filtered.as_unit(AreaUnit.SQUARE_CENTIMETRE))
+
+    def test_update_value(self) -> None:
+        area_filter = AreaFilter(MovingMedian(3), AreaUnit.SQUARE_MILLIMETRE)
+        for value in (100, 101, 900):
+            filtered = area_filter.update_value(value)
+        self.assertAlmostEqual(101, filtered.as_unit(AreaUnit.SQUARE_MILLIMETRE))
+
+    def test_update_invalid_value_raises_error(self) -> None:
+        area_filter = AreaFilter(MovingAverage(2), AreaUnit.SQUARE_MILLIMETRE)
+        with self.assertRaises(NegativeAreaValueError):
+            area_filter.update_value(-1)
+
+    def test_reset(self) -> None:
+        area_filter = AreaFilter(MovingAverage(2), AreaUnit.SQUARE_MILLIMETRE)
+        area_filter.update_value(10)
+        area_filter.reset()
+        filtered = area_filter.update_value(4)
+        self.assertAlmostEqual(4, filtered.as_unit(AreaUnit.SQUARE_MILLIMETRE))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+from src.units import Area, AreaDelta, AreaUnit, NegativeAreaValueError
+from src.units.area import FixedPointArea, FixedPointAreaDelta
+
+
+class FixedPointAreaTest(unittest.TestCase):
+    """Unit tests for the fixed-point area class."""
+
+    def test_get_fixed_point_area_value_as_unit(self) -> None:
+        area = FixedPointArea(1_000, AreaUnit.SQUARE_CENTIMETRE)
+        for unit, expected_value in [
+            (AreaUnit.SQUARE_CENTIMETRE, 1_000),
+            (AreaUnit.SQUARE_INCH, 155),
+        ]:
+            with self.subTest(unit=unit, expected_value=expected_value):
+                value = area.as_unit(unit)
+                self.assertIsInstance(value, int)
+                self.assertEqual(expected_value, value)
+
+    def test_create_negative_fixed_point_area_raises_error(self) -> None:
+        with self.assertRaises(NegativeAreaValueError):
+            _ = FixedPointArea(-1, AreaUnit.SQUARE_CENTIMETRE)
+
+    def test_fixed_point_area_matches_floating_point_area(self) -> None:
+        area = FixedPointArea(1_000, AreaUnit.SQUARE_CENTIMETRE).to_area()
+        self.assertIsInstance(area, Area)
+        self.assertAlmostEqual(1_000, area.as_unit(AreaUnit.SQUARE_CENTIMETRE))
+
+    def test_add_fixed_point_area_delta_produces_fixed_point_area(self) -> None:
+        area = FixedPointArea(1, AreaUnit.SQUARE_METRE)
+        delta = FixedPointAreaDelta(1, AreaUnit.SQUARE_CENTIMETRE)
+        for new_area in (area + delta, delta + area):
+            with self.subTest(new_area=new_area):
+                self.assertIsInstance(new_area, FixedPointArea)
+                self.assertEqual(10_001, new_area.as_unit(AreaUnit.SQUARE_CENTIMETRE))
+
+    def test_subtract_fixed_point_areas_produces_fixed_point_area_delta(self) -> None:
+        area1 = FixedPointArea(1, AreaUnit.SQUARE_CENTIMETRE)
+        area2 = FixedPointArea(3, AreaUnit.SQUARE_CENTIMETRE)
+        delta = area1 - area2
+        self.assertIsInstance(delta, FixedPointAreaDelta)
+        self.assertEqual(-2, delta.as_unit(AreaUnit.SQUARE_CENTIMETRE))
+
+    def test_subtract_fixed_point_area_delta_below_zero_raises_error(self) -> None:
+        area = FixedPointArea(1, AreaUnit.SQUARE_CENTIMETRE)
+        with self.assertRaises(NegativeAreaValueError):
+            _ = area - FixedPointAreaDelta(2, AreaUnit.SQUARE_CENTIMETRE)
+
+    def test_compare_fixed_point_areas(self) -> None:
+        area1 = FixedPointArea(1, AreaUnit.SQUARE_METRE)
+        area2 = FixedPointArea(10_000, AreaUnit.SQUARE_CENTIMETRE)
+        area3 = FixedPointArea(10_001, AreaUnit.SQUARE_CENTIMETRE)
+        self.assertEqual(area1, area2)
+        self.assertEqual(hash(area1), hash(area2))
+        self.assertLess(area1, area3)
+        self.assertLessEqual(area1, area2)
+        self.assertGreater(area3, area1)
+        self.assertGreaterEqual(area1, area2)
+
+
+class FixedPointAreaDeltaTest(unittest.TestCase):
+    """Unit tests for the fixed-point area delta class."""
+
+    def test_fixed_point_area_delta_matches_floating_point_area_delta(self) -> None:
+        delta = FixedPointAreaDelta(-1_000, AreaUnit.SQUARE_CENTIMETRE).to_area_delta()
+        self.assertIsInstance(delta, AreaDelta)
+        self.assertAlmostEqual(-1_000, delta.as_unit(AreaUnit.SQUARE_CENTIMETRE))
+
+    def test_scale_fixed_point_area_delta(self) -> None:
+        delta = FixedPointAreaDelta(3, AreaUnit.SQUARE_CENTIMETRE)
+        self.assertEqual(6, (delta * 2).as_unit(AreaUnit.SQUARE_CENTIMETRE))
+        self.assertEqual(6, (2 * delta).as_unit(AreaUnit.SQUARE_CENTIMETRE))
+        self.assertEqual(-3, (-delta).as_unit(AreaUnit.SQUARE_CENTIMETRE))
+        self.assertEqual(3, abs(-delta).as_unit(AreaUnit.SQUARE_CENTIMETRE))
+
+    def test_floor_divide_fixed_point_area_delta(self) -> None:
+        delta = FixedPointAreaDelta(7, AreaUnit.SQUARE_CENTIMETRE)
+        self.assertEqual(3, delta // FixedPointAreaDelta(2, AreaUnit.SQUARE_CENTIMETRE))
+        self.assertEqual(
+            FixedPointAreaDelta(35_000, AreaUnit.SQUARE_CENTIMETRE),
+            FixedPointAreaDelta(7, AreaUnit.SQUARE_METRE) // 2,
+        )
+
+    def test_add_and_subtract_fixed_point_area_deltas(self) -> None:
+        delta1 = FixedPointAreaDelta(1, AreaUnit.SQUARE_METRE)
+        delta2 = FixedPointAreaDelta(1, AreaUnit.SQUARE_CENTIMETRE)
+        self.assertEqual(10_001, (delta1 + delta2).as_unit(AreaUnit.SQUARE_CENTIMETRE))
+        self.assertEqual(9_999, (delta1 - delta2).as_unit(AreaUnit.SQUARE_CENTIMETRE))
@@ -0,0 +1,74 @@
+# pyright: reportUnknownMemberType=false
+
+import unittest
+
+from src.units import Area, AreaUnit, NegativeAreaValueError
+from src.units.area import AreaCell, AreaThreshold
+
+try:
+    import micropython  # type: ignore[import-not-found]
+except ImportError:
+    micropython = None
+
+
+class AreaCellTest(unittest.TestCase):
+    """Unit tests for the area cell class."""
+
+    def test_get_produces_area(self) -> None:
+        cell = AreaCell(AreaUnit.SQUARE_CENTIMETRE)
+        cell.set(12.5)
+        area = cell.get()
+        self.assertIsInstance(area, Area)
+        self.assertAlmostEqual(12.5, area.as_unit(AreaUnit.SQUARE_CENTIMETRE))
+
+    def test_get_initial_value(self) -> None:
+        cell = AreaCell(AreaUnit.SQUARE_CENTIMETRE, 12.5)
+        self.assertAlmostEqual(12.5, cell.get().as_unit(AreaUnit.SQUARE_CENTIMETRE))
+
+    def test_get_invalid_value_raises_error(self) -> None:
+        cell = AreaCell(AreaUnit.SQUARE_CENTIMETRE)
+        cell.set(-1)
+        with self.assertRaises(NegativeAreaValueError):
+            cell.get()
+
+    def test_set_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        cell = AreaCell(AreaUnit.SQUARE_CENTIMETRE)
+        value = 12.5
+        micropython.heap_lock()
+        try:
+            cell.set(value)
+            cell.set(9000)
+        finally:
+            micropython.heap_unlock()
+
+
+class AreaThresholdTest(unittest.TestCase):
+    """Unit tests for the area threshold class."""
+
+    def test_compare_raw_values_with_threshold(self) -> None:
+        threshold = AreaThreshold(
+            Area(1, AreaUnit.SQUARE_METRE), AreaUnit.SQUARE_CENTIMETRE
+        )
+        self.assertTrue(threshold.is_below(9000))
+        self.assertFalse(threshold.is_above(9000))
+        self.assertTrue(threshold.is_above(11000))
+        self.assertFalse(threshold.is_below(11000))
+
+    def test_compare_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        threshold = AreaThreshold(
+            Area(1, AreaUnit.SQUARE_METRE), AreaUnit.SQUARE_CENTIMETRE
+        )
+        micropython.heap_lock()
+        try:
+            is_below = threshold.is_below(9000)
+            is_above = threshold.is_above(9000)
+        finally:
+            micropython.heap_unlock()
+        self.assertTrue(is_below)
+        self.assertFalse(is_above)
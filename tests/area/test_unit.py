@@ -0,0 +1,76 @@
+# Generated by `tools/generate_units.py` from `tools/units_spec.json`, so edit the
+# spec & rerun the generator rather than editing this module.
+
+import math
+import unittest
+
+from src.units.units_inner.area import unit
+
+# The member, name, abbreviation & change in the quantity expressed as the unit per 1m^2
+# of each unit
+_UNITS = [
+    (unit.Unit.SQUARE_METRE, "square metre", "m^2", 1**2),
+    (unit.Unit.SQUARE_CENTIMETRE, "square centimetre", "cm^2", 100**2),
+    (unit.Unit.SQUARE_MILLIMETRE, "square millimetre", "mm^2", 1000**2),
+    (unit.Unit.SQUARE_YARD, "square yard", "yd^2", 1.09361329834**2),
+    (unit.Unit.SQUARE_FOOT, "square foot", "ft^2", 3.28083989501**2),
+    (unit.Unit.SQUARE_INCH, "square inch", "in^2", 39.3700787402**2),
+]
+
+
+class UnitTest(unittest.TestCase):
+    """Unit tests for the area unit tables."""
+
+    def assert_close(self, expected: float, actual: float) -> None:
+        self.assertAlmostEqual(expected, actual, delta=abs(expected) * 1e-9)
+
+    def test_get_name(self) -> None:
+        for member, name, *_ in _UNITS:
+            with self.subTest(unit=member):
+                self.assertEqual(name, unit.get_name(member))
+
+    def test_get_abbreviation(self) -> None:
+        for member, _, abbreviation, *_ in _UNITS:
+            with self.subTest(unit=member):
+                self.assertEqual(abbreviation, unit.get_abbreviation(member))
+
+    def test_invalid_unit_raises_value_error(self) -> None:
+        for invalid_unit in [0, len(_UNITS) + 1]:
+            with (
+                self.subTest(unit=invalid_unit),
+                self.assertRaises(ValueError),
+            ):
+                unit.get_name(invalid_unit)  # type: ignore[arg-type]
+
+    def test_get_unit_delta_per_square_metre(self) -> None:
+        for member, _, _, unit_delta in _UNITS:
+            with self.subTest(unit=member):
+                self.assert_close(
+                    unit_delta, unit.get_unit_delta_per_square_metre(member)
+                )
+
+    def test_conversion_factors(self) -> None:
+        for from_member, _, _, from_unit_delta in _UNITS:
+            for to_member, _, _, to_unit_delta in _UNITS:
+                with self.subTest(from_unit=from_member, to_unit=to_member):
+                    index = from_member * unit.CONVERSION_FACTORS_STRIDE + to_member
+                    self.assert_close(
+                        to_unit_delta / from_unit_delta,
+                        unit.CONVERSION_FACTORS[index],
+                    )
+
+    def test_get_fixed_point_ratio(self) -> None:
+        for member, _, _, unit_delta in _UNITS:
+            with self.subTest(unit=member):
+                numerator, denominator = unit.get_fixed_point_ratio(member)
+                self.assertTrue(
+                    math.isclose(
+                        unit.FIXED_POINT_RESOLUTION_PER_SQUARE_METRE / unit_delta,
+                        numerator / denominator,
+                        rel_tol=1e-7,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,23 @@
 """Package for unit tests of current classes."""
 
+from .test_converter import ConvertIntoTest, MakeConverterTest
 from .test_current import CurrentTest
+from .test_current_array import CurrentArrayTest
+from .test_filter import CurrentFilterTest
+from .test_fixed_point_current import FixedPointCurrentTest
+from .test_isr import CurrentCellTest, CurrentThresholdTest
+from .test_series import CurrentSeriesTest
+from .test_unit import UnitTest
 
 __all__ = [
+    "ConvertIntoTest",
+    "CurrentArrayTest",
+    "CurrentCellTest",
+    "CurrentFilterTest",
+    "CurrentSeriesTest",
     "CurrentTest",
+    "CurrentThresholdTest",
+    "FixedPointCurrentTest",
+    "MakeConverterTest",
+    "UnitTest",
 ]
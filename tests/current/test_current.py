@@ -147,3 +147,9 @@ class CurrentTest(unittest.TestCase):
                     is_greater_than_or_equal_to,
                     current1 >= current2,
                 )
+
+    def test_get_current_value_as_invalid_unit_raises_value_error(self) -> None:
+        current = Current(1, CurrentUnit.AMPERE)
+        for invalid_unit in [-1, 0, 4, 5, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                current.as_unit(invalid_unit)  # type: ignore[arg-type]
@@ -0,0 +1,49 @@
+import unittest
+
+from src.units import Current, CurrentArray, CurrentUnit
+
+
+class CurrentArrayTest(unittest.TestCase):
+    """Unit tests for current array class."""
+
+    def test_get_current_array_values_as_unit(self) -> None:
+        currents = CurrentArray([1, -2], CurrentUnit.AMPERE)
+        values = currents.as_unit(CurrentUnit.MILLIAMPERE)
+        self.assertAlmostEqual(1_000, values[0])
+        self.assertAlmostEqual(-2_000, values[1])
+
+    def test_index_current_array_produces_current(self) -> None:
+        currents = CurrentArray([1, -2], CurrentUnit.MILLIAMPERE)
+        current = currents[1]
+        self.assertIsInstance(current, Current)
+        self.assertAlmostEqual(-2, current.as_unit(CurrentUnit.MILLIAMPERE))
+
+    def test_add_current_to_current_array(self) -> None:
+        currents = CurrentArray([1, -2], CurrentUnit.AMPERE)
+        for new_currents in (
+            currents + Current(1, CurrentUnit.AMPERE),
+            Current(1, CurrentUnit.AMPERE) + currents,
+        ):
+            with self.subTest(new_currents=new_currents):
+                values = new_currents.as_unit(CurrentUnit.AMPERE)
+                self.assertAlmostEqual(2, values[0])
+                self.assertAlmostEqual(-1, values[1])
+
+    def test_subtract_current_arrays(self) -> None:
+        currents1 = CurrentArray([1, -2], CurrentUnit.AMPERE)
+        currents2 = CurrentArray([1, 1], CurrentUnit.AMPERE)
+        values = (currents1 - currents2).as_unit(CurrentUnit.AMPERE)
+        self.assertAlmostEqual(0, values[0])
+        self.assertAlmostEqual(-3, values[1])
+
+    def test_scale_current_array(self) -> None:
+        currents = CurrentArray([1, -2], CurrentUnit.AMPERE)
+        values = (-currents / 2).as_unit(CurrentUnit.AMPERE)
+        self.assertAlmostEqual(-0.5, values[0])
+        self.assertAlmostEqual(1, values[1])
+
+    def test_compare_current_array_to_current(self) -> None:
+        currents = CurrentArray([1, -2, 3], CurrentUnit.AMPERE)
+        threshold = Current(0, CurrentUnit.AMPERE)
+        self.assertEqual(bytearray([0, 1, 0]), currents < threshold)
+        self.assertEqual(bytearray([1, 0, 1]), currents > threshold)
@@ -0,0 +1,34 @@
+import unittest
+
+from src.units import Current, CurrentUnit
+from src.units.current import CurrentFilter
+from src.units.filters import MovingAverage, MovingMedian
+
+
+class CurrentFilterTest(unittest.TestCase):
+    """Unit tests for the current filter class."""
+
+    def test_update_returns_filtered_current_in_unit_of_filter(self) -> None:
+        current_filter = CurrentFilter(MovingAverage(2), CurrentUnit.MILLIAMPERE)
+        current_filter.update(Current(1, CurrentUnit.AMPERE))
+        filtered = current_filter.update(Current(0, CurrentUnit.MILLIAMPERE))
+        self.assertIsInstance(filtered, Current)
+        self.assertAlmostEqual(500, filtered.as_unit(CurrentUnit.MILLIAMPERE))
+        self.assertAlmostEqual(0.5, filtered.as_unit(CurrentUnit.AMPERE))
+
+    def test_update_value(self) -> None:
+        current_filter = CurrentFilter(MovingMedian(3), CurrentUnit.MILLIAMPERE)
+        for value in (100, 101, 900):
+            filtered = current_filter.update_value(value)
+        self.assertAlmostEqual(101, filtered.as_unit(CurrentUnit.MILLIAMPERE))
+
+    def test_reset(self) -> None:
+        current_filter = CurrentFilter(MovingAverage(2), CurrentUnit.MILLIAMPERE)
+        current_filter.update_value(10)
+        current_filter.reset()
+        filtered = current_filter.update_value(4)
+        self.assertAlmostEqual(4, filtered.as_unit(CurrentUnit.MILLIAMPERE))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from src.units import Current, CurrentUnit
+from src.units.current import FixedPointCurrent
+
+
+class FixedPointCurrentTest(unittest.TestCase):
+    """Unit tests for the fixed-point current class."""
+
+    def test_get_fixed_point_current_value_as_unit(self) -> None:
+        current = FixedPointCurrent(1_500, CurrentUnit.MILLIAMPERE)
+        for unit, expected_value in [
+            (CurrentUnit.MILLIAMPERE, 1_500),
+            (CurrentUnit.AMPERE, 2),
+            (CurrentUnit.MICROAMPERE, 1_500_000),
+        ]:
+            with self.subTest(unit=unit, expected_value=expected_value):
+                value = current.as_unit(unit)
+                self.assertIsInstance(value, int)
+                self.assertEqual(expected_value, value)
+
+    def test_fixed_point_current_matches_floating_point_current(self) -> None:
+        current = FixedPointCurrent(-1_500, CurrentUnit.MILLIAMPERE).to_current()
+        self.assertIsInstance(current, Current)
+        self.assertAlmostEqual(-1_500, current.as_unit(CurrentUnit.MILLIAMPERE))
+
+    def test_add_and_subtract_fixed_point_currents(self) -> None:
+        current1 = FixedPointCurrent(1, CurrentUnit.AMPERE)
+        current2 = FixedPointCurrent(1, CurrentUnit.MILLIAMPERE)
+        self.assertEqual(1_001, (current1 + current2).as_unit(CurrentUnit.MILLIAMPERE))
+        self.assertEqual(999, (current1 - current2).as_unit(CurrentUnit.MILLIAMPERE))
+
+    def test_scale_fixed_point_current(self) -> None:
+        current = FixedPointCurrent(3, CurrentUnit.MILLIAMPERE)
+        self.assertEqual(6, (current * 2).as_unit(CurrentUnit.MILLIAMPERE))
+        self.assertEqual(6, (2 * current).as_unit(CurrentUnit.MILLIAMPERE))
+        self.assertEqual(-3, (-current).as_unit(CurrentUnit.MILLIAMPERE))
+        self.assertEqual(3, abs(-current).as_unit(CurrentUnit.MILLIAMPERE))
+        self.assertEqual(
+            FixedPointCurrent(2, CurrentUnit.MILLIAMPERE),
+            FixedPointCurrent(4, CurrentUnit.MILLIAMPERE) // 2,
+        )
+        self.assertEqual(3, current // FixedPointCurrent(1, CurrentUnit.MILLIAMPERE))
+
+    def test_compare_fixed_point_currents(self) -> None:
+        current1 = FixedPointCurrent(1, CurrentUnit.AMPERE)
+        current2 = FixedPointCurrent(1_000, CurrentUnit.MILLIAMPERE)
+        current3 = FixedPointCurrent(-1, CurrentUnit.MILLIAMPERE)
+        self.assertEqual(current1, current2)
+        self.assertEqual(hash(current1), hash(current2))
+        self.assertLess(current3, current1)
+        self.assertGreater(current1, current3)
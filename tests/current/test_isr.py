@@ -0,0 +1,68 @@
+# pyright: reportUnknownMemberType=false
+
+import unittest
+
+from src.units import Current, CurrentUnit
+from src.units.current import CurrentCell, CurrentThreshold
+
+try:
+    import micropython  # type: ignore[import-not-found]
+except ImportError:
+    micropython = None
+
+
+class CurrentCellTest(unittest.TestCase):
+    """Unit tests for the current cell class."""
+
+    def test_get_produces_current(self) -> None:
+        cell = CurrentCell(CurrentUnit.MILLIAMPERE)
+        cell.set(12.5)
+        current = cell.get()
+        self.assertIsInstance(current, Current)
+        self.assertAlmostEqual(12.5, current.as_unit(CurrentUnit.MILLIAMPERE))
+
+    def test_get_initial_value(self) -> None:
+        cell = CurrentCell(CurrentUnit.MILLIAMPERE, 12.5)
+        self.assertAlmostEqual(12.5, cell.get().as_unit(CurrentUnit.MILLIAMPERE))
+
+    def test_set_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        cell = CurrentCell(CurrentUnit.MILLIAMPERE)
+        value = 12.5
+        micropython.heap_lock()
+        try:
+            cell.set(value)
+            cell.set(900)
+        finally:
+            micropython.heap_unlock()
+
+
+class CurrentThresholdTest(unittest.TestCase):
+    """Unit tests for the current threshold class."""
+
+    def test_compare_raw_values_with_threshold(self) -> None:
+        threshold = CurrentThreshold(
+            Current(1, CurrentUnit.AMPERE), CurrentUnit.MILLIAMPERE
+        )
+        self.assertTrue(threshold.is_below(900))
+        self.assertFalse(threshold.is_above(900))
+        self.assertTrue(threshold.is_above(1100))
+        self.assertFalse(threshold.is_below(1100))
+
+    def test_compare_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        threshold = CurrentThreshold(
+            Current(1, CurrentUnit.AMPERE), CurrentUnit.MILLIAMPERE
+        )
+        micropython.heap_lock()
+        try:
+            is_below = threshold.is_below(900)
+            is_above = threshold.is_above(900)
+        finally:
+            micropython.heap_unlock()
+        self.assertTrue(is_below)
+        self.assertFalse(is_above)
@@ -0,0 +1,140 @@
+# pyright: reportUnknownMemberType=false
+
+import unittest
+
+from src.units import (
+    Current,
+    CurrentArray,
+    CurrentUnit,
+    Time,
+    TimeUnit,
+)
+from src.units.current import CurrentSeries
+
+try:
+    import micropython  # type: ignore[import-not-found]
+except ImportError:
+    micropython = None
+
+
+class CurrentSeriesTest(unittest.TestCase):
+    """Unit tests for the current series class."""
+
+    def test_push_and_read_back(self) -> None:
+        series = CurrentSeries(3, CurrentUnit.MILLIAMPERE)
+        series.push(Current(1, CurrentUnit.AMPERE))
+        series.push_value(90)
+        self.assertEqual(2, len(series))
+        self.assertIsInstance(series.oldest(), Current)
+        self.assertAlmostEqual(1000, series.oldest().as_unit(CurrentUnit.MILLIAMPERE))
+        self.assertAlmostEqual(90, series.latest().as_unit(CurrentUnit.MILLIAMPERE))
+
+    def test_push_overwrites_oldest_when_full(self) -> None:
+        series = CurrentSeries(3, CurrentUnit.AMPERE)
+        for value in range(5):
+            series.push_value(value)
+        self.assertEqual(3, len(series))
+        self.assertEqual(3, series.capacity)
+        values = [current.as_unit(CurrentUnit.AMPERE) for current in series]
+        self.assertEqual([2, 3, 4], values)
+
+    def test_index_from_oldest_and_latest(self) -> None:
+        series = CurrentSeries(3, CurrentUnit.AMPERE)
+        for value in range(4):
+            series.push_value(value)
+        self.assertEqual(1, series[0].as_unit(CurrentUnit.AMPERE))
+        self.assertEqual(3, series[-1].as_unit(CurrentUnit.AMPERE))
+        self.assertEqual(2, series[-2].as_unit(CurrentUnit.AMPERE))
+        with self.assertRaises(IndexError):
+            _ = series[3]
+        with self.assertRaises(IndexError):
+            _ = series[-4]
+
+    def test_empty_series_raises_error(self) -> None:
+        series = CurrentSeries(3, CurrentUnit.AMPERE)
+        with self.assertRaises(IndexError):
+            series.latest()
+        with self.assertRaises(IndexError):
+            series.oldest()
+        self.assertEqual([], list(series))
+
+    def test_window(self) -> None:
+        series = CurrentSeries(4, CurrentUnit.MILLIAMPERE)
+        for value in range(6):
+            series.push_value(value)
+        window = series.window(3)
+        self.assertIsInstance(window, CurrentArray)
+        self.assertEqual([3, 4, 5], list(window.as_unit(CurrentUnit.MILLIAMPERE)))
+        self.assertEqual(
+            [2, 3, 4, 5], list(series.window().as_unit(CurrentUnit.MILLIAMPERE))
+        )
+        self.assertEqual(4, len(series.window(10)))
+        self.assertEqual(0, len(series.window(0)))
+
+    def test_window_after_buffer_is_compacted(self) -> None:
+        series = CurrentSeries(3, CurrentUnit.AMPERE, timestamped=True)
+        for value in range(10):
+            series.push_value(value, Time(value, TimeUnit.SECOND))
+        self.assertEqual([7, 8, 9], list(series.window().as_unit(CurrentUnit.AMPERE)))
+        self.assertEqual([8, 9], list(series.window(2).as_unit(CurrentUnit.AMPERE)))
+        self.assertEqual([7, 8, 9], list(series.times().as_unit(TimeUnit.SECOND)))
+        self.assertEqual(7, series[0].as_unit(CurrentUnit.AMPERE))
+        self.assertEqual(3, len(series))
+
+    def test_timestamps(self) -> None:
+        series = CurrentSeries(2, CurrentUnit.AMPERE, timestamped=True)
+        for index in range(3):
+            series.push_value(index, Time(index, TimeUnit.MILLISECOND))
+        self.assertIsInstance(series.time_at(0), Time)
+        self.assertAlmostEqual(1, series.time_at(0).as_unit(TimeUnit.MILLISECOND))
+        self.assertAlmostEqual(2, series.time_at(-1).as_unit(TimeUnit.MILLISECOND))
+        self.assertEqual(
+            [1, 2], [round(x) for x in series.times().as_unit(TimeUnit.MILLISECOND)]
+        )
+
+    def test_timestamped_series_requires_time(self) -> None:
+        series = CurrentSeries(2, CurrentUnit.AMPERE, timestamped=True)
+        with self.assertRaises(ValueError):
+            series.push_value(1)
+        self.assertEqual(0, len(series))
+
+    def test_untimestamped_series_rejects_time(self) -> None:
+        series = CurrentSeries(2, CurrentUnit.AMPERE)
+        with self.assertRaises(ValueError):
+            series.push_value(1, Time(1, TimeUnit.SECOND))
+        series.push_value(1)
+        with self.assertRaises(ValueError):
+            series.time_at(0)
+        with self.assertRaises(ValueError):
+            series.times()
+
+    def test_invalid_capacity_raises_error(self) -> None:
+        with self.assertRaises(ValueError):
+            CurrentSeries(0, CurrentUnit.AMPERE)
+
+    def test_clear(self) -> None:
+        series = CurrentSeries(2, CurrentUnit.AMPERE)
+        series.push_value(1)
+        series.clear()
+        self.assertEqual(0, len(series))
+        series.push_value(2)
+        self.assertEqual(2, series.latest().as_unit(CurrentUnit.AMPERE))
+
+    def test_repr(self) -> None:
+        series = CurrentSeries(3, CurrentUnit.AMPERE)
+        series.push_value(1.5)
+        self.assertEqual("CurrentSeries([1.5], ampere, capacity=3)", repr(series))
+
+    def test_push_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        series = CurrentSeries(2, CurrentUnit.AMPERE, timestamped=True)
+        current = Current(1, CurrentUnit.AMPERE)
+        time = Time(1, TimeUnit.SECOND)
+        micropython.heap_lock()
+        try:
+            for _ in range(3):
+                series.push(current, time)
+        finally:
+            micropython.heap_unlock()
@@ -1,6 +1,20 @@
 """Package for unit tests of volumetric flow rate classes."""
 
+from .test_converter import ConvertIntoTest, MakeConverterTest
+from .test_flow_rate_and_time_delta import FlowRateAndTimeDeltaTest
 from .test_mass_flow_rate import MassFlowRateTest
+from .test_mass_totalizer import MassTotalizerTest
+from .test_volume_totalizer import VolumeTotalizerTest
 from .test_volumetric_flow_rate import VolumetricFlowRateTest
+from .test_volumetric_flow_rate_estimator import VolumetricFlowRateEstimatorTest
 
-__all__ = ["VolumetricFlowRateTest", "MassFlowRateTest"]
+__all__ = [
+    "ConvertIntoTest",
+    "FlowRateAndTimeDeltaTest",
+    "MakeConverterTest",
+    "MassFlowRateTest",
+    "MassTotalizerTest",
+    "VolumeTotalizerTest",
+    "VolumetricFlowRateEstimatorTest",
+    "VolumetricFlowRateTest",
+]
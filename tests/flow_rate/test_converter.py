@@ -0,0 +1,87 @@
+import unittest
+from array import array
+
+from src.units import (
+    MassFlowRate,
+    MassUnit,
+    TimeUnit,
+    VolumetricFlowRate,
+    VolumeUnit,
+)
+from src.units.flow_rate import (
+    convert_mass_flow_rate_into,
+    convert_volumetric_flow_rate_into,
+    make_mass_flow_rate_converter,
+    make_volumetric_flow_rate_converter,
+)
+
+
+class MakeConverterTest(unittest.TestCase):
+    """Unit tests for the flow-rate converter factories."""
+
+    def test_volumetric_flow_rate_converter_matches_as_unit(self) -> None:
+        convert = make_volumetric_flow_rate_converter(
+            (VolumeUnit.LITRE, TimeUnit.MINUTE),
+            (VolumeUnit.CUBIC_METRE, TimeUnit.HOUR),
+        )
+        self.assertAlmostEqual(
+            VolumetricFlowRate(12.5, VolumeUnit.LITRE, TimeUnit.MINUTE).as_unit(
+                VolumeUnit.CUBIC_METRE, TimeUnit.HOUR
+            ),
+            convert(12.5),
+        )
+
+    def test_mass_flow_rate_converter_matches_as_unit(self) -> None:
+        convert = make_mass_flow_rate_converter(
+            (MassUnit.POUND, TimeUnit.MINUTE),
+            (MassUnit.KILOGRAM, TimeUnit.SECOND),
+        )
+        self.assertAlmostEqual(
+            MassFlowRate(12.5, MassUnit.POUND, TimeUnit.MINUTE).as_unit(
+                MassUnit.KILOGRAM, TimeUnit.SECOND
+            ),
+            convert(12.5),
+        )
+
+    def test_make_converter_with_invalid_unit_raises_value_error(self) -> None:
+        for make in [
+            make_volumetric_flow_rate_converter,
+            make_mass_flow_rate_converter,
+        ]:
+            with self.subTest(make=make), self.assertRaises(ValueError):
+                make((1, TimeUnit.SECOND), (0, TimeUnit.SECOND))  # type: ignore[arg-type]
+
+
+class ConvertIntoTest(unittest.TestCase):
+    """Unit tests for the flow-rate buffer converters."""
+
+    def test_volumetric_flow_rate_convert_into_matches_converter(self) -> None:
+        from_unit = (VolumeUnit.LITRE, TimeUnit.MINUTE)
+        to_unit = (VolumeUnit.CUBIC_METRE, TimeUnit.HOUR)
+        convert = make_volumetric_flow_rate_converter(from_unit, to_unit)
+        src = array("d", [0, 1.5, 12.5])
+        dst = array("d", [0, 0, 0])
+        convert_volumetric_flow_rate_into(src, dst, from_unit, to_unit)
+        for index, value in enumerate(src):
+            with self.subTest(index=index):
+                self.assertAlmostEqual(convert(value), dst[index])
+
+    def test_mass_flow_rate_convert_into_matches_converter(self) -> None:
+        from_unit = (MassUnit.POUND, TimeUnit.MINUTE)
+        to_unit = (MassUnit.KILOGRAM, TimeUnit.SECOND)
+        convert = make_mass_flow_rate_converter(from_unit, to_unit)
+        src = array("d", [0, 1.5, 12.5])
+        dst = array("d", [0, 0, 0])
+        convert_mass_flow_rate_into(src, dst, from_unit, to_unit)
+        for index, value in enumerate(src):
+            with self.subTest(index=index):
+                self.assertAlmostEqual(convert(value), dst[index])
+
+    def test_convert_into_shorter_destination_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            convert_mass_flow_rate_into(
+                array("d", [1, 2]),
+                array("d", [0]),
+                (MassUnit.POUND, TimeUnit.MINUTE),
+                (MassUnit.KILOGRAM, TimeUnit.SECOND),
+            )
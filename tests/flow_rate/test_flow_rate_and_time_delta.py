@@ -0,0 +1,72 @@
+import unittest
+
+from src.units import (
+    MassDelta,
+    MassFlowRate,
+    MassUnit,
+    TimeDelta,
+    TimeUnit,
+    VolumeDelta,
+    VolumetricFlowRate,
+    VolumeUnit,
+)
+
+
+class FlowRateAndTimeDeltaTest(unittest.TestCase):
+    """Unit tests for the interactions between flow rates & time differences."""
+
+    def test_multiply_volumetric_flow_rate_by_time_delta_produces_volume_delta(
+        self,
+    ) -> None:
+        flow_rate = VolumetricFlowRate(3, VolumeUnit.LITRE, TimeUnit.MINUTE)
+        for time_delta, expected_value in [
+            (TimeDelta(2, TimeUnit.MINUTE), 6),
+            (TimeDelta(30, TimeUnit.SECOND), 1.5),
+        ]:
+            with self.subTest(time_delta=time_delta):
+                volume_delta = flow_rate * time_delta
+                self.assertIsInstance(volume_delta, VolumeDelta)
+                self.assertAlmostEqual(
+                    expected_value, volume_delta.as_unit(VolumeUnit.LITRE)
+                )
+
+    def test_multiply_mass_flow_rate_by_time_delta_produces_mass_delta(self) -> None:
+        flow_rate = MassFlowRate(3, MassUnit.GRAM, TimeUnit.SECOND)
+        for time_delta, expected_value in [
+            (TimeDelta(2, TimeUnit.SECOND), 6),
+            (TimeDelta(1, TimeUnit.MINUTE), 180),
+        ]:
+            with self.subTest(time_delta=time_delta):
+                mass_delta = flow_rate * time_delta
+                self.assertIsInstance(mass_delta, MassDelta)
+                self.assertAlmostEqual(
+                    expected_value, mass_delta.as_unit(MassUnit.GRAM)
+                )
+
+    def test_multiply_flow_rate_by_time_delta_in_same_unit_preserves_unit(
+        self,
+    ) -> None:
+        flow_rate = VolumetricFlowRate(3, VolumeUnit.LITRE, TimeUnit.MINUTE)
+        volume_delta = flow_rate * TimeDelta(2, TimeUnit.MINUTE)
+        self.assertEqual("6 L", str(volume_delta))
+
+    def test_multiply_time_delta_by_flow_rate_matches_other_order(self) -> None:
+        for flow_rate, time_delta in [
+            (
+                VolumetricFlowRate(3, VolumeUnit.LITRE, TimeUnit.MINUTE),
+                TimeDelta(2, TimeUnit.MINUTE),
+            ),
+            (
+                MassFlowRate(3, MassUnit.GRAM, TimeUnit.SECOND),
+                TimeDelta(1, TimeUnit.MINUTE),
+            ),
+        ]:
+            with self.subTest(flow_rate=flow_rate, time_delta=time_delta):
+                product = time_delta * flow_rate
+                self.assertIsInstance(product, type(flow_rate * time_delta))
+                self.assertEqual(flow_rate * time_delta, product)
+                self.assertEqual(str(flow_rate * time_delta), str(product))
+
+
+if __name__ == "__main__":
+    unittest.main()
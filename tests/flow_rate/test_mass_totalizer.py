@@ -0,0 +1,61 @@
+import unittest
+
+from src.units import (
+    MassDelta,
+    MassFlowRate,
+    MassUnit,
+    Time,
+    TimeDelta,
+    TimeUnit,
+)
+from src.units.flow_rate import MassTotalizer
+
+
+class MassTotalizerTest(unittest.TestCase):
+    """Unit tests for the mass totalizer class."""
+
+    def test_add_returns_total_in_unit_of_totalizer(self) -> None:
+        totalizer = MassTotalizer(MassUnit.GRAM)
+        totalizer.add(
+            MassFlowRate(6, MassUnit.KILOGRAM, TimeUnit.MINUTE),
+            TimeDelta(30, TimeUnit.SECOND),
+        )
+        total = totalizer.total()
+        self.assertIsInstance(total, MassDelta)
+        self.assertAlmostEqual(3_000, total.as_unit(MassUnit.GRAM))
+        self.assertAlmostEqual(3, total.as_unit(MassUnit.KILOGRAM))
+
+    def test_many_ticks_do_not_drift(self) -> None:
+        totalizer = MassTotalizer(MassUnit.KILOGRAM)
+        flow_rate = MassFlowRate(0.6, MassUnit.KILOGRAM, TimeUnit.MINUTE)
+        tick = TimeDelta(1, TimeUnit.SECOND)
+        for _ in range(10_000):
+            totalizer.add(flow_rate, tick)
+        self.assertAlmostEqual(
+            100, totalizer.total().as_unit(MassUnit.KILOGRAM), places=12
+        )
+
+    def test_update(self) -> None:
+        totalizer = MassTotalizer(MassUnit.KILOGRAM)
+        totalizer.update(
+            MassFlowRate(1, MassUnit.KILOGRAM, TimeUnit.SECOND),
+            Time(0, TimeUnit.SECOND),
+        )
+        totalizer.update(
+            MassFlowRate(3, MassUnit.KILOGRAM, TimeUnit.SECOND),
+            Time(2_000, TimeUnit.MILLISECOND),
+        )
+        self.assertAlmostEqual(4, totalizer.total().as_unit(MassUnit.KILOGRAM))
+
+    def test_reset(self) -> None:
+        totalizer = MassTotalizer(MassUnit.KILOGRAM)
+        totalizer.add(
+            MassFlowRate(1, MassUnit.KILOGRAM, TimeUnit.SECOND),
+            TimeDelta(1, TimeUnit.SECOND),
+        )
+        totalizer.reset()
+        self.assertEqual(0, totalizer.total().as_unit(MassUnit.KILOGRAM))
+
+
+if __name__ == "__main__":
+    unittest.main()
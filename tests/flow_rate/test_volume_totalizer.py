@@ -0,0 +1,61 @@
+import unittest
+
+from src.units import (
+    Time,
+    TimeDelta,
+    TimeUnit,
+    VolumeDelta,
+    VolumetricFlowRate,
+    VolumeUnit,
+)
+from src.units.flow_rate import VolumeTotalizer
+
+
+class VolumeTotalizerTest(unittest.TestCase):
+    """Unit tests for the volume totalizer class."""
+
+    def test_add_returns_total_in_unit_of_totalizer(self) -> None:
+        totalizer = VolumeTotalizer(VolumeUnit.MILLILITRE)
+        totalizer.add(
+            VolumetricFlowRate(6, VolumeUnit.LITRE, TimeUnit.MINUTE),
+            TimeDelta(30, TimeUnit.SECOND),
+        )
+        total = totalizer.total()
+        self.assertIsInstance(total, VolumeDelta)
+        self.assertAlmostEqual(3_000, total.as_unit(VolumeUnit.MILLILITRE))
+        self.assertAlmostEqual(3, total.as_unit(VolumeUnit.LITRE))
+
+    def test_many_ticks_do_not_drift(self) -> None:
+        totalizer = VolumeTotalizer(VolumeUnit.LITRE)
+        flow_rate = VolumetricFlowRate(0.6, VolumeUnit.LITRE, TimeUnit.MINUTE)
+        tick = TimeDelta(1, TimeUnit.SECOND)
+        for _ in range(10_000):
+            totalizer.add(flow_rate, tick)
+        self.assertAlmostEqual(
+            100, totalizer.total().as_unit(VolumeUnit.LITRE), places=12
+        )
+
+    def test_update(self) -> None:
+        totalizer = VolumeTotalizer(VolumeUnit.LITRE)
+        totalizer.update(
+            VolumetricFlowRate(1, VolumeUnit.LITRE, TimeUnit.SECOND),
+            Time(0, TimeUnit.SECOND),
+        )
+        totalizer.update(
+            VolumetricFlowRate(3, VolumeUnit.LITRE, TimeUnit.SECOND),
+            Time(2_000, TimeUnit.MILLISECOND),
+        )
+        self.assertAlmostEqual(4, totalizer.total().as_unit(VolumeUnit.LITRE))
+
+    def test_reset(self) -> None:
+        totalizer = VolumeTotalizer(VolumeUnit.LITRE)
+        totalizer.add(
+            VolumetricFlowRate(1, VolumeUnit.LITRE, TimeUnit.SECOND),
+            TimeDelta(1, TimeUnit.SECOND),
+        )
+        totalizer.reset()
+        self.assertEqual(0, totalizer.total().as_unit(VolumeUnit.LITRE))
+
+
+if __name__ == "__main__":
+    unittest.main()
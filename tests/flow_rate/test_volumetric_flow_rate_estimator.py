@@ -0,0 +1,64 @@
+import unittest
+
+from src.units import (
+    Time,
+    TimeArray,
+    TimeUnit,
+    Volume,
+    VolumeArray,
+    VolumetricFlowRate,
+    VolumeUnit,
+)
+from src.units.flow_rate import VolumetricFlowRateEstimator
+from src.units.rate_estimators import FirstDifference, LeastSquaresSlope
+
+
+class VolumetricFlowRateEstimatorTest(unittest.TestCase):
+    """Unit tests for the volumetric flow rate estimator class."""
+
+    def test_update_returns_flow_rate_in_units_of_estimator(self) -> None:
+        estimator = VolumetricFlowRateEstimator(
+            FirstDifference(), VolumeUnit.LITRE, TimeUnit.MINUTE
+        )
+        estimator.update(Time(0, TimeUnit.SECOND), Volume(1, VolumeUnit.LITRE))
+        flow_rate = estimator.update(
+            Time(30, TimeUnit.SECOND), Volume(2_500, VolumeUnit.MILLILITRE)
+        )
+        self.assertIsInstance(flow_rate, VolumetricFlowRate)
+        if flow_rate is None:
+            self.fail("No rate was estimated.")
+        self.assertAlmostEqual(3, flow_rate.as_unit(VolumeUnit.LITRE, TimeUnit.MINUTE))
+
+    def test_estimate(self) -> None:
+        estimator = VolumetricFlowRateEstimator(
+            LeastSquaresSlope(2), VolumeUnit.MILLILITRE, TimeUnit.SECOND
+        )
+        times = TimeArray([0, 1, 3], TimeUnit.SECOND)
+        volumes = VolumeArray([0, 1, 2], VolumeUnit.LITRE)
+        self.assertEqual(
+            [1_000, 500],
+            [round(rate, 6) for rate in estimator.estimate(times, volumes)],
+        )
+
+    def test_estimate_different_lengths_raises_error(self) -> None:
+        estimator = VolumetricFlowRateEstimator(
+            FirstDifference(), VolumeUnit.LITRE, TimeUnit.SECOND
+        )
+        with self.assertRaises(ValueError):
+            estimator.estimate(
+                TimeArray([0, 1], TimeUnit.SECOND), VolumeArray([0], VolumeUnit.LITRE)
+            )
+
+    def test_reset(self) -> None:
+        estimator = VolumetricFlowRateEstimator(
+            FirstDifference(), VolumeUnit.LITRE, TimeUnit.SECOND
+        )
+        estimator.update(Time(1, TimeUnit.SECOND), Volume(0, VolumeUnit.LITRE))
+        estimator.reset()
+        self.assertIsNone(
+            estimator.update(Time(0, TimeUnit.SECOND), Volume(0, VolumeUnit.LITRE))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
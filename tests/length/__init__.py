@@ -1,13 +1,32 @@
 """Package for unit tests of length classes."""
 
 from .test_constants import ZeroTest
+from .test_converter import ConvertIntoTest, MakeConverterTest
+from .test_filter import LengthFilterTest
+from .test_fixed_point_length import FixedPointLengthDeltaTest, FixedPointLengthTest
+from .test_isr import LengthCellTest, LengthThresholdTest
 from .test_length import LengthTest
 from .test_length_and_length_delta import LengthAndLengthDeltaTest
+from .test_length_array import LengthArrayTest
 from .test_length_delta import LengthDeltaTest
+from .test_length_delta_array import LengthDeltaArrayTest
+from .test_series import LengthSeriesTest
+from .test_unit import UnitTest
 
 __all__ = [
-    "LengthTest",
-    "LengthDeltaTest",
+    "ConvertIntoTest",
+    "FixedPointLengthDeltaTest",
+    "FixedPointLengthTest",
     "LengthAndLengthDeltaTest",
+    "LengthArrayTest",
+    "LengthCellTest",
+    "LengthDeltaArrayTest",
+    "LengthDeltaTest",
+    "LengthFilterTest",
+    "LengthSeriesTest",
+    "LengthTest",
+    "LengthThresholdTest",
+    "MakeConverterTest",
+    "UnitTest",
     "ZeroTest",
 ]
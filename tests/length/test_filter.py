@@ -0,0 +1,39 @@
+import unittest
+
+from src.units import DistanceUnit, Length, NegativeLengthValueError
+from src.units.filters import MovingAverage, MovingMedian
+from src.units.length import LengthFilter
+
+
+class LengthFilterTest(unittest.TestCase):
+    """Unit tests for the length filter class."""
+
+    def test_update_returns_filtered_length_in_unit_of_filter(self) -> None:
+        length_filter = LengthFilter(MovingAverage(2), DistanceUnit.MILLIMETRE)
+        length_filter.update(Length(1, DistanceUnit.CENTIMETRE))
+        filtered = length_filter.update(Length(0, DistanceUnit.MILLIMETRE))
+        self.assertIsInstance(filtered, Length)
+        self.assertAlmostEqual(5, filtered.as_unit(DistanceUnit.MILLIMETRE))
+        self.assertAlmostEqual(0.5, filtered.as_unit(DistanceUnit.CENTIMETRE))
+
+    def test_update_value(self) -> None:
+        length_filter = LengthFilter(MovingMedian(3), DistanceUnit.MILLIMETRE)
+        for value in (100, 101, 900):
+            filtered = length_filter.update_value(value)
+        self.assertAlmostEqual(101, filtered.as_unit(DistanceUnit.MILLIMETRE))
+
+    def test_update_invalid_value_raises_error(self) -> None:
+        length_filter = LengthFilter(MovingAverage(2), DistanceUnit.MILLIMETRE)
+        with self.assertRaises(NegativeLengthValueError):
+            length_filter.update_value(-1)
+
+    def test_reset(self) -> None:
+        length_filter = LengthFilter(MovingAverage(2), DistanceUnit.MILLIMETRE)
+        length_filter.update_value(10)
+        length_filter.reset()
+        filtered = length_filter.update_value(4)
+        self.assertAlmostEqual(4, filtered.as_unit(DistanceUnit.MILLIMETRE))
+
+
+if __name__ == "__main__":
+    unittest.main()
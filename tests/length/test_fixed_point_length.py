@@ -0,0 +1,105 @@
+import unittest
+
+from src.units import DistanceUnit, Length, LengthDelta, NegativeLengthValueError
+from src.units.length import FixedPointLength, FixedPointLengthDelta
+
+
+class FixedPointLengthTest(unittest.TestCase):
+    """Unit tests for the fixed-point length class."""
+
+    def test_get_fixed_point_length_value_as_unit(self) -> None:
+        length = FixedPointLength(1_000, DistanceUnit.MILLIMETRE)
+        for unit, expected_value in [
+            (DistanceUnit.MILLIMETRE, 1_000),
+            (DistanceUnit.INCH, 39),
+        ]:
+            with self.subTest(unit=unit, expected_value=expected_value):
+                value = length.as_unit(unit)
+                self.assertIsInstance(value, int)
+                self.assertEqual(expected_value, value)
+
+    def test_create_negative_fixed_point_length_raises_error(self) -> None:
+        with self.assertRaises(NegativeLengthValueError):
+            _ = FixedPointLength(-1, DistanceUnit.MILLIMETRE)
+
+    def test_fixed_point_length_beyond_range_raises_error(self) -> None:
+        length = FixedPointLength(1_000, DistanceUnit.METRE)
+        with self.assertRaises(OverflowError):
+            _ = FixedPointLength(1_100, DistanceUnit.METRE)
+        with self.assertRaises(OverflowError):
+            _ = length + FixedPointLengthDelta(100, DistanceUnit.METRE)
+
+    def test_fixed_point_length_matches_floating_point_length(self) -> None:
+        length = FixedPointLength(1_000, DistanceUnit.MILLIMETRE).to_length()
+        self.assertIsInstance(length, Length)
+        self.assertAlmostEqual(1_000, length.as_unit(DistanceUnit.MILLIMETRE))
+
+    def test_add_fixed_point_length_delta_produces_fixed_point_length(self) -> None:
+        length = FixedPointLength(1, DistanceUnit.METRE)
+        delta = FixedPointLengthDelta(1, DistanceUnit.MILLIMETRE)
+        for new_length in (length + delta, delta + length):
+            with self.subTest(new_length=new_length):
+                self.assertIsInstance(new_length, FixedPointLength)
+                self.assertEqual(1_001, new_length.as_unit(DistanceUnit.MILLIMETRE))
+
+    def test_subtract_fixed_point_lengths_produces_fixed_point_length_delta(
+        self,
+    ) -> None:
+        length1 = FixedPointLength(1, DistanceUnit.MILLIMETRE)
+        length2 = FixedPointLength(3, DistanceUnit.MILLIMETRE)
+        delta = length1 - length2
+        self.assertIsInstance(delta, FixedPointLengthDelta)
+        self.assertEqual(-2, delta.as_unit(DistanceUnit.MILLIMETRE))
+
+    def test_subtract_fixed_point_length_delta_below_zero_raises_error(self) -> None:
+        length = FixedPointLength(1, DistanceUnit.MILLIMETRE)
+        with self.assertRaises(NegativeLengthValueError):
+            _ = length - FixedPointLengthDelta(2, DistanceUnit.MILLIMETRE)
+
+    def test_compare_fixed_point_lengths(self) -> None:
+        length1 = FixedPointLength(1, DistanceUnit.METRE)
+        length2 = FixedPointLength(1_000, DistanceUnit.MILLIMETRE)
+        length3 = FixedPointLength(1_001, DistanceUnit.MILLIMETRE)
+        self.assertEqual(length1, length2)
+        self.assertEqual(hash(length1), hash(length2))
+        self.assertLess(length1, length3)
+        self.assertLessEqual(length1, length2)
+        self.assertGreater(length3, length1)
+        self.assertGreaterEqual(length1, length2)
+
+
+class FixedPointLengthDeltaTest(unittest.TestCase):
+    """Unit tests for the fixed-point length delta class."""
+
+    def test_fixed_point_length_delta_matches_floating_point_length_delta(self) -> None:
+        delta = FixedPointLengthDelta(-1_000, DistanceUnit.MILLIMETRE).to_length_delta()
+        self.assertIsInstance(delta, LengthDelta)
+        self.assertAlmostEqual(-1_000, delta.as_unit(DistanceUnit.MILLIMETRE))
+
+    def test_scale_fixed_point_length_delta(self) -> None:
+        delta = FixedPointLengthDelta(3, DistanceUnit.MILLIMETRE)
+        self.assertEqual(6, (delta * 2).as_unit(DistanceUnit.MILLIMETRE))
+        self.assertEqual(6, (2 * delta).as_unit(DistanceUnit.MILLIMETRE))
+        self.assertEqual(-3, (-delta).as_unit(DistanceUnit.MILLIMETRE))
+        self.assertEqual(3, abs(-delta).as_unit(DistanceUnit.MILLIMETRE))
+
+    def test_floor_divide_fixed_point_length_delta(self) -> None:
+        delta = FixedPointLengthDelta(7, DistanceUnit.MILLIMETRE)
+        self.assertEqual(3, delta // FixedPointLengthDelta(2, DistanceUnit.MILLIMETRE))
+        self.assertEqual(
+            FixedPointLengthDelta(3_500, DistanceUnit.MILLIMETRE),
+            FixedPointLengthDelta(7, DistanceUnit.METRE) // 2,
+        )
+
+    def test_add_and_subtract_fixed_point_length_deltas(self) -> None:
+        delta1 = FixedPointLengthDelta(1, DistanceUnit.METRE)
+        delta2 = FixedPointLengthDelta(1, DistanceUnit.MILLIMETRE)
+        self.assertEqual(1_001, (delta1 + delta2).as_unit(DistanceUnit.MILLIMETRE))
+        self.assertEqual(999, (delta1 - delta2).as_unit(DistanceUnit.MILLIMETRE))
+
+    def test_fixed_point_length_delta_beyond_range_raises_error(self) -> None:
+        delta = FixedPointLengthDelta(-600, DistanceUnit.METRE)
+        with self.assertRaises(OverflowError):
+            _ = FixedPointLengthDelta(-1_100, DistanceUnit.METRE)
+        with self.assertRaises(OverflowError):
+            _ = delta * 2
@@ -0,0 +1,74 @@
+# pyright: reportUnknownMemberType=false
+
+import unittest
+
+from src.units import DistanceUnit, Length, NegativeLengthValueError
+from src.units.length import LengthCell, LengthThreshold
+
+try:
+    import micropython  # type: ignore[import-not-found]
+except ImportError:
+    micropython = None
+
+
+class LengthCellTest(unittest.TestCase):
+    """Unit tests for the length cell class."""
+
+    def test_get_produces_length(self) -> None:
+        cell = LengthCell(DistanceUnit.MILLIMETRE)
+        cell.set(12.5)
+        length = cell.get()
+        self.assertIsInstance(length, Length)
+        self.assertAlmostEqual(12.5, length.as_unit(DistanceUnit.MILLIMETRE))
+
+    def test_get_initial_value(self) -> None:
+        cell = LengthCell(DistanceUnit.MILLIMETRE, 12.5)
+        self.assertAlmostEqual(12.5, cell.get().as_unit(DistanceUnit.MILLIMETRE))
+
+    def test_get_invalid_value_raises_error(self) -> None:
+        cell = LengthCell(DistanceUnit.MILLIMETRE)
+        cell.set(-1)
+        with self.assertRaises(NegativeLengthValueError):
+            cell.get()
+
+    def test_set_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        cell = LengthCell(DistanceUnit.MILLIMETRE)
+        value = 12.5
+        micropython.heap_lock()
+        try:
+            cell.set(value)
+            cell.set(900)
+        finally:
+            micropython.heap_unlock()
+
+
+class LengthThresholdTest(unittest.TestCase):
+    """Unit tests for the length threshold class."""
+
+    def test_compare_raw_values_with_threshold(self) -> None:
+        threshold = LengthThreshold(
+            Length(1, DistanceUnit.METRE), DistanceUnit.MILLIMETRE
+        )
+        self.assertTrue(threshold.is_below(900))
+        self.assertFalse(threshold.is_above(900))
+        self.assertTrue(threshold.is_above(1100))
+        self.assertFalse(threshold.is_below(1100))
+
+    def test_compare_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        threshold = LengthThreshold(
+            Length(1, DistanceUnit.METRE), DistanceUnit.MILLIMETRE
+        )
+        micropython.heap_lock()
+        try:
+            is_below = threshold.is_below(900)
+            is_above = threshold.is_above(900)
+        finally:
+            micropython.heap_unlock()
+        self.assertTrue(is_below)
+        self.assertFalse(is_above)
@@ -89,3 +89,35 @@ class LengthTest(unittest.TestCase):
                 self.assertEqual(is_less_than_or_equal_to, length1 <= length2)
                 self.assertEqual(is_greater_than, length1 > length2)
                 self.assertEqual(is_greater_than_or_equal_to, length1 >= length2)
+
+    def test_compare_lengths_in_different_units(self) -> None:
+        self.assertEqual(
+            Length(1, DistanceUnit.METRE), Length(1_000, DistanceUnit.MILLIMETRE)
+        )
+        self.assertEqual(
+            hash(Length(1, DistanceUnit.METRE)),
+            hash(Length(100, DistanceUnit.CENTIMETRE)),
+        )
+        self.assertLess(Length(1, DistanceUnit.FOOT), Length(1, DistanceUnit.METRE))
+
+    def test_string_representation_uses_original_unit(self) -> None:
+        length = Length(25, DistanceUnit.MILLIMETRE)
+        self.assertEqual("25 mm", str(length))
+        self.assertEqual("Length(25, millimetre)", repr(length))
+
+    def test_get_length_value_as_unit_from_non_si_unit(self) -> None:
+        length = Length(12, DistanceUnit.INCH)
+
+        for unit, expected_value in [
+            (DistanceUnit.INCH, 12),
+            (DistanceUnit.FOOT, 1),
+            (DistanceUnit.MILLIMETRE, 304.8),
+        ]:
+            with self.subTest(unit=unit, expected_value=expected_value):
+                self.assertAlmostEqual(expected_value, length.as_unit(unit))
+
+    def test_get_length_value_as_invalid_unit_raises_value_error(self) -> None:
+        length = Length(1, DistanceUnit.METRE)
+        for invalid_unit in [-1, 0, 7, 8, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                length.as_unit(invalid_unit)  # type: ignore[arg-type]
@@ -33,3 +33,60 @@ class LengthAndLengthDeltaTest(unittest.TestCase):
         new_length_delta = length1 - length2
         self.assertIsInstance(new_length_delta, LengthDelta)
         self.assertAlmostEqual(1, new_length_delta.as_unit(DistanceUnit.METRE))
+
+    def test_add_length_delta_to_length_in_same_unit_preserves_unit(self) -> None:
+        length = Length(25, DistanceUnit.MILLIMETRE)
+        delta = LengthDelta(5, DistanceUnit.MILLIMETRE)
+        new_length = length + delta
+        self.assertEqual("30 mm", str(new_length))
+        self.assertAlmostEqual(
+            (length + LengthDelta(0.5, DistanceUnit.CENTIMETRE)).as_unit(
+                DistanceUnit.MILLIMETRE
+            ),
+            new_length.as_unit(DistanceUnit.MILLIMETRE),
+        )
+
+    def test_subtract_length_delta_from_length_in_same_unit_preserves_unit(
+        self,
+    ) -> None:
+        length = Length(25, DistanceUnit.MILLIMETRE)
+        delta = LengthDelta(5, DistanceUnit.MILLIMETRE)
+        new_length = length - delta
+        self.assertEqual("20 mm", str(new_length))
+        self.assertAlmostEqual(
+            (length - LengthDelta(0.5, DistanceUnit.CENTIMETRE)).as_unit(
+                DistanceUnit.MILLIMETRE
+            ),
+            new_length.as_unit(DistanceUnit.MILLIMETRE),
+        )
+
+    def test_subtract_length_from_length_in_same_unit_preserves_unit(
+        self,
+    ) -> None:
+        length1 = Length(25, DistanceUnit.MILLIMETRE)
+        length2 = Length(5, DistanceUnit.MILLIMETRE)
+        new_length_delta = length1 - length2
+        self.assertIsInstance(new_length_delta, LengthDelta)
+        self.assertEqual("20 mm", str(new_length_delta))
+        self.assertAlmostEqual(
+            (length1 - Length(0.5, DistanceUnit.CENTIMETRE)).as_unit(
+                DistanceUnit.MILLIMETRE
+            ),
+            new_length_delta.as_unit(DistanceUnit.MILLIMETRE),
+        )
+
+    def test_length_in_same_unit_equals_length_created_with_result(self) -> None:
+        length = Length(100, DistanceUnit.MILLIMETRE)
+        delta = LengthDelta(200, DistanceUnit.MILLIMETRE)
+        for result, expected in [
+            (length + delta, Length(300, DistanceUnit.MILLIMETRE)),
+            (length + delta - delta, Length(100, DistanceUnit.MILLIMETRE)),
+            (
+                Length(300, DistanceUnit.MILLIMETRE) - length,
+                LengthDelta(200, DistanceUnit.MILLIMETRE),
+            ),
+        ]:
+            with self.subTest(result=result):
+                self.assertEqual(str(expected), str(result))
+                self.assertEqual(expected, result)
+                self.assertEqual(hash(expected), hash(result))
@@ -0,0 +1,154 @@
+import unittest
+
+from src.units import (
+    DistanceUnit,
+    Length,
+    LengthArray,
+    LengthDelta,
+    LengthDeltaArray,
+    NegativeLengthValueError,
+    get_indices,
+)
+
+
+class LengthArrayTest(unittest.TestCase):
+    """Unit tests for length array class."""
+
+    def test_create_length_array(self) -> None:
+        # Test passes if it simply doesn't throw an exception
+        _ = LengthArray([1, 2, 3], DistanceUnit.METRE)
+
+    def test_create_empty_length_array(self) -> None:
+        lengths = LengthArray([], DistanceUnit.METRE)
+        self.assertEqual(0, len(lengths))
+
+    def test_create_negative_length_array_raises_error(self) -> None:
+        with self.assertRaises(NegativeLengthValueError):
+            _ = LengthArray([1, -1], DistanceUnit.METRE)
+
+    def test_get_length_array_values_as_unit(self) -> None:
+        lengths = LengthArray([1, 2], DistanceUnit.METRE)
+        values = lengths.as_unit(DistanceUnit.MILLIMETRE)
+        self.assertEqual(2, len(values))
+        self.assertAlmostEqual(1_000, values[0])
+        self.assertAlmostEqual(2_000, values[1])
+
+    def test_length_array_length(self) -> None:
+        lengths = LengthArray([1, 2, 3], DistanceUnit.METRE)
+        self.assertEqual(3, len(lengths))
+
+    def test_index_length_array_produces_length(self) -> None:
+        lengths = LengthArray([1, 2, 3], DistanceUnit.CENTIMETRE)
+        length = lengths[1]
+        self.assertIsInstance(length, Length)
+        self.assertAlmostEqual(2, length.as_unit(DistanceUnit.CENTIMETRE))
+        self.assertEqual("2.0 cm", str(length))
+
+    def test_slice_length_array_produces_length_array(self) -> None:
+        lengths = LengthArray([1, 2, 3, 4], DistanceUnit.METRE)
+        sliced = lengths[1:3]
+        self.assertIsInstance(sliced, LengthArray)
+        self.assertEqual(2, len(sliced))
+        self.assertAlmostEqual(2, sliced[0].as_unit(DistanceUnit.METRE))
+        self.assertAlmostEqual(3, sliced[1].as_unit(DistanceUnit.METRE))
+
+    def test_iterate_over_length_array(self) -> None:
+        lengths = LengthArray([1, 2, 3], DistanceUnit.METRE)
+        values = [length.as_unit(DistanceUnit.METRE) for length in lengths]
+        self.assertEqual(3, len(values))
+        for expected_value, value in ((1, values[0]), (2, values[1]), (3, values[2])):
+            self.assertAlmostEqual(expected_value, value)
+
+    def test_add_length_delta_to_length_array(self) -> None:
+        lengths = LengthArray([1, 2], DistanceUnit.METRE)
+        new_lengths = lengths + LengthDelta(50, DistanceUnit.CENTIMETRE)
+        self.assertIsInstance(new_lengths, LengthArray)
+        values = new_lengths.as_unit(DistanceUnit.METRE)
+        self.assertAlmostEqual(1.5, values[0])
+        self.assertAlmostEqual(2.5, values[1])
+
+    def test_add_length_array_to_length_delta(self) -> None:
+        lengths = LengthArray([1, 2], DistanceUnit.METRE)
+        new_lengths = LengthDelta(1, DistanceUnit.METRE) + lengths
+        values = new_lengths.as_unit(DistanceUnit.METRE)
+        self.assertAlmostEqual(2, values[0])
+        self.assertAlmostEqual(3, values[1])
+
+    def test_add_length_delta_array_to_length_array(self) -> None:
+        lengths = LengthArray([1, 2], DistanceUnit.METRE)
+        deltas = LengthDeltaArray([3, 4], DistanceUnit.METRE)
+        values = (lengths + deltas).as_unit(DistanceUnit.METRE)
+        self.assertAlmostEqual(4, values[0])
+        self.assertAlmostEqual(6, values[1])
+
+    def test_add_length_delta_to_length_array_below_zero_raises_error(
+        self,
+    ) -> None:
+        lengths = LengthArray([1, 2], DistanceUnit.METRE)
+        with self.assertRaises(NegativeLengthValueError):
+            _ = lengths + LengthDelta(-1.5, DistanceUnit.METRE)
+
+    def test_add_length_arrays_of_different_lengths_raises_error(self) -> None:
+        lengths = LengthArray([1, 2], DistanceUnit.METRE)
+        deltas = LengthDeltaArray([1, 2, 3], DistanceUnit.METRE)
+        with self.assertRaises(ValueError):
+            _ = lengths + deltas
+
+    def test_subtract_length_from_length_array_produces_length_delta_array(
+        self,
+    ) -> None:
+        lengths = LengthArray([1, 2], DistanceUnit.METRE)
+        deltas = lengths - Length(1.5, DistanceUnit.METRE)
+        self.assertIsInstance(deltas, LengthDeltaArray)
+        values = deltas.as_unit(DistanceUnit.METRE)
+        self.assertAlmostEqual(-0.5, values[0])
+        self.assertAlmostEqual(0.5, values[1])
+
+    def test_subtract_length_arrays_produces_length_delta_array(self) -> None:
+        lengths1 = LengthArray([1, 2], DistanceUnit.METRE)
+        lengths2 = LengthArray([2, 1], DistanceUnit.METRE)
+        deltas = lengths1 - lengths2
+        self.assertIsInstance(deltas, LengthDeltaArray)
+        values = deltas.as_unit(DistanceUnit.METRE)
+        self.assertAlmostEqual(-1, values[0])
+        self.assertAlmostEqual(1, values[1])
+
+    def test_subtract_length_delta_from_length_array_produces_length_array(
+        self,
+    ) -> None:
+        lengths = LengthArray([1, 2], DistanceUnit.METRE)
+        new_lengths = lengths - LengthDelta(1, DistanceUnit.METRE)
+        self.assertIsInstance(new_lengths, LengthArray)
+        values = new_lengths.as_unit(DistanceUnit.METRE)
+        self.assertAlmostEqual(0, values[0])
+        self.assertAlmostEqual(1, values[1])
+
+    def test_subtract_length_delta_from_length_array_below_zero_raises_error(
+        self,
+    ) -> None:
+        lengths = LengthArray([1, 2], DistanceUnit.METRE)
+        with self.assertRaises(NegativeLengthValueError):
+            _ = lengths - LengthDelta(1.5, DistanceUnit.METRE)
+
+    def test_compare_length_array_to_length(self) -> None:
+        lengths = LengthArray([1, 2, 3], DistanceUnit.METRE)
+        threshold = Length(200, DistanceUnit.CENTIMETRE)
+        self.assertEqual(bytearray([1, 0, 0]), lengths < threshold)
+        self.assertEqual(bytearray([1, 1, 0]), lengths <= threshold)
+        self.assertEqual(bytearray([0, 0, 1]), lengths > threshold)
+        self.assertEqual(bytearray([0, 1, 1]), lengths >= threshold)
+
+    def test_compare_length_arrays(self) -> None:
+        lengths1 = LengthArray([1, 2, 3], DistanceUnit.METRE)
+        lengths2 = LengthArray([3, 2, 1], DistanceUnit.METRE)
+        self.assertEqual(bytearray([1, 0, 0]), lengths1 < lengths2)
+        self.assertEqual(bytearray([0, 0, 1]), lengths1 > lengths2)
+
+    def test_get_indices_of_length_array_comparison(self) -> None:
+        lengths = LengthArray([1, 5, 2, 7], DistanceUnit.METRE)
+        mask = lengths > Length(3, DistanceUnit.METRE)
+        self.assertEqual([1, 3], get_indices(mask))
+
+    def test_length_array_repr(self) -> None:
+        lengths = LengthArray([1, 2], DistanceUnit.METRE)
+        self.assertEqual("LengthArray([1.0, 2.0], metre)", repr(lengths))
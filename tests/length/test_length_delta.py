@@ -152,3 +152,43 @@ class LengthDeltaTest(unittest.TestCase):
                     is_greater_than_or_equal_to,
                     length_delta1 >= length_delta2,
                 )
+
+    def test_add_length_deltas_in_same_unit_preserves_unit(self) -> None:
+        delta1 = LengthDelta(1, DistanceUnit.FOOT)
+        delta2 = LengthDelta(2, DistanceUnit.FOOT)
+        new_delta = delta1 + delta2
+        self.assertEqual("3 ft", str(new_delta))
+        self.assertAlmostEqual(
+            (delta1 + LengthDelta(24, DistanceUnit.INCH)).as_unit(DistanceUnit.FOOT),
+            new_delta.as_unit(DistanceUnit.FOOT),
+        )
+
+    def test_subtract_length_deltas_in_same_unit_preserves_unit(self) -> None:
+        delta1 = LengthDelta(3, DistanceUnit.FOOT)
+        delta2 = LengthDelta(2, DistanceUnit.FOOT)
+        new_delta = delta1 - delta2
+        self.assertEqual("1 ft", str(new_delta))
+        self.assertAlmostEqual(
+            (delta1 - LengthDelta(24, DistanceUnit.INCH)).as_unit(DistanceUnit.FOOT),
+            new_delta.as_unit(DistanceUnit.FOOT),
+        )
+
+    def test_accumulate_length_deltas_in_same_unit_matches_metre_round_trip(
+        self,
+    ) -> None:
+        same_unit_total = LengthDelta(0, DistanceUnit.MILLIMETRE)
+        metre_total = LengthDelta(0, DistanceUnit.METRE)
+        for _ in range(1_000):
+            same_unit_total += LengthDelta(0.1, DistanceUnit.MILLIMETRE)
+            metre_total += LengthDelta(0.1, DistanceUnit.MILLIMETRE)
+        self.assertTrue(str(same_unit_total).endswith(" mm"))
+        self.assertAlmostEqual(
+            metre_total.as_unit(DistanceUnit.MILLIMETRE),
+            same_unit_total.as_unit(DistanceUnit.MILLIMETRE),
+        )
+
+    def test_get_length_delta_value_as_invalid_unit_raises_value_error(self) -> None:
+        length_delta = LengthDelta(1, DistanceUnit.METRE)
+        for invalid_unit in [-1, 0, 7, 8, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                length_delta.as_unit(invalid_unit)  # type: ignore[arg-type]
@@ -0,0 +1,93 @@
+import unittest
+
+from src.units import DistanceUnit, LengthDelta, LengthDeltaArray
+
+
+class LengthDeltaArrayTest(unittest.TestCase):
+    """Unit tests for length delta array class."""
+
+    def test_create_length_delta_array(self) -> None:
+        # Test passes if it simply doesn't throw an exception
+        _ = LengthDeltaArray([1, -2, 3], DistanceUnit.METRE)
+
+    def test_get_length_delta_array_values_as_unit(self) -> None:
+        deltas = LengthDeltaArray([1, -2], DistanceUnit.METRE)
+        values = deltas.as_unit(DistanceUnit.CENTIMETRE)
+        self.assertAlmostEqual(100, values[0])
+        self.assertAlmostEqual(-200, values[1])
+
+    def test_index_length_delta_array_produces_length_delta(self) -> None:
+        deltas = LengthDeltaArray([1, -2], DistanceUnit.FOOT)
+        delta = deltas[1]
+        self.assertIsInstance(delta, LengthDelta)
+        self.assertAlmostEqual(-2, delta.as_unit(DistanceUnit.FOOT))
+
+    def test_slice_of_length_delta_array_shares_buffer(self) -> None:
+        deltas = LengthDeltaArray([1, 2, 3, 4], DistanceUnit.METRE)
+        sliced = deltas[::2]
+        self.assertIsInstance(sliced, LengthDeltaArray)
+        self.assertEqual(2, len(sliced))
+        self.assertAlmostEqual(1, sliced[0].as_unit(DistanceUnit.METRE))
+        self.assertAlmostEqual(3, sliced[1].as_unit(DistanceUnit.METRE))
+
+    def test_iterate_over_length_delta_array(self) -> None:
+        deltas = LengthDeltaArray([1, -2], DistanceUnit.METRE)
+        values = [delta.as_unit(DistanceUnit.METRE) for delta in deltas]
+        self.assertEqual(2, len(values))
+        self.assertAlmostEqual(1, values[0])
+        self.assertAlmostEqual(-2, values[1])
+
+    def test_add_length_delta_arrays(self) -> None:
+        deltas1 = LengthDeltaArray([1, 2], DistanceUnit.METRE)
+        deltas2 = LengthDeltaArray([100, -300], DistanceUnit.CENTIMETRE)
+        values = (deltas1 + deltas2).as_unit(DistanceUnit.METRE)
+        self.assertAlmostEqual(2, values[0])
+        self.assertAlmostEqual(-1, values[1])
+
+    def test_add_length_delta_to_length_delta_array(self) -> None:
+        deltas = LengthDeltaArray([1, 2], DistanceUnit.METRE)
+        for new_deltas in (
+            deltas + LengthDelta(1, DistanceUnit.METRE),
+            LengthDelta(1, DistanceUnit.METRE) + deltas,
+        ):
+            with self.subTest(new_deltas=new_deltas):
+                values = new_deltas.as_unit(DistanceUnit.METRE)
+                self.assertAlmostEqual(2, values[0])
+                self.assertAlmostEqual(3, values[1])
+
+    def test_subtract_length_delta_arrays(self) -> None:
+        deltas1 = LengthDeltaArray([1, 2], DistanceUnit.METRE)
+        deltas2 = LengthDeltaArray([2, 2], DistanceUnit.METRE)
+        values = (deltas1 - deltas2).as_unit(DistanceUnit.METRE)
+        self.assertAlmostEqual(-1, values[0])
+        self.assertAlmostEqual(0, values[1])
+
+    def test_subtract_length_delta_arrays_of_different_lengths_raises_error(
+        self,
+    ) -> None:
+        deltas1 = LengthDeltaArray([1, 2], DistanceUnit.METRE)
+        deltas2 = LengthDeltaArray([1], DistanceUnit.METRE)
+        with self.assertRaises(ValueError):
+            _ = deltas1 - deltas2
+
+    def test_scale_length_delta_array(self) -> None:
+        deltas = LengthDeltaArray([1, -2], DistanceUnit.METRE)
+        for new_deltas, expected_values in (
+            (2 * deltas, (2, -4)),
+            (deltas * 2, (2, -4)),
+            (deltas / 2, (0.5, -1)),
+            (-deltas, (-1, 2)),
+            (abs(deltas), (1, 2)),
+        ):
+            with self.subTest(new_deltas=new_deltas):
+                values = new_deltas.as_unit(DistanceUnit.METRE)
+                self.assertAlmostEqual(expected_values[0], values[0])
+                self.assertAlmostEqual(expected_values[1], values[1])
+
+    def test_compare_length_delta_array_to_length_delta(self) -> None:
+        deltas = LengthDeltaArray([-1, 0, 1], DistanceUnit.METRE)
+        threshold = LengthDelta(0, DistanceUnit.METRE)
+        self.assertEqual(bytearray([1, 0, 0]), deltas < threshold)
+        self.assertEqual(bytearray([1, 1, 0]), deltas <= threshold)
+        self.assertEqual(bytearray([0, 0, 1]), deltas > threshold)
+        self.assertEqual(bytearray([0, 1, 1]), deltas >= threshold)
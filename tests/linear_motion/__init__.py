@@ -1,13 +1,22 @@
 """Package for unit tests of linear motion classes."""
 
 from .test_acceleration import AccelerationTest
+from .test_converter import ConvertIntoTest, MakeConverterTest
 from .test_displacement import DisplacementTest
+from .test_displacement_totalizer import DisplacementTotalizerTest
 from .test_jerk import JerkTest
+from .test_linear_motion_and_time_delta import LinearMotionAndTimeDeltaTest
 from .test_velocity import VelocityTest
+from .test_velocity_estimator import VelocityEstimatorTest
 
 __all__ = [
     "AccelerationTest",
+    "ConvertIntoTest",
     "DisplacementTest",
+    "DisplacementTotalizerTest",
     "JerkTest",
+    "LinearMotionAndTimeDeltaTest",
+    "MakeConverterTest",
+    "VelocityEstimatorTest",
     "VelocityTest",
 ]
@@ -0,0 +1,121 @@
+import unittest
+from array import array
+
+from src.units import (
+    Acceleration,
+    Displacement,
+    DistanceUnit,
+    Jerk,
+    TimeUnit,
+    Velocity,
+)
+from src.units.linear_motion import convert_into, make_converter
+
+
+class MakeConverterTest(unittest.TestCase):
+    """Unit tests for the linear-motion converter factory."""
+
+    def test_displacement_converter_matches_as_unit(self) -> None:
+        convert = make_converter(DistanceUnit.FOOT, DistanceUnit.CENTIMETRE)
+        self.assertAlmostEqual(
+            Displacement(12.5, DistanceUnit.FOOT).as_unit(DistanceUnit.CENTIMETRE),
+            convert(12.5),
+        )
+
+    def test_velocity_converter_matches_as_unit(self) -> None:
+        convert = make_converter(
+            (DistanceUnit.METRE, TimeUnit.SECOND),
+            (DistanceUnit.MILLIMETRE, TimeUnit.MINUTE),
+        )
+        self.assertAlmostEqual(
+            Velocity(12.5, DistanceUnit.METRE, TimeUnit.SECOND).as_unit(
+                DistanceUnit.MILLIMETRE, TimeUnit.MINUTE
+            ),
+            convert(12.5),
+        )
+
+    def test_acceleration_converter_matches_as_unit(self) -> None:
+        convert = make_converter(
+            (DistanceUnit.INCH, TimeUnit.MINUTE, TimeUnit.SECOND),
+            (DistanceUnit.METRE, TimeUnit.SECOND, TimeUnit.SECOND),
+        )
+        self.assertAlmostEqual(
+            Acceleration(
+                12.5, DistanceUnit.INCH, TimeUnit.MINUTE, TimeUnit.SECOND
+            ).as_unit(DistanceUnit.METRE, TimeUnit.SECOND, TimeUnit.SECOND),
+            convert(12.5),
+        )
+
+    def test_jerk_converter_matches_as_unit(self) -> None:
+        convert = make_converter(
+            (DistanceUnit.METRE, TimeUnit.SECOND, TimeUnit.SECOND, TimeUnit.SECOND),
+            (
+                DistanceUnit.CENTIMETRE,
+                TimeUnit.MILLISECOND,
+                TimeUnit.SECOND,
+                TimeUnit.MINUTE,
+            ),
+        )
+        self.assertAlmostEqual(
+            Jerk(12.5, DistanceUnit.METRE, TimeUnit.SECOND).as_unit(
+                DistanceUnit.CENTIMETRE,
+                TimeUnit.MILLISECOND,
+                TimeUnit.SECOND,
+                TimeUnit.MINUTE,
+            ),
+            convert(12.5),
+        )
+
+    def test_make_converter_with_mismatched_units_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            make_converter(
+                (DistanceUnit.METRE, TimeUnit.SECOND),
+                (DistanceUnit.METRE, TimeUnit.SECOND, TimeUnit.SECOND),  # type: ignore[arg-type]
+            )
+
+    def test_make_converter_with_invalid_unit_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            make_converter(
+                (DistanceUnit.METRE, TimeUnit.SECOND),
+                (DistanceUnit.METRE, 0),  # type: ignore[arg-type]
+            )
+
+
+class ConvertIntoTest(unittest.TestCase):
+    """Unit tests for the linear-motion buffer converter."""
+
+    def test_convert_into_matches_converter(self) -> None:
+        from_unit = (DistanceUnit.METRE, TimeUnit.SECOND)
+        to_unit = (DistanceUnit.MILLIMETRE, TimeUnit.MINUTE)
+        convert = make_converter(from_unit, to_unit)
+        src = array("d", [0, 1.5, 12.5])
+        dst = array("d", [0, 0, 0])
+        convert_into(src, dst, from_unit, to_unit)
+        for index, value in enumerate(src):
+            with self.subTest(index=index):
+                self.assertAlmostEqual(convert(value), dst[index])
+
+    def test_convert_into_same_buffer_converts_in_place(self) -> None:
+        convert = make_converter(DistanceUnit.METRE, DistanceUnit.MILLIMETRE)
+        values = array("d", [1.5, 12.5])
+        convert_into(values, values, DistanceUnit.METRE, DistanceUnit.MILLIMETRE)
+        self.assertAlmostEqual(convert(1.5), values[0])
+        self.assertAlmostEqual(convert(12.5), values[1])
+
+    def test_convert_into_shorter_destination_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            convert_into(
+                array("d", [1, 2]),
+                array("d", [0]),
+                DistanceUnit.METRE,
+                DistanceUnit.MILLIMETRE,
+            )
+
+    def test_convert_into_with_mismatched_units_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            convert_into(
+                array("d", [1]),
+                array("d", [0]),
+                (DistanceUnit.METRE, TimeUnit.SECOND),
+                (DistanceUnit.MILLIMETRE, TimeUnit.SECOND, TimeUnit.SECOND),  # type: ignore[arg-type]
+            )
@@ -156,3 +156,9 @@ class DisplacementTest(unittest.TestCase):
                     is_greater_than_or_equal_to,
                     displacement1 >= displacement2,
                 )
+
+    def test_get_displacement_value_as_invalid_unit_raises_value_error(self) -> None:
+        displacement = Displacement(1, DistanceUnit.METRE)
+        for invalid_unit in [-1, 0, 7, 8, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                displacement.as_unit(invalid_unit)  # type: ignore[arg-type]
@@ -0,0 +1,60 @@
+import unittest
+
+from src.units import Displacement, DistanceUnit, Time, TimeDelta, TimeUnit, Velocity
+from src.units.linear_motion import DisplacementTotalizer
+
+
+class DisplacementTotalizerTest(unittest.TestCase):
+    """Unit tests for the displacement totalizer class."""
+
+    def test_add_returns_total_in_unit_of_totalizer(self) -> None:
+        totalizer = DisplacementTotalizer(DistanceUnit.MILLIMETRE)
+        totalizer.add(
+            Velocity(2, DistanceUnit.METRE, TimeUnit.SECOND),
+            TimeDelta(250, TimeUnit.MILLISECOND),
+        )
+        totalizer.add(
+            Velocity(-1, DistanceUnit.METRE, TimeUnit.SECOND),
+            TimeDelta(100, TimeUnit.MILLISECOND),
+        )
+        total = totalizer.total()
+        self.assertIsInstance(total, Displacement)
+        self.assertAlmostEqual(400, total.as_unit(DistanceUnit.MILLIMETRE))
+
+    def test_many_ticks_do_not_drift(self) -> None:
+        totalizer = DisplacementTotalizer(DistanceUnit.METRE)
+        velocity = Velocity(0.1, DistanceUnit.METRE, TimeUnit.SECOND)
+        tick = TimeDelta(1, TimeUnit.SECOND)
+        for _ in range(10_000):
+            totalizer.add(velocity, tick)
+        self.assertEqual(1_000, totalizer.total().as_unit(DistanceUnit.METRE))
+
+    def test_update(self) -> None:
+        totalizer = DisplacementTotalizer(DistanceUnit.METRE)
+        totalizer.update(
+            Velocity(0, DistanceUnit.METRE, TimeUnit.SECOND), Time(1, TimeUnit.SECOND)
+        )
+        totalizer.update(
+            Velocity(4, DistanceUnit.METRE, TimeUnit.SECOND), Time(3, TimeUnit.SECOND)
+        )
+        self.assertAlmostEqual(4, totalizer.total().as_unit(DistanceUnit.METRE))
+
+    def test_time_going_backwards_raises_error(self) -> None:
+        totalizer = DisplacementTotalizer(DistanceUnit.METRE)
+        velocity = Velocity(1, DistanceUnit.METRE, TimeUnit.SECOND)
+        totalizer.update(velocity, Time(2, TimeUnit.SECOND))
+        with self.assertRaises(ValueError):
+            totalizer.update(velocity, Time(1, TimeUnit.SECOND))
+
+    def test_reset(self) -> None:
+        totalizer = DisplacementTotalizer(DistanceUnit.METRE)
+        totalizer.add(
+            Velocity(1, DistanceUnit.METRE, TimeUnit.SECOND),
+            TimeDelta(1, TimeUnit.SECOND),
+        )
+        totalizer.reset()
+        self.assertEqual(0, totalizer.total().as_unit(DistanceUnit.METRE))
+
+
+if __name__ == "__main__":
+    unittest.main()
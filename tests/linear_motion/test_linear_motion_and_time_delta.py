@@ -0,0 +1,130 @@
+import unittest
+
+from src.units import (
+    Acceleration,
+    Displacement,
+    DistanceUnit,
+    Jerk,
+    TimeDelta,
+    TimeUnit,
+    Velocity,
+)
+
+
+class LinearMotionAndTimeDeltaTest(unittest.TestCase):
+    """Unit tests for the interactions between linear motion & time differences."""
+
+    def test_divide_displacement_by_time_delta_produces_velocity(self) -> None:
+        displacement = Displacement(3, DistanceUnit.MILLIMETRE)
+        time_delta = TimeDelta(2, TimeUnit.MINUTE)
+        velocity = displacement / time_delta
+        self.assertIsInstance(velocity, Velocity)
+        self.assertEqual("1.5 mm/min", str(velocity))
+        self.assertAlmostEqual(
+            0.003 / 120, velocity.as_unit(DistanceUnit.METRE, TimeUnit.SECOND)
+        )
+
+    def test_divide_velocity_by_time_delta_produces_acceleration(self) -> None:
+        velocity = Velocity(3, DistanceUnit.METRE, TimeUnit.MINUTE)
+        time_delta = TimeDelta(2, TimeUnit.SECOND)
+        acceleration = velocity / time_delta
+        self.assertIsInstance(acceleration, Acceleration)
+        self.assertEqual("1.5 m/min/s", str(acceleration))
+        self.assertAlmostEqual(
+            0.025, acceleration.as_unit(DistanceUnit.METRE, TimeUnit.SECOND)
+        )
+
+    def test_divide_acceleration_by_time_delta_produces_jerk(self) -> None:
+        acceleration = Acceleration(3, DistanceUnit.METRE, TimeUnit.SECOND)
+        time_delta = TimeDelta(2, TimeUnit.MILLISECOND)
+        jerk = acceleration / time_delta
+        self.assertIsInstance(jerk, Jerk)
+        self.assertEqual("1.5 m/s/s/ms", str(jerk))
+        self.assertAlmostEqual(1500, jerk.as_unit(DistanceUnit.METRE, TimeUnit.SECOND))
+
+    def test_multiply_velocity_by_time_delta_produces_displacement(self) -> None:
+        for velocity, time_delta, expected_string in [
+            (
+                Velocity(3, DistanceUnit.MILLIMETRE, TimeUnit.SECOND),
+                TimeDelta(2, TimeUnit.SECOND),
+                "6 mm",
+            ),
+            (
+                Velocity(3, DistanceUnit.MILLIMETRE, TimeUnit.SECOND),
+                TimeDelta(2, TimeUnit.MINUTE),
+                "0.36 m",
+            ),
+        ]:
+            with self.subTest(velocity=velocity, time_delta=time_delta):
+                displacement = velocity * time_delta
+                self.assertIsInstance(displacement, Displacement)
+                self.assertEqual(expected_string, str(displacement))
+
+    def test_multiply_acceleration_by_time_delta_produces_velocity(self) -> None:
+        acceleration = Acceleration(
+            3, DistanceUnit.METRE, TimeUnit.MINUTE, TimeUnit.SECOND
+        )
+        velocity = acceleration * TimeDelta(2, TimeUnit.SECOND)
+        self.assertIsInstance(velocity, Velocity)
+        self.assertEqual("6 m/min", str(velocity))
+
+        velocity = acceleration * TimeDelta(2, TimeUnit.MINUTE)
+        self.assertAlmostEqual(6, velocity.as_unit(DistanceUnit.METRE, TimeUnit.SECOND))
+
+    def test_multiply_jerk_by_time_delta_produces_acceleration(self) -> None:
+        jerk = Jerk(3, DistanceUnit.METRE, TimeUnit.SECOND)
+        acceleration = jerk * TimeDelta(2, TimeUnit.SECOND)
+        self.assertIsInstance(acceleration, Acceleration)
+        self.assertEqual("6 m/s/s", str(acceleration))
+
+        acceleration = jerk * TimeDelta(2, TimeUnit.MILLISECOND)
+        self.assertAlmostEqual(
+            0.006, acceleration.as_unit(DistanceUnit.METRE, TimeUnit.SECOND)
+        )
+
+    def test_integrate_then_differentiate_returns_original(self) -> None:
+        velocity = Velocity(1.5, DistanceUnit.FOOT, TimeUnit.MINUTE)
+        time_delta = TimeDelta(250, TimeUnit.MILLISECOND)
+        self.assertAlmostEqual(
+            velocity.as_unit(DistanceUnit.METRE, TimeUnit.SECOND),
+            (velocity * time_delta / time_delta).as_unit(
+                DistanceUnit.METRE, TimeUnit.SECOND
+            ),
+        )
+
+    def test_scalar_multiplication_still_scales(self) -> None:
+        velocity = Velocity(1.5, DistanceUnit.METRE, TimeUnit.SECOND)
+        self.assertEqual("3.0 m/s", str(velocity * 2))
+        self.assertEqual("3.0 m/s", str(2 * velocity))
+        self.assertEqual("0.75 m/s", str(velocity / 2))
+
+    def test_multiply_time_delta_by_rate_matches_other_order(self) -> None:
+        for rate, time_delta in [
+            (
+                Velocity(3, DistanceUnit.MILLIMETRE, TimeUnit.SECOND),
+                TimeDelta(2, TimeUnit.SECOND),
+            ),
+            (
+                Velocity(3, DistanceUnit.MILLIMETRE, TimeUnit.SECOND),
+                TimeDelta(2, TimeUnit.MINUTE),
+            ),
+            (
+                Acceleration(3, DistanceUnit.METRE, TimeUnit.SECOND),
+                TimeDelta(2, TimeUnit.SECOND),
+            ),
+            (Jerk(3, DistanceUnit.METRE, TimeUnit.SECOND), TimeDelta(2, TimeUnit.HOUR)),
+        ]:
+            with self.subTest(rate=rate, time_delta=time_delta):
+                product = time_delta * rate
+                self.assertIsInstance(product, type(rate * time_delta))
+                self.assertEqual(rate * time_delta, product)
+                self.assertEqual(str(rate * time_delta), str(product))
+
+    def test_divide_time_delta_by_rate_raises_type_error(self) -> None:
+        velocity = Velocity(3, DistanceUnit.METRE, TimeUnit.SECOND)
+        with self.assertRaises(TypeError):
+            _ = TimeDelta(2, TimeUnit.SECOND) / velocity  # type: ignore[operator]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -198,3 +198,47 @@ class VelocityTest(unittest.TestCase):
                     is_greater_than_or_equal_to,
                     velocity1 >= velocity2,
                 )
+
+    def test_add_velocities_in_same_units_preserves_units(self) -> None:
+        velocity1 = Velocity(3, DistanceUnit.MILLIMETRE, TimeUnit.MINUTE)
+        velocity2 = Velocity(4, DistanceUnit.MILLIMETRE, TimeUnit.MINUTE)
+        new_velocity = velocity1 + velocity2
+        self.assertEqual("7 mm/min", str(new_velocity))
+        self.assertAlmostEqual(
+            (
+                velocity1 + Velocity(0.4, DistanceUnit.CENTIMETRE, TimeUnit.MINUTE)
+            ).as_unit(DistanceUnit.MILLIMETRE, TimeUnit.MINUTE),
+            new_velocity.as_unit(DistanceUnit.MILLIMETRE, TimeUnit.MINUTE),
+        )
+
+    def test_subtract_velocities_in_same_units_preserves_units(self) -> None:
+        velocity1 = Velocity(3, DistanceUnit.MILLIMETRE, TimeUnit.MINUTE)
+        velocity2 = Velocity(4, DistanceUnit.MILLIMETRE, TimeUnit.MINUTE)
+        new_velocity = velocity1 - velocity2
+        self.assertEqual("-1 mm/min", str(new_velocity))
+        self.assertAlmostEqual(
+            (
+                velocity1 - Velocity(0.4, DistanceUnit.CENTIMETRE, TimeUnit.MINUTE)
+            ).as_unit(DistanceUnit.MILLIMETRE, TimeUnit.MINUTE),
+            new_velocity.as_unit(DistanceUnit.MILLIMETRE, TimeUnit.MINUTE),
+        )
+
+    def test_velocities_in_same_units_equal_velocity_created_with_result(
+        self,
+    ) -> None:
+        velocity1 = Velocity(0.1, DistanceUnit.MILLIMETRE, TimeUnit.MINUTE)
+        velocity2 = Velocity(0.2, DistanceUnit.MILLIMETRE, TimeUnit.MINUTE)
+        for result, expected in [
+            (
+                velocity1 + velocity2,
+                Velocity(0.1 + 0.2, DistanceUnit.MILLIMETRE, TimeUnit.MINUTE),
+            ),
+            (
+                velocity1 - velocity2,
+                Velocity(0.1 - 0.2, DistanceUnit.MILLIMETRE, TimeUnit.MINUTE),
+            ),
+        ]:
+            with self.subTest(result=result):
+                self.assertEqual(str(expected), str(result))
+                self.assertEqual(expected, result)
+                self.assertEqual(hash(expected), hash(result))
@@ -0,0 +1,83 @@
+import unittest
+
+from src.units import (
+    Displacement,
+    DistanceUnit,
+    Length,
+    LengthArray,
+    Time,
+    TimeArray,
+    TimeUnit,
+    Velocity,
+)
+from src.units.linear_motion import VelocityEstimator
+from src.units.rate_estimators import FirstDifference, LeastSquaresSlope
+
+
+class VelocityEstimatorTest(unittest.TestCase):
+    """Unit tests for the velocity estimator class."""
+
+    def test_update_returns_velocity_in_units_of_estimator(self) -> None:
+        estimator = VelocityEstimator(
+            FirstDifference(), DistanceUnit.MILLIMETRE, TimeUnit.SECOND
+        )
+        self.assertIsNone(
+            estimator.update(Time(0, TimeUnit.SECOND), Length(1, DistanceUnit.METRE))
+        )
+        velocity = estimator.update(
+            Time(500, TimeUnit.MILLISECOND), Length(150, DistanceUnit.CENTIMETRE)
+        )
+        self.assertIsInstance(velocity, Velocity)
+        if velocity is None:
+            self.fail("No rate was estimated.")
+        self.assertAlmostEqual(
+            1_000, velocity.as_unit(DistanceUnit.MILLIMETRE, TimeUnit.SECOND)
+        )
+        self.assertAlmostEqual(1, velocity.as_unit(DistanceUnit.METRE, TimeUnit.SECOND))
+
+    def test_update_with_displacements(self) -> None:
+        estimator = VelocityEstimator(
+            FirstDifference(), DistanceUnit.METRE, TimeUnit.MINUTE
+        )
+        estimator.update(Time(0, TimeUnit.SECOND), Displacement(-2, DistanceUnit.METRE))
+        velocity = estimator.update(
+            Time(1, TimeUnit.SECOND), Displacement(-3, DistanceUnit.METRE)
+        )
+        if velocity is None:
+            self.fail("No rate was estimated.")
+        self.assertAlmostEqual(
+            -60, velocity.as_unit(DistanceUnit.METRE, TimeUnit.MINUTE)
+        )
+
+    def test_estimate(self) -> None:
+        estimator = VelocityEstimator(
+            LeastSquaresSlope(3), DistanceUnit.MILLIMETRE, TimeUnit.SECOND
+        )
+        times = TimeArray([0, 1, 2, 3], TimeUnit.SECOND)
+        lengths = LengthArray([0, 2, 4, 6], DistanceUnit.METRE)
+        self.assertEqual(
+            [2_000, 2_000, 2_000],
+            [round(rate, 6) for rate in estimator.estimate(times, lengths)],
+        )
+
+    def test_time_not_advancing_raises_error(self) -> None:
+        estimator = VelocityEstimator(
+            FirstDifference(), DistanceUnit.METRE, TimeUnit.SECOND
+        )
+        estimator.update(Time(1, TimeUnit.SECOND), Length(0, DistanceUnit.METRE))
+        with self.assertRaises(ValueError):
+            estimator.update(Time(1, TimeUnit.SECOND), Length(1, DistanceUnit.METRE))
+
+    def test_reset(self) -> None:
+        estimator = VelocityEstimator(
+            FirstDifference(), DistanceUnit.METRE, TimeUnit.SECOND
+        )
+        estimator.update(Time(1, TimeUnit.SECOND), Length(0, DistanceUnit.METRE))
+        estimator.reset()
+        self.assertIsNone(
+            estimator.update(Time(0, TimeUnit.SECOND), Length(0, DistanceUnit.METRE))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,30 @@
 """Package for unit tests of mass classes."""
 
 from .test_constants import ZeroTest
+from .test_converter import ConvertIntoTest, MakeConverterTest
+from .test_filter import MassFilterTest
+from .test_fixed_point_mass import FixedPointMassDeltaTest, FixedPointMassTest
+from .test_isr import MassCellTest, MassThresholdTest
 from .test_mass import MassTest
 from .test_mass_and_mass_delta import MassAndMassDeltaTest
+from .test_mass_array import MassArrayTest
 from .test_mass_delta import MassDeltaTest
+from .test_series import MassSeriesTest
+from .test_unit import UnitTest
 
 __all__ = [
+    "ConvertIntoTest",
+    "FixedPointMassDeltaTest",
+    "FixedPointMassTest",
+    "MakeConverterTest",
     "MassAndMassDeltaTest",
+    "MassArrayTest",
+    "MassCellTest",
     "MassDeltaTest",
+    "MassFilterTest",
+    "MassSeriesTest",
     "MassTest",
+    "MassThresholdTest",
+    "UnitTest",
     "ZeroTest",
 ]
@@ -0,0 +1,39 @@
+import unittest
+
+from src.units import Mass, MassUnit, NegativeMassValueError
+from src.units.filters import MovingAverage, MovingMedian
+from src.units.mass import MassFilter
+
+
+class MassFilterTest(unittest.TestCase):
+    """Unit tests for the mass filter class."""
+
+    def test_update_returns_filtered_mass_in_unit_of_filter(self) -> None:
+        mass_filter = MassFilter(MovingAverage(2), MassUnit.GRAM)
+        mass_filter.update(Mass(1, MassUnit.KILOGRAM))
+        filtered = mass_filter.update(Mass(0, MassUnit.GRAM))
+        self.assertIsInstance(filtered, Mass)
+        self.assertAlmostEqual(500, filtered.as_unit(MassUnit.GRAM))
+        self.assertAlmostEqual(0.5, filtered.as_unit(MassUnit.KILOGRAM))
+
+    def test_update_value(self) -> None:
+        mass_filter = MassFilter(MovingMedian(3), MassUnit.GRAM)
+        for value in (100, 101, 900):
+            filtered = mass_filter.update_value(value)
+        self.assertAlmostEqual(101, filtered.as_unit(MassUnit.GRAM))
+
+    def test_update_invalid_value_raises_error(self) -> None:
+        mass_filter = MassFilter(MovingAverage(2), MassUnit.GRAM)
+        with self.assertRaises(NegativeMassValueError):
+            mass_filter.update_value(-1)
+
+    def test_reset(self) -> None:
+        mass_filter = MassFilter(MovingAverage(2), MassUnit.GRAM)
+        mass_filter.update_value(10)
+        mass_filter.reset()
+        filtered = mass_filter.update_value(4)
+        self.assertAlmostEqual(4, filtered.as_unit(MassUnit.GRAM))
+
+
+if __name__ == "__main__":
+    unittest.main()
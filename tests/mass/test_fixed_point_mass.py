@@ -0,0 +1,89 @@
+import unittest
+
+from src.units import Mass, MassDelta, MassUnit, NegativeMassValueError
+from src.units.mass import FixedPointMass, FixedPointMassDelta
+
+
+class FixedPointMassTest(unittest.TestCase):
+    """Unit tests for the fixed-point mass class."""
+
+    def test_get_fixed_point_mass_value_as_unit(self) -> None:
+        mass = FixedPointMass(1_000, MassUnit.GRAM)
+        for unit, expected_value in [
+            (MassUnit.GRAM, 1_000),
+            (MassUnit.POUND, 2),
+        ]:
+            with self.subTest(unit=unit, expected_value=expected_value):
+                value = mass.as_unit(unit)
+                self.assertIsInstance(value, int)
+                self.assertEqual(expected_value, value)
+
+    def test_create_negative_fixed_point_mass_raises_error(self) -> None:
+        with self.assertRaises(NegativeMassValueError):
+            _ = FixedPointMass(-1, MassUnit.GRAM)
+
+    def test_fixed_point_mass_matches_floating_point_mass(self) -> None:
+        mass = FixedPointMass(1_000, MassUnit.GRAM).to_mass()
+        self.assertIsInstance(mass, Mass)
+        self.assertAlmostEqual(1_000, mass.as_unit(MassUnit.GRAM))
+
+    def test_add_fixed_point_mass_delta_produces_fixed_point_mass(self) -> None:
+        mass = FixedPointMass(1, MassUnit.KILOGRAM)
+        delta = FixedPointMassDelta(1, MassUnit.GRAM)
+        for new_mass in (mass + delta, delta + mass):
+            with self.subTest(new_mass=new_mass):
+                self.assertIsInstance(new_mass, FixedPointMass)
+                self.assertEqual(1_001, new_mass.as_unit(MassUnit.GRAM))
+
+    def test_subtract_fixed_point_masses_produces_fixed_point_mass_delta(self) -> None:
+        mass1 = FixedPointMass(1, MassUnit.GRAM)
+        mass2 = FixedPointMass(3, MassUnit.GRAM)
+        delta = mass1 - mass2
+        self.assertIsInstance(delta, FixedPointMassDelta)
+        self.assertEqual(-2, delta.as_unit(MassUnit.GRAM))
+
+    def test_subtract_fixed_point_mass_delta_below_zero_raises_error(self) -> None:
+        mass = FixedPointMass(1, MassUnit.GRAM)
+        with self.assertRaises(NegativeMassValueError):
+            _ = mass - FixedPointMassDelta(2, MassUnit.GRAM)
+
+    def test_compare_fixed_point_masses(self) -> None:
+        mass1 = FixedPointMass(1, MassUnit.KILOGRAM)
+        mass2 = FixedPointMass(1_000, MassUnit.GRAM)
+        mass3 = FixedPointMass(1_001, MassUnit.GRAM)
+        self.assertEqual(mass1, mass2)
+        self.assertEqual(hash(mass1), hash(mass2))
+        self.assertLess(mass1, mass3)
+        self.assertLessEqual(mass1, mass2)
+        self.assertGreater(mass3, mass1)
+        self.assertGreaterEqual(mass1, mass2)
+
+
+class FixedPointMassDeltaTest(unittest.TestCase):
+    """Unit tests for the fixed-point mass delta class."""
+
+    def test_fixed_point_mass_delta_matches_floating_point_mass_delta(self) -> None:
+        delta = FixedPointMassDelta(-1_000, MassUnit.GRAM).to_mass_delta()
+        self.assertIsInstance(delta, MassDelta)
+        self.assertAlmostEqual(-1_000, delta.as_unit(MassUnit.GRAM))
+
+    def test_scale_fixed_point_mass_delta(self) -> None:
+        delta = FixedPointMassDelta(3, MassUnit.GRAM)
+        self.assertEqual(6, (delta * 2).as_unit(MassUnit.GRAM))
+        self.assertEqual(6, (2 * delta).as_unit(MassUnit.GRAM))
+        self.assertEqual(-3, (-delta).as_unit(MassUnit.GRAM))
+        self.assertEqual(3, abs(-delta).as_unit(MassUnit.GRAM))
+
+    def test_floor_divide_fixed_point_mass_delta(self) -> None:
+        delta = FixedPointMassDelta(7, MassUnit.GRAM)
+        self.assertEqual(3, delta // FixedPointMassDelta(2, MassUnit.GRAM))
+        self.assertEqual(
+            FixedPointMassDelta(3_500, MassUnit.GRAM),
+            FixedPointMassDelta(7, MassUnit.KILOGRAM) // 2,
+        )
+
+    def test_add_and_subtract_fixed_point_mass_deltas(self) -> None:
+        delta1 = FixedPointMassDelta(1, MassUnit.KILOGRAM)
+        delta2 = FixedPointMassDelta(1, MassUnit.GRAM)
+        self.assertEqual(1_001, (delta1 + delta2).as_unit(MassUnit.GRAM))
+        self.assertEqual(999, (delta1 - delta2).as_unit(MassUnit.GRAM))
@@ -0,0 +1,70 @@
+# pyright: reportUnknownMemberType=false
+
+import unittest
+
+from src.units import Mass, MassUnit, NegativeMassValueError
+from src.units.mass import MassCell, MassThreshold
+
+try:
+    import micropython  # type: ignore[import-not-found]
+except ImportError:
+    micropython = None
+
+
+class MassCellTest(unittest.TestCase):
+    """Unit tests for the mass cell class."""
+
+    def test_get_produces_mass(self) -> None:
+        cell = MassCell(MassUnit.GRAM)
+        cell.set(12.5)
+        mass = cell.get()
+        self.assertIsInstance(mass, Mass)
+        self.assertAlmostEqual(12.5, mass.as_unit(MassUnit.GRAM))
+
+    def test_get_initial_value(self) -> None:
+        cell = MassCell(MassUnit.GRAM, 12.5)
+        self.assertAlmostEqual(12.5, cell.get().as_unit(MassUnit.GRAM))
+
+    def test_get_invalid_value_raises_error(self) -> None:
+        cell = MassCell(MassUnit.GRAM)
+        cell.set(-1)
+        with self.assertRaises(NegativeMassValueError):
+            cell.get()
+
+    def test_set_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        cell = MassCell(MassUnit.GRAM)
+        value = 12.5
+        micropython.heap_lock()
+        try:
+            cell.set(value)
+            cell.set(900)
+        finally:
+            micropython.heap_unlock()
+
+
+class MassThresholdTest(unittest.TestCase):
+    """Unit tests for the mass threshold class."""
+
+    def test_compare_raw_values_with_threshold(self) -> None:
+        threshold = MassThreshold(Mass(1, MassUnit.KILOGRAM), MassUnit.GRAM)
+        self.assertTrue(threshold.is_below(900))
+        self.assertFalse(threshold.is_above(900))
+        self.assertTrue(threshold.is_above(1100))
+        self.assertFalse(threshold.is_below(1100))
+
+    def test_compare_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        threshold = MassThreshold(Mass(1, MassUnit.KILOGRAM), MassUnit.GRAM)
+        micropython.heap_lock()
+        try:
+            is_below = threshold.is_below(900)
+            is_above = threshold.is_above(900)
+        finally:
+            micropython.heap_unlock()
+        self.assertTrue(is_below)
+        self.assertFalse(is_above)
@@ -88,3 +88,9 @@ class MassTest(unittest.TestCase):
                 self.assertEqual(is_less_than_or_equal_to, mass1 <= mass2)
                 self.assertEqual(is_greater_than, mass1 > mass2)
                 self.assertEqual(is_greater_than_or_equal_to, mass1 >= mass2)
+
+    def test_get_mass_value_as_invalid_unit_raises_value_error(self) -> None:
+        mass = Mass(1, MassUnit.KILOGRAM)
+        for invalid_unit in [-1, 0, 6, 7, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                mass.as_unit(invalid_unit)  # type: ignore[arg-type]
@@ -0,0 +1,65 @@
+import unittest
+
+from src.units import (
+    Mass,
+    MassArray,
+    MassDelta,
+    MassDeltaArray,
+    MassUnit,
+    NegativeMassValueError,
+)
+
+
+class MassArrayTest(unittest.TestCase):
+    """Unit tests for mass array and mass delta array classes."""
+
+    def test_get_mass_array_values_as_unit(self) -> None:
+        masss = MassArray([1, 2], MassUnit.KILOGRAM)
+        values = masss.as_unit(MassUnit.GRAM)
+        self.assertAlmostEqual(1_000, values[0])
+        self.assertAlmostEqual(2_000, values[1])
+
+    def test_create_negative_mass_array_raises_error(self) -> None:
+        with self.assertRaises(NegativeMassValueError):
+            _ = MassArray([1, -1], MassUnit.KILOGRAM)
+
+    def test_index_mass_array_produces_mass(self) -> None:
+        masss = MassArray([1, 2], MassUnit.GRAM)
+        mass = masss[1]
+        self.assertIsInstance(mass, Mass)
+        self.assertAlmostEqual(2, mass.as_unit(MassUnit.GRAM))
+
+    def test_add_mass_delta_array_to_mass_array(self) -> None:
+        masss = MassArray([1, 2], MassUnit.KILOGRAM)
+        deltas = MassDeltaArray([1, -1], MassUnit.KILOGRAM)
+        values = (masss + deltas).as_unit(MassUnit.KILOGRAM)
+        self.assertAlmostEqual(2, values[0])
+        self.assertAlmostEqual(1, values[1])
+
+    def test_subtract_mass_delta_from_mass_array_below_zero_raises_error(
+        self,
+    ) -> None:
+        masss = MassArray([1, 2], MassUnit.KILOGRAM)
+        with self.assertRaises(NegativeMassValueError):
+            _ = masss - MassDelta(1.5, MassUnit.KILOGRAM)
+
+    def test_subtract_mass_arrays_produces_mass_delta_array(self) -> None:
+        masss1 = MassArray([1, 2], MassUnit.KILOGRAM)
+        masss2 = MassArray([2, 1], MassUnit.KILOGRAM)
+        deltas = masss1 - masss2
+        self.assertIsInstance(deltas, MassDeltaArray)
+        values = deltas.as_unit(MassUnit.KILOGRAM)
+        self.assertAlmostEqual(-1, values[0])
+        self.assertAlmostEqual(1, values[1])
+
+    def test_scale_mass_delta_array(self) -> None:
+        deltas = MassDeltaArray([1, -2], MassUnit.KILOGRAM)
+        values = (deltas * 2).as_unit(MassUnit.KILOGRAM)
+        self.assertAlmostEqual(2, values[0])
+        self.assertAlmostEqual(-4, values[1])
+
+    def test_compare_mass_array_to_mass(self) -> None:
+        masss = MassArray([1, 2, 3], MassUnit.KILOGRAM)
+        threshold = Mass(2, MassUnit.KILOGRAM)
+        self.assertEqual(bytearray([1, 0, 0]), masss < threshold)
+        self.assertEqual(bytearray([0, 1, 1]), masss >= threshold)
@@ -149,3 +149,9 @@ class MassDeltaTest(unittest.TestCase):
                     is_greater_than_or_equal_to,
                     mass_delta1 >= mass_delta2,
                 )
+
+    def test_get_mass_delta_value_as_invalid_unit_raises_value_error(self) -> None:
+        mass_delta = MassDelta(1, MassUnit.KILOGRAM)
+        for invalid_unit in [-1, 0, 6, 7, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                mass_delta.as_unit(invalid_unit)  # type: ignore[arg-type]
@@ -0,0 +1,73 @@
+# Generated by `tools/generate_units.py` from `tools/units_spec.json`, so edit the
+# spec & rerun the generator rather than editing this module.
+
+import math
+import unittest
+
+from src.units.units_inner.mass import unit
+
+# The member, name, abbreviation & change in the quantity expressed as the unit per 1kg
+# of each unit
+_UNITS = [
+    (unit.Unit.KILOGRAM, "kilogram", "kg", 1),
+    (unit.Unit.GRAM, "gram", "g", 1_000),
+    (unit.Unit.MILLIGRAM, "milligram", "mg", 1_000_000),
+    (unit.Unit.POUND, "pound", "lb", 2.20462262185),
+    (unit.Unit.OUNCE, "ounce", "oz", 35.2739619496),
+]
+
+
+class UnitTest(unittest.TestCase):
+    """Unit tests for the mass unit tables."""
+
+    def assert_close(self, expected: float, actual: float) -> None:
+        self.assertAlmostEqual(expected, actual, delta=abs(expected) * 1e-9)
+
+    def test_get_name(self) -> None:
+        for member, name, *_ in _UNITS:
+            with self.subTest(unit=member):
+                self.assertEqual(name, unit.get_name(member))
+
+    def test_get_abbreviation(self) -> None:
+        for member, _, abbreviation, *_ in _UNITS:
+            with self.subTest(unit=member):
+                self.assertEqual(abbreviation, unit.get_abbreviation(member))
+
+    def test_invalid_unit_raises_value_error(self) -> None:
+        for invalid_unit in [0, len(_UNITS) + 1]:
+            with (
+                self.subTest(unit=invalid_unit),
+                self.assertRaises(ValueError),
+            ):
+                unit.get_name(invalid_unit)  # type: ignore[arg-type]
+
+    def test_get_unit_delta_per_kilogram(self) -> None:
+        for member, _, _, unit_delta in _UNITS:
+            with self.subTest(unit=member):
+                self.assert_close(unit_delta, unit.get_unit_delta_per_kilogram(member))
+
+    def test_conversion_factors(self) -> None:
+        for from_member, _, _, from_unit_delta in _UNITS:
+            for to_member, _, _, to_unit_delta in _UNITS:
+                with self.subTest(from_unit=from_member, to_unit=to_member):
+                    index = from_member * unit.CONVERSION_FACTORS_STRIDE + to_member
+                    self.assert_close(
+                        to_unit_delta / from_unit_delta,
+                        unit.CONVERSION_FACTORS[index],
+                    )
+
+    def test_get_fixed_point_ratio(self) -> None:
+        for member, _, _, unit_delta in _UNITS:
+            with self.subTest(unit=member):
+                numerator, denominator = unit.get_fixed_point_ratio(member)
+                self.assertTrue(
+                    math.isclose(
+                        unit.FIXED_POINT_RESOLUTION_PER_KILOGRAM / unit_delta,
+                        numerator / denominator,
+                        rel_tol=1e-7,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
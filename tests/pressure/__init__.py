@@ -1,14 +1,34 @@
 """Package for unit tests of pressure classes."""
 
 from .test_constants import PerfectVacuumTest, StandardAtmosphereTest
+from .test_converter import ConvertIntoTest, MakeConverterTest
+from .test_filter import PressureFilterTest
+from .test_fixed_point_pressure import (
+    FixedPointPressureDeltaTest,
+    FixedPointPressureTest,
+)
+from .test_isr import PressureCellTest, PressureThresholdTest
 from .test_pressure import PressureTest
 from .test_pressure_and_pressure_delta import PressureAndPressureDeltaTest
+from .test_pressure_array import PressureArrayTest
 from .test_pressure_delta import PressureDeltaTest
+from .test_series import PressureSeriesTest
+from .test_unit import UnitTest
 
 __all__ = [
-    "PressureTest",
-    "PressureDeltaTest",
-    "PressureAndPressureDeltaTest",
+    "ConvertIntoTest",
+    "FixedPointPressureDeltaTest",
+    "FixedPointPressureTest",
+    "MakeConverterTest",
     "PerfectVacuumTest",
+    "PressureAndPressureDeltaTest",
+    "PressureArrayTest",
+    "PressureCellTest",
+    "PressureDeltaTest",
+    "PressureFilterTest",
+    "PressureSeriesTest",
+    "PressureTest",
+    "PressureThresholdTest",
     "StandardAtmosphereTest",
+    "UnitTest",
 ]
@@ -0,0 +1,39 @@
+import unittest
+
+from src.units import NegativePressureValueError, Pressure, PressureUnit
+from src.units.filters import MovingAverage, MovingMedian
+from src.units.pressure import PressureFilter
+
+
+class PressureFilterTest(unittest.TestCase):
+    """Unit tests for the pressure filter class."""
+
+    def test_update_returns_filtered_pressure_in_unit_of_filter(self) -> None:
+        pressure_filter = PressureFilter(MovingAverage(2), PressureUnit.KILOPASCAL)
+        pressure_filter.update(Pressure(1, PressureUnit.BAR))
+        filtered = pressure_filter.update(Pressure(80_000, PressureUnit.PASCAL))
+        self.assertIsInstance(filtered, Pressure)
+        self.assertAlmostEqual(90, filtered.as_unit(PressureUnit.KILOPASCAL))
+        self.assertAlmostEqual(90_000, filtered.as_unit(PressureUnit.PASCAL))
+
+    def test_update_value(self) -> None:
+        pressure_filter = PressureFilter(MovingMedian(3), PressureUnit.KILOPASCAL)
+        for value in (100, 101, 900):
+            filtered = pressure_filter.update_value(value)
+        self.assertAlmostEqual(101, filtered.as_unit(PressureUnit.KILOPASCAL))
+
+    def test_update_invalid_value_raises_error(self) -> None:
+        pressure_filter = PressureFilter(MovingAverage(2), PressureUnit.PASCAL)
+        with self.assertRaises(NegativePressureValueError):
+            pressure_filter.update_value(-1)
+
+    def test_reset(self) -> None:
+        pressure_filter = PressureFilter(MovingAverage(2), PressureUnit.PASCAL)
+        pressure_filter.update_value(10)
+        pressure_filter.reset()
+        filtered = pressure_filter.update_value(4)
+        self.assertAlmostEqual(4, filtered.as_unit(PressureUnit.PASCAL))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+
+from src.units import NegativePressureValueError, Pressure, PressureDelta, PressureUnit
+from src.units.pressure import FixedPointPressure, FixedPointPressureDelta
+
+
+class FixedPointPressureTest(unittest.TestCase):
+    """Unit tests for the fixed-point pressure class."""
+
+    def test_get_fixed_point_pressure_value_as_unit(self) -> None:
+        pressure = FixedPointPressure(1_000_000, PressureUnit.PASCAL)
+        for unit, expected_value in [
+            (PressureUnit.PASCAL, 1_000_000),
+            (PressureUnit.POUND_PER_SQUARE_INCH, 145),
+        ]:
+            with self.subTest(unit=unit, expected_value=expected_value):
+                value = pressure.as_unit(unit)
+                self.assertIsInstance(value, int)
+                self.assertEqual(expected_value, value)
+
+    def test_create_negative_fixed_point_pressure_raises_error(self) -> None:
+        with self.assertRaises(NegativePressureValueError):
+            _ = FixedPointPressure(-1, PressureUnit.PASCAL)
+
+    def test_fixed_point_pressure_matches_floating_point_pressure(self) -> None:
+        pressure = FixedPointPressure(1_000_000, PressureUnit.PASCAL).to_pressure()
+        self.assertIsInstance(pressure, Pressure)
+        self.assertAlmostEqual(1_000_000, pressure.as_unit(PressureUnit.PASCAL))
+
+    def test_add_fixed_point_pressure_delta_produces_fixed_point_pressure(self) -> None:
+        pressure = FixedPointPressure(1, PressureUnit.KILOPASCAL)
+        delta = FixedPointPressureDelta(1, PressureUnit.PASCAL)
+        for new_pressure in (pressure + delta, delta + pressure):
+            with self.subTest(new_pressure=new_pressure):
+                self.assertIsInstance(new_pressure, FixedPointPressure)
+                self.assertEqual(1_001, new_pressure.as_unit(PressureUnit.PASCAL))
+
+    def test_subtract_fixed_point_pressures_produces_fixed_point_pressure_delta(
+        self,
+    ) -> None:
+        pressure1 = FixedPointPressure(1, PressureUnit.PASCAL)
+        pressure2 = FixedPointPressure(3, PressureUnit.PASCAL)
+        delta = pressure1 - pressure2
+        self.assertIsInstance(delta, FixedPointPressureDelta)
+        self.assertEqual(-2, delta.as_unit(PressureUnit.PASCAL))
+
+    def test_subtract_fixed_point_pressure_delta_below_zero_raises_error(self) -> None:
+        pressure = FixedPointPressure(1, PressureUnit.PASCAL)
+        with self.assertRaises(NegativePressureValueError):
+            _ = pressure - FixedPointPressureDelta(2, PressureUnit.PASCAL)
+
+    def test_compare_fixed_point_pressures(self) -> None:
+        pressure1 = FixedPointPressure(1, PressureUnit.KILOPASCAL)
+        pressure2 = FixedPointPressure(1_000, PressureUnit.PASCAL)
+        pressure3 = FixedPointPressure(1_001, PressureUnit.PASCAL)
+        self.assertEqual(pressure1, pressure2)
+        self.assertEqual(hash(pressure1), hash(pressure2))
+        self.assertLess(pressure1, pressure3)
+        self.assertLessEqual(pressure1, pressure2)
+        self.assertGreater(pressure3, pressure1)
+        self.assertGreaterEqual(pressure1, pressure2)
+
+
+class FixedPointPressureDeltaTest(unittest.TestCase):
+    """Unit tests for the fixed-point pressure delta class."""
+
+    def test_fixed_point_pressure_delta_matches_floating_point_pressure_delta(
+        self,
+    ) -> None:
+        delta = FixedPointPressureDelta(
+            -1_000_000, PressureUnit.PASCAL
+        ).to_pressure_delta()
+        self.assertIsInstance(delta, PressureDelta)
+        self.assertAlmostEqual(-1_000_000, delta.as_unit(PressureUnit.PASCAL))
+
+    def test_scale_fixed_point_pressure_delta(self) -> None:
+        delta = FixedPointPressureDelta(3, PressureUnit.PASCAL)
+        self.assertEqual(6, (delta * 2).as_unit(PressureUnit.PASCAL))
+        self.assertEqual(6, (2 * delta).as_unit(PressureUnit.PASCAL))
+        self.assertEqual(-3, (-delta).as_unit(PressureUnit.PASCAL))
+        self.assertEqual(3, abs(-delta).as_unit(PressureUnit.PASCAL))
+
+    def test_floor_divide_fixed_point_pressure_delta(self) -> None:
+        delta = FixedPointPressureDelta(7, PressureUnit.PASCAL)
+        self.assertEqual(3, delta // FixedPointPressureDelta(2, PressureUnit.PASCAL))
+        self.assertEqual(
+            FixedPointPressureDelta(3_500, PressureUnit.PASCAL),
+            FixedPointPressureDelta(7, PressureUnit.KILOPASCAL) // 2,
+        )
+
+    def test_add_and_subtract_fixed_point_pressure_deltas(self) -> None:
+        delta1 = FixedPointPressureDelta(1, PressureUnit.KILOPASCAL)
+        delta2 = FixedPointPressureDelta(1, PressureUnit.PASCAL)
+        self.assertEqual(1_001, (delta1 + delta2).as_unit(PressureUnit.PASCAL))
+        self.assertEqual(999, (delta1 - delta2).as_unit(PressureUnit.PASCAL))
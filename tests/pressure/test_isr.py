@@ -0,0 +1,74 @@
+# pyright: reportUnknownMemberType=false
+
+import unittest
+
+from src.units import NegativePressureValueError, Pressure, PressureUnit
+from src.units.pressure import PressureCell, PressureThreshold
+
+try:
+    import micropython  # type: ignore[import-not-found]
+except ImportError:
+    micropython = None
+
+
+class PressureCellTest(unittest.TestCase):
+    """Unit tests for the pressure cell class."""
+
+    def test_get_produces_pressure(self) -> None:
+        cell = PressureCell(PressureUnit.KILOPASCAL)
+        cell.set(12.5)
+        pressure = cell.get()
+        self.assertIsInstance(pressure, Pressure)
+        self.assertAlmostEqual(12.5, pressure.as_unit(PressureUnit.KILOPASCAL))
+
+    def test_get_initial_value(self) -> None:
+        cell = PressureCell(PressureUnit.KILOPASCAL, 12.5)
+        self.assertAlmostEqual(12.5, cell.get().as_unit(PressureUnit.KILOPASCAL))
+
+    def test_get_invalid_value_raises_error(self) -> None:
+        cell = PressureCell(PressureUnit.KILOPASCAL)
+        cell.set(-1)
+        with self.assertRaises(NegativePressureValueError):
+            cell.get()
+
+    def test_set_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        cell = PressureCell(PressureUnit.KILOPASCAL)
+        value = 12.5
+        micropython.heap_lock()
+        try:
+            cell.set(value)
+            cell.set(90)
+        finally:
+            micropython.heap_unlock()
+
+
+class PressureThresholdTest(unittest.TestCase):
+    """Unit tests for the pressure threshold class."""
+
+    def test_compare_raw_values_with_threshold(self) -> None:
+        threshold = PressureThreshold(
+            Pressure(1, PressureUnit.BAR), PressureUnit.KILOPASCAL
+        )
+        self.assertTrue(threshold.is_below(90))
+        self.assertFalse(threshold.is_above(90))
+        self.assertTrue(threshold.is_above(110))
+        self.assertFalse(threshold.is_below(110))
+
+    def test_compare_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        threshold = PressureThreshold(
+            Pressure(1, PressureUnit.BAR), PressureUnit.KILOPASCAL
+        )
+        micropython.heap_lock()
+        try:
+            is_below = threshold.is_below(90)
+            is_above = threshold.is_above(90)
+        finally:
+            micropython.heap_unlock()
+        self.assertTrue(is_below)
+        self.assertFalse(is_above)
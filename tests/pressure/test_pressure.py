@@ -90,3 +90,9 @@ class PressureTest(unittest.TestCase):
                 self.assertEqual(is_less_than_or_equal_to, pressure1 <= pressure2)
                 self.assertEqual(is_greater_than, pressure1 > pressure2)
                 self.assertEqual(is_greater_than_or_equal_to, pressure1 >= pressure2)
+
+    def test_get_pressure_value_as_invalid_unit_raises_value_error(self) -> None:
+        pressure = Pressure(1, PressureUnit.PASCAL)
+        for invalid_unit in [-1, 0, 8, 9, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                pressure.as_unit(invalid_unit)  # type: ignore[arg-type]
@@ -0,0 +1,65 @@
+import unittest
+
+from src.units import (
+    NegativePressureValueError,
+    Pressure,
+    PressureArray,
+    PressureDelta,
+    PressureDeltaArray,
+    PressureUnit,
+)
+
+
+class PressureArrayTest(unittest.TestCase):
+    """Unit tests for pressure array and pressure delta array classes."""
+
+    def test_get_pressure_array_values_as_unit(self) -> None:
+        pressures = PressureArray([1, 2], PressureUnit.PASCAL)
+        values = pressures.as_unit(PressureUnit.BAR)
+        self.assertAlmostEqual(0.00001, values[0])
+        self.assertAlmostEqual(0.00002, values[1])
+
+    def test_create_negative_pressure_array_raises_error(self) -> None:
+        with self.assertRaises(NegativePressureValueError):
+            _ = PressureArray([1, -1], PressureUnit.PASCAL)
+
+    def test_index_pressure_array_produces_pressure(self) -> None:
+        pressures = PressureArray([1, 2], PressureUnit.BAR)
+        pressure = pressures[1]
+        self.assertIsInstance(pressure, Pressure)
+        self.assertAlmostEqual(2, pressure.as_unit(PressureUnit.BAR))
+
+    def test_add_pressure_delta_array_to_pressure_array(self) -> None:
+        pressures = PressureArray([1, 2], PressureUnit.PASCAL)
+        deltas = PressureDeltaArray([1, -1], PressureUnit.PASCAL)
+        values = (pressures + deltas).as_unit(PressureUnit.PASCAL)
+        self.assertAlmostEqual(2, values[0])
+        self.assertAlmostEqual(1, values[1])
+
+    def test_subtract_pressure_delta_from_pressure_array_below_zero_raises_error(
+        self,
+    ) -> None:
+        pressures = PressureArray([1, 2], PressureUnit.PASCAL)
+        with self.assertRaises(NegativePressureValueError):
+            _ = pressures - PressureDelta(1.5, PressureUnit.PASCAL)
+
+    def test_subtract_pressure_arrays_produces_pressure_delta_array(self) -> None:
+        pressures1 = PressureArray([1, 2], PressureUnit.PASCAL)
+        pressures2 = PressureArray([2, 1], PressureUnit.PASCAL)
+        deltas = pressures1 - pressures2
+        self.assertIsInstance(deltas, PressureDeltaArray)
+        values = deltas.as_unit(PressureUnit.PASCAL)
+        self.assertAlmostEqual(-1, values[0])
+        self.assertAlmostEqual(1, values[1])
+
+    def test_scale_pressure_delta_array(self) -> None:
+        deltas = PressureDeltaArray([1, -2], PressureUnit.PASCAL)
+        values = (deltas * 2).as_unit(PressureUnit.PASCAL)
+        self.assertAlmostEqual(2, values[0])
+        self.assertAlmostEqual(-4, values[1])
+
+    def test_compare_pressure_array_to_pressure(self) -> None:
+        pressures = PressureArray([1, 2, 3], PressureUnit.PASCAL)
+        threshold = Pressure(2, PressureUnit.PASCAL)
+        self.assertEqual(bytearray([1, 0, 0]), pressures < threshold)
+        self.assertEqual(bytearray([0, 1, 1]), pressures >= threshold)
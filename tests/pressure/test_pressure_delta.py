@@ -153,3 +153,9 @@ class PressureDeltaTest(unittest.TestCase):
                     is_greater_than_or_equal_to,
                     pressure_delta1 >= pressure_delta2,
                 )
+
+    def test_get_pressure_delta_value_as_invalid_unit_raises_value_error(self) -> None:
+        pressure_delta = PressureDelta(1, PressureUnit.PASCAL)
+        for invalid_unit in [-1, 0, 8, 9, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                pressure_delta.as_unit(invalid_unit)  # type: ignore[arg-type]
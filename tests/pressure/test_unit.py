@@ -0,0 +1,85 @@
+# Generated by `tools/generate_units.py` from `tools/units_spec.json`, so edit the
+# spec & rerun the generator rather than editing this module.
+
+import math
+import unittest
+
+from src.units.units_inner.pressure import unit
+
+# The member, name, abbreviation & change in the quantity expressed as the unit per 1Pa
+# of each unit
+_UNITS = [
+    (unit.Unit.PASCAL, "pascal", "Pa", 1),
+    (unit.Unit.POUND_PER_SQUARE_INCH, "pound-per-square-inch", "PSI", 0.00014503773773),
+    (unit.Unit.BAR, "bar", "bar", 1 / 100_000),
+    (
+        unit.Unit.ATMOSPHERE,
+        "atmosphere",
+        "atm",
+        1 / unit.STANDARD_ATMOSPHERIC_PRESSURE_AS_PASCAL,
+    ),
+    (
+        unit.Unit.MILLIMETRE_OF_MERCURY,
+        "millimetre-of-mercury",
+        "mmHg",
+        1 / 133.322387415,
+    ),
+    (unit.Unit.KILOPASCAL, "kilopascal", "kPa", 1 / 1_000),
+    (unit.Unit.MILLIBAR, "millibar", "mbar", 1 / 100),
+]
+
+
+class UnitTest(unittest.TestCase):
+    """Unit tests for the pressure unit tables."""
+
+    def assert_close(self, expected: float, actual: float) -> None:
+        self.assertAlmostEqual(expected, actual, delta=abs(expected) * 1e-9)
+
+    def test_get_name(self) -> None:
+        for member, name, *_ in _UNITS:
+            with self.subTest(unit=member):
+                self.assertEqual(name, unit.get_name(member))
+
+    def test_get_abbreviation(self) -> None:
+        for member, _, abbreviation, *_ in _UNITS:
+            with self.subTest(unit=member):
+                self.assertEqual(abbreviation, unit.get_abbreviation(member))
+
+    def test_invalid_unit_raises_value_error(self) -> None:
+        for invalid_unit in [0, len(_UNITS) + 1]:
+            with (
+                self.subTest(unit=invalid_unit),
+                self.assertRaises(ValueError),
+            ):
+                unit.get_name(invalid_unit)  # type: ignore[arg-type]
+
+    def test_get_unit_delta_per_pascal(self) -> None:
+        for member, _, _, unit_delta in _UNITS:
+            with self.subTest(unit=member):
+                self.assert_close(unit_delta, unit.get_unit_delta_per_pascal(member))
+
+    def test_conversion_factors(self) -> None:
+        for from_member, _, _, from_unit_delta in _UNITS:
+            for to_member, _, _, to_unit_delta in _UNITS:
+                with self.subTest(from_unit=from_member, to_unit=to_member):
+                    index = from_member * unit.CONVERSION_FACTORS_STRIDE + to_member
+                    self.assert_close(
+                        to_unit_delta / from_unit_delta,
+                        unit.CONVERSION_FACTORS[index],
+                    )
+
+    def test_get_fixed_point_ratio(self) -> None:
+        for member, _, _, unit_delta in _UNITS:
+            with self.subTest(unit=member):
+                numerator, denominator = unit.get_fixed_point_ratio(member)
+                self.assertTrue(
+                    math.isclose(
+                        unit.FIXED_POINT_RESOLUTION_PER_PASCAL / unit_delta,
+                        numerator / denominator,
+                        rel_tol=1e-7,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
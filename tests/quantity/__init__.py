@@ -0,0 +1,10 @@
+"""Package for unit tests of the generic quantity class and dimensions."""
+
+from .test_dimension import DimensionTest
+from .test_quantity import QuantityAndTypedQuantityTest, QuantityTest
+
+__all__ = [
+    "DimensionTest",
+    "QuantityAndTypedQuantityTest",
+    "QuantityTest",
+]
@@ -0,0 +1,102 @@
+import unittest
+
+from src.units import quantity
+
+
+class DimensionTest(unittest.TestCase):
+    """Unit tests for the dimension functions."""
+
+    def test_base_dimensions_have_a_single_exponent(self) -> None:
+        for dimension, expected_exponents in [
+            (quantity.LENGTH, (1, 0, 0, 0, 0, 0)),
+            (quantity.MASS, (0, 1, 0, 0, 0, 0)),
+            (quantity.TIME, (0, 0, 1, 0, 0, 0)),
+            (quantity.ANGLE, (0, 0, 0, 1, 0, 0)),
+            (quantity.CURRENT, (0, 0, 0, 0, 1, 0)),
+            (quantity.TEMPERATURE, (0, 0, 0, 0, 0, 1)),
+            (quantity.DIMENSIONLESS, (0, 0, 0, 0, 0, 0)),
+        ]:
+            with self.subTest(dimension=dimension):
+                self.assertEqual(expected_exponents, quantity.get_exponents(dimension))
+
+    def test_make_dimension_round_trips_through_exponents(self) -> None:
+        for exponents in [
+            (1, 0, -1, 0, 0, 0),
+            (2, 1, -3, 0, -1, 0),
+            (-15, 15, -15, 15, -15, 15),
+            (0, 0, 0, -1, 0, 0),
+        ]:
+            with self.subTest(exponents=exponents):
+                dimension = quantity.make_dimension(*exponents)
+                self.assertEqual(exponents, quantity.get_exponents(dimension))
+
+    def test_sum_of_dimensions_is_dimension_of_product(self) -> None:
+        velocity = quantity.make_dimension(length=1, time=-1)
+        self.assertEqual(velocity, quantity.LENGTH - quantity.TIME)
+        self.assertEqual(
+            quantity.make_dimension(length=1, time=-2), velocity - quantity.TIME
+        )
+
+    def test_make_dimension_with_exponent_out_of_range_raises_value_error(
+        self,
+    ) -> None:
+        for exponent in [quantity.MAX_EXPONENT + 1, -quantity.MAX_EXPONENT - 1]:
+            with self.subTest(exponent=exponent), self.assertRaises(ValueError):
+                quantity.make_dimension(time=exponent)
+
+    def test_get_product_dimension(self) -> None:
+        velocity = quantity.make_dimension(length=1, time=-1)
+        for dimension, other_dimension, expected_dimension in [
+            (velocity, quantity.TIME, quantity.LENGTH),
+            (velocity, -quantity.TIME, quantity.make_dimension(length=1, time=-2)),
+            (velocity, quantity.DIMENSIONLESS, velocity),
+            (quantity.DIMENSIONLESS, velocity, velocity),
+            (velocity, -velocity, quantity.DIMENSIONLESS),
+        ]:
+            with self.subTest(dimension=dimension, other_dimension=other_dimension):
+                self.assertEqual(
+                    expected_dimension,
+                    quantity.get_product_dimension(dimension, other_dimension),
+                )
+
+    def test_get_power_dimension(self) -> None:
+        velocity = quantity.make_dimension(length=1, time=-1)
+        for exponent in [-3, 0, 1, 2]:
+            with self.subTest(exponent=exponent):
+                self.assertEqual(
+                    quantity.make_dimension(length=exponent, time=-exponent),
+                    quantity.get_power_dimension(velocity, exponent),
+                )
+
+    def test_dimension_with_exponent_out_of_range_raises_value_error(self) -> None:
+        maximum = quantity.make_dimension(time=quantity.MAX_EXPONENT)
+        minimum = quantity.make_dimension(time=-quantity.MAX_EXPONENT)
+        for dimension, other_dimension in [
+            (maximum, quantity.TIME),
+            (minimum, -quantity.TIME),
+            (quantity.make_dimension(length=1, time=9), 7 * quantity.TIME),
+        ]:
+            with (
+                self.subTest(dimension=dimension, other_dimension=other_dimension),
+                self.assertRaises(ValueError),
+            ):
+                quantity.get_product_dimension(dimension, other_dimension)
+        with self.assertRaises(ValueError):
+            quantity.get_power_dimension(quantity.make_dimension(time=-4), 4)
+
+    def test_get_symbol(self) -> None:
+        for dimension, expected_symbol in [
+            (quantity.DIMENSIONLESS, ""),
+            (quantity.LENGTH, "m"),
+            (quantity.make_dimension(length=1, time=-2), "m s^-2"),
+            (
+                quantity.make_dimension(length=2, mass=1, time=-3, current=-1),
+                "m^2 kg s^-3 A^-1",
+            ),
+        ]:
+            with self.subTest(dimension=dimension):
+                self.assertEqual(expected_symbol, quantity.get_symbol(dimension))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,266 @@
+import unittest
+
+from src.units import (
+    Acceleration,
+    Angle,
+    AngleUnit,
+    AngularVelocity,
+    DimensionMismatchError,
+    Displacement,
+    DistanceUnit,
+    LengthDelta,
+    MassFlowRate,
+    MassUnit,
+    PressureDelta,
+    PressureUnit,
+    Quantity,
+    TemperatureDelta,
+    TemperatureUnit,
+    TimeDelta,
+    TimeUnit,
+    Velocity,
+    VolumeDelta,
+    VolumetricFlowRate,
+    VolumeUnit,
+    quantity,
+)
+
+_VELOCITY = quantity.LENGTH - quantity.TIME
+
+
+class QuantityTest(unittest.TestCase):
+    """Unit tests for the generic quantity class."""
+
+    def test_create_quantity(self) -> None:
+        speed = Quantity(2.5, _VELOCITY)
+        self.assertEqual(2.5, speed.as_si_unit())
+        self.assertEqual(_VELOCITY, speed.dimension)
+
+    def test_quantity_is_dimensionless_by_default(self) -> None:
+        self.assertEqual(quantity.DIMENSIONLESS, Quantity(2).dimension)
+
+    def test_multiply_quantities_adds_dimensions(self) -> None:
+        product = Quantity(2, _VELOCITY) * Quantity(3, quantity.TIME)
+        self.assertEqual(Quantity(6, quantity.LENGTH), product)
+
+    def test_divide_quantities_subtracts_dimensions(self) -> None:
+        quotient = Quantity(6, quantity.LENGTH) / Quantity(3, quantity.TIME)
+        self.assertEqual(Quantity(2, _VELOCITY), quotient)
+
+    def test_multiply_quantity_by_value(self) -> None:
+        self.assertEqual(Quantity(5, _VELOCITY), Quantity(2.5, _VELOCITY) * 2)
+        self.assertEqual(Quantity(5, _VELOCITY), 2 * Quantity(2.5, _VELOCITY))
+
+    def test_divide_quantity_by_value(self) -> None:
+        self.assertEqual(Quantity(1.25, _VELOCITY), Quantity(2.5, _VELOCITY) / 2)
+
+    def test_divide_value_by_quantity_inverts_dimension(self) -> None:
+        frequency = 1 / Quantity(0.5, quantity.TIME)
+        self.assertEqual(Quantity(2, -quantity.TIME), frequency)
+
+    def test_raise_quantity_to_power(self) -> None:
+        area = Quantity(3, quantity.LENGTH) ** 2
+        self.assertEqual(Quantity(9, 2 * quantity.LENGTH), area)
+
+    def test_product_with_exponent_out_of_range_raises_value_error(self) -> None:
+        time_cubed = Quantity(2, 3 * quantity.TIME)
+        with self.assertRaises(ValueError):
+            _ = time_cubed**6
+        with self.assertRaises(ValueError):
+            _ = (time_cubed**5) * Quantity(1, quantity.TIME)
+        with self.assertRaises(ValueError):
+            _ = (time_cubed**5) / Quantity(1, -quantity.TIME)
+
+    def test_multiply_non_number_by_quantity_is_not_supported(self) -> None:
+        speed = Quantity(2.5, _VELOCITY)
+        for value in ["2", [2], None]:
+            with self.subTest(value=value):
+                with self.assertRaises(TypeError):
+                    _ = value * speed  # type: ignore[operator]
+                with self.assertRaises(TypeError):
+                    _ = value / speed  # type: ignore[operator]
+
+    def test_add_quantities_of_same_dimension(self) -> None:
+        total = Quantity(1, quantity.LENGTH) + Quantity(2, quantity.LENGTH)
+        self.assertEqual(Quantity(3, quantity.LENGTH), total)
+
+    def test_subtract_quantities_of_same_dimension(self) -> None:
+        difference = Quantity(1, quantity.LENGTH) - Quantity(3, quantity.LENGTH)
+        self.assertEqual(Quantity(-2, quantity.LENGTH), difference)
+
+    def test_add_quantities_of_different_dimensions_raises_error(self) -> None:
+        with self.assertRaises(DimensionMismatchError):
+            _ = Quantity(1, quantity.LENGTH) + Quantity(1, quantity.TIME)
+
+    def test_subtract_quantities_of_different_dimensions_raises_error(self) -> None:
+        with self.assertRaises(DimensionMismatchError):
+            _ = Quantity(1, quantity.LENGTH) - Quantity(1, quantity.TIME)
+
+    def test_negate_quantity(self) -> None:
+        self.assertEqual(Quantity(-1, quantity.MASS), -Quantity(1, quantity.MASS))
+
+    def test_absolute_quantity(self) -> None:
+        self.assertEqual(Quantity(1, quantity.MASS), abs(Quantity(-1, quantity.MASS)))
+
+    def test_quantities_of_different_dimensions_are_not_equal(self) -> None:
+        self.assertNotEqual(Quantity(1, quantity.LENGTH), Quantity(1, quantity.TIME))
+
+    def test_quantity_is_not_equal_to_value(self) -> None:
+        self.assertNotEqual(Quantity(1), 1)
+
+    def test_compare_quantities(self) -> None:
+        small = Quantity(1, quantity.LENGTH)
+        large = Quantity(2, quantity.LENGTH)
+        self.assertLess(small, large)
+        self.assertLessEqual(small, large)
+        self.assertGreater(large, small)
+        self.assertGreaterEqual(large, small)
+
+    def test_compare_quantities_of_different_dimensions_raises_error(self) -> None:
+        small = Quantity(1, quantity.LENGTH)
+        large = Quantity(2, quantity.TIME)
+        for compare in [
+            lambda: small < large,
+            lambda: small <= large,
+            lambda: small > large,
+            lambda: small >= large,
+        ]:
+            with self.subTest(), self.assertRaises(DimensionMismatchError):
+                compare()
+
+    def test_equal_quantities_have_equal_hashes(self) -> None:
+        self.assertEqual(
+            hash(Quantity(1, quantity.LENGTH)), hash(Quantity(1.0, quantity.LENGTH))
+        )
+
+    def test_str(self) -> None:
+        self.assertEqual("2.5 m s^-1", str(Quantity(2.5, _VELOCITY)))
+        self.assertEqual("2.5", str(Quantity(2.5)))
+
+    def test_repr(self) -> None:
+        self.assertEqual(f"Quantity(2.5, {_VELOCITY})", repr(Quantity(2.5, _VELOCITY)))
+
+
+class QuantityAndTypedQuantityTest(unittest.TestCase):
+    """Unit tests for converting between generic & typed quantities."""
+
+    def test_create_quantity_from_typed_quantity(self) -> None:
+        for typed, expected in [
+            (LengthDelta(5, DistanceUnit.CENTIMETRE), Quantity(0.05, quantity.LENGTH)),
+            (
+                Velocity(60, DistanceUnit.METRE, TimeUnit.MINUTE),
+                Quantity(1, _VELOCITY),
+            ),
+            (
+                AngularVelocity(180, AngleUnit.DEGREE, TimeUnit.SECOND),
+                Quantity(3.141592653589793, quantity.ANGLE - quantity.TIME),
+            ),
+            (
+                TemperatureDelta(9, TemperatureUnit.FAHRENHEIT),
+                Quantity(5, quantity.TEMPERATURE),
+            ),
+            (
+                PressureDelta(1, PressureUnit.KILOPASCAL),
+                Quantity(1000, quantity.make_dimension(length=-1, mass=1, time=-2)),
+            ),
+        ]:
+            with self.subTest(typed=typed):
+                result = Quantity.from_typed(typed)
+                self.assertEqual(expected.dimension, result.dimension)
+                self.assertAlmostEqual(expected.as_si_unit(), result.as_si_unit())
+
+    def test_create_quantity_from_angle_raises_type_error(self) -> None:
+        with self.assertRaises(TypeError):
+            Quantity.from_typed(Angle(1, AngleUnit.RADIAN))
+
+    def test_create_quantity_from_value_raises_type_error(self) -> None:
+        with self.assertRaises(TypeError):
+            Quantity.from_typed(1.5)
+
+    def test_quantity_as_typed_quantity(self) -> None:
+        velocity = Quantity(2, _VELOCITY).as_type(Velocity)
+        self.assertIsInstance(velocity, Velocity)
+        self.assertAlmostEqual(
+            120, velocity.as_unit(DistanceUnit.METRE, TimeUnit.MINUTE)
+        )
+
+    def test_quantity_as_typed_quantity_in_non_si_default_unit(self) -> None:
+        delta = Quantity(5, quantity.TEMPERATURE).as_type(TemperatureDelta)
+        self.assertAlmostEqual(9, delta.as_unit(TemperatureUnit.FAHRENHEIT))
+
+    def test_quantity_as_typed_quantity_of_other_dimension_raises_error(
+        self,
+    ) -> None:
+        with self.assertRaises(DimensionMismatchError):
+            Quantity(2, _VELOCITY).as_type(Acceleration)
+
+    def test_products_of_typed_quantities(self) -> None:
+        flow_rate = VolumetricFlowRate(3, VolumeUnit.LITRE, TimeUnit.MINUTE)
+        duration = TimeDelta(2, TimeUnit.MINUTE)
+        volume = (Quantity.from_typed(flow_rate) * duration).as_type(VolumeDelta)
+        self.assertAlmostEqual(6, volume.as_unit(VolumeUnit.LITRE))
+
+    def test_quotients_of_typed_quantities(self) -> None:
+        displacement = Displacement(100, DistanceUnit.METRE)
+        duration = TimeDelta(10, TimeUnit.SECOND)
+        acceleration = (
+            Quantity.from_typed(displacement) / duration / duration
+        ).as_type(Acceleration)
+        self.assertAlmostEqual(
+            1, acceleration.as_unit(DistanceUnit.METRE, TimeUnit.SECOND)
+        )
+
+    def test_add_typed_quantity(self) -> None:
+        total = Quantity(1, quantity.LENGTH) + LengthDelta(50, DistanceUnit.CENTIMETRE)
+        self.assertAlmostEqual(1.5, total.as_si_unit())
+
+    def test_compare_typed_quantity(self) -> None:
+        length = Quantity(1, quantity.LENGTH)
+        delta = LengthDelta(50, DistanceUnit.CENTIMETRE)
+        self.assertGreater(length, delta)
+        self.assertGreaterEqual(length, delta)
+        self.assertFalse(length < delta)
+        self.assertFalse(length <= delta)
+
+    def test_compare_typed_quantity_of_different_dimension_raises_error(
+        self,
+    ) -> None:
+        with self.assertRaises(DimensionMismatchError):
+            _ = Quantity(1, quantity.LENGTH) < TimeDelta(1, TimeUnit.SECOND)
+
+    def test_typed_quantity_equals_quantity(self) -> None:
+        length = Quantity(0.5, quantity.LENGTH)
+        delta = LengthDelta(50, DistanceUnit.CENTIMETRE)
+        self.assertEqual(length, delta)
+        self.assertEqual(delta, length)
+        self.assertEqual(hash(length), hash(delta))
+        self.assertNotEqual(Quantity(0.5, quantity.TIME), delta)
+
+    def test_operator_with_unsupported_operand_raises_type_error(self) -> None:
+        length = Quantity(1, quantity.LENGTH)
+        other: object = "1"
+        for operate in [
+            lambda: length + other,
+            lambda: length - other,
+            lambda: length * other,
+            lambda: length / other,
+            lambda: length < other,
+            lambda: length <= other,
+            lambda: length > other,
+            lambda: length >= other,
+        ]:
+            with self.subTest(), self.assertRaises(TypeError):
+                operate()
+        self.assertNotEqual(length, other)
+
+    def test_mass_flow_rate_dimension(self) -> None:
+        self.assertEqual(
+            quantity.MASS - quantity.TIME,
+            Quantity.from_typed(
+                MassFlowRate(2, MassUnit.KILOGRAM, TimeUnit.SECOND)
+            ).dimension,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
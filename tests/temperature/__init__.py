@@ -1,13 +1,29 @@
 """Package for unit tests of temperature classes."""
 
 from .test_constants import AbsoluteZeroTest
+from .test_converter import ConvertIntoTest, MakeConverterTest
+from .test_filter import TemperatureFilterTest
+from .test_isr import TemperatureCellTest, TemperatureThresholdTest
+from .test_series import TemperatureSeriesTest
 from .test_temperature import TemperatureTest
 from .test_temperature_and_temperature_delta import TemperatureAndTemperatureDeltaTest
+from .test_temperature_array import TemperatureArrayTest
 from .test_temperature_delta import TemperatureDeltaTest
+from .test_temperature_delta_array import TemperatureDeltaArrayTest
+from .test_unit import UnitTest
 
 __all__ = [
-    "TemperatureTest",
-    "TemperatureDeltaTest",
-    "TemperatureAndTemperatureDeltaTest",
     "AbsoluteZeroTest",
+    "ConvertIntoTest",
+    "MakeConverterTest",
+    "TemperatureAndTemperatureDeltaTest",
+    "TemperatureArrayTest",
+    "TemperatureCellTest",
+    "TemperatureDeltaArrayTest",
+    "TemperatureDeltaTest",
+    "TemperatureFilterTest",
+    "TemperatureSeriesTest",
+    "TemperatureTest",
+    "TemperatureThresholdTest",
+    "UnitTest",
 ]
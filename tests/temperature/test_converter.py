@@ -0,0 +1,112 @@
+import unittest
+from array import array
+
+from src.units import Temperature, TemperatureDelta, TemperatureUnit
+from src.units.temperature import (
+    convert_delta_into,
+    convert_into,
+    make_converter,
+    make_delta_converter,
+)
+
+
+class MakeConverterTest(unittest.TestCase):
+    """Unit tests for the temperature converter factories."""
+
+    def test_converter_matches_as_unit(self) -> None:
+        units = [
+            TemperatureUnit.CELSIUS,
+            TemperatureUnit.KELVIN,
+            TemperatureUnit.FAHRENHEIT,
+        ]
+
+        for from_unit in units:
+            for to_unit in units:
+                with self.subTest(from_unit=from_unit, to_unit=to_unit):
+                    convert = make_converter(from_unit, to_unit)
+                    self.assertAlmostEqual(
+                        Temperature(300, from_unit).as_unit(to_unit), convert(300)
+                    )
+
+    def test_converter_applies_offset(self) -> None:
+        convert = make_converter(TemperatureUnit.CELSIUS, TemperatureUnit.FAHRENHEIT)
+        for value, expected_value in [(-40, -40), (0, 32), (100, 212)]:
+            with self.subTest(value=value, expected_value=expected_value):
+                self.assertAlmostEqual(expected_value, convert(value))
+
+    def test_converter_keeps_exact_values_exact(self) -> None:
+        to_fahrenheit = make_converter(
+            TemperatureUnit.CELSIUS, TemperatureUnit.FAHRENHEIT
+        )
+        to_celsius = make_converter(TemperatureUnit.FAHRENHEIT, TemperatureUnit.CELSIUS)
+        for celsius, fahrenheit in [(-40, -40), (0, 32), (37, 98.6), (100, 212)]:
+            with self.subTest(celsius=celsius, fahrenheit=fahrenheit):
+                self.assertEqual(fahrenheit, to_fahrenheit(celsius))
+                self.assertEqual(celsius, to_celsius(fahrenheit))
+
+    def test_delta_converter_matches_as_unit(self) -> None:
+        units = [
+            TemperatureUnit.CELSIUS,
+            TemperatureUnit.KELVIN,
+            TemperatureUnit.FAHRENHEIT,
+        ]
+
+        for from_unit in units:
+            for to_unit in units:
+                with self.subTest(from_unit=from_unit, to_unit=to_unit):
+                    convert = make_delta_converter(from_unit, to_unit)
+                    self.assertAlmostEqual(
+                        TemperatureDelta(-12.5, from_unit).as_unit(to_unit),
+                        convert(-12.5),
+                    )
+
+    def test_make_converter_with_invalid_unit_raises_value_error(self) -> None:
+        for make in [make_converter, make_delta_converter]:
+            with self.subTest(make=make), self.assertRaises(ValueError):
+                make(TemperatureUnit.CELSIUS, 0)  # type: ignore[arg-type]
+
+
+class ConvertIntoTest(unittest.TestCase):
+    """Unit tests for the temperature buffer converters."""
+
+    def test_convert_into_applies_offset(self) -> None:
+        src = array("d", [-40, 0, 100])
+        dst = array("d", [0, 0, 0])
+        convert_into(src, dst, TemperatureUnit.CELSIUS, TemperatureUnit.FAHRENHEIT)
+        for index, expected_value in enumerate([-40, 32, 212]):
+            with self.subTest(index=index, expected_value=expected_value):
+                self.assertAlmostEqual(expected_value, dst[index])
+
+    def test_convert_delta_into_does_not_apply_offset(self) -> None:
+        src = array("d", [-40, 0, 100])
+        dst = array("d", [0, 0, 0])
+        convert_delta_into(
+            src, dst, TemperatureUnit.CELSIUS, TemperatureUnit.FAHRENHEIT
+        )
+        for index, expected_value in enumerate([-72, 0, 180]):
+            with self.subTest(index=index, expected_value=expected_value):
+                self.assertAlmostEqual(expected_value, dst[index])
+
+    def test_convert_into_same_buffer_converts_in_place(self) -> None:
+        values = array("d", [0, 100])
+        convert_into(values, values, TemperatureUnit.CELSIUS, TemperatureUnit.KELVIN)
+        self.assertAlmostEqual(273.15, values[0])
+        self.assertAlmostEqual(373.15, values[1])
+
+    def test_convert_into_keeps_exact_values_exact(self) -> None:
+        src = array("d", [273.15, 373.15])
+        dst = array("d", [0, 0])
+        convert_into(src, dst, TemperatureUnit.KELVIN, TemperatureUnit.FAHRENHEIT)
+        self.assertEqual([32, 212], list(dst))
+        convert_into(dst, dst, TemperatureUnit.FAHRENHEIT, TemperatureUnit.CELSIUS)
+        self.assertEqual([0, 100], list(dst))
+
+    def test_convert_into_shorter_destination_raises_value_error(self) -> None:
+        for convert in (convert_into, convert_delta_into):
+            with self.subTest(convert=convert), self.assertRaises(ValueError):
+                convert(
+                    array("d", [1, 2]),
+                    array("d", [0]),
+                    TemperatureUnit.CELSIUS,
+                    TemperatureUnit.KELVIN,
+                )
@@ -0,0 +1,53 @@
+import unittest
+
+from src.units import BelowAbsoluteZeroError, Temperature, TemperatureUnit
+from src.units.filters import ExponentialMovingAverage, MovingMedian
+from src.units.temperature import TemperatureFilter
+
+
+class TemperatureFilterTest(unittest.TestCase):
+    """Unit tests for the temperature filter class."""
+
+    def test_update_returns_filtered_temperature_in_unit_of_filter(self) -> None:
+        temperature_filter = TemperatureFilter(
+            ExponentialMovingAverage(0.5), TemperatureUnit.CELSIUS
+        )
+        temperature_filter.update(Temperature(10, TemperatureUnit.CELSIUS))
+        filtered = temperature_filter.update(
+            Temperature(303.15, TemperatureUnit.KELVIN)
+        )
+        self.assertIsInstance(filtered, Temperature)
+        self.assertAlmostEqual(20, filtered.as_unit(TemperatureUnit.CELSIUS))
+        self.assertAlmostEqual(293.15, filtered.as_unit(TemperatureUnit.KELVIN))
+
+    def test_update_value(self) -> None:
+        temperature_filter = TemperatureFilter(
+            MovingMedian(3), TemperatureUnit.FAHRENHEIT
+        )
+        for value in (70, 71, -400):
+            filtered = temperature_filter.update_value(value)
+        self.assertAlmostEqual(70, filtered.as_unit(TemperatureUnit.FAHRENHEIT))
+
+    def test_update_value_keeps_exact_values_exact(self) -> None:
+        temperature_filter = TemperatureFilter(
+            MovingMedian(1), TemperatureUnit.FAHRENHEIT
+        )
+        filtered = temperature_filter.update_value(32)
+        self.assertEqual(32, filtered.as_unit(TemperatureUnit.FAHRENHEIT))
+        self.assertEqual(0, filtered.as_unit(TemperatureUnit.CELSIUS))
+
+    def test_update_invalid_value_raises_error(self) -> None:
+        temperature_filter = TemperatureFilter(MovingMedian(3), TemperatureUnit.CELSIUS)
+        with self.assertRaises(BelowAbsoluteZeroError):
+            temperature_filter.update_value(-300)
+
+    def test_reset(self) -> None:
+        temperature_filter = TemperatureFilter(MovingMedian(2), TemperatureUnit.CELSIUS)
+        temperature_filter.update_value(10)
+        temperature_filter.reset()
+        filtered = temperature_filter.update_value(4)
+        self.assertAlmostEqual(4, filtered.as_unit(TemperatureUnit.CELSIUS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# pyright: reportUnknownMemberType=false
+
+import unittest
+
+from src.units import BelowAbsoluteZeroError, Temperature, TemperatureUnit
+from src.units.temperature import TemperatureCell, TemperatureThreshold
+
+try:
+    import micropython  # type: ignore[import-not-found]
+except ImportError:
+    micropython = None
+
+
+class TemperatureCellTest(unittest.TestCase):
+    """Unit tests for the temperature cell class."""
+
+    def test_get_produces_temperature(self) -> None:
+        cell = TemperatureCell(TemperatureUnit.CELSIUS)
+        cell.set(12.5)
+        temperature = cell.get()
+        self.assertIsInstance(temperature, Temperature)
+        self.assertAlmostEqual(12.5, temperature.as_unit(TemperatureUnit.CELSIUS))
+
+    def test_get_initial_value(self) -> None:
+        cell = TemperatureCell(TemperatureUnit.CELSIUS, 12.5)
+        self.assertAlmostEqual(12.5, cell.get().as_unit(TemperatureUnit.CELSIUS))
+
+    def test_get_invalid_value_raises_error(self) -> None:
+        cell = TemperatureCell(TemperatureUnit.CELSIUS)
+        cell.set(-1000)
+        with self.assertRaises(BelowAbsoluteZeroError):
+            cell.get()
+
+    def test_set_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        cell = TemperatureCell(TemperatureUnit.CELSIUS)
+        value = 12.5
+        micropython.heap_lock()
+        try:
+            cell.set(value)
+            cell.set(90)
+        finally:
+            micropython.heap_unlock()
+
+
+class TemperatureThresholdTest(unittest.TestCase):
+    """Unit tests for the temperature threshold class."""
+
+    def test_compare_raw_values_with_threshold(self) -> None:
+        threshold = TemperatureThreshold(
+            Temperature(212, TemperatureUnit.FAHRENHEIT), TemperatureUnit.CELSIUS
+        )
+        self.assertTrue(threshold.is_below(90))
+        self.assertFalse(threshold.is_above(90))
+        self.assertTrue(threshold.is_above(110))
+        self.assertFalse(threshold.is_below(110))
+
+    def test_compare_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        threshold = TemperatureThreshold(
+            Temperature(212, TemperatureUnit.FAHRENHEIT), TemperatureUnit.CELSIUS
+        )
+        micropython.heap_lock()
+        try:
+            is_below = threshold.is_below(90)
+            is_above = threshold.is_above(90)
+        finally:
+            micropython.heap_unlock()
+        self.assertTrue(is_below)
+        self.assertFalse(is_above)
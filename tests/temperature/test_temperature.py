@@ -29,6 +29,69 @@ class TemperatureTest(unittest.TestCase):
             with self.subTest(unit=unit, expected_value=expected_value):
                 self.assertAlmostEqual(expected_value, temperature.as_unit(unit))
 
+    def test_get_temperature_value_as_own_unit_is_exact(self) -> None:
+        for unit in [
+            TemperatureUnit.CELSIUS,
+            TemperatureUnit.KELVIN,
+            TemperatureUnit.FAHRENHEIT,
+        ]:
+            with self.subTest(unit=unit):
+                self.assertEqual(21.3, Temperature(21.3, unit).as_unit(unit))
+
+    def test_get_temperature_value_as_every_unit(self) -> None:
+        for unit, value, expected_values in [
+            (TemperatureUnit.CELSIUS, 100, (100, 373.15, 212)),
+            (TemperatureUnit.KELVIN, 0, (-273.15, 0, -459.67)),
+            (TemperatureUnit.FAHRENHEIT, 50, (10, 283.15, 50)),
+        ]:
+            temperature = Temperature(value, unit)
+            for external_unit, expected_value in zip(
+                [
+                    TemperatureUnit.CELSIUS,
+                    TemperatureUnit.KELVIN,
+                    TemperatureUnit.FAHRENHEIT,
+                ],
+                expected_values,
+                strict=True,
+            ):
+                with self.subTest(unit=unit, external_unit=external_unit):
+                    self.assertAlmostEqual(
+                        expected_value, temperature.as_unit(external_unit)
+                    )
+
+    def test_create_temperature_with_invalid_unit_raises_value_error(self) -> None:
+        with self.assertRaises(ValueError):
+            _ = Temperature(1, 0)  # type: ignore[arg-type]
+
+    def test_get_temperature_value_as_invalid_unit_raises_value_error(self) -> None:
+        temperature = Temperature(1, TemperatureUnit.CELSIUS)
+        for unit in [-1, 0, 4, 5, 100]:
+            with self.subTest(unit=unit), self.assertRaises(ValueError):
+                temperature.as_unit(unit)  # type: ignore[arg-type]
+
+    def test_get_temperature_value_as_other_unit_is_exact(self) -> None:
+        for celsius, fahrenheit in [
+            (0, 32),
+            (100, 212),
+            (-40, -40),
+            (37, 98.6),
+            (20, 68),
+            (-17.5, 0.5),
+        ]:
+            with self.subTest(celsius=celsius, fahrenheit=fahrenheit):
+                self.assertEqual(
+                    fahrenheit,
+                    Temperature(celsius, TemperatureUnit.CELSIUS).as_unit(
+                        TemperatureUnit.FAHRENHEIT
+                    ),
+                )
+                self.assertEqual(
+                    celsius,
+                    Temperature(fahrenheit, TemperatureUnit.FAHRENHEIT).as_unit(
+                        TemperatureUnit.CELSIUS
+                    ),
+                )
+
     def test_compare_temperatures(self) -> None:
         for (
             temperature1,
@@ -89,3 +152,32 @@ class TemperatureTest(unittest.TestCase):
                 self.assertEqual(
                     is_greater_than_or_equal_to, temperature1 >= temperature2
                 )
+
+    def test_same_temperatures_in_different_units_are_equal(self) -> None:
+        for value, unit, other_value, other_unit in [
+            (0, TemperatureUnit.CELSIUS, 32, TemperatureUnit.FAHRENHEIT),
+            (100, TemperatureUnit.CELSIUS, 212, TemperatureUnit.FAHRENHEIT),
+            (-40, TemperatureUnit.CELSIUS, -40, TemperatureUnit.FAHRENHEIT),
+            (37, TemperatureUnit.CELSIUS, 98.6, TemperatureUnit.FAHRENHEIT),
+            (-17.5, TemperatureUnit.CELSIUS, 0.5, TemperatureUnit.FAHRENHEIT),
+            (-273.15, TemperatureUnit.CELSIUS, -459.67, TemperatureUnit.FAHRENHEIT),
+            (0, TemperatureUnit.KELVIN, -459.67, TemperatureUnit.FAHRENHEIT),
+            (273.15, TemperatureUnit.KELVIN, 32, TemperatureUnit.FAHRENHEIT),
+            (373.15, TemperatureUnit.KELVIN, 212, TemperatureUnit.FAHRENHEIT),
+            (310.15, TemperatureUnit.KELVIN, 37, TemperatureUnit.CELSIUS),
+        ]:
+            with self.subTest(value=value, unit=unit, other_unit=other_unit):
+                temperature = Temperature(value, unit)
+                other_temperature = Temperature(other_value, other_unit)
+                self.assertEqual(temperature, other_temperature)
+                self.assertEqual(hash(temperature), hash(other_temperature))
+
+    def test_compare_temperatures_in_different_units(self) -> None:
+        self.assertEqual(
+            Temperature(0, TemperatureUnit.CELSIUS),
+            Temperature(273.15, TemperatureUnit.KELVIN),
+        )
+        self.assertLess(
+            Temperature(32, TemperatureUnit.FAHRENHEIT),
+            Temperature(1, TemperatureUnit.CELSIUS),
+        )
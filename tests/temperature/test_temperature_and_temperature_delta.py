@@ -39,3 +39,51 @@ class TemperatureAndTemperatureDeltaTest(unittest.TestCase):
         self.assertAlmostEqual(
             1, new_temperature_delta.as_unit(TemperatureUnit.CELSIUS)
         )
+
+    def test_add_temperature_delta_to_temperature_in_same_unit_preserves_unit(
+        self,
+    ) -> None:
+        temperature = Temperature(20, TemperatureUnit.CELSIUS)
+        delta = TemperatureDelta(5, TemperatureUnit.CELSIUS)
+        new_temperature = temperature + delta
+        self.assertEqual("25 C", str(new_temperature))
+        self.assertAlmostEqual(
+            (temperature + TemperatureDelta(5, TemperatureUnit.KELVIN)).as_unit(
+                TemperatureUnit.CELSIUS
+            ),
+            new_temperature.as_unit(TemperatureUnit.CELSIUS),
+        )
+
+    def test_subtract_temperature_from_temperature_in_same_unit_preserves_unit(
+        self,
+    ) -> None:
+        temperature1 = Temperature(68, TemperatureUnit.FAHRENHEIT)
+        temperature2 = Temperature(50, TemperatureUnit.FAHRENHEIT)
+        new_temperature_delta = temperature1 - temperature2
+        self.assertIsInstance(new_temperature_delta, TemperatureDelta)
+        self.assertEqual("18 F", str(new_temperature_delta))
+        self.assertAlmostEqual(
+            (temperature1 - Temperature(10, TemperatureUnit.CELSIUS)).as_unit(
+                TemperatureUnit.FAHRENHEIT
+            ),
+            new_temperature_delta.as_unit(TemperatureUnit.FAHRENHEIT),
+        )
+
+    def test_temperature_in_same_unit_equals_temperature_created_with_result(
+        self,
+    ) -> None:
+        temperature = Temperature(98.6, TemperatureUnit.FAHRENHEIT)
+        delta = TemperatureDelta(0.3, TemperatureUnit.FAHRENHEIT)
+        for result, expected in [
+            (temperature + delta, Temperature(98.6 + 0.3, TemperatureUnit.FAHRENHEIT)),
+            (temperature - delta, Temperature(98.6 - 0.3, TemperatureUnit.FAHRENHEIT)),
+            (delta + delta, TemperatureDelta(0.3 + 0.3, TemperatureUnit.FAHRENHEIT)),
+            (
+                temperature - Temperature(32, TemperatureUnit.FAHRENHEIT),
+                TemperatureDelta(98.6 - 32, TemperatureUnit.FAHRENHEIT),
+            ),
+        ]:
+            with self.subTest(result=result):
+                self.assertEqual(str(expected), str(result))
+                self.assertEqual(expected, result)
+                self.assertEqual(hash(expected), hash(result))
@@ -0,0 +1,123 @@
+import unittest
+
+from src.units import (
+    BelowAbsoluteZeroError,
+    Temperature,
+    TemperatureArray,
+    TemperatureDelta,
+    TemperatureDeltaArray,
+    TemperatureUnit,
+    get_indices,
+)
+
+
+class TemperatureArrayTest(unittest.TestCase):
+    """Unit tests for temperature array class."""
+
+    def test_create_temperature_array(self) -> None:
+        # Test passes if it simply doesn't throw an exception
+        _ = TemperatureArray([0, 100], TemperatureUnit.CELSIUS)
+
+    def test_create_temperature_array_below_absolute_zero_raises_error(
+        self,
+    ) -> None:
+        with self.assertRaises(BelowAbsoluteZeroError):
+            _ = TemperatureArray([0, -300], TemperatureUnit.CELSIUS)
+
+    def test_get_temperature_array_values_as_unit(self) -> None:
+        temperatures = TemperatureArray([0, 100], TemperatureUnit.CELSIUS)
+        for unit, expected_values in [
+            (TemperatureUnit.CELSIUS, (0, 100)),
+            (TemperatureUnit.KELVIN, (273.15, 373.15)),
+            (TemperatureUnit.FAHRENHEIT, (32, 212)),
+        ]:
+            with self.subTest(unit=unit, expected_values=expected_values):
+                values = temperatures.as_unit(unit)
+                self.assertAlmostEqual(expected_values[0], values[0])
+                self.assertAlmostEqual(expected_values[1], values[1])
+
+    def test_index_temperature_array_produces_temperature(self) -> None:
+        temperatures = TemperatureArray([32, 212], TemperatureUnit.FAHRENHEIT)
+        temperature = temperatures[1]
+        self.assertIsInstance(temperature, Temperature)
+        self.assertAlmostEqual(212, temperature.as_unit(TemperatureUnit.FAHRENHEIT))
+
+    def test_temperature_array_keeps_exact_values_exact(self) -> None:
+        temperatures = TemperatureArray([32, 212], TemperatureUnit.FAHRENHEIT)
+        self.assertEqual(273.15, temperatures[0].as_unit(TemperatureUnit.KELVIN))
+        self.assertEqual(32, temperatures[0].as_unit(TemperatureUnit.FAHRENHEIT))
+        self.assertEqual([0, 100], list(temperatures.as_unit(TemperatureUnit.CELSIUS)))
+        self.assertEqual(
+            [32, 212],
+            [
+                temperature.as_unit(TemperatureUnit.FAHRENHEIT)
+                for temperature in temperatures
+            ],
+        )
+
+    def test_slice_temperature_array_produces_temperature_array(self) -> None:
+        temperatures = TemperatureArray([0, 10, 20], TemperatureUnit.CELSIUS)
+        sliced = temperatures[1:]
+        self.assertIsInstance(sliced, TemperatureArray)
+        self.assertEqual(2, len(sliced))
+        self.assertAlmostEqual(10, sliced[0].as_unit(TemperatureUnit.CELSIUS))
+
+    def test_iterate_over_temperature_array(self) -> None:
+        temperatures = TemperatureArray([0, 10], TemperatureUnit.CELSIUS)
+        values = [
+            temperature.as_unit(TemperatureUnit.CELSIUS) for temperature in temperatures
+        ]
+        self.assertEqual(2, len(values))
+        self.assertAlmostEqual(0, values[0])
+        self.assertAlmostEqual(10, values[1])
+
+    def test_add_temperature_delta_to_temperature_array(self) -> None:
+        temperatures = TemperatureArray([0, 10], TemperatureUnit.CELSIUS)
+        new_temperatures = temperatures + TemperatureDelta(5, TemperatureUnit.KELVIN)
+        self.assertIsInstance(new_temperatures, TemperatureArray)
+        values = new_temperatures.as_unit(TemperatureUnit.CELSIUS)
+        self.assertAlmostEqual(5, values[0])
+        self.assertAlmostEqual(15, values[1])
+
+    def test_add_temperature_delta_array_to_temperature_array(self) -> None:
+        temperatures = TemperatureArray([0, 10], TemperatureUnit.CELSIUS)
+        deltas = TemperatureDeltaArray([9, 18], TemperatureUnit.FAHRENHEIT)
+        values = (temperatures + deltas).as_unit(TemperatureUnit.CELSIUS)
+        self.assertAlmostEqual(5, values[0])
+        self.assertAlmostEqual(20, values[1])
+
+    def test_add_temperature_delta_below_absolute_zero_raises_error(self) -> None:
+        temperatures = TemperatureArray([0, 10], TemperatureUnit.KELVIN)
+        with self.assertRaises(BelowAbsoluteZeroError):
+            _ = temperatures + TemperatureDelta(-5, TemperatureUnit.KELVIN)
+
+    def test_subtract_temperature_produces_temperature_delta_array(self) -> None:
+        temperatures = TemperatureArray([0, 10], TemperatureUnit.CELSIUS)
+        deltas = temperatures - Temperature(5, TemperatureUnit.CELSIUS)
+        self.assertIsInstance(deltas, TemperatureDeltaArray)
+        values = deltas.as_unit(TemperatureUnit.KELVIN)
+        self.assertAlmostEqual(-5, values[0])
+        self.assertAlmostEqual(5, values[1])
+
+    def test_subtract_temperature_delta_produces_temperature_array(self) -> None:
+        temperatures = TemperatureArray([0, 10], TemperatureUnit.CELSIUS)
+        new_temperatures = temperatures - TemperatureDelta(5, TemperatureUnit.KELVIN)
+        self.assertIsInstance(new_temperatures, TemperatureArray)
+        values = new_temperatures.as_unit(TemperatureUnit.CELSIUS)
+        self.assertAlmostEqual(-5, values[0])
+        self.assertAlmostEqual(5, values[1])
+
+    def test_subtract_temperature_arrays_of_different_lengths_raises_error(
+        self,
+    ) -> None:
+        temperatures1 = TemperatureArray([0, 10], TemperatureUnit.CELSIUS)
+        temperatures2 = TemperatureArray([0], TemperatureUnit.CELSIUS)
+        with self.assertRaises(ValueError):
+            _ = temperatures1 - temperatures2
+
+    def test_compare_temperature_array_to_temperature(self) -> None:
+        temperatures = TemperatureArray([0, 100, 200], TemperatureUnit.CELSIUS)
+        threshold = Temperature(122, TemperatureUnit.FAHRENHEIT)
+        self.assertEqual(bytearray([1, 0, 0]), temperatures < threshold)
+        self.assertEqual(bytearray([0, 1, 1]), temperatures > threshold)
+        self.assertEqual([1, 2], get_indices(temperatures >= threshold))
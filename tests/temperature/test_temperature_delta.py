@@ -21,6 +21,40 @@ class TemperatureDeltaTest(unittest.TestCase):
             with self.subTest(unit=unit, expected_value=expected_value):
                 self.assertAlmostEqual(expected_value, delta.as_unit(unit))
 
+    def test_get_temperature_delta_value_as_every_unit(self) -> None:
+        delta = TemperatureDelta(9, TemperatureUnit.FAHRENHEIT)
+
+        for unit, expected_value in [
+            (TemperatureUnit.CELSIUS, 5.0),
+            (TemperatureUnit.KELVIN, 5.0),
+            (TemperatureUnit.FAHRENHEIT, 9.0),
+        ]:
+            with self.subTest(unit=unit, expected_value=expected_value):
+                self.assertAlmostEqual(expected_value, delta.as_unit(unit))
+
+    def test_create_temperature_delta_with_invalid_unit_raises_value_error(
+        self,
+    ) -> None:
+        with self.assertRaises(ValueError):
+            _ = TemperatureDelta(1, 4)  # type: ignore[arg-type]
+
+    def test_get_temperature_delta_value_as_invalid_unit_raises_value_error(
+        self,
+    ) -> None:
+        delta = TemperatureDelta(1, TemperatureUnit.CELSIUS)
+        for unit in [-1, 0, 4, 5, 100]:
+            with self.subTest(unit=unit), self.assertRaises(ValueError):
+                delta.as_unit(unit)  # type: ignore[arg-type]
+
+    def test_same_temperature_deltas_in_different_units_are_equal(self) -> None:
+        fahrenheit_delta = TemperatureDelta(180, TemperatureUnit.FAHRENHEIT)
+        for unit in [TemperatureUnit.CELSIUS, TemperatureUnit.KELVIN]:
+            with self.subTest(unit=unit):
+                delta = TemperatureDelta(100, unit)
+                self.assertEqual(delta, fahrenheit_delta)
+                self.assertEqual(100, fahrenheit_delta.as_unit(unit))
+                self.assertEqual(180, delta.as_unit(TemperatureUnit.FAHRENHEIT))
+
     def test_add_temperature_deltas_produces_temperature_delta(self) -> None:
         delta1 = TemperatureDelta(1, TemperatureUnit.CELSIUS)
         delta2 = TemperatureDelta(2, TemperatureUnit.CELSIUS)
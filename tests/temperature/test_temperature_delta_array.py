@@ -0,0 +1,50 @@
+import unittest
+
+from src.units import TemperatureDelta, TemperatureDeltaArray, TemperatureUnit
+
+
+class TemperatureDeltaArrayTest(unittest.TestCase):
+    """Unit tests for temperature delta array class."""
+
+    def test_create_temperature_delta_array(self) -> None:
+        # Test passes if it simply doesn't throw an exception
+        _ = TemperatureDeltaArray([-300, 300], TemperatureUnit.CELSIUS)
+
+    def test_get_temperature_delta_array_values_as_unit(self) -> None:
+        deltas = TemperatureDeltaArray([1, -2], TemperatureUnit.CELSIUS)
+        values = deltas.as_unit(TemperatureUnit.FAHRENHEIT)
+        self.assertAlmostEqual(1.8, values[0])
+        self.assertAlmostEqual(-3.6, values[1])
+
+    def test_index_temperature_delta_array_produces_temperature_delta(self) -> None:
+        deltas = TemperatureDeltaArray([1, -2], TemperatureUnit.KELVIN)
+        delta = deltas[1]
+        self.assertIsInstance(delta, TemperatureDelta)
+        self.assertAlmostEqual(-2, delta.as_unit(TemperatureUnit.CELSIUS))
+
+    def test_add_temperature_delta_arrays(self) -> None:
+        deltas1 = TemperatureDeltaArray([1, 2], TemperatureUnit.KELVIN)
+        deltas2 = TemperatureDeltaArray([1.8, 3.6], TemperatureUnit.FAHRENHEIT)
+        values = (deltas1 + deltas2).as_unit(TemperatureUnit.KELVIN)
+        self.assertAlmostEqual(2, values[0])
+        self.assertAlmostEqual(4, values[1])
+
+    def test_subtract_temperature_delta_from_temperature_delta_array(self) -> None:
+        deltas = TemperatureDeltaArray([1, 2], TemperatureUnit.KELVIN)
+        values = (deltas - TemperatureDelta(1, TemperatureUnit.KELVIN)).as_unit(
+            TemperatureUnit.KELVIN
+        )
+        self.assertAlmostEqual(0, values[0])
+        self.assertAlmostEqual(1, values[1])
+
+    def test_scale_temperature_delta_array(self) -> None:
+        deltas = TemperatureDeltaArray([1, -2], TemperatureUnit.KELVIN)
+        values = (deltas * 2).as_unit(TemperatureUnit.KELVIN)
+        self.assertAlmostEqual(2, values[0])
+        self.assertAlmostEqual(-4, values[1])
+
+    def test_compare_temperature_delta_array_to_temperature_delta(self) -> None:
+        deltas = TemperatureDeltaArray([-1, 0, 1], TemperatureUnit.KELVIN)
+        threshold = TemperatureDelta(0, TemperatureUnit.CELSIUS)
+        self.assertEqual(bytearray([1, 0, 0]), deltas < threshold)
+        self.assertEqual(bytearray([0, 1, 1]), deltas >= threshold)
@@ -0,0 +1,60 @@
+# Generated by `tools/generate_units.py` from `tools/units_spec.json`, so edit the
+# spec & rerun the generator rather than editing this module.
+
+import unittest
+
+from src.units.units_inner.temperature import unit
+
+# The member, name, abbreviation & change in the quantity expressed as the unit per 1K
+# of each unit, and the unit at absolute zero
+_UNITS = [
+    (unit.Unit.CELSIUS, "celsius", "C", 1, -273.15),
+    (unit.Unit.KELVIN, "kelvin", "K", 1, 0),
+    (unit.Unit.FAHRENHEIT, "fahrenheit", "F", 9 / 5, -459.67),
+]
+
+
+class UnitTest(unittest.TestCase):
+    """Unit tests for the temperature unit tables."""
+
+    def assert_close(self, expected: float, actual: float) -> None:
+        self.assertAlmostEqual(expected, actual, delta=abs(expected) * 1e-9)
+
+    def test_get_name(self) -> None:
+        for member, name, *_ in _UNITS:
+            with self.subTest(unit=member):
+                self.assertEqual(name, unit.get_name(member))
+
+    def test_get_abbreviation(self) -> None:
+        for member, _, abbreviation, *_ in _UNITS:
+            with self.subTest(unit=member):
+                self.assertEqual(abbreviation, unit.get_abbreviation(member))
+
+    def test_invalid_unit_raises_value_error(self) -> None:
+        for invalid_unit in [0, len(_UNITS) + 1]:
+            with (
+                self.subTest(unit=invalid_unit),
+                self.assertRaises(ValueError),
+            ):
+                unit.get_name(invalid_unit)  # type: ignore[arg-type]
+
+    def test_conversion_parameters(self) -> None:
+        for from_member, _, _, from_gradient, from_offset in _UNITS:
+            for to_member, _, _, to_gradient, to_offset in _UNITS:
+                with self.subTest(from_unit=from_member, to_unit=to_member):
+                    index = from_member * unit.CONVERSION_PARAMETERS_STRIDE + to_member
+                    gradient = to_gradient / from_gradient
+                    self.assert_close(
+                        gradient,
+                        unit.CONVERSION_NUMERATORS[index]
+                        / unit.CONVERSION_DENOMINATORS[index],
+                    )
+                    self.assertAlmostEqual(
+                        to_offset - gradient * from_offset,
+                        unit.CONVERSION_OFFSETS[index]
+                        / unit.CONVERSION_DENOMINATORS[index],
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
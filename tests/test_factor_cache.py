@@ -0,0 +1,78 @@
+import unittest
+
+from src.units import AngleUnit, AngularVelocity, DistanceUnit, Jerk, TimeUnit
+from src.units.units_inner.factor_cache import FactorCache
+
+
+class FactorCacheTest(unittest.TestCase):
+    """Unit tests for the cache of the conversion factors of composite units."""
+
+    def setUp(self) -> None:
+        self.calculated: list[tuple[int, ...]] = []
+
+    def _calculate(self, units: tuple[int, ...]) -> float:
+        self.calculated.append(units)
+        if not units[0]:
+            raise ValueError
+        return float(sum(units))
+
+    def test_calculate_returns_calculated_factor(self) -> None:
+        cache = FactorCache(self._calculate)
+        self.assertEqual(3, cache.calculate((1, 2)))
+
+    def test_calculated_factor_is_cached(self) -> None:
+        cache = FactorCache(self._calculate)
+        cache.calculate((1, 2))
+        self.assertEqual(3, cache[1, 2])
+        self.assertEqual([(1, 2)], self.calculated)
+
+    def test_full_cache_evicts_factor(self) -> None:
+        cache = FactorCache(self._calculate, max_size=2)
+        for units in [(1,), (2,), (3,)]:
+            cache.calculate(units)
+        self.assertEqual(2, len(cache))
+        self.assertIn((3,), cache)
+
+    def test_failed_calculation_is_not_cached(self) -> None:
+        cache = FactorCache(self._calculate)
+        with self.assertRaises(ValueError):
+            cache.calculate((0, 1))
+        self.assertEqual(0, len(cache))
+
+    def test_create_cache_with_max_size_less_than_one_raises_value_error(
+        self,
+    ) -> None:
+        with self.assertRaises(ValueError):
+            FactorCache(self._calculate, max_size=0)
+
+    def test_quantity_converts_correctly_after_evictions(self) -> None:
+        jerk = Jerk(1, DistanceUnit.METRE, TimeUnit.SECOND)
+        for _ in range(3):
+            for time_unit, expected_value in [
+                (TimeUnit.MILLISECOND, 1e-9),
+                (TimeUnit.SECOND, 1),
+                (TimeUnit.MINUTE, 216_000),
+            ]:
+                for distance_unit, distance_factor in [
+                    (DistanceUnit.METRE, 1),
+                    (DistanceUnit.MILLIMETRE, 1000),
+                    (DistanceUnit.CENTIMETRE, 100),
+                    (DistanceUnit.FOOT, 1 / 0.3048),
+                    (DistanceUnit.INCH, 1 / 0.0254),
+                ]:
+                    with self.subTest(distance_unit=distance_unit, time_unit=time_unit):
+                        self.assertAlmostEqual(
+                            1,
+                            jerk.as_unit(distance_unit, time_unit)
+                            / (distance_factor * expected_value),
+                        )
+
+    def test_invalid_unit_raises_value_error_every_time(self) -> None:
+        velocity = AngularVelocity(1, AngleUnit.RADIAN, TimeUnit.SECOND)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                velocity.as_unit(0, TimeUnit.SECOND)  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import unittest
+
+from src.units import TimeDelta, TimeUnit
+from src.units.filters import (
+    ExponentialMovingAverage,
+    LowPass,
+    MovingAverage,
+    MovingMedian,
+)
+
+
+class MovingAverageTest(unittest.TestCase):
+    """Unit tests for the simple moving average."""
+
+    def test_average_of_window(self) -> None:
+        average = MovingAverage(3)
+        results = [average.update(value) for value in (3, 6, 9, 12, 0)]
+        self.assertEqual([3, 4.5, 6, 9, 7], results)
+        self.assertEqual(3, average.window)
+
+    def test_average_stays_accurate_over_many_laps(self) -> None:
+        average = MovingAverage(4)
+        for value in range(9_999):
+            average.update(value * 0.1 + 1e6)
+        self.assertAlmostEqual(999.75 + 1e6, average.update(999.9 + 1e6), places=6)
+
+    def test_reset(self) -> None:
+        average = MovingAverage(2)
+        average.update(10)
+        average.update(20)
+        average.reset()
+        self.assertEqual(4, average.update(4))
+
+    def test_invalid_window_raises_error(self) -> None:
+        with self.assertRaises(ValueError):
+            MovingAverage(0)
+
+
+class ExponentialMovingAverageTest(unittest.TestCase):
+    """Unit tests for the exponential moving average."""
+
+    def test_first_sample_is_initial_average(self) -> None:
+        average = ExponentialMovingAverage(0.5)
+        self.assertEqual(8, average.update(8))
+        self.assertEqual(6, average.update(4))
+        self.assertEqual(5, average.update(4))
+
+    def test_from_span(self) -> None:
+        self.assertAlmostEqual(
+            0.2, ExponentialMovingAverage.from_span(9).smoothing_factor
+        )
+        with self.assertRaises(ValueError):
+            ExponentialMovingAverage.from_span(0)
+
+    def test_invalid_smoothing_factor_raises_error(self) -> None:
+        for smoothing_factor in (0, -0.5, 1.5):
+            with (
+                self.subTest(smoothing_factor=smoothing_factor),
+                self.assertRaises(ValueError),
+            ):
+                ExponentialMovingAverage(smoothing_factor)
+
+    def test_reset(self) -> None:
+        average = ExponentialMovingAverage(0.5)
+        average.update(8)
+        average.reset()
+        self.assertEqual(2, average.update(2))
+
+
+class LowPassTest(unittest.TestCase):
+    """Unit tests for the first-order low-pass filter."""
+
+    def test_smoothing_factor(self) -> None:
+        low_pass = LowPass(
+            TimeDelta(90, TimeUnit.MILLISECOND), TimeDelta(10, TimeUnit.MILLISECOND)
+        )
+        self.assertAlmostEqual(0.1, low_pass.smoothing_factor)
+
+    def test_step_response(self) -> None:
+        low_pass = LowPass(TimeDelta(1, TimeUnit.SECOND), TimeDelta(1, TimeUnit.SECOND))
+        low_pass.update(0)
+        self.assertAlmostEqual(5, low_pass.update(10))
+        self.assertAlmostEqual(7.5, low_pass.update(10))
+
+    def test_zero_time_constant_passes_samples_through(self) -> None:
+        low_pass = LowPass(TimeDelta(0, TimeUnit.SECOND), TimeDelta(1, TimeUnit.SECOND))
+        low_pass.update(1)
+        self.assertEqual(7, low_pass.update(7))
+
+    def test_invalid_time_raises_error(self) -> None:
+        with self.assertRaises(ValueError):
+            LowPass(TimeDelta(-1, TimeUnit.SECOND), TimeDelta(1, TimeUnit.SECOND))
+        with self.assertRaises(ValueError):
+            LowPass(TimeDelta(1, TimeUnit.SECOND), TimeDelta(0, TimeUnit.SECOND))
+
+
+class MovingMedianTest(unittest.TestCase):
+    """Unit tests for the running median."""
+
+    def _median(self, values: "list[float]") -> float:
+        ordered = sorted(values)
+        middle = len(ordered) // 2
+        if len(ordered) % 2:
+            return ordered[middle]
+        return (ordered[middle - 1] + ordered[middle]) / 2
+
+    def test_median_of_window(self) -> None:
+        median = MovingMedian(3)
+        results = [median.update(value) for value in (5, 1, 9, 2, 2, 100)]
+        self.assertEqual([5, 3, 5, 2, 2, 2], results)
+        self.assertEqual(3, median.window)
+
+    def test_median_matches_sorting_the_window(self) -> None:
+        samples = [(index * 37) % 11 - (index % 3) * 0.5 for index in range(200)]
+        for window in (1, 2, 5, 8):
+            median = MovingMedian(window)
+            for index, sample in enumerate(samples):
+                expected = self._median(samples[max(0, index + 1 - window) : index + 1])
+                with self.subTest(window=window, index=index):
+                    self.assertEqual(expected, median.update(sample))
+
+    def test_rejects_outlier(self) -> None:
+        median = MovingMedian(5)
+        for value in (10, 11, 10, 1_000, 11):
+            result = median.update(value)
+        self.assertEqual(11, result)
+
+    def test_reset(self) -> None:
+        median = MovingMedian(3)
+        median.update(10)
+        median.update(20)
+        median.reset()
+        self.assertEqual(4, median.update(4))
+
+    def test_invalid_window_raises_error(self) -> None:
+        with self.assertRaises(ValueError):
+            MovingMedian(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
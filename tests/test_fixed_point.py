@@ -0,0 +1,79 @@
+import unittest
+
+from src.units.units_inner import fixed_point
+from src.units.units_inner.area import unit as area_unit
+from src.units.units_inner.current import unit as current_unit
+from src.units.units_inner.length import unit as length_unit
+from src.units.units_inner.mass import unit as mass_unit
+from src.units.units_inner.pressure import unit as pressure_unit
+from src.units.units_inner.time import unit as time_unit
+from src.units.units_inner.voltage import unit as voltage_unit
+from src.units.units_inner.volume import unit as volume_unit
+
+_RATIOS = [
+    (13, 1),
+    (1, 1_000),
+    (4_535_924, 10),
+    (28_349_523, 1_000),
+    (1_333_224, 10_000),
+]
+
+
+class FixedPointTest(unittest.TestCase):
+    """Unit tests for the fixed-point helpers."""
+
+    def test_to_count_rounds_to_nearest_halves_up(self) -> None:
+        for numerator, denominator in _RATIOS:
+            for value in [-1_001, -500, -499, -1, 0, 1, 499, 500, 1_001, 2_000]:
+                with self.subTest(
+                    value=value, numerator=numerator, denominator=denominator
+                ):
+                    self.assertEqual(
+                        (2 * value * numerator + denominator) // (2 * denominator),
+                        fixed_point.to_count(value, numerator, denominator),
+                    )
+
+    def test_from_count_rounds_to_nearest_halves_up(self) -> None:
+        for numerator, denominator in _RATIOS:
+            for count in [-1_000_001, -6_500, -1, 0, 1, 6_500, 987_654_321]:
+                with self.subTest(
+                    count=count, numerator=numerator, denominator=denominator
+                ):
+                    self.assertEqual(
+                        (2 * count * denominator + numerator) // (2 * numerator),
+                        fixed_point.from_count(count, numerator, denominator),
+                    )
+
+    def test_count_out_of_range_raises_overflow_error(self) -> None:
+        maximum_count = fixed_point.MAXIMUM_COUNT
+        self.assertEqual(maximum_count, fixed_point.check_count(maximum_count))
+        self.assertEqual(-maximum_count, fixed_point.check_count(-maximum_count))
+        for count in [maximum_count + 1, -maximum_count - 1]:
+            with self.subTest(count=count), self.assertRaises(OverflowError):
+                fixed_point.check_count(count)
+        with self.assertRaises(OverflowError):
+            fixed_point.to_count(1_074, 1_000_000, 1)
+
+    def test_ratios_of_every_unit_keep_conversions_within_small_ints(self) -> None:
+        maximum_count = fixed_point.MAXIMUM_COUNT
+        for unit_module, stride in [
+            (area_unit, area_unit.CONVERSION_FACTORS_STRIDE),
+            (current_unit, current_unit.CONVERSION_FACTORS_STRIDE),
+            (length_unit, length_unit.CONVERSION_FACTORS_STRIDE),
+            (mass_unit, mass_unit.CONVERSION_FACTORS_STRIDE),
+            (pressure_unit, pressure_unit.CONVERSION_FACTORS_STRIDE),
+            (time_unit, time_unit.CONVERSION_FACTORS_STRIDE),
+            (voltage_unit, voltage_unit.CONVERSION_FACTORS_STRIDE),
+            (volume_unit, volume_unit.CONVERSION_FACTORS_STRIDE),
+        ]:
+            for member in range(1, stride):
+                numerator, denominator = unit_module.get_fixed_point_ratio(member)  # type: ignore[arg-type]
+                with self.subTest(module=unit_module.__name__, unit=member):
+                    self.assertLessEqual(numerator, maximum_count)
+                    self.assertLessEqual(2 * denominator * denominator, maximum_count)
+                    if denominator > 1:
+                        self.assertLessEqual(10 * numerator, maximum_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
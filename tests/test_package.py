@@ -0,0 +1,49 @@
+import sys
+import unittest
+
+import src.units
+from src.units import units_inner
+
+
+class PackageTest(unittest.TestCase):
+    """Unit tests for the on-demand loading of the package contents."""
+
+    def test_all_public_names_are_accessible(self) -> None:
+        for name in src.units.__all__:
+            with self.subTest(name=name):
+                self.assertIsNotNone(getattr(src.units, name))
+
+    def test_public_name_is_same_object_as_in_module(self) -> None:
+        self.assertIs(src.units.Temperature, src.units.temperature.Temperature)
+        self.assertIs(src.units.DistanceUnit, src.units.length.Unit)
+
+    def test_public_modules_are_accessible(self) -> None:
+        for name in ["length", "mass", "temperature"]:
+            with self.subTest(name=name):
+                self.assertIs(
+                    getattr(src.units, name), sys.modules[f"src.units.{name}"]
+                )
+
+    def test_accessed_name_is_stored_in_package(self) -> None:
+        _ = src.units.Length
+        self.assertIn("Length", vars(src.units))
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        with self.assertRaises(AttributeError):
+            _ = src.units.Unknown  # type: ignore[attr-defined]
+
+    def test_internal_subpackages_are_accessible(self) -> None:
+        for name in units_inner.__all__:
+            with self.subTest(name=name):
+                self.assertIs(
+                    getattr(units_inner, name),
+                    sys.modules[f"src.units.units_inner.{name}"],
+                )
+
+    def test_unknown_internal_subpackage_raises_attribute_error(self) -> None:
+        with self.assertRaises(AttributeError):
+            _ = units_inner.unknown  # type: ignore[attr-defined]
+
+
+if __name__ == "__main__":
+    unittest.main()
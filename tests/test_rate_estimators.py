@@ -0,0 +1,157 @@
+import unittest
+
+from src.units.rate_estimators import (
+    CentralDifference,
+    FirstDifference,
+    LeastSquaresSlope,
+)
+
+# Samples of 3t^2, taken at uneven times
+_TIMES = [0.0, 0.5, 1.5, 2.0, 3.0, 4.5]
+_VALUES = [3 * time * time for time in _TIMES]
+
+
+class FirstDifferenceTest(unittest.TestCase):
+    """Unit tests for the first-difference rate estimator."""
+
+    def test_first_sample_has_no_rate(self) -> None:
+        estimator = FirstDifference()
+        self.assertIsNone(estimator.update(1, 5))
+
+    def test_rate_since_previous_sample(self) -> None:
+        estimator = FirstDifference()
+        estimator.update(1, 5)
+        self.assertEqual(3, estimator.update(3, 11))
+        self.assertEqual(-1, estimator.update(4, 10))
+
+    def test_time_not_advancing_raises_error(self) -> None:
+        estimator = FirstDifference()
+        estimator.update(1, 5)
+        with self.assertRaises(ValueError):
+            estimator.update(1, 6)
+        self.assertEqual(2, estimator.update(2, 7))
+
+    def test_estimate_matches_stream(self) -> None:
+        estimator = FirstDifference()
+        estimator.update(100, 0)
+        stream = FirstDifference()
+        expected = [
+            stream.update(time, _VALUES[index]) for index, time in enumerate(_TIMES)
+        ]
+        self.assertEqual(expected[1:], list(estimator.estimate(_TIMES, _VALUES)))
+        self.assertEqual(2, estimator.update(101, 2))
+
+    def test_estimate_different_lengths_raises_error(self) -> None:
+        with self.assertRaises(ValueError):
+            FirstDifference().estimate([0, 1], [0])
+
+    def test_reset(self) -> None:
+        estimator = FirstDifference()
+        estimator.update(1, 5)
+        estimator.reset()
+        self.assertIsNone(estimator.update(0, 0))
+
+
+class CentralDifferenceTest(unittest.TestCase):
+    """Unit tests for the central-difference rate estimator."""
+
+    def test_first_two_samples_have_no_rate(self) -> None:
+        estimator = CentralDifference()
+        self.assertIsNone(estimator.update(0, 0))
+        self.assertIsNone(estimator.update(1, 3))
+
+    def test_rate_across_previous_sample(self) -> None:
+        estimator = CentralDifference()
+        estimator.update(0, 0)
+        estimator.update(1, 3)
+        self.assertEqual(6, estimator.update(2, 12))
+        self.assertEqual(12, estimator.update(3, 27))
+
+    def test_exact_for_quadratic_with_even_spacing(self) -> None:
+        estimator = CentralDifference()
+        for time in range(5):
+            rate = estimator.update(time, 3 * time * time)
+            if rate is not None:
+                self.assertAlmostEqual(6 * (time - 1), rate)
+
+    def test_time_not_advancing_raises_error(self) -> None:
+        estimator = CentralDifference()
+        estimator.update(1, 5)
+        with self.assertRaises(ValueError):
+            estimator.update(0, 6)
+
+    def test_estimate_matches_stream(self) -> None:
+        stream = CentralDifference()
+        expected = [
+            stream.update(time, _VALUES[index]) for index, time in enumerate(_TIMES)
+        ]
+        rates = CentralDifference().estimate(_TIMES, _VALUES)
+        self.assertEqual(expected[2:], list(rates))
+        self.assertEqual([], list(CentralDifference().estimate([0], [0])))
+
+    def test_reset(self) -> None:
+        estimator = CentralDifference()
+        estimator.update(0, 0)
+        estimator.update(1, 0)
+        estimator.reset()
+        self.assertIsNone(estimator.update(0, 0))
+        self.assertIsNone(estimator.update(1, 0))
+
+
+class LeastSquaresSlopeTest(unittest.TestCase):
+    """Unit tests for the least-squares rate estimator."""
+
+    def test_slope_of_line(self) -> None:
+        estimator = LeastSquaresSlope(4)
+        self.assertIsNone(estimator.update(0, 1))
+        for time in (0.5, 2, 2.5, 4, 7):
+            rate = estimator.update(time, 2 * time + 1)
+            self.assertAlmostEqual(2, rate)  # type: ignore[arg-type]
+
+    def test_noise_is_averaged_out(self) -> None:
+        estimator = LeastSquaresSlope(4)
+        for time, value in ((0, 0), (1, 1.5), (2, 1.5), (3, 3)):
+            rate = estimator.update(time, value)
+        self.assertAlmostEqual(0.9, rate)  # type: ignore[arg-type]
+
+    def test_large_timestamps_stay_accurate(self) -> None:
+        estimator = LeastSquaresSlope(3)
+        start = 1e6
+        for offset in range(5):
+            rate = estimator.update(start + offset * 0.001, offset * 0.002)
+        self.assertAlmostEqual(2, rate, places=6)  # type: ignore[arg-type]
+
+    def test_only_window_is_fitted(self) -> None:
+        estimator = LeastSquaresSlope(2)
+        estimator.update(0, 0)
+        estimator.update(1, 10)
+        self.assertEqual(1, estimator.update(2, 11))
+        self.assertEqual(2, estimator.window)
+
+    def test_time_not_advancing_raises_error(self) -> None:
+        estimator = LeastSquaresSlope(3)
+        estimator.update(1, 5)
+        with self.assertRaises(ValueError):
+            estimator.update(0.5, 6)
+
+    def test_estimate_matches_stream(self) -> None:
+        stream = LeastSquaresSlope(3)
+        expected = [
+            stream.update(time, _VALUES[index]) for index, time in enumerate(_TIMES)
+        ]
+        rates = LeastSquaresSlope(3).estimate(_TIMES, _VALUES)
+        self.assertEqual(expected[1:], list(rates))
+
+    def test_invalid_window_raises_error(self) -> None:
+        with self.assertRaises(ValueError):
+            LeastSquaresSlope(1)
+
+    def test_reset(self) -> None:
+        estimator = LeastSquaresSlope(3)
+        estimator.update(1, 5)
+        estimator.reset()
+        self.assertIsNone(estimator.update(0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
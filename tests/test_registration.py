@@ -0,0 +1,64 @@
+import os
+import unittest
+
+import tests
+
+
+def _list_directory(path: str) -> list[str]:
+    # os.path is not available on MicroPython, so a plain file is told apart
+    # from a directory by failing to list it.
+    try:
+        return os.listdir(path)  # noqa: PTH208
+    except OSError:
+        return []
+
+
+def _get_test_module_names(directory: str) -> list[str]:
+    return [
+        name[:-3]
+        for name in sorted(_list_directory(directory))
+        if name.startswith("test_") and name.endswith(".py")
+    ]
+
+
+def _get_test_classes(module: object) -> list[type]:
+    classes: list[type] = []
+    for name in dir(module):
+        value = getattr(module, name)
+        if (
+            isinstance(value, type)
+            and issubclass(value, unittest.TestCase)
+            and value.__module__ == getattr(module, "__name__", None)
+        ):
+            classes.append(value)
+    return classes
+
+
+class RegistrationTest(unittest.TestCase):
+    """Unit tests for the registration of every test class with the test packages.
+
+    unittest.main("tests") on MicroPython only runs the test classes that the
+    tests package exports, so a test class missing from tests/__init__.py or
+    tests/<quantity>/__init__.py never runs on a board.
+    """
+
+    def test_every_test_class_is_exported_by_the_tests_package(self) -> None:
+        exported = [getattr(tests, name) for name in tests.__all__]
+        directory = tests.__file__.rsplit("/", 1)[0]
+        module_names = [f"tests.{name}" for name in _get_test_module_names(directory)]
+        for package in sorted(os.listdir(directory)):  # noqa: PTH208
+            package_directory = f"{directory}/{package}"
+            if "__init__.py" in _list_directory(package_directory):
+                module_names.extend(
+                    f"tests.{package}.{name}"
+                    for name in _get_test_module_names(package_directory)
+                )
+        for module_name in module_names:
+            module = __import__(module_name, None, None, ["__name__"])
+            for test_class in _get_test_classes(module):
+                with self.subTest(test_class=f"{module_name}.{test_class.__name__}"):
+                    self.assertIn(test_class, exported)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,256 @@
+import asyncio
+import contextlib
+import time
+import unittest
+
+from src.units import (
+    NegativePressureValueError,
+    Pressure,
+    PressureArray,
+    PressureUnit,
+    Temperature,
+    TemperatureUnit,
+)
+from src.units.sampler import QueueEmptyError, QueueFullError, SampleQueue, Sampler
+
+
+def _ticks_ms() -> int:
+    if hasattr(time, "ticks_ms"):
+        return time.ticks_ms()  # type: ignore[attr-defined]
+    return time.monotonic_ns() // 1_000_000
+
+
+class _FakeSensor:
+    """A sensor that returns each of its values in turn, counting its reads."""
+
+    def __init__(self, *values: float) -> None:
+        self.values = values
+        self.reads = 0
+
+    async def read(self) -> float:
+        value = self.values[self.reads % len(self.values)]
+        self.reads += 1
+        await asyncio.sleep(0)
+        return value
+
+
+class _FailingSensor:
+    """A sensor whose reads raise an error, counting its reads."""
+
+    def __init__(self) -> None:
+        self.reads = 0
+
+    async def read(self) -> float:
+        self.reads += 1
+        await asyncio.sleep(0)
+        raise OSError
+
+
+class SampleQueueTest(unittest.TestCase):
+    """Unit tests for the bounded sample queue."""
+
+    def test_samples_come_out_in_order(self) -> None:
+        queue = SampleQueue(2)
+        for sample in range(5):
+            queue.put_nowait(sample)
+            self.assertEqual(sample, queue.get_nowait())
+        queue.put_nowait(5)
+        queue.put_nowait(6)
+        self.assertTrue(queue.full())
+        self.assertEqual([5, 6], [queue.get_nowait(), queue.get_nowait()])
+        self.assertTrue(queue.empty())
+
+    def test_put_into_full_queue_raises_error(self) -> None:
+        queue = SampleQueue(1)
+        queue.put_nowait(1)
+        with self.assertRaises(QueueFullError):
+            queue.put_nowait(2)
+        self.assertEqual(1, len(queue))
+
+    def test_get_from_empty_queue_raises_error(self) -> None:
+        with self.assertRaises(QueueEmptyError):
+            SampleQueue(1).get_nowait()
+
+    def test_get_waits_for_sample(self) -> None:
+        async def main() -> object:
+            queue = SampleQueue(1)
+            task = asyncio.create_task(queue.get())
+            await asyncio.sleep(0)
+            await queue.put("sample")
+            return await task
+
+        self.assertEqual("sample", asyncio.run(main()))
+
+    def test_invalid_maxsize_raises_error(self) -> None:
+        with self.assertRaises(ValueError):
+            SampleQueue(0)
+
+
+class SamplerTest(unittest.TestCase):
+    """Unit tests for the sensor sampler."""
+
+    def test_due_sensors_are_read_together_as_quantities(self) -> None:
+        pressure_sensor = _FakeSensor(101.3)
+        temperature_sensor = _FakeSensor(21.5)
+        sampler = Sampler()
+        pressures = sampler.register(
+            pressure_sensor.read, Pressure, PressureUnit.KILOPASCAL, 100
+        ).subscribe()
+        temperatures = sampler.register(
+            temperature_sensor.read, Temperature, TemperatureUnit.CELSIUS, 100
+        ).subscribe()
+
+        self.assertEqual(2, asyncio.run(sampler.sample(_ticks_ms() + 1_000)))
+        pressure = pressures.get_nowait()
+        self.assertIsInstance(pressure, Pressure)
+        self.assertAlmostEqual(101.3, pressure.as_unit(PressureUnit.KILOPASCAL))
+        temperature = temperatures.get_nowait()
+        self.assertIsInstance(temperature, Temperature)
+        self.assertAlmostEqual(21.5, temperature.as_unit(TemperatureUnit.CELSIUS))
+
+    def test_sensor_is_only_read_when_due(self) -> None:
+        fast = _FakeSensor(1)
+        slow = _FakeSensor(2)
+        sampler = Sampler()
+        sampler.register(fast.read, Pressure, PressureUnit.PASCAL, 10)
+        sampler.register(slow.read, Pressure, PressureUnit.PASCAL, 20)
+
+        async def main() -> "list[int]":
+            now = _ticks_ms() + 1_000
+            return [await sampler.sample(now + offset) for offset in (0, 9, 10, 20)]
+
+        self.assertEqual([2, 0, 1, 2], asyncio.run(main()))
+        self.assertEqual(3, fast.reads)
+        self.assertEqual(2, slow.reads)
+
+    def test_every_subscriber_gets_each_sample(self) -> None:
+        sensor = _FakeSensor(1)
+        sampler = Sampler()
+        registered = sampler.register(sensor.read, Pressure, PressureUnit.PASCAL, 10)
+        queues = [registered.subscribe(), registered.subscribe()]
+        asyncio.run(sampler.sample(_ticks_ms() + 1_000))
+        for queue in queues:
+            self.assertEqual(1, len(queue))
+
+    def test_batch_is_converted_into_array(self) -> None:
+        sensor = _FakeSensor(1, 2, 3)
+        sampler = Sampler()
+        queue = sampler.register(
+            sensor.read, PressureArray, PressureUnit.KILOPASCAL, 10, batch_size=3
+        ).subscribe()
+
+        async def main() -> None:
+            now = _ticks_ms() + 1_000
+            for offset in (0, 10, 20, 30):
+                await sampler.sample(now + offset)
+
+        asyncio.run(main())
+        self.assertEqual(1, len(queue))
+        pressures = queue.get_nowait()
+        self.assertIsInstance(pressures, PressureArray)
+        self.assertEqual([1, 2, 3], list(pressures.as_unit(PressureUnit.KILOPASCAL)))
+
+    def test_full_queue_holds_up_sampler(self) -> None:
+        sensor = _FakeSensor(1, 2)
+        sampler = Sampler()
+        queue = sampler.register(
+            sensor.read, Pressure, PressureUnit.PASCAL, 10
+        ).subscribe(maxsize=1)
+
+        async def main() -> "list[float]":
+            now = _ticks_ms() + 1_000
+            await sampler.sample(now)
+            task = asyncio.create_task(sampler.sample(now + 10))
+            for _ in range(3):
+                await asyncio.sleep(0)
+            self.assertTrue(queue.full())
+            first = await queue.get()
+            await task
+            second = await queue.get()
+            return [
+                first.as_unit(PressureUnit.PASCAL),
+                second.as_unit(PressureUnit.PASCAL),
+            ]
+
+        self.assertEqual([1, 2], asyncio.run(main()))
+
+    def test_sensor_fallen_behind_is_rescheduled_from_now(self) -> None:
+        sensor = _FakeSensor(1)
+        sampler = Sampler()
+        sampler.register(sensor.read, Pressure, PressureUnit.PASCAL, 10)
+
+        async def main() -> "list[int]":
+            now = _ticks_ms() + 1_000
+            return [await sampler.sample(now + offset) for offset in (0, 9, 10)]
+
+        self.assertEqual([1, 0, 1], asyncio.run(main()))
+
+    def test_run_reads_sensors_periodically(self) -> None:
+        sensor = _FakeSensor(1)
+        sampler = Sampler()
+        queue = sampler.register(
+            sensor.read, Pressure, PressureUnit.PASCAL, 10
+        ).subscribe(maxsize=100)
+
+        async def main() -> None:
+            # Micropython has no builtin TimeoutError, only the one in asyncio
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(sampler.run(), 0.1)
+
+        asyncio.run(main())
+        self.assertGreaterEqual(len(queue), 3)
+        self.assertLessEqual(len(queue), 12)
+
+    def test_failing_sensor_does_not_stop_other_sensors(self) -> None:
+        failing_sensor = _FailingSensor()
+        negative_sensor = _FakeSensor(-1)
+        sensor = _FakeSensor(1, 2)
+        sampler = Sampler()
+        failing = sampler.register(
+            failing_sensor.read, Pressure, PressureUnit.PASCAL, 10
+        )
+        negative = sampler.register(
+            negative_sensor.read, Pressure, PressureUnit.PASCAL, 10
+        )
+        queues = [
+            failing.subscribe(),
+            negative.subscribe(),
+            sampler.register(
+                sensor.read, Pressure, PressureUnit.PASCAL, 10
+            ).subscribe(),
+        ]
+
+        async def main() -> "list[int]":
+            now = _ticks_ms() + 1_000
+            return [await sampler.sample(now + offset) for offset in (0, 5, 10)]
+
+        self.assertEqual([3, 0, 3], asyncio.run(main()))
+        self.assertEqual(2, failing_sensor.reads)
+        self.assertEqual(2, failing.error_count)
+        self.assertIsInstance(failing.last_error, OSError)
+        self.assertEqual(2, negative_sensor.reads)
+        self.assertEqual(2, negative.error_count)
+        self.assertIsInstance(negative.last_error, NegativePressureValueError)
+        self.assertEqual([0, 0, 2], [len(queue) for queue in queues])
+        self.assertEqual(
+            [1, 2],
+            [queues[2].get_nowait().as_unit(PressureUnit.PASCAL) for _ in range(2)],
+        )
+
+    def test_run_without_sensors_raises_error(self) -> None:
+        with self.assertRaises(ValueError):
+            asyncio.run(Sampler().run())
+
+    def test_invalid_registration_raises_error(self) -> None:
+        sampler = Sampler()
+        sensor = _FakeSensor(1)
+        with self.assertRaises(ValueError):
+            sampler.register(sensor.read, Pressure, PressureUnit.PASCAL, 0)
+        with self.assertRaises(ValueError):
+            sampler.register(
+                sensor.read, PressureArray, PressureUnit.PASCAL, 10, batch_size=0
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
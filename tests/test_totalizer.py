@@ -0,0 +1,62 @@
+import unittest
+
+from src.units.units_inner.totalizer import Totalizer
+
+
+class TotalizerTest(unittest.TestCase):
+    """Unit tests for the compensated totalizer."""
+
+    def test_add_rate_over_duration(self) -> None:
+        totalizer = Totalizer()
+        totalizer.add(2, 3)
+        totalizer.add(-1, 0.5)
+        self.assertEqual(5.5, totalizer.total)
+
+    def test_many_small_increments_do_not_drift(self) -> None:
+        totalizer = Totalizer()
+        for _ in range(10_000):
+            totalizer.add(0.1, 1)
+        self.assertEqual(1_000, totalizer.total)
+
+    def test_increment_smaller_than_rounding_of_total_is_kept(self) -> None:
+        totalizer = Totalizer()
+        totalizer.add(1e16, 1)
+        totalizer.add(1, 1)
+        totalizer.add(-1e16, 1)
+        self.assertEqual(1, totalizer.total)
+
+    def test_update_integrates_between_timestamps(self) -> None:
+        totalizer = Totalizer()
+        totalizer.update(2, 10)
+        self.assertEqual(0, totalizer.total)
+        totalizer.update(4, 12)
+        self.assertEqual(6, totalizer.total)
+        totalizer.update(4, 12)
+        self.assertEqual(6, totalizer.total)
+
+    def test_negative_duration_raises_error(self) -> None:
+        totalizer = Totalizer()
+        with self.assertRaises(ValueError):
+            totalizer.add(1, -1)
+        self.assertEqual(0, totalizer.total)
+
+    def test_time_going_backwards_raises_error(self) -> None:
+        totalizer = Totalizer()
+        totalizer.update(1, 10)
+        with self.assertRaises(ValueError):
+            totalizer.update(1, 9)
+        totalizer.update(1, 11)
+        self.assertEqual(1, totalizer.total)
+
+    def test_reset(self) -> None:
+        totalizer = Totalizer()
+        totalizer.update(1, 0)
+        totalizer.update(1, 1)
+        totalizer.reset()
+        self.assertEqual(0, totalizer.total)
+        totalizer.update(1, 5)
+        self.assertEqual(0, totalizer.total)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,26 @@
 """Package for unit tests of time classes."""
 
 from .test_constants import ZeroTest
+from .test_converter import ConvertIntoTest, MakeConverterTest
+from .test_fixed_point_time import FixedPointTimeDeltaTest, FixedPointTimeTest
+from .test_isr import TimeCellTest, TimeThresholdTest
 from .test_time import TimeTest
 from .test_time_and_time_delta import TimeAndTimeDeltaTest
+from .test_time_array import TimeArrayTest
 from .test_time_delta import TimeDeltaTest
+from .test_unit import UnitTest
 
 __all__ = [
-    "TimeTest",
-    "TimeDeltaTest",
+    "ConvertIntoTest",
+    "FixedPointTimeDeltaTest",
+    "FixedPointTimeTest",
+    "MakeConverterTest",
     "TimeAndTimeDeltaTest",
+    "TimeArrayTest",
+    "TimeCellTest",
+    "TimeDeltaTest",
+    "TimeTest",
+    "TimeThresholdTest",
+    "UnitTest",
     "ZeroTest",
 ]
@@ -0,0 +1,98 @@
+import unittest
+
+from src.units import NegativeTimeValueError, Time, TimeDelta, TimeUnit
+from src.units.time import FixedPointTime, FixedPointTimeDelta
+
+
+class FixedPointTimeTest(unittest.TestCase):
+    """Unit tests for the fixed-point time class."""
+
+    def test_get_fixed_point_time_value_as_unit(self) -> None:
+        time = FixedPointTime(90_000, TimeUnit.MILLISECOND)
+        for unit, expected_value in [
+            (TimeUnit.MILLISECOND, 90_000),
+            (TimeUnit.MINUTE, 2),
+        ]:
+            with self.subTest(unit=unit, expected_value=expected_value):
+                value = time.as_unit(unit)
+                self.assertIsInstance(value, int)
+                self.assertEqual(expected_value, value)
+
+    def test_fixed_point_time_holds_days_in_milliseconds(self) -> None:
+        time = FixedPointTime(24 * 12, TimeUnit.HOUR)
+        self.assertEqual(24 * 12 * 3_600_000, time.as_unit(TimeUnit.MILLISECOND))
+        self.assertEqual(
+            1, FixedPointTime(1_499, TimeUnit.MICROSECOND).as_unit(TimeUnit.MILLISECOND)
+        )
+        with self.assertRaises(OverflowError):
+            _ = FixedPointTime(24 * 13, TimeUnit.HOUR)
+
+    def test_create_negative_fixed_point_time_raises_error(self) -> None:
+        with self.assertRaises(NegativeTimeValueError):
+            _ = FixedPointTime(-1, TimeUnit.MILLISECOND)
+
+    def test_fixed_point_time_matches_floating_point_time(self) -> None:
+        time = FixedPointTime(90_000, TimeUnit.MILLISECOND).to_time()
+        self.assertIsInstance(time, Time)
+        self.assertAlmostEqual(90_000, time.as_unit(TimeUnit.MILLISECOND))
+
+    def test_add_fixed_point_time_delta_produces_fixed_point_time(self) -> None:
+        time = FixedPointTime(1, TimeUnit.SECOND)
+        delta = FixedPointTimeDelta(1, TimeUnit.MILLISECOND)
+        for new_time in (time + delta, delta + time):
+            with self.subTest(new_time=new_time):
+                self.assertIsInstance(new_time, FixedPointTime)
+                self.assertEqual(1_001, new_time.as_unit(TimeUnit.MILLISECOND))
+
+    def test_subtract_fixed_point_times_produces_fixed_point_time_delta(self) -> None:
+        time1 = FixedPointTime(1, TimeUnit.MILLISECOND)
+        time2 = FixedPointTime(3, TimeUnit.MILLISECOND)
+        delta = time1 - time2
+        self.assertIsInstance(delta, FixedPointTimeDelta)
+        self.assertEqual(-2, delta.as_unit(TimeUnit.MILLISECOND))
+
+    def test_subtract_fixed_point_time_delta_below_zero_raises_error(self) -> None:
+        time = FixedPointTime(1, TimeUnit.MILLISECOND)
+        with self.assertRaises(NegativeTimeValueError):
+            _ = time - FixedPointTimeDelta(2, TimeUnit.MILLISECOND)
+
+    def test_compare_fixed_point_times(self) -> None:
+        time1 = FixedPointTime(1, TimeUnit.SECOND)
+        time2 = FixedPointTime(1_000, TimeUnit.MILLISECOND)
+        time3 = FixedPointTime(1_001, TimeUnit.MILLISECOND)
+        self.assertEqual(time1, time2)
+        self.assertEqual(hash(time1), hash(time2))
+        self.assertLess(time1, time3)
+        self.assertLessEqual(time1, time2)
+        self.assertGreater(time3, time1)
+        self.assertGreaterEqual(time1, time2)
+
+
+class FixedPointTimeDeltaTest(unittest.TestCase):
+    """Unit tests for the fixed-point time delta class."""
+
+    def test_fixed_point_time_delta_matches_floating_point_time_delta(self) -> None:
+        delta = FixedPointTimeDelta(-90_000, TimeUnit.MILLISECOND).to_time_delta()
+        self.assertIsInstance(delta, TimeDelta)
+        self.assertAlmostEqual(-90_000, delta.as_unit(TimeUnit.MILLISECOND))
+
+    def test_scale_fixed_point_time_delta(self) -> None:
+        delta = FixedPointTimeDelta(3, TimeUnit.MILLISECOND)
+        self.assertEqual(6, (delta * 2).as_unit(TimeUnit.MILLISECOND))
+        self.assertEqual(6, (2 * delta).as_unit(TimeUnit.MILLISECOND))
+        self.assertEqual(-3, (-delta).as_unit(TimeUnit.MILLISECOND))
+        self.assertEqual(3, abs(-delta).as_unit(TimeUnit.MILLISECOND))
+
+    def test_floor_divide_fixed_point_time_delta(self) -> None:
+        delta = FixedPointTimeDelta(7, TimeUnit.MILLISECOND)
+        self.assertEqual(3, delta // FixedPointTimeDelta(2, TimeUnit.MILLISECOND))
+        self.assertEqual(
+            FixedPointTimeDelta(3_500, TimeUnit.MILLISECOND),
+            FixedPointTimeDelta(7, TimeUnit.SECOND) // 2,
+        )
+
+    def test_add_and_subtract_fixed_point_time_deltas(self) -> None:
+        delta1 = FixedPointTimeDelta(1, TimeUnit.SECOND)
+        delta2 = FixedPointTimeDelta(1, TimeUnit.MILLISECOND)
+        self.assertEqual(1_001, (delta1 + delta2).as_unit(TimeUnit.MILLISECOND))
+        self.assertEqual(999, (delta1 - delta2).as_unit(TimeUnit.MILLISECOND))
@@ -0,0 +1,70 @@
+# pyright: reportUnknownMemberType=false
+
+import unittest
+
+from src.units import NegativeTimeValueError, Time, TimeUnit
+from src.units.time import TimeCell, TimeThreshold
+
+try:
+    import micropython  # type: ignore[import-not-found]
+except ImportError:
+    micropython = None
+
+
+class TimeCellTest(unittest.TestCase):
+    """Unit tests for the time cell class."""
+
+    def test_get_produces_time(self) -> None:
+        cell = TimeCell(TimeUnit.MILLISECOND)
+        cell.set(12.5)
+        time = cell.get()
+        self.assertIsInstance(time, Time)
+        self.assertAlmostEqual(12.5, time.as_unit(TimeUnit.MILLISECOND))
+
+    def test_get_initial_value(self) -> None:
+        cell = TimeCell(TimeUnit.MILLISECOND, 12.5)
+        self.assertAlmostEqual(12.5, cell.get().as_unit(TimeUnit.MILLISECOND))
+
+    def test_get_invalid_value_raises_error(self) -> None:
+        cell = TimeCell(TimeUnit.MILLISECOND)
+        cell.set(-1)
+        with self.assertRaises(NegativeTimeValueError):
+            cell.get()
+
+    def test_set_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        cell = TimeCell(TimeUnit.MILLISECOND)
+        value = 12.5
+        micropython.heap_lock()
+        try:
+            cell.set(value)
+            cell.set(900)
+        finally:
+            micropython.heap_unlock()
+
+
+class TimeThresholdTest(unittest.TestCase):
+    """Unit tests for the time threshold class."""
+
+    def test_compare_raw_values_with_threshold(self) -> None:
+        threshold = TimeThreshold(Time(1, TimeUnit.SECOND), TimeUnit.MILLISECOND)
+        self.assertTrue(threshold.is_below(900))
+        self.assertFalse(threshold.is_above(900))
+        self.assertTrue(threshold.is_above(1100))
+        self.assertFalse(threshold.is_below(1100))
+
+    def test_compare_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        threshold = TimeThreshold(Time(1, TimeUnit.SECOND), TimeUnit.MILLISECOND)
+        micropython.heap_lock()
+        try:
+            is_below = threshold.is_below(900)
+            is_above = threshold.is_above(900)
+        finally:
+            micropython.heap_unlock()
+        self.assertTrue(is_below)
+        self.assertFalse(is_above)
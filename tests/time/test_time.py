@@ -88,3 +88,20 @@ class TimeTest(unittest.TestCase):
                 self.assertEqual(is_less_than_or_equal_to, time1 <= time2)
                 self.assertEqual(is_greater_than, time1 > time2)
                 self.assertEqual(is_greater_than_or_equal_to, time1 >= time2)
+
+    def test_get_time_value_as_unit_from_non_si_unit(self) -> None:
+        time = Time(90, TimeUnit.MINUTE)
+
+        for unit, expected_value in [
+            (TimeUnit.MINUTE, 90),
+            (TimeUnit.HOUR, 1.5),
+            (TimeUnit.MILLISECOND, 5_400_000),
+        ]:
+            with self.subTest(unit=unit, expected_value=expected_value):
+                self.assertAlmostEqual(expected_value, time.as_unit(unit))
+
+    def test_get_time_value_as_invalid_unit_raises_value_error(self) -> None:
+        time = Time(1, TimeUnit.SECOND)
+        for invalid_unit in [-1, 0, 6, 7, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                time.as_unit(invalid_unit)  # type: ignore[arg-type]
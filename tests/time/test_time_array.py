@@ -0,0 +1,65 @@
+import unittest
+
+from src.units import (
+    NegativeTimeValueError,
+    Time,
+    TimeArray,
+    TimeDelta,
+    TimeDeltaArray,
+    TimeUnit,
+)
+
+
+class TimeArrayTest(unittest.TestCase):
+    """Unit tests for time array and time delta array classes."""
+
+    def test_get_time_array_values_as_unit(self) -> None:
+        times = TimeArray([1, 2], TimeUnit.SECOND)
+        values = times.as_unit(TimeUnit.MINUTE)
+        self.assertAlmostEqual(1 / 60, values[0])
+        self.assertAlmostEqual(2 / 60, values[1])
+
+    def test_create_negative_time_array_raises_error(self) -> None:
+        with self.assertRaises(NegativeTimeValueError):
+            _ = TimeArray([1, -1], TimeUnit.SECOND)
+
+    def test_index_time_array_produces_time(self) -> None:
+        times = TimeArray([1, 2], TimeUnit.MINUTE)
+        time = times[1]
+        self.assertIsInstance(time, Time)
+        self.assertAlmostEqual(2, time.as_unit(TimeUnit.MINUTE))
+
+    def test_add_time_delta_array_to_time_array(self) -> None:
+        times = TimeArray([1, 2], TimeUnit.SECOND)
+        deltas = TimeDeltaArray([1, -1], TimeUnit.SECOND)
+        values = (times + deltas).as_unit(TimeUnit.SECOND)
+        self.assertAlmostEqual(2, values[0])
+        self.assertAlmostEqual(1, values[1])
+
+    def test_subtract_time_delta_from_time_array_below_zero_raises_error(
+        self,
+    ) -> None:
+        times = TimeArray([1, 2], TimeUnit.SECOND)
+        with self.assertRaises(NegativeTimeValueError):
+            _ = times - TimeDelta(1.5, TimeUnit.SECOND)
+
+    def test_subtract_time_arrays_produces_time_delta_array(self) -> None:
+        times1 = TimeArray([1, 2], TimeUnit.SECOND)
+        times2 = TimeArray([2, 1], TimeUnit.SECOND)
+        deltas = times1 - times2
+        self.assertIsInstance(deltas, TimeDeltaArray)
+        values = deltas.as_unit(TimeUnit.SECOND)
+        self.assertAlmostEqual(-1, values[0])
+        self.assertAlmostEqual(1, values[1])
+
+    def test_scale_time_delta_array(self) -> None:
+        deltas = TimeDeltaArray([1, -2], TimeUnit.SECOND)
+        values = (deltas * 2).as_unit(TimeUnit.SECOND)
+        self.assertAlmostEqual(2, values[0])
+        self.assertAlmostEqual(-4, values[1])
+
+    def test_compare_time_array_to_time(self) -> None:
+        times = TimeArray([1, 2, 3], TimeUnit.SECOND)
+        threshold = Time(2, TimeUnit.SECOND)
+        self.assertEqual(bytearray([1, 0, 0]), times < threshold)
+        self.assertEqual(bytearray([0, 1, 1]), times >= threshold)
@@ -47,6 +47,15 @@ class TimeDeltaTest(unittest.TestCase):
         new_delta = delta / 2
         self.assertAlmostEqual(1, new_delta.as_unit(TimeUnit.SECOND))
 
+    def test_multiply_or_divide_time_delta_by_non_number_raises_type_error(
+        self,
+    ) -> None:
+        delta = TimeDelta(2, TimeUnit.SECOND)
+        with self.assertRaises(TypeError):
+            _ = delta * "2"  # type: ignore[operator]
+        with self.assertRaises(TypeError):
+            _ = delta / "2"  # type: ignore[operator]
+
     def test_divide_time_delta_by_time_delta_produces_ratio(self) -> None:
         delta1 = TimeDelta(2, TimeUnit.SECOND)
         delta2 = TimeDelta(1, TimeUnit.SECOND)
@@ -149,3 +158,9 @@ class TimeDeltaTest(unittest.TestCase):
                     is_greater_than_or_equal_to,
                     time_delta1 >= time_delta2,
                 )
+
+    def test_get_time_delta_value_as_invalid_unit_raises_value_error(self) -> None:
+        time_delta = TimeDelta(1, TimeUnit.SECOND)
+        for invalid_unit in [-1, 0, 6, 7, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                time_delta.as_unit(invalid_unit)  # type: ignore[arg-type]
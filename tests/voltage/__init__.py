@@ -1,7 +1,23 @@
 """Package for unit tests of voltage classes."""
 
+from .test_converter import ConvertIntoTest, MakeConverterTest
+from .test_filter import VoltageFilterTest
+from .test_fixed_point_voltage import FixedPointVoltageTest
+from .test_isr import VoltageCellTest, VoltageThresholdTest
+from .test_series import VoltageSeriesTest
+from .test_unit import UnitTest
 from .test_voltage import VoltageTest
+from .test_voltage_array import VoltageArrayTest
 
 __all__ = [
+    "ConvertIntoTest",
+    "FixedPointVoltageTest",
+    "MakeConverterTest",
+    "UnitTest",
+    "VoltageArrayTest",
+    "VoltageCellTest",
+    "VoltageFilterTest",
+    "VoltageSeriesTest",
     "VoltageTest",
+    "VoltageThresholdTest",
 ]
@@ -0,0 +1,34 @@
+import unittest
+
+from src.units import Voltage, VoltageUnit
+from src.units.filters import MovingAverage, MovingMedian
+from src.units.voltage import VoltageFilter
+
+
+class VoltageFilterTest(unittest.TestCase):
+    """Unit tests for the voltage filter class."""
+
+    def test_update_returns_filtered_voltage_in_unit_of_filter(self) -> None:
+        voltage_filter = VoltageFilter(MovingAverage(2), VoltageUnit.MILLIVOLT)
+        voltage_filter.update(Voltage(1, VoltageUnit.VOLT))
+        filtered = voltage_filter.update(Voltage(0, VoltageUnit.MILLIVOLT))
+        self.assertIsInstance(filtered, Voltage)
+        self.assertAlmostEqual(500, filtered.as_unit(VoltageUnit.MILLIVOLT))
+        self.assertAlmostEqual(0.5, filtered.as_unit(VoltageUnit.VOLT))
+
+    def test_update_value(self) -> None:
+        voltage_filter = VoltageFilter(MovingMedian(3), VoltageUnit.MILLIVOLT)
+        for value in (100, 101, 900):
+            filtered = voltage_filter.update_value(value)
+        self.assertAlmostEqual(101, filtered.as_unit(VoltageUnit.MILLIVOLT))
+
+    def test_reset(self) -> None:
+        voltage_filter = VoltageFilter(MovingAverage(2), VoltageUnit.MILLIVOLT)
+        voltage_filter.update_value(10)
+        voltage_filter.reset()
+        filtered = voltage_filter.update_value(4)
+        self.assertAlmostEqual(4, filtered.as_unit(VoltageUnit.MILLIVOLT))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from src.units import Voltage, VoltageUnit
+from src.units.voltage import FixedPointVoltage
+
+
+class FixedPointVoltageTest(unittest.TestCase):
+    """Unit tests for the fixed-point voltage class."""
+
+    def test_get_fixed_point_voltage_value_as_unit(self) -> None:
+        voltage = FixedPointVoltage(1_500, VoltageUnit.MILLIVOLT)
+        for unit, expected_value in [
+            (VoltageUnit.MILLIVOLT, 1_500),
+            (VoltageUnit.VOLT, 2),
+            (VoltageUnit.MICROVOLT, 1_500_000),
+        ]:
+            with self.subTest(unit=unit, expected_value=expected_value):
+                value = voltage.as_unit(unit)
+                self.assertIsInstance(value, int)
+                self.assertEqual(expected_value, value)
+
+    def test_fixed_point_voltage_matches_floating_point_voltage(self) -> None:
+        voltage = FixedPointVoltage(-1_500, VoltageUnit.MILLIVOLT).to_voltage()
+        self.assertIsInstance(voltage, Voltage)
+        self.assertAlmostEqual(-1_500, voltage.as_unit(VoltageUnit.MILLIVOLT))
+
+    def test_add_and_subtract_fixed_point_voltages(self) -> None:
+        voltage1 = FixedPointVoltage(1, VoltageUnit.VOLT)
+        voltage2 = FixedPointVoltage(1, VoltageUnit.MILLIVOLT)
+        self.assertEqual(1_001, (voltage1 + voltage2).as_unit(VoltageUnit.MILLIVOLT))
+        self.assertEqual(999, (voltage1 - voltage2).as_unit(VoltageUnit.MILLIVOLT))
+
+    def test_scale_fixed_point_voltage(self) -> None:
+        voltage = FixedPointVoltage(3, VoltageUnit.MILLIVOLT)
+        self.assertEqual(6, (voltage * 2).as_unit(VoltageUnit.MILLIVOLT))
+        self.assertEqual(6, (2 * voltage).as_unit(VoltageUnit.MILLIVOLT))
+        self.assertEqual(-3, (-voltage).as_unit(VoltageUnit.MILLIVOLT))
+        self.assertEqual(3, abs(-voltage).as_unit(VoltageUnit.MILLIVOLT))
+        self.assertEqual(
+            FixedPointVoltage(2, VoltageUnit.MILLIVOLT),
+            FixedPointVoltage(4, VoltageUnit.MILLIVOLT) // 2,
+        )
+        self.assertEqual(3, voltage // FixedPointVoltage(1, VoltageUnit.MILLIVOLT))
+
+    def test_compare_fixed_point_voltages(self) -> None:
+        voltage1 = FixedPointVoltage(1, VoltageUnit.VOLT)
+        voltage2 = FixedPointVoltage(1_000, VoltageUnit.MILLIVOLT)
+        voltage3 = FixedPointVoltage(-1, VoltageUnit.MILLIVOLT)
+        self.assertEqual(voltage1, voltage2)
+        self.assertEqual(hash(voltage1), hash(voltage2))
+        self.assertLess(voltage3, voltage1)
+        self.assertGreater(voltage1, voltage3)
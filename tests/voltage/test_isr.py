@@ -0,0 +1,68 @@
+# pyright: reportUnknownMemberType=false
+
+import unittest
+
+from src.units import Voltage, VoltageUnit
+from src.units.voltage import VoltageCell, VoltageThreshold
+
+try:
+    import micropython  # type: ignore[import-not-found]
+except ImportError:
+    micropython = None
+
+
+class VoltageCellTest(unittest.TestCase):
+    """Unit tests for the voltage cell class."""
+
+    def test_get_produces_voltage(self) -> None:
+        cell = VoltageCell(VoltageUnit.MILLIVOLT)
+        cell.set(12.5)
+        voltage = cell.get()
+        self.assertIsInstance(voltage, Voltage)
+        self.assertAlmostEqual(12.5, voltage.as_unit(VoltageUnit.MILLIVOLT))
+
+    def test_get_initial_value(self) -> None:
+        cell = VoltageCell(VoltageUnit.MILLIVOLT, 12.5)
+        self.assertAlmostEqual(12.5, cell.get().as_unit(VoltageUnit.MILLIVOLT))
+
+    def test_set_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        cell = VoltageCell(VoltageUnit.MILLIVOLT)
+        value = 12.5
+        micropython.heap_lock()
+        try:
+            cell.set(value)
+            cell.set(900)
+        finally:
+            micropython.heap_unlock()
+
+
+class VoltageThresholdTest(unittest.TestCase):
+    """Unit tests for the voltage threshold class."""
+
+    def test_compare_raw_values_with_threshold(self) -> None:
+        threshold = VoltageThreshold(
+            Voltage(1, VoltageUnit.VOLT), VoltageUnit.MILLIVOLT
+        )
+        self.assertTrue(threshold.is_below(900))
+        self.assertFalse(threshold.is_above(900))
+        self.assertTrue(threshold.is_above(1100))
+        self.assertFalse(threshold.is_below(1100))
+
+    def test_compare_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        threshold = VoltageThreshold(
+            Voltage(1, VoltageUnit.VOLT), VoltageUnit.MILLIVOLT
+        )
+        micropython.heap_lock()
+        try:
+            is_below = threshold.is_below(900)
+            is_above = threshold.is_above(900)
+        finally:
+            micropython.heap_unlock()
+        self.assertTrue(is_below)
+        self.assertFalse(is_above)
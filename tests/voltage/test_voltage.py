@@ -147,3 +147,9 @@ class VoltageTest(unittest.TestCase):
                     is_greater_than_or_equal_to,
                     voltage1 >= voltage2,
                 )
+
+    def test_get_voltage_value_as_invalid_unit_raises_value_error(self) -> None:
+        voltage = Voltage(1, VoltageUnit.VOLT)
+        for invalid_unit in [-1, 0, 4, 5, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                voltage.as_unit(invalid_unit)  # type: ignore[arg-type]
@@ -0,0 +1,49 @@
+import unittest
+
+from src.units import Voltage, VoltageArray, VoltageUnit
+
+
+class VoltageArrayTest(unittest.TestCase):
+    """Unit tests for voltage array class."""
+
+    def test_get_voltage_array_values_as_unit(self) -> None:
+        voltages = VoltageArray([1, -2], VoltageUnit.VOLT)
+        values = voltages.as_unit(VoltageUnit.MILLIVOLT)
+        self.assertAlmostEqual(1_000, values[0])
+        self.assertAlmostEqual(-2_000, values[1])
+
+    def test_index_voltage_array_produces_voltage(self) -> None:
+        voltages = VoltageArray([1, -2], VoltageUnit.MILLIVOLT)
+        voltage = voltages[1]
+        self.assertIsInstance(voltage, Voltage)
+        self.assertAlmostEqual(-2, voltage.as_unit(VoltageUnit.MILLIVOLT))
+
+    def test_add_voltage_to_voltage_array(self) -> None:
+        voltages = VoltageArray([1, -2], VoltageUnit.VOLT)
+        for new_voltages in (
+            voltages + Voltage(1, VoltageUnit.VOLT),
+            Voltage(1, VoltageUnit.VOLT) + voltages,
+        ):
+            with self.subTest(new_voltages=new_voltages):
+                values = new_voltages.as_unit(VoltageUnit.VOLT)
+                self.assertAlmostEqual(2, values[0])
+                self.assertAlmostEqual(-1, values[1])
+
+    def test_subtract_voltage_arrays(self) -> None:
+        voltages1 = VoltageArray([1, -2], VoltageUnit.VOLT)
+        voltages2 = VoltageArray([1, 1], VoltageUnit.VOLT)
+        values = (voltages1 - voltages2).as_unit(VoltageUnit.VOLT)
+        self.assertAlmostEqual(0, values[0])
+        self.assertAlmostEqual(-3, values[1])
+
+    def test_scale_voltage_array(self) -> None:
+        voltages = VoltageArray([1, -2], VoltageUnit.VOLT)
+        values = (-voltages / 2).as_unit(VoltageUnit.VOLT)
+        self.assertAlmostEqual(-0.5, values[0])
+        self.assertAlmostEqual(1, values[1])
+
+    def test_compare_voltage_array_to_voltage(self) -> None:
+        voltages = VoltageArray([1, -2, 3], VoltageUnit.VOLT)
+        threshold = Voltage(0, VoltageUnit.VOLT)
+        self.assertEqual(bytearray([0, 1, 0]), voltages < threshold)
+        self.assertEqual(bytearray([1, 0, 1]), voltages > threshold)
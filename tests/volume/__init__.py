@@ -1,13 +1,30 @@
 """Package for unit tests of volume classes."""
 
 from .test_constants import ZeroTest
+from .test_converter import ConvertIntoTest, MakeConverterTest
+from .test_filter import VolumeFilterTest
+from .test_fixed_point_volume import FixedPointVolumeDeltaTest, FixedPointVolumeTest
+from .test_isr import VolumeCellTest, VolumeThresholdTest
+from .test_series import VolumeSeriesTest
+from .test_unit import UnitTest
 from .test_volume import VolumeTest
 from .test_volume_and_volume_delta import VolumeAndVolumeDeltaTest
+from .test_volume_array import VolumeArrayTest
 from .test_volume_delta import VolumeDeltaTest
 
 __all__ = [
-    "VolumeTest",
-    "VolumeDeltaTest",
+    "ConvertIntoTest",
+    "FixedPointVolumeDeltaTest",
+    "FixedPointVolumeTest",
+    "MakeConverterTest",
+    "UnitTest",
     "VolumeAndVolumeDeltaTest",
+    "VolumeArrayTest",
+    "VolumeCellTest",
+    "VolumeDeltaTest",
+    "VolumeFilterTest",
+    "VolumeSeriesTest",
+    "VolumeTest",
+    "VolumeThresholdTest",
     "ZeroTest",
 ]
@@ -0,0 +1,39 @@
+import unittest
+
+from src.units import NegativeVolumeValueError, Volume, VolumeUnit
+from src.units.filters import MovingAverage, MovingMedian
+from src.units.volume import VolumeFilter
+
+
+class VolumeFilterTest(unittest.TestCase):
+    """Unit tests for the volume filter class."""
+
+    def test_update_returns_filtered_volume_in_unit_of_filter(self) -> None:
+        volume_filter = VolumeFilter(MovingAverage(2), VolumeUnit.MILLILITRE)
+        volume_filter.update(Volume(1, VolumeUnit.LITRE))
+        filtered = volume_filter.update(Volume(0, VolumeUnit.MILLILITRE))
+        self.assertIsInstance(filtered, Volume)
+        self.assertAlmostEqual(500, filtered.as_unit(VolumeUnit.MILLILITRE))
+        self.assertAlmostEqual(0.5, filtered.as_unit(VolumeUnit.LITRE))
+
+    def test_update_value(self) -> None:
+        volume_filter = VolumeFilter(MovingMedian(3), VolumeUnit.MILLILITRE)
+        for value in (100, 101, 900):
+            filtered = volume_filter.update_value(value)
+        self.assertAlmostEqual(101, filtered.as_unit(VolumeUnit.MILLILITRE))
+
+    def test_update_invalid_value_raises_error(self) -> None:
+        volume_filter = VolumeFilter(MovingAverage(2), VolumeUnit.MILLILITRE)
+        with self.assertRaises(NegativeVolumeValueError):
+            volume_filter.update_value(-1)
+
+    def test_reset(self) -> None:
+        volume_filter = VolumeFilter(MovingAverage(2), VolumeUnit.MILLILITRE)
+        volume_filter.update_value(10)
+        volume_filter.reset()
+        filtered = volume_filter.update_value(4)
+        self.assertAlmostEqual(4, filtered.as_unit(VolumeUnit.MILLILITRE))
+
+
+if __name__ == "__main__":
+    unittest.main()
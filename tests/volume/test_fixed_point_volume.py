@@ -0,0 +1,91 @@
+import unittest
+
+from src.units import NegativeVolumeValueError, Volume, VolumeDelta, VolumeUnit
+from src.units.volume import FixedPointVolume, FixedPointVolumeDelta
+
+
+class FixedPointVolumeTest(unittest.TestCase):
+    """Unit tests for the fixed-point volume class."""
+
+    def test_get_fixed_point_volume_value_as_unit(self) -> None:
+        volume = FixedPointVolume(2_500, VolumeUnit.MILLILITRE)
+        for unit, expected_value in [
+            (VolumeUnit.MILLILITRE, 2_500),
+            (VolumeUnit.LITRE, 3),
+        ]:
+            with self.subTest(unit=unit, expected_value=expected_value):
+                value = volume.as_unit(unit)
+                self.assertIsInstance(value, int)
+                self.assertEqual(expected_value, value)
+
+    def test_create_negative_fixed_point_volume_raises_error(self) -> None:
+        with self.assertRaises(NegativeVolumeValueError):
+            _ = FixedPointVolume(-1, VolumeUnit.MILLILITRE)
+
+    def test_fixed_point_volume_matches_floating_point_volume(self) -> None:
+        volume = FixedPointVolume(2_500, VolumeUnit.MILLILITRE).to_volume()
+        self.assertIsInstance(volume, Volume)
+        self.assertAlmostEqual(2_500, volume.as_unit(VolumeUnit.MILLILITRE))
+
+    def test_add_fixed_point_volume_delta_produces_fixed_point_volume(self) -> None:
+        volume = FixedPointVolume(1, VolumeUnit.CUBIC_METRE)
+        delta = FixedPointVolumeDelta(1, VolumeUnit.MILLILITRE)
+        for new_volume in (volume + delta, delta + volume):
+            with self.subTest(new_volume=new_volume):
+                self.assertIsInstance(new_volume, FixedPointVolume)
+                self.assertEqual(1_000_001, new_volume.as_unit(VolumeUnit.MILLILITRE))
+
+    def test_subtract_fixed_point_volumes_produces_fixed_point_volume_delta(
+        self,
+    ) -> None:
+        volume1 = FixedPointVolume(1, VolumeUnit.MILLILITRE)
+        volume2 = FixedPointVolume(3, VolumeUnit.MILLILITRE)
+        delta = volume1 - volume2
+        self.assertIsInstance(delta, FixedPointVolumeDelta)
+        self.assertEqual(-2, delta.as_unit(VolumeUnit.MILLILITRE))
+
+    def test_subtract_fixed_point_volume_delta_below_zero_raises_error(self) -> None:
+        volume = FixedPointVolume(1, VolumeUnit.MILLILITRE)
+        with self.assertRaises(NegativeVolumeValueError):
+            _ = volume - FixedPointVolumeDelta(2, VolumeUnit.MILLILITRE)
+
+    def test_compare_fixed_point_volumes(self) -> None:
+        volume1 = FixedPointVolume(1, VolumeUnit.CUBIC_METRE)
+        volume2 = FixedPointVolume(1_000_000, VolumeUnit.MILLILITRE)
+        volume3 = FixedPointVolume(1_000_001, VolumeUnit.MILLILITRE)
+        self.assertEqual(volume1, volume2)
+        self.assertEqual(hash(volume1), hash(volume2))
+        self.assertLess(volume1, volume3)
+        self.assertLessEqual(volume1, volume2)
+        self.assertGreater(volume3, volume1)
+        self.assertGreaterEqual(volume1, volume2)
+
+
+class FixedPointVolumeDeltaTest(unittest.TestCase):
+    """Unit tests for the fixed-point volume delta class."""
+
+    def test_fixed_point_volume_delta_matches_floating_point_volume_delta(self) -> None:
+        delta = FixedPointVolumeDelta(-2_500, VolumeUnit.MILLILITRE).to_volume_delta()
+        self.assertIsInstance(delta, VolumeDelta)
+        self.assertAlmostEqual(-2_500, delta.as_unit(VolumeUnit.MILLILITRE))
+
+    def test_scale_fixed_point_volume_delta(self) -> None:
+        delta = FixedPointVolumeDelta(3, VolumeUnit.MILLILITRE)
+        self.assertEqual(6, (delta * 2).as_unit(VolumeUnit.MILLILITRE))
+        self.assertEqual(6, (2 * delta).as_unit(VolumeUnit.MILLILITRE))
+        self.assertEqual(-3, (-delta).as_unit(VolumeUnit.MILLILITRE))
+        self.assertEqual(3, abs(-delta).as_unit(VolumeUnit.MILLILITRE))
+
+    def test_floor_divide_fixed_point_volume_delta(self) -> None:
+        delta = FixedPointVolumeDelta(7, VolumeUnit.MILLILITRE)
+        self.assertEqual(3, delta // FixedPointVolumeDelta(2, VolumeUnit.MILLILITRE))
+        self.assertEqual(
+            FixedPointVolumeDelta(3_500, VolumeUnit.MILLILITRE),
+            FixedPointVolumeDelta(7, VolumeUnit.LITRE) // 2,
+        )
+
+    def test_add_and_subtract_fixed_point_volume_deltas(self) -> None:
+        delta1 = FixedPointVolumeDelta(1, VolumeUnit.CUBIC_METRE)
+        delta2 = FixedPointVolumeDelta(1, VolumeUnit.MILLILITRE)
+        self.assertEqual(1_000_001, (delta1 + delta2).as_unit(VolumeUnit.MILLILITRE))
+        self.assertEqual(999_999, (delta1 - delta2).as_unit(VolumeUnit.MILLILITRE))
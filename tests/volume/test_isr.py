@@ -0,0 +1,70 @@
+# pyright: reportUnknownMemberType=false
+
+import unittest
+
+from src.units import NegativeVolumeValueError, Volume, VolumeUnit
+from src.units.volume import VolumeCell, VolumeThreshold
+
+try:
+    import micropython  # type: ignore[import-not-found]
+except ImportError:
+    micropython = None
+
+
+class VolumeCellTest(unittest.TestCase):
+    """Unit tests for the volume cell class."""
+
+    def test_get_produces_volume(self) -> None:
+        cell = VolumeCell(VolumeUnit.MILLILITRE)
+        cell.set(12.5)
+        volume = cell.get()
+        self.assertIsInstance(volume, Volume)
+        self.assertAlmostEqual(12.5, volume.as_unit(VolumeUnit.MILLILITRE))
+
+    def test_get_initial_value(self) -> None:
+        cell = VolumeCell(VolumeUnit.MILLILITRE, 12.5)
+        self.assertAlmostEqual(12.5, cell.get().as_unit(VolumeUnit.MILLILITRE))
+
+    def test_get_invalid_value_raises_error(self) -> None:
+        cell = VolumeCell(VolumeUnit.MILLILITRE)
+        cell.set(-1)
+        with self.assertRaises(NegativeVolumeValueError):
+            cell.get()
+
+    def test_set_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        cell = VolumeCell(VolumeUnit.MILLILITRE)
+        value = 12.5
+        micropython.heap_lock()
+        try:
+            cell.set(value)
+            cell.set(900)
+        finally:
+            micropython.heap_unlock()
+
+
+class VolumeThresholdTest(unittest.TestCase):
+    """Unit tests for the volume threshold class."""
+
+    def test_compare_raw_values_with_threshold(self) -> None:
+        threshold = VolumeThreshold(Volume(1, VolumeUnit.LITRE), VolumeUnit.MILLILITRE)
+        self.assertTrue(threshold.is_below(900))
+        self.assertFalse(threshold.is_above(900))
+        self.assertTrue(threshold.is_above(1100))
+        self.assertFalse(threshold.is_below(1100))
+
+    def test_compare_does_not_allocate(self) -> None:
+        if micropython is None:
+            self.skipTest("Requires micropython.heap_lock")
+
+        threshold = VolumeThreshold(Volume(1, VolumeUnit.LITRE), VolumeUnit.MILLILITRE)
+        micropython.heap_lock()
+        try:
+            is_below = threshold.is_below(900)
+            is_above = threshold.is_above(900)
+        finally:
+            micropython.heap_unlock()
+        self.assertTrue(is_below)
+        self.assertFalse(is_above)
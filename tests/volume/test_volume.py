@@ -87,3 +87,9 @@ class VolumeTest(unittest.TestCase):
                 self.assertEqual(is_less_than_or_equal_to, volume1 <= volume2)
                 self.assertEqual(is_greater_than, volume1 > volume2)
                 self.assertEqual(is_greater_than_or_equal_to, volume1 >= volume2)
+
+    def test_get_volume_value_as_invalid_unit_raises_value_error(self) -> None:
+        volume = Volume(1, VolumeUnit.CUBIC_METRE)
+        for invalid_unit in [-1, 0, 5, 6, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                volume.as_unit(invalid_unit)  # type: ignore[arg-type]
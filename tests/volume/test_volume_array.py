@@ -0,0 +1,65 @@
+import unittest
+
+from src.units import (
+    NegativeVolumeValueError,
+    Volume,
+    VolumeArray,
+    VolumeDelta,
+    VolumeDeltaArray,
+    VolumeUnit,
+)
+
+
+class VolumeArrayTest(unittest.TestCase):
+    """Unit tests for volume array and volume delta array classes."""
+
+    def test_get_volume_array_values_as_unit(self) -> None:
+        volumes = VolumeArray([1, 2], VolumeUnit.CUBIC_METRE)
+        values = volumes.as_unit(VolumeUnit.LITRE)
+        self.assertAlmostEqual(1_000, values[0])
+        self.assertAlmostEqual(2_000, values[1])
+
+    def test_create_negative_volume_array_raises_error(self) -> None:
+        with self.assertRaises(NegativeVolumeValueError):
+            _ = VolumeArray([1, -1], VolumeUnit.CUBIC_METRE)
+
+    def test_index_volume_array_produces_volume(self) -> None:
+        volumes = VolumeArray([1, 2], VolumeUnit.LITRE)
+        volume = volumes[1]
+        self.assertIsInstance(volume, Volume)
+        self.assertAlmostEqual(2, volume.as_unit(VolumeUnit.LITRE))
+
+    def test_add_volume_delta_array_to_volume_array(self) -> None:
+        volumes = VolumeArray([1, 2], VolumeUnit.CUBIC_METRE)
+        deltas = VolumeDeltaArray([1, -1], VolumeUnit.CUBIC_METRE)
+        values = (volumes + deltas).as_unit(VolumeUnit.CUBIC_METRE)
+        self.assertAlmostEqual(2, values[0])
+        self.assertAlmostEqual(1, values[1])
+
+    def test_subtract_volume_delta_from_volume_array_below_zero_raises_error(
+        self,
+    ) -> None:
+        volumes = VolumeArray([1, 2], VolumeUnit.CUBIC_METRE)
+        with self.assertRaises(NegativeVolumeValueError):
+            _ = volumes - VolumeDelta(1.5, VolumeUnit.CUBIC_METRE)
+
+    def test_subtract_volume_arrays_produces_volume_delta_array(self) -> None:
+        volumes1 = VolumeArray([1, 2], VolumeUnit.CUBIC_METRE)
+        volumes2 = VolumeArray([2, 1], VolumeUnit.CUBIC_METRE)
+        deltas = volumes1 - volumes2
+        self.assertIsInstance(deltas, VolumeDeltaArray)
+        values = deltas.as_unit(VolumeUnit.CUBIC_METRE)
+        self.assertAlmostEqual(-1, values[0])
+        self.assertAlmostEqual(1, values[1])
+
+    def test_scale_volume_delta_array(self) -> None:
+        deltas = VolumeDeltaArray([1, -2], VolumeUnit.CUBIC_METRE)
+        values = (deltas * 2).as_unit(VolumeUnit.CUBIC_METRE)
+        self.assertAlmostEqual(2, values[0])
+        self.assertAlmostEqual(-4, values[1])
+
+    def test_compare_volume_array_to_volume(self) -> None:
+        volumes = VolumeArray([1, 2, 3], VolumeUnit.CUBIC_METRE)
+        threshold = Volume(2, VolumeUnit.CUBIC_METRE)
+        self.assertEqual(bytearray([1, 0, 0]), volumes < threshold)
+        self.assertEqual(bytearray([0, 1, 1]), volumes >= threshold)
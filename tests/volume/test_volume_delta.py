@@ -150,3 +150,9 @@ class VolumeDeltaTest(unittest.TestCase):
                     is_greater_than_or_equal_to,
                     volume_delta1 >= volume_delta2,
                 )
+
+    def test_get_volume_delta_value_as_invalid_unit_raises_value_error(self) -> None:
+        volume_delta = VolumeDelta(1, VolumeUnit.CUBIC_METRE)
+        for invalid_unit in [-1, 0, 5, 6, 100]:
+            with self.subTest(unit=invalid_unit), self.assertRaises(ValueError):
+                volume_delta.as_unit(invalid_unit)  # type: ignore[arg-type]
@@ -0,0 +1,357 @@
+"""Build a flattened copy of the library, with a single module per quantity.
+
+Importing a quantity from the source layout opens every module of its subpackage
+(the unit, exceptions, class & array modules, ...), each of which is a separate
+file lookup & module object on micropython. The flattened build concatenates the
+modules of each `units/units_inner/<quantity>/` subpackage into a single
+`units/units_inner/<quantity>.py` module, so a quantity is imported from one file.
+The public modules & the modules shared between quantities are copied unchanged,
+so the flattened build is imported exactly like the source one.
+
+Within a subpackage, the imports between its modules are dropped (or turned into
+assignments, where a name is imported under an alias), references to the modules
+imported for their attributes (`velocity.Velocity`) are replaced by the attributes,
+and the imports from outside the subpackage are merged at the top of the module.
+Private names defined by more than one module are prefixed with the name of their
+module, so that they do not clash.
+
+Run from the `tools/` directory. The build is written into `flat/`, and can be
+compiled to `.mpy` bytecode with `mpy-cross` like the source modules.
+"""
+
+import ast
+import pathlib
+import shutil
+from collections import OrderedDict
+from typing import Final
+
+_SRC_DIRECTORY: Final = pathlib.Path("src")
+_FLAT_DIRECTORY: Final = pathlib.Path("flat")
+_INNER_DIRECTORY: Final = pathlib.Path("units", "units_inner")
+
+_INIT_MODULE: Final = "__init__"
+
+# The imports of a flattened module, keyed by the level & module imported from. The
+# names are an ordered set of the names imported & their aliases.
+_Imports = OrderedDict[tuple[int, str], OrderedDict[tuple[str, str | None], None]]
+
+
+def _root_directory() -> pathlib.Path:
+    return pathlib.Path.cwd().parent
+
+
+def _is_type_checking(test: ast.expr) -> bool:
+    return isinstance(test, ast.Name) and test.id == "TYPE_CHECKING"
+
+
+def _is_docstring(node: ast.stmt) -> bool:
+    return (
+        isinstance(node, ast.Expr)
+        and isinstance(node.value, ast.Constant)
+        and isinstance(node.value.value, str)
+    )
+
+
+def _defined_names(tree: ast.Module) -> set[str]:
+    """Return the names defined (rather than imported) at the top of a module."""
+    names = set[str]()
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            names.update(
+                name.id
+                for target in targets
+                for name in ast.walk(target)
+                if isinstance(name, ast.Name)
+            )
+
+    return names
+
+
+def _find_renames(modules: dict[str, ast.Module]) -> dict[str, dict[str, str]]:
+    """Find the new names of the names defined by more than one module.
+
+    Raises:
+        ValueError: A public name is defined by more than one module.
+    """
+    definers = dict[str, list[str]]()
+    for module, tree in modules.items():
+        for name in _defined_names(tree):
+            definers.setdefault(name, []).append(module)
+
+    renames = {module: dict[str, str]() for module in modules}
+    for name, names_modules in definers.items():
+        if len(names_modules) == 1:
+            continue
+        if not name.startswith("_"):
+            msg = f"{name!r} is defined by several modules: {names_modules}."
+            raise ValueError(msg)
+        for module in names_modules:
+            renames[module][name] = f"_{module}{name}"
+
+    return renames
+
+
+def _sort_modules(modules: dict[str, ast.Module]) -> list[str]:
+    """Sort the modules so that each comes after the modules whose names it imports.
+
+    Modules imported for their attributes (`from . import velocity`) are only used
+    once the module has loaded, so do not constrain the order.
+
+    Raises:
+        ValueError: The modules import names from each other in a cycle.
+    """
+    dependencies = {
+        module: sorted(
+            node.module
+            for node in tree.body
+            if isinstance(node, ast.ImportFrom)
+            and node.level == 1
+            and node.module is not None
+        )
+        for module, tree in modules.items()
+    }
+    order = list[str]()
+    visiting = set[str]()
+
+    def visit(module: str) -> None:
+        if module in order:
+            return
+        if module in visiting:
+            msg = f"Modules import names from each other in a cycle: {module!r}."
+            raise ValueError(msg)
+        visiting.add(module)
+        for dependency in dependencies[module]:
+            visit(dependency)
+        visiting.remove(module)
+        order.append(module)
+
+    for module in sorted(modules):
+        visit(module)
+
+    return order
+
+
+class _ModuleFlattener(ast.NodeTransformer):
+    """Rewrites the names of a module, for it to be merged into its subpackage."""
+
+    def __init__(
+        self,
+        renames: dict[str, str],
+        module_aliases: dict[str, str],
+        defined_names: dict[str, set[str]],
+        all_renames: dict[str, dict[str, str]],
+    ) -> None:
+        self._renames = renames
+        self._module_aliases = module_aliases
+        self._defined_names = defined_names
+        self._all_renames = all_renames
+
+    def visit_Name(self, node: ast.Name) -> ast.Name:
+        node.id = self._renames.get(node.id, node.id)
+        return node
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.FunctionDef:
+        node.name = self._renames.get(node.name, node.name)
+        self.generic_visit(node)
+        return node
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> ast.ClassDef:
+        node.name = self._renames.get(node.name, node.name)
+        self.generic_visit(node)
+        return node
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.AST:
+        value = node.value
+        if isinstance(value, ast.Name) and value.id in self._module_aliases:
+            module = self._module_aliases[value.id]
+            if node.attr in self._defined_names[module]:
+                name = self._all_renames[module].get(node.attr, node.attr)
+                return ast.copy_location(ast.Name(name, node.ctx), node)
+
+        self.generic_visit(node)
+        return node
+
+
+class _PackageFlattener:
+    """Merges the modules of a subpackage into a single module."""
+
+    def __init__(self, package: pathlib.Path, packages: set[str]) -> None:
+        """Initialise a flattener of the package, among the subpackages named."""
+        self._package = package
+        self._packages = packages
+        self._modules = {
+            file.stem: ast.parse(file.read_text(), filename=str(file))
+            for file in sorted(package.glob("*.py"))
+        }
+        submodules = {
+            module: tree
+            for module, tree in self._modules.items()
+            if module != _INIT_MODULE
+        }
+        self._renames = _find_renames(submodules)
+        self._renames[_INIT_MODULE] = {}
+        self._defined_names = {
+            module: _defined_names(tree) for module, tree in self._modules.items()
+        }
+        self._order = [*_sort_modules(submodules), _INIT_MODULE]
+        self._imports = _Imports()
+        self._type_checking_imports = _Imports()
+
+    def _target_name(self, module: str, name: str) -> str:
+        return self._renames[module].get(name, name)
+
+    def _add_import(
+        self,
+        imports: _Imports,
+        node: ast.Import | ast.ImportFrom,
+    ) -> None:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.setdefault((-1, alias.name), OrderedDict())
+            return
+
+        # The subpackage becomes a module of its parent package, one level higher, and
+        # the modules of the other subpackages are merged into their subpackage
+        level = node.level - 1 if node.level else 0
+        module = node.module or ""
+        if level == 1 and module.partition(".")[0] in self._packages:
+            module = module.partition(".")[0]
+        names = imports.setdefault((level, module), OrderedDict())
+        for alias in node.names:
+            names[alias.name, alias.asname] = None
+
+    def _flatten_statements(
+        self,
+        module: str,
+        statements: list[ast.stmt],
+        module_aliases: dict[str, str],
+        *,
+        type_checking: bool,
+    ) -> list[ast.stmt]:
+        """Flatten the statements at the top of a module or of a TYPE_CHECKING block."""
+        flattened = list[ast.stmt]()
+        for node in statements:
+            if isinstance(node, ast.ImportFrom) and node.level == 1:
+                if node.module is None:
+                    for alias in node.names:
+                        module_aliases[alias.asname or alias.name] = alias.name
+                    continue
+                for alias in node.names:
+                    target = self._target_name(node.module, alias.name)
+                    name = alias.asname or alias.name
+                    if name != target and not type_checking:
+                        flattened.append(
+                            ast.Assign(
+                                targets=[ast.Name(name, ast.Store())],
+                                value=ast.Name(target, ast.Load()),
+                                lineno=0,
+                            )
+                        )
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                imports = (
+                    self._type_checking_imports if type_checking else self._imports
+                )
+                self._add_import(imports, node)
+            elif (
+                isinstance(node, ast.If)
+                and _is_type_checking(node.test)
+                and not type_checking
+            ):
+                body = self._flatten_statements(
+                    module, node.body, module_aliases, type_checking=True
+                )
+                if body or node.orelse:
+                    node.body = body or [ast.Pass()]
+                    flattened.append(node)
+            else:
+                flattened.append(node)
+
+        return flattened
+
+    def _flatten_module(self, module: str) -> list[ast.stmt]:
+        tree = self._modules[module]
+        statements = tree.body[1:] if _is_docstring(tree.body[0]) else tree.body
+        module_aliases = dict[str, str]()
+        flattened = self._flatten_statements(
+            module, statements, module_aliases, type_checking=False
+        )
+        transformer = _ModuleFlattener(
+            self._renames[module], module_aliases, self._defined_names, self._renames
+        )
+        return [transformer.visit(node) for node in flattened]
+
+    @staticmethod
+    def _import_statements(
+        imports: _Imports,
+    ) -> list[ast.stmt]:
+        statements = list[ast.stmt]()
+        for (level, module), names in imports.items():
+            if level < 0:
+                statements.append(ast.Import(names=[ast.alias(module)]))
+                continue
+            statements.append(
+                ast.ImportFrom(
+                    module=module or None,
+                    names=[ast.alias(name, asname) for name, asname in names],
+                    level=level,
+                )
+            )
+
+        return statements
+
+    def flatten(self) -> str:
+        """Return the source of the flattened module."""
+        body = list[ast.stmt]()
+        for module in self._order:
+            body.extend(self._flatten_module(module))
+
+        init_body = self._modules[_INIT_MODULE].body
+        header: list[ast.stmt] = init_body[:1] if _is_docstring(init_body[0]) else []
+        header.extend(self._import_statements(self._imports))
+        if self._type_checking_imports:
+            header.append(
+                ast.If(
+                    test=ast.Name("TYPE_CHECKING", ast.Load()),
+                    body=self._import_statements(self._type_checking_imports),
+                    orelse=[],
+                )
+            )
+
+        tree = ast.Module(body=header + body, type_ignores=[])
+        ast.fix_missing_locations(tree)
+        relative_path = self._package.relative_to(_root_directory() / _SRC_DIRECTORY)
+        return (
+            f"# Generated by `tools/flatten.py` from `{relative_path.as_posix()}/`\n"
+            f"{ast.unparse(tree)}\n"
+        )
+
+
+def _build() -> None:
+    src_directory = _root_directory() / _SRC_DIRECTORY
+    flat_directory = _root_directory() / _FLAT_DIRECTORY
+    shutil.rmtree(flat_directory, ignore_errors=True)
+
+    inner_directory = src_directory / _INNER_DIRECTORY
+    packages = sorted(
+        path
+        for path in inner_directory.iterdir()
+        if path.is_dir() and (path / "__init__.py").is_file()
+    )
+    for file in sorted((src_directory / "units").rglob("*.py")):
+        if any(file.is_relative_to(package) for package in packages):
+            continue
+        output = flat_directory / file.relative_to(src_directory)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(file, output)
+
+    for package in packages:
+        output = flat_directory / _INNER_DIRECTORY / f"{package.name}.py"
+        flattener = _PackageFlattener(package, {package.name for package in packages})
+        output.write_text(flattener.flatten())
+
+
+if __name__ == "__main__":
+    _build()
@@ -1,49 +1,230 @@
+"""Generate the mip package files of the library.
+
+Writes `package.json`, which installs the whole library, and a profile per quantity
+in `packages/`, which installs only the modules that quantity imports (such as
+`packages/units-linear-motion`, which also pulls in length & time). Passing `--mpy`
+also compiles every module to `.mpy` bytecode with `mpy-cross` (or the compiler in
+the `MPY_CROSS` environment variable) into `mpy/`. No package files are written for
+the bytecode, as `mpy/` is not committed, so mip URLs into it would not resolve.
+
+Run from the `tools/` directory.
+"""
+
+import argparse
+import ast
 import json
+import os
 import pathlib
-from os import path
+import shutil
+import subprocess
 from typing import Final
 
 _PACKAGE_JSON_FILE: Final = pathlib.Path("package.json")
-_UNITS_DIRECTORY: Final = pathlib.Path("src", "units")
+_PROFILES_DIRECTORY: Final = pathlib.Path("packages")
+_MPY_DIRECTORY: Final = pathlib.Path("mpy")
+_SRC_DIRECTORY: Final = pathlib.Path("src")
+_UNITS_DIRECTORY: Final = _SRC_DIRECTORY / "units"
 
 _GITHUB_REPO_STEM: Final = "github:WoolleySheep/micropython-units"
 
+_DEPS: Final = [["github:Josverl/micropython-stubs/mip/typing.py", "main"]]
+_VERSION: Final = "0.1"
+
+# Profiles which combine several quantities, on top of the profile of each quantity
+_COMBINED_PROFILES: Final = {
+    "units-motion": ("angular_motion", "linear_motion"),
+}
+
 # [
 #     "units/angular_motion.py",
 #     "github:WoolleySheep/micropython-units/src/units/angular_motion.py"
 # ],
 
+PackageInfo = dict[str, str | list[list[str]]]
+
+
+def _root_directory() -> pathlib.Path:
+    return pathlib.Path.cwd().parent
+
 
 def _create_package_filepath(file: pathlib.Path) -> str:
     """Create a package filepath for a given file."""
-    src_directory = pathlib.Path.cwd().parent / "src"
+    src_directory = _root_directory() / _SRC_DIRECTORY
     relative_path = file.relative_to(src_directory)
     return str(relative_path).replace("\\", "/")
 
 
-def _create_package_info() -> dict[str, str | list[list[str]]]:
-    urls = list[list[str]]()
-    for file in (pathlib.Path.cwd().parent / _UNITS_DIRECTORY).rglob("*"):
-        if file.is_dir() or file.suffix != ".py":
+def _is_type_checking(test: ast.expr) -> bool:
+    return isinstance(test, ast.Name) and test.id == "TYPE_CHECKING"
+
+
+def _find_module(package: pathlib.Path, name: str) -> pathlib.Path | None:
+    """Find the module or package with the dotted name, relative to the package."""
+    path = package.joinpath(*name.split("."))
+    if (path / "__init__.py").is_file():
+        return path / "__init__.py"
+    if path.with_suffix(".py").is_file():
+        return path.with_suffix(".py")
+    return None
+
+
+def _find_imports(file: pathlib.Path) -> set[pathlib.Path]:
+    """Find the library modules imported by a module when it runs.
+
+    Only relative imports are followed, and imports only made for type checking are
+    skipped.
+    """
+    imports = set[pathlib.Path]()
+    nodes: list[ast.AST] = [ast.parse(file.read_text(), filename=str(file))]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, ast.If) and _is_type_checking(node.test):
+            nodes.extend(node.orelse)
             continue
+        nodes.extend(ast.iter_child_nodes(node))
+        if not isinstance(node, ast.ImportFrom) or node.level == 0:
+            continue
+
+        package = file.parent
+        for _ in range(node.level - 1):
+            package = package.parent
+        if node.module is not None:
+            module = _find_module(package, node.module)
+            if module is None:
+                msg = f"Cannot find module {node.module!r} imported by {file}."
+                raise ValueError(msg)
+            imports.add(module)
+            package = module.parent if module.name == "__init__.py" else package
+            if module.name != "__init__.py":
+                continue
+        # The imported names may be submodules, rather than attributes
+        for alias in node.names:
+            submodule = _find_module(package, alias.name)
+            if submodule is not None:
+                imports.add(submodule)
+
+    return imports
+
+
+def _with_parent_packages(file: pathlib.Path) -> set[pathlib.Path]:
+    """Return the module along with the `__init__.py` of every package it is in."""
+    units_directory = _root_directory() / _UNITS_DIRECTORY
+    files = {file}
+    directory = file.parent
+    while directory.is_relative_to(units_directory):
+        files.add(directory / "__init__.py")
+        directory = directory.parent
+    return files
+
+
+def _find_dependencies(modules: list[pathlib.Path]) -> set[pathlib.Path]:
+    """Find every module needed to import the modules."""
+    dependencies = set[pathlib.Path]()
+    unvisited = set[pathlib.Path]()
+    for module in modules:
+        unvisited |= _with_parent_packages(module)
+    while unvisited:
+        module = unvisited.pop()
+        dependencies.add(module)
+        for imported in _find_imports(module):
+            unvisited |= _with_parent_packages(imported) - dependencies
+
+    return dependencies
+
+
+def _find_package_files() -> list[pathlib.Path]:
+    return sorted((_root_directory() / _UNITS_DIRECTORY).rglob("*.py"))
+
+
+def _find_profiles() -> dict[str, list[pathlib.Path]]:
+    """Find the modules of every profile, keyed by the name of the profile."""
+    units_directory = _root_directory() / _UNITS_DIRECTORY
+    modules = {
+        file.stem: [file]
+        for file in sorted(units_directory.glob("*.py"))
+        if file.name != "__init__.py"
+    }
+    profiles = {
+        "units-" + name.replace("_", "-"): files for name, files in modules.items()
+    }
+    for profile, names in _COMBINED_PROFILES.items():
+        profiles[profile] = [modules[name][0] for name in names]
+
+    return {
+        profile: sorted(_find_dependencies(files))
+        for profile, files in sorted(profiles.items())
+    }
+
+
+def _create_package_info(files: list[pathlib.Path]) -> PackageInfo:
+    """Create the package info that installs the files."""
+    urls = list[list[str]]()
+    for file in files:
         package_filepath = _create_package_filepath(file)
-        package_url = f"{_GITHUB_REPO_STEM}/src/{package_filepath}"
+        package_url = (
+            f"{_GITHUB_REPO_STEM}/{_SRC_DIRECTORY.as_posix()}/{package_filepath}"
+        )
         urls.append([package_filepath, package_url])
 
     return {
         "urls": sorted(urls),
-        "deps": [["github:Josverl/micropython-stubs/mip/typing.py", "main"]],
-        "version": "0.1",
+        "deps": _DEPS,
+        "version": _VERSION,
     }
 
 
-def _write_package_json(package_info: dict[str, str | list[list[str]]]) -> None:
-    with (pathlib.Path.cwd().parent / _PACKAGE_JSON_FILE).open(mode="w") as f:
+def _write_package_json(package_info: PackageInfo, file: pathlib.Path) -> None:
+    path = _root_directory() / file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open(mode="w") as f:
         json.dump(package_info, fp=f, indent=4)
 
 
+def _write_package_jsons() -> None:
+    """Write the package & profile files."""
+    _write_package_json(_create_package_info(_find_package_files()), _PACKAGE_JSON_FILE)
+    for profile, files in _find_profiles().items():
+        _write_package_json(
+            _create_package_info(files),
+            _PROFILES_DIRECTORY / profile / _PACKAGE_JSON_FILE,
+        )
+
+
+def _compile_mpy() -> None:
+    """Compile every module of the library into `.mpy` bytecode.
+
+    Raises:
+        FileNotFoundError: `mpy-cross` could not be found.
+    """
+    mpy_cross = os.environ.get("MPY_CROSS") or shutil.which("mpy-cross")
+    if mpy_cross is None:
+        msg = "mpy-cross not found; install it or set the MPY_CROSS variable."
+        raise FileNotFoundError(msg)
+
+    src_directory = _root_directory() / _SRC_DIRECTORY
+    mpy_directory = _root_directory() / _MPY_DIRECTORY
+    shutil.rmtree(mpy_directory, ignore_errors=True)
+    for file in _find_package_files():
+        output = mpy_directory / file.relative_to(src_directory).with_suffix(".mpy")
+        output.parent.mkdir(parents=True, exist_ok=True)
+        subprocess.run(  # noqa: S603
+            [mpy_cross, "-o", str(output), str(file)],
+            check=True,
+        )
+
+
 def _main() -> None:
-    _write_package_json(_create_package_info())
+    parser = argparse.ArgumentParser(description="Generate the mip package files.")
+    parser.add_argument(
+        "--mpy",
+        action="store_true",
+        help="also compile the modules to .mpy bytecode, into mpy/",
+    )
+    args = parser.parse_args()
+
+    _write_package_jsons()
+    if args.mpy:
+        _compile_mpy()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,674 @@
+"""Generate the unit modules & their tests from the spec of the quantities & units.
+
+Every `unit.py` module in `src/units/units_inner` (and its `test_unit.py` in
+`tests`) is generated from `units_spec.json`, so that the conversion tables of every
+quantity are laid out the same way. The tables are precomputed here & written out as
+literal tuples, so that nothing needs to be calculated when a module is imported.
+The generated source is formatted with ruff.
+
+Run from the `tools` directory, with `--check` to only report the modules that are
+out of date with the spec:
+
+    uv run generate_units.py [--check]
+"""
+
+import ast
+import json
+import math
+import pathlib
+import subprocess
+import sys
+from fractions import Fraction
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_SPEC_FILE: Final = pathlib.Path("units_spec.json")
+_INNER_DIRECTORY: Final = pathlib.Path("src", "units", "units_inner")
+_TESTS_DIRECTORY: Final = pathlib.Path("tests")
+
+_GENERATED_NOTICE: Final = [
+    "Generated by `tools/generate_units.py` from `tools/units_spec.json`, so edit the",
+    "spec & rerun the generator rather than editing this module.",
+]
+
+_ENUM_DOCSTRING_NOTE: Final = '''
+    NB: Micropython does not yet support enums. The desired behaviour
+    (enumerated options embedded in the type system) can be mostly
+    replicated by substituting IntEnum for object at runtime, which
+    is what has been done here.
+    """'''
+
+_UNIT_CHECK_TEMPLATE: Final = '''
+
+def _check_unit(unit: Unit) -> None:
+    """Check that the unit is a {quantity} unit.
+
+    Not intended for public use.
+
+    Raises:
+        ValueError: The unit is not a {quantity} unit.
+    """
+    if not 0 < unit < {stride_name}:
+        raise ValueError
+
+
+def get_name(unit: Unit) -> str:
+    """Get the name of the {quantity} unit.
+
+    Not intended for public use.
+    """
+    _check_unit(unit)
+    return _NAMES[unit]
+
+
+def get_abbreviation(unit: Unit) -> str:
+    """Get the abbreviation for the {quantity} unit.
+
+    Not intended for public use.
+    """
+    _check_unit(unit)
+    return _ABBREVIATIONS[unit]
+'''
+
+_UNIT_DELTA_GETTER_TEMPLATE: Final = '''
+
+def get_unit_delta_per_{si_name}(unit: Unit) -> float:
+    """Get the change in {quantity} expressed as the unit per 1{si_abbreviation}.
+
+    Not intended for public use.
+    """
+    _check_unit(unit)
+    return {table_name}[unit]
+'''
+
+_FIXED_POINT_GETTER_TEMPLATE: Final = '''
+
+def get_fixed_point_ratio(unit: Unit) -> tuple[int, int]:
+    """Get the number of {sub_unit} per 1 of the {quantity} unit, as an integer ratio.
+
+    Not intended for public use.
+    """
+    _check_unit(unit)
+    return _FIXED_POINT_RATIOS[unit]
+'''
+
+_TEST_CLASS_TEMPLATE: Final = '''
+
+class UnitTest(unittest.TestCase):
+    """Unit tests for the {quantity} unit tables."""
+
+    def assert_close(self, expected: float, actual: float) -> None:
+        self.assertAlmostEqual(
+            expected, actual, delta=abs(expected) * 1e-9
+        )
+
+    def test_get_name(self) -> None:
+        for member, name, *_ in _UNITS:
+            with self.subTest(unit=member):
+                self.assertEqual(name, unit.get_name(member))
+
+    def test_get_abbreviation(self) -> None:
+        for member, _, abbreviation, *_ in _UNITS:
+            with self.subTest(unit=member):
+                self.assertEqual(
+                    abbreviation, unit.get_abbreviation(member)
+                )
+
+    def test_invalid_unit_raises_value_error(self) -> None:
+        for invalid_unit in [0, len(_UNITS) + 1]:
+            with (
+                self.subTest(unit=invalid_unit),
+                self.assertRaises(ValueError),
+            ):
+                unit.get_name(invalid_unit)  # type: ignore[arg-type]'''
+
+_AFFINE_TESTS_TEMPLATE: Final = """
+    def test_conversion_parameters(self) -> None:
+        for from_member, _, _, from_gradient, from_offset in _UNITS:
+            for to_member, _, _, to_gradient, to_offset in _UNITS:
+                with self.subTest(
+                    from_unit=from_member, to_unit=to_member
+                ):
+                    index = (
+                        from_member * unit.CONVERSION_PARAMETERS_STRIDE
+                        + to_member
+                    )
+                    gradient = to_gradient / from_gradient
+                    self.assert_close(
+                        gradient,
+                        unit.CONVERSION_NUMERATORS[index]
+                        / unit.CONVERSION_DENOMINATORS[index],
+                    )
+                    self.assertAlmostEqual(
+                        to_offset - gradient * from_offset,
+                        unit.CONVERSION_OFFSETS[index]
+                        / unit.CONVERSION_DENOMINATORS[index],
+                    )"""
+
+_LINEAR_TESTS_TEMPLATE: Final = """
+    def test_get_unit_delta_per_{si_name}(self) -> None:
+        for member, _, _, unit_delta in _UNITS:
+            with self.subTest(unit=member):
+                self.assert_close(
+                    unit_delta, unit.get_unit_delta_per_{si_name}(member)
+                )
+
+    def test_conversion_factors(self) -> None:
+        for from_member, _, _, from_unit_delta in _UNITS:
+            for to_member, _, _, to_unit_delta in _UNITS:
+                with self.subTest(
+                    from_unit=from_member, to_unit=to_member
+                ):
+                    index = (
+                        from_member * unit.CONVERSION_FACTORS_STRIDE
+                        + to_member
+                    )
+                    self.assert_close(
+                        to_unit_delta / from_unit_delta,
+                        unit.CONVERSION_FACTORS[index],
+                    )"""
+
+_TURN_TABLE_TESTS_TEMPLATE: Final = """
+    def test_turn_tables(self) -> None:
+        for member, _, _, unit_delta in _UNITS:
+            with self.subTest(unit=member):
+                self.assert_close(
+                    2 * math.pi * unit_delta, unit.FULL_TURNS[member]
+                )
+                self.assert_close(
+                    math.pi * unit_delta, unit.HALF_TURNS[member]
+                )"""
+
+_FIXED_POINT_TESTS_TEMPLATE: Final = """
+    def test_get_fixed_point_ratio(self) -> None:
+        for member, _, _, unit_delta in _UNITS:
+            with self.subTest(unit=member):
+                numerator, denominator = unit.get_fixed_point_ratio(
+                    member
+                )
+                self.assertTrue(
+                    math.isclose(
+                        unit.{resolution_name} / unit_delta,
+                        numerator / denominator,
+                        rel_tol=1e-7,
+                    )
+                )"""
+
+
+_BINARY_OPERATORS: "dict[type[ast.operator], Callable[[float, float], float]]" = {
+    ast.Add: lambda left, right: left + right,
+    ast.Sub: lambda left, right: left - right,
+    ast.Mult: lambda left, right: left * right,
+    ast.Div: lambda left, right: left / right,
+    ast.Pow: lambda left, right: left**right,
+}
+_UNARY_OPERATORS: "dict[type[ast.unaryop], Callable[[float], float]]" = {
+    ast.UAdd: lambda operand: +operand,
+    ast.USub: lambda operand: -operand,
+}
+
+
+def _evaluate(expression: str, constants: dict[str, float]) -> float:
+    """Evaluate an arithmetic expression from the spec.
+
+    The expression is parsed rather than passed to `eval`, & may only contain numbers,
+    `pi`, the constants, `+ - * / **` & parentheses.
+
+    Raises:
+        ValueError: The expression contains anything else.
+    """
+    names = {"pi": math.pi, **constants}
+
+    def evaluate(node: ast.expr) -> float:
+        if (
+            isinstance(node, ast.Constant)
+            and isinstance(node.value, (int, float))
+            and not isinstance(node.value, bool)
+        ):
+            return node.value
+        if isinstance(node, ast.Name) and node.id in names:
+            return names[node.id]
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+            return _BINARY_OPERATORS[type(node.op)](
+                evaluate(node.left), evaluate(node.right)
+            )
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+            return _UNARY_OPERATORS[type(node.op)](evaluate(node.operand))
+        msg = f"Unsupported expression in the spec [{ast.unparse(node)}]."
+        raise ValueError(msg)
+
+    return evaluate(ast.parse(expression, mode="eval").body)
+
+
+def _exact(value: float) -> Fraction:
+    """Return the value as the shortest decimal that it was written as in the spec."""
+    return Fraction(repr(value))
+
+
+def _format_number(value: float) -> str:
+    """Format a number as a Python literal, or the name of the NaN constant."""
+    if isinstance(value, float) and math.isnan(value):
+        return "_NAN"
+    if isinstance(value, int) and abs(value) >= 10_000:  # noqa: PLR2004
+        return f"{value:_}"
+    return repr(value)
+
+
+def _format_tuple(name: str, elements: list[str]) -> list[str]:
+    """Format a tuple constant, with one element per line."""
+    return [f"{name}: Final = (", *(f"    {element}," for element in elements), ")"]
+
+
+def _format_comment(text: str) -> list[str]:
+    """Format a comment, wrapped to the line length."""
+    lines: list[str] = []
+    line = "#"
+    for word in text.split():
+        if len(line) + len(word) + 1 > 88:  # noqa: PLR2004
+            lines.append(line)
+            line = "#"
+        line = f"{line} {word}"
+    lines.append(line)
+    return lines
+
+
+def _constant_name(si_unit: str) -> str:
+    """Return the SI unit as part of a constant name, such as "SQUARE_METRE"."""
+    return si_unit.upper().replace(" ", "_")
+
+
+class _Quantity:
+    """The spec of a quantity, with the values of its units evaluated."""
+
+    def __init__(self, package: str, spec: dict[str, Any]) -> None:
+        self.package = package
+        self.quantity: str = spec["quantity"]
+        self.si_unit: str = spec["si_unit"]
+        self.si_abbreviation: str = spec["si_abbreviation"]
+        self.turn_tables: bool = spec.get("turn_tables", False)
+        self.fixed_point: dict[str, Any] | None = spec.get("fixed_point")
+        self.constant_expressions: dict[str, str] = spec.get("constants", {})
+        self.constants = {
+            name: _evaluate(expression, {})
+            for name, expression in self.constant_expressions.items()
+        }
+        self.units: list[dict[str, str]] = spec["units"]
+        self.stride = len(self.units) + 1
+        self.per_si_unit = [math.nan] + [
+            _evaluate(unit["per_si_unit"], self.constants) for unit in self.units
+        ]
+        self.is_affine = any("absolute_zero_offset" in unit for unit in self.units)
+        self.absolute_zero_offsets = [math.nan] + [
+            _evaluate(unit.get("absolute_zero_offset", "0"), self.constants)
+            for unit in self.units
+        ]
+
+    @property
+    def indices(self) -> range:
+        """The values of the units."""
+        return range(1, self.stride)
+
+    def gradient(self, from_unit: int, to_unit: int) -> float:
+        """Return the factor that converts a difference between the units."""
+        if not from_unit or not to_unit:
+            return math.nan
+        return self.per_si_unit[to_unit] / self.per_si_unit[from_unit]
+
+    def _exact_gradient(self, from_unit: int, to_unit: int) -> Fraction:
+        """Return the factor that converts a difference between the units, exactly."""
+        return _exact(self.per_si_unit[to_unit]) / _exact(self.per_si_unit[from_unit])
+
+    def numerator(self, from_unit: int, to_unit: int) -> int:
+        """Return the numerator of the factor that converts between the units."""
+        if not from_unit or not to_unit:
+            return 0
+        return self._exact_gradient(from_unit, to_unit).numerator
+
+    def denominator(self, from_unit: int, to_unit: int) -> int:
+        """Return the denominator of the factor that converts between the units."""
+        if not from_unit or not to_unit:
+            return 1
+        return self._exact_gradient(from_unit, to_unit).denominator
+
+    def _reference_value(self, unit: int) -> Fraction:
+        """Return the unit at the reference point, where the first unit is zero.
+
+        For temperatures, this is the freezing point of water, which is a short
+        decimal in every unit (0C, 273.15K & 32F).
+        """
+        reference_as_si_unit = -_exact(self.absolute_zero_offsets[1]) / _exact(
+            self.per_si_unit[1]
+        )
+        return reference_as_si_unit * _exact(self.per_si_unit[unit]) + _exact(
+            self.absolute_zero_offsets[unit]
+        )
+
+    def offset(self, from_unit: int, to_unit: int) -> float:
+        """Return the offset added to a scaled value, before it is divided.
+
+        A value is converted with `(value * numerator + offset) / denominator`. The
+        offset is a short decimal, as the reference point (such as 32F & 0C) is a
+        short decimal in every unit, so values that are exact at the reference point
+        stay exact.
+        """
+        if not from_unit or not to_unit:
+            return math.nan
+        gradient = self._exact_gradient(from_unit, to_unit)
+        return float(
+            (
+                self._reference_value(to_unit)
+                - self._reference_value(from_unit) * gradient
+            )
+            * gradient.denominator
+        )
+
+
+def _create_matrix(
+    quantity: _Quantity, name: str, get: "Callable[[int, int], float]", what: str
+) -> list[str]:
+    """Create a from-unit x to-unit table, with a comment above each row."""
+    lines = [f"{name}: Final = ("]
+    for from_unit in range(quantity.stride):
+        if from_unit:
+            unit_name = quantity.units[from_unit - 1]["name"]
+            lines.append(f"    # {what} {unit_name} to each unit")
+        else:
+            lines.append("    # Row 0 does not correspond to a unit")
+        lines.extend(
+            f"    {_format_number(get(from_unit, to_unit))},"
+            for to_unit in range(quantity.stride)
+        )
+    lines.append(")")
+    return lines
+
+
+def _create_unit_module(quantity: _Quantity) -> str:
+    """Create the source of the unit module of a quantity."""
+    lines = [f'"""Module for the {quantity.quantity} units.', ""]
+    lines.extend(_GENERATED_NOTICE)
+    lines.extend(['"""', "", "from typing import TYPE_CHECKING, Final", ""])
+    lines.extend(
+        [
+            "if TYPE_CHECKING:",
+            "    from enum import IntEnum",
+            "else:",
+            "    IntEnum = object",
+            "",
+        ]
+    )
+    for name, expression in quantity.constant_expressions.items():
+        lines.append(f"{name}: Final = {expression}")
+    lines.extend(['_NAN: Final = float("nan")', "", ""])
+
+    lines.extend(
+        [
+            "# NB: When adding a new unit, add it to `tools/units_spec.json` & rerun",
+            "# `tools/generate_units.py`, which also regenerates the tests of the unit",
+            "# tables",
+            "class Unit(IntEnum):",
+            f'    """A {quantity.quantity} unit.',
+            *_ENUM_DOCSTRING_NOTE.splitlines(),
+            "",
+        ]
+    )
+    lines.extend(
+        f"    {unit['member']} = {index}"
+        for index, unit in zip(quantity.indices, quantity.units, strict=True)
+    )
+
+    si_name = _constant_name(quantity.si_unit)
+    stride_name = (
+        "CONVERSION_PARAMETERS_STRIDE"
+        if quantity.is_affine
+        else "CONVERSION_FACTORS_STRIDE"
+    )
+    lines.extend(["", ""])
+    lines.extend(
+        _format_comment(
+            "The name & abbreviation of each unit, indexed by the unit. Element 0 does"
+            " not correspond to a unit."
+        )
+    )
+    names = [repr(""), *(repr(unit["name"]) for unit in quantity.units)]
+    abbreviations = [repr(""), *(repr(unit["abbreviation"]) for unit in quantity.units)]
+    lines.extend(_format_tuple("_NAMES", names))
+    lines.extend(_format_tuple("_ABBREVIATIONS", abbreviations))
+
+    if quantity.is_affine:
+        lines.append("")
+        lines.extend(
+            _format_comment(
+                "Dense from-unit x to-unit tables of the conversion parameters. Units"
+                " are small contiguous ints, so the parameters that convert a value"
+                " from one unit to another are at index `from_unit *"
+                " CONVERSION_PARAMETERS_STRIDE + to_unit`. A temperature is converted"
+                " with `(value * numerator + offset) / denominator`, where the"
+                " numerator & denominator are ints & the offset is a short decimal, so"
+                " that temperatures that are exact in one unit (such as 32F & 0C) stay"
+                " exact in the other. Differences are converted with the numerator &"
+                " denominator alone. Row & column 0 do"
+                " not correspond to a unit. Tuples are used rather than arrays, as"
+                " reading an element of a tuple returns the stored float instead of"
+                " allocating a new one."
+            )
+        )
+        lines.append(f"CONVERSION_PARAMETERS_STRIDE: Final = {quantity.stride}")
+        for name, get, what in (
+            ("CONVERSION_NUMERATORS", quantity.numerator, "Numerators from"),
+            ("CONVERSION_DENOMINATORS", quantity.denominator, "Denominators from"),
+            ("CONVERSION_OFFSETS", quantity.offset, "Offsets from"),
+        ):
+            lines.extend(_create_matrix(quantity, name, get, what))
+    else:
+        lines.append("")
+        lines.extend(
+            _format_comment(
+                f"The change in {quantity.quantity} expressed as each unit per"
+                f" 1{quantity.si_abbreviation}, indexed by the unit. Element 0 does"
+                " not correspond to a unit, and so holds NaN."
+            )
+        )
+        lines.extend(
+            _format_tuple(
+                f"UNIT_DELTAS_PER_{si_name}",
+                [_format_number(value) for value in quantity.per_si_unit],
+            )
+        )
+        lines.append("")
+        lines.extend(
+            _format_comment(
+                "Dense from-unit x to-unit table of conversion factors. Units are"
+                " small contiguous ints, so the factor that converts a value from one"
+                " unit to another is at index `from_unit * CONVERSION_FACTORS_STRIDE +"
+                " to_unit`. Row & column 0 do not correspond to a unit, and so hold"
+                " NaN. A tuple is used rather than an array, as reading an element of"
+                " a tuple returns the stored float instead of allocating a new one."
+            )
+        )
+        lines.append(f"CONVERSION_FACTORS_STRIDE: Final = {quantity.stride}")
+        lines.extend(
+            _create_matrix(quantity, "CONVERSION_FACTORS", quantity.gradient, "From")
+        )
+
+    if quantity.turn_tables:
+        lines.append("")
+        lines.extend(
+            _format_comment(
+                "Tables of a full turn & half a turn, expressed as each unit & indexed"
+                " by the unit, so that angles can be wrapped into range without"
+                " looking up the info of the unit. Element 0 does not correspond to a"
+                " unit, and so holds NaN."
+            )
+        )
+        for name, turns in (("FULL_TURNS", 2 * math.pi), ("HALF_TURNS", math.pi)):
+            lines.extend(
+                _format_tuple(
+                    name,
+                    [_format_number(turns * value) for value in quantity.per_si_unit],
+                )
+            )
+
+    if quantity.fixed_point is not None:
+        sub_unit = quantity.fixed_point["sub_unit"]
+        resolution = quantity.fixed_point["resolution"]
+        lines.append("")
+        lines.extend(
+            _format_comment(
+                f"Fixed-point quantities hold an integer count of {sub_unit}. The"
+                f" number of {sub_unit} per 1 of each unit is stored as an integer"
+                " ratio, indexed by the unit, so that converting to & from the units"
+                " stays in ints. Element 0 does not correspond to a unit."
+            )
+        )
+        resolution_name = f"FIXED_POINT_RESOLUTION_PER_{si_name}"
+        lines.append(f"{resolution_name}: Final = {_format_number(resolution)}")
+        ratios = ["(0, 1)"] + [
+            repr(get_ratio(resolution / quantity.per_si_unit[index]))
+            for index in quantity.indices
+        ]
+        lines.extend(_format_tuple("_FIXED_POINT_RATIOS", ratios))
+
+    lines.append("")
+    lines.extend(
+        _UNIT_CHECK_TEMPLATE.format(
+            quantity=quantity.quantity, stride_name=stride_name
+        ).splitlines()
+    )
+    if not quantity.is_affine:
+        lines.extend(
+            _UNIT_DELTA_GETTER_TEMPLATE.format(
+                si_name=si_name.lower(),
+                quantity=quantity.quantity,
+                si_abbreviation=quantity.si_abbreviation,
+                table_name=f"UNIT_DELTAS_PER_{si_name}",
+            ).splitlines()
+        )
+    if quantity.fixed_point is not None:
+        lines.extend(
+            _FIXED_POINT_GETTER_TEMPLATE.format(
+                sub_unit=quantity.fixed_point["sub_unit"], quantity=quantity.quantity
+            ).splitlines()
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def _test_expression(expression: str, quantity: _Quantity) -> str:
+    """Return an expression from the spec, as it is written in a test."""
+    expression = expression.replace("pi", "math.pi")
+    for name in quantity.constants:
+        expression = expression.replace(name, f"unit.{name}")
+    return expression
+
+
+def _create_test_module(quantity: _Quantity) -> str:
+    """Create the source of the tests of the unit module of a quantity."""
+    si_name = _constant_name(quantity.si_unit).lower()
+    uses_math = (
+        quantity.turn_tables
+        or quantity.fixed_point is not None
+        or any("pi" in unit["per_si_unit"] for unit in quantity.units)
+    )
+    lines = [f"# {line}" for line in _GENERATED_NOTICE]
+    lines.append("")
+    if uses_math:
+        lines.append("import math")
+    lines.extend(
+        [
+            "import unittest",
+            "",
+            f"from src.units.units_inner.{quantity.package} import unit",
+            "",
+        ]
+    )
+    lines.extend(
+        _format_comment(
+            "The member, name, abbreviation & change in the quantity expressed as the"
+            f" unit per 1{quantity.si_abbreviation} of each unit"
+            + (", and the unit at absolute zero" if quantity.is_affine else "")
+        )
+    )
+    lines.append("_UNITS = [")
+    for spec in quantity.units:
+        values = [
+            f"unit.Unit.{spec['member']}",
+            repr(spec["name"]),
+            repr(spec["abbreviation"]),
+            _test_expression(spec["per_si_unit"], quantity),
+        ]
+        if quantity.is_affine:
+            values.append(_test_expression(spec["absolute_zero_offset"], quantity))
+        lines.append(f"    ({', '.join(values)}),")
+    lines.append("]")
+
+    lines.extend(_TEST_CLASS_TEMPLATE.format(quantity=quantity.quantity).splitlines())
+    if quantity.is_affine:
+        lines.extend(_AFFINE_TESTS_TEMPLATE.splitlines())
+    else:
+        lines.extend(_LINEAR_TESTS_TEMPLATE.format(si_name=si_name).splitlines())
+    if quantity.turn_tables:
+        lines.extend(_TURN_TABLE_TESTS_TEMPLATE.splitlines())
+    if quantity.fixed_point is not None:
+        lines.extend(
+            _FIXED_POINT_TESTS_TEMPLATE.format(
+                resolution_name=f"FIXED_POINT_RESOLUTION_PER_{si_name.upper()}"
+            ).splitlines()
+        )
+
+    lines.extend(["", "", 'if __name__ == "__main__":', "    unittest.main()"])
+    return "\n".join(lines) + "\n"
+
+
+def _format_source(source: str, file: pathlib.Path) -> str:
+    """Format the source with ruff, like the rest of the package."""
+    return subprocess.run(  # noqa: S603
+        ["ruff", "format", "--stdin-filename", str(file), "-"],  # noqa: S607
+        input=source,
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=pathlib.Path.cwd().parent,
+    ).stdout
+
+
+def _load_quantities() -> list[_Quantity]:
+    with (pathlib.Path.cwd() / _SPEC_FILE).open() as f:
+        spec: dict[str, dict[str, Any]] = json.load(f)
+    return [_Quantity(package, quantity) for package, quantity in spec.items()]
+
+
+def _create_files() -> dict[pathlib.Path, str]:
+    root = pathlib.Path.cwd().parent
+    files: dict[pathlib.Path, str] = {}
+    for quantity in _load_quantities():
+        unit_file = root / _INNER_DIRECTORY / quantity.package / "unit.py"
+        test_file = root / _TESTS_DIRECTORY / quantity.package / "test_unit.py"
+        files[unit_file] = _format_source(_create_unit_module(quantity), unit_file)
+        files[test_file] = _format_source(_create_test_module(quantity), test_file)
+    return files
+
+
+def _main() -> None:
+    files = _create_files()
+    if "--check" in sys.argv[1:]:
+        stale = [
+            file
+            for file, source in files.items()
+            if not file.exists() or file.read_text() != source
+        ]
+        for file in stale:
+            print(f"Out of date: {file}")  # noqa: T201
+        sys.exit(1 if stale else 0)
+
+    for file, source in files.items():
+        file.write_text(source)
+
+
+if __name__ == "__main__":
+    # The fixed-point ratios are calculated the same way as by the package itself
+    sys.path.insert(0, str(pathlib.Path.cwd().parent))
+    from src.units.units_inner.fixed_point import get_ratio
+
+    _main()
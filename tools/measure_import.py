@@ -0,0 +1,88 @@
+"""Measure the first-import time & heap use of each public module of the library.
+
+Each module is imported into a fresh interpreter state (with every module of the
+library removed from `sys.modules`), so that the figures include the quantities
+the module depends on. Pass the directory to import the library from, to compare
+the source modules against the `.mpy` bytecode built by `generate_package_json.py`.
+
+Run from the root of the repository on the micropython unix port, with either of:
+
+    micropython tools/measure_import.py src
+    micropython tools/measure_import.py mpy
+"""
+
+import gc
+import sys
+import time
+
+_MODULES = (
+    "angle",
+    "angular_motion",
+    "area",
+    "current",
+    "flow_rate",
+    "length",
+    "linear_motion",
+    "mass",
+    "pressure",
+    "quantity",
+    "temperature",
+    "time",
+    "voltage",
+    "volume",
+)
+
+try:
+    _ticks_us = time.ticks_us  # type: ignore[attr-defined]
+    _ticks_diff = time.ticks_diff  # type: ignore[attr-defined]
+except AttributeError:
+
+    def _ticks_us() -> int:
+        return time.perf_counter_ns() // 1000
+
+    def _ticks_diff(end: int, start: int) -> int:
+        return end - start
+
+
+try:
+    _mem_alloc = gc.mem_alloc  # type: ignore[attr-defined]
+except AttributeError:
+    import tracemalloc
+
+    tracemalloc.start()
+
+    def _mem_alloc() -> int:
+        return tracemalloc.get_traced_memory()[0]
+
+
+def _unload_library() -> None:
+    for name in list(sys.modules):
+        if name == "units" or name.startswith("units."):
+            del sys.modules[name]
+    gc.collect()
+
+
+def _measure(module: str) -> tuple[int, int]:
+    """Return the time (us) & heap (bytes) taken to first import the module."""
+    _unload_library()
+    heap_before = _mem_alloc()
+    start = _ticks_us()
+    __import__("units." + module)
+    end = _ticks_us()
+    gc.collect()
+    return _ticks_diff(end, start), _mem_alloc() - heap_before
+
+
+def main() -> None:
+    """Measure every module and print the results."""
+    directory = sys.argv[1] if len(sys.argv) > 1 else "src"
+    sys.path.insert(0, directory)
+    print(f"First import from {directory}/")  # noqa: T201
+    print("{:<16} {:>10} {:>12}".format("module", "time (us)", "heap (B)"))  # noqa: T201
+    for module in _MODULES:
+        elapsed, heap = _measure(module)
+        print(f"{module:<16} {elapsed:>10} {heap:>12}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()